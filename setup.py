@@ -229,6 +229,7 @@ def replaceIntHeader(file):
 
 HEADER_FILES = [
     'mutant_vector.h',
+    'mapped_allocator.h',
     'simuPOP_cfg.h',
     'utility.h',
     'genoStru.h',
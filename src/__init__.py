@@ -301,6 +301,9 @@ __all__ = [
     'Bernullitrials_T',
     'WeightedSampler',
     #
+    # used by TrajectorySimulator of simuPOP.utils
+    'TrajectoryEngine',
+    #
     # modules are not loaded by default because they require rpy or matplotlib
     #
     #'utils',
@@ -438,6 +441,107 @@ def evolve_pop(self,
 
 Population.evolve = evolve_pop
 
+_evolve_simulator = Simulator.evolve
+
+# arguments passed to worker processes of Simulator.evolve(numProcs=...),
+# which are inherited by forked processes instead of being pickled.
+_evolve_args = None
+
+
+def _evolve_replicate(job):
+    # evolve a single replicate in a forked process and write the evolved
+    # population to a file in binary format.
+    rep, seed, filename = job
+    simu, args = _evolve_args
+    # the OpenMP thread pool of the parent process does not survive fork so
+    # the replicate is evolved in a single thread.
+    setOptions(numThreads=1, seed=seed)
+    gens = _evolve_simulator(simu, *args, reps=[rep])
+    simu.population(rep).save(filename, format='binary')
+    return rep, gens[rep]
+
+
+def evolve_simulator(self,
+                     initOps=[],
+                     preOps=[],
+                     matingScheme=MatingScheme(),
+                     postOps=[],
+                     finalOps=[],
+                     gen=-1,
+                     dryrun=False,
+                     reps=ALL_AVAIL,
+                     numProcs=None):
+    if numProcs is None or dryrun:
+        return _evolve_simulator(self, initOps, preOps, matingScheme, postOps,
+                                 finalOps, gen, dryrun, reps)
+    if reps is ALL_AVAIL:
+        reps = range(self.numRep())
+    elif isinstance(reps, int):
+        reps = [reps]
+    reps = [rep if rep >= 0 else rep + self.numRep() for rep in reps]
+    for rep in reps:
+        if rep < 0 or rep >= self.numRep():
+            raise IndexError('Replicate index %d out of range of 0 ~ %d' %
+                             (rep, self.numRep() - 1))
+    # seeds of replicates are drawn from the random number generator of the
+    # parent process so that results do not depend on the number of processes.
+    seeds = [getRNG().randInt(2**31) + 1 for rep in reps]
+    args = (initOps, preOps, matingScheme, postOps, finalOps, gen)
+    evolved = [0] * self.numRep()
+    if numProcs == 0:
+        numProcs = os.cpu_count() or 1
+    try:
+        import multiprocessing
+        ctx = multiprocessing.get_context('fork')
+    except (ImportError, ValueError):
+        ctx = None
+    if numProcs == 1 or len(reps) <= 1 or ctx is None:
+        # replicates are evolved in a single thread as in worker processes,
+        # and the random number generator of the caller is restored afterward.
+        rng = getRNG()
+        savedRNG = RNG(rng.name(), rng.seed())
+        savedRNG.copyState(rng)
+        numThreads = moduleInfo()['threads']
+        try:
+            for rep, seed in zip(reps, seeds):
+                setOptions(numThreads=1, seed=seed)
+                evolved[rep] = _evolve_simulator(self, *args, reps=[rep])[rep]
+        finally:
+            setOptions(numThreads=numThreads, seed=savedRNG.seed())
+            getRNG().copyState(savedRNG)
+    else:
+        import tempfile, shutil
+        global _evolve_args
+        tmpDir = tempfile.mkdtemp(prefix='simuPOP_')
+        _evolve_args = (self, args)
+        try:
+            jobs = [(rep, seed, os.path.join(tmpDir, 'rep%d.pop' % rep))
+                    for rep, seed in zip(reps, seeds)]
+            with ctx.Pool(min(numProcs, len(reps))) as pool:
+                for rep, gens in pool.imap_unordered(_evolve_replicate, jobs):
+                    evolved[rep] = gens
+            for rep, seed, filename in jobs:
+                self.population(rep).swap(loadPopulation(filename))
+        finally:
+            _evolve_args = None
+            shutil.rmtree(tmpDir, ignore_errors=True)
+    return tuple(evolved)
+
+
+evolve_simulator.__doc__ = _evolve_simulator.__doc__.replace(
+    'dryrun=False, reps=ALL_AVAIL)',
+    'dryrun=False, reps=ALL_AVAIL,\n      numProcs=None)') + '''
+    If parameter numProcs is set, selected replicates are evolved
+    independently in up to numProcs processes (0 for the number of
+    CPUs). Each replicate is evolved in a single thread with its own
+    random seed drawn from the random number generator of the current
+    process so that results do not depend on the number of processes
+    or threads used. Because replicates are evolved independently,
+    operators should not refer to other replicates in this mode.
+'''
+
+Simulator.evolve = evolve_simulator
+
 
 def all_individuals(self, subPops=ALL_AVAIL, ancGens=ALL_AVAIL):
     '''Return an iterator that iterat through all (virtual) subpopulations in
@@ -777,15 +881,17 @@ class CloneMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField=None):
+                 selectionField=None,
+                 trackAlleleFreq=[]):
         '''Create a clonal mating scheme that clones parents to offspring using
         a ``CloneGenoTransmitter``. Please refer to class ``OffspringGenerator``
         for parameters *ops* and *numOffspring*, and to class ``HomoMating`` for
-        parameters  *subPopSize*, *subPops* and *weight*. Parameters *sexMode* and
-        *selectionField* are ignored because this mating scheme does not support
-        natural selection, and ``CloneGenoTransmitter`` copies sex from parents
-        to offspring. Note that ``CloneGenoTransmitter`` by default also copies
-        all parental information fields to offspring.
+        parameters  *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*.
+        Parameters *sexMode* and *selectionField* are ignored because this
+        mating scheme does not support natural selection, and
+        ``CloneGenoTransmitter`` copies sex from parents to offspring. Note
+        that ``CloneGenoTransmitter`` by default also copies all parental
+        information fields to offspring.
         '''
         HomoMating.__init__(
             self,
@@ -793,7 +899,8 @@ class CloneMating(HomoMating):
             generator=OffspringGenerator(ops, numOffspring, RANDOM_SEX),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class RandomSelection(HomoMating):
@@ -809,14 +916,15 @@ class RandomSelection(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Create a mating scheme that select a parent randomly and copy him or
         her to the offspring population. Please refer to class
         ``RandomParentChooser`` for parameter *selectionField*, to class
         ``OffspringGenerator`` for parameters *ops* and *numOffspring*, and to
-        class ``HomoMating`` for parameters *subPopSize*, *subPops* and *weight*.
-        Parameter *sexMode* is ignored because ``cloneOffspringGenerator`` copies
-        sex from parents to offspring.
+        class ``HomoMating`` for parameters *subPopSize*, *subPops*, *weight*
+        and *trackAlleleFreq*. Parameter *sexMode* is ignored because
+        ``cloneOffspringGenerator`` copies sex from parents to offspring.
         '''
         HomoMating.__init__(
             self,
@@ -824,7 +932,8 @@ class RandomSelection(HomoMating):
             generator=OffspringGenerator(ops, numOffspring, RANDOM_SEX),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class RandomMating(HomoMating):
@@ -839,13 +948,14 @@ class RandomMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Creates a random mating ssheme that selects two parents randomly and
         transmit genotypes according to Mendelian laws. Please refer to class
         ``RandomParentsChooser`` for parameter *selectionField*, to class
         ``OffspringGenerator`` for parameters *ops*, *sexMode* and
         *numOffspring*, and to class ``HomoMating`` for parameters
-        *subPopSize*, *subPops* and *weight*.
+        *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*.
         '''
         HomoMating.__init__(
             self,
@@ -853,7 +963,8 @@ class RandomMating(HomoMating):
             generator=OffspringGenerator(ops, numOffspring, sexMode),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class MonogamousMating(HomoMating):
@@ -869,13 +980,14 @@ class MonogamousMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField=None):
+                 selectionField=None,
+                 trackAlleleFreq=[]):
         '''Creates a monogamous mating scheme that selects each parent only
         once. Please refer to class ``OffspringGenerator`` for parameters
         *ops*, *sexMode* and *numOffspring*, and to class ``HomoMating`` for
-        parameters *subPopSize*, *subPops* and *weight*. Parameter
-        *selectionField* is ignored because this mating scheme does not
-        support natural selection.
+        parameters *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*.
+        Parameter *selectionField* is ignored because this mating scheme does
+        not support natural selection.
         '''
         HomoMating.__init__(
             self,
@@ -883,7 +995,8 @@ class MonogamousMating(HomoMating):
             generator=OffspringGenerator(ops, numOffspring, sexMode),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class PolygamousMating(HomoMating):
@@ -901,20 +1014,22 @@ class PolygamousMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Creates a polygamous mating scheme that each parent mates with
         multiple spouses. Please refer to class ``PolyParentsChooser`` for
         parameters *polySex*, *polyNum* and *selectionField*, to class
         ``OffspringGenerator`` for parameters *ops*,  *sexMode* and
         *numOffspring*, and to class ``HomoMating`` for parameters
-        *subPopSize*, *subPops* and *weight*. '''
+        *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*. '''
         HomoMating.__init__(
             self,
             chooser=PolyParentsChooser(polySex, polyNum),
             generator=OffspringGenerator(ops, numOffspring, sexMode),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class HaplodiploidMating(HomoMating):
@@ -930,12 +1045,13 @@ class HaplodiploidMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Creates a mating scheme in haplodiploid populations. Please refer
         to class ``RandomParentsChooser`` for parameter *selectionField*, to
         class ``OffspringGenerator`` for parameters *ops*, *sexMode* and
         *numOffspring*, and to class ``HomoMating`` for parameters
-        *subPopSize*, *subPops* and *weight*.
+        *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*.
         '''
         HomoMating.__init__(
             self,
@@ -943,7 +1059,8 @@ class HaplodiploidMating(HomoMating):
             generator=OffspringGenerator(ops, numOffspring, sexMode),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class SelfMating(HomoMating):
@@ -960,21 +1077,23 @@ class SelfMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Creates a selfing mating scheme where two homologous copies of
         parental chromosomes are transmitted to offspring according to
         Mendelian laws. Please refer to class ``RandomParentChooser`` for
         parameter *replacement* and  *selectionField*, to class
         ``OffspringGenerator`` for parameters *ops*, *sexMode* and
         *numOffspring*, and to class ``HomoMating`` for parameters
-        *subPopSize*, *subPops* and *weight*. '''
+        *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*. '''
         HomoMating.__init__(
             self,
             chooser=RandomParentChooser(replacement, selectionField),
             generator=OffspringGenerator(ops, numOffspring, sexMode),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 class HermaphroditicMating(HomoMating):
@@ -993,14 +1112,15 @@ class HermaphroditicMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Creates a hermaphroditic mating scheme where individuals can
         serve as father or mother, or both (self-fertilization). Please
         refer to class ``CombinedParentsChooser`` for parameter *allowSelfing``,
         to ``RandomParentChooser`` for parameter *replacement* and
         *selectionField*, to class ``OffspringGenerator`` for parameters *ops*,
         *sexMode* and *numOffspring*, and to class ``HomoMating`` for parameters
-        *subPopSize*, *subPops* and *weight*. '''
+        *subPopSize*, *subPops*, *weight* and *trackAlleleFreq*. '''
         HomoMating.__init__(
             self,
             chooser=CombinedParentsChooser(
@@ -1010,7 +1130,8 @@ class HermaphroditicMating(HomoMating):
             generator=OffspringGenerator(ops, numOffspring, sexMode),
             subPopSize=subPopSize,
             subPops=subPops,
-            weight=weight)
+            weight=weight,
+            trackAlleleFreq=trackAlleleFreq)
 
 
 ##
@@ -1054,7 +1175,8 @@ class ControlledRandomMating(HomoMating):
                  subPopSize=[],
                  subPops=ALL_AVAIL,
                  weight=0,
-                 selectionField='fitness'):
+                 selectionField='fitness',
+                 trackAlleleFreq=[]):
         '''Creates a random mating scheme that controls allele frequency at
         loci *loci*. At each generation, function *freqFunc* will be called to
         called to obtain intended frequencies of alleles *alleles* at loci
@@ -1067,8 +1189,8 @@ class ControlledRandomMating(HomoMating):
         for parameters *selectionField*, to class ``ControlledOffspringGenerator``
         for parameters *loci*, *alleles*, *freqFunc*, to class
         ``OffspringGenerator`` for parameters *ops*, *sexMode* and *numOffspring*,
-        and to class ``HomoMating`` for parameters *subPopSize*, *subPops* and
-        *weight*.
+        and to class ``HomoMating`` for parameters *subPopSize*, *subPops*,
+        *weight* and *trackAlleleFreq*.
         '''
         if (type(loci) in [type([]), type(
             ())] and len(loci) == 0) or (freqFunc is None):
@@ -1078,7 +1200,8 @@ class ControlledRandomMating(HomoMating):
                 generator=OffspringGenerator(ops, numOffspring, sexMode),
                 subPopSize=subPopSize,
                 subPops=subPops,
-                weight=weight)
+                weight=weight,
+                trackAlleleFreq=trackAlleleFreq)
         else:
             HomoMating.__init__(
                 self,
@@ -1088,7 +1211,8 @@ class ControlledRandomMating(HomoMating):
                                                        sexMode),
                 subPopSize=subPopSize,
                 subPops=subPops,
-                weight=weight)
+                weight=weight,
+                trackAlleleFreq=trackAlleleFreq)
 
 
 class SNPMutator(MatrixMutator):
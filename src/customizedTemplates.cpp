@@ -722,6 +722,12 @@ struct arrayobject_template
 	PyObject_VAR_HEAD
 	// pointer to the beginning of the genotype
 	T ob_iter;
+	// shape and strides (in bytes) of the array when it is exported through
+	// the buffer interface, e.g. (individual, ploidy, locus) for the genotype
+	// of a population.
+	int ob_ndim;
+	Py_ssize_t ob_shape[3];
+	Py_ssize_t ob_strides[3];
 };
 
 template <typename T>
@@ -1488,6 +1494,95 @@ getarrayitem_template<GenoIterator>(PyObject * op, Py_ssize_t i)
 }
 
 
+/// CPPONLY
+template <typename T>
+void setarrayshape_template(struct arrayobject_template<T> * op, const vectoru & shape,
+                            Py_ssize_t itemsize)
+{
+	size_t size = 1;
+
+	for (size_t i = 0; i < shape.size(); ++i)
+		size *= shape[i];
+	// fall back to a one-dimensional array if shape does not match the array
+	if (shape.empty() || shape.size() > 3 || size != static_cast<size_t>(Py_SIZE(op))) {
+		op->ob_ndim = 1;
+		op->ob_shape[0] = Py_SIZE(op);
+	} else {
+		op->ob_ndim = static_cast<int>(shape.size());
+		for (int i = 0; i < op->ob_ndim; ++i)
+			op->ob_shape[i] = static_cast<Py_ssize_t>(shape[i]);
+	}
+	// C-contiguous strides
+	op->ob_strides[op->ob_ndim - 1] = itemsize;
+	for (int i = op->ob_ndim - 2; i >= 0; --i)
+		op->ob_strides[i] = op->ob_strides[i + 1] * op->ob_shape[i + 1];
+}
+
+
+/// CPPONLY
+template <typename T>
+int fillarraybuffer_template(struct arrayobject_template<T> * self, Py_buffer * view,
+                             int flags, const char * format)
+{
+	// a valid pointer is needed even if the array is empty
+	static char empty = 0;
+
+	view->buf = Py_SIZE(self) == 0 ? &empty : reinterpret_cast<void *>(&*self->ob_iter);
+	view->obj = (PyObject *)self;
+	Py_INCREF(self);
+	view->itemsize = self->ob_strides[self->ob_ndim - 1];
+	view->len = Py_SIZE(self) * view->itemsize;
+	view->readonly = 0;
+	view->format = (flags & PyBUF_FORMAT) ? const_cast<char *>(format) : NULL;
+	view->ndim = self->ob_ndim;
+	view->shape = (flags & PyBUF_ND) == PyBUF_ND ? self->ob_shape : NULL;
+	view->strides = (flags & PyBUF_STRIDES) == PyBUF_STRIDES ? self->ob_strides : NULL;
+	view->suboffsets = NULL;
+	view->internal = NULL;
+	return 0;
+}
+
+
+/// CPPONLY
+template <typename T>
+int array_getbuffer_template(struct arrayobject_template<T> * /* self */, Py_buffer * view, int /* flags */)
+{
+	view->obj = NULL;
+	PyErr_SetString(PyExc_BufferError, "This array does not support the buffer interface");
+	return -1;
+}
+
+
+/// CPPONLY
+template <>
+int array_getbuffer_template<GenoIterator>(struct arrayobject_template<GenoIterator> * self,
+                                           Py_buffer * view, int flags)
+{
+#  if defined(BINARYALLELE) || defined(MUTANTALLELE)
+	(void)self;
+	(void)flags;
+	view->obj = NULL;
+	PyErr_SetString(PyExc_BufferError, "Genotypes of binary and mutant modules are not stored "
+		                               "as plain arrays and cannot be exported through the buffer interface. "
+		                               "Please use list(pop.genotype()) to obtain a copy of genotypes.");
+	return -1;
+#  elif defined(LONGALLELE)
+	return fillarraybuffer_template<GenoIterator>(self, view, flags, "L");
+#  else
+	return fillarraybuffer_template<GenoIterator>(self, view, flags, "B");
+#  endif
+}
+
+
+/// CPPONLY
+template <>
+int array_getbuffer_template<LineageIterator>(struct arrayobject_template<LineageIterator> * self,
+                                              Py_buffer * view, int flags)
+{
+	return fillarraybuffer_template<LineageIterator>(self, view, flags, "l");
+}
+
+
 /// CPPONLY
 template <typename T>
 PyObject * newcarrayobject_template(T begin, T end)
@@ -1511,6 +1606,7 @@ PyObject * newcarrayobject_template<GenoIterator>(GenoIterator begin, GenoIterat
 	//
 	op->ob_iter = begin;
 	Py_SIZE(op) = end - begin;
+	setarrayshape_template(op, vectoru(), sizeof(Allele));
 	return (PyObject *)op;
 }
 
@@ -1530,6 +1626,7 @@ PyObject * newcarrayobject_template<LineageIterator>(LineageIterator begin, Line
 	//
 	op->ob_iter = begin;
 	Py_SIZE(op) = end - begin;
+	setarrayshape_template(op, vectoru(), sizeof(long));
 	return (PyObject *)op;
 }
 
@@ -85,7 +85,7 @@ carray_init(PyTypeObject * a, PyObject * b, PyObject * c)
 
 
 /// CPPONLY
-PyObject * newcarrayobject(GenoIterator begin, GenoIterator end);
+PyObject * newcarrayobject(GenoIterator begin, GenoIterator end, const vectoru & shape);
 
 /// CPPONLY
 void
@@ -320,7 +320,7 @@ bool is_carrayobject(PyObject * op)
 
 
 /// CPPONLY
-PyObject * newcarrayobject(GenoIterator begin, GenoIterator end)
+PyObject * newcarrayobject(GenoIterator begin, GenoIterator end, const vectoru & /* shape */)
 {
 	return(newcarrayobject_template<GenoIterator>(begin, end));
 }
@@ -367,7 +367,7 @@ carray_init_lineage(PyTypeObject * a, PyObject * b, PyObject * c)
 
 
 /// CPPONLY
-PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end);
+PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end, const vectoru & shape);
 
 /// CPPONLY
 void
@@ -602,7 +602,7 @@ bool is_carrayobject_lineage(PyObject * op)
 
 
 /// CPPONLY
-PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end)
+PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end, const vectoru & /* shape */)
 {
 	return(newcarrayobject_template<LineageIterator>(begin, end));
 }
@@ -816,7 +816,7 @@ typedef struct arrayobject_template<GenoIterator> arrayobject;
 
 bool is_carrayobject(PyObject * op);
 
-PyObject * newcarrayobject(GenoIterator begin, GenoIterator end);
+PyObject * newcarrayobject(GenoIterator begin, GenoIterator end, const vectoru & shape);
 
 PyObject *
 getarrayitem(PyObject * op, Py_ssize_t i)
@@ -971,6 +971,19 @@ PyMappingMethods array_as_mapping = {
 	(objobjargproc)array_ass_subscr
 };
 
+
+int
+array_getbuffer(arrayobject * self, Py_buffer * view, int flags)
+{
+	return array_getbuffer_template<GenoIterator>(self, view, flags);
+}
+
+
+PyBufferProcs array_as_buffer = {
+	(getbufferproc)array_getbuffer,
+	0
+};
+
 PyObject * array_new(PyTypeObject * type, PyObject * args, PyObject * kwds)
 {
 	return array_new_template<GenoIterator>(type, args, kwds);
@@ -1023,7 +1036,7 @@ PyTypeObject Arraytype = {
 	0,                                          /* tp_str */
 	PyObject_GenericGetAttr,                    /* tp_getattro */
 	0,                                          /* tp_setattro */
-	0,                                          /* tp_as_buffer*/
+	&array_as_buffer,                           /* tp_as_buffer*/
 	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
 	arraytype_doc,                              /* tp_doc */
 	0,                                          /* tp_traverse */
@@ -1054,9 +1067,13 @@ bool is_carrayobject(PyObject * op)
 
 
 /// CPPONLY
-PyObject * newcarrayobject(GenoIterator begin, GenoIterator end)
+PyObject * newcarrayobject(GenoIterator begin, GenoIterator end, const vectoru & shape)
 {
-	return newcarrayobject_template<GenoIterator>(begin, end);
+	PyObject * op = newcarrayobject_template<GenoIterator>(begin, end);
+
+	if (op != NULL)
+		setarrayshape_template<GenoIterator>((arrayobject *)op, shape, sizeof(Allele));
+	return op;
 }
 
 
@@ -1066,7 +1083,7 @@ typedef struct arrayobject_template<LineageIterator> arrayobject_lineage;
 
 bool is_carrayobject_lineage(PyObject * op);
 
-PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end);
+PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end, const vectoru & shape);
 
 PyObject *
 getarrayitem_lineage(PyObject * op, Py_ssize_t i)
@@ -1221,6 +1238,19 @@ PyMappingMethods array_as_mapping_lineage = {
 	(objobjargproc)array_ass_subscr_lineage
 };
 
+
+int
+array_getbuffer_lineage(arrayobject_lineage * self, Py_buffer * view, int flags)
+{
+	return array_getbuffer_template<LineageIterator>(self, view, flags);
+}
+
+
+PyBufferProcs array_as_buffer_lineage = {
+	(getbufferproc)array_getbuffer_lineage,
+	0
+};
+
 PyObject * array_new_lineage(PyTypeObject * type, PyObject * args, PyObject * kwds)
 {
 	return array_new_template<LineageIterator>(type, args, kwds);
@@ -1273,7 +1303,7 @@ PyTypeObject LineageArraytype = {
 	0,                                          /* tp_str */
 	PyObject_GenericGetAttr,                    /* tp_getattro */
 	0,                                          /* tp_setattro */
-	0,                                          /* tp_as_buffer*/
+	&array_as_buffer_lineage,                   /* tp_as_buffer*/
 	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
 	arraytype_doc_lineage,                              /* tp_doc */
 	0,                                          /* tp_traverse */
@@ -1304,9 +1334,13 @@ bool is_carrayobject_lineage(PyObject * op)
 
 
 /// CPPONLY
-PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end)
+PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end, const vectoru & shape)
 {
-	return newcarrayobject_template<LineageIterator>(begin, end);
+	PyObject * op = newcarrayobject_template<LineageIterator>(begin, end);
+
+	if (op != NULL)
+		setarrayshape_template<LineageIterator>((arrayobject_lineage *)op, shape, sizeof(long));
+	return op;
 }
 
 
@@ -284,8 +284,11 @@ PyObject * Individual::genotype(const uintList & ply, const uintList & ch)
 		// has to be all chromosomes
 		DBG_FAILIF(beginCh != 0 || endCh != numChrom(), ValueError,
 			"If multiple ploidy are chosen, all chromosomes has to be chosen.");
+		// exported as ploidy x locus through the buffer interface
+		vectoru shape(2, totNumLoci());
+		shape[0] = endP - beginP;
 		return Allele_Vec_As_NumArray(m_genoPtr + beginP * totNumLoci(),
-			m_genoPtr + endP * totNumLoci());
+			m_genoPtr + endP * totNumLoci(), shape);
 	} else
 		return Allele_Vec_As_NumArray(m_genoPtr + beginP * totNumLoci() + chromBegin(beginCh),
 			m_genoPtr + beginP * totNumLoci() + chromEnd(endCh - 1));
@@ -406,8 +409,11 @@ PyObject * Individual::lineage(const uintList & ply, const uintList & ch)
 		// has to be all chromosomes
 		DBG_FAILIF(beginCh != 0 || endCh != numChrom(), ValueError,
 			"If multiple ploidy are chosen, all chromosomes has to be chosen.");
+		// exported as ploidy x locus through the buffer interface
+		vectoru shape(2, totNumLoci());
+		shape[0] = endP - beginP;
 		return Lineage_Vec_As_NumArray(m_lineagePtr + beginP * totNumLoci(),
-			m_lineagePtr + endP * totNumLoci());
+			m_lineagePtr + endP * totNumLoci(), shape);
 	} else
 		return Lineage_Vec_As_NumArray(m_lineagePtr + beginP * totNumLoci() + chromBegin(beginCh),
 			m_lineagePtr + beginP * totNumLoci() + chromEnd(endCh - 1));
@@ -672,14 +678,26 @@ PyObject * Individual::mutAtLoci(const lociList & lociList)
 
 
 PyObject * Individual::genoAtLoci(const lociList & lociList)
+{
+	vector<ULONG> alleles;
+
+	allelesAtLoci(lociList, alleles);
+	PyObject * genoObj = PyTuple_New(alleles.size());
+	// set value
+	for (size_t j = 0; j < alleles.size(); ++j)
+		PyTuple_SET_ITEM(genoObj, j, PyInt_FromLong(alleles[j]));
+	return genoObj;
+}
+
+
+void Individual::allelesAtLoci(const lociList & lociList, vector<ULONG> & alleles)
 {
 	ssize_t ply = ploidy();
 
 	if (isHaplodiploid() && sex() == MALE)
 		ply = 1;
 
-	vector<ULONG> alleles;
-
+	alleles.clear();
 	if (lociList.allAvail()) {
 #ifdef MUTANTALLELE
 		alleles.reserve(ply * totNumLoci());
@@ -807,11 +825,6 @@ PyObject * Individual::genoAtLoci(const lociList & lociList)
 		}
 #endif
 	}
-	PyObject * genoObj = PyTuple_New(alleles.size());
-	// set value
-	for (size_t j = 0; j < alleles.size(); ++j)
-		PyTuple_SET_ITEM(genoObj, j, PyInt_FromLong(alleles[j]));
-	return genoObj;
 }
 
 
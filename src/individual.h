@@ -331,7 +331,9 @@ public:
 	 *  will be returned. If multiple chromosomes are specified, there should
 	 *  not be gaps between chromosomes. This function ignores type of
 	 *  chromosomes so it will return unused alleles for sex and mitochondrial
-	 *  chromosomes.
+	 *  chromosomes. Alleles of more than one homologous copy of chromosomes
+	 *  are exported with shape <tt>(ploidy, locus)</tt> through the buffer
+	 *  interface (not available for binary and mutant modules).
 	 *  <group>2-genotype</group>
 	 */
 	PyObject * genotype(const uintList & ploidy = uintList(), const uintList & chroms = uintList());
@@ -374,6 +376,12 @@ public:
 	 */
 	PyObject * genoAtLoci(const lociList & loci);
 
+	/** CPPONLY
+	 *  Fill \e alleles with alleles at specified loci, in the order they are
+	 *  passed to a user-provided function by \c genoAtLoci.
+	 */
+	void allelesAtLoci(const lociList & loci, vector<ULONG> & alleles);
+
 	/** Fill the genotype of an individual using a list of alleles \e geno.
 	 *  If parameters \e ploidy and/or \e chroms are specified, alleles will
 	 *  be copied to only all or specified chromosomes on selected homologous
@@ -115,6 +115,8 @@ bool InitInfo::apply(Population & pop) const
 
 	for (size_t i = 0; i < infoIdx.size(); ++i)
 		infoIdx[i] = pop.infoIdx(infoField(i));
+	// the fields might be used as individual IDs
+	pop.invalidateIDIndex();
 
 	const subPopList subPops = applicableSubPops(pop);
 	subPopList::const_iterator sp = subPops.begin();
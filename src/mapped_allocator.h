@@ -0,0 +1,149 @@
+/**
+ *  $File: mapped_allocator.h $
+ *  $LastChangedDate$
+ *  $Rev$
+ *
+ *  This file is part of simuPOP, a forward-time population genetics
+ *  simulation environment. Please visit http://simupop.sourceforge.net
+ *  for details.
+ *
+ *  Copyright (C) 2004 - 2010 Bo Peng (bpeng@mdanderson.org)
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program. If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef _MAPPED_ALLOCATOR_H
+#define _MAPPED_ALLOCATOR_H
+
+#include <cstddef>
+#include <limits>
+#include <new>
+
+namespace simuPOP {
+
+/** CPPONLY
+ *  Allocate a block of \e bytes bytes for genotype or lineage storage. If a
+ *  storage directory has been set by <tt>setOptions(storageDir=...)</tt> and
+ *  the block is large enough, the block is allocated from a temporary file
+ *  mapped into memory so that pages that are not in use (e.g. ancestral
+ *  generations) can be written back to disk by the operating system.
+ *  Otherwise, the block is allocated from the heap.
+ */
+void * allocateStorage(size_t bytes);
+
+/// CPPONLY release a block allocated by allocateStorage.
+void deallocateStorage(void * ptr);
+
+/** CPPONLY
+ *  A stateless allocator for genotype and lineage vectors that allocates
+ *  large blocks from file-mapped regions when file-mapped storage is enabled.
+ *  Because each block records how it was allocated, vectors allocated in
+ *  different storage modes can be swapped and copied freely.
+ */
+template<class T>
+class MappedAllocator
+{
+public:
+	typedef T value_type;
+	typedef T * pointer;
+	typedef const T * const_pointer;
+	typedef T & reference;
+	typedef const T & const_reference;
+	typedef size_t size_type;
+	typedef ptrdiff_t difference_type;
+
+	template<class U>
+	struct rebind
+	{
+		typedef MappedAllocator<U> other;
+	};
+
+	MappedAllocator()
+	{
+	}
+
+
+	MappedAllocator(const MappedAllocator &)
+	{
+	}
+
+
+	template<class U>
+	MappedAllocator(const MappedAllocator<U> &)
+	{
+	}
+
+
+	pointer address(reference x) const
+	{
+		return &x;
+	}
+
+
+	const_pointer address(const_reference x) const
+	{
+		return &x;
+	}
+
+
+	pointer allocate(size_type n, const void * = 0)
+	{
+		if (n > max_size())
+			throw std::bad_alloc();
+		return static_cast<pointer>(allocateStorage(n * sizeof(T)));
+	}
+
+
+	void deallocate(pointer p, size_type)
+	{
+		deallocateStorage(p);
+	}
+
+
+	size_type max_size() const
+	{
+		return std::numeric_limits<size_type>::max() / sizeof(T);
+	}
+
+
+	void construct(pointer p, const T & val)
+	{
+		new (static_cast<void *>(p))T(val);
+	}
+
+
+	void destroy(pointer p)
+	{
+		p->~T();
+	}
+
+
+};
+
+template<class T1, class T2>
+inline bool operator==(const MappedAllocator<T1> &, const MappedAllocator<T2> &)
+{
+	return true;
+}
+
+
+template<class T1, class T2>
+inline bool operator!=(const MappedAllocator<T1> &, const MappedAllocator<T2> &)
+{
+	return false;
+}
+
+
+}
+#endif
@@ -45,6 +45,10 @@ typedef std::tr1::unordered_map<size_t, simuPOP::Individual *> IdMap;
 namespace simuPOP
 {
 
+// number of offspring in each block that draws random numbers from its own
+// stream when random number streams are used during mating
+const ssize_t RNGStreamBlockSize = 512;
+
 SeqSexModel::SeqSexModel(const vectorf &sex) : m_sex()
 {
 	DBG_FAILIF(sex.empty(), ValueError, "A sequence of sex is needed.");
@@ -279,11 +283,6 @@ UINT OffspringGenerator::numOffspring(ssize_t gen)
 
 bool OffspringGenerator::parallelizable() const
 {
-#ifdef MUTANTALLELE
-	// mutant allele model cannot generate offspring in parallele
-	// due to the use of std::map
-	return false;
-#else
 	if (!m_sexModel->parallelizable())
 		return false;
 	if (!m_numOffModel->parallelizable())
@@ -296,7 +295,6 @@ bool OffspringGenerator::parallelizable() const
 			return false;
 	}
 	return true;
-#endif
 }
 
 Sex OffspringGenerator::getSex(UINT count)
@@ -1018,7 +1016,7 @@ ParentChooser::IndividualPair PolyParentsChooser::chooseParents()
 	int threadID = omp_get_thread_num();
 #endif
 #ifdef _OPENMP
-	if (m_polyNum > 1 && m_polyCount[threadID] > 0)
+	if (m_polyNum > 1 && m_polyCount[threadID] > 0 && m_polyEpoch[threadID] == getRNG().streamEpoch())
 	{
 		if (m_polySex == MALE)
 			dad = m_lastParent[threadID];
@@ -1027,7 +1025,7 @@ ParentChooser::IndividualPair PolyParentsChooser::chooseParents()
 		m_polyCount[threadID]--;
 	}
 #else
-	if (m_polyNum > 1 && m_polyCount > 0)
+	if (m_polyNum > 1 && m_polyCount > 0 && m_polyEpoch == getRNG().streamEpoch())
 	{
 		if (m_polySex == MALE)
 			dad = m_lastParent;
@@ -1053,9 +1051,11 @@ ParentChooser::IndividualPair PolyParentsChooser::chooseParents()
 #ifdef _OPENMP
 			m_polyCount[threadID] = m_polyNum - 1;
 			m_lastParent[threadID] = dad;
+			m_polyEpoch[threadID] = getRNG().streamEpoch();
 #else
 			m_polyCount = m_polyNum - 1;
 			m_lastParent = dad;
+			m_polyEpoch = getRNG().streamEpoch();
 #endif
 		}
 	}
@@ -1075,9 +1075,11 @@ ParentChooser::IndividualPair PolyParentsChooser::chooseParents()
 #ifdef _OPENMP
 			m_polyCount[threadID] = m_polyNum - 1;
 			m_lastParent[threadID] = mom;
+			m_polyEpoch[threadID] = getRNG().streamEpoch();
 #else
 			m_polyCount = m_polyNum - 1;
 			m_lastParent = mom;
+			m_polyEpoch = getRNG().streamEpoch();
 #endif
 		}
 	}
@@ -1356,8 +1358,163 @@ void PyParentsChooser::finalize()
 	m_initialized = false;
 }
 
-MatingScheme::MatingScheme(const uintListFunc &subPopSize)
-	: m_subPopSize(subPopSize)
+AlleleTracker::AlleleTracker(const Population &pop, const vectoru &loci)
+	: m_loci(loci), m_chromTypes(loci.size()), m_ploidy(pop.ploidy()),
+	  m_allCopies(!pop.isHaplodiploid()), m_alleleCnt(loci.size()),
+	  m_allAlleles(loci.size(), 0)
+{
+	for (size_t idx = 0; idx < m_loci.size(); ++idx)
+		m_chromTypes[idx] = pop.chromType(pop.chromLocusPair(m_loci[idx]).first);
+}
+
+void AlleleTracker::count(RawIndIterator begin, RawIndIterator end)
+{
+	for (RawIndIterator ind = begin; ind != end; ++ind)
+	{
+		Sex sex = ind->sex();
+		for (size_t p = 0; p < m_ploidy; ++p)
+		{
+			GenoIterator geno = ind->genoBegin(p);
+			for (size_t idx = 0; idx < m_loci.size(); ++idx)
+			{
+				switch (m_chromTypes[idx])
+				{
+				case CHROMOSOME_X:
+					if (p == 1 && sex == MALE)
+						continue;
+					break;
+				case CHROMOSOME_Y:
+					if (p == 0 || sex == FEMALE)
+						continue;
+					break;
+				case MITOCHONDRIAL:
+					if (p > 0 && !m_allCopies)
+						continue;
+					break;
+				default:
+					break;
+				}
+				size_t v = static_cast<size_t>(DEREF_ALLELE(geno + m_loci[idx]));
+#ifndef LONGALLELE
+				if (v >= m_alleleCnt[idx].size())
+					m_alleleCnt[idx].resize(v + 1, 0);
+#endif
+				++m_alleleCnt[idx][v];
+				++m_allAlleles[idx];
+			}
+		}
+	}
+}
+
+void AlleleTracker::merge(const AlleleTracker &rhs)
+{
+	DBG_ASSERT(m_loci == rhs.m_loci, SystemError,
+			   "Cannot merge allele counts at different loci");
+	for (size_t idx = 0; idx < m_loci.size(); ++idx)
+	{
+#ifdef LONGALLELE
+		AlleleCnt::const_iterator cnt = rhs.m_alleleCnt[idx].begin();
+		AlleleCnt::const_iterator cntEnd = rhs.m_alleleCnt[idx].end();
+		for (; cnt != cntEnd; ++cnt)
+			m_alleleCnt[idx][cnt->first] += cnt->second;
+#else
+		const AlleleCnt &cnt = rhs.m_alleleCnt[idx];
+		if (cnt.size() > m_alleleCnt[idx].size())
+			m_alleleCnt[idx].resize(cnt.size(), 0);
+		for (size_t i = 0; i < cnt.size(); ++i)
+			m_alleleCnt[idx][i] += cnt[i];
+#endif
+		m_allAlleles[idx] += rhs.m_allAlleles[idx];
+	}
+}
+
+void AlleleTracker::setVars(Population &pop) const
+{
+	pop.getVars().removeVar("alleleNum");
+	pop.getVars().removeVar("alleleFreq");
+	for (size_t idx = 0; idx < m_loci.size(); ++idx)
+	{
+		uintDict num;
+		uintDict freq;
+#ifdef LONGALLELE
+		AlleleCnt::const_iterator cnt = m_alleleCnt[idx].begin();
+		AlleleCnt::const_iterator cntEnd = m_alleleCnt[idx].end();
+		for (; cnt != cntEnd; ++cnt)
+		{
+			num[cnt->first] = static_cast<double>(cnt->second);
+			freq[cnt->first] = cnt->second / static_cast<double>(m_allAlleles[idx]);
+		}
+#else
+		for (size_t i = 0; i < m_alleleCnt[idx].size(); ++i)
+		{
+			if (m_alleleCnt[idx][i] == 0)
+				continue;
+			num[i] = static_cast<double>(m_alleleCnt[idx][i]);
+			freq[i] = m_alleleCnt[idx][i] / static_cast<double>(m_allAlleles[idx]);
+		}
+#endif
+		pop.getVars().setVar((boost::format("alleleNum{%1%}") % m_loci[idx]).str(), num);
+		pop.getVars().setVar((boost::format("alleleFreq{%1%}") % m_loci[idx]).str(), freq);
+	}
+}
+
+#ifdef MUTANTALLELE
+// copy genotypes of individuals in [begin, end) from their current location
+// to the same location of \e to, in runs of individuals with adjacent genotypes
+static void copyIndGenotypes(RawIndIterator begin, RawIndIterator end, vectorm &to)
+{
+	size_t genoSize = begin->genoSize();
+	RawIndIterator it = begin;
+	while (it != end)
+	{
+		GenoIterator from = it->genoPtr();
+		size_t runEnd = from.index() + genoSize;
+		for (++it; it != end && it->genoPtr().index() == runEnd; ++it)
+			runEnd += genoSize;
+		copyGenotype(from, from + (runEnd - from.index()), to.begin() + from.index());
+	}
+	for (it = begin; it != end; ++it)
+		it->setGenoPtr(to.begin() + it->genoPtr().index());
+}
+
+void OffspringGenoBlock::redirect(RawIndIterator begin, RawIndIterator end)
+{
+	m_begin = begin;
+	m_end = end;
+	if (begin == end)
+		return;
+	m_target = &begin->genoPtr()();
+	m_genotype.resize(m_target->size(), false);
+	// existing genotypes are copied because operators might not set all alleles
+	copyIndGenotypes(begin, end, m_genotype);
+}
+
+void OffspringGenoBlock::restore()
+{
+	if (m_begin == m_end)
+		return;
+	size_t genoSize = m_begin->genoSize();
+	size_t begin = m_begin->genoPtr().index();
+	RawIndIterator it = m_begin;
+	for (; it != m_end; ++it)
+		if (it->genoPtr().index() != begin + (it - m_begin) * genoSize)
+			break;
+	if (it == m_end)
+	{
+		// genotypes are adjacent so mutants can be moved without copying
+		m_target->splice_region(begin, begin + (m_end - m_begin) * genoSize, m_genotype);
+		for (it = m_begin; it != m_end; ++it)
+			it->setGenoPtr(m_target->begin() + it->genoPtr().index());
+	}
+	else
+		copyIndGenotypes(m_begin, m_end, *m_target);
+	m_genotype.clear();
+	m_begin = m_end;
+}
+#endif
+
+MatingScheme::MatingScheme(const uintListFunc &subPopSize, const lociList &trackAlleleFreq)
+	: m_subPopSize(subPopSize), m_trackAlleleFreq(trackAlleleFreq), m_tracker(NULL)
 {
 }
 
@@ -1433,10 +1590,21 @@ bool MatingScheme::mate(Population &pop, Population &scratch)
 	// scrtach will have the right structure.
 	if (!prepareScratchPop(pop, scratch))
 		return false;
+	// count alleles of offspring as they are produced
+	vector<AlleleTracker> tracker;
+	if (!m_trackAlleleFreq.empty())
+		tracker.push_back(AlleleTracker(pop, m_trackAlleleFreq.elems(&pop)));
+	m_tracker = tracker.empty() ? NULL : &tracker[0];
 	for (size_t sp = 0; sp < static_cast<size_t>(pop.numSubPop()); ++sp)
 		if (!mateSubPop(pop, scratch, sp, scratch.rawIndBegin(sp), scratch.rawIndEnd(sp)))
+		{
+			m_tracker = NULL;
 			return false;
+		}
+	m_tracker = NULL;
 	submitScratch(pop, scratch);
+	if (!tracker.empty())
+		tracker[0].setVars(pop);
 	return true;
 }
 
@@ -1450,8 +1618,9 @@ void MatingScheme::submitScratch(Population &pop, Population &scratch)
 HomoMating::HomoMating(ParentChooser &chooser,
 					   OffspringGenerator &generator,
 					   const uintListFunc &subPopSize,
-					   subPopList subPops, double weight)
-	: MatingScheme(subPopSize), m_subPops(subPops), m_weight(weight)
+					   subPopList subPops, double weight,
+					   const lociList &trackAlleleFreq)
+	: MatingScheme(subPopSize, trackAlleleFreq), m_subPops(subPops), m_weight(weight)
 {
 	m_ParentChooser = chooser.clone();
 	m_OffspringGenerator = generator.clone();
@@ -1480,8 +1649,12 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 	// generate scratch.subPopSize(sp) individuals.
 	RawIndIterator it = offBegin;
 	// If the parent chooser is not parallelizable, or if openMP is not supported
-	// or if number of thread is set to 1, use the sequential method.
-	if (!m_ParentChooser->parallelizable() || numThreads() == 1 || !m_OffspringGenerator->parallelizable())
+	// or if number of thread is set to 1, use the sequential method. If random
+	// number streams are used, offspring are generated in blocks even if only
+	// one thread is used so that results do not depend on number of threads.
+	bool streams = useRNGStreams();
+	if (!m_ParentChooser->parallelizable() || !m_OffspringGenerator->parallelizable() ||
+		(numThreads() == 1 && !streams))
 	{
 		DBG_DO(DBG_MATING, cerr << "Mating is done in single-thread mode" << endl);
 		while (it != offEnd)
@@ -1492,26 +1665,55 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 			dad = parents.first;
 			mom = parents.second;
 
+			RawIndIterator famBegin = it;
 			m_OffspringGenerator->generateOffspring(pop, offPop, dad, mom, it, offEnd);
+			if (m_tracker != NULL)
+				m_tracker->count(famBegin, it);
 		}
 	}
 	else
 	{
 		DBG_DO(DBG_MATING, cerr << "Mating is done in " << numThreads() << " threads" << endl);
-		// in this case, openMP must have been supported with numThreads() > 1
-#ifdef _OPENMP
 		size_t offPopSize = offEnd - offBegin;
-		ssize_t nBlocks = numThreads() * 2;
 		ssize_t numOffspring = m_OffspringGenerator->numOffspring(pop.gen());
+		ssize_t nBlocks = numThreads() * 2;
+		ssize_t blockSize = offPopSize / nBlocks / numOffspring * numOffspring;
+		// random number streams
+		unsigned long seed = getRNG().seed();
+		RNG * mainRNG = NULL;
+		if (streams)
+		{
+			// use blocks of fixed size
+			blockSize = std::max<ssize_t>(RNGStreamBlockSize / numOffspring, 1) * numOffspring;
+			nBlocks = (offPopSize + blockSize - 1) / blockSize;
+			// the RNG of the main thread will be restored after mating
+			mainRNG = new RNG(getRNG());
+			mainRNG->copyState(getRNG());
+		}
+		// alleles of offspring in each block are counted separately and
+		// merged after mating
+		vector<AlleleTracker> trackers;
+		if (m_tracker != NULL)
+			trackers.resize(nBlocks, AlleleTracker(pop, m_tracker->loci()));
+#ifdef MUTANTALLELE
+		// each block of offspring writes to its own genotype
+		vector<OffspringGenoBlock> genoBlocks(nBlocks);
+#endif
 		int except = 0;
 		string msg;
-#pragma omp parallel for
+#pragma omp parallel for if (numThreads() > 1)
 		for (int i = 0; i < nBlocks; i++)
 		{
 			try
 			{
-				RawIndIterator local_it = offBegin + i * (offPopSize / nBlocks / numOffspring) * numOffspring;
-				RawIndIterator local_offEnd = i == nBlocks - 1 ? offEnd : local_it + (offPopSize / nBlocks / numOffspring) * numOffspring;
+				RawIndIterator local_it = offBegin + i * blockSize;
+				RawIndIterator local_offEnd = i == nBlocks - 1 ? offEnd : local_it + blockSize;
+
+				if (streams)
+					getRNG().setStream(seed, pop.gen(), pop.rep(), subPop, local_it - offPop.rawIndBegin());
+#ifdef MUTANTALLELE
+				genoBlocks[i].redirect(local_it, local_offEnd);
+#endif
 
 				while (local_it != local_offEnd)
 				{
@@ -1522,7 +1724,10 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 					ParentChooser::IndividualPair const parents = m_ParentChooser->chooseParents();
 					dad = parents.first;
 					mom = parents.second;
+					RawIndIterator famBegin = local_it;
 					m_OffspringGenerator->generateOffspring(pop, offPop, dad, mom, local_it, local_offEnd);
+					if (!trackers.empty())
+						trackers[i].count(famBegin, local_it);
 				}
 			}
 			catch (StopEvolution e)
@@ -1564,6 +1769,16 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 			}
 		}
 
+		if (mainRNG != NULL)
+		{
+			getRNG().copyState(*mainRNG);
+			delete mainRNG;
+		}
+#ifdef MUTANTALLELE
+		for (size_t i = 0; i < genoBlocks.size(); ++i)
+			genoBlocks[i].restore();
+#endif
+
 		if (except == 1)
 			throw StopEvolution(msg);
 		else if (except == 2)
@@ -1574,7 +1789,9 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 			throw Exception(msg);
 		else if (except == -1)
 			throw Exception("Unexpected error from openMP parallel region");
-#endif
+
+		for (size_t i = 0; i < trackers.size(); ++i)
+			m_tracker->merge(trackers[i]);
 	}
 	m_ParentChooser->finalize();
 	m_OffspringGenerator->finalize(pop);
@@ -1611,6 +1828,10 @@ bool PedigreeMating::mate(Population &pop, Population &scratch)
 	for (; iop != iopEnd; ++iop)
 		(*iop)->initializeIfNeeded(*pop.rawIndBegin());
 
+#ifdef MUTANTALLELE
+	// each thread writes to its own genotype
+	vector<OffspringGenoBlock> genoBlocks(numThreads() > 1 && parallelizable() ? numThreads() : 0);
+#endif
 #pragma omp parallel private(it, it_end) if (numThreads() > 1 && parallelizable())
 	{
 #ifdef _OPENMP
@@ -1619,6 +1840,10 @@ bool PedigreeMating::mate(Population &pop, Population &scratch)
 		it = scratch.rawIndBegin() + id * (offPopSize / numThreads());
 		it_end = id == numThreads() - 1 ? scratch.rawIndEnd() : it + (offPopSize / numThreads());
 		size_t i = id * (offPopSize / numThreads());
+#  ifdef MUTANTALLELE
+		if (!genoBlocks.empty())
+			genoBlocks[id].redirect(it, it_end);
+#  endif
 #else
 		it = scratch.rawIndBegin();
 		it_end = scratch.rawIndEnd();
@@ -1668,6 +1893,10 @@ bool PedigreeMating::mate(Population &pop, Population &scratch)
 			it->setInfo(static_cast<double>(my_id), m_idField);
 		}
 	}
+#ifdef MUTANTALLELE
+	for (size_t i = 0; i < genoBlocks.size(); ++i)
+		genoBlocks[i].restore();
+#endif
 	const_cast<Pedigree &>(m_ped).useAncestralGen(oldGen);
 	submitScratch(pop, scratch);
 	--m_gen;
@@ -1701,8 +1930,9 @@ bool PedigreeMating::parallelizable() const
 
 HeteroMating::HeteroMating(const vectormating &matingSchemes,
 						   const uintListFunc &subPopSize,
-						   bool shuffleOffspring, SexChoice weightBy)
-	: MatingScheme(subPopSize),
+						   bool shuffleOffspring, SexChoice weightBy,
+						   const lociList &trackAlleleFreq)
+	: MatingScheme(subPopSize, trackAlleleFreq),
 	  m_shuffleOffspring(shuffleOffspring),
 	  m_weightBy(weightBy)
 {
@@ -1770,6 +2000,9 @@ HeteroMating::HeteroMating(const HeteroMating &rhs) : MatingScheme(rhs), m_shuff
 		DBG_WARNIF(dynamic_cast<HomoMating *>(*it)->subPopSizeSpecified(),
 				   "Parameter subPopSize of a HomoMating is ignored when this mating"
 				   " scheme is used in a heterogeneous mating scheme.");
+		DBG_WARNIF(dynamic_cast<HomoMating *>(*it)->trackAlleleFreqSpecified(),
+				   "Parameter trackAlleleFreq of a HomoMating is ignored when this mating"
+				   " scheme is used in a heterogeneous mating scheme.");
 	}
 }
 
@@ -1779,6 +2012,14 @@ bool HeteroMating::mate(Population &pop, Population &scratch)
 	if (!prepareScratchPop(pop, scratch))
 		return false;
 
+	// alleles of offspring produced by all homogeneous mating schemes are
+	// added to the same tracker
+	vector<AlleleTracker> tracker;
+	if (!m_trackAlleleFreq.empty())
+		tracker.push_back(AlleleTracker(pop, m_trackAlleleFreq.elems(&pop)));
+	for (vectormating::iterator it = m_matingSchemes.begin(); it != m_matingSchemes.end(); ++it)
+		(*it)->setAlleleTracker(tracker.empty() ? NULL : &tracker[0]);
+
 	for (size_t sp = 0; sp < static_cast<size_t>(pop.numSubPop()); ++sp)
 	{
 		vectormating m;
@@ -1970,7 +2211,11 @@ bool HeteroMating::mate(Population &pop, Population &scratch)
 			scratch.setIndOrdered(false);
 		}
 	} // each subpopulation.
+	for (vectormating::iterator it = m_matingSchemes.begin(); it != m_matingSchemes.end(); ++it)
+		(*it)->setAlleleTracker(NULL);
 	submitScratch(pop, scratch);
+	if (!tracker.empty())
+		tracker[0].setVars(pop);
 	return true;
 }
 
@@ -1095,13 +1095,16 @@ public:
 #ifdef _OPENMP
 		m_polyCount.resize(numThreads());
 		m_lastParent.resize(numThreads());
+		m_polyEpoch.resize(numThreads());
 		for (size_t i = 0; i < numThreads(); i++) {
 			m_polyCount[i] = 0;
 			m_lastParent[i] = NULL;
+			m_polyEpoch[i] = 0;
 		}
 #else
 		m_polyCount = 0;
 		m_lastParent = NULL;
+		m_polyEpoch = 0;
 #endif
 
 		DBG_FAILIF(polyNum < 1, ValueError,
@@ -1143,10 +1146,16 @@ private:
 	vector<UINT> m_polyCount;
 
 	vector<Individual *> m_lastParent;
+
+	// stream epoch of the RNG when m_lastParent is chosen, used to avoid
+	// sharing spouses across blocks of offspring with different RNG streams
+	vector<ULONG> m_polyEpoch;
 #else
 	UINT m_polyCount;
 
 	Individual * m_lastParent;
+
+	ULONG m_polyEpoch;
 #endif
 
 	bool m_selection;
@@ -1417,6 +1426,92 @@ private:
 };
 
 
+/** CPPONLY
+ *  Count alleles at specified loci of offspring as they are produced by a
+ *  mating scheme, so that allele frequencies of the offspring generation are
+ *  known without a separate pass through the offspring population. Alleles
+ *  on sex chromosomes and mitochondrial DNA are counted as in operator
+ *  \c Stat.
+ */
+class AlleleTracker
+{
+public:
+	AlleleTracker(const Population & pop, const vectoru & loci);
+
+	/// loci at which alleles are counted
+	const vectoru & loci() const
+	{
+		return m_loci;
+	}
+
+
+	/// count alleles of individuals in the range [begin, end)
+	void count(RawIndIterator begin, RawIndIterator end);
+
+	/// add allele counts of another tracker at the same loci
+	void merge(const AlleleTracker & rhs);
+
+	/// set variables alleleNum and alleleFreq of population \e pop
+	void setVars(Population & pop) const;
+
+private:
+#ifdef LONGALLELE
+	typedef std::map<size_t, size_t> AlleleCnt;
+#else
+	typedef vectoru AlleleCnt;
+#endif
+
+	vectoru m_loci;
+
+	vectoru m_chromTypes;
+
+	size_t m_ploidy;
+
+	// count all homologous copies of mitochondrial DNA
+	bool m_allCopies;
+
+	vector<AlleleCnt> m_alleleCnt;
+
+	vectoru m_allAlleles;
+};
+
+
+#ifdef MUTANTALLELE
+/** CPPONLY
+ *  In the mutant module, genotypes of all offspring are stored in a single
+ *  sparse vector of the offspring population, which cannot be changed by
+ *  more than one thread at a time. This class redirects genotypes of a block
+ *  of offspring to a vector owned by the block so that blocks of offspring
+ *  can be produced in parallel, and moves the genotypes back to the
+ *  offspring population afterwards.
+ */
+class OffspringGenoBlock
+{
+public:
+	OffspringGenoBlock() : m_begin(), m_end(), m_target(NULL), m_genotype()
+	{
+	}
+
+
+	/// let offspring in the range [begin, end) use genotype of this block
+	void redirect(RawIndIterator begin, RawIndIterator end);
+
+	/// move genotype of offspring back to the offspring population
+	void restore();
+
+private:
+	RawIndIterator m_begin;
+
+	RawIndIterator m_end;
+
+	// genotype of the offspring population
+	vectorm * m_target;
+
+	vectorm m_genotype;
+};
+#endif
+
+
 /** This mating scheme is the base class of all mating schemes. It evolves
  *  a population generation by generation but does not actually transmit
  *  genotype.
@@ -1441,8 +1536,17 @@ public:
 	 *  prepare for mating. A common practice is to split and merge parental
 	 *  populations in this function so that you demographic related
 	 *  information and actions could be implemented in the same function.
+	 *
+	 *  If a list of loci is given to parameter \e trackAlleleFreq, alleles at
+	 *  these loci are counted as offspring are produced, and variables
+	 *  \c alleleNum and \c alleleFreq of the offspring population are set as
+	 *  if operator <tt>Stat(alleleFreq=trackAlleleFreq)</tt> were applied to
+	 *  it after mating. Because offspring are counted while their genotypes
+	 *  are being written, this avoids a separate pass through the offspring
+	 *  population.
 	 */
-	MatingScheme(const uintListFunc & subPopSize = uintListFunc());
+	MatingScheme(const uintListFunc & subPopSize = uintListFunc(),
+		const lociList & trackAlleleFreq = vectoru());
 
 	/// destructor
 	virtual ~MatingScheme()
@@ -1501,11 +1605,37 @@ public:
 	}
 
 
+	/** CPPONLY
+	 *  Use to generate a warning when trackAlleleFreq is specified in a
+	 *  homogeneous mating scheme called in a heterogeneous mating scheme.
+	 */
+	bool trackAlleleFreqSpecified()
+	{
+		return !m_trackAlleleFreq.empty();
+	}
+
+
+	/** CPPONLY
+	 *  Set an allele tracker to which alleles of offspring produced by
+	 *  mateSubPop() are added. No allele is counted if \e tracker is \c NULL.
+	 */
+	void setAlleleTracker(AlleleTracker * tracker)
+	{
+		m_tracker = tracker;
+	}
+
+
 protected:
 	/** Specify subpopulation size of the offspring generation. Can be a
 	 *  list of subpopulation sizes or a function.
 	 */
 	uintListFunc m_subPopSize;
+
+	/// loci at which allele frequencies are tracked during mating
+	lociList m_trackAlleleFreq;
+
+	/// tracker of alleles during mating, only valid during mate()
+	AlleleTracker * m_tracker;
 };
 
 
@@ -1534,12 +1664,17 @@ public:
 	 *  subpopulations this mating scheme will be applied to, and how many
 	 *  offspring this mating scheme will produce. Please refer to mating scheme
 	 *  \c HeteroMating for the use of these two parameters.
+	 *
+	 *  Parameter \e trackAlleleFreq can be used to count alleles at
+	 *  specified loci during mating. Please refer to class \c MatingScheme
+	 *  for details. This parameter is ignored if this mating scheme is used
+	 *  within a heterogeneous mating scheme.
 	 */
 	HomoMating(ParentChooser & chooser,
 		OffspringGenerator & generator,
 		const uintListFunc & subPopSize = uintListFunc(),
 		subPopList subPops = subPopList(),
-		double weight = 0);
+		double weight = 0, const lociList & trackAlleleFreq = vectoru());
 
 	/// destructor
 	~HomoMating()
@@ -1724,10 +1859,17 @@ public:
 	 *  offspring produced by these mating schemes are shuffled randomly. If this
 	 *  is not desired, you can turn off offspring shuffling by setting parameter
 	 *  \e shuffleOffspring to \c False.
+	 *
+	 *  If a list of loci is given to parameter \e trackAlleleFreq, alleles at
+	 *  these loci are counted as offspring are produced by all homogeneous
+	 *  mating schemes, and are used to set variables \c alleleNum and
+	 *  \c alleleFreq of the offspring population. Please refer to class
+	 *  \c MatingScheme for details.
 	 */
 	HeteroMating(const vectormating & matingSchemes,
 		const uintListFunc & subPopSize = uintListFunc(),
-		bool shuffleOffspring = true, SexChoice weightBy = ANY_SEX);
+		bool shuffleOffspring = true, SexChoice weightBy = ANY_SEX,
+		const lociList & trackAlleleFreq = vectoru());
 
 	/// destructor
 	~HeteroMating();
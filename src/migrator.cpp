@@ -43,6 +43,26 @@ Migrator::Migrator(const floatMatrix & rate, int mode, const uintList & toSubPop
 }
 
 
+/** Randomly select \e m of indexes 0, ..., \e n - 1 without replacement,
+ *  using a partial Fisher-Yates shuffle that only remembers swapped indexes
+ *  so that the complexity is O(m log m) instead of O(n).
+ */
+static void sampleWithoutReplacement(size_t n, size_t m, vectoru & res)
+{
+	map<size_t, size_t> swapped;
+
+	res.resize(m);
+	for (size_t i = 0; i < m; ++i) {
+		size_t j = i + getRNG().randInt(static_cast<ULONG>(n - i));
+		map<size_t, size_t>::iterator it = swapped.find(j);
+		res[i] = it == swapped.end() ? j : it->second;
+		// index j is replaced by index i, which will not be visited again
+		it = swapped.find(i);
+		swapped[j] = it == swapped.end() ? i : it->second;
+	}
+}
+
+
 string Migrator::describe(bool /* format */) const
 {
 	return "<simuPOP.Migrator>";
@@ -146,11 +166,12 @@ bool Migrator::apply(Population & pop) const
 		}
 	}
 
+	// individuals are only moved if some of them migrate by probability
+	bool migrated = m_mode != BY_PROBABILITY;
 	for (size_t from = 0, fromEnd = fromSubPops.size(); from < fromEnd; ++from) {
 		size_t spFrom = fromSubPops[from].subPop();
 		// rateSize might be toSize + 1, the last one is from->from
 		size_t toSize = toSubPops.size();
-		size_t toIndex;
 
 		// fromSubPops out of range....
 		DBG_FAILIF(spFrom >= pop.numSubPop(), IndexError,
@@ -179,37 +200,33 @@ bool Migrator::apply(Population & pop) const
 				}
 			}
 		} else if (m_mode == BY_PROBABILITY) {
-			WeightedSampler ws(migrationRate[from]);
-
-			// for each individual, migrate according to migration probability
-			if (numThreads() > 1) {
-#ifdef _OPENMP
-#  pragma omp parallel private(toIndex)
-				{
-					for (IndIterator ind = pop.indIterator(spFrom, omp_get_thread_num()); ind.valid(); ++ind) {
-						toIndex = ws.draw();
-						DBG_ASSERT(toIndex < migrationRate[from].size(), ValueError,
-							"Return index out of range.");
-						if (toIndex < toSize && toSubPops[toIndex] != spFrom)
-							ind->setInfo(static_cast<double>(toSubPops[toIndex]), info);
+			// Instead of drawing a destination for each individual, draw the
+			// number of migrants to each destination from a multinomial
+			// distribution and select migrants randomly without replacement.
+			// The last element of the rate might be from->from.
+			vectoru toNum = getRNG().randMultinomial(static_cast<unsigned int>(spSize), migrationRate[from]);
+			size_t numMigrants = 0;
+			for (size_t i = 0; i < toSize; ++i) {
+				if (toSubPops[i] == spFrom)
+					toNum[i] = 0;
+				numMigrants += toNum[i];
+			}
+			if (numMigrants > 0) {
+				migrated = true;
+				vectoru migrants;
+				sampleWithoutReplacement(spSize, numMigrants, migrants);
+				// individuals in a virtual subpopulation are not stored contiguously
+				vector<Individual *> inds;
+				if (fromSubPops[from].isVirtual())
+					for (IndIterator ind = pop.indIterator(spFrom); ind.valid(); ++ind)
+						inds.push_back(&*ind);
+				RawIndIterator spBegin = pop.rawIndBegin(spFrom);
+				vectoru::const_iterator it = migrants.begin();
+				for (size_t i = 0; i < toSize; ++i)
+					for (size_t j = 0; j < toNum[i]; ++j, ++it) {
+						Individual * ind = inds.empty() ? &*(spBegin + *it) : inds[*it];
+						ind->setInfo(static_cast<double>(toSubPops[i]), info);
 					}
-				}
-#endif
-			} else {
-				for (IndIterator ind = pop.indIterator(spFrom); ind.valid(); ++ind) {
-					//toIndex = getRNG().randIntByFreq( rateSize, &migrationRate[from][0] ) ;
-					toIndex = ws.draw();
-
-					DBG_ASSERT(toIndex < migrationRate[from].size(), ValueError,
-						"Return index out of range.");
-
-					// rateSize == toSize (no i->i addition)
-					//     toIndex < toSize
-					// rateSize = toSize + 1, ignore i->1 (last one)
-					//     toIndex < toSize
-					if (toIndex < toSize && toSubPops[toIndex] != spFrom)
-						ind->setInfo(static_cast<double>(toSubPops[toIndex]), info);
-				}
 			}
 		} else {
 			// 2nd, or 3rd method
@@ -248,6 +265,10 @@ bool Migrator::apply(Population & pop) const
 			pop.deactivateVirtualSubPop(spFrom);
 	}   // for all subPop.
 
+	// nobody is moved
+	if (!migrated)
+		return true;
+
 	// do migration.
 	size_t oldNumSubPop = pop.numSubPop();
 	pop.setSubPopByIndInfo(infoField(0));
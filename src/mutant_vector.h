@@ -28,11 +28,457 @@
 
 #ifdef MUTANTALLELE
 
-#  include <map>
+#  include <vector>
+#  include <algorithm>
 #  include <iostream>
 
 namespace simuPOP {
 
+/** A sorted sequence of (index, allele) pairs with the part of the interface
+ *  of std::map<size_t, Allele> that is used by vectorm. Pairs are stored in
+ *  chunks of contiguous memory so that mutants can be iterated without
+ *  chasing pointers and segments of mutants can be copied in bulk. Memory is
+ *  allocated for a chunk of mutants instead of each mutant, and chunks
+ *  released by the container are kept in a pool for later use.
+ */
+class mutantStorage
+{
+public:
+	typedef std::pair<size_t, Allele> value_type;
+	typedef std::vector<value_type> chunk;
+
+	/// number of mutants in a chunk filled by appending mutants
+	static const size_t chunkSize = 512;
+
+	/// maximum number of released chunks kept for later use
+	static const size_t poolSize = 64;
+
+	template <typename C, typename V>
+	class basic_iterator
+	{
+public:
+		basic_iterator() : m_storage(NULL), m_chunk(0), m_pos(0)
+		{
+		}
+
+
+		basic_iterator(C * storage, size_t chunk, size_t pos) :
+			m_storage(storage), m_chunk(chunk), m_pos(pos)
+		{
+		}
+
+
+		// conversion from iterator to const_iterator
+		template <typename C1, typename V1>
+		basic_iterator(const basic_iterator<C1, V1> & it) :
+			m_storage(it.m_storage), m_chunk(it.m_chunk), m_pos(it.m_pos)
+		{
+		}
+
+
+		V & operator*() const
+		{
+			return (*m_storage->m_chunks[m_chunk])[m_pos];
+		}
+
+
+		V * operator->() const
+		{
+			return &(*m_storage->m_chunks[m_chunk])[m_pos];
+		}
+
+
+		basic_iterator & operator++()
+		{
+			if (++m_pos == m_storage->m_chunks[m_chunk]->size()) {
+				++m_chunk;
+				m_pos = 0;
+			}
+			return *this;
+		}
+
+
+		basic_iterator operator++(int)
+		{
+			basic_iterator orig = *this;
+
+			++(*this);
+			return orig;
+		}
+
+
+		bool operator==(const basic_iterator & rhs) const
+		{
+			return m_chunk == rhs.m_chunk && m_pos == rhs.m_pos;
+		}
+
+
+		bool operator!=(const basic_iterator & rhs) const
+		{
+			return m_chunk != rhs.m_chunk || m_pos != rhs.m_pos;
+		}
+
+
+private:
+		template <typename C1, typename V1> friend class basic_iterator;
+		friend class mutantStorage;
+
+		C * m_storage;
+		// index of chunk, which is the number of chunks for end()
+		size_t m_chunk;
+		// position in the chunk
+		size_t m_pos;
+	};
+
+	typedef basic_iterator<mutantStorage, value_type> iterator;
+	typedef basic_iterator<const mutantStorage, const value_type> const_iterator;
+
+	mutantStorage() : m_chunks(), m_pool(), m_size(0)
+	{
+	}
+
+
+	mutantStorage(const mutantStorage & rhs) : m_chunks(), m_pool(), m_size(rhs.m_size)
+	{
+		m_chunks.reserve(rhs.m_chunks.size());
+		for (size_t c = 0; c < rhs.m_chunks.size(); ++c)
+			m_chunks.push_back(new chunk(*rhs.m_chunks[c]));
+	}
+
+
+	~mutantStorage()
+	{
+		clear();
+		for (size_t c = 0; c < m_pool.size(); ++c)
+			delete m_pool[c];
+	}
+
+
+	mutantStorage & operator=(const mutantStorage & rhs)
+	{
+		if (this != &rhs) {
+			mutantStorage tmp(rhs);
+			swap(tmp);
+		}
+		return *this;
+	}
+
+
+	void swap(mutantStorage & rhs)
+	{
+		m_chunks.swap(rhs.m_chunks);
+		m_pool.swap(rhs.m_pool);
+		std::swap(m_size, rhs.m_size);
+	}
+
+
+	size_t size() const
+	{
+		return m_size;
+	}
+
+
+	bool empty() const
+	{
+		return m_size == 0;
+	}
+
+
+	iterator begin()
+	{
+		return iterator(this, 0, 0);
+	}
+
+
+	const_iterator begin() const
+	{
+		return const_iterator(this, 0, 0);
+	}
+
+
+	iterator end()
+	{
+		return iterator(this, m_chunks.size(), 0);
+	}
+
+
+	const_iterator end() const
+	{
+		return const_iterator(this, m_chunks.size(), 0);
+	}
+
+
+	/// the mutant with the largest index
+	const value_type & back() const
+	{
+		return m_chunks.back()->back();
+	}
+
+
+	iterator lower_bound(size_t index)
+	{
+		size_t c = findChunk(index);
+
+		if (c == m_chunks.size())
+			return end();
+		chunk & ch = *m_chunks[c];
+		return iterator(this, c, std::lower_bound(ch.begin(), ch.end(), index, indexLess()) - ch.begin());
+	}
+
+
+	const_iterator lower_bound(size_t index) const
+	{
+		return const_cast<mutantStorage *>(this)->lower_bound(index);
+	}
+
+
+	iterator upper_bound(size_t index)
+	{
+		return lower_bound(index + 1);
+	}
+
+
+	iterator find(size_t index)
+	{
+		iterator it = lower_bound(index);
+
+		return it == end() || it->first != index ? end() : it;
+	}
+
+
+	const_iterator find(size_t index) const
+	{
+		return const_cast<mutantStorage *>(this)->find(index);
+	}
+
+
+	/// append a mutant with an index larger than existing ones
+	void push_back(const value_type & val)
+	{
+		if (m_chunks.empty() || m_chunks.back()->size() >= chunkSize)
+			m_chunks.push_back(newChunk());
+		m_chunks.back()->push_back(val);
+		++m_size;
+	}
+
+
+	/// insert a mutant before \e pos and return its location
+	iterator insert(const iterator & pos, const value_type & val)
+	{
+		if (pos.m_chunk == m_chunks.size()) {
+			push_back(val);
+			return iterator(this, m_chunks.size() - 1, m_chunks.back()->size() - 1);
+		}
+		chunk & ch = *m_chunks[pos.m_chunk];
+		ch.insert(ch.begin() + pos.m_pos, val);
+		++m_size;
+		if (ch.size() <= 2 * chunkSize)
+			return pos;
+		splitChunk(pos.m_chunk);
+		return pos.m_pos < chunkSize ? pos : iterator(this, pos.m_chunk + pos.m_pos / chunkSize, pos.m_pos % chunkSize);
+	}
+
+
+	/** Insert mutants in [first, last) before \e pos, with their indexes
+	 *  shifted by \e shift.
+	 */
+	void insert(const iterator & pos, const_iterator first, const const_iterator & last, ssize_t shift)
+	{
+		if (first == last)
+			return;
+		if (pos.m_chunk == m_chunks.size() && first.m_storage != this) {
+			// append directly
+			for (; first.m_chunk < last.m_chunk || (first.m_chunk == last.m_chunk && first.m_pos < last.m_pos); ) {
+				const chunk & src = *first.m_storage->m_chunks[first.m_chunk];
+				size_t srcEnd = first.m_chunk == last.m_chunk ? last.m_pos : src.size();
+				if (m_chunks.empty() || m_chunks.back()->size() >= chunkSize)
+					m_chunks.push_back(newChunk());
+				chunk & dest = *m_chunks.back();
+				size_t n = std::min(srcEnd - first.m_pos, chunkSize - dest.size());
+				for (size_t i = first.m_pos; i < first.m_pos + n; ++i)
+					dest.push_back(value_type(src[i].first + shift, src[i].second));
+				m_size += n;
+				if (first.m_pos + n == src.size()) {
+					++first.m_chunk;
+					first.m_pos = 0;
+				} else
+					first.m_pos += n;
+			}
+			return;
+		}
+		// copy to a buffer because the source could be part of this container
+		chunk buf;
+		for (; first != last; ++first)
+			buf.push_back(value_type(first->first + shift, first->second));
+		if (pos.m_chunk == m_chunks.size()) {
+			for (size_t i = 0; i < buf.size(); ++i)
+				push_back(buf[i]);
+			return;
+		}
+		chunk & ch = *m_chunks[pos.m_chunk];
+		ch.insert(ch.begin() + pos.m_pos, buf.begin(), buf.end());
+		m_size += buf.size();
+		if (ch.size() > 2 * chunkSize)
+			splitChunk(pos.m_chunk);
+	}
+
+
+	/** Move all mutants of \e rhs before \e pos without copying them. Indexes
+	 *  of these mutants should fall between those around \e pos.
+	 */
+	void splice(const iterator & pos, mutantStorage & rhs)
+	{
+		if (rhs.m_chunks.empty())
+			return;
+		size_t c = pos.m_chunk;
+		if (pos.m_pos > 0) {
+			// split the chunk at pos
+			chunk & ch = *m_chunks[c];
+			chunk * tail = newChunk();
+			tail->assign(ch.begin() + pos.m_pos, ch.end());
+			ch.erase(ch.begin() + pos.m_pos, ch.end());
+			m_chunks.insert(m_chunks.begin() + ++c, tail);
+		}
+		m_chunks.insert(m_chunks.begin() + c, rhs.m_chunks.begin(), rhs.m_chunks.end());
+		m_size += rhs.m_size;
+		rhs.m_chunks.clear();
+		rhs.m_size = 0;
+	}
+
+
+	void erase(const iterator & pos)
+	{
+		chunk & ch = *m_chunks[pos.m_chunk];
+
+		ch.erase(ch.begin() + pos.m_pos);
+		--m_size;
+		if (ch.empty()) {
+			releaseChunk(m_chunks[pos.m_chunk]);
+			m_chunks.erase(m_chunks.begin() + pos.m_chunk);
+		}
+	}
+
+
+	void erase(const iterator & first, const iterator & last)
+	{
+		if (first == last)
+			return;
+		if (first.m_chunk == last.m_chunk) {
+			chunk & ch = *m_chunks[first.m_chunk];
+			ch.erase(ch.begin() + first.m_pos, ch.begin() + last.m_pos);
+			m_size -= last.m_pos - first.m_pos;
+			if (ch.empty()) {
+				releaseChunk(m_chunks[first.m_chunk]);
+				m_chunks.erase(m_chunks.begin() + first.m_chunk);
+			}
+			return;
+		}
+		// chunks in [chunkBegin, last.m_chunk) are removed
+		size_t chunkBegin = first.m_chunk;
+		if (first.m_pos > 0) {
+			chunk & ch = *m_chunks[first.m_chunk];
+			m_size -= ch.size() - first.m_pos;
+			ch.erase(ch.begin() + first.m_pos, ch.end());
+			++chunkBegin;
+		}
+		if (last.m_pos > 0) {
+			chunk & ch = *m_chunks[last.m_chunk];
+			m_size -= last.m_pos;
+			ch.erase(ch.begin(), ch.begin() + last.m_pos);
+		}
+		for (size_t c = chunkBegin; c < last.m_chunk; ++c) {
+			m_size -= m_chunks[c]->size();
+			releaseChunk(m_chunks[c]);
+		}
+		m_chunks.erase(m_chunks.begin() + chunkBegin, m_chunks.begin() + last.m_chunk);
+	}
+
+
+	void clear()
+	{
+		for (size_t c = 0; c < m_chunks.size(); ++c)
+			releaseChunk(m_chunks[c]);
+		m_chunks.clear();
+		m_size = 0;
+	}
+
+
+private:
+	struct indexLess
+	{
+		bool operator()(const value_type & val, size_t index) const
+		{
+			return val.first < index;
+		}
+
+
+	};
+
+	/// index of the first chunk with a mutant at or after \e index
+	size_t findChunk(size_t index) const
+	{
+		size_t lo = 0;
+		size_t hi = m_chunks.size();
+
+		while (lo < hi) {
+			size_t mid = (lo + hi) / 2;
+			if (m_chunks[mid]->back().first < index)
+				lo = mid + 1;
+			else
+				hi = mid;
+		}
+		return lo;
+	}
+
+
+	chunk * newChunk()
+	{
+		if (m_pool.empty()) {
+			chunk * ch = new chunk();
+			ch->reserve(chunkSize);
+			return ch;
+		}
+		chunk * ch = m_pool.back();
+		m_pool.pop_back();
+		return ch;
+	}
+
+
+	void releaseChunk(chunk * ch)
+	{
+		if (m_pool.size() < poolSize) {
+			ch->clear();
+			m_pool.push_back(ch);
+		} else
+			delete ch;
+	}
+
+
+	/// split a large chunk into chunks of chunkSize mutants
+	void splitChunk(size_t c)
+	{
+		chunk * ch = m_chunks[c];
+		size_t numChunks = (ch->size() + chunkSize - 1) / chunkSize;
+
+		std::vector<chunk *> chunks(numChunks - 1);
+		for (size_t i = 1; i < numChunks; ++i) {
+			chunks[i - 1] = newChunk();
+			chunks[i - 1]->assign(ch->begin() + i * chunkSize,
+				ch->begin() + std::min(ch->size(), (i + 1) * chunkSize));
+		}
+		ch->resize(chunkSize);
+		m_chunks.insert(m_chunks.begin() + c + 1, chunks.begin(), chunks.end());
+	}
+
+
+	std::vector<chunk *> m_chunks;
+
+	std::vector<chunk *> m_pool;
+
+	size_t m_size;
+};
+
+
 class vectorm
 {
 public:
@@ -40,7 +486,7 @@ public:
 	typedef const Allele & const_reference;
 	typedef Allele * pointer;
 	typedef const Allele * const_pointer;
-	typedef std::map<size_t, Allele> storage;
+	typedef mutantStorage storage;
 	typedef storage::iterator val_iterator;
 	typedef storage::const_iterator const_val_iterator;
 
@@ -147,7 +593,15 @@ public:
 	inline void push_back(size_t i, const_reference t)
 	{
 		DBG_ASSERT(t != 0, RuntimeError, "Cannot store zero as mutant");
-		m_data.insert(m_data.end(), storage::value_type(i, t));
+		if (m_data.empty() || i > m_data.back().first)
+			m_data.push_back(storage::value_type(i, t));
+		else {
+			val_iterator it = m_data.lower_bound(i);
+			if (it->first == i)
+				it->second = t;
+			else
+				m_data.insert(it, storage::value_type(i, t));
+		}
 	}
 
 
@@ -165,12 +619,7 @@ public:
 		ssize_t shift = m_size - ibeg.index();
 
 		m_size += iend.index() - ibeg.index();
-		const_val_iterator ptr = beg;
-		for (; ptr != end; ++ptr) {
-			DBG_ASSERT(ptr->second != 0, RuntimeError, "Cannot store zero as mutant");
-			// we are inserting to the end, which should be constant instead of log(n) time
-			m_data.insert(m_data.end(), storage::value_type(ptr->first + shift, ptr->second));
-		}
+		m_data.insert(m_data.end(), beg, end, shift);
 	}
 
 
@@ -182,60 +631,22 @@ public:
 		ssize_t lagging = it.index() - begin.index();
 
 		// remove old data
-		if (!m_data.empty() && it.index() <= m_data.rbegin()->first)
+		if (!m_data.empty() && it.index() <= m_data.back().first)
 			m_data.erase(m_data.lower_bound(it.index()),
 				iend > m_size ? m_data.end() : m_data.lower_bound(iend));
-		// insert new data
+		// insert new data in bulk
 		const_val_iterator vbeg = begin.get_val_iterator();
 		const_val_iterator vend = (end - (iend > m_size ? iend - m_size : 0)).get_val_iterator();
-		if (vbeg == vend)
-			return;
-		// the first element is insert to get the right location for future insertion
-		DBG_ASSERT(vbeg->second != 0, RuntimeError, "Cannot store zero as mutant");
-		val_iterator dest = m_data.insert(m_data.end(), val_iterator::value_type(vbeg->first + lagging, vbeg->second));
-		++vbeg;
-		// according to the documentation, if ip in insert(ip, val) is set to the position
-		// precedes the value to be inserted, this will make a very fast insertion.
-		// because we are insertion from small to large numbers, we are setting ip to the
-		// location of the last item
-		for (; vbeg != vend; ++vbeg) {
-			DBG_ASSERT(vbeg->second != 0, RuntimeError, "Cannot store zero as mutant");
-			dest = m_data.insert(dest, val_iterator::value_type(vbeg->first + lagging, vbeg->second));
-		}
-#  if 0
-		/*
-		   The following code copies elements one by one, which can be more efficient if the
-		   elements overlap a lot so that we do not have to remove and insert values at the
-		   same location. In practice this rarely happens because we clear genotypes of the
-		   offspring before mating.
-		 */
-		size_t iend = it.index() + (end - begin);
-		ssize_t lagging = it.index() - begin.index();
-
-		const_val_iterator sbeg = begin.get_val_iterator();
-		const_val_iterator send = (end - (iend > m_size ? iend - m_size : 0)).get_val_iterator();
-		if (sbeg == send)
-			return;
+		m_data.insert(m_data.lower_bound(it.index()), vbeg, vend, lagging);
+	}
 
-		val_iterator dbeg = m_data.lower_bound(it.index());
-		val_iterator dend = iend > m_size ? m_data.end() : m_data.lower_bound(iend);
 
-		for (; sbeg != send; ++sbeg) {
-			if (dbeg == dend) {
-				// destination empty, no comparison is needed
-				for ( ; sbeg != send; ++sbeg)
-					dbeg = m_data.insert(dbeg, val_iterator::value_type(sbeg->first + lagging, sbeg->second));
-				return;
-			}
-			if (sbeg->first < dbeg->first)          // insert
-				m_data.insert(dbeg, val_iterator::value_type(sbeg->first + lagging, sbeg->second));
-			else if (sbeg->first == dbeg->first) {  // assign
-				dbeg->second = sbeg->second;
-				++dbeg;
-			} else  // remove
-				m_data.erase(dbeg++);
-		}
-#  endif
+	// replace region [beg, end) with mutants of v, which should all be in
+	// this region, and leave v empty
+	inline void splice_region(size_t beg, size_t end, vectorm & v)
+	{
+		m_data.erase(m_data.lower_bound(beg), m_data.lower_bound(end));
+		m_data.splice(m_data.lower_bound(beg), v.m_data);
 	}
 
 
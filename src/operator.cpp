@@ -1228,6 +1228,180 @@ bool PyOperator::applyDuringMating(Population & pop, Population & offPop, RawInd
 }
 
 
+pyFuncArgs::pyFuncArgs(const pyFunc & func, int types) :
+	m_func(func), m_types(func.numArgs(), INFO_ARG), m_infoIdx(func.numArgs(), 0),
+	m_lastGenoStru(MaxTraitIndex), m_tuple(NULL)
+{
+	for (size_t i = 0; i < func.numArgs(); ++i) {
+		const string & arg = func.arg(i);
+		ArgType type = INFO_ARG;
+		if (arg == "ind")
+			type = IND_ARG;
+		else if (arg == "geno")
+			type = GENO_ARG;
+		else if (arg == "mut")
+			type = MUT_ARG;
+		else if (arg == "gen")
+			type = GEN_ARG;
+		else if (arg == "pop")
+			type = POP_ARG;
+		if (type & types)
+			m_types[i] = type;
+	}
+}
+
+
+pyFuncArgs::pyFuncArgs(const pyFuncArgs & rhs) :
+	m_func(rhs.m_func), m_types(rhs.m_types), m_infoIdx(rhs.m_infoIdx),
+	m_lastGenoStru(rhs.m_lastGenoStru), m_tuple(NULL)
+{
+}
+
+
+pyFuncArgs::~pyFuncArgs()
+{
+	Py_XDECREF(m_tuple);
+}
+
+
+void pyFuncArgs::initializeIfNeeded(const Individual & ind) const
+{
+	if (m_lastGenoStru == ind.genoStruIdx())
+		return;
+	for (size_t i = 0; i < m_types.size(); ++i) {
+		if (m_types[i] != INFO_ARG)
+			continue;
+		const string & arg = m_func.arg(i);
+		if (!ind.hasInfoField(arg))
+			throw ValueError("Parameter " + arg + " of function " + m_func.name() +
+				" is not an acceptable parameter or the name of an information field.");
+		m_infoIdx[i] = ind.infoIdx(arg);
+	}
+	m_lastGenoStru = ind.genoStruIdx();
+}
+
+
+PyObject * pyFuncArgs::tuple() const
+{
+	if (m_tuple == NULL || Py_REFCNT(m_tuple) > 1) {
+		Py_XDECREF(m_tuple);
+		m_tuple = PyTuple_New(m_types.size());
+		DBG_ASSERT(m_tuple, RuntimeError, "Failed to create a parameter tuple");
+	}
+	return m_tuple;
+}
+
+
+void checkBatchFunc(const pyFunc & func)
+{
+	if (func.hasArg("ind") || func.hasArg("mut"))
+		throw ValueError("Parameters ind and mut are not allowed for function " + func.name() +
+			" that is called in batch mode.");
+	PyObject * numpy = PyImport_ImportModule("numpy");
+	if (numpy == NULL) {
+		PyErr_Clear();
+		throw ValueError("Module numpy is required to call function " + func.name() + " in batch mode.");
+	}
+	Py_DECREF(numpy);
+}
+
+
+// call func for individuals inds[idx[0]], inds[idx[1]], ... whose genotypes
+// at specified loci, if requested, are given by alleles.
+static void batchCallGroup(const pyFunc & func, Population * pop, size_t gen,
+                           const vector<Individual *> & inds, const vector<vector<ULONG> > & alleles,
+                           const vectoru & idx, size_t numValues, vectorf & values)
+{
+	size_t numInds = idx.size();
+	PyObject * args = PyTuple_New(func.numArgs());
+
+	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
+
+	try {
+		for (size_t i = 0; i < func.numArgs(); ++i) {
+			const string & arg = func.arg(i);
+			if (arg == "geno") {
+				size_t numAlleles = alleles[idx[0]].size();
+				vector<long> geno;
+				geno.reserve(numInds * numAlleles);
+				for (size_t j = 0; j < numInds; ++j)
+					geno.insert(geno.end(), alleles[idx[j]].begin(), alleles[idx[j]].end());
+				vectoru shape(2, numInds);
+				shape[1] = numAlleles;
+				PyTuple_SET_ITEM(args, i, Vec_As_NumPyArray(geno, shape));
+			} else if (arg == "gen")
+				PyTuple_SET_ITEM(args, i, PyLong_FromLong(static_cast<long>(gen)));
+			else if (arg == "pop") {
+				DBG_FAILIF(pop == NULL, ValueError, "No valid population reference is passed.");
+				PyTuple_SET_ITEM(args, i, pyPopObj(static_cast<void *>(pop)));
+			} else {
+				DBG_FAILIF(!inds[idx[0]]->hasInfoField(arg), ValueError,
+					"Only parameters 'geno', 'gen', 'pop' and names of information fields are "
+					"acceptable in function " + func.name());
+				vectorf info(numInds);
+				size_t infoIdx = inds[idx[0]]->infoIdx(arg);
+				for (size_t j = 0; j < numInds; ++j)
+					info[j] = inds[idx[j]]->info(infoIdx);
+				PyTuple_SET_ITEM(args, i, Vec_As_NumPyArray(info, vectoru(1, numInds)));
+			}
+		}
+	} catch (...) {
+		Py_DECREF(args);
+		throw;
+	}
+
+	PyObject * res = func(args);
+	Py_DECREF(args);
+	PyObject * numpy = PyImport_ImportModule("numpy");
+	PyObject * arr = numpy == NULL ? NULL : PyObject_CallMethod(numpy, "ascontiguousarray", "Os", res, "d");
+	Py_XDECREF(numpy);
+	Py_DECREF(res);
+
+	Py_buffer buf;
+	if (arr == NULL || PyObject_GetBuffer(arr, &buf, PyBUF_C_CONTIGUOUS) != 0) {
+		Py_XDECREF(arr);
+		PyErr_Clear();
+		throw ValueError("Function " + func.name() + " should return an array of numbers in batch mode.");
+	}
+	bool valid = buf.ndim >= 1 && static_cast<size_t>(buf.shape[0]) == numInds &&
+	             static_cast<size_t>(buf.len) == numInds * numValues * sizeof(double);
+	if (valid) {
+		const double * ptr = static_cast<const double *>(buf.buf);
+		for (size_t j = 0; j < numInds; ++j)
+			std::copy(ptr + j * numValues, ptr + (j + 1) * numValues, values.begin() + idx[j] * numValues);
+	}
+	PyBuffer_Release(&buf);
+	Py_DECREF(arr);
+	if (!valid)
+		throw ValueError((boost::format("Function %1% should return %2% value(s) for each of the %3% individuals.")
+			              % func.name() % numValues % numInds).str());
+}
+
+
+void batchCall(const pyFunc & func, Population * pop, size_t gen, const lociList & loci,
+               const vector<Individual *> & inds, size_t numValues, vectorf & values)
+{
+	size_t numInds = inds.size();
+	bool hasGeno = func.hasArg("geno");
+
+	// Individuals can have different numbers of alleles at the loci, for example
+	// males and females at loci on sex chromosomes, or males and females of
+	// haplodiploid populations. Their genotypes cannot be stacked to a 2-d array
+	// so individuals are grouped by number of alleles and passed in separate calls.
+	vector<vector<ULONG> > alleles(hasGeno ? numInds : 0);
+	map<size_t, vectoru> groups;
+	for (size_t j = 0; j < numInds; ++j) {
+		if (hasGeno)
+			inds[j]->allelesAtLoci(loci, alleles[j]);
+		groups[hasGeno ? alleles[j].size() : 0].push_back(j);
+	}
+	values.resize(numInds * numValues);
+	map<size_t, vectoru>::const_iterator it = groups.begin();
+	for (; it != groups.end(); ++it)
+		batchCallGroup(func, pop, gen, inds, alleles, it->second, numValues, values);
+}
+
+
 void applyDuringMatingOperator(const BaseOperator & op,
                                Population * pop, Population * offPop, ssize_t dad, ssize_t mom,
                                const pairu & off)
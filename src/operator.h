@@ -957,6 +957,122 @@ private:
 };
 
 
+/** CPPONLY
+ *  Arguments of a Python function that is called for each individual.
+ *  Parameter names of the function are resolved to argument types once,
+ *  and names of information fields are resolved to their indexes whenever
+ *  the genotypic structure of individuals changes, so that no string
+ *  comparison is needed when arguments are prepared for an individual.
+ *  The argument tuple is reused for the next call if the function does not
+ *  keep a reference to it.
+ */
+class pyFuncArgs
+{
+public:
+	/// types of arguments, which can be combined to specify accepted types
+	enum ArgType {
+		IND_ARG = 1,
+		GENO_ARG = 2,
+		MUT_ARG = 4,
+		GEN_ARG = 8,
+		POP_ARG = 16,
+		INFO_ARG = 32
+	};
+
+	/** Resolve parameters of \e func to argument types. Parameters \c ind,
+	 *  \c geno, \c mut, \c gen and \c pop are recognized if their types
+	 *  are included in \e types. Other parameters are treated as names of
+	 *  information fields.
+	 */
+	pyFuncArgs(const pyFunc & func, int types);
+
+	pyFuncArgs(const pyFuncArgs & rhs);
+
+	~pyFuncArgs();
+
+	/// number of arguments
+	size_t size() const
+	{
+		return m_types.size();
+	}
+
+
+	/// type of the \e i-th argument
+	ArgType type(size_t i) const
+	{
+		return m_types[i];
+	}
+
+
+	/** index of the information field passed as the \e i-th argument, for
+	 *  individuals with the genotypic structure passed to initializeIfNeeded
+	 */
+	size_t infoIdx(size_t i) const
+	{
+		return m_infoIdx[i];
+	}
+
+
+	/** Resolve names of information fields for the genotypic structure of
+	 *  \e ind, if it differs from the last one. A \c ValueError will be
+	 *  raised if an information field does not exist.
+	 */
+	void initializeIfNeeded(const Individual & ind) const;
+
+	/** Return an argument tuple to be filled by \c setArg. The tuple of the
+	 *  last call is returned if it is no longer referred by others.
+	 */
+	PyObject * tuple() const;
+
+	/// set the \e i-th argument of the tuple, stealing a reference to \e item
+	void setArg(size_t i, PyObject * item) const
+	{
+		PyObject * old = PyTuple_GET_ITEM(m_tuple, i);
+
+		PyTuple_SET_ITEM(m_tuple, i, item);
+		Py_XDECREF(old);
+	}
+
+
+private:
+	/// function name and parameters, used for error messages
+	const pyFunc m_func;
+
+	/// types of arguments
+	vector<ArgType> m_types;
+
+	/// indexes of information fields
+	mutable vectoru m_infoIdx;
+
+	/// genotypic structure for which m_infoIdx is resolved
+	mutable TraitIndexType m_lastGenoStru;
+
+	/// argument tuple of the last call
+	mutable PyObject * m_tuple;
+};
+
+
+/** CPPONLY
+ *  Check if Python function \e func can be called in batch mode, namely with
+ *  arrays of values for a block of individuals. A \c ValueError will be
+ *  raised if the function accepts parameter \c ind or \c mut, or if NumPy
+ *  is not available.
+ */
+void checkBatchFunc(const pyFunc & func);
+
+/** CPPONLY
+ *  Call Python function \e func for individuals \e inds, passing
+ *  genotypes at \e loci as a 2-d NumPy array with one row per individual
+ *  (parameter \c geno), values at information fields as 1-d NumPy arrays,
+ *  generation number \e gen (parameter \c gen) and population \e pop
+ *  (parameter \c pop). The function should return an array with
+ *  \e numValues values for each individual, which will be saved to
+ *  \e values. If genotypes are requested, the function is called once for
+ *  each group of individuals with the same number of alleles at \e loci.
+ */
+void batchCall(const pyFunc & func, Population * pop, size_t gen, const lociList & loci,
+	const vector<Individual *> & inds, size_t numValues, vectorf & values);
+
 /** HIDDEN
  *  This function is used to test during mating operators. It simply apply
  *  operator \e op to \e dad, \e mom to offspring \e off through \e off1
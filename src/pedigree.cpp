@@ -30,8 +30,21 @@ using std::ofstream;
 
 #include <set>
 
+#if PY_VERSION_HEX >= 0x03000000
+#  define PyInt_FromLong(x) PyLong_FromLong(x)
+#endif
+
 namespace simuPOP {
 
+// indexes of individuals by their IDs
+#if TR1_SUPPORT == 0
+typedef std::map<size_t, size_t> IndexMap;
+#elif TR1_SUPPORT == 1
+typedef std::unordered_map<size_t, size_t> IndexMap;
+#else
+typedef std::tr1::unordered_map<size_t, size_t> IndexMap;
+#endif
+
 Pedigree::Pedigree(const Population & pop, const lociList & loci,
 	const stringList & infoFields, const uintList & ancGens, const string & idField,
 	const string & fatherField, const string & motherField, bool stealPop)
@@ -271,6 +284,78 @@ void Pedigree::locateRelatives(RelativeType relType, const vectorstr & resultFie
 }
 
 
+void Pedigree::buildFamilies(const vectoru & ancGens, Families & fam)
+{
+	IndexMap index;
+
+	// all individuals of the pedigree, which might be parents of members
+	for (IdMap::const_iterator it = m_idMap.begin(); it != m_idMap.end(); ++it) {
+		index[it->first] = fam.inds.size();
+		fam.inds.push_back(it->second);
+		fam.IDs.push_back(it->first);
+	}
+	fam.firstMember.resize(fam.inds.size(), NOT_FOUND);
+
+	for (unsigned genIdx = 0; genIdx < ancGens.size(); ++genIdx) {
+		useAncestralGen(ancGens[genIdx]);
+		for (size_t i = 0; i < popSize(); ++i) {
+			Individual & ind = individual(i);
+			size_t m = fam.members.size();
+			size_t idx = index[toID(ind.info(m_idIdx))];
+			fam.members.push_back(&ind);
+			fam.memberInd.push_back(idx);
+			if (fam.firstMember[idx] == NOT_FOUND)
+				fam.firstMember[idx] = m;
+			// locate parents, parents who are not in the pedigree are added
+			// as NULL individuals so that they still define families.
+			size_t parents[2] = { NOT_FOUND, NOT_FOUND };
+			int parentIdx[2] = { m_fatherIdx, m_motherIdx };
+			bool found = m_fatherIdx != -1 || m_motherIdx != -1;
+			for (size_t p = 0; p < 2; ++p) {
+				if (parentIdx[p] == -1)
+					continue;
+				double pid = ind.info(parentIdx[p]);
+				if (pid < 1) {
+					found = false;
+					continue;
+				}
+				IndexMap::iterator it = index.find(toID(pid));
+				if (it == index.end()) {
+					it = index.insert(IndexMap::value_type(toID(pid), fam.inds.size())).first;
+					fam.inds.push_back(NULL);
+					fam.IDs.push_back(toID(pid));
+					fam.firstMember.push_back(NOT_FOUND);
+				}
+				parents[p] = it->second;
+				if (fam.inds[parents[p]] == NULL)
+					found = false;
+			}
+			fam.fathers.push_back(parents[0]);
+			fam.mothers.push_back(parents[1]);
+			fam.parentsFound.push_back(found);
+		}
+	}
+	// offspring of each parent, in the order they appear in the pedigree
+	fam.offsets.resize(fam.inds.size() + 1, 0);
+	for (size_t m = 0; m < fam.members.size(); ++m) {
+		if (fam.fathers[m] != NOT_FOUND)
+			++fam.offsets[fam.fathers[m] + 1];
+		if (fam.mothers[m] != NOT_FOUND)
+			++fam.offsets[fam.mothers[m] + 1];
+	}
+	for (size_t i = 0; i < fam.inds.size(); ++i)
+		fam.offsets[i + 1] += fam.offsets[i];
+	vectoru next(fam.offsets.begin(), fam.offsets.end() - 1);
+	fam.offspring.resize(fam.offsets.back());
+	for (size_t m = 0; m < fam.members.size(); ++m) {
+		if (fam.fathers[m] != NOT_FOUND)
+			fam.offspring[next[fam.fathers[m]]++] = 2 * m;
+		if (fam.mothers[m] != NOT_FOUND)
+			fam.offspring[next[fam.mothers[m]]++] = 2 * m + 1;
+	}
+}
+
+
 void Pedigree::locateSpouse(SexChoice sexChoice, AffectionStatus affectionChoice, const vectorstr & resultFields,
                             const vectoru & ancGens, bool excludeOutbred)
 {
@@ -282,10 +367,6 @@ void Pedigree::locateSpouse(SexChoice sexChoice, AffectionStatus affectionChoice
 
 	DBG_FAILIF(sexChoice == SAME_SEX, ValueError, "Can not locate spouses with the same sex");
 
-	// if we are using individual ID, the algorithm is slower, but it can handle
-	// overlapping generations.
-	//
-	// What we essentially do is getting all the couples and assign them...
 	size_t maxSpouse = resultFields.size();
 
 	vectoru spouseIdx(maxSpouse);
@@ -302,75 +383,49 @@ void Pedigree::locateSpouse(SexChoice sexChoice, AffectionStatus affectionChoice
 				*ptr = -1;
 		}
 	}
-	// find all the couples
-	typedef pairu couple;
-	vector<couple> couples;
-	for (unsigned genIdx = 0; genIdx < ancGens.size(); ++genIdx) {
-		useAncestralGen(ancGens[genIdx]);
-		for (size_t i = 0; i < popSize(); ++i) {
-			double f = individual(i).info(m_fatherIdx);
-			double m = individual(i).info(m_motherIdx);
-			if (f > 0 && m > 0) {
-				if (excludeOutbred) {
-					// if they share a father or a mother.
-					try {
-						double f1 = indByID(m).info(m_fatherIdx);
-						double m1 = indByID(m).info(m_motherIdx);
-						double f2 = indByID(f).info(m_fatherIdx);
-						double m2 = indByID(f).info(m_motherIdx);
-						if ((fcmp_ge(f1, 1) && fcmp_eq(f1, f2)) || (fcmp_ge(m1, 1) && fcmp_eq(m1, m2)))
-							continue;
-					} catch (IndexError &) {
-						// if parent not found, does not matter.
-						// pass
-					}
-				}
-				couples.push_back(couple(toID(f), toID(m)));
-			}
-		}
-	}
-	// now, look for each pair and assign spouse
-	std::map<size_t, size_t> numSpouse;
-	for (size_t i = 0; i < couples.size(); ++i) {
-		// now p and m are spouse
-		size_t p = couples[i].first;
-		size_t m = couples[i].second;
-		try {
-			// but these guys might not be in the population...
-			Individual & fa = indByID(p);
-			Individual & ma = indByID(m);
-			DBG_ASSERT(ma.sex() == FEMALE && fa.sex() == MALE, RuntimeError,
-				"Sex of parents appear to be wrong.");
-			if (numSpouse[p] < maxSpouse && sexChoice != MALE_ONLY
-			    && acceptableAffectionStatus(ma.affected(), affectionChoice)) {
-				bool valid = true;
-				// duplicate spouse
-				for (size_t s = 0; s < numSpouse[p]; ++s)
-					if (fa.info(spouseIdx[s]) == m) {
-						valid = false;
-						break;
-					}
-				if (valid) {
-					fa.setInfo(static_cast<double>(m), spouseIdx[numSpouse[p]]);
-					++numSpouse[p];
-				}
+
+	Families fam;
+	buildFamilies(ancGens, fam);
+
+	// spouses of each individual are the other parents of his or her
+	// offspring, in the order offspring appear in the pedigree.
+	ssize_t numInds = static_cast<ssize_t>(fam.inds.size());
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t i = 0; i < numInds; ++i) {
+		Individual * ind = fam.inds[i];
+		if (ind == NULL)
+			continue;
+		size_t numSpouse = 0;
+		for (size_t k = fam.offsets[i]; k < fam.offsets[i + 1] && numSpouse < maxSpouse; ++k) {
+			size_t m = fam.offspring[k] / 2;
+			bool isFather = fam.offspring[k] % 2 == 0;
+			if (!fam.parentsFound[m])
+				continue;
+			if (isFather ? sexChoice == MALE_ONLY : sexChoice == FEMALE_ONLY)
+				continue;
+			if (excludeOutbred) {
+				// if they share a father or a mother.
+				Individual * fa = fam.inds[fam.fathers[m]];
+				Individual * ma = fam.inds[fam.mothers[m]];
+				double f1 = ma->info(m_fatherIdx);
+				double m1 = ma->info(m_motherIdx);
+				double f2 = fa->info(m_fatherIdx);
+				double m2 = fa->info(m_motherIdx);
+				if ((fcmp_ge(f1, 1) && fcmp_eq(f1, f2)) || (fcmp_ge(m1, 1) && fcmp_eq(m1, m2)))
+					continue;
 			}
-			if (numSpouse[m] < maxSpouse && sexChoice != FEMALE_ONLY
-			    && acceptableAffectionStatus(fa.affected(), affectionChoice)) {
-				bool valid = true;
-				// duplicate spouse
-				for (size_t s = 0; s < numSpouse[m]; ++s)
-					if (individual(m).info(spouseIdx[s]) == p) {
-						valid = false;
-						break;
-					}
-				if (valid) {
-					ma.setInfo(static_cast<double>(p), spouseIdx[numSpouse[m]]);
-					++numSpouse[m];
+			size_t spouse = isFather ? fam.mothers[m] : fam.fathers[m];
+			if (!acceptableAffectionStatus(fam.inds[spouse]->affected(), affectionChoice))
+				continue;
+			bool valid = true;
+			// duplicate spouse
+			for (size_t s = 0; s < numSpouse; ++s)
+				if (toID(ind->info(spouseIdx[s])) == fam.IDs[spouse]) {
+					valid = false;
+					break;
 				}
-			}                                                                                               // idx
-		} catch (...) {
-			// if does not found, ignore this couple.
+			if (valid)
+				ind->setInfo(static_cast<double>(fam.IDs[spouse]), spouseIdx[numSpouse++]);
 		}
 	}
 }
@@ -397,42 +452,27 @@ void Pedigree::locateOffspring(SexChoice sexChoice, AffectionStatus affectionCho
 		}
 	}
 
-	// use individual ID
-	std::map<size_t, size_t> numOffspring;
-	for (unsigned genIdx = 0; genIdx < ancGens.size(); ++genIdx) {
-		useAncestralGen(ancGens[genIdx]);
-		for (size_t i = 0; i < popSize(); ++i) {
-			// everyone has one or two parents.
-			double p = individual(i).info(m_fatherIdx);
-			double m = individual(i).info(m_motherIdx);
-			if (p < 0 || m < 0)
+	Families fam;
+	buildFamilies(ancGens, fam);
+
+	ssize_t numInds = static_cast<ssize_t>(fam.inds.size());
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t i = 0; i < numInds; ++i) {
+		Individual * ind = fam.inds[i];
+		if (ind == NULL)
+			continue;
+		size_t numOffspring = 0;
+		for (size_t k = fam.offsets[i]; k < fam.offsets[i + 1] && numOffspring < maxOffspring; ++k) {
+			size_t m = fam.offspring[k] / 2;
+			// does not care if a parent cannot be found
+			if (!fam.parentsFound[m])
 				continue;
-			try {
-				// but the parents might not exist
-				size_t pp = toID(p);
-				size_t mm = toID(m);
-				Individual & fa = indByID(pp);
-				Individual & ma = indByID(mm);
-				// add child as father's offspring
-				if (numOffspring[pp] < maxOffspring &&
-				    acceptableSex(MALE, individual(i).sex(), sexChoice) &&
-				    acceptableAffectionStatus(individual(i).affected(), affectionChoice)) {
-					fa.setInfo(individual(i).info(m_idIdx), offspringIdx[numOffspring[pp]]);
-					++numOffspring[pp];
-				}
-				// add child as mother's offspring
-				if (numOffspring[mm] < maxOffspring &&
-				    acceptableSex(FEMALE, individual(i).sex(), sexChoice) &&
-				    acceptableAffectionStatus(individual(i).affected(), affectionChoice)) {
-					ma.setInfo(individual(i).info(m_idIdx), offspringIdx[numOffspring[mm]]);
-					++numOffspring[mm];
-				}
-			} catch (...) {
-				// does not care if a parent cannot be found
-			}
+			Individual * child = fam.members[m];
+			if (acceptableSex(fam.offspring[k] % 2 == 0 ? MALE : FEMALE, child->sex(), sexChoice) &&
+			    acceptableAffectionStatus(child->affected(), affectionChoice))
+				ind->setInfo(child->info(m_idIdx), offspringIdx[numOffspring++]);
 		}
 	}
-
 }
 
 
@@ -455,74 +495,45 @@ void Pedigree::locateSibling(SexChoice sexChoice, AffectionStatus affectionChoic
 				it->setInfo(-1, siblingIdx[i]);
 	}
 
-	// find all single families
-	map<size_t, vectoru> families;
-	for (unsigned genIdx = 0; genIdx < ancGens.size(); ++genIdx) {
-		useAncestralGen(ancGens[genIdx]);
-		for (size_t i = 0; i < popSize(); ++i) {
-			double f = individual(i).info(m_fatherIdx);
-			double m = individual(i).info(m_motherIdx);
-			if (f >= 1)
-				families[toID(f)].push_back(toID(individual(i).info(m_idIdx)));
-			if (m >= 1)
-				families[toID(m)].push_back(toID(individual(i).info(m_idIdx)));
-		}
-	}
-	// look in each single-parent family
-	std::map<size_t, size_t> numSibling;
-	map<size_t, vectoru>::iterator it = families.begin();
-	map<size_t, vectoru>::iterator itEnd = families.end();
-	for (; it != itEnd; ++it) {
-		// these guys share at least one parent!
-		const vectoru & sibs = it->second;
-		if (sibs.size() <= 1)
+	Families fam;
+	buildFamilies(ancGens, fam);
+
+	// siblings are offspring of the parents of each individual, looked up
+	// in the order of parental IDs
+	ssize_t numInds = static_cast<ssize_t>(fam.inds.size());
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t i = 0; i < numInds; ++i) {
+		size_t m = fam.firstMember[i];
+		if (m == NOT_FOUND)
 			continue;
-		for (size_t i = 0; i < sibs.size(); ++i) {
-			try {
-				Individual & child = indByID(sibs[i]);
-				for (size_t j = 0; j < sibs.size(); ++j) {
-					if (i == j)
-						continue;
-					try {
-						Individual & sibling = indByID(sibs[j]);
-
-						if (numSibling[sibs[i]] < maxSibling &&
-						    acceptableSex(child.sex(), sibling.sex(), sexChoice) &&
-						    acceptableAffectionStatus(sibling.affected(), affectionChoice)) {
-							bool valid = true;
-							// duplicate sibling
-							for (size_t s = 0; s < numSibling[sibs[i]]; ++s)
-								if (child.info(siblingIdx[s]) == sibs[j]) {
-									valid = false;
-									break;
-								}
-							if (valid) {
-								child.setInfo(static_cast<double>(sibs[j]), siblingIdx[numSibling[sibs[i]]]);
-								++numSibling[sibs[i]];
-							}
-						}
-						if (numSibling[sibs[j]] < maxSibling &&
-						    acceptableSex(sibling.sex(), child.sex(), sexChoice) &&
-						    acceptableAffectionStatus(child.affected(), affectionChoice)) {
-							bool valid = true;
-							// duplicate sibling
-							for (size_t s = 0; s < numSibling[sibs[j]]; ++s)
-								if (sibling.info(siblingIdx[s]) == sibs[i]) {
-									valid = false;
-									break;
-								}
-							if (valid) {
-								sibling.setInfo(static_cast<double>(sibs[i]), siblingIdx[numSibling[sibs[j]]]);
-								++numSibling[sibs[j]];
-							}
-						}
-						// idx
-					} catch (...) {
-						continue;
+		Individual * child = fam.inds[i];
+		size_t parents[2] = { fam.fathers[m], fam.mothers[m] };
+		if (parents[0] == parents[1])
+			parents[1] = NOT_FOUND;
+		else if (parents[0] != NOT_FOUND && parents[1] != NOT_FOUND &&
+		         fam.IDs[parents[1]] < fam.IDs[parents[0]])
+			std::swap(parents[0], parents[1]);
+		size_t numSibling = 0;
+		for (size_t p = 0; p < 2; ++p) {
+			if (parents[p] == NOT_FOUND)
+				continue;
+			for (size_t k = fam.offsets[parents[p]]; k < fam.offsets[parents[p] + 1] && numSibling < maxSibling; ++k) {
+				size_t sib = fam.memberInd[fam.offspring[k] / 2];
+				if (sib == static_cast<size_t>(i))
+					continue;
+				Individual * sibling = fam.inds[sib];
+				if (!acceptableSex(child->sex(), sibling->sex(), sexChoice) ||
+				    !acceptableAffectionStatus(sibling->affected(), affectionChoice))
+					continue;
+				bool valid = true;
+				// duplicate sibling
+				for (size_t s = 0; s < numSibling; ++s)
+					if (toID(child->info(siblingIdx[s])) == fam.IDs[sib]) {
+						valid = false;
+						break;
 					}
-				}
-			} catch (...) {
-				// if does not found, ignore this couple.
+				if (valid)
+					child->setInfo(static_cast<double>(fam.IDs[sib]), siblingIdx[numSibling++]);
 			}
 		}
 	}
@@ -551,69 +562,39 @@ void Pedigree::locateFullSibling(SexChoice sexChoice, AffectionStatus affectionC
 				it->setInfo(-1, siblingIdx[i]);
 	}
 
-	// find all full families
-	typedef pairu couple;
-	map<couple, vectoru> families;
-	for (unsigned genIdx = 0; genIdx < ancGens.size(); ++genIdx) {
-		useAncestralGen(ancGens[genIdx]);
-		for (size_t i = 0; i < popSize(); ++i) {
-			double f = individual(i).info(m_fatherIdx);
-			double m = individual(i).info(m_motherIdx);
-			if (f >= 1 && m >= 1)
-				families[couple(toID(f), toID(m))].push_back(toID(individual(i).info(m_idIdx)));
-		}
-	}
-	// look in each single-parent family
-	std::map<size_t, size_t> numSibling;
-	map<couple, vectoru>::iterator it = families.begin();
-	map<couple, vectoru>::iterator itEnd = families.end();
-	for (; it != itEnd; ++it) {
-		// these guys share two parents....
-		const vectoru & sibs = it->second;
-		if (sibs.size() <= 1)
+	Families fam;
+	buildFamilies(ancGens, fam);
+
+	// full siblings are offspring of the father with the same mother
+	ssize_t numInds = static_cast<ssize_t>(fam.inds.size());
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t i = 0; i < numInds; ++i) {
+		size_t m = fam.firstMember[i];
+		if (m == NOT_FOUND || fam.fathers[m] == NOT_FOUND || fam.mothers[m] == NOT_FOUND)
 			continue;
-		for (size_t i = 0; i < sibs.size(); ++i) {
-			try {
-				Individual & child = indByID(sibs[i]);
-				for (size_t j = 0; j < sibs.size(); ++j) {
-					if (i == j)
-						continue;
-					Individual & sibling = indByID(sibs[j]);
-
-					if (numSibling[sibs[i]] < maxSibling &&
-					    acceptableSex(child.sex(), sibling.sex(), sexChoice) &&
-					    acceptableAffectionStatus(sibling.affected(), affectionChoice)) {
-						bool valid = true;
-						// duplicat sibling
-						for (size_t s = 0; s < numSibling[sibs[i]]; ++s)
-							if (child.info(siblingIdx[s]) == sibs[j]) {
-								valid = false;
-								break;
-							}
-						if (valid) {
-							child.setInfo(static_cast<double>(sibs[j]), siblingIdx[numSibling[sibs[i]]]);
-							++numSibling[sibs[i]];
-						}
-					}
-					if (numSibling[sibs[j]] < maxSibling &&
-					    acceptableSex(sibling.sex(), child.sex(), sexChoice) &&
-					    acceptableAffectionStatus(child.affected(), affectionChoice)) {
-						bool valid = true;
-						// duplicate sibling
-						for (size_t s = 0; s < numSibling[sibs[j]]; ++s)
-							if (sibling.info(siblingIdx[s]) == sibs[i]) {
-								valid = false;
-								break;
-							}
-						if (valid) {
-							sibling.setInfo(static_cast<double>(sibs[i]), siblingIdx[numSibling[sibs[j]]]);
-							++numSibling[sibs[j]];
-						}
-					}                                                                                       // idx
+		Individual * child = fam.inds[i];
+		size_t father = fam.fathers[m];
+		size_t numSibling = 0;
+		for (size_t k = fam.offsets[father]; k < fam.offsets[father + 1] && numSibling < maxSibling; ++k) {
+			size_t sm = fam.offspring[k] / 2;
+			if (fam.offspring[k] % 2 != 0 || fam.mothers[sm] != fam.mothers[m])
+				continue;
+			size_t sib = fam.memberInd[sm];
+			if (sib == static_cast<size_t>(i))
+				continue;
+			Individual * sibling = fam.inds[sib];
+			if (!acceptableSex(child->sex(), sibling->sex(), sexChoice) ||
+			    !acceptableAffectionStatus(sibling->affected(), affectionChoice))
+				continue;
+			bool valid = true;
+			// duplicate sibling
+			for (size_t s = 0; s < numSibling; ++s)
+				if (toID(child->info(siblingIdx[s])) == fam.IDs[sib]) {
+					valid = false;
+					break;
 				}
-			} catch (...) {
-				// if does not found, ignore this couple.
-			}
+			if (valid)
+				child->setInfo(static_cast<double>(fam.IDs[sib]), siblingIdx[numSibling++]);
 		}
 	}
 }
@@ -646,67 +627,42 @@ void Pedigree::locateCommonOffspring(SexChoice sexChoice, AffectionStatus affect
 		}
 	}
 
-	// find all full families
-	typedef pairu couple;
-	map<couple, vectoru> families;
-	for (unsigned genIdx = 0; genIdx < ancGens.size(); ++genIdx) {
-		useAncestralGen(ancGens[genIdx]);
-		for (size_t i = 0; i < popSize(); ++i) {
-			double f = individual(i).info(m_fatherIdx);
-			double m = individual(i).info(m_motherIdx);
-			if (f >= 1 && m >= 1)
-				families[couple(toID(f), toID(m))].push_back(toID(individual(i).info(m_idIdx)));
-		}
-	}
-	// look in each family
-	map<couple, vectoru>::iterator it = families.begin();
-	map<couple, vectoru>::iterator itEnd = families.end();
-	std::map<size_t, size_t> numOffspring;
-	for (; it != itEnd; ++it) {
-		size_t p = it->first.first;
-		size_t m = it->first.second;
-		// these guys share two parents
-		const vectoru & offspring = it->second;
-		try {
-			Individual & fa = indByID(p);
-			Individual & ma = indByID(m);
-			// spouse
-			double fa_spouse = fa.info(spouseIdx);
-			double ma_spouse = ma.info(spouseIdx);
-			bool valid_fa = fa_spouse != -1 && toID(fa_spouse) == m;
-			bool valid_ma = ma_spouse != -1 && toID(ma_spouse) == p;
-			if (!valid_fa && !valid_ma)
+	Families fam;
+	buildFamilies(ancGens, fam);
+
+	// common offspring are offspring of each individual with his or her spouse
+	ssize_t numInds = static_cast<ssize_t>(fam.inds.size());
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t i = 0; i < numInds; ++i) {
+		Individual * ind = fam.inds[i];
+		if (ind == NULL)
+			continue;
+		double spouse = ind->info(spouseIdx);
+		if (spouse == -1)
+			continue;
+		size_t numOffspring = 0;
+		for (size_t k = fam.offsets[i]; k < fam.offsets[i + 1] && numOffspring < maxOffspring; ++k) {
+			size_t m = fam.offspring[k] / 2;
+			// if a parent is not found, ignore this offspring
+			if (!fam.parentsFound[m])
 				continue;
-			// offspring
-			for (size_t j = 0; j < offspring.size(); ++j) {
-				try {
-					Individual & child = indByID(offspring[j]);
-					bool valid = acceptableSex(MALE, child.sex(), sexChoice) &&
-					             acceptableAffectionStatus(child.affected(), affectionChoice);
-					// duplicate child
-					if (valid) {
-						for (size_t s = 0; s < numOffspring[p]; ++s)
-							if (fa.info(offspringIdx[s]) == offspring[j]) {
-								valid = false;
-								break;
-							}
-					}
-					if (valid) {
-						if (valid_fa && numOffspring[p] < maxOffspring) {
-							fa.setInfo(static_cast<double>(offspring[j]), offspringIdx[numOffspring[p]]);
-							++numOffspring[p];
-						}
-						if (valid_ma && numOffspring[m] < maxOffspring) {
-							ma.setInfo(static_cast<double>(offspring[j]), offspringIdx[numOffspring[m]]);
-							++numOffspring[m];
-						}
-					}
-				} catch (...) {
-					// if does not found, ignore this offspring
+			size_t other = fam.offspring[k] % 2 == 0 ? fam.mothers[m] : fam.fathers[m];
+			if (fam.IDs[other] != toID(spouse))
+				continue;
+			size_t off = fam.memberInd[m];
+			Individual * child = fam.inds[off];
+			if (!acceptableSex(MALE, child->sex(), sexChoice) ||
+			    !acceptableAffectionStatus(child->affected(), affectionChoice))
+				continue;
+			bool valid = true;
+			// duplicate child
+			for (size_t s = 0; s < numOffspring; ++s)
+				if (toID(ind->info(offspringIdx[s])) == fam.IDs[off]) {
+					valid = false;
+					break;
 				}
-			}
-		} catch (...) {
-			// if does not found, ignore this couple.
+			if (valid)
+				ind->setInfo(static_cast<double>(fam.IDs[off]), offspringIdx[numOffspring++]);
 		}
 	}
 }
@@ -741,7 +697,6 @@ bool Pedigree::traceRelatives(const stringMatrix & fieldPath,
 	vectoru resultIdx(resultFields.size());
 	for (size_t i = 0; i < resultIdx.size(); ++i)
 		resultIdx[i] = infoIdx(resultFields[i]);
-	vectoru numResult(popSize(), 0);
 	size_t maxResult = resultIdx.size();
 	// clear values
 	for (unsigned genIdx = 0; genIdx < gens.size(); ++genIdx) {
@@ -774,48 +729,97 @@ bool Pedigree::traceRelatives(const stringMatrix & fieldPath,
 		affections[i] = static_cast<AffectionStatus>(affectionChoice[i]);
 	}
 
-	size_t idx = 0;
+	// number individuals consecutively so that relatives referred to by each
+	// field could be looked up once, before relative paths are traced.
+	// Relatives who are not in the pedigree are added as NULL individuals and
+	// cause an IndexError if they are reached.
+	IndexMap index;
+	vector<Individual *> inds;
+	vectoru IDs;
+	for (IdMap::const_iterator it = m_idMap.begin(); it != m_idMap.end(); ++it) {
+		index[it->first] = inds.size();
+		inds.push_back(it->second);
+		IDs.push_back(it->first);
+	}
+	size_t numInds = inds.size();
+	vector<vectoru> relatives(infoSize());
+	for (size_t i = 0; i < pathIdx.size(); ++i) {
+		for (size_t j = 0; j < pathIdx[i].size(); ++j) {
+			vectoru & rel = relatives[pathIdx[i][j]];
+			if (!rel.empty())
+				continue;
+			rel.resize(numInds, NOT_FOUND);
+			for (size_t k = 0; k < numInds; ++k) {
+				double sID = inds[k]->info(pathIdx[i][j]);
+				if (sID < 0)
+					continue;
+				IndexMap::iterator it = index.find(toID(sID));
+				if (it == index.end()) {
+					it = index.insert(IndexMap::value_type(toID(sID), inds.size())).first;
+					inds.push_back(NULL);
+					IDs.push_back(toID(sID));
+				}
+				rel[k] = it->second;
+			}
+		}
+	}
+
+	vector<Individual *> members;
+	vectoru memberInd;
 	for (unsigned genIdx = 0; genIdx < gens.size(); ++genIdx) {
 		useAncestralGen(gens[genIdx]);
-		for (IndIterator ind = indIterator(); ind.valid(); ++ind, ++idx) {
-			Sex mySex = ind->sex();
-			vectoru inds = vectoru(1, toID(ind->info(m_idIdx)));
-			// go through the path
-			for (size_t path = 0; path < pathFields.size(); ++path) {
-				DBG_DO(DBG_POPULATION, cerr << "Start of path " << path
-					                        << " : " << inds << endl);
-				const vectori & fields = pathIdx[path];
-				SexChoice sex = sexes[path];
-				AffectionStatus affection = affections[path];
-
-				vectoru newInds;
-				// for all individuals
-				for (size_t i = 0; i < inds.size(); ++i) {
-					// for all fields
-					for (size_t s = 0; s < fields.size(); ++s) {
-						double sID = indByID(inds[i]).info(fields[s]);
-						if (sID < 0)
-							continue;
-						Individual & sind = indByID(sID);
-						if (!acceptableSex(mySex, sind.sex(), sex))
-							continue;
-						if (!acceptableAffectionStatus(sind.affected(), affection))
-							continue;
-						newInds.push_back(toID(sID));
+		for (IndIterator ind = indIterator(); ind.valid(); ++ind) {
+			members.push_back(&*ind);
+			memberInd.push_back(index[toID(ind->info(m_idIdx))]);
+		}
+	}
+	useAncestralGen(oldGen);
+
+	size_t missingID = NOT_FOUND;
+	ssize_t numMembers = static_cast<ssize_t>(members.size());
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t m = 0; m < numMembers; ++m) {
+		Individual * ind = members[m];
+		Sex mySex = ind->sex();
+		vectoru cur(1, memberInd[m]);
+		// go through the path
+		for (size_t path = 0; path < pathIdx.size() && !cur.empty(); ++path) {
+			const vectori & fields = pathIdx[path];
+			SexChoice sex = sexes[path];
+			AffectionStatus affection = affections[path];
+
+			vectoru next;
+			// for all individuals
+			for (size_t i = 0; i < cur.size(); ++i) {
+				// for all fields
+				for (size_t s = 0; s < fields.size(); ++s) {
+					size_t rel = relatives[fields[s]][cur[i]];
+					if (rel == NOT_FOUND)
+						continue;
+					Individual * sind = inds[rel];
+					if (sind == NULL) {
+#pragma omp critical
+						{
+							if (missingID == NOT_FOUND)
+								missingID = IDs[rel];
+						}
+						continue;
 					}
+					if (!acceptableSex(mySex, sind->sex(), sex))
+						continue;
+					if (!acceptableAffectionStatus(sind->affected(), affection))
+						continue;
+					next.push_back(rel);
 				}
-				inds.swap(newInds);
-				if (inds.empty())
-					break;
 			}
-			DBG_DO(DBG_POPULATION, cerr << "Ind " << idx << " has relatives " << inds << endl);
-			// ind has the results
-			for (size_t i = 0; i < maxResult; ++i)
-				if (i < inds.size())
-					ind->setInfo(static_cast<double>(inds[i]), resultIdx[i]);
+			cur.swap(next);
 		}
+		// ind has the results
+		for (size_t i = 0; i < maxResult && i < cur.size(); ++i)
+			ind->setInfo(static_cast<double>(IDs[cur[i]]), resultIdx[i]);
 	}
-	useAncestralGen(oldGen);
+	if (missingID != NOT_FOUND)
+		throw IndexError((boost::format("No individual with ID %1% could be found.") % missingID).str());
 	return true;
 }
 
@@ -1255,6 +1259,109 @@ vectoru Pedigree::identifyOffspring(const uintList & IDs,
 }
 
 
+PyObject * Pedigree::drawFamilies(const intMatrix & IDs, const stringMatrix & fieldPath,
+                                  const uintList & numFamilies, size_t numOfSamples)
+{
+	const matrixi & anchors = IDs.elems();
+	const vectoru & counts = numFamilies.elems();
+	const matrixstr & paths = fieldPath.elems();
+
+	PARAM_FAILIF(counts.size() != anchors.size(), ValueError,
+		(boost::format("Number of families should be specified for each of the %1% groups of anchor individuals.")
+		 % anchors.size()).str());
+
+	// indexes of information fields at each step of relative paths
+	vector<vectoru> pathIdx(paths.size());
+	for (size_t p = 0; p < paths.size(); ++p) {
+		PARAM_FAILIF(paths[p].empty(), ValueError, "An empty relative path is specified.");
+		for (size_t s = 0; s < paths[p].size(); ++s)
+			pathIdx[p].push_back(infoIdx(paths[p][s]));
+	}
+
+	// step 1: enumerate families. Members of all families are numbered
+	// consecutively so that overlapping families can be detected from an
+	// array of flags. Family f has members members[offsets[f]] to
+	// members[offsets[f+1]-1].
+	IndexMap memberIdx;
+	vectoru memberIDs;
+	vectoru offsets(1, 0);
+	vectoru members;
+	vectoru groupBegin(1, 0);
+	vectoru fam;
+	for (size_t g = 0; g < anchors.size(); ++g) {
+		for (size_t i = 0; i < anchors[g].size(); ++i) {
+			PARAM_FAILIF(anchors[g][i] < 0, ValueError, "Invalid negative ID of an anchor individual.");
+			size_t anchorID = static_cast<size_t>(anchors[g][i]);
+			Individual & anchor = indByID(anchorID);
+			fam.assign(1, anchorID);
+			for (size_t p = 0; p < pathIdx.size(); ++p) {
+				Individual * rel = &anchor;
+				for (size_t s = 0; s < pathIdx[p].size(); ++s) {
+					double relID = rel->info(pathIdx[p][s]);
+					if (relID < 0)
+						break;
+					if (s + 1 == pathIdx[p].size())
+						fam.push_back(toID(relID));
+					else
+						rel = &indByID(relID);
+				}
+			}
+			std::sort(fam.begin(), fam.end());
+			fam.erase(std::unique(fam.begin(), fam.end()), fam.end());
+			for (size_t m = 0; m < fam.size(); ++m) {
+				IndexMap::iterator it = memberIdx.find(fam[m]);
+				if (it == memberIdx.end()) {
+					it = memberIdx.insert(IndexMap::value_type(fam[m], memberIDs.size())).first;
+					memberIDs.push_back(fam[m]);
+				}
+				members.push_back(it->second);
+			}
+			offsets.push_back(members.size());
+		}
+		groupBegin.push_back(offsets.size() - 1);
+	}
+
+	// step 2: draw samples. Families of each group are visited in random
+	// order, using a Fisher-Yates shuffle that stops as soon as enough
+	// families are selected.
+	PyObject * res = PyList_New(numOfSamples);
+	vectoru order;
+	vector<bool> used(memberIDs.size());
+	for (size_t smp = 0; smp < numOfSamples; ++smp) {
+		std::fill(used.begin(), used.end(), false);
+		PyObject * sample = PyList_New(anchors.size());
+		for (size_t g = 0; g < anchors.size(); ++g) {
+			size_t numFam = groupBegin[g + 1] - groupBegin[g];
+			order.resize(numFam);
+			for (size_t i = 0; i < numFam; ++i)
+				order[i] = groupBegin[g] + i;
+			PyObject * selected = PyList_New(0);
+			size_t cnt = 0;
+			for (size_t i = 0; i < numFam && cnt < counts[g]; ++i) {
+				std::swap(order[i], order[i + getRNG().randInt(static_cast<ULONG>(numFam - i))]);
+				size_t f = order[i];
+				bool overlap = false;
+				for (size_t m = offsets[f]; m < offsets[f + 1] && !overlap; ++m)
+					overlap = used[members[m]];
+				if (overlap)
+					continue;
+				PyObject * famIDs = PyList_New(offsets[f + 1] - offsets[f]);
+				for (size_t m = offsets[f]; m < offsets[f + 1]; ++m) {
+					used[members[m]] = true;
+					PyList_SET_ITEM(famIDs, m - offsets[f], PyInt_FromLong(static_cast<long>(memberIDs[members[m]])));
+				}
+				PyList_Append(selected, famIDs);
+				Py_DECREF(famIDs);
+				++cnt;
+			}
+			PyList_SET_ITEM(sample, g, selected);
+		}
+		PyList_SET_ITEM(res, smp, sample);
+	}
+	return res;
+}
+
+
 void Pedigree::removeIndividuals(const uintList & indexes,
                                  const floatList & IDs, const string & idField, PyObject * filter)
 {
@@ -1323,16 +1430,84 @@ void Pedigree::setSubPopByIndInfo(const string & field)
 }
 
 
-struct IndInfo
+/* Records of individuals loaded from a pedigree file, stored column by
+ * column with one row for each individual, and for each parent without
+ * a record.
+ */
+struct PedigreeRecords
 {
-	Sex sex;
+	PedigreeRecords(size_t nFields) : IDs(), parents(), sexes(), affected(),
+		fields(), genoStart(), genotypes(), numFields(nFields)
+	{
+	}
+
+
+	size_t addRow(size_t id)
+	{
+		IDs.push_back(id);
+		parents.push_back(NOT_FOUND);
+		parents.push_back(NOT_FOUND);
+		sexes.push_back(MALE);
+		affected.push_back(false);
+		fields.resize(fields.size() + numFields, 0);
+		genoStart.push_back(NOT_FOUND);
+		return IDs.size() - 1;
+	}
+
+
+	size_t numParents(size_t row) const
+	{
+		return static_cast<size_t>(parents[2 * row] != NOT_FOUND) +
+		       static_cast<size_t>(parents[2 * row + 1] != NOT_FOUND);
+	}
+
+
+	void setIndividual(Individual & ind, size_t row, size_t fieldIndex, size_t numLoci, int ploidy) const
+	{
+		ind.setInfo(static_cast<double>(IDs[row]), 0);
+		for (size_t i = 0; i < numParents(row); ++i)
+			ind.setInfo(static_cast<double>(IDs[parents[2 * row + i]]), 1 + i);
+		ind.setSex(sexes[row]);
+		ind.setAffected(affected[row]);
+		for (size_t i = 0; i < numFields; ++i)
+			ind.setInfo(fields[row * numFields + i], i + fieldIndex);
+		// individuals without genotype keep wildtype alleles
+		if (genoStart[row] == NOT_FOUND)
+			return;
+		for (size_t i = 0, k = genoStart[row]; i < numLoci; ++i)
+			for (int j = 0; j < ploidy; ++j, ++k)
+				ind.setAllele(genotypes[k], i, j);
+	}
+
+
+	vectoru IDs;
+	/// rows of up to two parents, NOT_FOUND if missing
 	vectoru parents;
-	vectoru offspring;
-	bool affectionStatus;
+	vector<Sex> sexes;
+	vector<bool> affected;
+	/// numFields values of information fields for each row
 	vectorf fields;
-	vectora genotype;
-	IndInfo() : sex(MALE), parents(), offspring(), affectionStatus(false), fields(), genotype() {}
-	IndInfo(size_t off) : sex(MALE), parents(), offspring(1, off), affectionStatus(false), fields(), genotype() {}
+	/// index of the first allele of each row in genotypes, NOT_FOUND if missing
+	vectoru genoStart;
+	vectora genotypes;
+	size_t numFields;
+};
+
+
+struct compareRowID
+{
+	compareRowID(const vectoru & IDs) : m_IDs(IDs)
+	{
+	}
+
+
+	bool operator()(size_t r1, size_t r2) const
+	{
+		return m_IDs[r1] < m_IDs[r2];
+	}
+
+
+	const vectoru & m_IDs;
 };
 
 
@@ -1359,22 +1534,18 @@ Pedigree loadPedigree(const string & file, const string & idField, const string
 	//
 	size_t max_parents = 0;
 	string line;
-	// individual and their parents
-#if TR1_SUPPORT == 0
-	typedef std::map<size_t, IndInfo *> IdMap;
-#elif TR1_SUPPORT == 1
-	typedef std::unordered_map<size_t, IndInfo *> IdMap;
-#else
-	typedef std::tr1::unordered_map<size_t, IndInfo *> IdMap;
-#endif
-	IdMap individuals;
+	// individual and their parents, located by their IDs
+	PedigreeRecords records(infoFields.size());
+	IndexMap rows;
+	vectora genotype;
 	while (getline(input, line)) {
 		if (line.empty())
 			continue;
 		//
-		IndInfo * info = NULL;
-		size_t myID = 0;
+		size_t row = 0;
+		size_t numFields = 0;
 		int part = 0;
+		genotype.clear();
 		char * p = strtok(const_cast<char *>(line.c_str()), " ");
 		// boost::tokenizer is proven to be too slow..... (5.5s vs. 1.5s)
 		while (p) {
@@ -1382,79 +1553,82 @@ Pedigree loadPedigree(const string & file, const string & idField, const string
 			p = strtok(NULL, " ");
 			// collect self ID
 			if (part == 0) {
-				myID = atoi(q);
-				if (individuals.find(myID) != individuals.end())
+				size_t myID = atoi(q);
+				if (rows.find(myID) != rows.end())
 					throw ValueError((boost::format("Duplicate individual ID %1%") % myID).str());
-				info = (individuals.insert(IdMap::value_type(myID, new IndInfo())).first)->second;
+				row = records.addRow(myID);
+				rows[myID] = row;
 				++part;
 				continue;
 				// parental ID and sex
 			} else if (part == 1) {
 				if (*q == 'M') {
-					info->sex = MALE;
+					records.sexes[row] = MALE;
 					++part;
 					continue;
 				} else if (*q == 'F') {
-					info->sex = FEMALE;
+					records.sexes[row] = FEMALE;
 					++part;
 					continue;
 				} else {
 					size_t id = atoi(q);
 					if (id) {
-						info->parents.push_back(id);
-						IdMap::iterator it = individuals.find(id);
+						size_t n = records.numParents(row);
+						if (n == 2)
+							throw ValueError("At most two parental IDs are allowed before sex information");
+						IndexMap::iterator it = rows.find(id);
 						// this is a parent but we do not know if he or she has parent
-						if (it == individuals.end())
-							individuals[id] = new IndInfo(myID);
-						else
-							it->second->offspring.push_back(myID);
+						if (it == rows.end())
+							it = rows.insert(IndexMap::value_type(id, records.addRow(id))).first;
+						records.parents[2 * row + n] = it->second;
 					}
-					if (info->parents.size() > 2)
-						throw ValueError("At most two parental IDs are allowed before sex information");
 				}
 				// parental affection status, can be ignored
 			} else if (part == 2) {
 				if (*q == 'A')
-					info->affectionStatus = true;
+					records.affected[row] = true;
 				else if (*q == 'U')
-					info->affectionStatus = false;
+					records.affected[row] = false;
 				else
 					++part;
 			}
 
 			// information fields, can be ignored
 			if (part == 3) {
-				if (info->fields.size() == infoFields.size())
+				if (numFields == infoFields.size())
 					++part;
 				else
-					info->fields.push_back(atof(q));
+					records.fields[row * infoFields.size() + numFields++] = atof(q);
 			}
 
 			// genotype
 			if (part == 4)
-				info->genotype.push_back(TO_ALLELE(atoi(q)));
+				genotype.push_back(TO_ALLELE(atoi(q)));
 		}
 		// if there is no valid input...
 		if (part == 0)
 			continue;
-		if (!info->genotype.empty()) {
+		if (!genotype.empty()) {
 			if (loci.empty()) {
-				loci.push_back(info->genotype.size() / pldy);
-				genoCols = info->genotype.size();
+				loci.push_back(genotype.size() / pldy);
+				genoCols = genotype.size();
 				if (loci.back() * pldy != genoCols)
 					throw ValueError("Incorrect number of genotype colmns for a diploid population.");
 			} else {
-				if (genoCols != info->genotype.size())
+				if (genoCols != genotype.size())
 					throw ValueError("Inconsistent number of columns of genotypes.");
 			}
+			records.genoStart[row] = records.genotypes.size();
+			records.genotypes.insert(records.genotypes.end(), genotype.begin(), genotype.end());
 		}
 		//
-		if (max_parents < info->parents.size())
-			max_parents = info->parents.size();
+		if (max_parents < records.numParents(row))
+			max_parents = records.numParents(row);
 	}
 	input.close();
 	elapsedTime("Readfile");
-	DBG_DO(DBG_POPULATION, cerr << "Information about " << individuals.size() << " individuals are loaded." << endl);
+	size_t numRows = records.IDs.size();
+	DBG_DO(DBG_POPULATION, cerr << "Information about " << numRows << " individuals are loaded." << endl);
 	// create the top most ancestral generation
 	// find parents who do not have parents...
 	vectorstr fields(1, idField);
@@ -1468,90 +1642,70 @@ Pedigree loadPedigree(const string & file, const string & idField, const string
 	fields.insert(fields.end(), infoFields.begin(), infoFields.end());
 	DBG_DO(DBG_POPULATION, cerr << "Using information fields " << fields << endl);
 	//
-	if (individuals.empty()) {
+	if (numRows == 0) {
 		return Population(0, ploidy, loci, chromTypes, lociPos,
 			-1, chromNames, alleleNames, lociNames, subPopNames, fields);
 	}
+	// offspring of each row are stored in offspring[offsets[row]] to
+	// offspring[offsets[row + 1] - 1]
+	vectoru offsets(numRows + 1, 0);
+	for (size_t i = 0; i < 2 * numRows; ++i)
+		if (records.parents[i] != NOT_FOUND)
+			++offsets[records.parents[i] + 1];
+	for (size_t i = 0; i < numRows; ++i)
+		offsets[i + 1] += offsets[i];
+	vectoru offspring(offsets.back());
+	vectoru next(offsets.begin(), offsets.end() - 1);
+	for (size_t i = 0; i < 2 * numRows; ++i)
+		if (records.parents[i] != NOT_FOUND)
+			offspring[next[records.parents[i]]++] = i / 2;
+	vectoru().swap(next);
 	//
-	typedef std::set<size_t> IdSet;
-	IdSet parents;
-	IdMap::iterator it = individuals.begin();
-	IdMap::iterator it_end = individuals.end();
-	for (; it != it_end; ++it)
-		if (it->second->parents.empty())
-			parents.insert(it->first);
+	compareRowID byID(records.IDs);
+	vectoru parents;
+	for (size_t i = 0; i < numRows; ++i)
+		if (records.numParents(i) == 0)
+			parents.push_back(i);
 	if (parents.empty())
 		throw ValueError("No parents in the top-most ancestral generation");
+	std::sort(parents.begin(), parents.end(), byID);
 	//
+	size_t numLoci = genoCols / pldy;
 	Population pop(vectoru(1, parents.size()), ploidy, loci, chromTypes, lociPos,
 	               -1, chromNames, alleleNames, lociNames, subPopNames, fields);
 	// set individual info
 	RawIndIterator ind = pop.rawIndBegin();
-	RawIndIterator ind_end = pop.rawIndEnd();
-	IdSet::iterator pit = parents.begin();
-	for (; ind != ind_end; ++ind, ++pit) {
-		ind->setInfo(static_cast<double>(*pit), 0);
-		const IndInfo * info = individuals.find(*pit)->second;
-		ind->setSex(info->sex);
-		ind->setAffected(info->affectionStatus);
-		for (size_t i = 0; i < infoFields.size() && i < info->fields.size(); ++i)
-			ind->setInfo(info->fields[i], i + fieldIndex);
-		for (size_t i = 0, k = 0; i < genoCols / pldy; ++i)
-			for (int j = 0; j < pldy; ++j, ++k)
-				ind->setAllele(info->genotype[k], i, j);
-	}
+	for (size_t i = 0; i < parents.size(); ++i, ++ind)
+		records.setIndividual(*ind, parents[i], fieldIndex, numLoci, pldy);
 	DBG_DO(DBG_POPULATION, cerr << parents.size() << " individuals are located for the top-most ancestral generation" << endl);
 	//
 	while (true) {
-		if (parents.empty())
-			break;
-		//
-		IdSet offspring;
-		pit = parents.begin();
-		IdSet::iterator pit_end = parents.end();
-		for (; pit != pit_end; ++pit) {
-			const IdMap::const_iterator info = individuals.find(*pit);
-			const vectoru & off = info->second->offspring;
-			for (size_t i = 0; i < off.size(); ++i)
-				offspring.insert(off[i]);
-		}
-		DBG_DO(DBG_POPULATION, cerr << offspring.size() << " individuals are located from "
-			                        << individuals.size() << " individuals for an ancestral generation" << endl);
-
-		if (offspring.empty())
+		vectoru offRows;
+		for (size_t i = 0; i < parents.size(); ++i)
+			offRows.insert(offRows.end(), offspring.begin() + offsets[parents[i]],
+				offspring.begin() + offsets[parents[i] + 1]);
+		std::sort(offRows.begin(), offRows.end(), byID);
+		offRows.erase(std::unique(offRows.begin(), offRows.end()), offRows.end());
+		DBG_DO(DBG_POPULATION, cerr << offRows.size() << " individuals are located from "
+			                        << numRows << " individuals for an ancestral generation" << endl);
+
+		if (offRows.empty())
 			break;
 
-		Population off_pop(vectoru(1, offspring.size()), ploidy, loci, chromTypes, lociPos,
+		Population off_pop(vectoru(1, offRows.size()), ploidy, loci, chromTypes, lociPos,
 		                   0, chromNames, alleleNames, lociNames, subPopNames, fields);
 		// set individual info
 		ind = off_pop.rawIndBegin();
-		ind_end = off_pop.rawIndEnd();
-		pit = offspring.begin();
-		for (; ind != ind_end; ++ind, ++pit) {
-			ind->setInfo(static_cast<double>(*pit), 0);
-			const IndInfo * info = individuals.find(*pit)->second;
-			for (size_t i = 0; i < info->parents.size(); ++i)
-				ind->setInfo(static_cast<double>(info->parents[i]), 1 + i);
-			ind->setSex(info->sex);
-			ind->setAffected(info->affectionStatus);
-			for (size_t i = 0; i < infoFields.size() && i < info->fields.size(); ++i)
-				ind->setInfo(info->fields[i], i + fieldIndex);
-			for (size_t i = 0, k = 0; i < genoCols / pldy; ++i)
-				for (int j = 0; j < pldy; ++j, ++k)
-					ind->setAllele(info->genotype[k], i, j);
-		}
+		for (size_t i = 0; i < offRows.size(); ++i, ++ind)
+			records.setIndividual(*ind, offRows[i], fieldIndex, numLoci, pldy);
 		//
-		parents.swap(offspring);
+		parents.swap(offRows);
 		pop.push(off_pop);
 	}
 	elapsedTime("Generation");
 	DBG_DO(DBG_POPULATION, cerr << "A pedigree with " << pop.ancestralGens()
 		                        << " ancestral generations are created." << endl);
 
-	it = individuals.begin();
-	it_end = individuals.end();
-	for (; it != it_end; ++it)
-		delete it->second;
 	// uintList means ALL_AVAIL
 	return Pedigree(pop, lociList(), pop.infoFields(), uintList(),
 		idField, max_parents > 0 ? fatherField : string(),
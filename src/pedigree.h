@@ -303,6 +303,32 @@ public:
 		const subPopList & subPops = subPopList(),
 		const uintList & ancGens = uintList());
 
+	/** Randomly select non-overlapping families from a pedigree and return
+	 *  IDs of their members. A family is identified by an anchor individual
+	 *  (e.g. a father or grandfather) and consists of this individual and
+	 *  relatives located by following each <em>relative path</em> in
+	 *  \e fieldPath, which is a list of information fields to look for at
+	 *  each step. For example, <tt>fieldPath=[['spouse'], ['off0'],
+	 *  ['off0', 'spouse']]</tt> specifies a family with an anchor individual,
+	 *  its spouse, its first offspring and the spouse of this offspring.
+	 *  Paths that lead to an invalid (negative) ID are ignored.
+	 *
+	 *  Parameter \e IDs should be a list of IDs of anchor individuals, or a
+	 *  list of such lists if families are drawn separately from several
+	 *  groups (e.g. subpopulations). \e numFamilies families are drawn from
+	 *  each group, by visiting anchor individuals in random order and
+	 *  selecting a family if none of its members belongs to a family that
+	 *  has been selected for the same sample. Families are enumerated only
+	 *  once so that multiple samples (\e numOfSamples) can be drawn
+	 *  efficiently. This function returns a list of samples, each of which
+	 *  has a list of selected families (a list of IDs) for each group. Fewer
+	 *  families than requested are returned if there are not enough
+	 *  non-overlapping families in a group.
+	 *  <group>4-locate</group>
+	 */
+	PyObject * drawFamilies(const intMatrix & IDs, const stringMatrix & fieldPath,
+		const uintList & numFamilies, size_t numOfSamples = 1);
+
 	/** HIDDEN This function has the potential to change individuals in a
 	 *  population so the ID map needs to be rebuilt.
 	 */
@@ -359,6 +385,41 @@ private:
 
 	bool acceptableAffectionStatus(bool affected, AffectionStatus choice);
 
+	/// Parent-offspring relationships of individuals in some ancestral
+	/// generations. Unique individuals (by ID) are numbered consecutively and
+	/// offspring of each parent are stored in consecutive blocks of an array
+	/// (compressed sparse rows), so that relatives can be located without
+	/// looking up IDs.
+	struct Families
+	{
+		/// individuals of the pedigree and parents of members, NULL for
+		/// parents who are not in the pedigree
+		vector<Individual *> inds;
+		/// IDs of inds
+		vectoru IDs;
+		/// index of the first member of inds, or NOT_FOUND
+		vectoru firstMember;
+		/// individuals in specified ancestral generations (members), in
+		/// the order they appear in the pedigree
+		vector<Individual *> members;
+		/// index of members in inds
+		vectoru memberInd;
+		/// index of father and mother of each member in inds, or NOT_FOUND
+		vectoru fathers;
+		vectoru mothers;
+		/// whether or not all parents of each member are in the pedigree
+		vector<bool> parentsFound;
+		/// offspring of inds[i] are stored in offspring[offsets[i]] to
+		/// offspring[offsets[i+1]-1], as 2 * member for paternal and
+		/// 2 * member + 1 for maternal relationships.
+		vectoru offsets;
+		vectoru offspring;
+	};
+
+	/// build parent-offspring relationships of members in ancestral
+	/// generations ancGens.
+	void buildFamilies(const vectoru & ancGens, Families & fam);
+
 	// a list of functions that will be used in locateRelatives.
 	// they are called only once. The reason this is separated is because
 	// they are too long when putting in one function.
@@ -52,6 +52,8 @@ bool BasePenetrance::apply(Population & pop) const
 		gens.push_back(pop.curAncestralGen());
 
 	size_t oldGen = pop.curAncestralGen();
+	vector<Individual *> inds;
+	vectorf penetrance;
 	for (unsigned genIdx = 0; genIdx < gens.size(); ++genIdx) {
 		pop.useAncestralGen(gens[genIdx]);
 
@@ -63,7 +65,20 @@ bool BasePenetrance::apply(Population & pop) const
 			if (sp->isVirtual())
 				pop.activateVirtualSubPop(*sp);
 
-			if (numThreads() > 1 && parallelizable()) {
+			if (batchSize() > 0) {
+				IndIterator ind = pop.indIterator(sp->subPop());
+				while (ind.valid()) {
+					inds.clear();
+					for (; ind.valid() && inds.size() < batchSize(); ++ind)
+						inds.push_back(&*ind);
+					blockPenet(pop, inds, penetrance);
+					for (size_t i = 0; i < inds.size(); ++i) {
+						if (savePene)
+							inds[i]->setInfo(penetrance[i], infoIdx);
+						inds[i]->setAffected(getRNG().randUniform() < penetrance[i]);
+					}
+				}
+			} else if (numThreads() > 1 && parallelizable()) {
 #pragma omp parallel
 				{
 #ifdef _OPENMP
@@ -105,6 +120,15 @@ bool BasePenetrance::apply(Population & pop) const
 }
 
 
+void BasePenetrance::blockPenet(Population & pop, const vector<Individual *> & inds,
+                                vectorf & penetrance) const
+{
+	penetrance.resize(inds.size());
+	for (size_t i = 0; i < inds.size(); ++i)
+		penetrance[i] = penet(&pop, pop.rawIndBegin() + (inds[i] - &*pop.rawIndBegin()));
+}
+
+
 bool BasePenetrance::applyToIndividual(Individual * ind, Population * pop)
 {
 	double p = penet(pop, pop->rawIndBegin() + (ind - &*pop->rawIndBegin()));
@@ -345,37 +369,64 @@ double MlPenetrance::penet(Population * pop, RawIndIterator ind) const
 }
 
 
+void PyPenetrance::blockPenet(Population & pop, const vector<Individual *> & inds,
+                              vectorf & penetrance) const
+{
+	batchCall(m_func, &pop, pop.gen(), m_loci, inds, 1, penetrance);
+}
+
+
 // the same as PyPenetrance
 double PyPenetrance::penet(Population * pop, RawIndIterator ind) const
 {
-	PyObject * args = PyTuple_New(m_func.numArgs());
-
-	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
-
-	for (size_t i = 0; i < m_func.numArgs(); ++i) {
-		const string & arg = m_func.arg(i);
-		if (arg == "ind")
-			PyTuple_SET_ITEM(args, i, pyIndObj(static_cast<void *>(&*ind)));
-		else if (arg == "geno")
-			PyTuple_SET_ITEM(args, i, ind->genoAtLoci(m_loci));
-		else if (arg == "mut")
-			PyTuple_SET_ITEM(args, i, ind->mutAtLoci(m_loci));
-		else if (arg == "gen") {
+	if (m_batchSize > 0) {
+		vectorf penetrance;
+		batchCall(m_func, pop, pop == NULL ? 0 : pop->gen(), m_loci,
+			vector<Individual *>(1, &*ind), 1, penetrance);
+		return penetrance[0];
+	}
+
+	genoValueCache::Key key;
+
+	if (m_cache.enabled()) {
+		vector<ULONG> geno;
+		ind->allelesAtLoci(m_loci, geno);
+		m_cache.setKey(key, pop == NULL ? 0 : pop->gen(), geno);
+		const vectorf * penetrance = m_cache.find(key);
+		if (penetrance != NULL)
+			return (*penetrance)[0];
+	}
+
+	m_args.initializeIfNeeded(*ind);
+	PyObject * args = m_args.tuple();
+
+	for (size_t i = 0; i < m_args.size(); ++i) {
+		switch (m_args.type(i)) {
+		case pyFuncArgs::IND_ARG:
+			m_args.setArg(i, pyIndObj(static_cast<void *>(&*ind)));
+			break;
+		case pyFuncArgs::GENO_ARG:
+			m_args.setArg(i, ind->genoAtLoci(m_loci));
+			break;
+		case pyFuncArgs::MUT_ARG:
+			m_args.setArg(i, ind->mutAtLoci(m_loci));
+			break;
+		case pyFuncArgs::GEN_ARG:
 			DBG_FAILIF(pop == NULL, ValueError, "No valid population reference is passed.");
-			PyTuple_SET_ITEM(args, i, PyInt_FromLong(static_cast<long>(pop->gen())));
-		} else if (arg == "pop") {
+			m_args.setArg(i, PyInt_FromLong(static_cast<long>(pop->gen())));
+			break;
+		case pyFuncArgs::POP_ARG:
 			DBG_FAILIF(pop == NULL, ValueError, "No valid population reference is passed.");
-			PyTuple_SET_ITEM(args, i, pyPopObj(static_cast<void *>(pop)));
-		} else {
-			DBG_FAILIF(!ind->hasInfoField(arg), ValueError,
-				"Only parameters 'ind', 'geno', 'gen', 'pop' and names of information fields are "
-				"acceptable in function " + m_func.name());
-			PyTuple_SET_ITEM(args, i, PyFloat_FromDouble(ind->info(arg)));
+			m_args.setArg(i, pyPopObj(static_cast<void *>(pop)));
+			break;
+		default:
+			m_args.setArg(i, PyFloat_FromDouble(ind->info(m_args.infoIdx(i))));
 		}
 	}
 
 	double penetrance = m_func(PyObj_As_Double, args);
-	Py_XDECREF(args);
+	if (m_cache.enabled())
+		m_cache.insert(key, vectorf(1, penetrance));
 	return penetrance;
 }
 
@@ -111,6 +111,22 @@ public:
 	}
 
 
+	/** CPPONLY
+	 *  Number of individuals whose penetrance values are calculated together
+	 *  by \c blockPenet, or 0 if they are calculated one by one.
+	 */
+	virtual size_t batchSize() const
+	{
+		return 0;
+	}
+
+
+	/** CPPONLY
+	 *  Calculate penetrance values of a block of individuals \e inds.
+	 */
+	virtual void blockPenet(Population & pop, const vector<Individual *> & inds,
+		vectorf & penetrance) const;
+
 	/// set penetrance to all individuals and record penetrance if requested
 	virtual bool apply(Population & pop) const;
 
@@ -134,7 +150,7 @@ public:
 	}
 
 
-private:
+protected:
 	/// how to handle ancestral gen
 	const uintList m_ancGens;
 };
@@ -396,6 +412,21 @@ public:
 	 *  of chromosome position pairs, \c ALL_AVAIL, or a function with optional
 	 *  parameter \c pop that will be called at each ganeeration to determine
 	 *  indexes of loci. The return value will be treated as Individual penetrance.
+	 *
+	 *  If \e func accepts only parameters \c geno and \c gen, a positive
+	 *  \e cacheSize allows this operator to cache penetrance values of up to
+	 *  \e cacheSize genotypes (and generations) so that \e func is called
+	 *  only once for each distinct genotype. Least recently used values are
+	 *  removed when the cache is full.
+	 *
+	 *  If a positive \e batchSize is specified, \e func is called in batch
+	 *  mode for blocks of up to \e batchSize individuals. It then receives
+	 *  genotypes as a 2-d NumPy array with one row per individual (\c geno),
+	 *  values at information fields as NumPy arrays, and should return an
+	 *  array of penetrance values, one for each individual. Individuals with
+	 *  different numbers of alleles at \e loci, such as males and females at
+	 *  loci on sex chromosomes, are passed in separate calls. Parameters
+	 *  \c ind and \c mut are not allowed in this mode.
 	 */
 	PyPenetrance(PyObject * func,
 		const lociList & loci = vectoru(),
@@ -403,11 +434,19 @@ public:
 		int begin = 0, int end = -1, int step = 1,
 		const intList & at = vectori(), const intList & reps = intList(),
 		const subPopList & subPops = subPopList(),
-		const stringList & infoFields = vectorstr()) :
+		const stringList & infoFields = vectorstr(), size_t cacheSize = 0,
+		size_t batchSize = 0) :
 		BasePenetrance(ancGens, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func), m_loci(loci)
+		m_func(func), m_args(m_func, pyFuncArgs::IND_ARG | pyFuncArgs::GENO_ARG | pyFuncArgs::MUT_ARG |
+		                     pyFuncArgs::GEN_ARG | pyFuncArgs::POP_ARG),
+		m_loci(loci), m_cache(m_func, cacheSize), m_batchSize(batchSize)
 	{
 		DBG_ASSERT(m_func.isValid(), ValueError, "Passed variable is not a callable python function.");
+		if (m_batchSize > 0) {
+			if (cacheSize > 0)
+				throw ValueError("Penetrance values cannot be cached in batch mode.");
+			checkBatchFunc(m_func);
+		}
 	};
 
 
@@ -423,6 +462,17 @@ public:
 	 */
 	virtual double penet(Population * pop, RawIndIterator ind) const;
 
+	/// CPPONLY
+	size_t batchSize() const
+	{
+		return m_batchSize;
+	}
+
+
+	/// CPPONLY
+	void blockPenet(Population & pop, const vector<Individual *> & inds,
+		vectorf & penetrance) const;
+
 	/// HIDDEN
 	string describe(bool format = true) const
 	{
@@ -431,6 +481,15 @@ public:
 	}
 
 
+	/** Return a dictionary with numbers of \c hits and \c misses of the
+	 *  penetrance cache, number of cached values (\c size) and \c cacheSize.
+	 */
+	PyObject * cacheStats() const
+	{
+		return m_cache.stats();
+	}
+
+
 	/// CPPONLY
 	bool parallelizable() const
 	{
@@ -442,8 +501,17 @@ private:
 	/// user supplied python function
 	const pyFunc m_func;
 
+	/// arguments of m_func
+	const pyFuncArgs m_args;
+
 	/// susceptibility loci
 	const lociList m_loci;
+
+	/// cached penetrance values
+	const genoValueCache m_cache;
+
+	/// number of individuals passed to m_func in batch mode
+	const size_t m_batchSize;
 };
 
 
@@ -68,7 +68,11 @@ Population::Population(const uintList & size,
 	m_curAncestralGen(0),
 	m_indOrdered(true),
 	m_gen(0),
-	m_rep(0)
+	m_rep(0),
+	m_idIndex(),
+	m_idIndexField(0),
+	m_indEpoch(0),
+	m_idIndexEpoch(0)
 {
 	DBG_DO(DBG_POPULATION, cerr << "Constructor of population is called\n");
 
@@ -127,7 +131,11 @@ Population::Population(const Population & rhs) :
 	m_curAncestralGen(rhs.m_curAncestralGen),
 	m_indOrdered(true),
 	m_gen(rhs.m_gen),
-	m_rep(rhs.m_rep)
+	m_rep(rhs.m_rep),
+	m_idIndex(),
+	m_idIndexField(0),
+	m_indEpoch(0),
+	m_idIndexEpoch(0)
 {
 	DBG_DO(DBG_POPULATION,
 		cerr << "Copy constructor of population is called" << endl);
@@ -217,12 +225,6 @@ Population::Population(const Population & rhs) :
 
 void Population::popData::swap(Population & pop)
 {
-#ifdef MUTANTALLELE
-	size_t genoSize = 0;
-	if (m_inds.size() != 0)
-		genoSize = m_genotype.size() / m_inds.size();
-#endif
-
 	pop.m_subPopSize.swap(m_subPopSize);
 	pop.m_subPopNames.swap(m_subPopNames);
 	pop.m_genotype.swap(m_genotype);
@@ -231,13 +233,12 @@ void Population::popData::swap(Population & pop)
 	pop.m_inds.swap(m_inds);
 	std::swap(pop.m_indOrdered, m_indOrdered);
 #ifdef MUTANTALLELE
-	// vectorm must be setGenoPtr after swap
-	GenoIterator ptr = pop.m_genotype.begin();
-	for (size_t i = 0; i < pop.m_inds.size(); ++i, ptr += genoSize)
-		pop.m_inds[i].setGenoPtr(ptr);
-	ptr = m_genotype.begin();
-	for (size_t i = 0; i < m_inds.size(); ++i, ptr += pop.genoSize())
-		m_inds[i].setGenoPtr(ptr);
+	// vectorm must be setGenoPtr after swap. Individuals might not be in
+	// order so the location of their genotype has to be kept.
+	for (size_t i = 0; i < pop.m_inds.size(); ++i)
+		pop.m_inds[i].setGenoPtr(pop.m_genotype.begin() + pop.m_inds[i].genoPtr().index());
+	for (size_t i = 0; i < m_inds.size(); ++i)
+		m_inds[i].setGenoPtr(m_genotype.begin() + m_inds[i].genoPtr().index());
 #endif
 }
 
@@ -384,6 +385,65 @@ int Population::__cmp__(const Population & rhs) const
 }
 
 
+vector<Individual> & Population::ancestralInds(size_t gen)
+{
+	// the current generation is not necessarily the present generation
+	if (static_cast<int>(gen) == m_curAncestralGen)
+		return m_inds;
+	return m_ancestralPops[gen == 0 ? m_curAncestralGen - 1 : gen - 1].m_inds;
+}
+
+
+void Population::buildIDIndex(size_t field)
+{
+	m_idIndex.clear();
+	m_idIndexField = field;
+	m_idIndexEpoch = m_indEpoch;
+	// the first individual with an ID is indexed if IDs are not unique
+	for (int gen = 0; gen <= ancestralGens(); ++gen) {
+		vector<Individual> & inds = ancestralInds(gen);
+		for (size_t i = 0; i < inds.size(); ++i)
+			m_idIndex.insert(IdIndex::value_type(toID(inds[i].info(field)), pairu(gen, i)));
+	}
+}
+
+
+Individual * Population::findIndByID(size_t id, const vectoru & gens, size_t field)
+{
+	// The index is rebuilt if individuals have been added, removed, reordered
+	// or assigned new IDs since it was built. Because IDs can also be changed
+	// directly, an indexed location is checked before it is used, and the
+	// index is rebuilt if the check fails.
+	if (m_idIndexField != field || m_idIndexEpoch != m_indEpoch || m_idIndex.empty())
+		buildIDIndex(field);
+	for (bool rebuilt = false; ; rebuilt = true) {
+		IdIndex::const_iterator it = m_idIndex.find(id);
+		if (it == m_idIndex.end())
+			return NULL;
+		if (it->second.first <= static_cast<size_t>(ancestralGens())) {
+			vector<Individual> & inds = ancestralInds(it->second.first);
+			if (it->second.second < inds.size() && toID(inds[it->second.second].info(field)) == id) {
+				if (find(gens.begin(), gens.end(), it->second.first) != gens.end())
+					return &inds[it->second.second];
+				break;
+			}
+		}
+		if (rebuilt)
+			break;
+		buildIDIndex(field);
+	}
+	// the individual is not in the specified generations, but there might be
+	// other individuals with the same ID in these generations
+	for (size_t genIdx = 0; genIdx < gens.size(); ++genIdx) {
+		vector<Individual> & inds = ancestralInds(gens[genIdx]);
+		for (size_t i = 0; i < inds.size(); ++i)
+			if (toID(inds[i].info(field)) == id)
+				return &inds[i];
+	}
+	return NULL;
+}
+
+
 Individual & Population::indByID(double fid, const uintList & ancGens, const string & idField)
 {
 	size_t id = toID(fid);
@@ -400,31 +460,39 @@ Individual & Population::indByID(double fid, const uintList & ancGens, const str
 	else if (ancGens.unspecified())
 		gens.push_back(m_curAncestralGen);
 
-	for (size_t genIdx = 0; genIdx < gens.size(); ++genIdx) {
-		ssize_t gen = gens[genIdx];
-		vector<Individual> * inds = NULL;
-		// search in current, not necessarily the present generation
-		if (gen == m_curAncestralGen)
-			inds = &m_inds;
-		else
-			inds = &m_ancestralPops[gen == 0 ? m_curAncestralGen - 1 : gen - 1].m_inds;
-		// first try our luck
-		size_t startID = (*inds)[0].intInfo(idx);
-		if (idx >= startID && startID + (*inds).size() > id) {
-			Individual & ind = (*inds)[id - startID];
-			if (toID(ind.intInfo(idx)) == id)
-				return ind;
-		}
-		// now we have to search all individuals
-		for (size_t i = 0; i < (*inds).size(); ++i) {
-			if (toID((*inds)[i].intInfo(idx)) == id)
-				return (*inds)[i];
+	Individual * ind = findIndByID(id, gens, idx);
+	// if still cannot be found, raise an IndexError.
+	if (ind == NULL)
+		throw IndexError((boost::format("No individual with ID %1% could be found.") % id).str());
+	return *ind;
+}
+
+
+PyObject * Population::indsByIDs(const floatList & IDList, const uintList & ancGens, const string & idField)
+{
+	const vectorf & IDs = IDList.elems();
+	size_t idx = infoIdx(idField);
+
+	vectoru gens = ancGens.elems();
+	if (ancGens.allAvail())
+		for (int gen = 0; gen <= ancestralGens(); ++gen)
+			gens.push_back(gen);
+	else if (ancGens.unspecified())
+		gens.push_back(m_curAncestralGen);
+
+	PyObject * res = PyList_New(IDs.size());
+	for (size_t i = 0; i < IDs.size(); ++i) {
+		size_t id = toID(IDs[i]);
+		DBG_FAILIF(fabs(IDs[i] - id) > 1e-8, ValueError,
+			"individual ID has to be integer (or a double round to full iteger).");
+		Individual * ind = findIndByID(id, gens, idx);
+		if (ind == NULL) {
+			Py_DECREF(res);
+			throw IndexError((boost::format("No individual with ID %1% could be found.") % id).str());
 		}
+		PyList_SET_ITEM(res, i, pyIndObj(static_cast<void *>(ind)));
 	}
-	// if still cannot be found, raise an IndexError.
-	throw IndexError((boost::format("No individual with ID %1% could be found.") % id).str());
-	// this is just to suppress a warning.
-	return m_inds[0];
+	return res;
 }
 
 
@@ -675,14 +743,20 @@ PyObject * Population::lineage(vspID subPopID)
 		"This operation is not allowed when there is an activated virtual subpopulation");
 
 	syncIndPointers();
+	// the array is exported as individual x ploidy x locus through the buffer interface
+	vectoru shape(3);
+	shape[1] = ploidy();
+	shape[2] = totNumLoci();
 	if (!vsp.valid()) {
+		shape[0] = popSize();
 		// directly expose values. Do not copy data over.
-		return Lineage_Vec_As_NumArray(m_lineage.begin(), m_lineage.end());
+		return Lineage_Vec_As_NumArray(m_lineage.begin(), m_lineage.end(), shape);
 	} else {
 		size_t subPop = vsp.subPop();
 		CHECKRANGESUBPOP(subPop);
+		shape[0] = subPopSize(subPop);
 		// directly expose values. Do not copy data over.
-		return Lineage_Vec_As_NumArray(lineageBegin(subPop, true), lineageEnd(subPop, true));
+		return Lineage_Vec_As_NumArray(lineageBegin(subPop, true), lineageEnd(subPop, true), shape);
 	}
 	Py_INCREF(Py_None);
 	return Py_None;
@@ -710,14 +784,20 @@ PyObject * Population::genotype(vspID subPopID)
 		"This operation is not allowed when there is an activated virtual subpopulation");
 
 	syncIndPointers();
+	// the array is exported as individual x ploidy x locus through the buffer interface
+	vectoru shape(3);
+	shape[1] = ploidy();
+	shape[2] = totNumLoci();
 	if (!vsp.valid()) {
+		shape[0] = popSize();
 		// directly expose values. Do not copy data over.
-		return Allele_Vec_As_NumArray(m_genotype.begin(), m_genotype.end());
+		return Allele_Vec_As_NumArray(m_genotype.begin(), m_genotype.end(), shape);
 	} else {
 		size_t subPop = vsp.subPop();
 		CHECKRANGESUBPOP(subPop);
+		shape[0] = subPopSize(subPop);
 		// directly expose values. Do not copy data over.
-		return Allele_Vec_As_NumArray(genoBegin(subPop, true), genoEnd(subPop, true));
+		return Allele_Vec_As_NumArray(genoBegin(subPop, true), genoEnd(subPop, true), shape);
 	}
 	return NULL;
 }
@@ -876,6 +956,7 @@ void Population::validate(const string & msg) const
 void Population::fitSubPopStru(const vectoru & newSubPopSizes,
                                const vectorstr & newSubPopNames)
 {
+	invalidateIDIndex();
 	size_t newSize = accumulate(newSubPopSizes.begin(), newSubPopSizes.end(), size_t(0));
 
 	bool needsResize = m_popSize != newSize;
@@ -977,6 +1058,7 @@ void Population::fitGenoStru(size_t stru)
 void Population::setSubPopStru(const vectoru & newSubPopSizes,
                                const vectorstr & newSubPopNames)
 {
+	invalidateIDIndex();
 	DBG_FAILIF(hasActivatedVirtualSubPop(), ValueError,
 		"This operation is not allowed when there is an activated virtual subpopulation");
 
@@ -1118,6 +1200,7 @@ size_t Population::subPopSize(vspID subPopID, int ancGen, SexChoice sex) const
 
 void Population::sortIndividuals(const stringList & infoList, bool reverse)
 {
+	invalidateIDIndex();
 	const vectorstr & infoFields = infoList.elems();
 
 	if (infoFields.size() == 0)
@@ -1125,14 +1208,29 @@ void Population::sortIndividuals(const stringList & infoList, bool reverse)
 	vectoru fields(infoFields.size());
 	for (size_t i = 0; i < infoFields.size(); ++i)
 		fields[i] = infoIdx(infoFields[i]);
-	for (size_t sp = 0; sp < numSubPop(); ++sp)
-		parallelSort(rawIndBegin(sp), rawIndEnd(sp), indCompare(fields, reverse));
-	setIndOrdered(false);
+	indCompare cmp(fields, reverse);
+	bool sorted = true;
+	for (size_t sp = 0; sp < numSubPop(); ++sp) {
+		// individuals that are already in order are not moved so that
+		// genotypes do not have to be rearranged.
+		RawIndIterator it = rawIndBegin(sp);
+		RawIndIterator it_end = rawIndEnd(sp);
+		for (; it != it_end && it + 1 != it_end; ++it)
+			if (cmp(*(it + 1), *it))
+				break;
+		if (it == it_end || it + 1 == it_end)
+			continue;
+		parallelSort(rawIndBegin(sp), it_end, cmp);
+		sorted = false;
+	}
+	if (!sorted)
+		setIndOrdered(false);
 }
 
 
 void Population::setSubPopByIndInfo(const string & field)
 {
+	invalidateIDIndex();
 	DBG_FAILIF(hasActivatedVirtualSubPop(), ValueError,
 		"This operation is not allowed when there is an activated virtual subpopulation");
 
@@ -1142,83 +1240,100 @@ void Population::setSubPopByIndInfo(const string & field)
 	// if the population is empty, return directly (#19)
 	if (rawIndBegin() == rawIndEnd())
 		return;
-	// sort individuals first
-	parallelSort(rawIndBegin(), rawIndEnd(), indCompare(info));
-	setIndOrdered(false);
-
-	// sort individuals first
-	// remove individuals with negative index.
-	if (indIterator()->info(info) < 0) {
-		// popsize etc will be changed.
-		size_t newPopSize = m_popSize;
-		IndIterator it = indIterator();
-		for (; it.valid(); ++it) {
-			if (it->info(info) < 0)
-				newPopSize-- ;
-			else
-				break;
+
+	// count individuals in each new subpopulation. Individuals with negative
+	// values will be removed.
+	vectoru newSubPopSize;
+	size_t newPopSize = 0;
+	size_t lastSubPop = 0;
+	bool ordered = true;
+	for (RawIndIterator it = rawIndBegin(); it != rawIndEnd(); ++it) {
+		double value = it->info(info);
+		if (value < 0) {
+			ordered = false;
+			continue;
 		}
-		// 'it' now point to the one with positive info(info)
+		size_t sp = static_cast<size_t>(value);
+		if (sp >= newSubPopSize.size())
+			newSubPopSize.resize(sp + 1, 0);
+		++newSubPopSize[sp];
+		++newPopSize;
+		if (sp < lastSubPop)
+			ordered = false;
+		lastSubPop = sp;
+	}
 
-		DBG_DO(DBG_POPULATION, cerr << "New pop size" << newPopSize << endl);
+	// Individuals are rearranged by a counting sort that keeps their relative
+	// order in each subpopulation. Only individual objects are moved, and
+	// genotypes will be rearranged when they are needed in order. Nothing is
+	// moved if no individual changes subpopulation.
+	if (!ordered) {
+		vectoru offset(newSubPopSize.size(), 0);
+		for (size_t sp = 1; sp < newSubPopSize.size(); ++sp)
+			offset[sp] = offset[sp - 1] + newSubPopSize[sp - 1];
+		vector<Individual> newInds(newPopSize);
+		for (RawIndIterator it = rawIndBegin(); it != rawIndEnd(); ++it) {
+			double value = it->info(info);
+			if (value >= 0)
+				newInds[offset[static_cast<size_t>(value)]++] = *it;
+		}
+		if (newPopSize == m_popSize) {
+			m_inds.swap(newInds);
+			setIndOrdered(false);
+		} else {
+			DBG_DO(DBG_POPULATION, cerr << "New pop size" << newPopSize << endl);
 
-		// allocate new genotype and inds
+			// allocate new genotype and inds
 #ifdef MUTANTALLELE
-		vectorm newGenotype(genoSize() * newPopSize);
+			vectorm newGenotype(genoSize() * newPopSize);
 #else
-		vectora newGenotype(genoSize() * newPopSize);
+			vectora newGenotype(genoSize() * newPopSize);
 #endif
-		LINEAGE_EXPR(vectori newLineage(genoSize() * newPopSize));
-		vectorf newInfo(newPopSize * infoSize());
-		vector<Individual> newInds(newPopSize);
-
-		// assign genotype location and set structure information for individuals
-		InfoIterator infoPtr = newInfo.begin();
-		size_t step = genoSize();
-		size_t infoStep = infoSize();
-		GenoIterator ptr = newGenotype.begin();
+			LINEAGE_EXPR(vectorlin newLineage(genoSize() * newPopSize));
+			vectorf newInfo(newPopSize * infoSize());
+
+			// assign genotype location and set structure information for individuals
+			InfoIterator infoPtr = newInfo.begin();
+			size_t step = genoSize();
+			size_t infoStep = infoSize();
+			GenoIterator ptr = newGenotype.begin();
+			// individuals in newInds still refer to the existing genotype
+			vector<Individual>::iterator it = newInds.begin();
+			Individual ind;
 #ifdef LINEAGE
-		LineageIterator lineagePtr = newLineage.begin();
-		for (size_t i = 0; i < newPopSize; ++i, ptr += step, ++it, lineagePtr += step, infoPtr += infoStep) {
-			newInds[i].setLineagePtr(lineagePtr);
+			LineageIterator lineagePtr = newLineage.begin();
+			for (size_t i = 0; i < newPopSize; ++i, ptr += step, ++it, lineagePtr += step, infoPtr += infoStep) {
+				ind.setLineagePtr(lineagePtr);
 #else
-		for (size_t i = 0; i < newPopSize; ++i, ptr += step, ++it, infoPtr += infoStep) {
+			for (size_t i = 0; i < newPopSize; ++i, ptr += step, ++it, infoPtr += infoStep) {
 #endif
-			newInds[i].setGenoStruIdx(genoStruIdx());
-			newInds[i].setGenoPtr(ptr);
-			newInds[i].setInfoPtr(infoPtr);
-			newInds[i].copyFrom(*it);                         // copy everything, with info value
-		}
-		// now, switch!
-		m_genotype.swap(newGenotype);
-		m_info.swap(newInfo);
-		m_inds.swap(newInds);
-		LINEAGE_EXPR(m_lineage.swap(newLineage));
-		m_popSize = newPopSize;
-		setIndOrdered(true);
+				ind.setGenoStruIdx(genoStruIdx());
+				ind.setGenoPtr(ptr);
+				ind.setInfoPtr(infoPtr);
+				ind.copyFrom(*it);                         // copy everything, with info value
+				*it = ind;
+			}
+			// now, switch!
+			m_genotype.swap(newGenotype);
+			m_info.swap(newInfo);
+			m_inds.swap(newInds);
+			LINEAGE_EXPR(m_lineage.swap(newLineage));
+			m_popSize = newPopSize;
+			setIndOrdered(true);
 #ifdef MUTANTALLELE
-		// vectorm must be setGenoPtr after swap
-		ptr = m_genotype.begin();
-		for (size_t i = 0; i < m_popSize; ++i, ptr += genoSize())
-			m_inds[i].setGenoPtr(ptr);
-
+			// vectorm must be setGenoPtr after swap
+			ptr = m_genotype.begin();
+			for (size_t i = 0; i < m_popSize; ++i, ptr += genoSize())
+				m_inds[i].setGenoPtr(ptr);
 #endif
+		}
 	}
 
-	if (m_inds.empty()) {
-		m_subPopSize.resize(1, 0);
-		m_subPopIndex.resize(2);
-	} else {
-		// reset indexes etc.
-		size_t numSubPop = static_cast<size_t>(m_inds.back().info(info)) + 1;
-		m_subPopSize.resize(numSubPop);
-		m_subPopIndex.resize(numSubPop + 1);
-
-		// check subpop size
-		fill(m_subPopSize.begin(), m_subPopSize.end(), 0);
-		for (IndIterator it = indIterator(); it.valid(); ++it)
-			m_subPopSize[ static_cast<size_t>(it->info(info)) ]++;
-	}
+	if (m_inds.empty())
+		m_subPopSize.assign(1, 0);
+	else
+		m_subPopSize.swap(newSubPopSize);
+	m_subPopIndex.resize(numSubPop() + 1);
 	// rebuild index
 	size_t i = 1;
 	for (m_subPopIndex[0] = 0; i <= numSubPop(); ++i)
@@ -1282,6 +1397,7 @@ vectoru Population::splitSubPop(size_t subPop, const vectorf & sizes, const vect
 
 void Population::removeSubPops(const subPopList & subPops)
 {
+	invalidateIDIndex();
 	syncIndPointers();
 	vectoru new_size;
 	vectorstr new_spNames;
@@ -1424,6 +1540,7 @@ void Population::removeSubPops(const subPopList & subPops)
 
 void Population::removeMarkedIndividuals()
 {
+	invalidateIDIndex();
 	syncIndPointers();
 	vectoru new_size(numSubPop(), 0);
 
@@ -1511,6 +1628,7 @@ void Population::removeMarkedIndividuals()
 void Population::removeIndividuals(const uintList & indexList, const floatList & IDList,
                                    const string & idField, PyObject * filter)
 {
+	invalidateIDIndex();
 	const vectoru & indexes = indexList.elems();
 	const vectorf & IDs = IDList.elems();
 
@@ -1594,6 +1712,7 @@ void Population::removeIndividuals(const uintList & indexList, const floatList &
 
 size_t Population::mergeSubPops(const uintList & subPops, const string & name, int toSubPop)
 {
+	invalidateIDIndex();
 	if (!name.empty() && m_subPopNames.empty())
 		m_subPopNames.resize(numSubPop(), UnnamedSubPop);
 
@@ -1687,7 +1806,7 @@ size_t Population::mergeSubPops(const uintList & subPops, const string & name, i
 	new_genotype.reserve(step * popSize());
 #endif
 #ifdef LINEAGE
-	vectori new_lineage;
+	vectorlin new_lineage;
 	new_lineage.reserve(step * popSize());
 #endif
 	new_inds.reserve(popSize());
@@ -1759,7 +1878,7 @@ void Population::addChromFrom(const Population & pop)
 		// append pop2 chromosomes to the first one
 		GenoIterator ptr = newGenotype.begin();
 #ifdef LINEAGE
-		vectori newLineage(genoSize() * m_popSize);
+		vectorlin newLineage(genoSize() * m_popSize);
 		LineageIterator lineagePtr = newLineage.begin();
 #endif
 
@@ -1816,6 +1935,7 @@ void Population::addChromFrom(const Population & pop)
 
 void Population::addIndFrom(const Population & pop)
 {
+	invalidateIDIndex();
 	DBG_FAILIF(genoStruIdx() != pop.genoStruIdx(), ValueError,
 		"Cannot add Individual from a population with different genotypic structure.");
 	DBG_FAILIF(ancestralGens() != pop.ancestralGens(), ValueError,
@@ -1907,7 +2027,7 @@ void Population::addLociFrom(const Population & pop, bool byName)
 		// merge chromosome by chromosome
 		GenoIterator ptr = newGenotype.begin();
 #ifdef LINEAGE
-		vectori newLineage(genoSize() * m_popSize);
+		vectorlin newLineage(genoSize() * m_popSize);
 		LineageIterator lineagePtr = newLineage.begin();
 #endif
 		size_t pEnd = ploidy();
@@ -1982,7 +2102,7 @@ void Population::addChrom(const floatList & lociPosList, const stringList & loci
 		// copy data over
 		GenoIterator newPtr = newGenotype.begin();
 #ifdef LINEAGE
-		vectori newLineage(newPopGenoSize, 0);
+		vectorlin newLineage(newPopGenoSize, 0);
 		LineageIterator newLineagePtr = newLineage.begin();
 #endif
 
@@ -2063,7 +2183,7 @@ vectoru Population::addLoci(const uintList & chromList, const floatList & posLis
 		// copy data over
 		GenoIterator newPtr = newGenotype.begin();
 #ifdef LINEAGE
-		vectori newLineage(newPopGenoSize, 0);
+		vectorlin newLineage(newPopGenoSize, 0);
 		LineageIterator newLineagePtr = newLineage.begin();
 #endif
 		size_t pEnd = ploidy();
@@ -2106,6 +2226,7 @@ vectoru Population::addLoci(const uintList & chromList, const floatList & posLis
 
 void Population::resize(const uintList & sizeList, bool propagate)
 {
+	invalidateIDIndex();
 	const vectoru & newSubPopSizes = sizeList.elems();
 
 	DBG_FAILIF(newSubPopSizes.size() != numSubPop(), ValueError,
@@ -2133,7 +2254,7 @@ void Population::resize(const uintList & sizeList, bool propagate)
 		newInds[i].setInfoPtr(infoPtr);
 	}
 #ifdef LINEAGE
-	vectori newLineage(genoSize() * newPopSize);
+	vectorlin newLineage(genoSize() * newPopSize);
 	LineageIterator lineagePtr = newLineage.begin();
 	for (size_t i = 0; i < newPopSize; ++i, lineagePtr += step) {
 		newInds[i].setLineagePtr(lineagePtr);
@@ -2203,7 +2324,7 @@ Population & Population::extractSubPops(const subPopList & subPops, bool rearran
 #else
 	vectora new_genotype;
 #endif
-	LINEAGE_EXPR(vectori new_lineage);
+	LINEAGE_EXPR(vectorlin new_lineage);
 	vectorf new_info;
 
 	if (rearrange) {
@@ -2371,6 +2492,17 @@ Population & Population::extractSubPops(const subPopList & subPops, bool rearran
 
 
 Population & Population::extractMarkedIndividuals() const
+{
+	vectoru indexes;
+
+	for (size_t i = 0; i < m_popSize; ++i)
+		if (m_inds[i].marked())
+			indexes.push_back(i);
+	return extractIndexedIndividuals(indexes);
+}
+
+
+Population & Population::extractIndexedIndividuals(const vectoru & indexes) const
 {
 	Population & pop = *new Population();
 
@@ -2379,21 +2511,11 @@ Population & Population::extractMarkedIndividuals() const
 	pop.setVirtualSplitter(virtualSplitter());
 
 	syncIndPointers();
-	vectoru new_size;
+	vectoru new_size(numSubPop(), 0);
 
 	size_t step = genoSize();
 	size_t infoStep = infoSize();
-	ConstRawIndIterator oldInd = m_inds.begin();
-	ConstGenoIterator oldPtr = m_genotype.begin();
-	LINEAGE_EXPR(ConstLineageIterator oldLineagePtr = m_lineage.begin());
-	ConstInfoIterator oldInfoPtr = m_info.begin();
-
-	size_t sz = 0;
-	ConstRawIndIterator it = rawIndBegin();
-	ConstRawIndIterator itEnd = rawIndEnd();
-	for (; it != itEnd; ++it)
-		if (it->marked())
-			++sz;
+	size_t sz = indexes.size();
 
 	vector<Individual> new_inds(sz);
 #ifdef MUTANTALLELE
@@ -2401,47 +2523,41 @@ Population & Population::extractMarkedIndividuals() const
 #else
 	vectora new_genotype(sz * step);
 #endif
-	LINEAGE_EXPR(vectori new_lineage(sz * step));
+	LINEAGE_EXPR(vectorlin new_lineage(sz * step));
 	vectorf new_info(sz * infoStep);
 
-	RawIndIterator newInd = new_inds.begin();
 	GenoIterator newPtr = new_genotype.begin();
 	LINEAGE_EXPR(LineageIterator newLineagePtr = new_lineage.begin());
 	InfoIterator newInfoPtr = new_info.begin();
 	//
-	for (size_t sp = 0; sp < numSubPop(); ++sp) {
-		size_t newSize = 0;
-		size_t spSize = subPopSize(sp);
-		for (size_t i = 0; i < spSize; ++i) {
-			// will be kept
-			if (oldInd->marked()) {
-				++newSize;
-				*newInd = *oldInd;
+	size_t sp = 0;
+	for (size_t i = 0; i < sz; ++i) {
+		size_t idx = indexes[i];
+		DBG_FAILIF(idx >= m_popSize || (i > 0 && idx <= indexes[i - 1]), ValueError,
+			"Indexes of extracted individuals should be sorted and within range.");
+		while (idx >= subPopEnd(sp))
+			++sp;
+		++new_size[sp];
+		new_inds[i] = m_inds[idx];
+		ConstGenoIterator oldPtr = m_genotype.begin() + idx * step;
 #ifdef MUTANTALLELE
-				copyGenotype(oldPtr, oldPtr + step, newPtr);
+		copyGenotype(oldPtr, oldPtr + step, newPtr);
 #else
-				copy(oldPtr, oldPtr + step, newPtr);
+		copy(oldPtr, oldPtr + step, newPtr);
 #endif
-				copy(oldInfoPtr, oldInfoPtr + infoStep, newInfoPtr);
-				LINEAGE_EXPR(copy(oldLineagePtr, oldLineagePtr + step, newLineagePtr));
-				++newInd;
-				newPtr += step;
-				newInfoPtr += infoStep;
-				LINEAGE_EXPR(newLineagePtr += step);
-			}
-			++oldInd;
-			oldPtr += step;
-			oldInfoPtr += infoStep;
-			LINEAGE_EXPR(oldLineagePtr += step);
-		}
-		new_size.push_back(newSize);
+		ConstInfoIterator oldInfoPtr = m_info.begin() + idx * infoStep;
+		copy(oldInfoPtr, oldInfoPtr + infoStep, newInfoPtr);
+		LINEAGE_EXPR(copy(m_lineage.begin() + idx * step, m_lineage.begin() + (idx + 1) * step, newLineagePtr));
+		newPtr += step;
+		newInfoPtr += infoStep;
+		LINEAGE_EXPR(newLineagePtr += step);
 	}
 	//
 	pop.m_inds.swap(new_inds);
 	pop.m_genotype.swap(new_genotype);
 	pop.m_info.swap(new_info);
 	LINEAGE_EXPR(pop.m_lineage.swap(new_lineage));
-	pop.m_popSize = std::accumulate(new_size.begin(), new_size.end(), size_t(0));
+	pop.m_popSize = sz;
 	pop.setSubPopStru(new_size, m_subPopNames);
 	//
 	InfoIterator infoPtr = pop.m_info.begin();
@@ -2560,6 +2676,89 @@ Population & Population::extractIndividuals(const uintList & indexList,
 }
 
 
+PyObject * Population::extractIndividualSets(const intMatrix & indexList,
+                                             const floatMatrix & IDList, const string & idField) const
+{
+	const matrixi & indexes = indexList.elems();
+	const matrixf & IDs = IDList.elems();
+
+	DBG_FAILIF(!indexes.empty() && !IDs.empty(), ValueError,
+		"Please specify only one of parameters indexes and IDs");
+
+	PyObject * res = PyList_New(0);
+	vectoru sel;
+	for (size_t s = 0; s < indexes.size(); ++s) {
+		sel.resize(indexes[s].size());
+		for (size_t i = 0; i < indexes[s].size(); ++i) {
+			DBG_FAILIF(indexes[s][i] < 0 || static_cast<size_t>(indexes[s][i]) >= m_popSize, IndexError,
+				(boost::format("individual index %1% out of range of 0 ~ %2%.") % indexes[s][i] % m_popSize).str());
+			sel[i] = static_cast<size_t>(indexes[s][i]);
+		}
+		std::sort(sel.begin(), sel.end());
+		sel.erase(std::unique(sel.begin(), sel.end()), sel.end());
+		PyObject * pop = pyPopObj(static_cast<void *>(&extractIndexedIndividuals(sel)), true);
+		PyList_Append(res, pop);
+		Py_DECREF(pop);
+	}
+	if (IDs.empty())
+		return res;
+
+	// locations (ancestral generation and index) of all individuals, sorted
+	// by ID so that individuals with the same ID can be located together.
+	size_t fieldIdx = infoIdx(idField);
+	vector<std::pair<size_t, pairu> > locations;
+	for (int depth = ancestralGens(); depth >= 0; --depth) {
+		const vector<Individual> & inds = const_cast<Population *>(this)->ancestralInds(depth);
+		for (size_t i = 0; i < inds.size(); ++i)
+			locations.push_back(std::pair<size_t, pairu>(toID(inds[i].info(fieldIdx)), pairu(depth, i)));
+	}
+	std::sort(locations.begin(), locations.end());
+
+	int curGen = m_curAncestralGen;
+	vector<pairu> found;
+	for (size_t s = 0; s < IDs.size(); ++s) {
+		if (IDs[s].empty()) {
+			// extract no individuals
+			PyObject * pop = pyPopObj(static_cast<void *>(&extractIndexedIndividuals(vectoru())), true);
+			PyList_Append(res, pop);
+			Py_DECREF(pop);
+			continue;
+		}
+		found.clear();
+		for (size_t i = 0; i < IDs[s].size(); ++i) {
+			size_t id = toID(IDs[s][i]);
+			vector<std::pair<size_t, pairu> >::const_iterator it = std::lower_bound(locations.begin(),
+				locations.end(), std::pair<size_t, pairu>(id, pairu(0, 0)));
+			for (; it != locations.end() && it->first == id; ++it)
+				found.push_back(it->second);
+		}
+		// individuals are extracted in their original order
+		std::sort(found.begin(), found.end());
+		found.erase(std::unique(found.begin(), found.end()), found.end());
+
+		Population * allPop = NULL;
+		for (int depth = ancestralGens(); depth >= 0; --depth) {
+			sel.clear();
+			vector<pairu>::const_iterator it = std::lower_bound(found.begin(), found.end(), pairu(depth, 0));
+			for (; it != found.end() && it->first == static_cast<size_t>(depth); ++it)
+				sel.push_back(it->second);
+			const_cast<Population *>(this)->useAncestralGen(depth);
+			Population & pop = extractIndexedIndividuals(sel);
+			if (allPop == NULL) {
+				allPop = &pop;
+				allPop->setAncestralDepth(ancestralGens());
+			} else
+				allPop->push(pop);
+		}
+		const_cast<Population *>(this)->useAncestralGen(curGen);
+		PyObject * pop = pyPopObj(static_cast<void *>(allPop), true);
+		PyList_Append(res, pop);
+		Py_DECREF(pop);
+	}
+	return res;
+}
+
+
 Population & Population::extract(const lociList & extractedLoci, const stringList & infoFieldList,
                                  const subPopList & _subPops, const uintList & ancGens) const
 {
@@ -2706,7 +2905,7 @@ Population & Population::extract(const lociList & extractedLoci, const stringLis
 		new_genotype.reserve(size * step);
 #endif
 #ifdef LINEAGE
-		vectori new_lineage;
+		vectorlin new_lineage;
 		new_lineage.reserve(size * step);
 #endif
 		vectorf new_info;
@@ -2806,7 +3005,7 @@ Population & Population::extract(const lociList & extractedLoci, const stringLis
 			new_inds[i].setInfoPtr(infoPtr);
 		}
 #ifdef LINEAGE
-		vectori::iterator lineagePtr = new_lineage.begin();
+		vectorlin::iterator lineagePtr = new_lineage.begin();
 		for (size_t i = 0; i < size; ++i, lineagePtr += step) {
 			new_inds[i].setLineagePtr(lineagePtr);
 		}
@@ -2900,7 +3099,7 @@ void Population::removeLoci(const lociList & removeList, const lociList & keepLi
 		// copy data over
 		GenoIterator newPtr = newGenotype.begin();
 #ifdef LINEAGE
-		vectori newLineage(genoSize() * m_popSize);
+		vectorlin newLineage(genoSize() * m_popSize);
 		LineageIterator newLineagePtr = newLineage.begin();
 #endif
 		size_t pEnd = ploidy();
@@ -3092,6 +3291,7 @@ void Population::recodeAlleles(const uintListFunc & newAlleles, const lociList &
 
 void Population::push(Population & rhs)
 {
+	invalidateIDIndex();
 	if (rhs.genoStruIdx() != genoStruIdx()) {
 		if (m_ancestralGens > 0)
 			throw ValueError("Cannot save a population with different structure as an ancestral population to the existing population");
@@ -3132,13 +3332,12 @@ void Population::push(Population & rhs)
 	std::swap(m_indOrdered, rhs.m_indOrdered);
 
 #ifdef MUTANTALLELE
-	// vectorm must be setGenoPtr after swap
-	GenoIterator ptr = m_genotype.begin();
-	for (size_t i = 0; i < m_inds.size(); ++i, ptr += genoSize())
-		m_inds[i].setGenoPtr(ptr);
-	ptr = rhs.m_genotype.begin();
-	for (size_t i = 0; i < rhs.m_inds.size(); ++i, ptr += genoSize())
-		rhs.m_inds[i].setGenoPtr(ptr);
+	// vectorm must be setGenoPtr after swap. Individuals might not be in
+	// order so the location of their genotype has to be kept.
+	for (size_t i = 0; i < m_inds.size(); ++i)
+		m_inds[i].setGenoPtr(m_genotype.begin() + m_inds[i].genoPtr().index());
+	for (size_t i = 0; i < rhs.m_inds.size(); ++i)
+		rhs.m_inds[i].setGenoPtr(rhs.m_genotype.begin() + rhs.m_inds[i].genoPtr().index());
 #endif
 
 	// current population should be working well
@@ -3162,6 +3361,25 @@ vectorf Population::indInfo(const uintString & field, vspID subPopID)
 		"This operation is not allowed when there is an activated virtual subpopulation");
 	vspID subPop = subPopID.resolve(*this);
 	size_t idx = field.empty() ? field.value() : infoIdx(field.name());
+	if (!subPop.isVirtual() && indOrdered()) {
+		// read the field directly from ordered information fields
+		CHECKRANGEINFO(idx);
+		size_t is = infoSize();
+		size_t begin = 0;
+		size_t end = popSize();
+		if (subPop.valid()) {
+			CHECKRANGESUBPOP(subPop.subPop());
+			begin = subPopBegin(subPop.subPop());
+			end = subPopEnd(subPop.subPop());
+		}
+		vectorf ret(end - begin);
+		if (!ret.empty()) {
+			const double * ptr = &m_info[0] + begin * is + idx;
+			for (size_t i = 0; i < ret.size(); ++i)
+				ret[i] = ptr[i * is];
+		}
+		return ret;
+	}
 	vectorf ret;
 	if (subPop.valid()) {
 		activateVirtualSubPop(subPop);
@@ -3183,8 +3401,69 @@ vectorf Population::indInfo(const uintString & field, vspID subPopID)
 }
 
 
+PyObject * Population::infoArray(vspID subPopID)
+{
+	DBG_WARNIF(true, "The returned object of function Population.infoArray() is a memoryview "
+		             "that reflects the underlying information fields of a population. It will "
+		             "become invalid once the population changes. Please use numpy.array(pop.infoArray()) "
+		             "if you would like to keep a copy of information fields");
+
+	vspID vsp = subPopID.resolve(*this);
+
+	DBG_FAILIF(vsp.isVirtual(), ValueError,
+		"Function infoArray currently does not support virtual subpopulation");
+	DBG_FAILIF(hasActivatedVirtualSubPop(), ValueError,
+		"This operation is not allowed when there is an activated virtual subpopulation");
+
+	size_t is = infoSize();
+	size_t begin = 0;
+	vectoru shape(2, is);
+	shape[0] = popSize();
+	if (vsp.valid()) {
+		CHECKRANGESUBPOP(vsp.subPop());
+		begin = subPopBegin(vsp.subPop());
+		shape[0] = subPopSize(vsp.subPop());
+	}
+	vectoru strides(2, 1);
+	strides[0] = is;
+	syncIndPointers();
+	return Info_Vec_As_NumArray(m_info.empty() ? NULL : &m_info[0] + begin * is, shape, strides);
+}
+
+
+PyObject * Population::indInfoArray(const uintString & field, vspID subPopID)
+{
+	DBG_WARNIF(true, "The returned object of function Population.indInfoArray() is a memoryview "
+		             "that reflects the underlying information field of a population. It will "
+		             "become invalid once the population changes. Please use pop.indInfo(field) "
+		             "if you would like to keep a copy of information field");
+
+	vspID vsp = subPopID.resolve(*this);
+
+	DBG_FAILIF(vsp.isVirtual(), ValueError,
+		"Function indInfoArray currently does not support virtual subpopulation");
+	DBG_FAILIF(hasActivatedVirtualSubPop(), ValueError,
+		"This operation is not allowed when there is an activated virtual subpopulation");
+
+	size_t idx = field.empty() ? field.value() : infoIdx(field.name());
+	CHECKRANGEINFO(idx);
+	size_t is = infoSize();
+	size_t begin = 0;
+	vectoru shape(1, popSize());
+	if (vsp.valid()) {
+		CHECKRANGESUBPOP(vsp.subPop());
+		begin = subPopBegin(vsp.subPop());
+		shape[0] = subPopSize(vsp.subPop());
+	}
+	syncIndPointers();
+	return Info_Vec_As_NumArray(m_info.empty() ? NULL : &m_info[0] + begin * is + idx,
+		shape, vectoru(1, is));
+}
+
+
 void Population::addInfoFields(const stringList & fieldList, double init)
 {
+	invalidateIDIndex();
 	const vectorstr & fields = fieldList.elems();
 
 	DBG_ASSERT(m_info.size() == infoSize() * popSize(), SystemError,
@@ -3240,6 +3519,7 @@ void Population::addInfoFields(const stringList & fieldList, double init)
 
 void Population::setInfoFields(const stringList & fieldList, double init)
 {
+	invalidateIDIndex();
 	const vectorstr & fields = fieldList.elems();
 
 	setGenoStructure(gsSetInfoFields(fields));
@@ -3262,6 +3542,7 @@ void Population::setInfoFields(const stringList & fieldList, double init)
 
 void Population::removeInfoFields(const stringList & fieldList)
 {
+	invalidateIDIndex();
 	const vectorstr & fields = fieldList.elems();
 
 	if (fields.size() == 0)
@@ -3306,6 +3587,7 @@ void Population::removeInfoFields(const stringList & fieldList)
 void Population::updateInfoFieldsFrom(const stringList & fieldList, const Population & pop,
                                       const stringList & fromFieldList, const uintList & ancGens)
 {
+	invalidateIDIndex();
 	const vectorstr & fields = fieldList.elems();
 	const vectorstr & fromFields = fromFieldList.elems();
 
@@ -3346,9 +3628,26 @@ void Population::setIndInfo(const floatList & valueList, const uintString &
 	size_t idx = field.empty() ? field.value() : infoIdx(field.name());
 
 	CHECKRANGEINFO(idx);
+	if (idx == m_idIndexField)
+		invalidateIDIndex();
 	const vectorf & values = valueList.elems();
 	size_t valueSize = values.size();
-	if (subPop.valid()) {
+	if (!subPop.isVirtual() && !hasActivatedVirtualSubPop() && indOrdered()) {
+		// write the field directly to ordered information fields
+		size_t is = infoSize();
+		size_t begin = 0;
+		size_t end = popSize();
+		if (subPop.valid()) {
+			CHECKRANGESUBPOP(subPop.subPop());
+			begin = subPopBegin(subPop.subPop());
+			end = subPopEnd(subPop.subPop());
+		}
+		if (end > begin) {
+			double * ptr = &m_info[0] + begin * is + idx;
+			for (size_t i = 0; i < end - begin; ++i)
+				ptr[i * is] = values[i % valueSize];
+		}
+	} else if (subPop.valid()) {
 		activateVirtualSubPop(subPop);
 		IndInfoIterator ptr = infoBegin(idx, subPop);
 		for (size_t i = 0; ptr != infoEnd(idx, subPop); ++ptr, ++i)
@@ -3381,6 +3680,7 @@ void Population::markIndividuals(vspID subPop, bool mark) const
 // set ancestral depth, can be -1
 void Population::setAncestralDepth(int depth)
 {
+	invalidateIDIndex();
 	// just to make sure.
 	useAncestralGen(0);
 	//
@@ -3398,6 +3698,7 @@ void Population::setAncestralDepth(int depth)
 
 void Population::keepAncestralGens(const uintList & ancGens)
 {
+	invalidateIDIndex();
 	if (ancGens.allAvail())
 		return;
 
@@ -3586,8 +3887,11 @@ void Population::save(boost::archive::text_oarchive & ar, const unsigned int ver
 		ar & has_lineage;
 		if (has_lineage == 1)
 			ar & single_lineage;
-		else
-			ar & m_lineage;
+		else {
+			// archive as std::vector<long> to keep the text format
+			vectori lineage(m_lineage.begin(), m_lineage.end());
+			ar & lineage;
+		}
 	} else {
 		int has_lineage = 0;
 		ar & has_lineage;
@@ -3701,8 +4005,10 @@ void Population::save(boost::archive::text_oarchive & ar, const unsigned int ver
 			ar & has_lineage;
 			if (has_lineage == 1)
 				ar & single_lineage;
-			else
-				ar & m_lineage;
+			else {
+				vectori lineage(m_lineage.begin(), m_lineage.end());
+				ar & lineage;
+			}
 		} else {
 			int has_lineage = 0;
 			ar & has_lineage;
@@ -3846,7 +4152,7 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 			}
 		} else {
 			DBG_DO(DBG_POPULATION, cerr << "Load mutant from long. " << endl);
-			vectora data;
+			std::vector<Allele> data;
 			ar & data;
 			m_genotype.resize(data.size());
 			for (size_t i = 0; i < data.size(); ++i)
@@ -3870,8 +4176,10 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 		}                                                                                   // if ma == 1
 		else {                                                                              // for non-binary types, ...
 			DBG_DO(DBG_POPULATION, cerr << "Load long from long. " << endl);
-			// long from long
-			ar & m_genotype;
+			// long from long, archived as std::vector<Allele>
+			std::vector<Allele> data;
+			ar & data;
+			m_genotype.assign(data.begin(), data.end());
 		}
 #endif
 	}
@@ -3881,7 +4189,9 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 #ifdef LINEAGE
 		if (has_lineage == 2) {
 			DBG_DO(DBG_POPULATION, cerr << "Handling lineage" << endl);
-			ar & m_lineage;
+			vectori lineage;
+			ar & lineage;
+			m_lineage.assign(lineage.begin(), lineage.end());
 		} else if (has_lineage == 1) {
 			long lin_value = 0;
 			ar & lin_value;
@@ -4066,7 +4376,7 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 				}
 			} else {
 				DBG_DO(DBG_POPULATION, cerr << "Load mutant from long. " << endl);
-				vectora data;
+				std::vector<Allele> data;
 				ar & data;
 				for (size_t i = 0; i < data.size(); ++i) {
 					if (data[i] != 0)
@@ -4089,7 +4399,9 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 			} else {
 				DBG_DO(DBG_POPULATION, cerr << "Load long from long. " << endl);
 				// long type from long type.
-				ar & pd.m_genotype;
+				std::vector<Allele> data;
+				ar & data;
+				pd.m_genotype.assign(data.begin(), data.end());
 			}
 #endif
 		}
@@ -4099,7 +4411,9 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 #ifdef LINEAGE
 			if (has_lineage == 2) {
 				DBG_DO(DBG_POPULATION, cerr << "Handling lineage" << endl);
-				ar & pd.m_lineage;
+				vectori lineage;
+				ar & lineage;
+				pd.m_lineage.assign(lineage.begin(), lineage.end());
 			} else if (has_lineage == 1) {
 				long lin_value = 0;
 				ar & lin_value;
@@ -4162,8 +4476,328 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 }
 
 
-void Population::save(const string & filename) const
+// Layout of a population saved in binary format:
+//
+//    magic number (8 bytes), format version (8 bytes)
+//    a block with module type, a block with a text archive of genotypic
+//    structure and number of ancestral generations, then for each generation
+//    a text-archived block with subpopulation sizes and names, and raw
+//    blocks for genotype, lineage, information fields and individual flags,
+//    followed by a block with pickled population variables.
+//
+// Each block starts with its size in bytes (8 bytes) and is padded to a
+// multiple of 8 bytes so that raw blocks are aligned in the mapped file.
+static const char BinaryPopMagic[8] = { 'S', 'I', 'M', 'U', 'P', 'O', 'P', 'B' };
+static const uint64_t BinaryPopVersion = 1;
+
+#ifdef LONGALLELE
+#  define BINARY_POP_MODULE "long"
+#elif defined BINARYALLELE
+#  define BINARY_POP_MODULE "binary"
+#elif defined MUTANTALLELE
+#  define BINARY_POP_MODULE "mutant"
+#elif defined LINEAGE
+#  define BINARY_POP_MODULE "lineage"
+#else
+#  define BINARY_POP_MODULE "short"
+#endif
+
+static void writeBinaryBlock(std::ostream & out, const void * data, size_t bytes)
+{
+	static const char padding[8] = { 0, 0, 0, 0, 0, 0, 0, 0 };
+	uint64_t sz = bytes;
+
+	out.write(reinterpret_cast<const char *>(&sz), sizeof(sz));
+	if (bytes > 0)
+		out.write(reinterpret_cast<const char *>(data), bytes);
+	if (bytes % 8 != 0)
+		out.write(padding, 8 - bytes % 8);
+}
+
+
+static const char * readBinaryBlock(const char *& cur, const char * end, size_t & bytes)
+{
+	uint64_t sz = 0;
+
+	if (end - cur < static_cast<std::ptrdiff_t>(sizeof(sz)))
+		throw ValueError("Unexpected end of binary population file.");
+	memcpy(&sz, cur, sizeof(sz));
+	cur += sizeof(sz);
+	size_t padded = sz % 8 == 0 ? sz : sz + 8 - sz % 8;
+	if (static_cast<size_t>(end - cur) < padded)
+		throw ValueError("Unexpected end of binary population file.");
+	const char * data = cur;
+	cur += padded;
+	bytes = sz;
+	return data;
+}
+
+
+void Population::saveBinaryGen(std::ostream & out) const
+{
+	std::ostringstream meta;
+	{
+		boost::archive::text_oarchive ar(meta);
+		ar & m_subPopSize;
+		ar & m_subPopNames;
+	}
+	const string & metaStr = meta.str();
+	writeBinaryBlock(out, metaStr.data(), metaStr.size());
+
+	// genotype
+#ifdef MUTANTALLELE
+	uint64_t genoSize = m_genotype.size();
+	writeBinaryBlock(out, &genoSize, sizeof(genoSize));
+	const vectorm::storage & mutants = m_genotype.data();
+	vector<uint64_t> mutLoc;
+	vectora mutVal;
+	mutLoc.reserve(mutants.size());
+	mutVal.reserve(mutants.size());
+	vectorm::const_val_iterator it = mutants.begin();
+	vectorm::const_val_iterator it_end = mutants.end();
+	for (; it != it_end; ++it) {
+		mutLoc.push_back(it->first);
+		mutVal.push_back(it->second);
+	}
+	writeBinaryBlock(out, mutLoc.empty() ? NULL : &mutLoc[0], mutLoc.size() * sizeof(uint64_t));
+	writeBinaryBlock(out, mutVal.empty() ? NULL : &mutVal[0], mutVal.size() * sizeof(Allele));
+#elif defined BINARYALLELE
+	uint64_t genoSize = m_genotype.size();
+	writeBinaryBlock(out, &genoSize, sizeof(genoSize));
+	ConstGenoIterator it = m_genotype.begin();
+	writeBinaryBlock(out, m_genotype.empty() ? NULL : BITPTR(it),
+		(m_genotype.size() + WORDBIT - 1) / WORDBIT * sizeof(WORDTYPE));
+#else
+	writeBinaryBlock(out, m_genotype.empty() ? NULL : &m_genotype[0], m_genotype.size() * sizeof(Allele));
+#endif
+
+	// lineage
+#ifdef LINEAGE
+	writeBinaryBlock(out, m_lineage.empty() ? NULL : &m_lineage[0], m_lineage.size() * sizeof(long));
+#else
+	writeBinaryBlock(out, NULL, 0);
+#endif
+
+	// information fields
+	writeBinaryBlock(out, m_info.empty() ? NULL : &m_info[0], m_info.size() * sizeof(double));
+
+	// sex and affection status
+	vector<unsigned char> flags(m_inds.size(), 0);
+	for (size_t i = 0; i < m_inds.size(); ++i)
+		flags[i] = (m_inds[i].sex() == FEMALE ? 1 : 0) | (m_inds[i].affected() ? 2 : 0);
+	writeBinaryBlock(out, flags.empty() ? NULL : &flags[0], flags.size());
+}
+
+
+void Population::loadBinaryGen(popData & pd, const char *& cur, const char * end) const
 {
+	size_t bytes = 0;
+	const char * data = readBinaryBlock(cur, end, bytes);
+
+	{
+		std::istringstream meta(string(data, bytes));
+		boost::archive::text_iarchive ar(meta);
+		ar & pd.m_subPopSize;
+		ar & pd.m_subPopNames;
+	}
+	size_t popSize = accumulate(pd.m_subPopSize.begin(), pd.m_subPopSize.end(), size_t(0));
+	size_t step = genoSize();
+	size_t infoStep = infoSize();
+
+	// genotype
+#ifdef MUTANTALLELE
+	uint64_t size = 0;
+	data = readBinaryBlock(cur, end, bytes);
+	if (bytes != sizeof(size))
+		throw ValueError("Corrupted genotype block in binary population file.");
+	memcpy(&size, data, sizeof(size));
+	pd.m_genotype.resize(size);
+	const char * locData = readBinaryBlock(cur, end, bytes);
+	size_t numMutants = bytes / sizeof(uint64_t);
+	const char * valData = readBinaryBlock(cur, end, bytes);
+	if (bytes != numMutants * sizeof(Allele))
+		throw ValueError("Corrupted genotype block in binary population file.");
+	uint64_t loc = 0;
+	for (size_t i = 0; i < numMutants; ++i) {
+		memcpy(&loc, locData + i * sizeof(uint64_t), sizeof(uint64_t));
+		pd.m_genotype.push_back(loc, reinterpret_cast<const Allele *>(valData)[i]);
+	}
+#elif defined BINARYALLELE
+	uint64_t size = 0;
+	data = readBinaryBlock(cur, end, bytes);
+	if (bytes != sizeof(size))
+		throw ValueError("Corrupted genotype block in binary population file.");
+	memcpy(&size, data, sizeof(size));
+	pd.m_genotype.resize(size);
+	data = readBinaryBlock(cur, end, bytes);
+	if (bytes != (size + WORDBIT - 1) / WORDBIT * sizeof(WORDTYPE))
+		throw ValueError("Corrupted genotype block in binary population file.");
+	if (size > 0) {
+		GenoIterator it = pd.m_genotype.begin();
+		memcpy(BITPTR(it), data, bytes);
+	}
+#else
+	data = readBinaryBlock(cur, end, bytes);
+	pd.m_genotype.resize(bytes / sizeof(Allele));
+	if (bytes > 0)
+		memcpy(&pd.m_genotype[0], data, bytes);
+#endif
+	if (pd.m_genotype.size() != popSize * step)
+		throw ValueError("Corrupted genotype block in binary population file.");
+
+	// lineage
+	data = readBinaryBlock(cur, end, bytes);
+#ifdef LINEAGE
+	pd.m_lineage.resize(pd.m_genotype.size(), 0);
+	if (bytes == pd.m_lineage.size() * sizeof(long)) {
+		if (bytes > 0)
+			memcpy(&pd.m_lineage[0], data, bytes);
+	} else if (bytes != 0)
+		throw ValueError("Corrupted lineage block in binary population file.");
+#endif
+
+	// information fields
+	data = readBinaryBlock(cur, end, bytes);
+	if (bytes != popSize * infoStep * sizeof(double))
+		throw ValueError("Corrupted information block in binary population file.");
+	pd.m_info.resize(popSize * infoStep);
+	if (bytes > 0)
+		memcpy(&pd.m_info[0], data, bytes);
+
+	// individuals
+	data = readBinaryBlock(cur, end, bytes);
+	if (bytes != popSize)
+		throw ValueError("Corrupted individual block in binary population file.");
+	pd.m_inds.resize(popSize);
+	GenoIterator ptr = pd.m_genotype.begin();
+	InfoIterator infoPtr = pd.m_info.begin();
+	for (size_t i = 0; i < popSize; ++i, ptr += step, infoPtr += infoStep) {
+		Individual & ind = pd.m_inds[i];
+		ind.setGenoStruIdx(genoStruIdx());
+		ind.setGenoPtr(ptr);
+		ind.setInfoPtr(infoPtr);
+		ind.setSex((data[i] & 1) ? FEMALE : MALE);
+		ind.setAffected((data[i] & 2) != 0);
+	}
+#ifdef LINEAGE
+	LineageIterator lineagePtr = pd.m_lineage.begin();
+	for (size_t i = 0; i < popSize; ++i, lineagePtr += step)
+		pd.m_inds[i].setLineagePtr(lineagePtr);
+#endif
+	pd.m_indOrdered = true;
+}
+
+
+void Population::saveBinary(const string & filename) const
+{
+	std::ofstream out(filename.c_str(), std::ios::binary | std::ios::trunc);
+
+	if (!out)
+		throw ValueError("Cannot write to file " + filename);
+
+	out.write(BinaryPopMagic, sizeof(BinaryPopMagic));
+	out.write(reinterpret_cast<const char *>(&BinaryPopVersion), sizeof(BinaryPopVersion));
+
+	string module = (boost::format("%1%_%2%") % BINARY_POP_MODULE % (sizeof(long) * 8)).str();
+	writeBinaryBlock(out, module.data(), module.size());
+
+	std::ostringstream meta;
+	{
+		boost::archive::text_oarchive ar(meta);
+		ar & genoStru();
+		ar & m_ancestralGens;
+		size_t na = m_ancestralPops.size();
+		ar & na;
+	}
+	const string & metaStr = meta.str();
+	writeBinaryBlock(out, metaStr.data(), metaStr.size());
+
+	// all generations, starting from the current one
+	for (size_t gen = 0; gen <= m_ancestralPops.size(); ++gen) {
+		const_cast<Population *>(this)->useAncestralGen(gen);
+		syncIndPointers();
+		saveBinaryGen(out);
+	}
+	const_cast<Population *>(this)->useAncestralGen(0);
+
+	string vars = varsAsString(true);
+	writeBinaryBlock(out, vars.data(), vars.size());
+	if (!out)
+		throw ValueError("Failed to save population to file " + filename);
+}
+
+
+void Population::loadBinary(const string & filename)
+{
+	boost::iostreams::mapped_file_source src;
+
+	try {
+		src.open(filename);
+	} catch (const std::exception & e) {
+		throw ValueError("Can not open file " + filename + " (" + e.what() + ")");
+	}
+
+	const char * cur = src.data() + sizeof(BinaryPopMagic) + sizeof(BinaryPopVersion);
+	const char * end = src.data() + src.size();
+	if (end < cur)
+		throw ValueError("Unexpected end of binary population file.");
+	uint64_t version = 0;
+	memcpy(&version, src.data() + sizeof(BinaryPopMagic), sizeof(version));
+	if (version > BinaryPopVersion)
+		throw ValueError((boost::format("Binary population format version %1% is not supported by this version of simuPOP.")
+			              % version).str());
+
+	size_t bytes = 0;
+	const char * data = readBinaryBlock(cur, end, bytes);
+	string module = (boost::format("%1%_%2%") % BINARY_POP_MODULE % (sizeof(long) * 8)).str();
+	if (string(data, bytes) != module)
+		throw ValueError("Population saved in binary format by module " + string(data, bytes) +
+			" cannot be loaded by module " + module + ". Please save the population in text format "
+			"to transfer it between modules and platforms.");
+
+	GenoStructure stru;
+	size_t na = 0;
+	data = readBinaryBlock(cur, end, bytes);
+	{
+		std::istringstream meta(string(data, bytes));
+		boost::archive::text_iarchive ar(meta);
+		ar & stru;
+		ar & m_ancestralGens;
+		ar & na;
+	}
+	this->setGenoStructure(stru);
+
+	// current generation
+	popData pd;
+	loadBinaryGen(pd, cur, end);
+	pd.swap(*this);
+	m_popSize = m_inds.size();
+	setSubPopStru(m_subPopSize, m_subPopNames);
+
+	// ancestral generations
+	m_ancestralPops.clear();
+	for (size_t ap = 0; ap < na; ++ap) {
+		// fill in place because copying popData invalidates genotype pointers
+		m_ancestralPops.push_back(popData());
+		loadBinaryGen(m_ancestralPops.back(), cur, end);
+	}
+	m_curAncestralGen = 0;
+
+	data = readBinaryBlock(cur, end, bytes);
+	varsFromString(string(data, bytes), true);
+	setIndOrdered(true);
+}
+
+
+void Population::save(const string & filename, const string & format) const
+{
+	if (format == "binary") {
+		saveBinary(filename);
+		return;
+	}
+	if (format != "text")
+		throw ValueError("Unsupported population format " + format + ". Please use 'text' or 'binary'.");
+
 	boost::iostreams::filtering_ostream ofs;
 
 	// compress output
@@ -4184,6 +4818,19 @@ void Population::save(const string & filename) const
 
 void Population::load(const string & filename)
 {
+	// check if the file is saved in binary format
+	char magic[sizeof(BinaryPopMagic)] = { 0 };
+	{
+		std::ifstream in(filename.c_str(), std::ios::binary);
+		if (!in)
+			throw ValueError("Can not open file " + filename);
+		in.read(magic, sizeof(magic));
+	}
+	if (memcmp(magic, BinaryPopMagic, sizeof(magic)) == 0) {
+		loadBinary(filename);
+		return;
+	}
+
 	boost::iostreams::filtering_istream ifs;
 
 	ifs.push(boost::iostreams::gzip_decompressor());
@@ -4303,8 +4950,8 @@ void Population::syncIndPointers(bool infoOnly) const
 		vectora::iterator it = tmpGenotype.begin();
 #endif
 #ifdef LINEAGE
-		vectori tmpLineage(m_popSize * genoSize());
-		vectori::iterator lineagePtr = tmpLineage.begin();
+		vectorlin tmpLineage(m_popSize * genoSize());
+		vectorlin::iterator lineagePtr = tmpLineage.begin();
 #endif
 
 		vectorf tmpInfo(m_popSize * infoSize());
@@ -4334,6 +4981,12 @@ void Population::syncIndPointers(bool infoOnly) const
 		const_cast<Population *>(this)->m_genotype.swap(tmpGenotype);
 		const_cast<Population *>(this)->m_info.swap(tmpInfo);
 		LINEAGE_EXPR(const_cast<Population *>(this)->m_lineage.swap(tmpLineage));
+#ifdef MUTANTALLELE
+		// vectorm must be setGenoPtr after swap
+		it = const_cast<Population *>(this)->m_genotype.begin();
+		for (size_t i = 0; i < m_popSize; ++i, it += sz)
+			const_cast<Population *>(this)->m_inds[i].setGenoPtr(it);
+#endif
 	}
 	setIndOrdered(true);
 }
@@ -46,6 +46,14 @@ using std::equal_to;
 #include <deque>
 using std::deque;
 
+#if TR1_SUPPORT == 0
+#  include <map>
+#elif TR1_SUPPORT == 1
+#  include <unordered_map>
+#else
+#  include <tr1/unordered_map>
+#endif
+
 #include "boost_pch.hpp"
 #include "individual.h"
 #include "virtualSubPop.h"
@@ -292,14 +300,15 @@ public:
 		std::swap(m_vspSplitter, rhs.m_vspSplitter);
 		std::swap(rhs.m_gen, m_gen);
 		std::swap(rhs.m_rep, m_rep);
+		invalidateIDIndex();
+		rhs.invalidateIDIndex();
 #ifdef MUTANTALLELE
-		// vectorm must be setGenoPtr after swap
-		GenoIterator ptr = m_genotype.begin();
-		for (size_t i = 0; i < m_inds.size(); ++i, ptr += genoSize())
-			m_inds[i].setGenoPtr(ptr);
-		ptr = rhs.m_genotype.begin();
-		for (size_t i = 0; i < rhs.m_inds.size(); ++i, ptr += rhs.genoSize())
-			rhs.m_inds[i].setGenoPtr(ptr);
+		// vectorm must be setGenoPtr after swap. Individuals might not be in
+		// order so the location of their genotype has to be kept.
+		for (size_t i = 0; i < m_inds.size(); ++i)
+			m_inds[i].setGenoPtr(m_genotype.begin() + m_inds[i].genoPtr().index());
+		for (size_t i = 0; i < rhs.m_inds.size(); ++i)
+			rhs.m_inds[i].setGenoPtr(rhs.m_genotype.begin() + rhs.m_inds[i].genoPtr().index());
 #endif
 	}
 
@@ -606,14 +615,36 @@ public:
 	 *  parental generations) or \c UNSPECIFIED to search only the current
 	 *  generation. If no individual with \e id is found, an \c IndexError will
 	 *  be raised. A float \e id is acceptable as long as it rounds closely to
-	 *  an integer. Note that this function uses a dynamic searching algorithm
-	 *  which tends to be slow. If you need to look for multiple individuals
-	 *  from a static population, you might want to convert a population
-	 *  object to a pedigree object and use function <tt>Pedigree.indByID</tt>.
+	 *  an integer. Individuals are located through an index of IDs that is
+	 *  built when this function is first called, and is rebuilt only after
+	 *  individuals have been added, removed, reordered, or assigned new IDs
+	 *  by functions such as \c setIndInfo and operators such as \c IdTagger.
+	 *  Individuals whose IDs are changed directly through
+	 *  <tt>Individual.setInfo</tt> might not be found.
 	 *  <group>4-ind</group>
 	 */
 	Individual & indByID(double id, const uintList & ancGens = uintList(), const string & idField = "ind_id");
 
+	/** Return a list of individuals with \e IDs stored in information field
+	 *  \e idField (default to \c ind_id), searched in the present and all
+	 *  ancestral generations (default), or specified generations \e ancGens.
+	 *  This function is equivalent to, but much faster than, calling
+	 *  \c indByID for each ID. An \c IndexError will be raised if any of the
+	 *  individuals could not be found.
+	 *  <group>4-ind</group>
+	 */
+	PyObject * indsByIDs(const floatList & IDs, const uintList & ancGens = uintList(), const string & idField = "ind_id");
+
+	/** CPPONLY
+	 *  Mark the index of individual IDs as outdated. This function should be
+	 *  called by functions that change individuals or their IDs.
+	 */
+	void invalidateIDIndex()
+	{
+		++m_indEpoch;
+	}
+
+
 	/** CPPONLY: const version of the ind function.
 	 */
 	const Individual & individual(double idx, vspID subPop = vspID()) const
@@ -1050,7 +1081,11 @@ public:
 
 	/** Return an editable array of the genotype of all individuals in
 	 *  a population (if <tt>subPop=[]</tt>, default), or individuals in a
-	 *  subpopulation \e subPop. Virtual subpopulation is unsupported.
+	 *  subpopulation \e subPop. Virtual subpopulation is unsupported. The
+	 *  array supports the buffer interface with shape <tt>(individual, ploidy,
+	 *  locus)</tt> so <tt>numpy.asarray(pop.genotype())</tt> refers to the
+	 *  underlying genotype directly without copying (not available for binary
+	 *  and mutant modules).
 	 *  <group>5-genotype</group>
 	 */
 	PyObject * genotype(vspID subPop = vspID());
@@ -1069,7 +1104,9 @@ public:
 
 	/** Return an editable array of the lineage of alleles for all individuals in
 	 *  a population (if <tt>subPop=[]</tt>, default), or individuals in a
-	 *  subpopulation \e subPop. Virtual subpopulation is unsupported. <bf>
+	 *  subpopulation \e subPop. Virtual subpopulation is unsupported. Similar
+	 *  to \c genotype(), the array can be accessed through the buffer interface
+	 *  with shape <tt>(individual, ploidy, locus)</tt>. <bf>
 	 *  This function returns \c None for modules without lineage information.</bf>
 	 *  <group>5-genotype</group>
 	 */
@@ -1110,8 +1147,9 @@ public:
 	/** Rearrange individuals to their new subpopulations according to their
 	 *  integer values at information field \e field (value returned by
 	 *  <tt>Individual::info(field)</tt>). individuals with negative values
-	 *  at this \e field will be removed. Existing subpopulation names are
-	 *  kept. New subpopulations will have empty names.
+	 *  at this \e field will be removed. The relative order of individuals in
+	 *  each subpopulation is kept. Existing subpopulation names are kept. New
+	 *  subpopulations will have empty names.
 	 *  <group>7-manipulate</group>
 	 */
 	void setSubPopByIndInfo(const string & field);
@@ -1277,6 +1315,10 @@ public:
 	/// CPPONLY
 	Population & extractMarkedIndividuals() const;
 
+	/// CPPONLY extract individuals with sorted absolute indexes in the
+	/// current generation
+	Population & extractIndexedIndividuals(const vectoru & indexes) const;
+
 	/** Extract individuals with given absolute indexes (parameter \e indexes),
 	 *  IDs (parameter \e IDs, stored in information field \e idField,
 	 *  default to \c ind_id), or a filter function (parameter \e filter). If a
@@ -1299,6 +1341,20 @@ public:
 		const floatList & IDs = vectorf(), const string & idField = "ind_id",
 		PyObject * filter = NULL) const;
 
+	/** Extract several sets of individuals and return a list of populations,
+	 *  one for each set. Sets of individuals can be specified as lists of
+	 *  absolute indexes in the present generation (parameter \e indexes), or
+	 *  lists of IDs (parameter \e IDs, stored in information field
+	 *  \e idField, default to \c ind_id). The returned populations are the
+	 *  same as those returned by calling \c extractIndividuals for each set,
+	 *  but this function locates individuals with a single index that is
+	 *  shared by all sets so it is much faster if many samples are extracted
+	 *  from a large population.
+	 *  <group>7-manipulate</group>
+	 */
+	PyObject * extractIndividualSets(const intMatrix & indexes = intMatrix(),
+		const floatMatrix & IDs = floatMatrix(), const string & idField = "ind_id") const;
+
 	/** Extract subsets of individuals, loci and/or information fields from the
 	 *  current population and create a new population. By default, all
 	 *  genotypes and information fields for all individuals in all ancestral
@@ -1484,6 +1540,34 @@ public:
 	vectorf indInfo(const uintString & field, vspID subPop = vspID());
 
 
+	/** Return an editable array of the values of all information fields of
+	 *  all individuals (if <tt>subPop=[]</tt>, default), or individuals in a
+	 *  subpopulation \e subPop. Virtual subpopulation is unsupported. The
+	 *  returned object is a two-dimensional \c memoryview of shape
+	 *  <tt>(individual, field)</tt> that refers directly to the underlying
+	 *  storage so that <tt>numpy.asarray(pop.infoArray())</tt> does not copy
+	 *  data and changes to the array are reflected in the population. Values
+	 *  of a field can be accessed as <tt>arr[:, pop.infoIdx(field)]</tt>.
+	 *  Similar to \c genotype(), the returned array becomes invalid once the
+	 *  population changes.
+	 *  <group>8-info</group>
+	 */
+	PyObject * infoArray(vspID subPop = vspID());
+
+
+	/** Return an editable one-dimensional array of the values of information
+	 *  field \e field (by index or name) of all individuals (if
+	 *  <tt>subPop=[]</tt>, default), or individuals in a subpopulation
+	 *  \e subPop. Unlike \c indInfo(), which returns a copy of the values,
+	 *  the returned \c memoryview refers directly to the underlying storage
+	 *  so <tt>numpy.asarray(pop.indInfoArray('fitness'))</tt> can be used to
+	 *  read or write a field without copying. Virtual subpopulation is
+	 *  unsupported and the array becomes invalid once the population changes.
+	 *  <group>8-info</group>
+	 */
+	PyObject * indInfoArray(const uintString & field, vspID subPop = vspID());
+
+
 	/** Add a list of information fields \e fields to a population and
 	 *  initialize their values to \e init. If an information field alreay
 	 *  exists, it will be re-initialized.
@@ -1549,10 +1633,17 @@ public:
 	void syncIndPointers(bool infoOnly = false) const;
 
 	/** Save population to a file \e filename, which can be loaded by a global
-	 *  function <tt>loadPopulation(filename)</tt>.
+	 *  function <tt>loadPopulation(filename)</tt>. By default (<tt>format='text'</tt>),
+	 *  the population is saved as a compressed text archive that can be loaded
+	 *  by all simuPOP modules on all platforms. If \e format is set to
+	 *  \c 'binary', genotype, lineage, information fields and individual
+	 *  flags of all generations are written as raw memory blocks, which is
+	 *  much faster to save and load for large populations but can only be
+	 *  loaded by the same type of simuPOP module on a platform with the same
+	 *  word size. <tt>loadPopulation</tt> detects the format automatically.
 	 *  <group>8-pop</group>
 	 */
-	void save(const string & filename) const;
+	void save(const string & filename, const string & format = "text") const;
 
 	/** CPPONLY load Population from file \e filename
 	 *  <group>8-pop</group>
@@ -1638,6 +1729,21 @@ private:
 
 	BOOST_SERIALIZATION_SPLIT_MEMBER();
 
+	/// save population in binary format
+	void saveBinary(const string & filename) const;
+
+	/// load population from a file in binary format
+	void loadBinary(const string & filename);
+
+	/// individuals of ancestral generation gen (0 for the present generation)
+	vector<Individual> & ancestralInds(size_t gen);
+
+	/// build an index of individuals by IDs stored in information field field
+	void buildIDIndex(size_t field);
+
+	/// find an individual with id in ancestral generations gens
+	Individual * findIndByID(size_t id, const vectoru & gens, size_t field);
+
 private:
 	/// population size: number of individual
 	size_t m_popSize;
@@ -1662,7 +1768,7 @@ private:
 #endif
 
 #ifdef LINEAGE
-	vectori m_lineage;
+	vectorlin m_lineage;
 #endif
 
 	/// information
@@ -1691,7 +1797,7 @@ private:
 #endif
 
 #ifdef LINEAGE
-		vectori m_lineage;
+		vectorlin m_lineage;
 #endif
 
 		vectorf m_info;
@@ -1703,6 +1809,12 @@ private:
 
 	};
 
+	/// write blocks of the current generation to a binary file
+	void saveBinaryGen(std::ostream & out) const;
+
+	/// read blocks of one generation from a mapped binary file
+	void loadBinaryGen(popData & pd, const char *& cur, const char * end) const;
+
 	std::deque<popData> m_ancestralPops;
 
 	/// current ancestral depth
@@ -1715,6 +1827,27 @@ private:
 	mutable size_t m_gen;
 	mutable size_t m_rep;
 
+	/// locations (ancestral generation and index) of individuals by their
+	/// IDs, built and validated by indByID and indsByIDs
+#if TR1_SUPPORT == 0
+	typedef std::map<size_t, pairu> IdIndex;
+#elif TR1_SUPPORT == 1
+	typedef std::unordered_map<size_t, pairu> IdIndex;
+#else
+	typedef std::tr1::unordered_map<size_t, pairu> IdIndex;
+#endif
+	IdIndex m_idIndex;
+
+	/// information field used to build m_idIndex
+	size_t m_idIndexField;
+
+	/// number of times individuals have been added, removed, reordered or
+	/// assigned new IDs
+	ULONG m_indEpoch;
+
+	/// value of m_indEpoch when m_idIndex was built
+	ULONG m_idIndexEpoch;
+
 public:
 	/** CPPONLY
 	 *  current replicate in a simulator which is not meaningful for a stand-alone population
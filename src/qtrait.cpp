@@ -47,6 +47,7 @@ bool BaseQuanTrait::apply(Population & pop) const
 
 	size_t oldGen = pop.curAncestralGen();
 	vectorf traits(infoSize());
+	vector<Individual *> inds;
 	for (unsigned genIdx = 0; genIdx < gens.size(); ++genIdx) {
 		pop.useAncestralGen(gens[genIdx]);
 
@@ -59,10 +60,22 @@ bool BaseQuanTrait::apply(Population & pop) const
 				pop.activateVirtualSubPop(*sp);
 
 			IndIterator ind = pop.indIterator(sp->subPop());
-			for (; ind.valid(); ++ind) {
-				qtrait(&*ind, pop.gen(), traits);
-				for (size_t i = 0; i < infoSize(); ++i)
-					ind->setInfo(traits[i], infoIdx[i]);
+			if (batchSize() > 0) {
+				while (ind.valid()) {
+					inds.clear();
+					for (; ind.valid() && inds.size() < batchSize(); ++ind)
+						inds.push_back(&*ind);
+					blockQtrait(pop, inds, traits);
+					for (size_t i = 0; i < inds.size(); ++i)
+						for (size_t j = 0; j < infoSize(); ++j)
+							inds[i]->setInfo(traits[i * infoSize() + j], infoIdx[j]);
+				}
+			} else {
+				for (; ind.valid(); ++ind) {
+					qtrait(&*ind, pop.gen(), traits);
+					for (size_t i = 0; i < infoSize(); ++i)
+						ind->setInfo(traits[i], infoIdx[i]);
+				}
 			}
 
 			if (sp->isVirtual())
@@ -74,6 +87,19 @@ bool BaseQuanTrait::apply(Population & pop) const
 }
 
 
+void BaseQuanTrait::blockQtrait(Population & pop, const vector<Individual *> & inds,
+                                vectorf & traits) const
+{
+	vectorf values(infoSize());
+
+	traits.clear();
+	for (size_t i = 0; i < inds.size(); ++i) {
+		qtrait(inds[i], pop.gen(), values);
+		traits.insert(traits.end(), values.begin(), values.end());
+	}
+}
+
+
 bool BaseQuanTrait::applyDuringMating(Population & pop, Population & offPop, RawIndIterator offspring,
                                       Individual * /* dad */, Individual * /* mom */) const
 
@@ -90,32 +116,56 @@ bool BaseQuanTrait::applyDuringMating(Population & pop, Population & offPop, Raw
 }
 
 
+void PyQuanTrait::blockQtrait(Population & pop, const vector<Individual *> & inds,
+                              vectorf & traits) const
+{
+	batchCall(m_func, &pop, pop.gen(), m_loci, inds, infoSize(), traits);
+}
+
+
 void PyQuanTrait::qtrait(Individual * ind, size_t gen, vectorf & traits) const
 {
-	PyObject * args = PyTuple_New(m_func.numArgs());
-
-	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
-
-	for (size_t i = 0; i < m_func.numArgs(); ++i) {
-		const string & arg = m_func.arg(i);
-		if (arg == "ind")
-			PyTuple_SET_ITEM(args, i, pyIndObj(static_cast<void *>(ind)));
-		else if (arg == "geno")
-			PyTuple_SET_ITEM(args, i, ind->genoAtLoci(m_loci));
-		else if (arg == "mut")
-			PyTuple_SET_ITEM(args, i, ind->mutAtLoci(m_loci));
-		else if (arg == "gen")
-			PyTuple_SET_ITEM(args, i, PyInt_FromLong(static_cast<long>(gen)));
-		else {
-			DBG_FAILIF(!ind->hasInfoField(arg), ValueError,
-				"Only parameters 'ind', 'geno', 'gen', and names of information fields are "
-				"acceptable in function " + m_func.name());
-			PyTuple_SET_ITEM(args, i, PyFloat_FromDouble(ind->info(arg)));
+	if (m_batchSize > 0) {
+		batchCall(m_func, NULL, gen, m_loci, vector<Individual *>(1, ind), infoSize(), traits);
+		return;
+	}
+
+	genoValueCache::Key key;
+
+	if (m_cache.enabled()) {
+		vector<ULONG> geno;
+		ind->allelesAtLoci(m_loci, geno);
+		m_cache.setKey(key, gen, geno);
+		const vectorf * values = m_cache.find(key);
+		if (values != NULL) {
+			traits = *values;
+			return;
+		}
+	}
+
+	m_args.initializeIfNeeded(*ind);
+	PyObject * args = m_args.tuple();
+
+	for (size_t i = 0; i < m_args.size(); ++i) {
+		switch (m_args.type(i)) {
+		case pyFuncArgs::IND_ARG:
+			m_args.setArg(i, pyIndObj(static_cast<void *>(ind)));
+			break;
+		case pyFuncArgs::GENO_ARG:
+			m_args.setArg(i, ind->genoAtLoci(m_loci));
+			break;
+		case pyFuncArgs::MUT_ARG:
+			m_args.setArg(i, ind->mutAtLoci(m_loci));
+			break;
+		case pyFuncArgs::GEN_ARG:
+			m_args.setArg(i, PyInt_FromLong(static_cast<long>(gen)));
+			break;
+		default:
+			m_args.setArg(i, PyFloat_FromDouble(ind->info(m_args.infoIdx(i))));
 		}
 	}
 
 	PyObject * res = PyEval_CallObject(m_func.func(), args);
-	Py_XDECREF(args);
 
 	if (res == NULL) {
 		PyErr_Print();
@@ -135,6 +185,8 @@ void PyQuanTrait::qtrait(Individual * ind, size_t gen, vectorf & traits) const
 	} else {
 		DBG_FAILIF(true, RuntimeError, "Invalid return value from penetrance function.");
 	}
+	if (m_cache.enabled())
+		m_cache.insert(key, traits);
 	return;
 }
 
@@ -99,6 +99,23 @@ public:
 	}
 
 
+	/** CPPONLY
+	 *  Number of individuals whose trait values are calculated together by
+	 *  \c blockQtrait, or 0 if they are calculated one by one.
+	 */
+	virtual size_t batchSize() const
+	{
+		return 0;
+	}
+
+
+	/** CPPONLY
+	 *  Calculate trait values of a block of individuals \e inds, which are
+	 *  saved individual by individual to \e traits.
+	 */
+	virtual void blockQtrait(Population & pop, const vector<Individual *> & inds,
+		vectorf & traits) const;
+
 	/// set \c qtrait to all individual
 	bool apply(Population & pop) const;
 
@@ -114,7 +131,7 @@ public:
 	}
 
 
-private:
+protected:
 	/// how to handle ancestral gen
 	const uintList m_ancGens;
 
@@ -147,15 +164,40 @@ public:
 	 *  number or a sequence of one element is acceptable. Otherwise, a
 	 *  sequence of values will be accepted and be assigned to each trait
 	 *  field.
+	 *
+	 *  If \e func accepts only parameters \c geno and \c gen, a positive
+	 *  \e cacheSize allows this operator to cache trait values of up to
+	 *  \e cacheSize genotypes (and generations) so that \e func is called
+	 *  only once for each distinct genotype. Least recently used values are
+	 *  removed when the cache is full. This should not be used if \e func
+	 *  returns random trait values.
+	 *
+	 *  If a positive \e batchSize is specified, \e func is called in batch
+	 *  mode for blocks of up to \e batchSize individuals. It then receives
+	 *  genotypes as a 2-d NumPy array with one row per individual (\c geno),
+	 *  values at information fields as NumPy arrays, and should return an
+	 *  array with one row of trait values for each individual (or a 1-d
+	 *  array if there is only one trait field). Individuals with different
+	 *  numbers of alleles at \e loci, such as males and females at loci on
+	 *  sex chromosomes, are passed in separate calls. Parameters \c ind and
+	 *  \c mut are not allowed in this mode.
 	 */
 	PyQuanTrait(PyObject * func, const lociList & loci = vectoru(),
 		const uintList ancGens = uintList(NULL), int begin = 0, int end = -1, int step = 1,
 		const intList & at = vectori(), const intList & reps = intList(), const subPopList & subPops = subPopList(),
-		const stringList & infoFields = vectorstr()) :
+		const stringList & infoFields = vectorstr(), size_t cacheSize = 0,
+		size_t batchSize = 0) :
 		BaseQuanTrait(ancGens, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func), m_loci(loci)
+		m_func(func), m_args(m_func, pyFuncArgs::IND_ARG | pyFuncArgs::GENO_ARG | pyFuncArgs::MUT_ARG |
+		                     pyFuncArgs::GEN_ARG),
+		m_loci(loci), m_cache(m_func, cacheSize), m_batchSize(batchSize)
 	{
 		DBG_ASSERT(m_func.isValid(), ValueError, "Passed variable is not a callable python function.");
+		if (m_batchSize > 0) {
+			if (cacheSize > 0)
+				throw ValueError("Trait values cannot be cached in batch mode.");
+			checkBatchFunc(m_func);
+		}
 
 	};
 
@@ -171,6 +213,17 @@ public:
 	 */
 	virtual void qtrait(Individual * ind, size_t gen, vectorf & traits) const;
 
+	/// CPPONLY
+	size_t batchSize() const
+	{
+		return m_batchSize;
+	}
+
+
+	/// CPPONLY
+	void blockQtrait(Population & pop, const vector<Individual *> & inds,
+		vectorf & traits) const;
+
 	/// HIDDEN
 	string describe(bool format = true) const
 	{
@@ -179,12 +232,30 @@ public:
 	}
 
 
+	/** Return a dictionary with numbers of \c hits and \c misses of the
+	 *  trait cache, number of cached values (\c size) and \c cacheSize.
+	 */
+	PyObject * cacheStats() const
+	{
+		return m_cache.stats();
+	}
+
+
 private:
 	/// user supplied python function
 	const pyFunc m_func;
 
+	/// arguments of m_func
+	const pyFuncArgs m_args;
+
 	/// susceptibility loci
 	const lociList m_loci;
+
+	/// cached trait values
+	const genoValueCache m_cache;
+
+	/// number of individuals passed to m_func in batch mode
+	const size_t m_batchSize;
 };
 
 }
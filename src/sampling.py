@@ -50,6 +50,13 @@ used to convert index based pedigree to ID based Pedigree. Note that
 populations because they require parents of each individual resides in a
 parental generation.
 
+If you would rather not keep ancestral generations, with their genotypes, in
+memory, operator ``PedigreeTagger`` can write the ID, parental IDs, sex,
+affection status and optionally information fields and genotypes of
+offspring to a file during evolution. A pedigree loaded from this file using
+function ``loadPedigree`` can be passed to all pedigree-based sampling
+functions in place of a multi-generational population.
+
 All sampling functions support virtual subpopulations through parameter
 ``subPops``, although sample size specification might vary. This feature
 allows you to draw samples with specified properties. For example, you
@@ -57,6 +64,15 @@ could select only female individuals for cases of a female-only disease,
 or select individuals within certain age-range. If you specify a list
 of (virtual) subpopulations, you are usually allowed to draw certain
 number of individuals from each subpopulation.
+
+A sampler object prepares a population (e.g. finds affected individuals or
+qualified families) before it draws the first sample, and reuses the
+preparation for later samples drawn from the same population, until the
+population evolves to another generation or changes in size. If you draw
+many samples, it is therefore more efficient to create a sampler and call
+its ``drawSample`` function repeatedly, or to draw all samples with function
+``drawSamples``, than calling functions such as ``drawCaseControlSample``
+repeatedly.
 """
 
 __all__ = [
@@ -91,9 +107,14 @@ __all__ = [
 from simuPOP import ALL_AVAIL, Pedigree, OUTBRED_SPOUSE, COMMON_OFFSPRING, FEMALE_ONLY, \
     MALE, AFFECTED, tagID, getRNG
 
-import random
-def random_shuffle(x):
-    random.shuffle(x, getRNG().randUniform)
+def random_sample(x, size):
+    '''Move ``size`` randomly selected items of list ``x`` to the front of
+    the list and return them.'''
+    size = min(size, len(x))
+    for i in range(size):
+        j = i + getRNG().randInt(len(x) - i)
+        x[i], x[j] = x[j], x[i]
+    return x[:size]
 
 def isSequence(obj):
     return hasattr(obj, '__iter__')
@@ -101,6 +122,10 @@ def isSequence(obj):
 def isNumber(obj):
     return isinstance(obj, (int, float))
 
+def populationState(pop):
+    '''Return values that change when a population evolves or changes in size.'''
+    return pop.vars().get('gen', None), pop.ancestralGens(), pop.subPopSizes()
+
 def indexToID(pop, idField='ind_id', fatherField='father_id', motherField='mother_id',
               fatherIndex='father_idx', motherIndex='mother_idx', reset=False):
     '''This function adds information field idField (default to ``'ind_id'``)
@@ -146,6 +171,15 @@ class BaseSampler:
         '''
         self.subPops=subPops
         self.pop = None
+        self.source = None
+
+    def prepared(self, pop):
+        '''Return ``True`` if the sampler has been prepared for population
+        ``pop`` and the population has not evolved to another generation or
+        changed in size since then.
+        '''
+        return self.pop is not None and self.source is not None and \
+            self.source[0] is pop and self.source[1] == populationState(pop)
 
     def prepareSample(self, pop, rearrange):
         '''Prepare passed population object for sampling according to parameter
@@ -159,6 +193,7 @@ class BaseSampler:
             self.pop = pop
         else:
             self.pop = pop.extractSubPops(self.subPops, rearrange)
+        self.source = pop, populationState(pop)
         return True
 
     def drawSample(self, pop):
@@ -186,22 +221,25 @@ class RandomSampler(BaseSampler):
         BaseSampler.__init__(self, subPops)
         self.sizes = sizes
 
-    def drawSample(self, input_pop):
-        '''Draw a random sample from passed population.
+    def prepareSample(self, input_pop):
+        '''Find out indexes of individuals from which samples are drawn.
+        '''
+        BaseSampler.prepareSample(self, input_pop, isSequence(self.sizes))
+        if not isSequence(self.sizes):
+            self.indexes = list(range(self.pop.popSize()))
+        else:
+            self.indexes = [list(range(self.pop.subPopBegin(sp), self.pop.subPopEnd(sp)))
+                for sp in range(self.pop.numSubPop())]
+
+    def drawIndexes(self):
+        '''Return indexes of randomly selected individuals.
         '''
-        if self.pop is None:
-            # this will produce self.pop.
-            self.prepareSample(input_pop, isSequence(self.sizes))
-        #
         if not isSequence(self.sizes):
             size = self.sizes
             if size > self.pop.popSize():
                 print('Warning: sample size %d is greater than population size %d.' % (size, self.pop.popSize()))
-                size = self.pop.popSize()
             # randomly choose size individuals
-            values = list(range(self.pop.popSize()))
-            random_shuffle(values)
-            indexes = values[:size]
+            return random_sample(self.indexes, size)
         else:
             indexes = []
             for sp in range(self.pop.numSubPop()):
@@ -209,10 +247,27 @@ class RandomSampler(BaseSampler):
                 if size > self.pop.subPopSize(sp):
                     print('Warning: sample size (%d) at subpopulation %d is greater than subpopulation size %d ' \
                         % (size, sp, self.pop.subPopSize(sp)))
-                values = list(range(self.pop.subPopBegin(sp), self.pop.subPopEnd(sp)))
-                random_shuffle(values)
-                indexes.extend(values[:size])
-        return self.pop.extractIndividuals(indexes = indexes)
+                indexes.extend(random_sample(self.indexes[sp], size))
+            return indexes
+
+    def drawSample(self, input_pop):
+        '''Draw a random sample from passed population.
+        '''
+        return self.drawSamples(input_pop, 1)[0]
+
+    def drawSamples(self, input_pop, numOfSamples):
+        '''Draw ``numOfSamples`` random samples from passed population and
+        return a list of populations.
+        '''
+        if numOfSamples < 0:
+            raise ValueError("Negative number of samples are unacceptable")
+        if numOfSamples == 0:
+            return []
+        if not self.prepared(input_pop):
+            # this will produce self.pop and self.indexes
+            self.prepareSample(input_pop)
+        #
+        return self.pop.extractIndividualSets(indexes = [self.drawIndexes() for x in range(numOfSamples)])
 
 
 def drawRandomSample(pop, sizes, subPops=ALL_AVAIL):
@@ -254,10 +309,6 @@ class CaseControlSampler(BaseSampler):
         '''Find out indexes all affected and unaffected individuales.
         '''
         BaseSampler.prepareSample(self, input_pop, isSequence(self.cases))
-        if self.pop is None:
-            # this will produce self.pop and self.cases and self.controls
-            self.prepareSample(input_pop)
-        #
         if not isSequence(self.cases):
             # find affected individuals
             self.affected = []
@@ -300,25 +351,37 @@ class CaseControlSampler(BaseSampler):
                 self.affected.append(aff)
                 self.unaffected.append(unaff)
 
+    def drawIndexes(self):
+        '''Return indexes of randomly selected cases and controls.
+        '''
+        if not isSequence(self.cases):
+            return random_sample(self.affected, self.cases) + \
+                random_sample(self.unaffected, self.controls)
+        else:
+            indexes = []
+            for sp in range(self.pop.numSubPop()):
+                indexes.extend(random_sample(self.affected[sp], self.cases[sp]))
+                indexes.extend(random_sample(self.unaffected[sp], self.controls[sp]))
+            return indexes
+
     def drawSample(self, input_pop):
         '''Draw a case control sample
         '''
-        if self.pop is None:
+        return self.drawSamples(input_pop, 1)[0]
+
+    def drawSamples(self, input_pop, numOfSamples):
+        '''Draw ``numOfSamples`` case control samples and return a list of
+        populations.
+        '''
+        if numOfSamples < 0:
+            raise ValueError("Negative number of samples are unacceptable")
+        if numOfSamples == 0:
+            return []
+        if not self.prepared(input_pop):
             # this will produce self.pop and self.affected and self.unaffected
             self.prepareSample(input_pop)
         #
-        if not isSequence(self.cases):
-            random_shuffle(self.affected)
-            random_shuffle(self.unaffected)
-            indexes = self.affected[:self.cases] + self.unaffected[:self.controls]
-        else:
-            indexes = []
-            for sp in range(self.pop.numSubPop()):
-                random_shuffle(self.affected[sp])
-                random_shuffle(self.unaffected[sp])
-                indexes.extend(self.affected[sp][:self.cases[sp]])
-                indexes.extend(self.unaffected[sp][:self.controls[sp]])
-        return self.pop.extractIndividuals(indexes = indexes)
+        return self.pop.extractIndividualSets(indexes = [self.drawIndexes() for x in range(numOfSamples)])
 
 
 def drawCaseControlSample(pop, cases, controls, subPops=ALL_AVAIL):
@@ -378,65 +441,91 @@ class PedigreeSampler(BaseSampler):
         # get self.pedigree
         self.pedigree = Pedigree(self.pop, loci, infoFields,
             ancGens, self.idField, self.fatherField, self.motherField)
-        # Your prepareSample should define selected_IDs, which should be the
+        # Your prepareSample should define selectedIDs, which should be the
         # anchor individuals of each Pedigree, typically father or grandfather.
-        # Other family members will be looked up through function self.family.
-        self.selected_IDs = []
+        # Other family members are located by following relative paths
+        # self.familyPaths (see Pedigree.drawFamilies), or through function
+        # self.family if no path is defined or if the function is redefined.
+        self.selectedIDs = []
+        self.familyPaths = []
 
     def family(self, id):
-        'Get the family of individual with id.'
+        '''Get the family of individual with id. A derived sampler can
+        redefine this function to select families that cannot be described
+        by relative paths in self.familyPaths.'''
         return [id]
 
+    def drawFamilies(self, anchors, families, numOfSamples):
+        '''Select non-overlapping families from each group of ``anchors``
+        using function ``self.family``, and return them in the format of
+        ``Pedigree.drawFamilies``.'''
+        samples = []
+        for s in range(numOfSamples):
+            IDs = set()
+            sample = []
+            for group, requested in zip(anchors, families):
+                # a tuple might be returned
+                group = list(group)
+                random_sample(group, len(group))
+                # we select families one by one to exclude overlapping families.
+                selected = []
+                for id in group:
+                    if len(selected) == requested:
+                        break
+                    fam = set(self.family(id))
+                    if len(IDs & fam) == 0:
+                        IDs.update(fam)
+                        selected.append(list(fam))
+                sample.append(selected)
+            samples.append(sample)
+        return samples
+
     def drawSample(self, input_pop):
         'Randomly select Pedigrees'
-        if self.pedigree is None:
+        return self.drawSamples(input_pop, 1)[0]
+
+    def drawSamples(self, input_pop, numOfSamples):
+        '''Randomly select Pedigrees for ``numOfSamples`` samples and return
+        a list of populations.'''
+        if numOfSamples < 0:
+            raise ValueError("Negative number of samples are unacceptable")
+        if not self.prepared(input_pop):
             # this will give us self.pop, self.pedigree, and self.selectedIDs
             self.prepareSample(input_pop)
         #
         if not isSequence(self.families):
+            anchors = [self.selectedIDs]
+            families = [self.families]
             if self.families > len(self.selectedIDs):
                 print('Warning: number of requested Pedigrees %d is greater than what exists (%d).' \
                     % (self.families, len(self.selectedIDs)))
-            # a tuple might be returned
-            self.selectedIDs = list(self.selectedIDs)
-            random_shuffle(self.selectedIDs)
-            # we select families one by one to exclude overlapping families.
-            IDs = set()
-            cnt = 0
-            for id in self.selectedIDs:
-                fam = set(self.family(id))
-                if len(IDs & fam) == 0:
-                    IDs.update(fam)
-                    cnt += 1
-                if cnt == self.families:
-                    break
-            if cnt != self.families:
-                print('Warning: not enough non-overlapping Pedigrees are found (requested %d, found %d).' \
-                    % (self.families, cnt))
         else:
-            IDs = set()
+            anchors = self.selectedIDs
+            families = self.families
             for sp in range(self.pop.numSubPop()):
                 if self.families[sp] > len(self.selectedIDs[sp]):
                     print('Warning: number of requested Pedigrees %d is greater than what exists (%d) in subpopulation %d.' \
                         % (self.families[sp], len(self.selectedIDs[sp]), sp))
-                #
-                # a tuple might be returned
-                self.selectedIDs[sp] = list(self.selectedIDs[sp])
-                random_shuffle(self.selectedIDs[sp])
-                # we select families one by one to exclude overlapping families.
-                cnt = 0
-                for id in self.selectedIDs[sp]:
-                    fam = set(self.family(id))
-                    if len(IDs & fam) == 0:
-                        IDs.update(fam)
-                        cnt += 1
-                    if cnt == self.families[sp]:
-                        break
-                if cnt != self.families[sp]:
+        # families are selected one by one, in random order, to exclude
+        # overlapping families. Function self.family is used instead of
+        # relative paths if it is redefined by a derived sampler.
+        if self.familyPaths and type(self).family is PedigreeSampler.family:
+            drawn = self.pedigree.drawFamilies(anchors, self.familyPaths,
+                families, numOfSamples)
+        else:
+            drawn = self.drawFamilies(anchors, families, numOfSamples)
+        samples = []
+        for sample in drawn:
+            IDs = []
+            for requested, selected in zip(families, sample):
+                if len(selected) != requested:
                     print('Warning: not enough non-overlapping Pedigrees are found (requested %d, found %d).' \
-                        % (self.families, cnt))
+                        % (requested, len(selected)))
+                for fam in selected:
+                    IDs.extend(fam)
+            samples.append(IDs)
         # get family members
-        return self.pop.extractIndividuals(IDs = list(IDs), idField = self.idField)
+        return self.pop.extractIndividualSets(IDs = samples, idField = self.idField)
 
 
 class AffectedSibpairSampler(PedigreeSampler):
@@ -447,11 +536,6 @@ class AffectedSibpairSampler(PedigreeSampler):
         '''Initialize an affected sibpair sampler.'''
         PedigreeSampler.__init__(self, families, subPops, idField, fatherField, motherField)
 
-    def family(self, id):
-        'Return id, its spouse and their children'
-        ind = self.pedigree.indByID(id)
-        return id, ind.spouse, ind.off1, ind.off2
-
     def prepareSample(self, input_pop):
         'Find the father or all affected sibpair families'
         # this will give us self.pop and self.pedigree
@@ -465,6 +549,7 @@ class AffectedSibpairSampler(PedigreeSampler):
         self.pedigree.locateRelatives(OUTBRED_SPOUSE, ['spouse'], FEMALE_ONLY)
         # look for affected offspring
         self.pedigree.locateRelatives(COMMON_OFFSPRING, ['spouse', 'off1', 'off2'], affectionStatus=AFFECTED)
+        self.familyPaths = [['spouse'], ['off1'], ['off2']]
         # find qualified families
         if not isSequence(self.families):
             self.selectedIDs = self.pedigree.individualsWithRelatives(['spouse', 'off1', 'off2'])
@@ -496,7 +581,7 @@ def drawAffectedSibpairSamples(pop, families, numOfSamples=1, subPops=ALL_AVAIL,
     return a list of populations. Please refer to function
     ``drawAffectedSibpairSample`` for a description of other parameters.
     '''
-    return affectedSibpairSample(families, subPops, idField, fatherField,
+    return AffectedSibpairSampler(families, subPops, idField, fatherField,
         motherField).drawSamples(pop, numOfSamples)
 
 
@@ -567,12 +652,6 @@ class NuclearFamilySampler(PedigreeSampler):
         #
         PedigreeSampler.__init__(self, families, subPops, idField, fatherField, motherField)
 
-    def family(self, id):
-        'Return id, its spouse and their children'
-        ind = self.pedigree.indByID(id)
-        offIDs = [ind.info('off%d' % x) for x in range(self.numOffspring[1])]
-        return [id, ind.spouse] + [x for x in offIDs if x >= 0]
-
     def prepareSample(self, input_pop):
         # this will give us self.pop and self.pedigree
         PedigreeSampler.prepareSample(self, input_pop, isSequence(self.families))
@@ -587,6 +666,7 @@ class NuclearFamilySampler(PedigreeSampler):
         self.pedigree.locateRelatives(OUTBRED_SPOUSE, ['spouse'], FEMALE_ONLY)
         # look for offspring
         self.pedigree.locateRelatives(COMMON_OFFSPRING, ['spouse'] + offFields)
+        self.familyPaths = [['spouse']] + [[x] for x in offFields]
         # check number of affected individuals and filter them out.
         def qualify(id):
             father = self.pedigree.indByID(id)
@@ -634,7 +714,7 @@ def drawNuclearFamilySamples(pop, families, numOffspring, affectedParents=0,
     return a list of populations. Please refer to function
     ``drawNuclearFamilySample`` for a description of other parameters.
     '''
-    return nuclearFamilySample(families, numOffspring, affectedParents,
+    return NuclearFamilySampler(families, numOffspring, affectedParents,
         affectedOffspring, subPops, idField, fatherField,
         motherField).drawSamples(pop, numOfSamples)
 
@@ -703,18 +783,6 @@ class ThreeGenFamilySampler(PedigreeSampler):
         #
         PedigreeSampler.__init__(self, families, subPops, idField, fatherField, motherField)
 
-    def family(self, id):
-        '''Return id, its spouse, their children, children's spouse and grandchildren'''
-        father = self.pedigree.indByID(id)
-        spouseID = father.spouse
-        offID = [father.info('off%d' % x) for x in range(self.numOffspring[1])]
-        offID = [x for x in offID if x >= 1]
-        offSpouseID = [self.pedigree.indByID(x).spouse for x in offID]
-        offSpouseID = [x for x in offSpouseID if x >= 1]
-        grandOffID = [father.info('goff%d' % x) for x in range(self.numOffspring[1]**2)]
-        grandOffID = [x for x in grandOffID if x >= 1]
-        return [id, spouseID] + offID + offSpouseID + grandOffID
-
     def prepareSample(self, input_pop):
         # this will give us self.pop and self.pedigree
         PedigreeSampler.prepareSample(self, input_pop, isSequence(self.families))
@@ -733,13 +801,16 @@ class ThreeGenFamilySampler(PedigreeSampler):
         self.pedigree.locateRelatives(COMMON_OFFSPRING, ['spouse'] + offFields)
         # look for grand children
         self.pedigree.traceRelatives(fieldPath = [offFields, offFields], resultFields = grandOffFields)
+        self.familyPaths = [['spouse']] + [[x] for x in offFields] + \
+            [[x, 'spouse'] for x in offFields] + [[x] for x in grandOffFields]
         # check number of affected individuals and filter them out.
         def qualify(id):
             father = self.pedigree.indByID(id)
             mother = self.pedigree.indByID(father.spouse)
             offID = [father.info('off%d' % x) for x in range(self.numOffspring[1])]
             offID = [x for x in offID if x >= 0]
-            offSpouseID = [self.pedigree.indByID(id).spouse for x in offID]
+            offSpouseID = [self.pedigree.indByID(x).spouse for x in offID]
+            offSpouseID = [x for x in offSpouseID if x >= 0]
             grandOffID = [father.info('goff%d' % x) for x in range(self.numOffspring[1]**2)]
             grandOffID = [x for x in grandOffID if x >= 0]
             pedSize = 2 + len(offID) + len(offSpouseID) + len(grandOffID)
@@ -756,7 +827,7 @@ class ThreeGenFamilySampler(PedigreeSampler):
         else:
             self.selectedIDs = []
             for sp in range(self.pedigree.numSubPop()):
-                self.selectedIDs.append(list(filter(quality, self.pedigree.individualsWithRelatives(['spouse'] + minOffFields + minGrandOffFields, subPops=sp))))
+                self.selectedIDs.append(list(filter(qualify, self.pedigree.individualsWithRelatives(['spouse'] + minOffFields + minGrandOffFields, subPops=sp))))
 
 
 def drawThreeGenFamilySample(pop, families, numOffspring, pedSize, numOfAffected=0,
@@ -43,10 +43,22 @@ bool BaseSelector::apply(Population & pop) const
 	subPopList::const_iterator sp = subPops.begin();
 	subPopList::const_iterator spEnd = subPops.end();
 
+	vector<Individual *> inds;
+	vectorf fitness;
 	for (; sp != spEnd; ++sp) {
 		if (sp->isVirtual())
 			pop.activateVirtualSubPop(*sp);
-		if (numThreads() > 1 && parallelizable()) {
+		if (batchSize() > 0) {
+			IndIterator ind = pop.indIterator(sp->subPop());
+			while (ind.valid()) {
+				inds.clear();
+				for (; ind.valid() && inds.size() < batchSize(); ++ind)
+					inds.push_back(&*ind);
+				blockFitness(pop, inds, fitness);
+				for (size_t i = 0; i < inds.size(); ++i)
+					inds[i]->setInfo(fitness[i], fit_id);
+			}
+		} else if (numThreads() > 1 && parallelizable()) {
 #pragma omp parallel
 			{
 #ifdef _OPENMP
@@ -69,6 +81,15 @@ bool BaseSelector::apply(Population & pop) const
 }
 
 
+void BaseSelector::blockFitness(Population & pop, const vector<Individual *> & inds,
+                                vectorf & fitness) const
+{
+	fitness.resize(inds.size());
+	for (size_t i = 0; i < inds.size(); ++i)
+		fitness[i] = indFitness(pop, pop.rawIndBegin() + (inds[i] - &*pop.rawIndBegin()));
+}
+
+
 double MapSelector::indFitness(Population & pop, RawIndIterator ind) const
 {
 	vectoru chromTypes;
@@ -277,34 +298,60 @@ double MlSelector::indFitness(Population & pop, RawIndIterator ind) const
 }
 
 
+void PySelector::blockFitness(Population & pop, const vector<Individual *> & inds,
+                              vectorf & fitness) const
+{
+	batchCall(m_func, &pop, pop.gen(), m_loci, inds, 1, fitness);
+}
+
+
 double PySelector::indFitness(Population & pop, RawIndIterator ind) const
 {
-	PyObject * args = PyTuple_New(m_func.numArgs());
-
-	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
-
-	for (size_t i = 0; i < m_func.numArgs(); ++i) {
-		const string & arg = m_func.arg(i);
-		if (arg == "ind")
-			PyTuple_SET_ITEM(args, i, pyIndObj(static_cast<void *>(&*ind)));
-		else if (arg == "geno")
-			PyTuple_SET_ITEM(args, i, ind->genoAtLoci(m_loci));
-		else if (arg == "mut")
-			PyTuple_SET_ITEM(args, i, ind->mutAtLoci(m_loci));
-		else if (arg == "gen")
-			PyTuple_SET_ITEM(args, i, PyInt_FromLong(static_cast<long>(pop.gen())));
-		else if (arg == "pop")
-			PyTuple_SET_ITEM(args, i, pyPopObj(static_cast<void *>(&pop)));
-		else {
-			DBG_FAILIF(!ind->hasInfoField(arg), ValueError,
-				"Only parameters 'ind', 'geno', 'gen', 'pop' and names of information fields are "
-				"acceptable in function " + m_func.name());
-			PyTuple_SET_ITEM(args, i, PyFloat_FromDouble(ind->info(arg)));
+	if (m_batchSize > 0) {
+		vectorf fitness;
+		blockFitness(pop, vector<Individual *>(1, &*ind), fitness);
+		return fitness[0];
+	}
+
+	genoValueCache::Key key;
+
+	if (m_cache.enabled()) {
+		vector<ULONG> geno;
+		ind->allelesAtLoci(m_loci, geno);
+		m_cache.setKey(key, pop.gen(), geno);
+		const vectorf * fitness = m_cache.find(key);
+		if (fitness != NULL)
+			return (*fitness)[0];
+	}
+
+	m_args.initializeIfNeeded(*ind);
+	PyObject * args = m_args.tuple();
+
+	for (size_t i = 0; i < m_args.size(); ++i) {
+		switch (m_args.type(i)) {
+		case pyFuncArgs::IND_ARG:
+			m_args.setArg(i, pyIndObj(static_cast<void *>(&*ind)));
+			break;
+		case pyFuncArgs::GENO_ARG:
+			m_args.setArg(i, ind->genoAtLoci(m_loci));
+			break;
+		case pyFuncArgs::MUT_ARG:
+			m_args.setArg(i, ind->mutAtLoci(m_loci));
+			break;
+		case pyFuncArgs::GEN_ARG:
+			m_args.setArg(i, PyInt_FromLong(static_cast<long>(pop.gen())));
+			break;
+		case pyFuncArgs::POP_ARG:
+			m_args.setArg(i, pyPopObj(static_cast<void *>(&pop)));
+			break;
+		default:
+			m_args.setArg(i, PyFloat_FromDouble(ind->info(m_args.infoIdx(i))));
 		}
 	}
 
 	double fitness = m_func(PyObj_As_Double, args);
-	Py_XDECREF(args);
+	if (m_cache.enabled())
+		m_cache.insert(key, vectorf(1, fitness));
 	return fitness;
 }
 
@@ -148,6 +148,22 @@ public:
 	}
 
 
+	/** CPPONLY
+	 *  Number of individuals whose fitness values are calculated together
+	 *  by \c blockFitness, or 0 if they are calculated one by one.
+	 */
+	virtual size_t batchSize() const
+	{
+		return 0;
+	}
+
+
+	/** CPPONLY
+	 *  Calculate fitness values of a block of individuals \e inds.
+	 */
+	virtual void blockFitness(Population & pop, const vector<Individual *> & inds,
+		vectorf & fitness) const;
+
 	/// HIDDEN set fitness to all individuals. No selection will happen!
 	bool apply(Population & pop) const;
 
@@ -442,16 +458,40 @@ public:
 	 *  \e loci, values at specified information fields (if requested) and
 	 *  a generation number to a user-defined function \e func. The return
 	 *  value will be treated as individual fitness.
+	 *
+	 *  If \e func accepts only parameters \c geno and \c gen, a positive
+	 *  \e cacheSize allows this operator to cache fitness values of up to
+	 *  \e cacheSize genotypes (and generations) so that \e func is called
+	 *  only once for each distinct genotype. Least recently used values are
+	 *  removed when the cache is full. This should only be used if \e func
+	 *  returns the same value for the same genotype (and generation).
+	 *
+	 *  If a positive \e batchSize is specified, \e func is called in batch
+	 *  mode for blocks of up to \e batchSize individuals. It then receives
+	 *  genotypes as a 2-d NumPy array with one row per individual (\c geno),
+	 *  values at information fields as NumPy arrays, and should return an
+	 *  array of fitness values, one for each individual. Individuals with
+	 *  different numbers of alleles at \e loci, such as males and females at
+	 *  loci on sex chromosomes, are passed in separate calls. Parameters
+	 *  \c ind and \c mut are not allowed in this mode.
 	 */
 	PySelector(PyObject * func, lociList loci = vectoru(),
 		int begin = 0, int end = -1, int step = 1,
 		const intList & at = vectori(), const intList & reps = intList(), const stringFunc & output = "",
 		const subPopList & subPops = subPopList(),
-		const stringList & infoFields = stringList("fitness")) :
+		const stringList & infoFields = stringList("fitness"), size_t cacheSize = 0,
+		size_t batchSize = 0) :
 		BaseSelector(output, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func), m_loci(loci)
+		m_func(func), m_args(m_func, pyFuncArgs::IND_ARG | pyFuncArgs::GENO_ARG | pyFuncArgs::MUT_ARG |
+		                     pyFuncArgs::GEN_ARG | pyFuncArgs::POP_ARG),
+		m_loci(loci), m_cache(m_func, cacheSize), m_batchSize(batchSize)
 	{
 		DBG_ASSERT(m_func.isValid(), ValueError, "Passed variable is not a callable python function.");
+		if (m_batchSize > 0) {
+			if (cacheSize > 0)
+				throw ValueError("Fitness values cannot be cached in batch mode.");
+			checkBatchFunc(m_func);
+		}
 	}
 
 
@@ -467,6 +507,17 @@ public:
 	 */
 	virtual double indFitness(Population & pop, RawIndIterator ind) const;
 
+	/// CPPONLY
+	size_t batchSize() const
+	{
+		return m_batchSize;
+	}
+
+
+	/// CPPONLY
+	void blockFitness(Population & pop, const vector<Individual *> & inds,
+		vectorf & fitness) const;
+
 	/// HIDDEN
 	string describe(bool format = true) const
 	{
@@ -475,6 +526,17 @@ public:
 	}
 
 
+	/** Return a dictionary with numbers of \c hits and \c misses of the
+	 *  fitness cache, number of cached values (\c size) and \c cacheSize.
+	 *  The cache is shared by copies of this operator, including those used
+	 *  by function \c evolve.
+	 */
+	PyObject * cacheStats() const
+	{
+		return m_cache.stats();
+	}
+
+
 	/// CPPONLY
 	bool parallelizable() const
 	{
@@ -486,9 +548,17 @@ private:
 	/// user supplied python function
 	const pyFunc m_func;
 
+	/// arguments of m_func
+	const pyFuncArgs m_args;
+
 	/// susceptibility loci
 	const lociList m_loci;
 
+	/// cached fitness values
+	const genoValueCache m_cache;
+
+	/// number of individuals passed to m_func in batch mode
+	const size_t m_batchSize;
 };
 
 
@@ -1,85 +1,26 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 3.0.12
+# Version 4.0.2
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
 from sys import version_info as _swig_python_version_info
-if _swig_python_version_info >= (3, 0, 0):
-    new_instancemethod = lambda func, inst, cls: _simuPOP_ba.SWIG_PyInstanceMethod_New(func)
-else:
-    from new import instancemethod as new_instancemethod
-if _swig_python_version_info >= (2, 7, 0):
-    def swig_import_helper():
-        import importlib
-        pkg = __name__.rpartition('.')[0]
-        mname = '.'.join((pkg, '_simuPOP_ba')).lstrip('.')
-        try:
-            return importlib.import_module(mname)
-        except ImportError:
-            return importlib.import_module('_simuPOP_ba')
-    _simuPOP_ba = swig_import_helper()
-    del swig_import_helper
-elif _swig_python_version_info >= (2, 6, 0):
-    def swig_import_helper():
-        from os.path import dirname
-        import imp
-        fp = None
-        try:
-            fp, pathname, description = imp.find_module('_simuPOP_ba', [dirname(__file__)])
-        except ImportError:
-            import _simuPOP_ba
-            return _simuPOP_ba
-        try:
-            _mod = imp.load_module('_simuPOP_ba', fp, pathname, description)
-        finally:
-            if fp is not None:
-                fp.close()
-        return _mod
-    _simuPOP_ba = swig_import_helper()
-    del swig_import_helper
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
+
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _simuPOP_ba
 else:
     import _simuPOP_ba
-del _swig_python_version_info
-
-try:
-    _swig_property = property
-except NameError:
-    pass  # Python < 2.2 doesn't have 'property'.
 
 try:
     import builtins as __builtin__
 except ImportError:
     import __builtin__
 
-def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
-    if (name == "thisown"):
-        return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'SwigPyObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name, None)
-    if method:
-        return method(self, value)
-    if (not static):
-        object.__setattr__(self, name, value)
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
-
-
-def _swig_setattr(self, class_type, name, value):
-    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
-
-
-def _swig_getattr(self, class_type, name):
-    if (name == "thisown"):
-        return self.this.own()
-    method = class_type.__swig_getmethods__.get(name, None)
-    if method:
-        return method(self)
-    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
-
+_swig_new_instance_method = _simuPOP_ba.SWIG_PyInstanceMethod_New
+_swig_new_static_method = _simuPOP_ba.SWIG_PyStaticMethod_New
 
 def _swig_repr(self):
     try:
@@ -89,15 +30,38 @@ def _swig_repr(self):
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
 
-def _swig_setattr_nondynamic_method(set):
-    def set_attr(self, name, value):
-        if (name == "thisown"):
-            return self.this.own(value)
-        if hasattr(self, name) or (name == "this"):
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
             set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
         else:
-            raise AttributeError("You cannot add attributes to %s" % self)
-    return set_attr
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
 
 
 
@@ -109,35 +73,35 @@ def _swig_repr(self):
         return "<%s.%s>" % (self.__class__.__module__.split('.')[-1].split('_')[0], self.__class__.__name__)
 
 class SwigPyIterator(object):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
 
     def __init__(self, *args, **kwargs):
         raise AttributeError("No constructor defined - class is abstract")
     __repr__ = _swig_repr
     __swig_destroy__ = _simuPOP_ba.delete_SwigPyIterator
+    value = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_value)
+    incr = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_incr)
+    decr = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_decr)
+    distance = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_distance)
+    equal = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_equal)
+    copy = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_copy)
+    next = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_next)
+    __next__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___next__)
+    previous = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_previous)
+    advance = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator_advance)
+    __eq__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___eq__)
+    __ne__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___ne__)
+    __iadd__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___iadd__)
+    __isub__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___isub__)
+    __add__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___add__)
+    __sub__ = _swig_new_instance_method(_simuPOP_ba.SwigPyIterator___sub__)
     def __iter__(self):
         return self
-SwigPyIterator.value = new_instancemethod(_simuPOP_ba.SwigPyIterator_value, None, SwigPyIterator)
-SwigPyIterator.incr = new_instancemethod(_simuPOP_ba.SwigPyIterator_incr, None, SwigPyIterator)
-SwigPyIterator.decr = new_instancemethod(_simuPOP_ba.SwigPyIterator_decr, None, SwigPyIterator)
-SwigPyIterator.distance = new_instancemethod(_simuPOP_ba.SwigPyIterator_distance, None, SwigPyIterator)
-SwigPyIterator.equal = new_instancemethod(_simuPOP_ba.SwigPyIterator_equal, None, SwigPyIterator)
-SwigPyIterator.copy = new_instancemethod(_simuPOP_ba.SwigPyIterator_copy, None, SwigPyIterator)
-SwigPyIterator.next = new_instancemethod(_simuPOP_ba.SwigPyIterator_next, None, SwigPyIterator)
-SwigPyIterator.__next__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___next__, None, SwigPyIterator)
-SwigPyIterator.previous = new_instancemethod(_simuPOP_ba.SwigPyIterator_previous, None, SwigPyIterator)
-SwigPyIterator.advance = new_instancemethod(_simuPOP_ba.SwigPyIterator_advance, None, SwigPyIterator)
-SwigPyIterator.__eq__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___eq__, None, SwigPyIterator)
-SwigPyIterator.__ne__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___ne__, None, SwigPyIterator)
-SwigPyIterator.__iadd__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___iadd__, None, SwigPyIterator)
-SwigPyIterator.__isub__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___isub__, None, SwigPyIterator)
-SwigPyIterator.__add__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___add__, None, SwigPyIterator)
-SwigPyIterator.__sub__ = new_instancemethod(_simuPOP_ba.SwigPyIterator___sub__, None, SwigPyIterator)
-SwigPyIterator_swigregister = _simuPOP_ba.SwigPyIterator_swigregister
-SwigPyIterator_swigregister(SwigPyIterator)
+
+# Register SwigPyIterator in _simuPOP_ba:
+_simuPOP_ba.SwigPyIterator_swigregister(SwigPyIterator)
 
 HAVE_INLINE = _simuPOP_ba.HAVE_INLINE
-TR1_SUPPORT = _simuPOP_ba.TR1_SUPPORT
 THREAFPRIVATE_SUPPORT = _simuPOP_ba.THREAFPRIVATE_SUPPORT
 SIZE_T_FORMAT = _simuPOP_ba.SIZE_T_FORMAT
 OpSWIGType = _simuPOP_ba.OpSWIGType
@@ -205,15 +169,16 @@ FROM_INFO = _simuPOP_ba.FROM_INFO
 FROM_INFO_SIGNED = _simuPOP_ba.FROM_INFO_SIGNED
 DBG_WARNING = _simuPOP_ba.DBG_WARNING
 class Exception(object):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const &'):
+    def __init__(self, msg: "string const &"):
         _simuPOP_ba.Exception_swiginit(self, _simuPOP_ba.new_Exception(msg))
+    message = _swig_new_instance_method(_simuPOP_ba.Exception_message)
     __swig_destroy__ = _simuPOP_ba.delete_Exception
-Exception.message = new_instancemethod(_simuPOP_ba.Exception_message, None, Exception)
-Exception_swigregister = _simuPOP_ba.Exception_swigregister
-Exception_swigregister(Exception)
+
+# Register Exception in _simuPOP_ba:
+_simuPOP_ba.Exception_swigregister(Exception)
 cvar = _simuPOP_ba.cvar
 MISSING_VALUE = cvar.MISSING_VALUE
 NOT_FOUND = cvar.NOT_FOUND
@@ -224,161 +189,94 @@ InvalidValue = cvar.InvalidValue
 MaxIndexSize = cvar.MaxIndexSize
 
 class StopIteration(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.StopIteration_swiginit(self, _simuPOP_ba.new_StopIteration(msg))
     __swig_destroy__ = _simuPOP_ba.delete_StopIteration
-StopIteration_swigregister = _simuPOP_ba.StopIteration_swigregister
-StopIteration_swigregister(StopIteration)
+
+# Register StopIteration in _simuPOP_ba:
+_simuPOP_ba.StopIteration_swigregister(StopIteration)
 
 class IndexError(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.IndexError_swiginit(self, _simuPOP_ba.new_IndexError(msg))
     __swig_destroy__ = _simuPOP_ba.delete_IndexError
-IndexError_swigregister = _simuPOP_ba.IndexError_swigregister
-IndexError_swigregister(IndexError)
+
+# Register IndexError in _simuPOP_ba:
+_simuPOP_ba.IndexError_swigregister(IndexError)
 
 class ValueError(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.ValueError_swiginit(self, _simuPOP_ba.new_ValueError(msg))
     __swig_destroy__ = _simuPOP_ba.delete_ValueError
-ValueError_swigregister = _simuPOP_ba.ValueError_swigregister
-ValueError_swigregister(ValueError)
+
+# Register ValueError in _simuPOP_ba:
+_simuPOP_ba.ValueError_swigregister(ValueError)
 
 class SystemError(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.SystemError_swiginit(self, _simuPOP_ba.new_SystemError(msg))
     __swig_destroy__ = _simuPOP_ba.delete_SystemError
-SystemError_swigregister = _simuPOP_ba.SystemError_swigregister
-SystemError_swigregister(SystemError)
+
+# Register SystemError in _simuPOP_ba:
+_simuPOP_ba.SystemError_swigregister(SystemError)
 
 class RuntimeError(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.RuntimeError_swiginit(self, _simuPOP_ba.new_RuntimeError(msg))
     __swig_destroy__ = _simuPOP_ba.delete_RuntimeError
-RuntimeError_swigregister = _simuPOP_ba.RuntimeError_swigregister
-RuntimeError_swigregister(RuntimeError)
+
+# Register RuntimeError in _simuPOP_ba:
+_simuPOP_ba.RuntimeError_swigregister(RuntimeError)
 
 class StopEvolution(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.StopEvolution_swiginit(self, _simuPOP_ba.new_StopEvolution(msg))
     __swig_destroy__ = _simuPOP_ba.delete_StopEvolution
-StopEvolution_swigregister = _simuPOP_ba.StopEvolution_swigregister
-StopEvolution_swigregister(StopEvolution)
+
+# Register StopEvolution in _simuPOP_ba:
+_simuPOP_ba.StopEvolution_swigregister(StopEvolution)
 
 class RevertEvolution(Exception):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, msg: 'string const'):
+    def __init__(self, msg: "string const"):
         _simuPOP_ba.RevertEvolution_swiginit(self, _simuPOP_ba.new_RevertEvolution(msg))
     __swig_destroy__ = _simuPOP_ba.delete_RevertEvolution
-RevertEvolution_swigregister = _simuPOP_ba.RevertEvolution_swigregister
-RevertEvolution_swigregister(RevertEvolution)
+
+# Register RevertEvolution in _simuPOP_ba:
+_simuPOP_ba.RevertEvolution_swigregister(RevertEvolution)
 
 UnnamedSubPop = _simuPOP_ba.UnnamedSubPop
 cmp_epsilon = _simuPOP_ba.cmp_epsilon
-
-def turnOnDebug(*args, **kwargs) -> "void":
-    """
-
-
-    Usage:
-
-        turnOnDebug(code="")
-
-    Details:
-
-        Set debug code code. More than one code could be specified using a
-        comma separated string. Name of available codes are available from
-        moduleInfo()['debug'].keys().
-
-
-    """
-    return _simuPOP_ba.turnOnDebug(*args, **kwargs)
-
-def turnOffDebug(*args, **kwargs) -> "void":
-    """
-
-
-    Usage:
-
-        turnOffDebug(code="DBG_ALL")
-
-    Details:
-
-        Turn off debug code code. More than one code could be specified
-        using a comma separated string. Default to turn off all debug
-        codes.
-
-
-    """
-    return _simuPOP_ba.turnOffDebug(*args, **kwargs)
-
-def elapsedTime(name: 'string const &') -> "void":
-    """
-
-
-    Usage:
-
-        elapsedTime(name)
-
-
-    """
-    return _simuPOP_ba.elapsedTime(name)
-
-def setOptions(numThreads: 'int const'=-1, name: 'char const *'=None, seed: 'unsigned long'=0) -> "void":
-    """
-
-
-    Usage:
-
-        setOptions(numThreads=-1, name=None, seed=0)
-
-    Details:
-
-        First argument is to set number of thread in openMP. The number of
-        threads can be be positive, integer (number of threads) or 0,
-        which implies all available cores, or a number set by
-        environmental variable OMP_NUM_THREADS. Second and third argument
-        is to set the type or seed of existing random number generator
-        using RNGname with seed. If using openMP, it sets the type or seed
-        of random number generator of each thread.
-
-
-    """
-    return _simuPOP_ba.setOptions(numThreads, name, seed)
-
-def simuPOP_kbhit() -> "int":
-    return _simuPOP_ba.simuPOP_kbhit()
+turnOnDebug = _simuPOP_ba.turnOnDebug
+turnOffDebug = _simuPOP_ba.turnOffDebug
+elapsedTime = _simuPOP_ba.elapsedTime
+setOptions = _simuPOP_ba.setOptions
+useRNGStreams = _simuPOP_ba.useRNGStreams
 simuPOP_kbhit = _simuPOP_ba.simuPOP_kbhit
-
-def simuPOP_getch() -> "int":
-    return _simuPOP_ba.simuPOP_getch()
 simuPOP_getch = _simuPOP_ba.simuPOP_getch
-
-def pow3(n: 'unsigned int') -> "unsigned int":
-    return _simuPOP_ba.pow3(n)
 pow3 = _simuPOP_ba.pow3
 class intList(object):
-    """
+    r"""
 
 
     Details:
@@ -390,11 +288,11 @@ class intList(object):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, obj: 'PyObject *'=None):
-        """
+    def __init__(self, obj: "PyObject *"=None):
+        r"""
 
 
         Usage:
@@ -405,21 +303,22 @@ class intList(object):
         """
         _simuPOP_ba.intList_swiginit(self, _simuPOP_ba.new_intList(obj))
     __swig_destroy__ = _simuPOP_ba.delete_intList
-intList_swigregister = _simuPOP_ba.intList_swigregister
-intList_swigregister(intList)
+
+# Register intList in _simuPOP_ba:
+_simuPOP_ba.intList_swigregister(intList)
 
 class uintList(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -429,36 +328,24 @@ class uintList(object):
 
         """
         _simuPOP_ba.uintList_swiginit(self, _simuPOP_ba.new_uintList(*args, **kwargs))
-
-    def unspecified(self) -> "bool":
-        """
-
-
-        Usage:
-
-            x.unspecified()
-
-
-        """
-        return _simuPOP_ba.uintList_unspecified(self)
-
+    unspecified = _swig_new_instance_method(_simuPOP_ba.uintList_unspecified)
     __swig_destroy__ = _simuPOP_ba.delete_uintList
-uintList.unspecified = new_instancemethod(_simuPOP_ba.uintList_unspecified, None, uintList)
-uintList_swigregister = _simuPOP_ba.uintList_swigregister
-uintList_swigregister(uintList)
+
+# Register uintList in _simuPOP_ba:
+_simuPOP_ba.uintList_swigregister(uintList)
 
 class lociList(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -468,51 +355,26 @@ class lociList(object):
 
         """
         _simuPOP_ba.lociList_swiginit(self, _simuPOP_ba.new_lociList(*args, **kwargs))
-
-    def empty(self) -> "bool":
-        """
-
-
-        Usage:
-
-            x.empty()
-
-
-        """
-        return _simuPOP_ba.lociList_empty(self)
-
-
-    def dynamic(self) -> "bool":
-        """
-
-
-        Usage:
-
-            x.dynamic()
-
-
-        """
-        return _simuPOP_ba.lociList_dynamic(self)
-
+    empty = _swig_new_instance_method(_simuPOP_ba.lociList_empty)
+    dynamic = _swig_new_instance_method(_simuPOP_ba.lociList_dynamic)
+    elems = _swig_new_instance_method(_simuPOP_ba.lociList_elems)
     __swig_destroy__ = _simuPOP_ba.delete_lociList
-lociList.empty = new_instancemethod(_simuPOP_ba.lociList_empty, None, lociList)
-lociList.dynamic = new_instancemethod(_simuPOP_ba.lociList_dynamic, None, lociList)
-lociList.elems = new_instancemethod(_simuPOP_ba.lociList_elems, None, lociList)
-lociList_swigregister = _simuPOP_ba.lociList_swigregister
-lociList_swigregister(lociList)
+
+# Register lociList in _simuPOP_ba:
+_simuPOP_ba.lociList_swigregister(lociList)
 
 class floatList(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -523,21 +385,22 @@ class floatList(object):
         """
         _simuPOP_ba.floatList_swiginit(self, _simuPOP_ba.new_floatList(*args))
     __swig_destroy__ = _simuPOP_ba.delete_floatList
-floatList_swigregister = _simuPOP_ba.floatList_swigregister
-floatList_swigregister(floatList)
+
+# Register floatList in _simuPOP_ba:
+_simuPOP_ba.floatList_swigregister(floatList)
 
 class stringList(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -547,23 +410,24 @@ class stringList(object):
 
         """
         _simuPOP_ba.stringList_swiginit(self, _simuPOP_ba.new_stringList(*args))
+    push_back = _swig_new_instance_method(_simuPOP_ba.stringList_push_back)
     __swig_destroy__ = _simuPOP_ba.delete_stringList
-stringList.push_back = new_instancemethod(_simuPOP_ba.stringList_push_back, None, stringList)
-stringList_swigregister = _simuPOP_ba.stringList_swigregister
-stringList_swigregister(stringList)
+
+# Register stringList in _simuPOP_ba:
+_simuPOP_ba.stringList_swigregister(stringList)
 
 class intMatrix(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, obj: 'PyObject *'=None):
-        """
+    def __init__(self, obj: "PyObject *"=None):
+        r"""
 
 
         Usage:
@@ -574,21 +438,22 @@ class intMatrix(object):
         """
         _simuPOP_ba.intMatrix_swiginit(self, _simuPOP_ba.new_intMatrix(obj))
     __swig_destroy__ = _simuPOP_ba.delete_intMatrix
-intMatrix_swigregister = _simuPOP_ba.intMatrix_swigregister
-intMatrix_swigregister(intMatrix)
+
+# Register intMatrix in _simuPOP_ba:
+_simuPOP_ba.intMatrix_swigregister(intMatrix)
 
 class floatMatrix(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, obj: 'PyObject *'=None):
-        """
+    def __init__(self, obj: "PyObject *"=None):
+        r"""
 
 
         Usage:
@@ -599,21 +464,22 @@ class floatMatrix(object):
         """
         _simuPOP_ba.floatMatrix_swiginit(self, _simuPOP_ba.new_floatMatrix(obj))
     __swig_destroy__ = _simuPOP_ba.delete_floatMatrix
-floatMatrix_swigregister = _simuPOP_ba.floatMatrix_swigregister
-floatMatrix_swigregister(floatMatrix)
+
+# Register floatMatrix in _simuPOP_ba:
+_simuPOP_ba.floatMatrix_swigregister(floatMatrix)
 
 class stringMatrix(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, str: 'PyObject *'=None):
-        """
+    def __init__(self, str: "PyObject *"=None):
+        r"""
 
 
         Usage:
@@ -624,21 +490,22 @@ class stringMatrix(object):
         """
         _simuPOP_ba.stringMatrix_swiginit(self, _simuPOP_ba.new_stringMatrix(str))
     __swig_destroy__ = _simuPOP_ba.delete_stringMatrix
-stringMatrix_swigregister = _simuPOP_ba.stringMatrix_swigregister
-stringMatrix_swigregister(stringMatrix)
+
+# Register stringMatrix in _simuPOP_ba:
+_simuPOP_ba.stringMatrix_swigregister(stringMatrix)
 
 class uintString(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -649,25 +516,23 @@ class uintString(object):
         """
         _simuPOP_ba.uintString_swiginit(self, _simuPOP_ba.new_uintString(*args))
     __swig_destroy__ = _simuPOP_ba.delete_uintString
-uintString_swigregister = _simuPOP_ba.uintString_swigregister
-uintString_swigregister(uintString)
 
+# Register uintString in _simuPOP_ba:
+_simuPOP_ba.uintString_swigregister(uintString)
 
-def PyObj_AsString(str: 'PyObject *') -> "string":
-    return _simuPOP_ba.PyObj_AsString(str)
 PyObj_AsString = _simuPOP_ba.PyObj_AsString
 class stringFunc(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -677,40 +542,24 @@ class stringFunc(object):
 
         """
         _simuPOP_ba.stringFunc_swiginit(self, _simuPOP_ba.new_stringFunc(*args))
-
-    def mode(self) -> "string":
-        """
-
-
-        Description:
-
-            COPY.
-
-        Usage:
-
-            x.mode()
-
-
-        """
-        return _simuPOP_ba.stringFunc_mode(self)
-
+    mode = _swig_new_instance_method(_simuPOP_ba.stringFunc_mode)
     __swig_destroy__ = _simuPOP_ba.delete_stringFunc
-stringFunc.mode = new_instancemethod(_simuPOP_ba.stringFunc_mode, None, stringFunc)
-stringFunc_swigregister = _simuPOP_ba.stringFunc_swigregister
-stringFunc_swigregister(stringFunc)
+
+# Register stringFunc in _simuPOP_ba:
+_simuPOP_ba.stringFunc_swigregister(stringFunc)
 
 class uintListFunc(uintList):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -721,21 +570,22 @@ class uintListFunc(uintList):
         """
         _simuPOP_ba.uintListFunc_swiginit(self, _simuPOP_ba.new_uintListFunc(*args))
     __swig_destroy__ = _simuPOP_ba.delete_uintListFunc
-uintListFunc_swigregister = _simuPOP_ba.uintListFunc_swigregister
-uintListFunc_swigregister(uintListFunc)
+
+# Register uintListFunc in _simuPOP_ba:
+_simuPOP_ba.uintListFunc_swigregister(uintListFunc)
 
 class floatListFunc(floatList):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -746,85 +596,25 @@ class floatListFunc(floatList):
         """
         _simuPOP_ba.floatListFunc_swiginit(self, _simuPOP_ba.new_floatListFunc(*args))
     __swig_destroy__ = _simuPOP_ba.delete_floatListFunc
-floatListFunc_swigregister = _simuPOP_ba.floatListFunc_swigregister
-floatListFunc_swigregister(floatListFunc)
 
+# Register floatListFunc in _simuPOP_ba:
+_simuPOP_ba.floatListFunc_swigregister(floatListFunc)
 
-def PyObj_As_Bool(obj: 'PyObject *', val: 'bool &') -> "void":
-    return _simuPOP_ba.PyObj_As_Bool(obj, val)
 PyObj_As_Bool = _simuPOP_ba.PyObj_As_Bool
-
-def PyObj_As_Int(obj: 'PyObject *', val: 'long &') -> "void":
-    return _simuPOP_ba.PyObj_As_Int(obj, val)
 PyObj_As_Int = _simuPOP_ba.PyObj_As_Int
-
-def PyObj_As_SizeT(obj: 'PyObject *', val: 'size_t &') -> "void":
-    return _simuPOP_ba.PyObj_As_SizeT(obj, val)
 PyObj_As_SizeT = _simuPOP_ba.PyObj_As_SizeT
-
-def PyObj_As_Double(obj: 'PyObject *', val: 'double &') -> "void":
-    return _simuPOP_ba.PyObj_As_Double(obj, val)
 PyObj_As_Double = _simuPOP_ba.PyObj_As_Double
-
-def PyObj_As_String(obj: 'PyObject *', val: 'string &') -> "void":
-    return _simuPOP_ba.PyObj_As_String(obj, val)
 PyObj_As_String = _simuPOP_ba.PyObj_As_String
-
-def PyObj_As_Array(obj: 'PyObject *', val: 'vectorf &') -> "void":
-    return _simuPOP_ba.PyObj_As_Array(obj, val)
 PyObj_As_Array = _simuPOP_ba.PyObj_As_Array
-
-def PyObj_As_IntArray(obj: 'PyObject *', val: 'vectori &') -> "void":
-    return _simuPOP_ba.PyObj_As_IntArray(obj, val)
 PyObj_As_IntArray = _simuPOP_ba.PyObj_As_IntArray
-
-def PyObj_As_SizeTArray(obj: 'PyObject *', val: 'vectoru &') -> "void":
-    return _simuPOP_ba.PyObj_As_SizeTArray(obj, val)
 PyObj_As_SizeTArray = _simuPOP_ba.PyObj_As_SizeTArray
-
-def Allele_Vec_As_NumArray(begin: 'GenoIterator', end: 'GenoIterator') -> "PyObject *":
-    return _simuPOP_ba.Allele_Vec_As_NumArray(begin, end)
 Allele_Vec_As_NumArray = _simuPOP_ba.Allele_Vec_As_NumArray
-
-def Lineage_Vec_As_NumArray(begin: 'LineageIterator', end: 'LineageIterator') -> "PyObject *":
-    return _simuPOP_ba.Lineage_Vec_As_NumArray(begin, end)
 Lineage_Vec_As_NumArray = _simuPOP_ba.Lineage_Vec_As_NumArray
-
-def closeOutput(*args, **kwargs) -> "void":
-    """
-
-
-    Usage:
-
-        closeOutput(output="")
-
-    Details:
-
-        Output files specified by '>' are closed immediately after they
-        are written. Those specified by '>>' and '>>>' are closed by a
-        simulator after Simulator.evolve(). However, these files will be
-        kept open if the operators are applied directly to a population
-        using the operators' function form. In this case, function
-        closeOutput can be used to close a specific file output, and close
-        all unclosed files if output is unspecified. An exception will be
-        raised if output does not exist or it has already been closed.
-
-
-    """
-    return _simuPOP_ba.closeOutput(*args, **kwargs)
-class RNG_func(object):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, rng: 'gsl_rng *'):
-        _simuPOP_ba.RNG_func_swiginit(self, _simuPOP_ba.new_RNG_func(rng))
-    __swig_destroy__ = _simuPOP_ba.delete_RNG_func
-RNG_func.__call__ = new_instancemethod(_simuPOP_ba.RNG_func___call__, None, RNG_func)
-RNG_func_swigregister = _simuPOP_ba.RNG_func_swigregister
-RNG_func_swigregister(RNG_func)
-
+Info_Vec_As_NumArray = _simuPOP_ba.Info_Vec_As_NumArray
+Vec_As_NumPyArray = _simuPOP_ba.Vec_As_NumPyArray
+closeOutput = _simuPOP_ba.closeOutput
 class RNG(object):
-    """
+    r"""
 
 
     Details:
@@ -838,11 +628,11 @@ class RNG(object):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, name: 'char const *'=None, seed: 'unsigned long'=0):
-        """
+    def __init__(self, name: "char const *"=None, seed: "unsigned long"=0):
+        r"""
 
 
         Usage:
@@ -864,3796 +654,1145 @@ class RNG(object):
         """
         _simuPOP_ba.RNG_swiginit(self, _simuPOP_ba.new_RNG(name, seed))
     __swig_destroy__ = _simuPOP_ba.delete_RNG
+    set = _swig_new_instance_method(_simuPOP_ba.RNG_set)
+    name = _swig_new_instance_method(_simuPOP_ba.RNG_name)
+    seed = _swig_new_instance_method(_simuPOP_ba.RNG_seed)
+    generateRandomSeed = _swig_new_static_method(_simuPOP_ba.RNG_generateRandomSeed)
+    setStream = _swig_new_instance_method(_simuPOP_ba.RNG_setStream)
+    copyState = _swig_new_instance_method(_simuPOP_ba.RNG_copyState)
+    streamEpoch = _swig_new_instance_method(_simuPOP_ba.RNG_streamEpoch)
+    randUniform = _swig_new_instance_method(_simuPOP_ba.RNG_randUniform)
+    randBit = _swig_new_instance_method(_simuPOP_ba.RNG_randBit)
+    randInt = _swig_new_instance_method(_simuPOP_ba.RNG_randInt)
+    randNormal = _swig_new_instance_method(_simuPOP_ba.RNG_randNormal)
+    randExponential = _swig_new_instance_method(_simuPOP_ba.RNG_randExponential)
+    randGamma = _swig_new_instance_method(_simuPOP_ba.RNG_randGamma)
+    randChisq = _swig_new_instance_method(_simuPOP_ba.RNG_randChisq)
+    randGeometric = _swig_new_instance_method(_simuPOP_ba.RNG_randGeometric)
+    randBinomial = _swig_new_instance_method(_simuPOP_ba.RNG_randBinomial)
+    randPoisson = _swig_new_instance_method(_simuPOP_ba.RNG_randPoisson)
+    randTruncatedPoisson = _swig_new_instance_method(_simuPOP_ba.RNG_randTruncatedPoisson)
+    randTruncatedBinomial = _swig_new_instance_method(_simuPOP_ba.RNG_randTruncatedBinomial)
+    randMultinomial = _swig_new_instance_method(_simuPOP_ba.RNG_randMultinomial)
+
+# Register RNG in _simuPOP_ba:
+_simuPOP_ba.RNG_swigregister(RNG)
+RNG_generateRandomSeed = _simuPOP_ba.RNG_generateRandomSeed
 
-    def set(self, name: 'char const *'=None, seed: 'unsigned long'=0) -> "void":
-        """
-
-
-        Usage:
+getRNG = _simuPOP_ba.getRNG
+class WeightedSampler(object):
+    r"""
 
-            x.set(name=None, seed=0)
 
-        Details:
+    Details:
 
-            Replace the existing random number generator using RNGname with
-            seed seed. If seed is 0, a random seed will be used. If name is
-            empty, use the existing RNG but reset the seed.
+        A random number generator that returns 0, 1, ..., k-1 with
+        probabilites that are proportional to their weights. For example,
+        a weighted sampler with weights 4, 3, 2 and 1 will return numbers
+        0, 1, 2 and 3 with probabilities 0.4, 0.3, 0.2 and 0.1,
+        respectively. If an additional parameter N is specified, the
+        weighted sampler will return exact proportions of numbers if N
+        numbers are returned. The version without additional parameter is
+        similar to the sample(prob, replace=FALSE) function of the R
+        statistical package.
 
 
-        """
-        return _simuPOP_ba.RNG_set(self, name, seed)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def name(self) -> "char const *":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.name()
+            WeightedSampler(weights=[], N=0)
 
         Details:
 
-            Return the name of the current random number generator.
-
-
-        """
-        return _simuPOP_ba.RNG_name(self)
+            Creates a weighted sampler that returns 0, 1, ... k-1 when a list
+            of k weights are specified (weights). weights do not have to add
+            up to 1. If a non-zero N is specified, exact proportions of
+            numbers will be returned in N returned numbers.
 
 
-    def seed(self) -> "unsigned long":
         """
+        _simuPOP_ba.WeightedSampler_swiginit(self, _simuPOP_ba.new_WeightedSampler(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_WeightedSampler
+    draw = _swig_new_instance_method(_simuPOP_ba.WeightedSampler_draw)
+    drawSamples = _swig_new_instance_method(_simuPOP_ba.WeightedSampler_drawSamples)
 
+# Register WeightedSampler in _simuPOP_ba:
+_simuPOP_ba.WeightedSampler_swigregister(WeightedSampler)
 
-        Usage:
+class Bernullitrials(object):
+    r"""
 
-            x.seed()
 
-        Details:
+    Details:
 
-            Return the seed used to initialize the RNG. This can be used to
-            repeat a previous session.
+        this class encapsulate behavior of a sequence of Bernulli trial.
+        the main idea is that when doing a sequence of Bernulli trials of
+        the same probability, we can use much quicker algorithms instead
+        of doing n Bernulli trials  For example, when N=10000, p=0.001.
+        The usual way to do N Bin(p) trials is to do N randUnif(0,1)<p
+        comparison.  using the new method, we can use geometric
+        distrubution to find the next true event.  Also, for the cases of
+        p=0.5, random bits are generated.  This class maintain a two
+        dimensional table: a vector of probabilities cross expected number
+        of trials p1 p2 p3 p4 p5  trial 1 trial 2 ... trial N  We expect
+        that N is big (usually populaiton size) and p_i are small  using
+        fast bernulliTrial method for fix p, we can fill up this table
+        very quickly column by column  This class will provide easy access
+        to row (each trial) or column (called each prob) of this table.
+        if this table is accessed row by row (each trial), a internal
+        index is used.  if index exceeds N, trials will be generated all
+        again. if trial will be called, e.g., N+2 times all the time, this
+        treatment might not be very efficient.
 
 
-        """
-        return _simuPOP_ba.RNG_seed(self)
+    """
 
-    generateRandomSeed = staticmethod(_simuPOP_ba.RNG_generateRandomSeed)
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def randUniform(self) -> "double":
-        """
+    def __init__(self, arg2: "RNG", prob: "vectorf const &", trials: "ULONG"=0):
+        r"""
 
 
         Usage:
 
-            x.randUniform()
-
-        Details:
-
-            Generate a random number following a rng_uniform [0, 1)
-            distribution.
+            Bernullitrials(, prob, trials=0)
 
 
         """
-        return _simuPOP_ba.RNG_randUniform(self)
-
+        _simuPOP_ba.Bernullitrials_swiginit(self, _simuPOP_ba.new_Bernullitrials(arg2, prob, trials))
+    __swig_destroy__ = _simuPOP_ba.delete_Bernullitrials
+    probSize = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_probSize)
+    doTrial = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_doTrial)
+    trial = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_trial)
+    trialSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_trialSucc)
+    trialFirstSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_trialFirstSucc)
+    trialNextSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_trialNextSucc)
+    setTrialSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_setTrialSucc)
+    trialSuccRate = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_trialSuccRate)
+    probSuccRate = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_probSuccRate)
+    npos = _simuPOP_ba.Bernullitrials_npos
 
-    def randBit(self) -> "bool":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.RNG_randBit(self)
+# Register Bernullitrials in _simuPOP_ba:
+_simuPOP_ba.Bernullitrials_swigregister(Bernullitrials)
 
+class Bernullitrials_T(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def randInt(self, n: 'unsigned long') -> "unsigned long":
-        """
+    def __init__(self, *args):
+        _simuPOP_ba.Bernullitrials_T_swiginit(self, _simuPOP_ba.new_Bernullitrials_T(*args))
+    __swig_destroy__ = _simuPOP_ba.delete_Bernullitrials_T
+    setParameter = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_setParameter)
+    doTrial = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_doTrial)
+    trial = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_trial)
+    trialSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_trialSucc)
+    probFirstSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_probFirstSucc)
+    probNextSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_probNextSucc)
+    setTrialSucc = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_setTrialSucc)
+    trialSuccRate = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_trialSuccRate)
+    probSuccRate = _swig_new_instance_method(_simuPOP_ba.Bernullitrials_T_probSuccRate)
+    npos = _simuPOP_ba.Bernullitrials_T_npos
 
+# Register Bernullitrials_T in _simuPOP_ba:
+_simuPOP_ba.Bernullitrials_T_swigregister(Bernullitrials_T)
 
-        Usage:
+class TrajectoryEngine(object):
+    r"""
 
-            x.randInt(n)
 
-        Details:
+    Details:
 
-            return a random number in the range of [0, 1, 2, ... n-1]
+        A trajectory engine simulates trajectories of allele frequencies
+        of one or more unlinked diallelic loci in a diploid population,
+        forward or backward in time. It is the native engine used by class
+        TrajectorySimulator of module simuPOP.utils, which prepares
+        population sizes and fitness values from demographic and fitness
+        functions and wraps simulated frequencies into Trajectory objects.
+        Attempts to simulate a trajectory are run in parallel if multiple
+        threads are used. The accepted attempt depends on the number of
+        threads unless random number streams are enabled by
+        setOptions(rngStreams=True), in which case each attempt uses its own
+        stream of random numbers.
 
 
-        """
-        return _simuPOP_ba.RNG_randInt(self, n)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def randNormal(self, mu: 'double', sigma: 'double') -> "double":
-        """
+    def __init__(self, nLoci: "size_t", firstGen: "long", N: "intMatrix", fitness: "floatMatrix"):
+        r"""
 
 
         Usage:
 
-            x.randNormal(mu, sigma)
+            TrajectoryEngine(nLoci, firstGen, N, fitness)
 
         Details:
 
-            Generate a random number following a normal distribution with mean
-            mu and standard deviation sigma.
+            Create a trajectory engine for nLoci unlinked loci. N is a list of
+            subpopulation sizes at the beginning of generation firstGen and at
+            the end of generations firstGen, firstGen + 1, and so on. The
+            first and last items are used for generations before and after
+            these generations. fitness can be a list of fitness values (3,
+            3*nLoci or 3**nLoci values, see TrajectorySimulator for details)
+            that is used for all generations and subpopulations, or a list of
+            fitness values for each subpopulation at each generation, starting
+            from generation firstGen, with the same number of items (the
+            maximal number of subpopulations in N) for each generation.
 
 
         """
-        return _simuPOP_ba.RNG_randNormal(self, mu, sigma)
+        _simuPOP_ba.TrajectoryEngine_swiginit(self, _simuPOP_ba.new_TrajectoryEngine(nLoci, firstGen, N, fitness))
+    simuForward = _swig_new_instance_method(_simuPOP_ba.TrajectoryEngine_simuForward)
+    simuBackward = _swig_new_instance_method(_simuPOP_ba.TrajectoryEngine_simuBackward)
+    attempts = _swig_new_instance_method(_simuPOP_ba.TrajectoryEngine_attempts)
+    __swig_destroy__ = _simuPOP_ba.delete_TrajectoryEngine
 
+# Register TrajectoryEngine in _simuPOP_ba:
+_simuPOP_ba.TrajectoryEngine_swigregister(TrajectoryEngine)
 
-    def randExponential(self, mu: 'double') -> "double":
-        """
-
-
-        Usage:
-
-            x.randExponential(mu)
-
-        Details:
-
-            Generate a random number following a exponential distribution with
-            parameter mu.
-
-
-        """
-        return _simuPOP_ba.RNG_randExponential(self, mu)
-
-
-    def randGamma(self, a: 'double', b: 'double') -> "double":
-        """
-
-
-        Usage:
-
-            x.randGamma(a, b)
-
-        Details:
-
-            Generate a random number following a gamma distribution with a
-            shape parameters a and scale parameter b.
-
-
-        """
-        return _simuPOP_ba.RNG_randGamma(self, a, b)
-
-
-    def randChisq(self, nu: 'double') -> "double":
-        """
-
-
-        Usage:
-
-            x.randChisq(nu)
-
-        Details:
-
-            Generate a random number following a Chi-squared distribution with
-            nu degrees of freedom.
-
-
-        """
-        return _simuPOP_ba.RNG_randChisq(self, nu)
-
-
-    def randGeometric(self, p: 'double') -> "long":
-        """
-
-
-        Usage:
-
-            x.randGeometric(p)
-
-        Details:
-
-            Generate a random number following a geometric distribution with
-            parameter p.
-
-
-        """
-        return _simuPOP_ba.RNG_randGeometric(self, p)
-
-
-    def randBinomial(self, n: 'UINT', p: 'double') -> "ULONG":
-        """
-
-
-        Usage:
-
-            x.randBinomial(n, p)
-
-        Details:
-
-            Generate a random number following a binomial distribution with
-            parameters n and p.
-
-
-        """
-        return _simuPOP_ba.RNG_randBinomial(self, n, p)
-
-
-    def randPoisson(self, mu: 'double') -> "ULONG":
-        """
-
-
-        Usage:
-
-            x.randPoisson(mu)
-
-        Details:
-
-            Generate a random number following a Poisson distribution with
-            parameter mu.
-
-
-        """
-        return _simuPOP_ba.RNG_randPoisson(self, mu)
-
-
-    def randTruncatedPoisson(self, mu: 'double') -> "ULONG":
-        """
-
-
-        Usage:
-
-            x.randTruncatedPoisson(mu)
-
-        Details:
-
-            Generate a positive random number following a zero-truncated
-            Poisson distribution with parameter mu.
-
-
-        """
-        return _simuPOP_ba.RNG_randTruncatedPoisson(self, mu)
-
-
-    def randTruncatedBinomial(self, n: 'UINT', p: 'double') -> "ULONG":
-        """
-
-
-        Usage:
-
-            x.randTruncatedBinomial(n, p)
-
-        Details:
-
-            Generate a positive random number following a zero-truncated
-            binomial distribution with parameters n and p.
-
-
-        """
-        return _simuPOP_ba.RNG_randTruncatedBinomial(self, n, p)
-
-
-    def randMultinomial(self, N: 'unsigned int', p: 'vectorf const &') -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.randMultinomial(N, p)
-
-        Details:
-
-            Generate a random number following a multinomial distribution with
-            parameters N and p (a list of probabilities).
-
-
-        """
-        return _simuPOP_ba.RNG_randMultinomial(self, N, p)
-
-RNG.set = new_instancemethod(_simuPOP_ba.RNG_set, None, RNG)
-RNG.name = new_instancemethod(_simuPOP_ba.RNG_name, None, RNG)
-RNG.seed = new_instancemethod(_simuPOP_ba.RNG_seed, None, RNG)
-RNG.randUniform = new_instancemethod(_simuPOP_ba.RNG_randUniform, None, RNG)
-RNG.randBit = new_instancemethod(_simuPOP_ba.RNG_randBit, None, RNG)
-RNG.randInt = new_instancemethod(_simuPOP_ba.RNG_randInt, None, RNG)
-RNG.randNormal = new_instancemethod(_simuPOP_ba.RNG_randNormal, None, RNG)
-RNG.randExponential = new_instancemethod(_simuPOP_ba.RNG_randExponential, None, RNG)
-RNG.randGamma = new_instancemethod(_simuPOP_ba.RNG_randGamma, None, RNG)
-RNG.randChisq = new_instancemethod(_simuPOP_ba.RNG_randChisq, None, RNG)
-RNG.randGeometric = new_instancemethod(_simuPOP_ba.RNG_randGeometric, None, RNG)
-RNG.randBinomial = new_instancemethod(_simuPOP_ba.RNG_randBinomial, None, RNG)
-RNG.randPoisson = new_instancemethod(_simuPOP_ba.RNG_randPoisson, None, RNG)
-RNG.randTruncatedPoisson = new_instancemethod(_simuPOP_ba.RNG_randTruncatedPoisson, None, RNG)
-RNG.randTruncatedBinomial = new_instancemethod(_simuPOP_ba.RNG_randTruncatedBinomial, None, RNG)
-RNG.randMultinomial = new_instancemethod(_simuPOP_ba.RNG_randMultinomial, None, RNG)
-RNG_swigregister = _simuPOP_ba.RNG_swigregister
-RNG_swigregister(RNG)
-
-def RNG_generateRandomSeed() -> "unsigned long":
-    return _simuPOP_ba.RNG_generateRandomSeed()
-RNG_generateRandomSeed = _simuPOP_ba.RNG_generateRandomSeed
-
-
-def getRNG() -> "simuPOP::RNG &":
-    """
-
-
-    Description:
-
-        return the currently used random number generator
-
-    Usage:
-
-        getRNG()
-
-
-    """
-    return _simuPOP_ba.getRNG()
-class WeightedSampler(object):
-    """
+moduleInfo = _simuPOP_ba.moduleInfo
+copyGenotype = _simuPOP_ba.copyGenotype
+clearGenotype = _simuPOP_ba.clearGenotype
+testCopyGenotype = _simuPOP_ba.testCopyGenotype
+class GenoStruTrait(object):
+    r"""
 
 
     Details:
 
-        A random number generator that returns 0, 1, ..., k-1 with
-        probabilites that are proportional to their weights. For example,
-        a weighted sampler with weights 4, 3, 2 and 1 will return numbers
-        0, 1, 2 and 3 with probabilities 0.4, 0.3, 0.2 and 0.1,
-        respectively. If an additional parameter N is specified, the
-        weighted sampler will return exact proportions of numbers if N
-        numbers are returned. The version without additional parameter is
-        similar to the sample(prob, replace=FALSE) function of the R
-        statistical package.
+        All individuals in a population share the same genotypic
+        properties such as number of chromosomes, number and position of
+        loci, names of markers, chromosomes, and information fields. These
+        properties are stored in this GenoStruTrait class and are
+        accessible from both Individual and Population classes. Currently,
+        a genotypic structure consists of
+        *   Ploidy, namely the number of homologous sets of chromosomes,
+        of a population. Haplodiploid population is also supported.
+        *   Number of chromosomes and number of loci on each chromosome.
+        *   Positions of loci, which determine the relative distance
+        between loci on the same chromosome. No unit is assumed so these
+        positions can be ordinal (1, 2, 3, ..., the default), in physical
+        distance (bp, kb or mb), or in map distance (e.g. centiMorgan)
+        depending on applications.
+        *   Names of alleles, which can either be shared by all loci or be
+        specified for each locus.
+        *   Names of loci and chromosomes.
+        *   Names of information fields attached to each individual. In
+        addition to basic property access functions, this class provides
+        some utility functions such as locusByName, which looks up a locus
+        by its name.
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            WeightedSampler(weights=[], N=0)
-
-        Details:
-
-            Creates a weighted sampler that returns 0, 1, ... k-1 when a list
-            of k weights are specified (weights). weights do not have to add
-            up to 1. If a non-zero N is specified, exact proportions of
-            numbers will be returned in N returned numbers.
-
-
-        """
-        _simuPOP_ba.WeightedSampler_swiginit(self, _simuPOP_ba.new_WeightedSampler(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_WeightedSampler
-
-    def draw(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.draw()
-
-        Details:
-
-            Returns a random number between 0 and k-1 with probabilities that
-            are proportional to specified weights.
-
-
-        """
-        return _simuPOP_ba.WeightedSampler_draw(self)
-
-
-    def drawSamples(self, n: 'ULONG'=1) -> "vectoru":
-        """
+    def __init__(self):
+        r"""
 
 
         Usage:
 
-            x.drawSamples(n=1)
+            GenoStruTrait()
 
         Details:
 
-            Returns a list of n random numbers
+            A GenoStruTrait object is created with the construction of a
+            Population object and cannot be initialized directly.
 
 
         """
-        return _simuPOP_ba.WeightedSampler_drawSamples(self, n)
+        _simuPOP_ba.GenoStruTrait_swiginit(self, _simuPOP_ba.new_GenoStruTrait())
+    lociDist = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_lociDist)
+    lociLeft = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_lociLeft)
+    distLeft = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_distLeft)
+    lociCovered = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_lociCovered)
+    ploidy = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_ploidy)
+    ploidyName = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_ploidyName)
+    numLoci = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_numLoci)
+    sexChrom = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_sexChrom)
+    isHaplodiploid = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_isHaplodiploid)
+    totNumLoci = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_totNumLoci)
+    genoSize = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_genoSize)
+    locusPos = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_locusPos)
+    lociPos = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_lociPos)
+    numChrom = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_numChrom)
+    chromBegin = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromBegin)
+    chromEnd = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromEnd)
+    absLocusIndex = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_absLocusIndex)
+    chromLocusPair = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromLocusPair)
+    chromName = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromName)
+    chromNames = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromNames)
+    chromType = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromType)
+    chromTypes = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromTypes)
+    chromByName = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_chromByName)
+    alleleName = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_alleleName)
+    alleleNames = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_alleleNames)
+    locusName = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_locusName)
+    lociNames = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_lociNames)
+    locusByName = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_locusByName)
+    lociByNames = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_lociByNames)
+    indexesOfLoci = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_indexesOfLoci)
+    hasInfoField = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_hasInfoField)
+    infoSize = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_infoSize)
+    infoFields = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_infoFields)
+    infoField = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_infoField)
+    infoIdx = _swig_new_instance_method(_simuPOP_ba.GenoStruTrait_infoIdx)
+    __swig_destroy__ = _simuPOP_ba.delete_GenoStruTrait
 
-WeightedSampler.draw = new_instancemethod(_simuPOP_ba.WeightedSampler_draw, None, WeightedSampler)
-WeightedSampler.drawSamples = new_instancemethod(_simuPOP_ba.WeightedSampler_drawSamples, None, WeightedSampler)
-WeightedSampler_swigregister = _simuPOP_ba.WeightedSampler_swigregister
-WeightedSampler_swigregister(WeightedSampler)
+# Register GenoStruTrait in _simuPOP_ba:
+_simuPOP_ba.GenoStruTrait_swigregister(GenoStruTrait)
 
-class Bernullitrials(object):
-    """
+class pyMutantIterator(object):
+    r"""
 
 
     Details:
 
-        this class encapsulate behavior of a sequence of Bernulli trial.
-        the main idea is that when doing a sequence of Bernulli trials of
-        the same probability, we can use much quicker algorithms instead
-        of doing n Bernulli trials  For example, when N=10000, p=0.001.
-        The usual way to do N Bin(p) trials is to do N randUnif(0,1)<p
-        comparison.  using the new method, we can use geometric
-        distrubution to find the next true event.  Also, for the cases of
-        p=0.5, random bits are generated.  This class maintain a two
-        dimensional table: a vector of probabilities cross expected number
-        of trials p1 p2 p3 p4 p5  trial 1 trial 2 ... trial N  We expect
-        that N is big (usually populaiton size) and p_i are small  using
-        fast bernulliTrial method for fix p, we can fill up this table
-        very quickly column by column  This class will provide easy access
-        to row (each trial) or column (called each prob) of this table.
-        if this table is accessed row by row (each trial), a internal
-        index is used.  if index exceeds N, trials will be generated all
-        again. if trial will be called, e.g., N+2 times all the time, this
-        treatment might not be very efficient.
+        this class implements a Python itertor class that can be used to
+        iterate through individuals in a (sub)population. If allInds are
+        true, visiblility of individuals will not be checked. Otherwise, a
+        functor will be used to check if indiviudals belong to a specified
+        virtual subpopulation.  An instance of this class is returned by
+        population::Individuals() and Population::Individuals(subPop)
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, arg2: 'RNG', prob: 'vectorf const &', trials: 'ULONG'=0):
-        """
-
-
-        Usage:
-
-            Bernullitrials(, prob, trials=0)
-
-
-        """
-        _simuPOP_ba.Bernullitrials_swiginit(self, _simuPOP_ba.new_Bernullitrials(arg2, prob, trials))
-    __swig_destroy__ = _simuPOP_ba.delete_Bernullitrials
-
-    def probSize(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.probSize()
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_probSize(self)
-
-
-    def doTrial(self) -> "void":
-        """
-
-
-        Description:
-
-            generate the trial table, reset m_cur
-
-        Usage:
-
-            x.doTrial()
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_doTrial(self)
-
-
-    def trial(self) -> "void":
-        """
-
-
-        Description:
-
-            if necessary, do trail again.
-
-        Usage:
-
-            x.trial()
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_trial(self)
-
-
-    def trialSucc(self, *args) -> "bool":
-        """
-
-
-        Usage:
-
-            x.trialSucc(idx)
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_trialSucc(self, *args)
-
-
-    def trialFirstSucc(self, idx: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.trialFirstSucc(idx)
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_trialFirstSucc(self, idx)
-
-
-    def trialNextSucc(self, idx: 'size_t', pos: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.trialNextSucc(idx, pos)
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_trialNextSucc(self, idx, pos)
-
-
-    def setTrialSucc(self, idx: 'size_t', succ: 'bool') -> "void":
-        """
-
-
-        Usage:
-
-            x.setTrialSucc(idx, succ)
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_setTrialSucc(self, idx, succ)
-
-
-    def trialSuccRate(self, index: 'UINT') -> "double":
-        """
-
-
-        Description:
-
-            return the succ rate for one index, used for verification pruposes
-
-        Usage:
-
-            x.trialSuccRate(index)
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_trialSuccRate(self, index)
-
-
-    def probSuccRate(self) -> "double":
-        """
-
-
-        Description:
-
-            return the succ rate for current trial, used for verification
-            pruposes
-
-        Usage:
-
-            x.probSuccRate()
-
-
-        """
-        return _simuPOP_ba.Bernullitrials_probSuccRate(self)
-
-    npos = _simuPOP_ba.Bernullitrials_npos
-Bernullitrials.probSize = new_instancemethod(_simuPOP_ba.Bernullitrials_probSize, None, Bernullitrials)
-Bernullitrials.doTrial = new_instancemethod(_simuPOP_ba.Bernullitrials_doTrial, None, Bernullitrials)
-Bernullitrials.trial = new_instancemethod(_simuPOP_ba.Bernullitrials_trial, None, Bernullitrials)
-Bernullitrials.trialSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_trialSucc, None, Bernullitrials)
-Bernullitrials.trialFirstSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_trialFirstSucc, None, Bernullitrials)
-Bernullitrials.trialNextSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_trialNextSucc, None, Bernullitrials)
-Bernullitrials.setTrialSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_setTrialSucc, None, Bernullitrials)
-Bernullitrials.trialSuccRate = new_instancemethod(_simuPOP_ba.Bernullitrials_trialSuccRate, None, Bernullitrials)
-Bernullitrials.probSuccRate = new_instancemethod(_simuPOP_ba.Bernullitrials_probSuccRate, None, Bernullitrials)
-Bernullitrials_swigregister = _simuPOP_ba.Bernullitrials_swigregister
-Bernullitrials_swigregister(Bernullitrials)
-
-class Bernullitrials_T(object):
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args):
-        _simuPOP_ba.Bernullitrials_T_swiginit(self, _simuPOP_ba.new_Bernullitrials_T(*args))
-    __swig_destroy__ = _simuPOP_ba.delete_Bernullitrials_T
-    npos = _simuPOP_ba.Bernullitrials_T_npos
-Bernullitrials_T.setParameter = new_instancemethod(_simuPOP_ba.Bernullitrials_T_setParameter, None, Bernullitrials_T)
-Bernullitrials_T.doTrial = new_instancemethod(_simuPOP_ba.Bernullitrials_T_doTrial, None, Bernullitrials_T)
-Bernullitrials_T.trial = new_instancemethod(_simuPOP_ba.Bernullitrials_T_trial, None, Bernullitrials_T)
-Bernullitrials_T.trialSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_T_trialSucc, None, Bernullitrials_T)
-Bernullitrials_T.probFirstSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_T_probFirstSucc, None, Bernullitrials_T)
-Bernullitrials_T.probNextSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_T_probNextSucc, None, Bernullitrials_T)
-Bernullitrials_T.setTrialSucc = new_instancemethod(_simuPOP_ba.Bernullitrials_T_setTrialSucc, None, Bernullitrials_T)
-Bernullitrials_T.trialSuccRate = new_instancemethod(_simuPOP_ba.Bernullitrials_T_trialSuccRate, None, Bernullitrials_T)
-Bernullitrials_T.probSuccRate = new_instancemethod(_simuPOP_ba.Bernullitrials_T_probSuccRate, None, Bernullitrials_T)
-Bernullitrials_T_swigregister = _simuPOP_ba.Bernullitrials_T_swigregister
-Bernullitrials_T_swigregister(Bernullitrials_T)
-
-
-def moduleInfo() -> "PyObject *":
-    """
-
-
-    Usage:
-
-        moduleInfo()
-
-    Details:
-
-        Return a dictionary with information regarding the currently
-        loaded simuPOP module. This dictionary has the following keys:
-        *   revision: revision number.
-        *   version: simuPOP version string.
-        *   optimized: Is this module optimized (True or False).
-        *   alleleType: Allele type of the module (short, long or binary).
-        *   maxAllele: the maximum allowed allele state, which is 1 for
-        binary modules, 255 for short modules and 65535 for long modules.
-        *   compiler: the compiler that compiles this module.
-        *   date: date on which this module is compiled.
-        *   python: version of python.
-        *   platform: platform of the module.
-        *   wordsize: size of word, can be either 32 or 64.
-        *   alleleBits: the number of bits used to store an allele
-        *   maxNumSubPop: maximum number of subpopulations.
-        *   maxIndex: maximum index size (limits population size * total
-        number of marker).
-        *   debug: A dictionary with debugging codes as keys and the
-        status of each debugging code (True or False) as their values.
-
-
-    """
-    return _simuPOP_ba.moduleInfo()
-
-def copyGenotype(fr: 'GenoIterator', to: 'GenoIterator', n: 'size_t') -> "void":
-    return _simuPOP_ba.copyGenotype(fr, to, n)
-copyGenotype = _simuPOP_ba.copyGenotype
-
-def clearGenotype(to: 'GenoIterator', n: 'size_t') -> "void":
-    return _simuPOP_ba.clearGenotype(to, n)
-clearGenotype = _simuPOP_ba.clearGenotype
-
-def testCopyGenotype() -> "void":
-    return _simuPOP_ba.testCopyGenotype()
-testCopyGenotype = _simuPOP_ba.testCopyGenotype
-class GenoStruTrait(object):
-    """
-
-
-    Details:
-
-        All individuals in a population share the same genotypic
-        properties such as number of chromosomes, number and position of
-        loci, names of markers, chromosomes, and information fields. These
-        properties are stored in this GenoStruTrait class and are
-        accessible from both Individual and Population classes. Currently,
-        a genotypic structure consists of
-        *   Ploidy, namely the number of homologous sets of chromosomes,
-        of a population. Haplodiploid population is also supported.
-        *   Number of chromosomes and number of loci on each chromosome.
-        *   Positions of loci, which determine the relative distance
-        between loci on the same chromosome. No unit is assumed so these
-        positions can be ordinal (1, 2, 3, ..., the default), in physical
-        distance (bp, kb or mb), or in map distance (e.g. centiMorgan)
-        depending on applications.
-        *   Names of alleles, which can either be shared by all loci or be
-        specified for each locus.
-        *   Names of loci and chromosomes.
-        *   Names of information fields attached to each individual. In
-        addition to basic property access functions, this class provides
-        some utility functions such as locusByName, which looks up a locus
-        by its name.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self):
-        """
-
-
-        Usage:
-
-            GenoStruTrait()
-
-        Details:
-
-            A GenoStruTrait object is created with the construction of a
-            Population object and cannot be initialized directly.
-
-
-        """
-        _simuPOP_ba.GenoStruTrait_swiginit(self, _simuPOP_ba.new_GenoStruTrait())
-
-    def lociDist(self, locus1: 'size_t', locus2: 'size_t') -> "double":
-        """
-
-
-        Usage:
-
-            x.lociDist(locus1, locus2)
-
-        Details:
-
-            Return the distance between loci locus1 and locus2 on the same
-            chromosome. A negative value will be returned if locus1 is after
-            locus2.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_lociDist(self, locus1, locus2)
-
-
-    def lociLeft(self, locus: 'size_t') -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_lociLeft(self, locus)
-
-
-    def distLeft(self, locus: 'size_t') -> "double":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_distLeft(self, locus)
-
-
-    def lociCovered(self, locus: 'size_t', dist: 'double') -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_lociCovered(self, locus, dist)
-
-
-    def ploidy(self) -> "UINT":
-        """
-
-
-        Usage:
-
-            x.ploidy()
-
-        Details:
-
-            return the number of homologous sets of chromosomes, specified by
-            the ploidy parameter of the Population function. Return 2 for a
-            haplodiploid population because two sets of chromosomes are stored
-            for both males and females in such a population.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_ploidy(self)
-
-
-    def ploidyName(self) -> "string":
-        """
-
-
-        Usage:
-
-            x.ploidyName()
-
-        Details:
-
-            return the ploidy name of this population, can be one of haploid,
-            diploid, haplodiploid, triploid, tetraploid or #-ploid where # is
-            the ploidy number.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_ploidyName(self)
-
-
-    def numLoci(self, *args) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.numLoci()
-
-        Details:
-
-            return a list of the number of loci on all chromosomes.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_numLoci(self, *args)
-
-
-    def sexChrom(self) -> "bool":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_sexChrom(self)
-
-
-    def isHaplodiploid(self) -> "bool":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_isHaplodiploid(self)
-
-
-    def totNumLoci(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.totNumLoci()
-
-        Details:
-
-            return the total number of loci on all chromosomes.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_totNumLoci(self)
-
-
-    def genoSize(self) -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_genoSize(self)
-
-
-    def locusPos(self, locus: 'size_t') -> "double":
-        """
-
-
-        Usage:
-
-            x.locusPos(locus)
-
-        Details:
-
-            return the position of locus locus specified by the lociPos
-            parameter of the Population function.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_locusPos(self, locus)
-
-
-    def lociPos(self) -> "vectorf":
-        """
-
-
-        Usage:
-
-            x.lociPos()
-
-        Details:
-
-            return the positions of all loci, specified by the lociPos
-            prameter of the Population function. The default positions are 1,
-            2, 3, 4, ... on each chromosome.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_lociPos(self)
-
-
-    def numChrom(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.numChrom()
-
-        Details:
-
-            return the number of chromosomes.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_numChrom(self)
-
-
-    def chromBegin(self, chrom: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.chromBegin(chrom)
-
-        Details:
-
-            return the index of the first locus on chromosome chrom.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromBegin(self, chrom)
-
-
-    def chromEnd(self, chrom: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.chromEnd(chrom)
-
-        Details:
-
-            return the index of the last locus on chromosome chrom plus 1.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromEnd(self, chrom)
-
-
-    def absLocusIndex(self, chrom: 'UINT', locus: 'UINT') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.absLocusIndex(chrom, locus)
-
-        Details:
-
-            return the absolute index of locus locus on chromosome chrom. c.f.
-            chromLocusPair.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_absLocusIndex(self, chrom, locus)
-
-
-    def chromLocusPair(self, locus: 'size_t') -> "pairu":
-        """
-
-
-        Usage:
-
-            x.chromLocusPair(locus)
-
-        Details:
-
-            return the chromosome and relative index of a locus using its
-            absolute index locus. c.f. absLocusIndex.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromLocusPair(self, locus)
-
-
-    def chromName(self, chrom: 'size_t const') -> "string":
-        """
-
-
-        Usage:
-
-            x.chromName(chrom)
-
-        Details:
-
-            return the name of a chromosome chrom.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromName(self, chrom)
-
-
-    def chromNames(self) -> "vectorstr":
-        """
-
-
-        Usage:
-
-            x.chromNames()
-
-        Details:
-
-            return a list of the names of all chromosomes.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromNames(self)
-
-
-    def chromType(self, chrom: 'size_t const') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.chromType(chrom)
-
-        Details:
-
-            return the type of a chromosome chrom (CUSTOMIZED, AUTOSOME,
-            CHROMOSOME_X, CHROMOSOME_Y or MITOCHONDRIAL.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromType(self, chrom)
-
-
-    def chromTypes(self) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.chromTypes()
-
-        Details:
-
-            return the type of all chromosomes (CUSTOMIZED, AUTOSOME,
-            CHROMOSOME_X, CHROMOSOME_Y, or MITOCHONDRIAL).
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromTypes(self)
-
-
-    def chromByName(self, name: 'string const') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.chromByName(name)
-
-        Details:
-
-            return the index of a chromosome by its name.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_chromByName(self, name)
-
-
-    def alleleName(self, allele: 'ULONG const', locus: 'size_t const'=0) -> "string":
-        """
-
-
-        Usage:
-
-            x.alleleName(allele, locus=0)
-
-        Details:
-
-            return the name of allele allele at lcous specified by the
-            alleleNames parameter of the Population function. locus could be
-            ignored if alleles at all loci share the same names. If the name
-            of an allele is unspecified, its value ('0', '1', '2', etc) is
-            returned.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_alleleName(self, allele, locus)
-
-
-    def alleleNames(self, locus: 'size_t const'=0) -> "vectorstr":
-        """
-
-
-        Usage:
-
-            x.alleleNames(locus=0)
-
-        Details:
-
-            return a list of allele names at given by the alleleNames
-            parameter of the Population function. locus could be ignored if
-            alleles at all loci share the same names. This list does not have
-            to cover all possible allele states of a population so
-            alleleNames()[allele] might fail (use alleleNames(allele)
-            instead).
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_alleleNames(self, locus)
-
-
-    def locusName(self, locus: 'size_t const') -> "string":
-        """
-
-
-        Usage:
-
-            x.locusName(locus)
-
-        Details:
-
-            return the name of locus locus specified by the lociNames
-            parameter of the Population function. An empty string will be
-            returned if no name has been given to locus locus.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_locusName(self, locus)
-
-
-    def lociNames(self) -> "vectorstr":
-        """
-
-
-        Usage:
-
-            x.lociNames()
-
-        Details:
-
-            return the names of all loci specified by the lociNames parameter
-            of the Population function. An empty list will be returned if
-            lociNames was not specified.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_lociNames(self)
-
-
-    def locusByName(self, name: 'string const') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.locusByName(name)
-
-        Details:
-
-            return the index of a locus with name name. Raise a ValueError if
-            no locus is found. Note that empty strings are used for loci
-            without name but you cannot lookup such loci using this function.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_locusByName(self, name)
-
-
-    def lociByNames(self, names: 'vectorstr const &') -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.lociByNames(names)
-
-        Details:
-
-            return the indexes of loci with names names. Raise a ValueError if
-            any of the loci cannot be found.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_lociByNames(self, names)
-
-
-    def indexesOfLoci(self, *args, **kwargs) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.indexesOfLoci(loci=ALL_AVAIL)
-
-        Details:
-
-            return the indexes of loci with positions positions (list of (chr,
-            pos) pairs). Raise a ValueError if any of the loci cannot be
-            found.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_indexesOfLoci(self, *args, **kwargs)
-
-
-    def hasInfoField(self, name: 'string const &') -> "bool":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_hasInfoField(self, name)
-
-
-    def infoSize(self) -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.GenoStruTrait_infoSize(self)
-
-
-    def infoFields(self) -> "vectorstr":
-        """
-
-
-        Usage:
-
-            x.infoFields()
-
-        Details:
-
-            return a list of the names of all information fields of the
-            population.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_infoFields(self)
-
-
-    def infoField(self, idx: 'size_t') -> "string":
-        """
-
-
-        Usage:
-
-            x.infoField(idx)
-
-        Details:
-
-            return the name of information field idx.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_infoField(self, idx)
-
-
-    def infoIdx(self, name: 'string const &') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.infoIdx(name)
-
-        Details:
-
-            return the index of information field name. Raise an IndexError if
-            name is not one of the information fields.
-
-
-        """
-        return _simuPOP_ba.GenoStruTrait_infoIdx(self, name)
-
-    __swig_destroy__ = _simuPOP_ba.delete_GenoStruTrait
-GenoStruTrait.lociDist = new_instancemethod(_simuPOP_ba.GenoStruTrait_lociDist, None, GenoStruTrait)
-GenoStruTrait.lociLeft = new_instancemethod(_simuPOP_ba.GenoStruTrait_lociLeft, None, GenoStruTrait)
-GenoStruTrait.distLeft = new_instancemethod(_simuPOP_ba.GenoStruTrait_distLeft, None, GenoStruTrait)
-GenoStruTrait.lociCovered = new_instancemethod(_simuPOP_ba.GenoStruTrait_lociCovered, None, GenoStruTrait)
-GenoStruTrait.ploidy = new_instancemethod(_simuPOP_ba.GenoStruTrait_ploidy, None, GenoStruTrait)
-GenoStruTrait.ploidyName = new_instancemethod(_simuPOP_ba.GenoStruTrait_ploidyName, None, GenoStruTrait)
-GenoStruTrait.numLoci = new_instancemethod(_simuPOP_ba.GenoStruTrait_numLoci, None, GenoStruTrait)
-GenoStruTrait.sexChrom = new_instancemethod(_simuPOP_ba.GenoStruTrait_sexChrom, None, GenoStruTrait)
-GenoStruTrait.isHaplodiploid = new_instancemethod(_simuPOP_ba.GenoStruTrait_isHaplodiploid, None, GenoStruTrait)
-GenoStruTrait.totNumLoci = new_instancemethod(_simuPOP_ba.GenoStruTrait_totNumLoci, None, GenoStruTrait)
-GenoStruTrait.genoSize = new_instancemethod(_simuPOP_ba.GenoStruTrait_genoSize, None, GenoStruTrait)
-GenoStruTrait.locusPos = new_instancemethod(_simuPOP_ba.GenoStruTrait_locusPos, None, GenoStruTrait)
-GenoStruTrait.lociPos = new_instancemethod(_simuPOP_ba.GenoStruTrait_lociPos, None, GenoStruTrait)
-GenoStruTrait.numChrom = new_instancemethod(_simuPOP_ba.GenoStruTrait_numChrom, None, GenoStruTrait)
-GenoStruTrait.chromBegin = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromBegin, None, GenoStruTrait)
-GenoStruTrait.chromEnd = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromEnd, None, GenoStruTrait)
-GenoStruTrait.absLocusIndex = new_instancemethod(_simuPOP_ba.GenoStruTrait_absLocusIndex, None, GenoStruTrait)
-GenoStruTrait.chromLocusPair = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromLocusPair, None, GenoStruTrait)
-GenoStruTrait.chromName = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromName, None, GenoStruTrait)
-GenoStruTrait.chromNames = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromNames, None, GenoStruTrait)
-GenoStruTrait.chromType = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromType, None, GenoStruTrait)
-GenoStruTrait.chromTypes = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromTypes, None, GenoStruTrait)
-GenoStruTrait.chromByName = new_instancemethod(_simuPOP_ba.GenoStruTrait_chromByName, None, GenoStruTrait)
-GenoStruTrait.alleleName = new_instancemethod(_simuPOP_ba.GenoStruTrait_alleleName, None, GenoStruTrait)
-GenoStruTrait.alleleNames = new_instancemethod(_simuPOP_ba.GenoStruTrait_alleleNames, None, GenoStruTrait)
-GenoStruTrait.locusName = new_instancemethod(_simuPOP_ba.GenoStruTrait_locusName, None, GenoStruTrait)
-GenoStruTrait.lociNames = new_instancemethod(_simuPOP_ba.GenoStruTrait_lociNames, None, GenoStruTrait)
-GenoStruTrait.locusByName = new_instancemethod(_simuPOP_ba.GenoStruTrait_locusByName, None, GenoStruTrait)
-GenoStruTrait.lociByNames = new_instancemethod(_simuPOP_ba.GenoStruTrait_lociByNames, None, GenoStruTrait)
-GenoStruTrait.indexesOfLoci = new_instancemethod(_simuPOP_ba.GenoStruTrait_indexesOfLoci, None, GenoStruTrait)
-GenoStruTrait.hasInfoField = new_instancemethod(_simuPOP_ba.GenoStruTrait_hasInfoField, None, GenoStruTrait)
-GenoStruTrait.infoSize = new_instancemethod(_simuPOP_ba.GenoStruTrait_infoSize, None, GenoStruTrait)
-GenoStruTrait.infoFields = new_instancemethod(_simuPOP_ba.GenoStruTrait_infoFields, None, GenoStruTrait)
-GenoStruTrait.infoField = new_instancemethod(_simuPOP_ba.GenoStruTrait_infoField, None, GenoStruTrait)
-GenoStruTrait.infoIdx = new_instancemethod(_simuPOP_ba.GenoStruTrait_infoIdx, None, GenoStruTrait)
-GenoStruTrait_swigregister = _simuPOP_ba.GenoStruTrait_swigregister
-GenoStruTrait_swigregister(GenoStruTrait)
-
-class pyMutantIterator(object):
-    """
-
-
-    Details:
-
-        this class implements a Python itertor class that can be used to
-        iterate through individuals in a (sub)population. If allInds are
-        true, visiblility of individuals will not be checked. Otherwise, a
-        functor will be used to check if indiviudals belong to a specified
-        virtual subpopulation.  An instance of this class is returned by
-        population::Individuals() and Population::Individuals(subPop)
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, base: 'GenoIterator', begin: 'size_t', end: 'size_t', step: 'size_t'):
-        """
-
-
-        Usage:
-
-            pyMutantIterator(base, begin, end, step)
-
-
-        """
-        _simuPOP_ba.pyMutantIterator_swiginit(self, _simuPOP_ba.new_pyMutantIterator(base, begin, end, step))
-    __swig_destroy__ = _simuPOP_ba.delete_pyMutantIterator
-
-    def next(self) -> "pairu":
-        """
-
-
-        Usage:
-
-            x.__next__()
-
-
-        """
-        return _simuPOP_ba.pyMutantIterator_next(self)
-
-pyMutantIterator.__iter__ = new_instancemethod(_simuPOP_ba.pyMutantIterator___iter__, None, pyMutantIterator)
-pyMutantIterator.next = new_instancemethod(_simuPOP_ba.pyMutantIterator_next, None, pyMutantIterator)
-pyMutantIterator.__next__ = new_instancemethod(_simuPOP_ba.pyMutantIterator___next__, None, pyMutantIterator)
-pyMutantIterator_swigregister = _simuPOP_ba.pyMutantIterator_swigregister
-pyMutantIterator_swigregister(pyMutantIterator)
-
-class Individual(GenoStruTrait):
-    """
-
-
-    Details:
-
-        A Population consists of individuals with the same genotypic
-        structure. An Individual object cannot be created independently,
-        but refences to inidividuals can be retrieved using member
-        functions of a Population object. In addition to structural
-        information shared by all individuals in a population (provided by
-        class GenoStruTrait), the Individual class provides member
-        functions to get and set genotype, sex, affection status and
-        information fields of an individual.    Genotypes of an individual
-        are stored sequentially and can be accessed locus by locus, or in
-        batch. The alleles are arranged by position, chromosome and
-        ploidy. That is to say, the first allele on the first chromosome
-        of the first homologous set is followed by alleles at other loci
-        on the same chromsome, then markers on the second and later
-        chromosomes, followed by alleles on the second homologous set of
-        the chromosomes for a diploid individual. A consequence of this
-        memory layout is that alleles at the same locus of a non-haploid
-        individual are separated by Individual::totNumLoci() loci. It is
-        worth noting that access to invalid chromosomes, such as the Y
-        chromosomes of female individuals, is not restricted.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self):
-        """
-
-
-        Usage:
-
-            Individual()
-
-        Details:
-
-            An Individual object cannot be created directly. It has to be
-            accessed from a Population object using functions such as
-            Population::Individual(idx).
-
-
-        """
-        _simuPOP_ba.Individual_swiginit(self, _simuPOP_ba.new_Individual())
-    __swig_destroy__ = _simuPOP_ba.delete_Individual
-
-    def allele(self, idx: 'size_t', ploidy: 'ssize_t'=-1, chrom: 'ssize_t'=-1) -> "ULONG":
-        """
-
-
-        Usage:
-
-            x.allele(idx, ploidy=-1, chrom=-1)
-
-        Details:
-
-            return the current allele at a locus, using its absolute index
-            idx. If a ploidy ploidy and/or a chromosome indexes is given, idx
-            is relative to the beginning of specified homologous copy of
-            chromosomes (if chrom=-1) or the beginning of the specified
-            homologous copy of specified chromosome (if chrom >= 0).
-
-
-        """
-        return _simuPOP_ba.Individual_allele(self, idx, ploidy, chrom)
-
-
-    def alleleChar(self, idx: 'size_t', ploidy: 'ssize_t'=-1, chrom: 'ssize_t'=-1) -> "string":
-        """
-
-
-        Usage:
-
-            x.alleleChar(idx, ploidy=-1, chrom=-1)
-
-        Details:
-
-            return the name of allele(idx, ploidy, chrom). If idx is invalid
-            (e.g. second homologus copy of chromosome Y), '_' is returned.
-
-
-        """
-        return _simuPOP_ba.Individual_alleleChar(self, idx, ploidy, chrom)
-
-
-    def setAllele(self, allele: 'ULONG', idx: 'size_t', ploidy: 'int'=-1, chrom: 'int'=-1) -> "void":
-        """
-
-
-        Usage:
-
-            x.setAllele(allele, idx, ploidy=-1, chrom=-1)
-
-        Details:
-
-            set allele allele to a locus, using its absolute index idx. If a
-            ploidy ploidy and/or a chromosome indexes are given, idx is
-            relative to the beginning of specified homologous copy of
-            chromosomes (if chrom=-1) or the beginning of the specified
-            homologous copy of specified chromosome (if chrom >= 0).
-
-
-        """
-        return _simuPOP_ba.Individual_setAllele(self, allele, idx, ploidy, chrom)
-
-
-    def alleleLineage(self, idx: 'size_t', ploidy: 'ssize_t'=-1, chrom: 'ssize_t'=-1) -> "long":
-        """
-
-
-        Usage:
-
-            x.alleleLineage(idx, ploidy=-1, chrom=-1)
-
-        Details:
-
-            return the lineage of the allele at a locus, using its absolute
-            index idx. If a ploidy ploidy and/or a chromosome indexes is
-            given, idx is relative to the beginning of specified homologous
-            copy of chromosomes (if chrom=-1) or the beginning of the
-            specified homologous copy of specified chromosome (if chrom >= 0).
-            This function returns 0 for modules without lineage information.
-
-
-        """
-        return _simuPOP_ba.Individual_alleleLineage(self, idx, ploidy, chrom)
-
-
-    def setAlleleLineage(self, lineage: 'long', idx: 'size_t', ploidy: 'int'=-1, chrom: 'int'=-1) -> "void":
-        """
-
-
-        Usage:
-
-            x.setAlleleLineage(lineage, idx, ploidy=-1, chrom=-1)
-
-        Details:
-
-            set lineage lineage to an allele, using its absolute index idx. If
-            a ploidy ploidy and/or a chromosome indexes are given, idx is
-            relative to the beginning of specified homologous copy of
-            chromosomes (if chrom=-1) or the beginning of the specified
-            homologous copy of specified chromosome (if chrom >= 0). This
-            function does nothing for modules without lineage information.
-
-
-        """
-        return _simuPOP_ba.Individual_setAlleleLineage(self, lineage, idx, ploidy, chrom)
-
-
-    def genotype(self, *args, **kwargs) -> "PyObject *":
-        """
-
-
-        Usage:
-
-            x.genotype(ploidy=ALL_AVAIL, chroms=ALL_AVAIL)
-
-        Details:
-
-            return an editable array (a carray object) that represents all
-            alleles of an individual. If ploidy or chroms is given, only
-            alleles on the specified chromosomes and homologous copy of
-            chromosomes will be returned. If multiple chromosomes are
-            specified, there should not be gaps between chromosomes. This
-            function ignores type of chromosomes so it will return unused
-            alleles for sex and mitochondrial chromosomes.
-
-
-        """
-        return _simuPOP_ba.Individual_genotype(self, *args, **kwargs)
-
-
-    def mutants(self, *args, **kwargs) -> "simuPOP::pyMutantIterator":
-        """
-
-
-        Usage:
-
-            x.mutants(ploidy=ALL_AVAIL, chroms=ALL_AVAIL)
-
-        Details:
-
-            return an itertor that iterate through all mutants (non-zero
-            alleles) of an individual. Each mutant is presented as a tuple of
-            (index, value) where index is the index of mutant ranging from
-            zero to totNumLoci() * ploidy() - 1, so you will have to adjust
-            indexes to check multiple alleles at a locus. If ploidy or chroms
-            is given, only alleles on the specified chromosomes and homologous
-            copy of chromosomes will be iterated. If multiple chromosomes are
-            specified, there should not be gaps between chromosomes. This
-            function ignores type of chromosomes so it will return unused
-            alleles for sex and mitochondrial chromosomes.
-
-
-        """
-        return _simuPOP_ba.Individual_mutants(self, *args, **kwargs)
-
-
-    def lineage(self, *args, **kwargs) -> "PyObject *":
-        """
-
-
-        Usage:
-
-            x.lineage(ploidy=ALL_AVAIL, chroms=ALL_AVAIL)
-
-        Details:
-
-            return an editable array (a carray_lineage object) that represents
-            the lineages of all alleles of an individual. If ploidy or chroms
-            is given, only lineages on the specified chromosomes and
-            homologous copy of chromosomes will be returned. If multiple
-            chromosomes are specified, there should not be gaps between
-            chromosomes. This function ignores type of chromosomes so it will
-            return lineage of unused alleles for sex and mitochondrial
-            chromosomes. A None object will be returned for modules without
-            lineage information.
-
-
-        """
-        return _simuPOP_ba.Individual_lineage(self, *args, **kwargs)
-
-
-    def setGenotype(self, *args, **kwargs) -> "void":
-        """
-
-
-        Usage:
-
-            x.setGenotype(geno, ploidy=ALL_AVAIL, chroms=ALL_AVAIL)
-
-        Details:
-
-            Fill the genotype of an individual using a list of alleles geno.
-            If parameters ploidy and/or chroms are specified, alleles will be
-            copied to only all or specified chromosomes on selected homologous
-            copies of chromosomes. geno will be reused if its length is less
-            than number of alleles to be filled. This function ignores type of
-            chromosomes so it will set genotype for unused alleles for sex and
-            mitochondrial chromosomes.
-
-
-        """
-        return _simuPOP_ba.Individual_setGenotype(self, *args, **kwargs)
-
-
-    def setLineage(self, *args, **kwargs) -> "void":
-        """
-
-
-        Usage:
-
-            x.setLineage(lineage, ploidy=ALL_AVAIL, chroms=ALL_AVAIL)
-
-        Details:
-
-            Fill the lineage of an individual using a list of IDs lineage. If
-            parameters ploidy and/or chroms are specified, lineages will be
-            copied to only all or specified chromosomes on selected homologous
-            copies of chromosomes. lineage will be reused if its length is
-            less than number of allelic lineage to be filled. This function
-            ignores type of chromosomes so it will set lineage to unused
-            alleles for sex and mitochondrial chromosomes. It does nothing for
-            modules without lineage information.
-
-
-        """
-        return _simuPOP_ba.Individual_setLineage(self, *args, **kwargs)
-
-
-    def sex(self) -> "Sex":
-        """
-
-
-        Usage:
-
-            x.sex()
-
-        Details:
-
-            return the sex of an individual, 1 for male and 2 for female.
-
-
-        """
-        return _simuPOP_ba.Individual_sex(self)
-
-
-    def setSex(self, sex: 'Sex') -> "void":
-        """
-
-
-        Usage:
-
-            x.setSex(sex)
-
-        Details:
-
-            set individual sex to MALE or FEMALE.
-
-
-        """
-        return _simuPOP_ba.Individual_setSex(self, sex)
-
-
-    def affected(self) -> "bool":
-        """
-
-
-        Usage:
-
-            x.affected()
-
-        Details:
-
-            Return True if this individual is affected.
-
-
-        """
-        return _simuPOP_ba.Individual_affected(self)
-
-
-    def setAffected(self, affected: 'bool') -> "void":
-        """
-
-
-        Usage:
-
-            x.setAffected(affected)
-
-        Details:
-
-            set affection status to affected (True or False).
-
-
-        """
-        return _simuPOP_ba.Individual_setAffected(self, affected)
-
-
-    def info(self, field: 'uintString') -> "double":
-        """
-
-
-        Usage:
-
-            x.info(field)
-
-        Details:
-
-            Return the value of an information field filed (by index or name).
-            ind.info(name) is equivalent to ind.name although the function
-            form allows the use of indexes of information fieldes.
-
-
-        """
-        return _simuPOP_ba.Individual_info(self, field)
-
-
-    def setInfo(self, value: 'double', field: 'uintString') -> "void":
-        """
-
-
-        Usage:
-
-            x.setInfo(value, field)
-
-        Details:
-
-            set the value of an information field field (by index or name) to
-            value. ind.setInfo(value, field) is equivalent to ind.field =
-            value although the function form allows the use of indexes of
-            information fieldes.
-
-
-        """
-        return _simuPOP_ba.Individual_setInfo(self, value, field)
-
-Individual.allele = new_instancemethod(_simuPOP_ba.Individual_allele, None, Individual)
-Individual.alleleChar = new_instancemethod(_simuPOP_ba.Individual_alleleChar, None, Individual)
-Individual.setAllele = new_instancemethod(_simuPOP_ba.Individual_setAllele, None, Individual)
-Individual.alleleLineage = new_instancemethod(_simuPOP_ba.Individual_alleleLineage, None, Individual)
-Individual.setAlleleLineage = new_instancemethod(_simuPOP_ba.Individual_setAlleleLineage, None, Individual)
-Individual.genotype = new_instancemethod(_simuPOP_ba.Individual_genotype, None, Individual)
-Individual.mutants = new_instancemethod(_simuPOP_ba.Individual_mutants, None, Individual)
-Individual.lineage = new_instancemethod(_simuPOP_ba.Individual_lineage, None, Individual)
-Individual.setGenotype = new_instancemethod(_simuPOP_ba.Individual_setGenotype, None, Individual)
-Individual.setLineage = new_instancemethod(_simuPOP_ba.Individual_setLineage, None, Individual)
-Individual.sex = new_instancemethod(_simuPOP_ba.Individual_sex, None, Individual)
-Individual.setSex = new_instancemethod(_simuPOP_ba.Individual_setSex, None, Individual)
-Individual.affected = new_instancemethod(_simuPOP_ba.Individual_affected, None, Individual)
-Individual.setAffected = new_instancemethod(_simuPOP_ba.Individual_setAffected, None, Individual)
-Individual.info = new_instancemethod(_simuPOP_ba.Individual_info, None, Individual)
-Individual.setInfo = new_instancemethod(_simuPOP_ba.Individual_setInfo, None, Individual)
-Individual.genoEnd = new_instancemethod(_simuPOP_ba.Individual_genoEnd, None, Individual)
-Individual.__eq__ = new_instancemethod(_simuPOP_ba.Individual___eq__, None, Individual)
-Individual.__ne__ = new_instancemethod(_simuPOP_ba.Individual___ne__, None, Individual)
-Individual.__cmp__ = new_instancemethod(_simuPOP_ba.Individual___cmp__, None, Individual)
-Individual_swigregister = _simuPOP_ba.Individual_swigregister
-Individual_swigregister(Individual)
-
-class vspID(object):
-    """
-
-
-    Details:
-
-        A class to specify virtual subpopulation, which is composed of a
-        subpopulation ID and a virtual subpopulation ID.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args):
-        """
-
-
-        Usage:
-
-            vspID(id)
-
-        Details:
-
-            Create a subpopulation id. Accept id as well as names.
-
-
-        """
-        _simuPOP_ba.vspID_swiginit(self, _simuPOP_ba.new_vspID(*args))
-    __swig_destroy__ = _simuPOP_ba.delete_vspID
-
-    def resolve(self, pop: 'Population') -> "simuPOP::vspID":
-        """
-
-
-        Usage:
-
-            x.resolve(pop)
-
-
-        """
-        return _simuPOP_ba.vspID_resolve(self, pop)
-
-vspID.__eq__ = new_instancemethod(_simuPOP_ba.vspID___eq__, None, vspID)
-vspID.resolve = new_instancemethod(_simuPOP_ba.vspID_resolve, None, vspID)
-vspID_swigregister = _simuPOP_ba.vspID_swigregister
-vspID_swigregister(vspID)
-
-
-def __lshift__(out: 'ostream &', vsp: 'vspID') -> "ostream &":
-    return _simuPOP_ba.__lshift__(out, vsp)
-__lshift__ = _simuPOP_ba.__lshift__
-class subPopList(object):
-    """
-
-
-    Details:
-
-        A class to specify (virtual) subpopulation list. Using a dedicated
-        class allows users to specify a single subpopulation, or a list of
-        (virutal) subpoulations easily.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, obj: 'PyObject *'=None):
-        """
-
-
-        Usage:
-
-            subPopList(obj=None)
-
-
-        """
-        _simuPOP_ba.subPopList_swiginit(self, _simuPOP_ba.new_subPopList(obj))
-
-    def expandFrom(self, pop: 'Population') -> "simuPOP::subPopList":
-        """
-
-
-        Description:
-
-            expand ALL_AVAIL and [(ALL_AVAIL, vsp), ...] according to pop
-
-        Usage:
-
-            x.expandFrom(pop)
-
-
-        """
-        return _simuPOP_ba.subPopList_expandFrom(self, pop)
-
-    __swig_destroy__ = _simuPOP_ba.delete_subPopList
-subPopList.__len__ = new_instancemethod(_simuPOP_ba.subPopList___len__, None, subPopList)
-subPopList.push_back = new_instancemethod(_simuPOP_ba.subPopList_push_back, None, subPopList)
-subPopList.begin = new_instancemethod(_simuPOP_ba.subPopList_begin, None, subPopList)
-subPopList.end = new_instancemethod(_simuPOP_ba.subPopList_end, None, subPopList)
-subPopList.expandFrom = new_instancemethod(_simuPOP_ba.subPopList_expandFrom, None, subPopList)
-subPopList_swigregister = _simuPOP_ba.subPopList_swigregister
-subPopList_swigregister(subPopList)
-
-class BaseVspSplitter(object):
-    """
-
-
-    Details:
-
-        This class is the base class of all virtual subpopulation (VSP)
-        splitters, which provide ways to define groups of individuals in a
-        subpopulation who share certain properties. A splitter defines a
-        fixed number of named VSPs. They do not have to add up to the
-        whole subpopulation, nor do they have to be distinct. After a
-        splitter is assigned to a population, many functions and operators
-        can be applied to individuals within specified VSPs.  Each VSP has
-        a name. A default name is determined by each splitter but you can
-        also assign a name to each VSP. The name of a VSP can be retrieved
-        by function BaseVspSplitter.name() or Population.subPopName().
-        Only one VSP splitter can be assigned to a population, which
-        defined VSPs for all its subpopulations. If different splitters
-        are needed for different subpopulations, a CombinedSplitter can be
-        used.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-
-    def __init__(self, *args, **kwargs):
-        raise AttributeError("No constructor defined - class is abstract")
-    __repr__ = _swig_repr
-
-    def clone(self) -> "simuPOP::BaseVspSplitter *":
-        """
-
-
-        Usage:
-
-            x.clone()
-
-        Details:
-
-            All VSP splitter defines a clone() function to create an identical
-            copy of itself.
-
-
-        """
-        return _simuPOP_ba.BaseVspSplitter_clone(self)
-
-    __swig_destroy__ = _simuPOP_ba.delete_BaseVspSplitter
-
-    def numVirtualSubPop(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.numVirtualSubPop()
-
-        Details:
-
-            Return the number of VSPs defined by this splitter.
-
-
-        """
-        return _simuPOP_ba.BaseVspSplitter_numVirtualSubPop(self)
-
-
-    def name(self, vsp: 'size_t') -> "string":
-        """
-
-
-        Usage:
-
-            x.name(vsp)
-
-        Details:
-
-            Return the name of VSP vsp (an index between 0 and
-            numVirtualSubPop()).
-
-
-        """
-        return _simuPOP_ba.BaseVspSplitter_name(self, vsp)
-
-
-    def vspByName(self, name: 'string const &') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.vspByName(name)
-
-        Details:
-
-            Return the index of a virtual subpopulation from its name. If
-            multiple virtual subpopulations share the same name, the first vsp
-            is returned.
-
-
-        """
-        return _simuPOP_ba.BaseVspSplitter_vspByName(self, name)
-
-BaseVspSplitter.clone = new_instancemethod(_simuPOP_ba.BaseVspSplitter_clone, None, BaseVspSplitter)
-BaseVspSplitter.numVirtualSubPop = new_instancemethod(_simuPOP_ba.BaseVspSplitter_numVirtualSubPop, None, BaseVspSplitter)
-BaseVspSplitter.name = new_instancemethod(_simuPOP_ba.BaseVspSplitter_name, None, BaseVspSplitter)
-BaseVspSplitter.vspByName = new_instancemethod(_simuPOP_ba.BaseVspSplitter_vspByName, None, BaseVspSplitter)
-BaseVspSplitter_swigregister = _simuPOP_ba.BaseVspSplitter_swigregister
-BaseVspSplitter_swigregister(BaseVspSplitter)
-
-class CombinedSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This splitter takes several splitters and stacks their VSPs
-        together. For example, if the first splitter defines 3 VSPs and
-        the second splitter defines 2, the two VSPs from the second
-        splitter become the fourth (index 3) and the fifth (index 4) VSPs
-        of the combined splitter. In addition, a new set of VSPs could be
-        defined as the union of one or more of the original VSPs. This
-        splitter is usually used to define different types of VSPs to a
-        population.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            CombinedSplitter(splitters=[], vspMap=[], names=[])
-
-        Details:
-
-            Create a combined splitter using a list of splitters. For example,
-            CombinedSplitter([SexSplitter(), AffectionSplitter()]) defines a
-            combined splitter with four VSPs, defined by male (vsp 0), female
-            (vsp 1), unaffected (vsp 2) and affected individuals (vsp 3).
-            Optionally, a new set of VSPs could be defined by parameter
-            vspMap. Each item in this parameter is a list of VSPs that will be
-            combined to a single VSP. For example, vspMap=[(0, 2), (1, 3)] in
-            the previous example will define two VSPs defined by male or
-            unaffected, and female or affected individuals. VSP names are
-            usually determined by splitters, but can also be specified using
-            parameter names.
-
-
-        """
-        _simuPOP_ba.CombinedSplitter_swiginit(self, _simuPOP_ba.new_CombinedSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_CombinedSplitter
-CombinedSplitter_swigregister = _simuPOP_ba.CombinedSplitter_swigregister
-CombinedSplitter_swigregister(CombinedSplitter)
-
-class ProductSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This splitter takes several splitters and take their intersections
-        as new VSPs. For example, if the first splitter defines 3 VSPs and
-        the second splitter defines 2, 6 VSPs will be defined by splitting
-        3 VSPs defined by the first splitter each to two VSPs. This
-        splitter is usually used to define finer VSPs from existing VSPs.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            ProductSplitter(splitters=[], names=[])
-
-        Details:
-
-            Create a product splitter using a list of splitters. For example,
-            ProductSplitter([SexSplitter(), AffectionSplitter()]) defines four
-            VSPs by male unaffected, male affected, female unaffected, and
-            female affected individuals. VSP names are usually determined by
-            splitters, but can also be specified using parameter names.
-
-
-        """
-        _simuPOP_ba.ProductSplitter_swiginit(self, _simuPOP_ba.new_ProductSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_ProductSplitter
-ProductSplitter_swigregister = _simuPOP_ba.ProductSplitter_swigregister
-ProductSplitter_swigregister(ProductSplitter)
-
-class SexSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This splitter defines two VSPs by individual sex. The first VSP
-        consists of all male individuals and the second VSP consists of
-        all females in a subpopulation.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            SexSplitter(names=[])
-
-        Details:
-
-            Create a sex splitter that defines male and female VSPs. These
-            VSPs are named Male and Female unless a new set of names are
-            specified by parameter names.
-
-
-        """
-        _simuPOP_ba.SexSplitter_swiginit(self, _simuPOP_ba.new_SexSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_SexSplitter
-SexSplitter_swigregister = _simuPOP_ba.SexSplitter_swigregister
-SexSplitter_swigregister(SexSplitter)
-
-class AffectionSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This class defines two VSPs according individual affection status.
-        The first VSP consists of unaffected invidiauls and the second VSP
-        consists of affected ones.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            AffectionSplitter(names=[])
-
-        Details:
-
-            Create a splitter that defined two VSPs by affection status.These
-            VSPs are named Unaffected and Affected unless a new set of names
-            are specified by parameter names.
-
-
-        """
-        _simuPOP_ba.AffectionSplitter_swiginit(self, _simuPOP_ba.new_AffectionSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_AffectionSplitter
-AffectionSplitter_swigregister = _simuPOP_ba.AffectionSplitter_swigregister
-AffectionSplitter_swigregister(AffectionSplitter)
-
-class InfoSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This splitter defines VSPs according to the value of an
-        information field of each indivdiual. A VSP is defined either by a
-        value or a range of values.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            InfoSplitter(field, values=[], cutoff=[], ranges=[], names=[])
-
-        Details:
-
-            Create an infomration splitter using information field field. If
-            parameter values is specified, each item in this list defines a
-            VSP in which all individuals have this value at information field
-            field. If a set of cutoff values are defined in parameter cutoff,
-            individuals are grouped by intervals defined by these cutoff
-            values. For example, cutoff=[1,2] defines three VSPs with v < 1, 1
-            <= v < 2 and v >=2 where v is the value of an individual at
-            information field field. If parameter ranges is specified, each
-            range defines a VSP. For example, ranges=[[1, 3], [2, 5]] defines
-            two VSPs with 1 <= v < 3 and 2 <= 3 < 5. Of course, only one of
-            the parameters values, cutoff and ranges should be defined, and
-            values in cutoff should be distinct, and in an increasing order. A
-            default set of names are given to each VSP unless a new set of
-            names is given by parameter names.
-
-
-        """
-        _simuPOP_ba.InfoSplitter_swiginit(self, _simuPOP_ba.new_InfoSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_InfoSplitter
-InfoSplitter_swigregister = _simuPOP_ba.InfoSplitter_swigregister
-InfoSplitter_swigregister(InfoSplitter)
-
-class ProportionSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This splitter divides subpopulations into several VSPs by
-        proportion.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            ProportionSplitter(proportions=[], names=[])
-
-        Details:
-
-            Create a splitter that divides subpopulations by proportions,
-            which should be a list of float numbers (between 0 and 1) that add
-            up to 1. A default set of names are given to each VSP unless a new
-            set of names is given by parameter names.
-
-
-        """
-        _simuPOP_ba.ProportionSplitter_swiginit(self, _simuPOP_ba.new_ProportionSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_ProportionSplitter
-ProportionSplitter_swigregister = _simuPOP_ba.ProportionSplitter_swigregister
-ProportionSplitter_swigregister(ProportionSplitter)
-
-class RangeSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This class defines a splitter that groups individuals in certain
-        ranges into VSPs.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            RangeSplitter(ranges, names=[])
-
-        Details:
-
-            Create a splitter according to a number of individual ranges
-            defined in ranges. For example, RangeSplitter(ranges=[[0, 20],
-            [40, 50]]) defines two VSPs. The first VSP consists of individuals
-            0, 1, ..., 19, and the sceond VSP consists of individuals 40, 41,
-            ..., 49. Note that a nested list has to be used even if only one
-            range is defined. A default set of names are given to each VSP
-            unless a new set of names is given by parameter names.
-
-
-        """
-        _simuPOP_ba.RangeSplitter_swiginit(self, _simuPOP_ba.new_RangeSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_RangeSplitter
-RangeSplitter_swigregister = _simuPOP_ba.RangeSplitter_swigregister
-RangeSplitter_swigregister(RangeSplitter)
-
-class GenotypeSplitter(BaseVspSplitter):
-    """
-
-
-    Details:
-
-        This class defines a VSP splitter that defines VSPs according to
-        individual genotype at specified loci.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            GenotypeSplitter(loci, alleles, phase=False, names=[])
-
-        Details:
-
-            Create a splitter that defines VSPs by individual genotype at loci
-            (can be indexes or names of one or more loci). Each list in a list
-            allele defines a VSP, which is a list of allowed alleles at these
-            loci. If only one VSP is defined, the outer list of the nested
-            list can be ignored. If phase if true, the order of alleles in
-            each list is significant. If more than one set of alleles are
-            given, Individuals having either of them is qualified.  For
-            example, in a haploid population, loci=1, alleles=[0, 1] defines a
-            VSP with individuals having allele 0 or 1 at locus 1, alleles=[[0,
-            1], [2]] defines two VSPs with indivdiuals in the second VSP
-            having allele 2 at locus 1. If multiple loci are involved, alleles
-            at each locus need to be defined. For example, VSP defined by
-            loci=[0, 1], alleles=[0, 1, 1, 1] consists of individuals having
-            alleles [0, 1] or [1, 1] at loci [0, 1].  In a haploid population,
-            loci=1, alleles=[0, 1] defines a VSP with individuals having
-            genotype [0, 1] or [1, 0] at locus 1. alleles[[0, 1], [2, 2]]
-            defines two VSPs with indivdiuals in the second VSP having
-            genotype [2, 2] at locus 1. If phase is set to True, the first VSP
-            will only has individuals with genotype [0, 1]. In the multiple
-            loci case, alleles should be arranged by haplotypes, for example,
-            loci=[0, 1], alleles=[0, 0, 1, 1], phase=True defines a VSP with
-            individuals having genotype -0-0-, -1-1- at loci 0 and 1. If
-            phase=False (default), genotypes -1-1-, -0-0-, -0-1- and -1-0- are
-            all allowed.  A default set of names are given to each VSP unless
-            a new set of names is given by parameter names.
-
-
-        """
-        _simuPOP_ba.GenotypeSplitter_swiginit(self, _simuPOP_ba.new_GenotypeSplitter(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_GenotypeSplitter
-GenotypeSplitter_swigregister = _simuPOP_ba.GenotypeSplitter_swigregister
-GenotypeSplitter_swigregister(GenotypeSplitter)
-
-class pyIndIterator(object):
-    """
-
-
-    Details:
-
-        this class implements a Python itertor class that can be used to
-        iterate through individuals in a (sub)population. If allInds are
-        true, visiblility of individuals will not be checked. Otherwise, a
-        functor will be used to check if indiviudals belong to a specified
-        virtual subpopulation.  An instance of this class is returned by
-        population::Individuals() and Population::Individuals(subPop)
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, begin: 'vector< simuPOP::Individual,std::allocator< simuPOP::Individual > >::iterator const', end: 'vector< simuPOP::Individual,std::allocator< simuPOP::Individual > >::iterator const', allInds: 'bool', func: 'simuPOP::vspFunctor'):
-        """
-
-
-        Usage:
-
-            pyIndIterator(begin, end, allInds, func)
-
-
-        """
-        _simuPOP_ba.pyIndIterator_swiginit(self, _simuPOP_ba.new_pyIndIterator(begin, end, allInds, func))
-    __swig_destroy__ = _simuPOP_ba.delete_pyIndIterator
-
-    def next(self) -> "simuPOP::Individual &":
-        """
-
-
-        Usage:
-
-            x.__next__()
-
-
-        """
-        return _simuPOP_ba.pyIndIterator_next(self)
-
-pyIndIterator.__iter__ = new_instancemethod(_simuPOP_ba.pyIndIterator___iter__, None, pyIndIterator)
-pyIndIterator.next = new_instancemethod(_simuPOP_ba.pyIndIterator_next, None, pyIndIterator)
-pyIndIterator.__next__ = new_instancemethod(_simuPOP_ba.pyIndIterator___next__, None, pyIndIterator)
-pyIndIterator_swigregister = _simuPOP_ba.pyIndIterator_swigregister
-pyIndIterator_swigregister(pyIndIterator)
-
-class Population(GenoStruTrait):
-    """
-
-
-    Details:
-
-        A simuPOP population consists of individuals of the same genotypic
-        structure, organized by generations, subpopulations and virtual
-        subpopulations. It also contains a Python dictionary that is used
-        to store arbitrary population variables.  In addition to genotypic
-        structured related functions provided by the GenoStruTrait class,
-        the population class provides a large number of member functions
-        that can be used to
-        *   Create, copy and compare populations.
-        *   Manipulate subpopulations. A population can be divided into
-        several subpopulations. Because individuals only mate with
-        individuals within the same subpopulation, exchange of genetic
-        information across subpopulations can only be done through
-        migration. A number of functions are provided to access
-        subpopulation structure information, and to merge and split
-        subpopulations.
-        *   Define and access virtual subpopulations. A virtual
-        subpopulation splitter can be assigned to a population, which
-        defines groups of individuals called virtual subpopulations (VSP)
-        within each subpopulation.
-        *   Access individuals individually, or through iterators that
-        iterate through individuals in (virtual) subpopulations.
-        *   Access genotype and information fields of individuals at the
-        population level. From a population point of view, all genotypes
-        are arranged sequentially individual by individual. Please refer
-        to class Individual for an introduction to genotype arragement of
-        each individual.
-        *   Store and access ancestral generations. A population can save
-        arbitrary number of ancestral generations. It is possible to
-        directly access an ancestor, or make an ancestral generation the
-        current generation for more efficient access.
-        *   Insert or remove loci, resize (shrink or expand) a population,
-        sample from a population, or merge with other populations.
-        *   Manipulate population variables and evaluate expressions in
-        this local namespace.
-        *   Save and load a population.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            Population(size=[], ploidy=2, loci=[], chromTypes=[],
-              lociPos=[], ancGen=0, chromNames=[], alleleNames=[],
-              lociNames=[], subPopNames=[], infoFields=[])
-
-        Details:
-
-            The following parameters are used to create a population object:
-
-        Arguments:
-
-            size:           A list of subpopulation sizes. The length of this
-                            list determines the number of subpopulations of
-                            this population. If there is no subpopulation,
-                            size=[popSize] can be written as size=popSize.
-            ploidy:         Number of homologous sets of chromosomes. Default
-                            to 2 (diploid). For efficiency considerations, all
-                            chromosomes have the same number of homologous
-                            sets, even if some customized chromosomes or some
-                            individuals (e.g. males in a haplodiploid
-                            population) have different numbers of homologous
-                            sets. The first case is handled by setting
-                            chromTypes of each chromosome. Only the
-                            haplodiploid populations are handled for the
-                            second case, for which ploidy=HAPLODIPLOID should
-                            be used.
-            loci:           A list of numbers of loci on each chromosome. The
-                            length of this parameter determines the number of
-                            chromosomes. If there is only one chromosome,
-                            numLoci instead of [numLoci] can be used.
-            chromTypes:     A list that specifies the type of each chromosome,
-                            which can be AUTOSOME, CHROMOSOME_X, CHROMOSOME_Y,
-                            or CUSTOMIZED. All chromosomes are assumed to be
-                            autosomes if this parameter is ignored. Sex
-                            chromosome can only be specified in a diploid
-                            population where the sex of an individual is
-                            determined by the existence of these chromosomes
-                            using the XX (FEMALE) and XY (MALE) convention.
-                            Both sex chromosomes have to be available and be
-                            specified only once. Because chromosomes X and Y
-                            are treated as two chromosomes, recombination on
-                            the pseudo-autosomal regions of the sex chromsomes
-                            is not supported. CUSTOMIZED chromosomes are
-                            special chromosomes whose inheritance patterns are
-                            undefined. They rely on user-defined functions and
-                            operators to be passed from parents to offspring.
-                            Multiple customized chromosomes have to be
-                            arranged consecutively.
-            lociPos:        Positions of all loci on all chromosome, as a list
-                            of float numbers. Default to 1, 2, ... etc on each
-                            chromosome. lociPos should be arranged chromosome
-                            by chromosome. If lociPos are not in order within
-                            a chromosome, they will be re-arranged along with
-                            corresponding lociNames (if specified).
-            ancGen:         Number of the most recent ancestral generations to
-                            keep during evolution. Default to 0, which means
-                            only the current generation will be kept. If it is
-                            set to -1, all ancestral generations will be kept
-                            in this population (and exhaust your computer RAM
-                            quickly).
-            chromNames:     A list of chromosome names. Default to '' for all
-                            chromosomes.
-            alleleNames:    A list or a nested list of allele names. If a list
-                            of alleles is given, it will be used for all loci
-                            in this population. For example,
-                            alleleNames=('A','C','T','G') gives names A, C, T,
-                            and G to alleles 0, 1, 2, and 3 respectively. If a
-                            nested list of names is given, it should specify
-                            alleles names for all loci.
-            lociNames:      A list of names for each locus. It can be empty or
-                            a list of unique names for each locus. If loci are
-                            not specified in order, loci names will be
-                            rearranged according to their position on the
-                            chromosome.
-            subPopNames:    A list of subpopulation names. All subpopulations
-                            will have name '' if this parameter is not
-                            specified.
-            infoFields:     Names of information fields (named float number)
-                            that will be attached to each individual.
-
-
-        """
-        _simuPOP_ba.Population_swiginit(self, _simuPOP_ba.new_Population(*args, **kwargs))
-
-    def clone(self) -> "simuPOP::Population *":
-        """
-
-
-        Usage:
-
-            x.clone()
-
-        Details:
-
-            Create a cloned copy of a population. Note that Python statement
-            pop1 = pop only creates a reference to an existing population pop.
-
-
-        """
-        return _simuPOP_ba.Population_clone(self)
-
-
-    def swap(self, rhs: 'Population') -> "void":
-        """
-
-
-        Usage:
-
-            x.swap(rhs)
-
-        Details:
-
-            Swap the content of two population objects, which can be handy in
-            some particular circumstances. For example, you could swap out a
-            population in a simulator.
-
-
-        """
-        return _simuPOP_ba.Population_swap(self, rhs)
-
-    __swig_destroy__ = _simuPOP_ba.delete_Population
-
-    def virtualSplitter(self) -> "simuPOP::BaseVspSplitter *":
-        """
-
-
-        Usage:
-
-            x.virtualSplitter()
-
-        Details:
-
-            Return the virtual splitter associated with the population, None
-            will be returned if there is no splitter.
-
-
-        """
-        return _simuPOP_ba.Population_virtualSplitter(self)
-
-
-    def setVirtualSplitter(self, splitter: 'BaseVspSplitter') -> "void":
-        """
-
-
-        Usage:
-
-            x.setVirtualSplitter(splitter)
-
-        Details:
-
-            Set a VSP splitter to the population, which defines the same VSPs
-            for all subpopulations. If different VSPs are needed for different
-            subpopulations, a CombinedSplitter can be used to make these VSPs
-            available to all subpopulations.
-
-
-        """
-        return _simuPOP_ba.Population_setVirtualSplitter(self, splitter)
-
-
-    def numVirtualSubPop(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.numVirtualSubPop()
-
-        Details:
-
-            Return the number of virtual subpopulations (VSP) defined by a VSP
-            splitter. Return 0 if no VSP is defined.
-
-
-        """
-        return _simuPOP_ba.Population_numVirtualSubPop(self)
-
-
-    def activateVirtualSubPop(self, subPop: 'vspID') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_activateVirtualSubPop(self, subPop)
-
-
-    def deactivateVirtualSubPop(self, subPop: 'size_t') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_deactivateVirtualSubPop(self, subPop)
-
-
-    def fitGenoStru(self, stru: 'size_t') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_fitGenoStru(self, stru)
-
-
-    def setSubPopStru(self, newSubPopSizes: 'vectoru const &', newSubPopNames: 'vectorstr const &') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_setSubPopStru(self, newSubPopSizes, newSubPopNames)
-
-
-    def numSubPop(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.numSubPop()
-
-        Details:
-
-            Return the number of subpopulations in a population. Return 1 if
-            there is no subpopulation structure.
-
-
-        """
-        return _simuPOP_ba.Population_numSubPop(self)
-
-
-    def subPopSize(self, *args, **kwargs) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.subPopSize(subPop=[], ancGen=-1, sex=ANY_SEX)
-
-        Details:
-
-            Return the size of a subpopulation (subPopSize(sp)) or a virtual
-            subpopulation (subPopSize([sp, vsp])) in the current generation
-            (default) or a specified ancestral generation ancGen. If no subpop
-            is given, it is the same as popSize(ancGen, sex). Population and
-            virtual subpopulation names can be used. This function by default
-            returns number of all individuals (sex=ANY_SEX), but it will
-            return number of males (if sex=MALE_ONLY), number of females (if
-            sex=MALE_ONLY), and number of male/female pairs (if sex=PAIR_ONLY)
-            which is essentially less of the number of males and females.
-            <group>2-subpopsize</grouplociList()>
-
-
-        """
-        return _simuPOP_ba.Population_subPopSize(self, *args, **kwargs)
-
-
-    def subPopByName(self, name: 'string const &') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.subPopByName(name)
-
-        Details:
-
-            Return the index of the first subpopulation with name name. An
-            IndexError will be raised if subpopulations are not named, or if
-            no subpopulation with name name is found. Virtual subpopulation
-            name is not supported.
-
-
-        """
-        return _simuPOP_ba.Population_subPopByName(self, name)
-
-
-    def subPopName(self, subPop: 'vspID') -> "string":
-        """
-
-
-        Usage:
-
-            x.subPopName(subPop)
-
-        Details:
-
-            Return the "spName - vspName" (virtual named subpopulation), ""
-            (unnamed non-virtual subpopulation), "spName" (named
-            subpopulation) or "vspName" (unnamed virtual subpopulation),
-            depending on whether subpopulation is named or if subPop is
-            virtual.
-
-
-        """
-        return _simuPOP_ba.Population_subPopName(self, subPop)
-
-
-    def subPopNames(self) -> "vectorstr":
-        """
-
-
-        Usage:
-
-            x.subPopNames()
-
-        Details:
-
-            Return the names of all subpopulations (excluding virtual
-            subpopulations). An empty string will be returned for unnamed
-            subpopulations.
-
-
-        """
-        return _simuPOP_ba.Population_subPopNames(self)
-
-
-    def setSubPopName(self, name: 'string const &', subPop: 'size_t') -> "void":
-        """
-
-
-        Usage:
-
-            x.setSubPopName(name, subPop)
-
-        Details:
-
-            Assign a name name to subpopulation subPop. Note that
-            subpopulation names do not have to be unique.
-
-
-        """
-        return _simuPOP_ba.Population_setSubPopName(self, name, subPop)
-
-
-    def subPopSizes(self, ancGen: 'int'=-1) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.subPopSizes(ancGen=-1)
-
-        Details:
-
-            Return the sizes of all subpopulations at the current generation
-            (default) or specified ancestral generation ancGen. Virtual
-            subpopulations are not considered.
-
-
-        """
-        return _simuPOP_ba.Population_subPopSizes(self, ancGen)
-
-
-    def popSize(self, ancGen: 'int'=-1, sex: 'SexChoice'=ANY_SEX) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.popSize(ancGen=-1, sex=ANY_SEX)
-
-        Details:
-
-            Return the total number of individuals in all subpopulations of
-            the current generation (default) or the an ancestral generation
-            ancGen. This function by default returns number of all individuals
-            (sex=ANY_SEX), but it will return number of males (if
-            sex=MALE_ONLY), number of females (if sex=MALE_ONLY), and number
-            of male/female pairs (if sex=PAIR_ONLY) which is essentially less
-            of the number of males and females.
-
-
-        """
-        return _simuPOP_ba.Population_popSize(self, ancGen, sex)
-
-
-    def absIndIndex(self, idx: 'size_t', subPop: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.absIndIndex(idx, subPop)
-
-        Details:
-
-            return the absolute index of an individual idx in subpopulation
-            subPop.
-
-
-        """
-        return _simuPOP_ba.Population_absIndIndex(self, idx, subPop)
-
-
-    def subPopIndPair(self, idx: 'size_t') -> "pairu":
-        """
-
-
-        Usage:
-
-            x.subPopIndPair(idx)
-
-        Details:
-
-            Return the subpopulation ID and relative index of an individual,
-            given its absolute index idx.
-
-
-        """
-        return _simuPOP_ba.Population_subPopIndPair(self, idx)
-
-
-    def subPopBegin(self, subPop: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.subPopBegin(subPop)
-
-        Details:
-
-            Return the index of the first individual in subpopulation subPop.
-
-
-        """
-        return _simuPOP_ba.Population_subPopBegin(self, subPop)
-
-
-    def subPopEnd(self, subPop: 'size_t') -> "size_t":
-        """
-
-
-        Usage:
-
-            x.subPopEnd(subPop)
-
-        Details:
-
-            Return the index of the last individual in subpopulation subPop
-            plus 1, so that range(subPopBegin(subPop), subPopEnd(subPop) can
-            iterate through the index of all individuals in subpopulation
-            subPop.
-
-
-        """
-        return _simuPOP_ba.Population_subPopEnd(self, subPop)
-
-
-    def individual(self, *args) -> "simuPOP::Individual &":
-        """
-
-
-        Usage:
-
-            x.individual(idx, subPop=[])
-
-        Details:
-
-            Return a refernce to individual idx in the population (if
-            subPop=[], default) or a subpopulation (if subPop=sp). Virtual
-            subpopulation is not supported. Note that a float idx is
-            acceptable as long as it rounds closely to an integer.
-
-
-        """
-        return _simuPOP_ba.Population_individual(self, *args)
-
-
-    def indByID(self, *args, **kwargs) -> "simuPOP::Individual &":
-        """
-
-
-        Usage:
-
-            x.indByID(id, ancGens=ALL_AVAIL, idField="ind_id")
-
-        Details:
-
-            Return a reference to individual with id stored in information
-            field idField (default to ind_id). This function by default search
-            the present and all ancestral generations (ancGen=ALL_AVAIL), but
-            you can limit the search in specific generations if you know which
-            generations to search (ancGens=[0,1] for present and parental
-            generations) or UNSPECIFIED to search only the current generation.
-            If no individual with id is found, an IndexError will be raised. A
-            float id is acceptable as long as it rounds closely to an integer.
-            Note that this function uses a dynamic searching algorithm which
-            tends to be slow. If you need to look for multiple individuals
-            from a static population, you might want to convert a population
-            object to a pedigree object and use function Pedigree.indByID.
-
-
-        """
-        return _simuPOP_ba.Population_indByID(self, *args, **kwargs)
-
-
-    def ancestor(self, *args, **kwargs) -> "simuPOP::Individual &":
-        """
-
-
-        Usage:
-
-            x.ancestor(idx, gen, subPop=[])
-
-        Details:
-
-            Return a reference to individual idx in ancestral generation gen.
-            The correct individual will be returned even if the current
-            generation is not the present one (see also useAncestralGen). If a
-            valid subPop is specified, index is relative to that subPop.
-            Virtual subpopulation is not supported. Note that a float idx is
-            acceptable as long as it rounds closely to an integer.
-
-
-        """
-        return _simuPOP_ba.Population_ancestor(self, *args, **kwargs)
-
-
-    def individuals(self, *args, **kwargs) -> "simuPOP::pyIndIterator":
-        """
-
-
-        Usage:
-
-            x.individuals(subPop=[])
-
-        Details:
-
-            Return an iterator that can be used to iterate through all
-            individuals in a population (if subPop=[], default), or a
-            (virtual) subpopulation (subPop=spID or (spID, vspID)). If you
-            would like to iterate through multiple subpopulations in multiple
-            ancestral generations, please use function
-            Population.allIndividuals().
-
-
-        """
-        return _simuPOP_ba.Population_individuals(self, *args, **kwargs)
-
-
-    def genotype(self, *args, **kwargs) -> "PyObject *":
-        """
-
-
-        Usage:
-
-            x.genotype(subPop=[])
-
-        Details:
-
-            Return an editable array of the genotype of all individuals in a
-            population (if subPop=[], default), or individuals in a
-            subpopulation subPop. Virtual subpopulation is unsupported.
-
-
-        """
-        return _simuPOP_ba.Population_genotype(self, *args, **kwargs)
-
-
-    def mutants(self, *args, **kwargs) -> "simuPOP::pyMutantIterator":
-        """
-
-
-        Usage:
-
-            x.mutants(subPop=[])
-
-        Details:
-
-            Return an iterator that iterate through mutants of all individuals
-            in a population (if subPop=[], default), or individuals in a
-            subpopulation subPop. Virtual subpopulation is unsupported. Each
-            mutant is presented as a tuple of (index, value) where index is
-            the index of mutant (from 0 to totNumLoci()*ploidy()) so you will
-            have to adjust its value to check multiple alleles at a locus.
-            This function ignores type of chromosomes so non-zero alleles in
-            unused alleles of sex and mitochondrial chromosomes are also
-            iterated.
-
-
-        """
-        return _simuPOP_ba.Population_mutants(self, *args, **kwargs)
-
-
-    def lineage(self, *args, **kwargs) -> "PyObject *":
-        """
-
-
-        Usage:
-
-            x.lineage(subPop=[])
-
-        Details:
-
-            Return an editable array of the lineage of alleles for all
-            individuals in a population (if subPop=[], default), or
-            individuals in a subpopulation subPop. Virtual subpopulation is
-            unsupported. This function returns None for modules without
-            lineage information.
-
-
-        """
-        return _simuPOP_ba.Population_lineage(self, *args, **kwargs)
-
-
-    def setGenotype(self, *args, **kwargs) -> "void":
-        """
-
-
-        Usage:
-
-            x.setGenotype(geno, subPop=[])
-
-        Details:
-
-            Fill the genotype of all individuals in a population (if
-            subPop=[]) or in a (virtual) subpopulation subPop (if subPop=sp or
-            (sp, vsp)) using a list of alleles geno. geno will be reused if
-            its length is less than subPopSize(subPop)*totNumLoci()*ploidy().
-
-
-        """
-        return _simuPOP_ba.Population_setGenotype(self, *args, **kwargs)
-
-
-    def setLineage(self, *args, **kwargs) -> "void":
-        """
-
-
-        Usage:
-
-            x.setLineage(geno, subPop=[])
-
-        Details:
-
-            Fill the lineage of all individuals in a population (if subPop=[])
-            or in a (virtual) subpopulation subPop (if subPop=sp or (sp, vsp))
-            using a list of IDs lineage. lineage will be reused if its length
-            is less than subPopSize(subPop)*totNumLoci()*ploidy(). This
-            function returns directly for modules without lineage information.
-
-
-        """
-        return _simuPOP_ba.Population_setLineage(self, *args, **kwargs)
-
-
-    def sortIndividuals(self, infoFields: 'stringList', reverse: 'bool'=False) -> "void":
-        """
-
-
-        Usage:
-
-            x.sortIndividuals(infoFields, reverse=False)
-
-        Details:
-
-            Sort individuals according to values at specified information
-            fields (infoFields). Individuals will be sorted at an increasing
-            order unless reverse is set to true.
-
-
-        """
-        return _simuPOP_ba.Population_sortIndividuals(self, infoFields, reverse)
-
-
-    def setSubPopByIndInfo(self, field: 'string const &') -> "void":
-        """
-
-
-        Usage:
-
-            x.setSubPopByIndInfo(field)
-
-        Details:
-
-            Rearrange individuals to their new subpopulations according to
-            their integer values at information field field (value returned by
-            Individual::info(field)). individuals with negative values at this
-            field will be removed. Existing subpopulation names are kept. New
-            subpopulations will have empty names.
-
-
-        """
-        return _simuPOP_ba.Population_setSubPopByIndInfo(self, field)
-
-
-    def splitSubPop(self, *args, **kwargs) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.splitSubPop(subPop, sizes, names=[])
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-        Details:
+    def __init__(self, base: "GenoIterator", begin: "size_t", end: "size_t", step: "size_t"):
+        r"""
 
-            Split subpopulation subPop into subpopulations of given sizes,
-            which should add up to the size of subpopulation subPop or 1, in
-            which case sizes are treated as proportions. If subPop is not the
-            last subpopulation, indexes of subpopulations after subPop are
-            shifted. If subPop is named, the same name will be given to all
-            new subpopulations unless a new set of names are specified for
-            these subpopulations. This function returns the IDs of split
-            subpopulations.
 
+        Usage:
 
-        """
-        return _simuPOP_ba.Population_splitSubPop(self, *args, **kwargs)
+            pyMutantIterator(base, begin, end, step)
 
 
-    def removeSubPops(self, subPops: 'subPopList') -> "void":
         """
+        _simuPOP_ba.pyMutantIterator_swiginit(self, _simuPOP_ba.new_pyMutantIterator(base, begin, end, step))
+    __swig_destroy__ = _simuPOP_ba.delete_pyMutantIterator
+    __iter__ = _swig_new_instance_method(_simuPOP_ba.pyMutantIterator___iter__)
+    next = _swig_new_instance_method(_simuPOP_ba.pyMutantIterator_next)
+    __next__ = _swig_new_instance_method(_simuPOP_ba.pyMutantIterator___next__)
 
+# Register pyMutantIterator in _simuPOP_ba:
+_simuPOP_ba.pyMutantIterator_swigregister(pyMutantIterator)
 
-        Usage:
+class Individual(GenoStruTrait):
+    r"""
 
-            x.removeSubPops(subPops)
 
-        Details:
+    Details:
 
-            Remove (virtual) subpopulation(s) subPops and all their
-            individuals. This function can be used to remove complete
-            subpopulations (with shifted subpopulation indexes) or individuals
-            belonging to virtual subpopulations of a subpopulation. In the
-            latter case, the subpopulations are kept even if all individuals
-            have been removed. This function only handles the present
-            generation.
+        A Population consists of individuals with the same genotypic
+        structure. An Individual object cannot be created independently,
+        but refences to inidividuals can be retrieved using member
+        functions of a Population object. In addition to structural
+        information shared by all individuals in a population (provided by
+        class GenoStruTrait), the Individual class provides member
+        functions to get and set genotype, sex, affection status and
+        information fields of an individual.    Genotypes of an individual
+        are stored sequentially and can be accessed locus by locus, or in
+        batch. The alleles are arranged by position, chromosome and
+        ploidy. That is to say, the first allele on the first chromosome
+        of the first homologous set is followed by alleles at other loci
+        on the same chromsome, then markers on the second and later
+        chromosomes, followed by alleles on the second homologous set of
+        the chromosomes for a diploid individual. A consequence of this
+        memory layout is that alleles at the same locus of a non-haploid
+        individual are separated by Individual::totNumLoci() loci. It is
+        worth noting that access to invalid chromosomes, such as the Y
+        chromosomes of female individuals, is not restricted.
 
 
-        """
-        return _simuPOP_ba.Population_removeSubPops(self, subPops)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def removeIndividuals(self, *args, **kwargs) -> "void":
-        """
+    def __init__(self):
+        r"""
 
 
         Usage:
 
-            x.removeIndividuals(indexes=[], IDs=[], idField="ind_id",
-              filter=None)
+            Individual()
 
         Details:
 
-            remove individual(s) by absolute indexes (parameter index) or
-            their IDs (parameter IDs), or using a filter function (paramter
-            filter). If indexes are used, only individuals at the current
-            generation will be removed. If IDs are used, all individuals with
-            one of the IDs at information field idField (default to "ind_id")
-            will be removed. Although "ind_id" usually stores unique IDs of
-            individuals, this function is frequently used to remove groups of
-            individuals with the same value at an information field. An
-            IndexError will be raised if an index is out of bound, but no
-            error will be given if an invalid ID is specified. In the last
-            case, a user-defined function should be provided. This function
-            should accept parameter "ind" or one or more of the information
-            fields. All individuals, including ancestors if there are multiple
-            ancestral generations, will be passed to this function.
-            Individuals that returns True will be removed. This function does
-            not affect subpopulation structure in the sense that a
-            subpopulation will be kept even if all individuals from it are
-            removed.
-
-
-        """
-        return _simuPOP_ba.Population_removeIndividuals(self, *args, **kwargs)
+            An Individual object cannot be created directly. It has to be
+            accessed from a Population object using functions such as
+            Population::Individual(idx).
 
 
-    def mergeSubPops(self, *args, **kwargs) -> "size_t":
         """
+        _simuPOP_ba.Individual_swiginit(self, _simuPOP_ba.new_Individual())
+    __swig_destroy__ = _simuPOP_ba.delete_Individual
+    allele = _swig_new_instance_method(_simuPOP_ba.Individual_allele)
+    alleleChar = _swig_new_instance_method(_simuPOP_ba.Individual_alleleChar)
+    setAllele = _swig_new_instance_method(_simuPOP_ba.Individual_setAllele)
+    alleleLineage = _swig_new_instance_method(_simuPOP_ba.Individual_alleleLineage)
+    setAlleleLineage = _swig_new_instance_method(_simuPOP_ba.Individual_setAlleleLineage)
+    genotype = _swig_new_instance_method(_simuPOP_ba.Individual_genotype)
+    mutants = _swig_new_instance_method(_simuPOP_ba.Individual_mutants)
+    lineage = _swig_new_instance_method(_simuPOP_ba.Individual_lineage)
+    setGenotype = _swig_new_instance_method(_simuPOP_ba.Individual_setGenotype)
+    setLineage = _swig_new_instance_method(_simuPOP_ba.Individual_setLineage)
+    sex = _swig_new_instance_method(_simuPOP_ba.Individual_sex)
+    setSex = _swig_new_instance_method(_simuPOP_ba.Individual_setSex)
+    affected = _swig_new_instance_method(_simuPOP_ba.Individual_affected)
+    setAffected = _swig_new_instance_method(_simuPOP_ba.Individual_setAffected)
+    info = _swig_new_instance_method(_simuPOP_ba.Individual_info)
+    setInfo = _swig_new_instance_method(_simuPOP_ba.Individual_setInfo)
+    genoEnd = _swig_new_instance_method(_simuPOP_ba.Individual_genoEnd)
+    __eq__ = _swig_new_instance_method(_simuPOP_ba.Individual___eq__)
+    __ne__ = _swig_new_instance_method(_simuPOP_ba.Individual___ne__)
+    __cmp__ = _swig_new_instance_method(_simuPOP_ba.Individual___cmp__)
+
+# Register Individual in _simuPOP_ba:
+_simuPOP_ba.Individual_swigregister(Individual)
 
+class vspID(object):
+    r"""
 
-        Usage:
-
-            x.mergeSubPops(subPops=ALL_AVAIL, name="", toSubPop=-1)
 
-        Details:
+    Details:
 
-            Merge subpopulations subPops. If subPops is ALL_AVAIL (default),
-            all subpopulations will be merged. subPops do not have to be
-            adjacent to each other. They will all be merged to the
-            subpopulation with the smallest subpopulation ID, unless a
-            subpopulation ID is specified using parameter toSubPop. Indexes of
-            the rest of the subpopulation may be changed. A new name can be
-            assigned to the merged subpopulation through parameter name (an
-            empty name will be ignored). This function returns the ID of the
-            merged subpopulation.
+        A class to specify virtual subpopulation, which is composed of a
+        subpopulation ID and a virtual subpopulation ID.
 
 
-        """
-        return _simuPOP_ba.Population_mergeSubPops(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def addIndFrom(self, pop: 'Population') -> "void":
-        """
+    def __init__(self, *args):
+        r"""
 
 
         Usage:
 
-            x.addIndFrom(pop)
+            vspID(id)
 
         Details:
 
-            Add all individuals, including ancestors, in pop to the current
-            population. Two populations should have the same genotypic
-            structures and number of ancestral generations. Subpopulations in
-            population pop are kept.
+            Create a subpopulation id. Accept id as well as names.
 
 
         """
-        return _simuPOP_ba.Population_addIndFrom(self, pop)
+        _simuPOP_ba.vspID_swiginit(self, _simuPOP_ba.new_vspID(*args))
+    __swig_destroy__ = _simuPOP_ba.delete_vspID
+    __eq__ = _swig_new_instance_method(_simuPOP_ba.vspID___eq__)
+    resolve = _swig_new_instance_method(_simuPOP_ba.vspID_resolve)
 
+# Register vspID in _simuPOP_ba:
+_simuPOP_ba.vspID_swigregister(vspID)
 
-    def addChromFrom(self, pop: 'Population') -> "void":
-        """
+__lshift__ = _simuPOP_ba.__lshift__
+class subPopList(object):
+    r"""
 
 
-        Usage:
+    Details:
+
+        A class to specify (virtual) subpopulation list. Using a dedicated
+        class allows users to specify a single subpopulation, or a list of
+        (virutal) subpoulations easily.
 
-            x.addChromFrom(pop)
 
-        Details:
+    """
 
-            Add chromosomes in population pop to the current population.
-            population pop should have the same number of individuals as the
-            current population in the current and all ancestral generations.
-            Chromosomes of pop, if named, should not conflict with names of
-            existing chromosome. This function merges genotypes on the new
-            chromosomes from population pop individual by individual.
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
+    def __init__(self, obj: "PyObject *"=None):
+        r"""
 
-        """
-        return _simuPOP_ba.Population_addChromFrom(self, pop)
+
+        Usage:
+
+            subPopList(obj=None)
 
 
-    def addLociFrom(self, pop: 'Population', byName: 'bool'=False) -> "void":
         """
+        _simuPOP_ba.subPopList_swiginit(self, _simuPOP_ba.new_subPopList(obj))
+    __len__ = _swig_new_instance_method(_simuPOP_ba.subPopList___len__)
+    push_back = _swig_new_instance_method(_simuPOP_ba.subPopList_push_back)
+    begin = _swig_new_instance_method(_simuPOP_ba.subPopList_begin)
+    end = _swig_new_instance_method(_simuPOP_ba.subPopList_end)
+    expandFrom = _swig_new_instance_method(_simuPOP_ba.subPopList_expandFrom)
+    __swig_destroy__ = _simuPOP_ba.delete_subPopList
 
+# Register subPopList in _simuPOP_ba:
+_simuPOP_ba.subPopList_swigregister(subPopList)
 
-        Usage:
+class BaseVspSplitter(object):
+    r"""
 
-            x.addLociFrom(pop, byName=False)
 
-        Details:
+    Details:
 
-            Add loci from population pop. By default, chromosomes are merged
-            by index and names of merged chromosomes of population pop will be
-            ignored (merge of two chromosomes with different names will yield
-            a warning). If byName is set to True, chromosomes in pop will be
-            merged to chromosomes with identical names. Added loci will be
-            inserted according to their position. Their position and names
-            should not overlap with any locus in the current population.
-            population pop should have the same number of individuals as the
-            current population in the current and all ancestral generations.
-            Allele lineages are also copied from pop in modules with lineage
-            information.
+        This class is the base class of all virtual subpopulation (VSP)
+        splitters, which provide ways to define groups of individuals in a
+        subpopulation who share certain properties. A splitter defines a
+        fixed number of named VSPs. They do not have to add up to the
+        whole subpopulation, nor do they have to be distinct. After a
+        splitter is assigned to a population, many functions and operators
+        can be applied to individuals within specified VSPs.  Each VSP has
+        a name. A default name is determined by each splitter but you can
+        also assign a name to each VSP. The name of a VSP can be retrieved
+        by function BaseVspSplitter.name() or Population.subPopName().
+        Only one VSP splitter can be assigned to a population, which
+        defined VSPs for all its subpopulations. If different splitters
+        are needed for different subpopulations, a CombinedSplitter can be
+        used.
 
 
-        """
-        return _simuPOP_ba.Population_addLociFrom(self, pop, byName)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
 
-    def addChrom(self, *args, **kwargs) -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        raise AttributeError("No constructor defined - class is abstract")
+    __repr__ = _swig_repr
+    clone = _swig_new_instance_method(_simuPOP_ba.BaseVspSplitter_clone)
+    __swig_destroy__ = _simuPOP_ba.delete_BaseVspSplitter
+    numVirtualSubPop = _swig_new_instance_method(_simuPOP_ba.BaseVspSplitter_numVirtualSubPop)
+    name = _swig_new_instance_method(_simuPOP_ba.BaseVspSplitter_name)
+    vspByName = _swig_new_instance_method(_simuPOP_ba.BaseVspSplitter_vspByName)
 
+# Register BaseVspSplitter in _simuPOP_ba:
+_simuPOP_ba.BaseVspSplitter_swigregister(BaseVspSplitter)
 
-        Usage:
+class CombinedSplitter(BaseVspSplitter):
+    r"""
 
-            x.addChrom(lociPos, lociNames=[], chromName="", alleleNames=[],
-              chromType=AUTOSOME)
 
-        Details:
+    Details:
 
-            Add chromosome chromName with given type chromType to a
-            population, with loci lociNames inserted at position lociPos.
-            lociPos should be ordered. lociNames and chromName should not
-            exist in the current population. Allele names could be specified
-            for all loci (a list of names) or differently for each locus (a
-            nested list of names), using parameter alleleNames. Empty loci
-            names will be used if lociNames is not specified. The newly added
-            alleles will have zero lineage in modules wiht lineage
-            information.
+        This splitter takes several splitters and stacks their VSPs
+        together. For example, if the first splitter defines 3 VSPs and
+        the second splitter defines 2, the two VSPs from the second
+        splitter become the fourth (index 3) and the fifth (index 4) VSPs
+        of the combined splitter. In addition, a new set of VSPs could be
+        defined as the union of one or more of the original VSPs. This
+        splitter is usually used to define different types of VSPs to a
+        population.
 
 
-        """
-        return _simuPOP_ba.Population_addChrom(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def addLoci(self, *args, **kwargs) -> "vectoru":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.addLoci(chrom, pos, lociNames=[], alleleNames=[])
+            CombinedSplitter(splitters=[], vspMap=[], names=[])
 
         Details:
 
-            Insert loci lociNames at positions pos on chromosome chrom. These
-            parameters should be lists of the same length, although names may
-            be ignored, in which case empty strings will be assumed. Single-
-            value input is allowed for parameter chrom and pos if only one
-            locus is added. Alleles at inserted loci are initialized with zero
-            alleles. Note that loci have to be added to existing chromosomes.
-            If loci on a new chromosome need to be added, function addChrom
-            should be used. Optionally, allele names could be specified either
-            for all loci (a single list) or each loci (a nested list). This
-            function returns indexes of the inserted loci. Newly inserted
-            alleles will have zero lineage in modules with lineage
-            information.
-
-
-        """
-        return _simuPOP_ba.Population_addLoci(self, *args, **kwargs)
+            Create a combined splitter using a list of splitters. For example,
+            CombinedSplitter([SexSplitter(), AffectionSplitter()]) defines a
+            combined splitter with four VSPs, defined by male (vsp 0), female
+            (vsp 1), unaffected (vsp 2) and affected individuals (vsp 3).
+            Optionally, a new set of VSPs could be defined by parameter
+            vspMap. Each item in this parameter is a list of VSPs that will be
+            combined to a single VSP. For example, vspMap=[(0, 2), (1, 3)] in
+            the previous example will define two VSPs defined by male or
+            unaffected, and female or affected individuals. VSP names are
+            usually determined by splitters, but can also be specified using
+            parameter names.
 
 
-    def resize(self, sizes: 'uintList', propagate: 'bool'=False) -> "void":
         """
+        _simuPOP_ba.CombinedSplitter_swiginit(self, _simuPOP_ba.new_CombinedSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_CombinedSplitter
 
+# Register CombinedSplitter in _simuPOP_ba:
+_simuPOP_ba.CombinedSplitter_swigregister(CombinedSplitter)
 
-        Usage:
+class ProductSplitter(BaseVspSplitter):
+    r"""
 
-            x.resize(sizes, propagate=False)
 
-        Details:
+    Details:
 
-            Resize population by giving new subpopulation sizes sizes.
-            individuals at the end of some subpopulations will be removed if
-            the new subpopulation size is smaller than the old one. New
-            individuals will be appended to a subpopulation if the new size is
-            larger. Their genotypes will be set to zero (default), or be
-            copied from existing individuals if propagate is set to True. More
-            specifically, if a subpopulation with 3 individuals is expanded to
-            7, the added individuals will copy genotypes from individual 1, 2,
-            3, and 1 respectively. Note that this function only resizes the
-            current generation.
+        This splitter takes several splitters and take their intersections
+        as new VSPs. For example, if the first splitter defines 3 VSPs and
+        the second splitter defines 2, 6 VSPs will be defined by splitting
+        3 VSPs defined by the first splitter each to two VSPs. This
+        splitter is usually used to define finer VSPs from existing VSPs.
 
 
-        """
-        return _simuPOP_ba.Population_resize(self, sizes, propagate)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def extractSubPops(self, *args, **kwargs) -> "simuPOP::Population &":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.extractSubPops(subPops=ALL_AVAIL, rearrange=False)
+            ProductSplitter(splitters=[], names=[])
 
         Details:
 
-            Extract a list of (virtual) subpopulations from a population and
-            create a new population. If rearrange is False (default),
-            structure and names of extracted subpopulations are kept although
-            extracted subpopulations can have fewer individuals if they are
-            created from extracted virtual subpopulations. (e.g. it is
-            possible to extract all male individuals from a subpopulation
-            using a SexSplitter()). If rearrange is True, each (virtual)
-            subpopulation in subPops becomes a new subpopulation in the
-            extracted population in the order at which they are specified.
-            Because each virtual subpopulation becomes a subpopulation, this
-            function could be used, for example, to separate male and female
-            individuals to two subpopulations ( subPops=[(0,0), (0,1)]). If
-            overlapping (virtual) subpopulations are specified, individuals
-            will be copied multiple times. This function only extract
-            individuals from the present generation.
-
-
-        """
-        return _simuPOP_ba.Population_extractSubPops(self, *args, **kwargs)
+            Create a product splitter using a list of splitters. For example,
+            ProductSplitter([SexSplitter(), AffectionSplitter()]) defines four
+            VSPs by male unaffected, male affected, female unaffected, and
+            female affected individuals. VSP names are usually determined by
+            splitters, but can also be specified using parameter names.
 
 
-    def extractIndividuals(self, *args, **kwargs) -> "simuPOP::Population &":
         """
+        _simuPOP_ba.ProductSplitter_swiginit(self, _simuPOP_ba.new_ProductSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_ProductSplitter
 
+# Register ProductSplitter in _simuPOP_ba:
+_simuPOP_ba.ProductSplitter_swigregister(ProductSplitter)
 
-        Usage:
+class SexSplitter(BaseVspSplitter):
+    r"""
 
-            x.extractIndividuals(indexes=[], IDs=[], idField="ind_id",
-              filter=None)
 
-        Details:
+    Details:
 
-            Extract individuals with given absolute indexes (parameter
-            indexes), IDs (parameter IDs, stored in information field idField,
-            default to ind_id), or a filter function (parameter filter). If a
-            list of absolute indexes are specified, the present generation
-            will be extracted and form a one-generational population. If a
-            list of IDs are specified, this function will look through all
-            ancestral generations and extract individuals with given ID.
-            Individuals with shared IDs are allowed. In the last case, a user-
-            defined Python function should be provided. This function should
-            accept parameter "ind" or one or more of the information fields.
-            All individuals, including ancestors if there are multiple
-            ancestral generations, will be passed to this function.
-            Individuals that returns True will be extracted. Extracted
-            individuals will be in their original ancestral generations and
-            subpopulations, even if some subpopulations or generations are
-            empty. An IndexError will be raised if an index is out of bound
-            but no error will be given if an invalid ID is encountered.
+        This splitter defines two VSPs by individual sex. The first VSP
+        consists of all male individuals and the second VSP consists of
+        all females in a subpopulation.
 
 
-        """
-        return _simuPOP_ba.Population_extractIndividuals(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def removeLoci(self, *args, **kwargs) -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.removeLoci(loci=UNSPECIFIED, keep=UNSPECIFIED)
+            SexSplitter(names=[])
 
         Details:
 
-            Remove loci (absolute indexes or names) and genotypes at these
-            loci from the current population. Alternatively, a parameter keep
-            can be used to specify loci that will not be removed.
-
-
-        """
-        return _simuPOP_ba.Population_removeLoci(self, *args, **kwargs)
+            Create a sex splitter that defines male and female VSPs. These
+            VSPs are named Male and Female unless a new set of names are
+            specified by parameter names.
 
 
-    def recodeAlleles(self, *args, **kwargs) -> "void":
         """
+        _simuPOP_ba.SexSplitter_swiginit(self, _simuPOP_ba.new_SexSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_SexSplitter
 
+# Register SexSplitter in _simuPOP_ba:
+_simuPOP_ba.SexSplitter_swigregister(SexSplitter)
 
-        Usage:
+class AffectionSplitter(BaseVspSplitter):
+    r"""
 
-            x.recodeAlleles(alleles, loci=ALL_AVAIL, alleleNames=[])
 
-        Details:
+    Details:
 
-            Recode alleles at loci (can be a list of loci indexes or names, or
-            all loci in a population (ALL_AVAIL)) to other values according to
-            parameter alleles. This parameter can a list of new allele numbers
-            for alleles 0, 1, 2, ... (allele x will be recoded to
-            newAlleles[x], x outside of the range of newAlleles will not be
-            recoded, although a warning will be given if DBG_WARNING is
-            defined) or a Python function, which should accept one or both
-            parameters allele (existing allele) and locus (index of locus).
-            The return value will become the new allele. This function is
-            intended to recode some alleles without listing all alleles in a
-            list. It will be called once for each existing allele so it is not
-            possible to recode an allele to different alleles. A new list of
-            allele names could be specified for these loci. Different sets of
-            names could be specified for each locus if a nested list of names
-            are given. This function recode alleles for all subpopulations in
-            all ancestral generations.
+        This class defines two VSPs according individual affection status.
+        The first VSP consists of unaffected invidiauls and the second VSP
+        consists of affected ones.
 
 
-        """
-        return _simuPOP_ba.Population_recodeAlleles(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def push(self, pop: 'Population') -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.push(pop)
+            AffectionSplitter(names=[])
 
         Details:
 
-            Push population pop into the current population. Both populations
-            should have the same genotypic structure. The current population
-            is discarded if ancestralDepth (maximum number of ancestral
-            generations to hold) is zero so no ancestral generation can be
-            kept. Otherise, the current population will become the parental
-            generation of pop. If ancGen of a population is positive and there
-            are already ancGen ancestral generations (c.f. ancestralGens()),
-            the greatest ancestral generation will be discarded. In any case,
-            Populationpop becomes invalid as all its individuals are absorbed
-            by the current population.
-
-
-        """
-        return _simuPOP_ba.Population_push(self, pop)
-
-
-    def curAncestralGen(self) -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_curAncestralGen(self)
+            Create a splitter that defined two VSPs by affection status.These
+            VSPs are named Unaffected and Affected unless a new set of names
+            are specified by parameter names.
 
 
-    def ancestralGens(self) -> "int":
         """
+        _simuPOP_ba.AffectionSplitter_swiginit(self, _simuPOP_ba.new_AffectionSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_AffectionSplitter
 
+# Register AffectionSplitter in _simuPOP_ba:
+_simuPOP_ba.AffectionSplitter_swigregister(AffectionSplitter)
 
-        Usage:
+class InfoSplitter(BaseVspSplitter):
+    r"""
 
-            x.ancestralGens()
 
-        Details:
+    Details:
 
-            Return the actual number of ancestral generations stored in a
-            population, which does not necessarily equal to the number set by
-            setAncestralDepth().
+        This splitter defines VSPs according to the value of an
+        information field of each indivdiual. A VSP is defined either by a
+        value or a range of values.
 
 
-        """
-        return _simuPOP_ba.Population_ancestralGens(self)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def setIndInfo(self, *args, **kwargs) -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.setIndInfo(values, field, subPop=[])
+            InfoSplitter(field, values=[], cutoff=[], ranges=[], names=[])
 
         Details:
 
-            Set information field field (specified by index or name) of all
-            individuals (if subPop=[], default), or individuals in a (virtual)
-            subpopulation (subPop=sp or (sp, vsp)) to values. values will be
-            reused if its length is smaller than the size of the population or
-            (virtual) subpopulation.
-
-
-        """
-        return _simuPOP_ba.Population_setIndInfo(self, *args, **kwargs)
+            Create an infomration splitter using information field field. If
+            parameter values is specified, each item in this list defines a
+            VSP in which all individuals have this value at information field
+            field. If a set of cutoff values are defined in parameter cutoff,
+            individuals are grouped by intervals defined by these cutoff
+            values. For example, cutoff=[1,2] defines three VSPs with v < 1, 1
+            <= v < 2 and v >=2 where v is the value of an individual at
+            information field field. If parameter ranges is specified, each
+            range defines a VSP. For example, ranges=[[1, 3], [2, 5]] defines
+            two VSPs with 1 <= v < 3 and 2 <= 3 < 5. Of course, only one of
+            the parameters values, cutoff and ranges should be defined, and
+            values in cutoff should be distinct, and in an increasing order. A
+            default set of names are given to each VSP unless a new set of
+            names is given by parameter names.
 
 
-    def indInfo(self, *args, **kwargs) -> "vectorf":
         """
+        _simuPOP_ba.InfoSplitter_swiginit(self, _simuPOP_ba.new_InfoSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_InfoSplitter
 
+# Register InfoSplitter in _simuPOP_ba:
+_simuPOP_ba.InfoSplitter_swigregister(InfoSplitter)
 
-        Usage:
+class ProportionSplitter(BaseVspSplitter):
+    r"""
 
-            x.indInfo(field, subPop=[])
 
-        Details:
+    Details:
 
-            Return the values (as a list) of information field field (by index
-            or name) of all individuals (if subPop=[], default), or
-            individuals in a (virtual) subpopulation (if subPop=sp or (sp,
-            vsp)).
+        This splitter divides subpopulations into several VSPs by
+        proportion.
 
 
-        """
-        return _simuPOP_ba.Population_indInfo(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def addInfoFields(self, fields: 'stringList', init: 'double'=0) -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.addInfoFields(fields, init=0)
+            ProportionSplitter(proportions=[], names=[])
 
         Details:
 
-            Add a list of information fields fields to a population and
-            initialize their values to init. If an information field alreay
-            exists, it will be re-initialized.
-
-
-        """
-        return _simuPOP_ba.Population_addInfoFields(self, fields, init)
+            Create a splitter that divides subpopulations by proportions,
+            which should be a list of float numbers (between 0 and 1) that add
+            up to 1. A default set of names are given to each VSP unless a new
+            set of names is given by parameter names.
 
 
-    def setInfoFields(self, fields: 'stringList', init: 'double'=0) -> "void":
         """
+        _simuPOP_ba.ProportionSplitter_swiginit(self, _simuPOP_ba.new_ProportionSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_ProportionSplitter
 
+# Register ProportionSplitter in _simuPOP_ba:
+_simuPOP_ba.ProportionSplitter_swigregister(ProportionSplitter)
 
-        Usage:
+class RangeSplitter(BaseVspSplitter):
+    r"""
 
-            x.setInfoFields(fields, init=0)
 
-        Details:
+    Details:
 
-            Set information fields fields to a population and initialize them
-            with value init. All existing information fields will be removed.
+        This class defines a splitter that groups individuals in certain
+        ranges into VSPs.
 
 
-        """
-        return _simuPOP_ba.Population_setInfoFields(self, fields, init)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def removeInfoFields(self, fields: 'stringList') -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.removeInfoFields(fields)
+            RangeSplitter(ranges, names=[])
 
         Details:
 
-            Remove information fields fields from a population.
-
-
-        """
-        return _simuPOP_ba.Population_removeInfoFields(self, fields)
+            Create a splitter according to a number of individual ranges
+            defined in ranges. For example, RangeSplitter(ranges=[[0, 20],
+            [40, 50]]) defines two VSPs. The first VSP consists of individuals
+            0, 1, ..., 19, and the sceond VSP consists of individuals 40, 41,
+            ..., 49. Note that a nested list has to be used even if only one
+            range is defined. A default set of names are given to each VSP
+            unless a new set of names is given by parameter names.
 
 
-    def updateInfoFieldsFrom(self, *args, **kwargs) -> "void":
         """
+        _simuPOP_ba.RangeSplitter_swiginit(self, _simuPOP_ba.new_RangeSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_RangeSplitter
 
+# Register RangeSplitter in _simuPOP_ba:
+_simuPOP_ba.RangeSplitter_swigregister(RangeSplitter)
 
-        Usage:
+class GenotypeSplitter(BaseVspSplitter):
+    r"""
 
-            x.updateInfoFieldsFrom(fields, pop, fromFields=[],
-              ancGens=ALL_AVAIL)
 
-        Details:
+    Details:
 
-            Update information fields fields from fromFields of another
-            population (or Pedigree) pop. Two populations should have the same
-            number of individuals. If fromFields is not specified, it is
-            assumed to be the same as fields. If ancGens is not ALL_AVAIL,
-            only the specified ancestral generations are updated.
+        This class defines a VSP splitter that defines VSPs according to
+        individual genotype at specified loci.
 
 
-        """
-        return _simuPOP_ba.Population_updateInfoFieldsFrom(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def setAncestralDepth(self, depth: 'int') -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.setAncestralDepth(depth)
+            GenotypeSplitter(loci, alleles, phase=False, names=[])
 
         Details:
 
-            set the intended ancestral depth of a population to depth, which
-            can be 0 (does not store any ancestral generation), -1 (store all
-            ancestral generations), and a positive number (store depth
-            ancestral generations. If there exists more than depth ancestral
-            generations (if depth > 0), extra ancestral generations are
-            removed.
-
-
-        """
-        return _simuPOP_ba.Population_setAncestralDepth(self, depth)
+            Create a splitter that defines VSPs by individual genotype at loci
+            (can be indexes or names of one or more loci). Each list in a list
+            allele defines a VSP, which is a list of allowed alleles at these
+            loci. If only one VSP is defined, the outer list of the nested
+            list can be ignored. If phase if true, the order of alleles in
+            each list is significant. If more than one set of alleles are
+            given, Individuals having either of them is qualified.  For
+            example, in a haploid population, loci=1, alleles=[0, 1] defines a
+            VSP with individuals having allele 0 or 1 at locus 1, alleles=[[0,
+            1], [2]] defines two VSPs with indivdiuals in the second VSP
+            having allele 2 at locus 1. If multiple loci are involved, alleles
+            at each locus need to be defined. For example, VSP defined by
+            loci=[0, 1], alleles=[0, 1, 1, 1] consists of individuals having
+            alleles [0, 1] or [1, 1] at loci [0, 1].  In a haploid population,
+            loci=1, alleles=[0, 1] defines a VSP with individuals having
+            genotype [0, 1] or [1, 0] at locus 1. alleles[[0, 1], [2, 2]]
+            defines two VSPs with indivdiuals in the second VSP having
+            genotype [2, 2] at locus 1. If phase is set to True, the first VSP
+            will only has individuals with genotype [0, 1]. In the multiple
+            loci case, alleles should be arranged by haplotypes, for example,
+            loci=[0, 1], alleles=[0, 0, 1, 1], phase=True defines a VSP with
+            individuals having genotype -0-0-, -1-1- at loci 0 and 1. If
+            phase=False (default), genotypes -1-1-, -0-0-, -0-1- and -1-0- are
+            all allowed.  A default set of names are given to each VSP unless
+            a new set of names is given by parameter names.
 
 
-    def useAncestralGen(self, idx: 'ssize_t') -> "void":
         """
+        _simuPOP_ba.GenotypeSplitter_swiginit(self, _simuPOP_ba.new_GenotypeSplitter(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_GenotypeSplitter
 
+# Register GenotypeSplitter in _simuPOP_ba:
+_simuPOP_ba.GenotypeSplitter_swigregister(GenotypeSplitter)
 
-        Usage:
+class pyIndIterator(object):
+    r"""
 
-            x.useAncestralGen(idx)
 
-        Details:
+    Details:
 
-            Making ancestral generation idx (0 for current generation, 1 for
-            parental generation, 2 for grand-parental generation, etc) the
-            current generation. This is an efficient way to access Population
-            properties of an ancestral generation. useAncestralGen(0) should
-            always be called afterward to restore the correct order of
-            ancestral generations.
+        this class implements a Python itertor class that can be used to
+        iterate through individuals in a (sub)population. If allInds are
+        true, visiblility of individuals will not be checked. Otherwise, a
+        functor will be used to check if indiviudals belong to a specified
+        virtual subpopulation.  An instance of this class is returned by
+        population::Individuals() and Population::Individuals(subPop)
 
 
-        """
-        return _simuPOP_ba.Population_useAncestralGen(self, idx)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def save(self, filename: 'string const &') -> "void":
-        """
+    def __init__(self, begin: "vector< simuPOP::Individual,std::allocator< simuPOP::Individual > >::iterator const", end: "vector< simuPOP::Individual,std::allocator< simuPOP::Individual > >::iterator const", allInds: "bool", func: "simuPOP::vspFunctor"):
+        r"""
 
 
         Usage:
 
-            x.save(filename)
-
-        Details:
-
-            Save population to a file filename, which can be loaded by a
-            global function loadPopulation(filename).
+            pyIndIterator(begin, end, allInds, func)
 
 
         """
-        return _simuPOP_ba.Population_save(self, filename)
+        _simuPOP_ba.pyIndIterator_swiginit(self, _simuPOP_ba.new_pyIndIterator(begin, end, allInds, func))
+    __swig_destroy__ = _simuPOP_ba.delete_pyIndIterator
+    __iter__ = _swig_new_instance_method(_simuPOP_ba.pyIndIterator___iter__)
+    next = _swig_new_instance_method(_simuPOP_ba.pyIndIterator_next)
+    __next__ = _swig_new_instance_method(_simuPOP_ba.pyIndIterator___next__)
 
+# Register pyIndIterator in _simuPOP_ba:
+_simuPOP_ba.pyIndIterator_swigregister(pyIndIterator)
 
-    def vars(self, *args, **kwargs) -> "PyObject *":
-        """
+class Population(GenoStruTrait):
+    r"""
 
 
-        Usage:
+    Details:
+
+        A simuPOP population consists of individuals of the same genotypic
+        structure, organized by generations, subpopulations and virtual
+        subpopulations. It also contains a Python dictionary that is used
+        to store arbitrary population variables.  In addition to genotypic
+        structured related functions provided by the GenoStruTrait class,
+        the population class provides a large number of member functions
+        that can be used to
+        *   Create, copy and compare populations.
+        *   Manipulate subpopulations. A population can be divided into
+        several subpopulations. Because individuals only mate with
+        individuals within the same subpopulation, exchange of genetic
+        information across subpopulations can only be done through
+        migration. A number of functions are provided to access
+        subpopulation structure information, and to merge and split
+        subpopulations.
+        *   Define and access virtual subpopulations. A virtual
+        subpopulation splitter can be assigned to a population, which
+        defines groups of individuals called virtual subpopulations (VSP)
+        within each subpopulation.
+        *   Access individuals individually, or through iterators that
+        iterate through individuals in (virtual) subpopulations.
+        *   Access genotype and information fields of individuals at the
+        population level. From a population point of view, all genotypes
+        are arranged sequentially individual by individual. Please refer
+        to class Individual for an introduction to genotype arragement of
+        each individual.
+        *   Store and access ancestral generations. A population can save
+        arbitrary number of ancestral generations. It is possible to
+        directly access an ancestor, or make an ancestral generation the
+        current generation for more efficient access.
+        *   Insert or remove loci, resize (shrink or expand) a population,
+        sample from a population, or merge with other populations.
+        *   Manipulate population variables and evaluate expressions in
+        this local namespace.
+        *   Save and load a population.
 
-            x.vars(subPop=[])
 
-        Details:
+    """
 
-            return variables of a population as a Python dictionary. If a
-            valid subpopulation subPop is specified, a dictionary
-            vars()["subPop"][subPop] is returned. A ValueError will be raised
-            if key subPop does not exist in vars(), or if key subPop does not
-            exist in vars()["subPop"].
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
+    def __init__(self, *args, **kwargs):
+        r"""
 
-        """
-        return _simuPOP_ba.Population_vars(self, *args, **kwargs)
-
-
-    def evaluate(self, *args, **kwargs) -> "PyObject *":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_evaluate(self, *args, **kwargs)
-
-
-    def execute(self, *args, **kwargs) -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Population_execute(self, *args, **kwargs)
-
-Population.clone = new_instancemethod(_simuPOP_ba.Population_clone, None, Population)
-Population.swap = new_instancemethod(_simuPOP_ba.Population_swap, None, Population)
-Population.virtualSplitter = new_instancemethod(_simuPOP_ba.Population_virtualSplitter, None, Population)
-Population.setVirtualSplitter = new_instancemethod(_simuPOP_ba.Population_setVirtualSplitter, None, Population)
-Population.numVirtualSubPop = new_instancemethod(_simuPOP_ba.Population_numVirtualSubPop, None, Population)
-Population.activateVirtualSubPop = new_instancemethod(_simuPOP_ba.Population_activateVirtualSubPop, None, Population)
-Population.deactivateVirtualSubPop = new_instancemethod(_simuPOP_ba.Population_deactivateVirtualSubPop, None, Population)
-Population.__cmp__ = new_instancemethod(_simuPOP_ba.Population___cmp__, None, Population)
-Population.fitGenoStru = new_instancemethod(_simuPOP_ba.Population_fitGenoStru, None, Population)
-Population.setSubPopStru = new_instancemethod(_simuPOP_ba.Population_setSubPopStru, None, Population)
-Population.numSubPop = new_instancemethod(_simuPOP_ba.Population_numSubPop, None, Population)
-Population.subPopSize = new_instancemethod(_simuPOP_ba.Population_subPopSize, None, Population)
-Population.subPopByName = new_instancemethod(_simuPOP_ba.Population_subPopByName, None, Population)
-Population.subPopName = new_instancemethod(_simuPOP_ba.Population_subPopName, None, Population)
-Population.subPopNames = new_instancemethod(_simuPOP_ba.Population_subPopNames, None, Population)
-Population.setSubPopName = new_instancemethod(_simuPOP_ba.Population_setSubPopName, None, Population)
-Population.subPopSizes = new_instancemethod(_simuPOP_ba.Population_subPopSizes, None, Population)
-Population.popSize = new_instancemethod(_simuPOP_ba.Population_popSize, None, Population)
-Population.absIndIndex = new_instancemethod(_simuPOP_ba.Population_absIndIndex, None, Population)
-Population.subPopIndPair = new_instancemethod(_simuPOP_ba.Population_subPopIndPair, None, Population)
-Population.subPopBegin = new_instancemethod(_simuPOP_ba.Population_subPopBegin, None, Population)
-Population.subPopEnd = new_instancemethod(_simuPOP_ba.Population_subPopEnd, None, Population)
-Population.individual = new_instancemethod(_simuPOP_ba.Population_individual, None, Population)
-Population.indByID = new_instancemethod(_simuPOP_ba.Population_indByID, None, Population)
-Population.ancestor = new_instancemethod(_simuPOP_ba.Population_ancestor, None, Population)
-Population.individuals = new_instancemethod(_simuPOP_ba.Population_individuals, None, Population)
-Population.indIterator = new_instancemethod(_simuPOP_ba.Population_indIterator, None, Population)
-Population.rawIndBegin = new_instancemethod(_simuPOP_ba.Population_rawIndBegin, None, Population)
-Population.rawIndEnd = new_instancemethod(_simuPOP_ba.Population_rawIndEnd, None, Population)
-Population.alleleIterator = new_instancemethod(_simuPOP_ba.Population_alleleIterator, None, Population)
-Population.indGenoBegin = new_instancemethod(_simuPOP_ba.Population_indGenoBegin, None, Population)
-Population.indGenoEnd = new_instancemethod(_simuPOP_ba.Population_indGenoEnd, None, Population)
-Population.genotype = new_instancemethod(_simuPOP_ba.Population_genotype, None, Population)
-Population.mutants = new_instancemethod(_simuPOP_ba.Population_mutants, None, Population)
-Population.lineage = new_instancemethod(_simuPOP_ba.Population_lineage, None, Population)
-Population.setGenotype = new_instancemethod(_simuPOP_ba.Population_setGenotype, None, Population)
-Population.setLineage = new_instancemethod(_simuPOP_ba.Population_setLineage, None, Population)
-Population.sortIndividuals = new_instancemethod(_simuPOP_ba.Population_sortIndividuals, None, Population)
-Population.setSubPopByIndInfo = new_instancemethod(_simuPOP_ba.Population_setSubPopByIndInfo, None, Population)
-Population.splitSubPop = new_instancemethod(_simuPOP_ba.Population_splitSubPop, None, Population)
-Population.removeSubPops = new_instancemethod(_simuPOP_ba.Population_removeSubPops, None, Population)
-Population.removeIndividuals = new_instancemethod(_simuPOP_ba.Population_removeIndividuals, None, Population)
-Population.mergeSubPops = new_instancemethod(_simuPOP_ba.Population_mergeSubPops, None, Population)
-Population.addIndFrom = new_instancemethod(_simuPOP_ba.Population_addIndFrom, None, Population)
-Population.addChromFrom = new_instancemethod(_simuPOP_ba.Population_addChromFrom, None, Population)
-Population.addLociFrom = new_instancemethod(_simuPOP_ba.Population_addLociFrom, None, Population)
-Population.addChrom = new_instancemethod(_simuPOP_ba.Population_addChrom, None, Population)
-Population.addLoci = new_instancemethod(_simuPOP_ba.Population_addLoci, None, Population)
-Population.resize = new_instancemethod(_simuPOP_ba.Population_resize, None, Population)
-Population.extractSubPops = new_instancemethod(_simuPOP_ba.Population_extractSubPops, None, Population)
-Population.extractIndividuals = new_instancemethod(_simuPOP_ba.Population_extractIndividuals, None, Population)
-Population.removeLoci = new_instancemethod(_simuPOP_ba.Population_removeLoci, None, Population)
-Population.recodeAlleles = new_instancemethod(_simuPOP_ba.Population_recodeAlleles, None, Population)
-Population.push = new_instancemethod(_simuPOP_ba.Population_push, None, Population)
-Population.curAncestralGen = new_instancemethod(_simuPOP_ba.Population_curAncestralGen, None, Population)
-Population.ancestralGens = new_instancemethod(_simuPOP_ba.Population_ancestralGens, None, Population)
-Population.setIndInfo = new_instancemethod(_simuPOP_ba.Population_setIndInfo, None, Population)
-Population.infoBegin = new_instancemethod(_simuPOP_ba.Population_infoBegin, None, Population)
-Population.infoEnd = new_instancemethod(_simuPOP_ba.Population_infoEnd, None, Population)
-Population.indInfo = new_instancemethod(_simuPOP_ba.Population_indInfo, None, Population)
-Population.addInfoFields = new_instancemethod(_simuPOP_ba.Population_addInfoFields, None, Population)
-Population.setInfoFields = new_instancemethod(_simuPOP_ba.Population_setInfoFields, None, Population)
-Population.removeInfoFields = new_instancemethod(_simuPOP_ba.Population_removeInfoFields, None, Population)
-Population.updateInfoFieldsFrom = new_instancemethod(_simuPOP_ba.Population_updateInfoFieldsFrom, None, Population)
-Population.setAncestralDepth = new_instancemethod(_simuPOP_ba.Population_setAncestralDepth, None, Population)
-Population.useAncestralGen = new_instancemethod(_simuPOP_ba.Population_useAncestralGen, None, Population)
-Population.save = new_instancemethod(_simuPOP_ba.Population_save, None, Population)
-Population.vars = new_instancemethod(_simuPOP_ba.Population_vars, None, Population)
-Population.evaluate = new_instancemethod(_simuPOP_ba.Population_evaluate, None, Population)
-Population.execute = new_instancemethod(_simuPOP_ba.Population_execute, None, Population)
-Population_swigregister = _simuPOP_ba.Population_swigregister
-Population_swigregister(Population)
-HAPLODIPLOID = _simuPOP_ba.HAPLODIPLOID
 
+        Usage:
 
-def loadPopulation(file: 'string const &') -> "simuPOP::Population &":
-    """
+            Population(size=[], ploidy=2, loci=[], chromTypes=[],
+              lociPos=[], ancGen=0, chromNames=[], alleleNames=[],
+              lociNames=[], subPopNames=[], infoFields=[])
 
+        Details:
 
-    Usage:
+            The following parameters are used to create a population object:
 
-        loadPopulation(file)
+        Arguments:
 
-    Details:
+            size:           A list of subpopulation sizes. The length of this
+                            list determines the number of subpopulations of
+                            this population. If there is no subpopulation,
+                            size=[popSize] can be written as size=popSize.
+            ploidy:         Number of homologous sets of chromosomes. Default
+                            to 2 (diploid). For efficiency considerations, all
+                            chromosomes have the same number of homologous
+                            sets, even if some customized chromosomes or some
+                            individuals (e.g. males in a haplodiploid
+                            population) have different numbers of homologous
+                            sets. The first case is handled by setting
+                            chromTypes of each chromosome. Only the
+                            haplodiploid populations are handled for the
+                            second case, for which ploidy=HAPLODIPLOID should
+                            be used.
+            loci:           A list of numbers of loci on each chromosome. The
+                            length of this parameter determines the number of
+                            chromosomes. If there is only one chromosome,
+                            numLoci instead of [numLoci] can be used.
+            chromTypes:     A list that specifies the type of each chromosome,
+                            which can be AUTOSOME, CHROMOSOME_X, CHROMOSOME_Y,
+                            or CUSTOMIZED. All chromosomes are assumed to be
+                            autosomes if this parameter is ignored. Sex
+                            chromosome can only be specified in a diploid
+                            population where the sex of an individual is
+                            determined by the existence of these chromosomes
+                            using the XX (FEMALE) and XY (MALE) convention.
+                            Both sex chromosomes have to be available and be
+                            specified only once. Because chromosomes X and Y
+                            are treated as two chromosomes, recombination on
+                            the pseudo-autosomal regions of the sex chromsomes
+                            is not supported. CUSTOMIZED chromosomes are
+                            special chromosomes whose inheritance patterns are
+                            undefined. They rely on user-defined functions and
+                            operators to be passed from parents to offspring.
+                            Multiple customized chromosomes have to be
+                            arranged consecutively.
+            lociPos:        Positions of all loci on all chromosome, as a list
+                            of float numbers. Default to 1, 2, ... etc on each
+                            chromosome. lociPos should be arranged chromosome
+                            by chromosome. If lociPos are not in order within
+                            a chromosome, they will be re-arranged along with
+                            corresponding lociNames (if specified).
+            ancGen:         Number of the most recent ancestral generations to
+                            keep during evolution. Default to 0, which means
+                            only the current generation will be kept. If it is
+                            set to -1, all ancestral generations will be kept
+                            in this population (and exhaust your computer RAM
+                            quickly).
+            chromNames:     A list of chromosome names. Default to '' for all
+                            chromosomes.
+            alleleNames:    A list or a nested list of allele names. If a list
+                            of alleles is given, it will be used for all loci
+                            in this population. For example,
+                            alleleNames=('A','C','T','G') gives names A, C, T,
+                            and G to alleles 0, 1, 2, and 3 respectively. If a
+                            nested list of names is given, it should specify
+                            alleles names for all loci.
+            lociNames:      A list of names for each locus. It can be empty or
+                            a list of unique names for each locus. If loci are
+                            not specified in order, loci names will be
+                            rearranged according to their position on the
+                            chromosome.
+            subPopNames:    A list of subpopulation names. All subpopulations
+                            will have name '' if this parameter is not
+                            specified.
+            infoFields:     Names of information fields (named float number)
+                            that will be attached to each individual.
 
-        load a population from a file saved by Population::save().
 
+        """
+        _simuPOP_ba.Population_swiginit(self, _simuPOP_ba.new_Population(*args, **kwargs))
+    clone = _swig_new_instance_method(_simuPOP_ba.Population_clone)
+    swap = _swig_new_instance_method(_simuPOP_ba.Population_swap)
+    __swig_destroy__ = _simuPOP_ba.delete_Population
+    virtualSplitter = _swig_new_instance_method(_simuPOP_ba.Population_virtualSplitter)
+    setVirtualSplitter = _swig_new_instance_method(_simuPOP_ba.Population_setVirtualSplitter)
+    numVirtualSubPop = _swig_new_instance_method(_simuPOP_ba.Population_numVirtualSubPop)
+    activateVirtualSubPop = _swig_new_instance_method(_simuPOP_ba.Population_activateVirtualSubPop)
+    deactivateVirtualSubPop = _swig_new_instance_method(_simuPOP_ba.Population_deactivateVirtualSubPop)
+    __cmp__ = _swig_new_instance_method(_simuPOP_ba.Population___cmp__)
+    fitGenoStru = _swig_new_instance_method(_simuPOP_ba.Population_fitGenoStru)
+    setSubPopStru = _swig_new_instance_method(_simuPOP_ba.Population_setSubPopStru)
+    numSubPop = _swig_new_instance_method(_simuPOP_ba.Population_numSubPop)
+    subPopSize = _swig_new_instance_method(_simuPOP_ba.Population_subPopSize)
+    subPopByName = _swig_new_instance_method(_simuPOP_ba.Population_subPopByName)
+    subPopName = _swig_new_instance_method(_simuPOP_ba.Population_subPopName)
+    subPopNames = _swig_new_instance_method(_simuPOP_ba.Population_subPopNames)
+    setSubPopName = _swig_new_instance_method(_simuPOP_ba.Population_setSubPopName)
+    subPopSizes = _swig_new_instance_method(_simuPOP_ba.Population_subPopSizes)
+    popSize = _swig_new_instance_method(_simuPOP_ba.Population_popSize)
+    absIndIndex = _swig_new_instance_method(_simuPOP_ba.Population_absIndIndex)
+    subPopIndPair = _swig_new_instance_method(_simuPOP_ba.Population_subPopIndPair)
+    subPopBegin = _swig_new_instance_method(_simuPOP_ba.Population_subPopBegin)
+    subPopEnd = _swig_new_instance_method(_simuPOP_ba.Population_subPopEnd)
+    individual = _swig_new_instance_method(_simuPOP_ba.Population_individual)
+    indByID = _swig_new_instance_method(_simuPOP_ba.Population_indByID)
+    indsByIDs = _swig_new_instance_method(_simuPOP_ba.Population_indsByIDs)
+    ancestor = _swig_new_instance_method(_simuPOP_ba.Population_ancestor)
+    individuals = _swig_new_instance_method(_simuPOP_ba.Population_individuals)
+    indIterator = _swig_new_instance_method(_simuPOP_ba.Population_indIterator)
+    rawIndBegin = _swig_new_instance_method(_simuPOP_ba.Population_rawIndBegin)
+    rawIndEnd = _swig_new_instance_method(_simuPOP_ba.Population_rawIndEnd)
+    alleleIterator = _swig_new_instance_method(_simuPOP_ba.Population_alleleIterator)
+    indGenoBegin = _swig_new_instance_method(_simuPOP_ba.Population_indGenoBegin)
+    indGenoEnd = _swig_new_instance_method(_simuPOP_ba.Population_indGenoEnd)
+    genotype = _swig_new_instance_method(_simuPOP_ba.Population_genotype)
+    mutants = _swig_new_instance_method(_simuPOP_ba.Population_mutants)
+    lineage = _swig_new_instance_method(_simuPOP_ba.Population_lineage)
+    setGenotype = _swig_new_instance_method(_simuPOP_ba.Population_setGenotype)
+    setLineage = _swig_new_instance_method(_simuPOP_ba.Population_setLineage)
+    sortIndividuals = _swig_new_instance_method(_simuPOP_ba.Population_sortIndividuals)
+    setSubPopByIndInfo = _swig_new_instance_method(_simuPOP_ba.Population_setSubPopByIndInfo)
+    splitSubPop = _swig_new_instance_method(_simuPOP_ba.Population_splitSubPop)
+    removeSubPops = _swig_new_instance_method(_simuPOP_ba.Population_removeSubPops)
+    removeIndividuals = _swig_new_instance_method(_simuPOP_ba.Population_removeIndividuals)
+    mergeSubPops = _swig_new_instance_method(_simuPOP_ba.Population_mergeSubPops)
+    addIndFrom = _swig_new_instance_method(_simuPOP_ba.Population_addIndFrom)
+    addChromFrom = _swig_new_instance_method(_simuPOP_ba.Population_addChromFrom)
+    addLociFrom = _swig_new_instance_method(_simuPOP_ba.Population_addLociFrom)
+    addChrom = _swig_new_instance_method(_simuPOP_ba.Population_addChrom)
+    addLoci = _swig_new_instance_method(_simuPOP_ba.Population_addLoci)
+    resize = _swig_new_instance_method(_simuPOP_ba.Population_resize)
+    extractSubPops = _swig_new_instance_method(_simuPOP_ba.Population_extractSubPops)
+    extractIndividuals = _swig_new_instance_method(_simuPOP_ba.Population_extractIndividuals)
+    extractIndividualSets = _swig_new_instance_method(_simuPOP_ba.Population_extractIndividualSets)
+    removeLoci = _swig_new_instance_method(_simuPOP_ba.Population_removeLoci)
+    recodeAlleles = _swig_new_instance_method(_simuPOP_ba.Population_recodeAlleles)
+    push = _swig_new_instance_method(_simuPOP_ba.Population_push)
+    curAncestralGen = _swig_new_instance_method(_simuPOP_ba.Population_curAncestralGen)
+    ancestralGens = _swig_new_instance_method(_simuPOP_ba.Population_ancestralGens)
+    setIndInfo = _swig_new_instance_method(_simuPOP_ba.Population_setIndInfo)
+    infoBegin = _swig_new_instance_method(_simuPOP_ba.Population_infoBegin)
+    infoEnd = _swig_new_instance_method(_simuPOP_ba.Population_infoEnd)
+    indInfo = _swig_new_instance_method(_simuPOP_ba.Population_indInfo)
+    infoArray = _swig_new_instance_method(_simuPOP_ba.Population_infoArray)
+    indInfoArray = _swig_new_instance_method(_simuPOP_ba.Population_indInfoArray)
+    addInfoFields = _swig_new_instance_method(_simuPOP_ba.Population_addInfoFields)
+    setInfoFields = _swig_new_instance_method(_simuPOP_ba.Population_setInfoFields)
+    removeInfoFields = _swig_new_instance_method(_simuPOP_ba.Population_removeInfoFields)
+    updateInfoFieldsFrom = _swig_new_instance_method(_simuPOP_ba.Population_updateInfoFieldsFrom)
+    setAncestralDepth = _swig_new_instance_method(_simuPOP_ba.Population_setAncestralDepth)
+    useAncestralGen = _swig_new_instance_method(_simuPOP_ba.Population_useAncestralGen)
+    save = _swig_new_instance_method(_simuPOP_ba.Population_save)
+    vars = _swig_new_instance_method(_simuPOP_ba.Population_vars)
+    evaluate = _swig_new_instance_method(_simuPOP_ba.Population_evaluate)
+    execute = _swig_new_instance_method(_simuPOP_ba.Population_execute)
+
+# Register Population in _simuPOP_ba:
+_simuPOP_ba.Population_swigregister(Population)
+HAPLODIPLOID = _simuPOP_ba.HAPLODIPLOID
 
-    """
-    return _simuPOP_ba.loadPopulation(file)
+loadPopulation = _simuPOP_ba.loadPopulation
 class BaseOperator(object):
-    """
+    r"""
 
 
     Details:
@@ -4708,11 +1847,11 @@ class BaseOperator(object):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, output: 'stringFunc', begin: 'int', end: 'int', step: 'int', at: 'intList', reps: 'intList', subPops: 'subPopList', infoFields: 'stringList'):
-        """
+    def __init__(self, output: "stringFunc", begin: "int", end: "int", step: "int", at: "intList", reps: "intList", subPops: "subPopList", infoFields: "stringList"):
+        r"""
 
 
         Usage:
@@ -4780,65 +1919,25 @@ class BaseOperator(object):
         """
         _simuPOP_ba.BaseOperator_swiginit(self, _simuPOP_ba.new_BaseOperator(output, begin, end, step, at, reps, subPops, infoFields))
     __swig_destroy__ = _simuPOP_ba.delete_BaseOperator
+    clone = _swig_new_instance_method(_simuPOP_ba.BaseOperator_clone)
+    apply = _swig_new_instance_method(_simuPOP_ba.BaseOperator_apply)
+    describe = _swig_new_instance_method(_simuPOP_ba.BaseOperator_describe)
 
-    def clone(self) -> "simuPOP::BaseOperator *":
-        """
-
-
-        Usage:
-
-            x.clone()
-
-        Details:
-
-            Return a cloned copy of an operator. This function is available to
-            all operators.
-
-
-        """
-        return _simuPOP_ba.BaseOperator_clone(self)
-
-
-    def apply(self, pop: 'Population') -> "bool":
-        """
-
-
-        Usage:
-
-            x.apply(pop)
-
-        Details:
-
-            Apply an operator to population pop directly, without checking its
-            applicability.
-
-
-        """
-        return _simuPOP_ba.BaseOperator_apply(self, pop)
-
-
-    def describe(self, format: 'bool'=True) -> "string":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.BaseOperator_describe(self, format)
-
-BaseOperator.clone = new_instancemethod(_simuPOP_ba.BaseOperator_clone, None, BaseOperator)
-BaseOperator.apply = new_instancemethod(_simuPOP_ba.BaseOperator_apply, None, BaseOperator)
-BaseOperator.describe = new_instancemethod(_simuPOP_ba.BaseOperator_describe, None, BaseOperator)
-BaseOperator_swigregister = _simuPOP_ba.BaseOperator_swigregister
-BaseOperator_swigregister(BaseOperator)
+# Register BaseOperator in _simuPOP_ba:
+_simuPOP_ba.BaseOperator_swigregister(BaseOperator)
 
 class opList(object):
-    """
+    r"""
 
 
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args):
-        """
+        r"""
 
 
         Usage:
@@ -4849,11 +1948,12 @@ class opList(object):
         """
         _simuPOP_ba.opList_swiginit(self, _simuPOP_ba.new_opList(*args))
     __swig_destroy__ = _simuPOP_ba.delete_opList
-opList_swigregister = _simuPOP_ba.opList_swigregister
-opList_swigregister(opList)
+
+# Register opList in _simuPOP_ba:
+_simuPOP_ba.opList_swigregister(opList)
 
 class Pause(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -4866,11 +1966,11 @@ class Pause(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -4906,11 +2006,12 @@ class Pause(BaseOperator):
         """
         _simuPOP_ba.Pause_swiginit(self, _simuPOP_ba.new_Pause(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_Pause
-Pause_swigregister = _simuPOP_ba.Pause_swigregister
-Pause_swigregister(Pause)
+
+# Register Pause in _simuPOP_ba:
+_simuPOP_ba.Pause_swigregister(Pause)
 
 class NoneOp(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -4922,11 +2023,11 @@ class NoneOp(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -4942,11 +2043,12 @@ class NoneOp(BaseOperator):
         """
         _simuPOP_ba.NoneOp_swiginit(self, _simuPOP_ba.new_NoneOp(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_NoneOp
-NoneOp_swigregister = _simuPOP_ba.NoneOp_swigregister
-NoneOp_swigregister(NoneOp)
+
+# Register NoneOp in _simuPOP_ba:
+_simuPOP_ba.NoneOp_swigregister(NoneOp)
 
 class IfElse(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -4960,11 +2062,11 @@ class IfElse(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -4994,11 +2096,12 @@ class IfElse(BaseOperator):
         """
         _simuPOP_ba.IfElse_swiginit(self, _simuPOP_ba.new_IfElse(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_IfElse
-IfElse_swigregister = _simuPOP_ba.IfElse_swigregister
-IfElse_swigregister(IfElse)
+
+# Register IfElse in _simuPOP_ba:
+_simuPOP_ba.IfElse_swigregister(IfElse)
 
 class TerminateIf(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -5014,11 +2117,11 @@ class TerminateIf(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5042,11 +2145,12 @@ class TerminateIf(BaseOperator):
         """
         _simuPOP_ba.TerminateIf_swiginit(self, _simuPOP_ba.new_TerminateIf(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_TerminateIf
-TerminateIf_swigregister = _simuPOP_ba.TerminateIf_swigregister
-TerminateIf_swigregister(TerminateIf)
+
+# Register TerminateIf in _simuPOP_ba:
+_simuPOP_ba.TerminateIf_swigregister(TerminateIf)
 
 class RevertIf(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -5060,11 +2164,11 @@ class RevertIf(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5091,11 +2195,12 @@ class RevertIf(BaseOperator):
         """
         _simuPOP_ba.RevertIf_swiginit(self, _simuPOP_ba.new_RevertIf(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_RevertIf
-RevertIf_swigregister = _simuPOP_ba.RevertIf_swigregister
-RevertIf_swigregister(RevertIf)
+
+# Register RevertIf in _simuPOP_ba:
+_simuPOP_ba.RevertIf_swigregister(RevertIf)
 
 class DiscardIf(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -5108,11 +2213,11 @@ class DiscardIf(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5151,11 +2256,12 @@ class DiscardIf(BaseOperator):
         """
         _simuPOP_ba.DiscardIf_swiginit(self, _simuPOP_ba.new_DiscardIf(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_DiscardIf
-DiscardIf_swigregister = _simuPOP_ba.DiscardIf_swigregister
-DiscardIf_swigregister(DiscardIf)
+
+# Register DiscardIf in _simuPOP_ba:
+_simuPOP_ba.DiscardIf_swigregister(DiscardIf)
 
 class TicToc(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -5178,11 +2284,11 @@ class TicToc(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5200,11 +2306,12 @@ class TicToc(BaseOperator):
         """
         _simuPOP_ba.TicToc_swiginit(self, _simuPOP_ba.new_TicToc(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_TicToc
-TicToc_swigregister = _simuPOP_ba.TicToc_swigregister
-TicToc_swigregister(TicToc)
+
+# Register TicToc in _simuPOP_ba:
+_simuPOP_ba.TicToc_swigregister(TicToc)
 
 class PyOperator(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -5221,11 +2328,11 @@ class PyOperator(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5263,15 +2370,13 @@ class PyOperator(BaseOperator):
         """
         _simuPOP_ba.PyOperator_swiginit(self, _simuPOP_ba.new_PyOperator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyOperator
-PyOperator_swigregister = _simuPOP_ba.PyOperator_swigregister
-PyOperator_swigregister(PyOperator)
 
+# Register PyOperator in _simuPOP_ba:
+_simuPOP_ba.PyOperator_swigregister(PyOperator)
 
-def applyDuringMatingOperator(op: 'BaseOperator', pop: 'Population', offPop: 'Population', dad: 'ssize_t', mom: 'ssize_t', off: 'pairu const &') -> "void":
-    """Obsolete or undocumented function."""
-    return _simuPOP_ba.applyDuringMatingOperator(op, pop, offPop, dad, mom, off)
+applyDuringMatingOperator = _simuPOP_ba.applyDuringMatingOperator
 class OffspringGenerator(object):
-    """
+    r"""
 
 
     Details:
@@ -5284,11 +2389,11 @@ class OffspringGenerator(object):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, ops: 'opList', numOffspring: 'floatListFunc'=1, sexMode: 'floatListFunc'=RANDOM_SEX):
-        """
+    def __init__(self, ops: "opList", numOffspring: "floatListFunc"=1, sexMode: "floatListFunc"=RANDOM_SEX):
+        r"""
 
 
         Usage:
@@ -5365,23 +2470,14 @@ class OffspringGenerator(object):
         """
         _simuPOP_ba.OffspringGenerator_swiginit(self, _simuPOP_ba.new_OffspringGenerator(ops, numOffspring, sexMode))
     __swig_destroy__ = _simuPOP_ba.delete_OffspringGenerator
+    clone = _swig_new_instance_method(_simuPOP_ba.OffspringGenerator_clone)
+    describe = _swig_new_instance_method(_simuPOP_ba.OffspringGenerator_describe)
 
-    def clone(self) -> "simuPOP::OffspringGenerator *":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.OffspringGenerator_clone(self)
-
-
-    def describe(self, format: 'bool'=True) -> "string":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.OffspringGenerator_describe(self, format)
-
-OffspringGenerator.clone = new_instancemethod(_simuPOP_ba.OffspringGenerator_clone, None, OffspringGenerator)
-OffspringGenerator.describe = new_instancemethod(_simuPOP_ba.OffspringGenerator_describe, None, OffspringGenerator)
-OffspringGenerator_swigregister = _simuPOP_ba.OffspringGenerator_swigregister
-OffspringGenerator_swigregister(OffspringGenerator)
+# Register OffspringGenerator in _simuPOP_ba:
+_simuPOP_ba.OffspringGenerator_swigregister(OffspringGenerator)
 
 class ControlledOffspringGenerator(OffspringGenerator):
-    """
+    r"""
 
 
     Details:
@@ -5400,11 +2496,11 @@ class ControlledOffspringGenerator(OffspringGenerator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5442,11 +2538,12 @@ class ControlledOffspringGenerator(OffspringGenerator):
         """
         _simuPOP_ba.ControlledOffspringGenerator_swiginit(self, _simuPOP_ba.new_ControlledOffspringGenerator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_ControlledOffspringGenerator
-ControlledOffspringGenerator_swigregister = _simuPOP_ba.ControlledOffspringGenerator_swigregister
-ControlledOffspringGenerator_swigregister(ControlledOffspringGenerator)
+
+# Register ControlledOffspringGenerator in _simuPOP_ba:
+_simuPOP_ba.ControlledOffspringGenerator_swigregister(ControlledOffspringGenerator)
 
 class ParentChooser(object):
-    """
+    r"""
 
 
     Details:
@@ -5460,11 +2557,11 @@ class ParentChooser(object):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5474,62 +2571,17 @@ class ParentChooser(object):
 
         """
         _simuPOP_ba.ParentChooser_swiginit(self, _simuPOP_ba.new_ParentChooser(*args, **kwargs))
-
-    def clone(self) -> "simuPOP::ParentChooser *":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.ParentChooser_clone(self)
-
-
-    def initialize(self, pop: 'Population', subPop: 'size_t') -> "void":
-        """
-
-
-        Description:
-
-            Initialize a parent chooser for subpopulation subPop of population
-            pop.
-
-        Usage:
-
-            x.initialize(pop, subPop)
-
-
-        """
-        return _simuPOP_ba.ParentChooser_initialize(self, pop, subPop)
-
-
-    def describe(self, format: 'bool'=True) -> "string":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.ParentChooser_describe(self, format)
-
-
-    def chooseParents(self) -> "simuPOP::ParentChooser::IndividualPair":
-        """
-
-
-        Description:
-
-            Return chosen parents from a population if the parent chooser
-            object is created with a population.
-
-        Usage:
-
-            x.chooseParents()
-
-
-        """
-        return _simuPOP_ba.ParentChooser_chooseParents(self)
-
+    clone = _swig_new_instance_method(_simuPOP_ba.ParentChooser_clone)
+    initialize = _swig_new_instance_method(_simuPOP_ba.ParentChooser_initialize)
+    describe = _swig_new_instance_method(_simuPOP_ba.ParentChooser_describe)
+    chooseParents = _swig_new_instance_method(_simuPOP_ba.ParentChooser_chooseParents)
     __swig_destroy__ = _simuPOP_ba.delete_ParentChooser
-ParentChooser.clone = new_instancemethod(_simuPOP_ba.ParentChooser_clone, None, ParentChooser)
-ParentChooser.initialize = new_instancemethod(_simuPOP_ba.ParentChooser_initialize, None, ParentChooser)
-ParentChooser.describe = new_instancemethod(_simuPOP_ba.ParentChooser_describe, None, ParentChooser)
-ParentChooser.chooseParents = new_instancemethod(_simuPOP_ba.ParentChooser_chooseParents, None, ParentChooser)
-ParentChooser_swigregister = _simuPOP_ba.ParentChooser_swigregister
-ParentChooser_swigregister(ParentChooser)
+
+# Register ParentChooser in _simuPOP_ba:
+_simuPOP_ba.ParentChooser_swigregister(ParentChooser)
 
 class SequentialParentChooser(ParentChooser):
-    """
+    r"""
 
 
     Details:
@@ -5542,11 +2594,11 @@ class SequentialParentChooser(ParentChooser):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, sexChoice: 'SexChoice'=ANY_SEX):
-        """
+    def __init__(self, sexChoice: "SexChoice"=ANY_SEX):
+        r"""
 
 
         Usage:
@@ -5566,11 +2618,12 @@ class SequentialParentChooser(ParentChooser):
         """
         _simuPOP_ba.SequentialParentChooser_swiginit(self, _simuPOP_ba.new_SequentialParentChooser(sexChoice))
     __swig_destroy__ = _simuPOP_ba.delete_SequentialParentChooser
-SequentialParentChooser_swigregister = _simuPOP_ba.SequentialParentChooser_swigregister
-SequentialParentChooser_swigregister(SequentialParentChooser)
+
+# Register SequentialParentChooser in _simuPOP_ba:
+_simuPOP_ba.SequentialParentChooser_swigregister(SequentialParentChooser)
 
 class RandomParentChooser(ParentChooser):
-    """
+    r"""
 
 
     Details:
@@ -5590,11 +2643,11 @@ class RandomParentChooser(ParentChooser):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5617,11 +2670,12 @@ class RandomParentChooser(ParentChooser):
         """
         _simuPOP_ba.RandomParentChooser_swiginit(self, _simuPOP_ba.new_RandomParentChooser(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_RandomParentChooser
-RandomParentChooser_swigregister = _simuPOP_ba.RandomParentChooser_swigregister
-RandomParentChooser_swigregister(RandomParentChooser)
+
+# Register RandomParentChooser in _simuPOP_ba:
+_simuPOP_ba.RandomParentChooser_swigregister(RandomParentChooser)
 
 class RandomParentsChooser(ParentChooser):
-    """
+    r"""
 
 
     Details:
@@ -5642,11 +2696,11 @@ class RandomParentsChooser(ParentChooser):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5665,11 +2719,12 @@ class RandomParentsChooser(ParentChooser):
         """
         _simuPOP_ba.RandomParentsChooser_swiginit(self, _simuPOP_ba.new_RandomParentsChooser(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_RandomParentsChooser
-RandomParentsChooser_swigregister = _simuPOP_ba.RandomParentsChooser_swigregister
-RandomParentsChooser_swigregister(RandomParentsChooser)
+
+# Register RandomParentsChooser in _simuPOP_ba:
+_simuPOP_ba.RandomParentsChooser_swigregister(RandomParentsChooser)
 
 class PolyParentsChooser(ParentChooser):
-    """
+    r"""
 
 
     Details:
@@ -5684,11 +2739,11 @@ class PolyParentsChooser(ParentChooser):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5710,11 +2765,12 @@ class PolyParentsChooser(ParentChooser):
         """
         _simuPOP_ba.PolyParentsChooser_swiginit(self, _simuPOP_ba.new_PolyParentsChooser(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PolyParentsChooser
-PolyParentsChooser_swigregister = _simuPOP_ba.PolyParentsChooser_swigregister
-PolyParentsChooser_swigregister(PolyParentsChooser)
+
+# Register PolyParentsChooser in _simuPOP_ba:
+_simuPOP_ba.PolyParentsChooser_swigregister(PolyParentsChooser)
 
 class CombinedParentsChooser(ParentChooser):
-    """
+    r"""
 
 
     Details:
@@ -5728,11 +2784,11 @@ class CombinedParentsChooser(ParentChooser):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, fatherChooser: 'ParentChooser', motherChooser: 'ParentChooser', allowSelfing: 'bool'=True):
-        """
+    def __init__(self, fatherChooser: "ParentChooser", motherChooser: "ParentChooser", allowSelfing: "bool"=True):
+        r"""
 
 
         Usage:
@@ -5759,11 +2815,12 @@ class CombinedParentsChooser(ParentChooser):
         """
         _simuPOP_ba.CombinedParentsChooser_swiginit(self, _simuPOP_ba.new_CombinedParentsChooser(fatherChooser, motherChooser, allowSelfing))
     __swig_destroy__ = _simuPOP_ba.delete_CombinedParentsChooser
-CombinedParentsChooser_swigregister = _simuPOP_ba.CombinedParentsChooser_swigregister
-CombinedParentsChooser_swigregister(CombinedParentsChooser)
+
+# Register CombinedParentsChooser in _simuPOP_ba:
+_simuPOP_ba.CombinedParentsChooser_swigregister(CombinedParentsChooser)
 
 class PyParentsChooser(ParentChooser):
-    """
+    r"""
 
 
     Details:
@@ -5783,11 +2840,11 @@ class PyParentsChooser(ParentChooser):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, generator: 'PyObject *'):
-        """
+    def __init__(self, generator: "PyObject *"):
+        r"""
 
 
         Usage:
@@ -5807,11 +2864,12 @@ class PyParentsChooser(ParentChooser):
         """
         _simuPOP_ba.PyParentsChooser_swiginit(self, _simuPOP_ba.new_PyParentsChooser(generator))
     __swig_destroy__ = _simuPOP_ba.delete_PyParentsChooser
-PyParentsChooser_swigregister = _simuPOP_ba.PyParentsChooser_swigregister
-PyParentsChooser_swigregister(PyParentsChooser)
+
+# Register PyParentsChooser in _simuPOP_ba:
+_simuPOP_ba.PyParentsChooser_swigregister(PyParentsChooser)
 
 class MatingScheme(object):
-    """
+    r"""
 
 
     Details:
@@ -5823,16 +2881,16 @@ class MatingScheme(object):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
 
-            MatingScheme(subPopSize=[])
+            MatingScheme(subPopSize=[], trackAlleleFreq=[])
 
         Details:
 
@@ -5853,29 +2911,27 @@ class MatingScheme(object):
             but you can also modify this population to prepare for mating. A
             common practice is to split and merge parental populations in this
             function so that you demographic related information and actions
-            could be implemented in the same function.
+            could be implemented in the same function.  If a list of loci is
+            given to parameter trackAlleleFreq, alleles at these loci are
+            counted as offspring are produced, and variables alleleNum and
+            alleleFreq of the offspring population are set as if operator
+            Stat(alleleFreq=trackAlleleFreq) were applied to it after mating.
+            Because offspring are counted while their genotypes are being
+            written, this avoids a separate pass through the offspring
+            population.
 
 
         """
         _simuPOP_ba.MatingScheme_swiginit(self, _simuPOP_ba.new_MatingScheme(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MatingScheme
+    clone = _swig_new_instance_method(_simuPOP_ba.MatingScheme_clone)
+    describe = _swig_new_instance_method(_simuPOP_ba.MatingScheme_describe)
 
-    def clone(self) -> "simuPOP::MatingScheme *":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.MatingScheme_clone(self)
-
-
-    def describe(self, format: 'bool'=True) -> "string":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.MatingScheme_describe(self, format)
-
-MatingScheme.clone = new_instancemethod(_simuPOP_ba.MatingScheme_clone, None, MatingScheme)
-MatingScheme.describe = new_instancemethod(_simuPOP_ba.MatingScheme_describe, None, MatingScheme)
-MatingScheme_swigregister = _simuPOP_ba.MatingScheme_swigregister
-MatingScheme_swigregister(MatingScheme)
+# Register MatingScheme in _simuPOP_ba:
+_simuPOP_ba.MatingScheme_swigregister(MatingScheme)
 
 class HomoMating(MatingScheme):
-    """
+    r"""
 
 
     Details:
@@ -5889,17 +2945,17 @@ class HomoMating(MatingScheme):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
 
             HomoMating(chooser, generator, subPopSize=[], subPops=ALL_AVAIL,
-              weight=0)
+              weight=0, trackAlleleFreq=[])
 
         Details:
 
@@ -5916,17 +2972,22 @@ class HomoMating(MatingScheme):
             weight are used to determine which (virtual) subpopulations this
             mating scheme will be applied to, and how many offspring this
             mating scheme will produce. Please refer to mating scheme
-            HeteroMating for the use of these two parameters.
+            HeteroMating for the use of these two parameters.  Parameter
+            trackAlleleFreq can be used to count alleles at specified loci
+            during mating. Please refer to class MatingScheme for details.
+            This parameter is ignored if this mating scheme is used within a
+            heterogeneous mating scheme.
 
 
         """
         _simuPOP_ba.HomoMating_swiginit(self, _simuPOP_ba.new_HomoMating(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_HomoMating
-HomoMating_swigregister = _simuPOP_ba.HomoMating_swigregister
-HomoMating_swigregister(HomoMating)
+
+# Register HomoMating in _simuPOP_ba:
+_simuPOP_ba.HomoMating_swigregister(HomoMating)
 
 class PedigreeMating(MatingScheme):
-    """
+    r"""
 
 
     Details:
@@ -5950,11 +3011,11 @@ class PedigreeMating(MatingScheme):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -5976,25 +3037,13 @@ class PedigreeMating(MatingScheme):
         """
         _simuPOP_ba.PedigreeMating_swiginit(self, _simuPOP_ba.new_PedigreeMating(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PedigreeMating
+    parallelizable = _swig_new_instance_method(_simuPOP_ba.PedigreeMating_parallelizable)
 
-    def parallelizable(self) -> "bool":
-        """
-
-
-        Usage:
-
-            x.parallelizable()
-
-
-        """
-        return _simuPOP_ba.PedigreeMating_parallelizable(self)
-
-PedigreeMating.parallelizable = new_instancemethod(_simuPOP_ba.PedigreeMating_parallelizable, None, PedigreeMating)
-PedigreeMating_swigregister = _simuPOP_ba.PedigreeMating_swigregister
-PedigreeMating_swigregister(PedigreeMating)
+# Register PedigreeMating in _simuPOP_ba:
+_simuPOP_ba.PedigreeMating_swigregister(PedigreeMating)
 
 class HeteroMating(MatingScheme):
-    """
+    r"""
 
 
     Details:
@@ -6005,17 +3054,17 @@ class HeteroMating(MatingScheme):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
 
             HeteroMating(matingSchemes, subPopSize=[],
-              shuffleOffspring=True, weightBy=ANY_SEX)
+              shuffleOffspring=True, weightBy=ANY_SEX, trackAlleleFreq=[])
 
         Details:
 
@@ -6034,403 +3083,188 @@ class HeteroMating(MatingScheme):
             schemes are applied to the same subpopulation, a weight (parameter
             weight) can be given to each mating scheme to determine how many
             offspring it will produce. The default for all mating schemes are
-            0. In this case, the number of offspring each mating scheme
-            produces is proportional to the number of individuals in its
-            parental (virtual) subpopulation (default to all parents, but can
-            be father for weightBy=MALE_ONLY, mother for weightBy=FEMALE_ONLY,
-            or father mother pairs (less of number of father and mothers) for
-            weightBy=PAIR_ONLY). If all weights are negative, the numbers of
-            offspring are determined by the multiplication of the absolute
-            values of the weights and their respective parental (virtual)
-            subpopulation sizes. If all weights are positive, the number of
-            offspring produced by each mating scheme is proportional to these
-            weights. Mating schemes with zero weight in this case will produce
-            no offspring. If both negative and positive weights are present,
-            negative weights are processed before positive ones.  A sexual
-            mating scheme might fail if a parental (virtual) subpopulation has
-            no father or mother. In this case, you can set weightBy to
-            PAIR_ONLY so a (virtual) subpopulation will appear to have zero
-            size, and will thus contribute no offspring to the offspring
-            population. Note that the size of parental (virtual) subpopulation
-            in this mode (and in the modes of MALE_ONLY, FEMALE_ONLY) during
-            the calculation of the size of the offspring subpopulation will be
-            roughly half of the actual population size so you might have to
-            use weight=-2 if you would like to have an offspring subpopulation
-            that is roughly the same size of the parental (virtual)
-            subpopulation.  If multiple mating schemes are applied to the same
-            subpopulation, offspring produced by these mating schemes are
-            shuffled randomly. If this is not desired, you can turn off
-            offspring shuffling by setting parameter shuffleOffspring to
-            False.
-
-
-        """
-        _simuPOP_ba.HeteroMating_swiginit(self, _simuPOP_ba.new_HeteroMating(*args, **kwargs))
-    __swig_destroy__ = _simuPOP_ba.delete_HeteroMating
-HeteroMating_swigregister = _simuPOP_ba.HeteroMating_swigregister
-HeteroMating_swigregister(HeteroMating)
-
-class ConditionalMating(MatingScheme):
-    """
-
-
-    Details:
-
-        A conditional mating scheme that applies different mating schemes
-        according to a condition (similar to operator IfElse). The
-        condition can be a fixed condition, an expression or a user-
-        defined function, to determine which mating scheme to be used.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, cond: 'PyObject *', ifMatingScheme: 'MatingScheme', elseMatingScheme: 'MatingScheme'):
-        """
-
-
-        Usage:
-
-            ConditionalMating(cond, ifMatingScheme, elseMatingScheme)
-
-        Details:
-
-            Create a conditional mating scheme that applies mating scheme
-            ifMatingScheme if the condition cond is True, or elseMatingScheme
-            if cond is False. If a Python expression (a string) is given to
-            parameter cond, the expression will be evalulated in parental
-            population's local namespace. When a Python function is specified,
-            it accepts parameter pop for the parental population. The return
-            value of this function should be True or False. Otherwise,
-            parameter cond will be treated as a fixed condition (converted to
-            True or False) upon which ifMatingScheme or elseMatingScheme will
-            alway be applied.
-
-
-        """
-        _simuPOP_ba.ConditionalMating_swiginit(self, _simuPOP_ba.new_ConditionalMating(cond, ifMatingScheme, elseMatingScheme))
-    __swig_destroy__ = _simuPOP_ba.delete_ConditionalMating
-ConditionalMating_swigregister = _simuPOP_ba.ConditionalMating_swigregister
-ConditionalMating_swigregister(ConditionalMating)
-
-class pyPopIterator(object):
-    """
-
-
-    Details:
-
-        This class implements a Python itertor class that can be used to
-        iterate through populations in a population.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, begin: 'vector< simuPOP::Population *,std::allocator< simuPOP::Population * > >::iterator const', end: 'vector< simuPOP::Population *,std::allocator< simuPOP::Population * > >::iterator const'):
-        """
-
-
-        Usage:
-
-            pyPopIterator(begin, end)
-
-
-        """
-        _simuPOP_ba.pyPopIterator_swiginit(self, _simuPOP_ba.new_pyPopIterator(begin, end))
-    __swig_destroy__ = _simuPOP_ba.delete_pyPopIterator
-
-    def next(self) -> "simuPOP::Population &":
-        """
-
-
-        Usage:
-
-            x.__next__()
-
-
-        """
-        return _simuPOP_ba.pyPopIterator_next(self)
-
-pyPopIterator.__iter__ = new_instancemethod(_simuPOP_ba.pyPopIterator___iter__, None, pyPopIterator)
-pyPopIterator.next = new_instancemethod(_simuPOP_ba.pyPopIterator_next, None, pyPopIterator)
-pyPopIterator.__next__ = new_instancemethod(_simuPOP_ba.pyPopIterator___next__, None, pyPopIterator)
-pyPopIterator_swigregister = _simuPOP_ba.pyPopIterator_swigregister
-pyPopIterator_swigregister(pyPopIterator)
-
-class Simulator(object):
-    """
-
-
-    Details:
-
-        A simuPOP simulator is responsible for evolving one or more
-        populations forward in time, subject to various operators.
-        Populations in a simulator are created from one or more replicates
-        of specified populations. A number of functions are provided to
-        access and manipulate populations, and most importantly, to evolve
-        them.
-
-
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, pops: 'PyObject *', rep: 'UINT'=1, stealPops: 'bool'=True):
-        """
-
-
-        Usage:
-
-            Simulator(pops, rep=1, stealPops=True)
-
-        Details:
-
-            Create a simulator with rep (default to 1) replicates of
-            populations pops, which is a list of populations although a single
-            population object is also acceptable. Contents of passed
-            populations are by default moved to the simulator to avoid
-            duplication of potentially large population objects, leaving empty
-            populations behind. This behavior can be changed by setting
-            stealPops to False, in which case populations are copied to the
-            simulator.
-
-
-        """
-        _simuPOP_ba.Simulator_swiginit(self, _simuPOP_ba.new_Simulator(pops, rep, stealPops))
-    __swig_destroy__ = _simuPOP_ba.delete_Simulator
-
-    def clone(self) -> "simuPOP::Simulator *":
-        """
-
-
-        Usage:
-
-            x.clone()
-
-        Details:
-
-            Clone a simulator, along with all its populations. Note that
-            Python assign statement simu1 = simu only creates a symbolic link
-            to an existing simulator.
-
-
-        """
-        return _simuPOP_ba.Simulator_clone(self)
-
-
-    def numRep(self) -> "size_t":
-        """
-
-
-        Usage:
-
-            x.numRep()
-
-        Details:
-
-            Return the number of replicates.
-
-
-        """
-        return _simuPOP_ba.Simulator_numRep(self)
+            0. In this case, the number of offspring each mating scheme
+            produces is proportional to the number of individuals in its
+            parental (virtual) subpopulation (default to all parents, but can
+            be father for weightBy=MALE_ONLY, mother for weightBy=FEMALE_ONLY,
+            or father mother pairs (less of number of father and mothers) for
+            weightBy=PAIR_ONLY). If all weights are negative, the numbers of
+            offspring are determined by the multiplication of the absolute
+            values of the weights and their respective parental (virtual)
+            subpopulation sizes. If all weights are positive, the number of
+            offspring produced by each mating scheme is proportional to these
+            weights, except for mating schemes with zero parental population
+            size (or no father, no mother, or no pairs, depending on value of
+            parameter weightBy). Mating schemes with zero weight in this case
+            will produce no offspring. If both negative and positive weights
+            are present, negative weights are processed before positive ones.
+            A sexual mating scheme might fail if a parental (virtual)
+            subpopulation has no father or mother. In this case, you can set
+            weightBy to PAIR_ONLY so a (virtual) subpopulation will appear to
+            have zero size, and will thus contribute no offspring to the
+            offspring population. Note that the perceived parental (virtual)
+            subpopulation size in this mode (and in modes of MALE_ONLY,
+            FEMALE_ONLY) during the calculation of the size of the offspring
+            subpopulation will be roughly half of the actual population size
+            so you might have to use weight=-2 if you would like to have an
+            offspring subpopulation that is roughly the same size of the
+            parental (virtual) subpopulation.  If multiple mating schemes are
+            applied to the same subpopulation, offspring produced by these
+            mating schemes are shuffled randomly. If this is not desired, you
+            can turn off offspring shuffling by setting parameter
+            shuffleOffspring to False.  If a list of loci is given to
+            parameter trackAlleleFreq, alleles at these loci are counted as
+            offspring are produced by all homogeneous mating schemes, and are
+            used to set variables alleleNum and alleleFreq of the offspring
+            population. Please refer to class MatingScheme for details.
 
 
-    def population(self, rep: 'size_t') -> "simuPOP::Population &":
         """
+        _simuPOP_ba.HeteroMating_swiginit(self, _simuPOP_ba.new_HeteroMating(*args, **kwargs))
+    __swig_destroy__ = _simuPOP_ba.delete_HeteroMating
 
+# Register HeteroMating in _simuPOP_ba:
+_simuPOP_ba.HeteroMating_swigregister(HeteroMating)
 
-        Usage:
+class ConditionalMating(MatingScheme):
+    r"""
 
-            x.population(rep)
 
-        Details:
+    Details:
 
-            Return a reference to the rep-th population of a simulator. The
-            reference will become invalid once the simulator starts evolving
-            or becomes invalid (removed). If an independent copy of the
-            population is needed, you can use population.clone() to create a
-            cloned copy or simulator.extract() to remove the population from
-            the simulator.
+        A conditional mating scheme that applies different mating schemes
+        according to a condition (similar to operator IfElse). The
+        condition can be a fixed condition, an expression or a user-
+        defined function, to determine which mating scheme to be used.
 
 
-        """
-        return _simuPOP_ba.Simulator_population(self, rep)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def add(self, pop: 'Population', stealPop: 'bool'=True) -> "void":
-        """
+    def __init__(self, cond: "PyObject *", ifMatingScheme: "MatingScheme", elseMatingScheme: "MatingScheme"):
+        r"""
 
 
         Usage:
 
-            x.add(pop, stealPop=True)
+            ConditionalMating(cond, ifMatingScheme, elseMatingScheme)
 
         Details:
 
-            Add a population pop to the end of an existing simulator. This
-            function by default moves pop to the simulator, leaving an empty
-            population for passed population object. If steal is set to False,
-            the population will be copied to the simulator, and thus
-            unchanged.
-
-
-        """
-        return _simuPOP_ba.Simulator_add(self, pop, stealPop)
+            Create a conditional mating scheme that applies mating scheme
+            ifMatingScheme if the condition cond is True, or elseMatingScheme
+            if cond is False. If a Python expression (a string) is given to
+            parameter cond, the expression will be evalulated in parental
+            population's local namespace. When a Python function is specified,
+            it accepts parameter pop for the parental population. The return
+            value of this function should be True or False. Otherwise,
+            parameter cond will be treated as a fixed condition (converted to
+            True or False) upon which ifMatingScheme or elseMatingScheme will
+            alway be applied.
 
 
-    def extract(self, rep: 'UINT') -> "simuPOP::Population &":
         """
+        _simuPOP_ba.ConditionalMating_swiginit(self, _simuPOP_ba.new_ConditionalMating(cond, ifMatingScheme, elseMatingScheme))
+    __swig_destroy__ = _simuPOP_ba.delete_ConditionalMating
 
+# Register ConditionalMating in _simuPOP_ba:
+_simuPOP_ba.ConditionalMating_swigregister(ConditionalMating)
 
-        Usage:
+class pyPopIterator(object):
+    r"""
 
-            x.extract(rep)
 
-        Details:
+    Details:
 
-            Extract the rep-th population from a simulator. This will reduce
-            the number of populations in this simulator by one.
+        This class implements a Python itertor class that can be used to
+        iterate through populations in a population.
 
 
-        """
-        return _simuPOP_ba.Simulator_extract(self, rep)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def populations(self) -> "simuPOP::pyPopIterator":
-        """
+    def __init__(self, begin: "vector< simuPOP::Population *,std::allocator< simuPOP::Population * > >::iterator const", end: "vector< simuPOP::Population *,std::allocator< simuPOP::Population * > >::iterator const"):
+        r"""
 
 
         Usage:
 
-            x.populations()
-
-        Details:
-
-            Return a Python iterator that can be used to iterate through all
-            populations in a simulator.
-
-
-        """
-        return _simuPOP_ba.Simulator_populations(self)
+            pyPopIterator(begin, end)
 
 
-    def evolve(self, *args, **kwargs) -> "vectoru":
         """
+        _simuPOP_ba.pyPopIterator_swiginit(self, _simuPOP_ba.new_pyPopIterator(begin, end))
+    __swig_destroy__ = _simuPOP_ba.delete_pyPopIterator
+    __iter__ = _swig_new_instance_method(_simuPOP_ba.pyPopIterator___iter__)
+    next = _swig_new_instance_method(_simuPOP_ba.pyPopIterator_next)
+    __next__ = _swig_new_instance_method(_simuPOP_ba.pyPopIterator___next__)
 
+# Register pyPopIterator in _simuPOP_ba:
+_simuPOP_ba.pyPopIterator_swigregister(pyPopIterator)
 
-        Usage:
+class Simulator(object):
+    r"""
 
-            x.evolve(initOps=[], preOps=[], matingScheme=MatingScheme,
-              postOps=[], finalOps=[], gen=-1, dryrun=False)
 
-        Details:
+    Details:
 
-            Evolve all populations gen generations, subject to several lists
-            of operators which are applied at different stages of an
-            evolutionary process. Operators initOps are applied to all
-            populations (subject to applicability restrictions of the
-            operators, imposed by the rep parameter of these operators) before
-            evolution. They are used to initialize populations before
-            evolution. Operators finalOps are applied to all populations after
-            the evolution.  Operators preOps, and postOps are applied during
-            the life cycle of each generation. These operators can be applied
-            at all or some of the generations, to all or some of the evolving
-            populations, depending the begin, end, step, at and reps
-            parameters of these operators. These operators are applied in the
-            order at which they are specified. populations in a simulator are
-            evolved one by one. At each generation, operators preOps are
-            applied to the parental generations. A mating scheme is then used
-            to populate an offspring generation. For each offspring, his or
-            her sex is determined before during-mating operators of the mating
-            scheme are used to transmit parental genotypes. After an offspring
-            generation is successfully generated and becomes the current
-            generation, operators postOps are applied to the offspring
-            generation. If any of the preOps and postOps fails (return False),
-            the evolution of a population will be stopped. The generation
-            number of a population, which is the variable "gen" in each
-            populations local namespace, is increased by one if an offspring
-            generation has been successfully populated even if a post-mating
-            operator fails. Another variable "rep" will also be set to
-            indicate the index of each population in the simulator. Note that
-            populations in a simulator does not have to have the same
-            generation number. You could reset a population's generation
-            number by changing this variable.  Parameter gen can be set to a
-            non-negative number, which is the number of generations to evolve.
-            If a simulator starts at the beginning of a generation g (for
-            example 0), a simulator will stop at the beginning (instead of the
-            end) of generation g + gen (for example gen). If gen is negative
-            (default), the evolution will continue indefinitely, until all
-            replicates are stopped by operators that return False at some
-            point (these operators are called terminators). At the end of the
-            evolution, the generations that each replicates have evolved are
-            returned. Note that finalOps are applied to all applicable
-            population, including those that have stopped before others.  If
-            parameter dryrun is set to True, this function will print a
-            description of the evolutionary process generated by function
-            describeEvolProcess() and exits.
+        A simuPOP simulator is responsible for evolving one or more
+        populations forward in time, subject to various operators.
+        Populations in a simulator are created from one or more replicates
+        of specified populations. A number of functions are provided to
+        access and manipulate populations, and most importantly, to evolve
+        them.
 
 
-        """
-        return _simuPOP_ba.Simulator_evolve(self, *args, **kwargs)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def vars(self, *args, **kwargs) -> "PyObject *":
-        """
+    def __init__(self, pops: "PyObject *", rep: "UINT"=1, stealPops: "bool"=True):
+        r"""
 
 
         Usage:
 
-            x.vars(rep, subPop=[])
+            Simulator(pops, rep=1, stealPops=True)
 
         Details:
 
-            Return the local namespace of the rep-th population, equivalent to
-            x.Population(rep).vars(subPop).
+            Create a simulator with rep (default to 1) replicates of
+            populations pops, which is a list of populations although a single
+            population object is also acceptable. Contents of passed
+            populations are by default moved to the simulator to avoid
+            duplication of potentially large population objects, leaving empty
+            populations behind. This behavior can be changed by setting
+            stealPops to False, in which case populations are copied to the
+            simulator.
 
 
         """
-        return _simuPOP_ba.Simulator_vars(self, *args, **kwargs)
-
-Simulator.clone = new_instancemethod(_simuPOP_ba.Simulator_clone, None, Simulator)
-Simulator.numRep = new_instancemethod(_simuPOP_ba.Simulator_numRep, None, Simulator)
-Simulator.population = new_instancemethod(_simuPOP_ba.Simulator_population, None, Simulator)
-Simulator.add = new_instancemethod(_simuPOP_ba.Simulator_add, None, Simulator)
-Simulator.extract = new_instancemethod(_simuPOP_ba.Simulator_extract, None, Simulator)
-Simulator.populations = new_instancemethod(_simuPOP_ba.Simulator_populations, None, Simulator)
-Simulator.evolve = new_instancemethod(_simuPOP_ba.Simulator_evolve, None, Simulator)
-Simulator.vars = new_instancemethod(_simuPOP_ba.Simulator_vars, None, Simulator)
-Simulator.__cmp__ = new_instancemethod(_simuPOP_ba.Simulator___cmp__, None, Simulator)
-Simulator_swigregister = _simuPOP_ba.Simulator_swigregister
-Simulator_swigregister(Simulator)
-
-
-def describeEvolProcess(*args, **kwargs) -> "string":
-    """
-
-
-    Usage:
-
-        describeEvolProcess(initOps=[], preOps=[],
-          matingScheme=MatingScheme, postOps=[], finalOps=[], gen=-1,
-          numRep=1)
-
-    Details:
-
-        This function takes the same parameters as Simulator.evolve and
-        output a description of how an evolutionary process will be
-        executed. It is recommended that you call this function if you
-        have any doubt how your simulation will proceed.
-
-
-    """
-    return _simuPOP_ba.describeEvolProcess(*args, **kwargs)
+        _simuPOP_ba.Simulator_swiginit(self, _simuPOP_ba.new_Simulator(pops, rep, stealPops))
+    __swig_destroy__ = _simuPOP_ba.delete_Simulator
+    clone = _swig_new_instance_method(_simuPOP_ba.Simulator_clone)
+    numRep = _swig_new_instance_method(_simuPOP_ba.Simulator_numRep)
+    population = _swig_new_instance_method(_simuPOP_ba.Simulator_population)
+    add = _swig_new_instance_method(_simuPOP_ba.Simulator_add)
+    extract = _swig_new_instance_method(_simuPOP_ba.Simulator_extract)
+    populations = _swig_new_instance_method(_simuPOP_ba.Simulator_populations)
+    evolve = _swig_new_instance_method(_simuPOP_ba.Simulator_evolve)
+    apply = _swig_new_instance_method(_simuPOP_ba.Simulator_apply)
+    vars = _swig_new_instance_method(_simuPOP_ba.Simulator_vars)
+    __cmp__ = _swig_new_instance_method(_simuPOP_ba.Simulator___cmp__)
+
+# Register Simulator in _simuPOP_ba:
+_simuPOP_ba.Simulator_swigregister(Simulator)
+
+describeEvolProcess = _simuPOP_ba.describeEvolProcess
 class PyEval(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -6442,11 +3276,11 @@ class PyEval(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -6485,17 +3319,13 @@ class PyEval(BaseOperator):
         """
         _simuPOP_ba.PyEval_swiginit(self, _simuPOP_ba.new_PyEval(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyEval
+    evaluate = _swig_new_instance_method(_simuPOP_ba.PyEval_evaluate)
 
-    def evaluate(self, pop: 'Population') -> "string":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.PyEval_evaluate(self, pop)
-
-PyEval.evaluate = new_instancemethod(_simuPOP_ba.PyEval_evaluate, None, PyEval)
-PyEval_swigregister = _simuPOP_ba.PyEval_swigregister
-PyEval_swigregister(PyEval)
+# Register PyEval in _simuPOP_ba:
+_simuPOP_ba.PyEval_swigregister(PyEval)
 
 class PyExec(PyEval):
-    """
+    r"""
 
 
     Details:
@@ -6506,11 +3336,11 @@ class PyExec(PyEval):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -6536,11 +3366,12 @@ class PyExec(PyEval):
         """
         _simuPOP_ba.PyExec_swiginit(self, _simuPOP_ba.new_PyExec(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyExec
-PyExec_swigregister = _simuPOP_ba.PyExec_swigregister
-PyExec_swigregister(PyExec)
+
+# Register PyExec in _simuPOP_ba:
+_simuPOP_ba.PyExec_swigregister(PyExec)
 
 class InfoEval(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -6556,11 +3387,11 @@ class InfoEval(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -6581,18 +3412,25 @@ class InfoEval(BaseOperator):
             output. Optionally, a statement (or several statements separated
             by newline) can be executed before expr is evaluated. The
             evaluation of this statement may change the value of information
-            fields.  Parameter usePopVars is obsolete because population
-            variables are always usable in such expressions.
+            fields.  If NumPy is available and the expression and statements
+            only use information fields, numeric population variables and
+            function abs, they are evaluated only once for each (non-virtual)
+            subpopulation, with information fields exposed as arrays of
+            values. Expressions that cannot be evaluated this way (e.g. raise
+            an error for arrays) are evaluated for each individual.  Parameter
+            usePopVars is obsolete because population variables are always
+            usable in such expressions.
 
 
         """
         _simuPOP_ba.InfoEval_swiginit(self, _simuPOP_ba.new_InfoEval(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InfoEval
-InfoEval_swigregister = _simuPOP_ba.InfoEval_swigregister
-InfoEval_swigregister(InfoEval)
+
+# Register InfoEval in _simuPOP_ba:
+_simuPOP_ba.InfoEval_swigregister(InfoEval)
 
 class InfoExec(InfoEval):
-    """
+    r"""
 
 
     Details:
@@ -6606,11 +3444,11 @@ class InfoExec(InfoEval):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -6633,18 +3471,22 @@ class InfoExec(InfoEval):
             individuals to information field b or a population variable b if b
             is not an information field but a population variable, and
             a=ind.sex() will set information field a of all individuals to its
-            sex (needs exposeInd='ind'.  Parameter usePopVars is obsolete
-            because population variables will always be usable.
+            sex (needs exposeInd='ind'.  Similar to operator InfoEval,
+            statements that only assign information fields are executed once
+            for each subpopulation, with information fields exposed as NumPy
+            arrays, if possible.  Parameter usePopVars is obsolete because
+            population variables will always be usable.
 
 
         """
         _simuPOP_ba.InfoExec_swiginit(self, _simuPOP_ba.new_InfoExec(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InfoExec
-InfoExec_swigregister = _simuPOP_ba.InfoExec_swigregister
-InfoExec_swigregister(InfoExec)
+
+# Register InfoExec in _simuPOP_ba:
+_simuPOP_ba.InfoExec_swigregister(InfoExec)
 
 class Stat(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -6657,11 +3499,11 @@ class Stat(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -6670,9 +3512,9 @@ class Stat(BaseOperator):
               numOfSegSites=[], numOfMutants=[], alleleFreq=[], heteroFreq=[],
               homoFreq=[], genoFreq=[], haploFreq=[], haploHeteroFreq=[],
               haploHomoFreq=[], sumOfInfo=[], meanOfInfo=[], varOfInfo=[],
-              maxOfInfo=[], minOfInfo=[], LD=[], association=[],
-              neutrality=[], structure=[], HWE=[], inbreeding=[],
-              effectiveSize=[], vars=ALL_AVAIL, suffix="", output="", begin=0,
+              maxOfInfo=[], minOfInfo=[], LD=[], LDMatrix=[], LDWindow=0,
+              association=[], neutrality=[], structure=[], HWE=[],
+              inbreeding=[], effectiveSize=[], vars=ALL_AVAIL, suffix="", output="", begin=0,
               end=-1, step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL,
               infoFields=[])
 
@@ -6958,6 +3800,35 @@ class Stat(BaseOperator):
             *   LD_ChiSq_p_sp p value for the ChiSq statistics for each
             (virtual) subpopulation.
             *   CramerV_sp Cramer V statistics for each (virtual)
+            subpopulation.LDMatrix: Parameter LDMatrix accepts a list of loci,
+            which can be a list of indexes, names, or ALL_AVAIL, and calculates
+            linkage disequilibrium between all pairs of these loci, which
+            should be on chromosomes of the same type. All non-zero alleles at
+            a locus are combined so the results are the same as diallelic
+            measures calculated by parameter LD for diallelic loci with
+            alleles 0 and 1. Haplotypes at all loci are packed into bits so
+            that this statistic is much faster than parameter LD for a large
+            number of pairs of loci, such as loci within a window of a
+            chromosome. If a positive LDWindow is given, only pairs of loci
+            that are at most LDWindow loci apart in the list are calculated,
+            which requires time and memory proportional to the number of loci
+            instead of its square. This statistic sets the following
+            variables, each as a list of lists (which can be converted to a
+            numpy array) with element [i][j] for the i-th and j-th loci, or,
+            if LDWindow is positive, with LDWindow elements [i][k] for the
+            i-th and (i+k+1)-th loci (0 for loci beyond the end of the list):
+            *   LD_matrix (default) Absolute value of basic LD measure for
+            haplotypes in all or specified (virtual) subpopulations.
+            *   LD_prime_matrix (default) Absolute value of Lewontin's D'
+            measure for haplotypes in all or specified (virtual)
+            subpopulations.
+            *   R2_matrix (default) Correlation LD measure for haplotypes in
+            all or specified (virtual) subpopulations.
+            *   LD_matrix_sp Basic LD measure for haplotypes in each (virtual)
+            subpopulation.
+            *   LD_prime_matrix_sp Lewontin's D' measure for haplotypes in
+            each (virtual) subpopulation.
+            *   R2_matrix_sp R2 measure for haplotypes in each (virtual)
             subpopulation.association: Parameter association accepts a list of
             loci, which can be a list of indexes, names, or ALL_AVAIL. At each
             locus, one or more statistical tests will be performed to test
@@ -7172,11 +4043,12 @@ class Stat(BaseOperator):
         """
         _simuPOP_ba.Stat_swiginit(self, _simuPOP_ba.new_Stat(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_Stat
-Stat_swigregister = _simuPOP_ba.Stat_swigregister
-Stat_swigregister(Stat)
+
+# Register Stat in _simuPOP_ba:
+_simuPOP_ba.Stat_swigregister(Stat)
 
 class PyOutput(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7187,11 +4059,11 @@ class PyOutput(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7211,11 +4083,12 @@ class PyOutput(BaseOperator):
         """
         _simuPOP_ba.PyOutput_swiginit(self, _simuPOP_ba.new_PyOutput(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyOutput
-PyOutput_swigregister = _simuPOP_ba.PyOutput_swigregister
-PyOutput_swigregister(PyOutput)
+
+# Register PyOutput in _simuPOP_ba:
+_simuPOP_ba.PyOutput_swigregister(PyOutput)
 
 class Dumper(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7229,11 +4102,11 @@ class Dumper(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7262,11 +4135,12 @@ class Dumper(BaseOperator):
         """
         _simuPOP_ba.Dumper_swiginit(self, _simuPOP_ba.new_Dumper(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_Dumper
-Dumper_swigregister = _simuPOP_ba.Dumper_swigregister
-Dumper_swigregister(Dumper)
+
+# Register Dumper in _simuPOP_ba:
+_simuPOP_ba.Dumper_swigregister(Dumper)
 
 class SavePopulation(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7276,11 +4150,11 @@ class SavePopulation(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7303,11 +4177,12 @@ class SavePopulation(BaseOperator):
         """
         _simuPOP_ba.SavePopulation_swiginit(self, _simuPOP_ba.new_SavePopulation(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_SavePopulation
-SavePopulation_swigregister = _simuPOP_ba.SavePopulation_swigregister
-SavePopulation_swigregister(SavePopulation)
+
+# Register SavePopulation in _simuPOP_ba:
+_simuPOP_ba.SavePopulation_swigregister(SavePopulation)
 
 class InitSex(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7318,11 +4193,11 @@ class InitSex(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7350,11 +4225,12 @@ class InitSex(BaseOperator):
         """
         _simuPOP_ba.InitSex_swiginit(self, _simuPOP_ba.new_InitSex(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InitSex
-InitSex_swigregister = _simuPOP_ba.InitSex_swigregister
-InitSex_swigregister(InitSex)
+
+# Register InitSex in _simuPOP_ba:
+_simuPOP_ba.InitSex_swigregister(InitSex)
 
 class InitInfo(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7365,11 +4241,11 @@ class InitInfo(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7394,11 +4270,12 @@ class InitInfo(BaseOperator):
         """
         _simuPOP_ba.InitInfo_swiginit(self, _simuPOP_ba.new_InitInfo(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InitInfo
-InitInfo_swigregister = _simuPOP_ba.InitInfo_swigregister
-InitInfo_swigregister(InitInfo)
+
+# Register InitInfo in _simuPOP_ba:
+_simuPOP_ba.InitInfo_swigregister(InitInfo)
 
 class InitGenotype(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7411,11 +4288,11 @@ class InitGenotype(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7465,11 +4342,12 @@ class InitGenotype(BaseOperator):
         """
         _simuPOP_ba.InitGenotype_swiginit(self, _simuPOP_ba.new_InitGenotype(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InitGenotype
-InitGenotype_swigregister = _simuPOP_ba.InitGenotype_swigregister
-InitGenotype_swigregister(InitGenotype)
+
+# Register InitGenotype in _simuPOP_ba:
+_simuPOP_ba.InitGenotype_swigregister(InitGenotype)
 
 class InitLineage(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7481,11 +4359,11 @@ class InitLineage(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7520,11 +4398,12 @@ class InitLineage(BaseOperator):
         """
         _simuPOP_ba.InitLineage_swiginit(self, _simuPOP_ba.new_InitLineage(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InitLineage
-InitLineage_swigregister = _simuPOP_ba.InitLineage_swigregister
-InitLineage_swigregister(InitLineage)
+
+# Register InitLineage in _simuPOP_ba:
+_simuPOP_ba.InitLineage_swigregister(InitLineage)
 
 class IdTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7547,11 +4426,11 @@ class IdTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7572,30 +4451,13 @@ class IdTagger(BaseOperator):
         """
         _simuPOP_ba.IdTagger_swiginit(self, _simuPOP_ba.new_IdTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_IdTagger
+    reset = _swig_new_instance_method(_simuPOP_ba.IdTagger_reset)
 
-    def reset(self, startID: 'ULONG'=1) -> "void":
-        """
-
-
-        Usage:
-
-            x.reset(startID=1)
-
-        Details:
-
-            Reset the global individual ID number so that IdTaggers will start
-            from id (default to 1) again.
-
-
-        """
-        return _simuPOP_ba.IdTagger_reset(self, startID)
-
-IdTagger.reset = new_instancemethod(_simuPOP_ba.IdTagger_reset, None, IdTagger)
-IdTagger_swigregister = _simuPOP_ba.IdTagger_swigregister
-IdTagger_swigregister(IdTagger)
+# Register IdTagger in _simuPOP_ba:
+_simuPOP_ba.IdTagger_swigregister(IdTagger)
 
 class InheritTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7609,11 +4471,11 @@ class InheritTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7644,11 +4506,12 @@ class InheritTagger(BaseOperator):
         """
         _simuPOP_ba.InheritTagger_swiginit(self, _simuPOP_ba.new_InheritTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_InheritTagger
-InheritTagger_swigregister = _simuPOP_ba.InheritTagger_swigregister
-InheritTagger_swigregister(InheritTagger)
+
+# Register InheritTagger in _simuPOP_ba:
+_simuPOP_ba.InheritTagger_swigregister(InheritTagger)
 
 class SummaryTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7660,11 +4523,11 @@ class SummaryTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7690,11 +4553,12 @@ class SummaryTagger(BaseOperator):
         """
         _simuPOP_ba.SummaryTagger_swiginit(self, _simuPOP_ba.new_SummaryTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_SummaryTagger
-SummaryTagger_swigregister = _simuPOP_ba.SummaryTagger_swigregister
-SummaryTagger_swigregister(SummaryTagger)
+
+# Register SummaryTagger in _simuPOP_ba:
+_simuPOP_ba.SummaryTagger_swigregister(SummaryTagger)
 
 class ParentsTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7711,11 +4575,11 @@ class ParentsTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7740,11 +4604,12 @@ class ParentsTagger(BaseOperator):
         """
         _simuPOP_ba.ParentsTagger_swiginit(self, _simuPOP_ba.new_ParentsTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_ParentsTagger
-ParentsTagger_swigregister = _simuPOP_ba.ParentsTagger_swigregister
-ParentsTagger_swigregister(ParentsTagger)
+
+# Register ParentsTagger in _simuPOP_ba:
+_simuPOP_ba.ParentsTagger_swigregister(ParentsTagger)
 
 class OffspringTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7757,11 +4622,11 @@ class OffspringTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7782,11 +4647,12 @@ class OffspringTagger(BaseOperator):
         """
         _simuPOP_ba.OffspringTagger_swiginit(self, _simuPOP_ba.new_OffspringTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_OffspringTagger
-OffspringTagger_swigregister = _simuPOP_ba.OffspringTagger_swigregister
-OffspringTagger_swigregister(OffspringTagger)
+
+# Register OffspringTagger in _simuPOP_ba:
+_simuPOP_ba.OffspringTagger_swigregister(OffspringTagger)
 
 class PedigreeTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7802,11 +4668,11 @@ class PedigreeTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7853,11 +4719,12 @@ class PedigreeTagger(BaseOperator):
         """
         _simuPOP_ba.PedigreeTagger_swiginit(self, _simuPOP_ba.new_PedigreeTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PedigreeTagger
-PedigreeTagger_swigregister = _simuPOP_ba.PedigreeTagger_swigregister
-PedigreeTagger_swigregister(PedigreeTagger)
+
+# Register PedigreeTagger in _simuPOP_ba:
+_simuPOP_ba.PedigreeTagger_swigregister(PedigreeTagger)
 
 class PyTagger(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7869,11 +4736,11 @@ class PyTagger(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7901,11 +4768,12 @@ class PyTagger(BaseOperator):
         """
         _simuPOP_ba.PyTagger_swiginit(self, _simuPOP_ba.new_PyTagger(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyTagger
-PyTagger_swigregister = _simuPOP_ba.PyTagger_swigregister
-PyTagger_swigregister(PyTagger)
+
+# Register PyTagger in _simuPOP_ba:
+_simuPOP_ba.PyTagger_swigregister(PyTagger)
 
 class Migrator(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -7959,11 +4827,11 @@ class Migrator(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -7997,11 +4865,12 @@ class Migrator(BaseOperator):
         """
         _simuPOP_ba.Migrator_swiginit(self, _simuPOP_ba.new_Migrator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_Migrator
-Migrator_swigregister = _simuPOP_ba.Migrator_swigregister
-Migrator_swigregister(Migrator)
+
+# Register Migrator in _simuPOP_ba:
+_simuPOP_ba.Migrator_swigregister(Migrator)
 
 class BackwardMigrator(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8048,11 +4917,11 @@ class BackwardMigrator(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8079,11 +4948,12 @@ class BackwardMigrator(BaseOperator):
         """
         _simuPOP_ba.BackwardMigrator_swiginit(self, _simuPOP_ba.new_BackwardMigrator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_BackwardMigrator
-BackwardMigrator_swigregister = _simuPOP_ba.BackwardMigrator_swigregister
-BackwardMigrator_swigregister(BackwardMigrator)
+
+# Register BackwardMigrator in _simuPOP_ba:
+_simuPOP_ba.BackwardMigrator_swigregister(BackwardMigrator)
 
 class SplitSubPops(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8096,11 +4966,11 @@ class SplitSubPops(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8150,11 +5020,12 @@ class SplitSubPops(BaseOperator):
         """
         _simuPOP_ba.SplitSubPops_swiginit(self, _simuPOP_ba.new_SplitSubPops(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_SplitSubPops
-SplitSubPops_swigregister = _simuPOP_ba.SplitSubPops_swigregister
-SplitSubPops_swigregister(SplitSubPops)
+
+# Register SplitSubPops in _simuPOP_ba:
+_simuPOP_ba.SplitSubPops_swigregister(SplitSubPops)
 
 class MergeSubPops(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8166,11 +5037,11 @@ class MergeSubPops(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8191,11 +5062,12 @@ class MergeSubPops(BaseOperator):
         """
         _simuPOP_ba.MergeSubPops_swiginit(self, _simuPOP_ba.new_MergeSubPops(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MergeSubPops
-MergeSubPops_swigregister = _simuPOP_ba.MergeSubPops_swigregister
-MergeSubPops_swigregister(MergeSubPops)
+
+# Register MergeSubPops in _simuPOP_ba:
+_simuPOP_ba.MergeSubPops_swigregister(MergeSubPops)
 
 class ResizeSubPops(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8207,11 +5079,11 @@ class ResizeSubPops(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8237,11 +5109,12 @@ class ResizeSubPops(BaseOperator):
         """
         _simuPOP_ba.ResizeSubPops_swiginit(self, _simuPOP_ba.new_ResizeSubPops(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_ResizeSubPops
-ResizeSubPops_swigregister = _simuPOP_ba.ResizeSubPops_swigregister
-ResizeSubPops_swigregister(ResizeSubPops)
+
+# Register ResizeSubPops in _simuPOP_ba:
+_simuPOP_ba.ResizeSubPops_swigregister(ResizeSubPops)
 
 class BaseMutator(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8256,11 +5129,11 @@ class BaseMutator(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8338,11 +5211,12 @@ class BaseMutator(BaseOperator):
         """
         _simuPOP_ba.BaseMutator_swiginit(self, _simuPOP_ba.new_BaseMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_BaseMutator
-BaseMutator_swigregister = _simuPOP_ba.BaseMutator_swigregister
-BaseMutator_swigregister(BaseMutator)
+
+# Register BaseMutator in _simuPOP_ba:
+_simuPOP_ba.BaseMutator_swigregister(BaseMutator)
 
 class MatrixMutator(BaseMutator):
-    """
+    r"""
 
 
     Details:
@@ -8358,11 +5232,11 @@ class MatrixMutator(BaseMutator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8389,11 +5263,12 @@ class MatrixMutator(BaseMutator):
         """
         _simuPOP_ba.MatrixMutator_swiginit(self, _simuPOP_ba.new_MatrixMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MatrixMutator
-MatrixMutator_swigregister = _simuPOP_ba.MatrixMutator_swigregister
-MatrixMutator_swigregister(MatrixMutator)
+
+# Register MatrixMutator in _simuPOP_ba:
+_simuPOP_ba.MatrixMutator_swigregister(MatrixMutator)
 
 class KAlleleMutator(BaseMutator):
-    """
+    r"""
 
 
     Details:
@@ -8406,11 +5281,11 @@ class KAlleleMutator(BaseMutator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8436,11 +5311,12 @@ class KAlleleMutator(BaseMutator):
         """
         _simuPOP_ba.KAlleleMutator_swiginit(self, _simuPOP_ba.new_KAlleleMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_KAlleleMutator
-KAlleleMutator_swigregister = _simuPOP_ba.KAlleleMutator_swigregister
-KAlleleMutator_swigregister(KAlleleMutator)
+
+# Register KAlleleMutator in _simuPOP_ba:
+_simuPOP_ba.KAlleleMutator_swigregister(KAlleleMutator)
 
 class StepwiseMutator(BaseMutator):
-    """
+    r"""
 
 
     Details:
@@ -8457,11 +5333,11 @@ class StepwiseMutator(BaseMutator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8497,11 +5373,12 @@ class StepwiseMutator(BaseMutator):
         """
         _simuPOP_ba.StepwiseMutator_swiginit(self, _simuPOP_ba.new_StepwiseMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_StepwiseMutator
-StepwiseMutator_swigregister = _simuPOP_ba.StepwiseMutator_swigregister
-StepwiseMutator_swigregister(StepwiseMutator)
+
+# Register StepwiseMutator in _simuPOP_ba:
+_simuPOP_ba.StepwiseMutator_swigregister(StepwiseMutator)
 
 class PyMutator(BaseMutator):
-    """
+    r"""
 
 
     Details:
@@ -8512,11 +5389,11 @@ class PyMutator(BaseMutator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8549,11 +5426,12 @@ class PyMutator(BaseMutator):
         """
         _simuPOP_ba.PyMutator_swiginit(self, _simuPOP_ba.new_PyMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyMutator
-PyMutator_swigregister = _simuPOP_ba.PyMutator_swigregister
-PyMutator_swigregister(PyMutator)
+
+# Register PyMutator in _simuPOP_ba:
+_simuPOP_ba.PyMutator_swigregister(PyMutator)
 
 class MixedMutator(BaseMutator):
-    """
+    r"""
 
 
     Details:
@@ -8564,11 +5442,11 @@ class MixedMutator(BaseMutator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8595,11 +5473,12 @@ class MixedMutator(BaseMutator):
         """
         _simuPOP_ba.MixedMutator_swiginit(self, _simuPOP_ba.new_MixedMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MixedMutator
-MixedMutator_swigregister = _simuPOP_ba.MixedMutator_swigregister
-MixedMutator_swigregister(MixedMutator)
+
+# Register MixedMutator in _simuPOP_ba:
+_simuPOP_ba.MixedMutator_swigregister(MixedMutator)
 
 class ContextMutator(BaseMutator):
-    """
+    r"""
 
 
     Details:
@@ -8611,11 +5490,11 @@ class ContextMutator(BaseMutator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8651,11 +5530,12 @@ class ContextMutator(BaseMutator):
         """
         _simuPOP_ba.ContextMutator_swiginit(self, _simuPOP_ba.new_ContextMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_ContextMutator
-ContextMutator_swigregister = _simuPOP_ba.ContextMutator_swigregister
-ContextMutator_swigregister(ContextMutator)
+
+# Register ContextMutator in _simuPOP_ba:
+_simuPOP_ba.ContextMutator_swigregister(ContextMutator)
 
 class PointMutator(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8669,11 +5549,11 @@ class PointMutator(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8698,11 +5578,12 @@ class PointMutator(BaseOperator):
         """
         _simuPOP_ba.PointMutator_swiginit(self, _simuPOP_ba.new_PointMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PointMutator
-PointMutator_swigregister = _simuPOP_ba.PointMutator_swigregister
-PointMutator_swigregister(PointMutator)
+
+# Register PointMutator in _simuPOP_ba:
+_simuPOP_ba.PointMutator_swigregister(PointMutator)
 
 class RevertFixedSites(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8717,11 +5598,11 @@ class RevertFixedSites(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8741,11 +5622,12 @@ class RevertFixedSites(BaseOperator):
         """
         _simuPOP_ba.RevertFixedSites_swiginit(self, _simuPOP_ba.new_RevertFixedSites(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_RevertFixedSites
-RevertFixedSites_swigregister = _simuPOP_ba.RevertFixedSites_swigregister
-RevertFixedSites_swigregister(RevertFixedSites)
+
+# Register RevertFixedSites in _simuPOP_ba:
+_simuPOP_ba.RevertFixedSites_swigregister(RevertFixedSites)
 
 class FiniteSitesMutator(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8759,11 +5641,11 @@ class FiniteSitesMutator(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8797,11 +5679,12 @@ class FiniteSitesMutator(BaseOperator):
         """
         _simuPOP_ba.FiniteSitesMutator_swiginit(self, _simuPOP_ba.new_FiniteSitesMutator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_FiniteSitesMutator
-FiniteSitesMutator_swigregister = _simuPOP_ba.FiniteSitesMutator_swigregister
-FiniteSitesMutator_swigregister(FiniteSitesMutator)
+
+# Register FiniteSitesMutator in _simuPOP_ba:
+_simuPOP_ba.FiniteSitesMutator_swigregister(FiniteSitesMutator)
 
 class GenoTransmitter(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -8812,101 +5695,37 @@ class GenoTransmitter(BaseOperator):
         by customized Python during mating operators.
 
 
-    """
-
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
-    __repr__ = _swig_repr
-
-    def __init__(self, *args, **kwargs):
-        """
-
-
-        Usage:
-
-            GenoTransmitter(output="", begin=0, end=-1, step=1, at=[],
-              reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[])
-
-        Details:
-
-            Create a base genotype transmitter.
-
-
-        """
-        _simuPOP_ba.GenoTransmitter_swiginit(self, _simuPOP_ba.new_GenoTransmitter(*args, **kwargs))
-
-    def clearChromosome(self, ind: 'Individual', ploidy: 'int', chrom: 'size_t') -> "void":
-        """
-
-
-        Usage:
-
-            x.clearChromosome(ind, ploidy, chrom)
-
-        Details:
-
-            Clear (set alleles to zero) chromosome chrom on the ploidy-th
-            homologous set of chromosomes of individual ind. It is equivalent
-            to ind.setGenotype([0], ploidy, chrom), except that it also clears
-            allele lineage if it is executed in a module with lineage allele
-            type.
-
-
-        """
-        return _simuPOP_ba.GenoTransmitter_clearChromosome(self, ind, ploidy, chrom)
-
-
-    def copyChromosome(self, parent: 'Individual', parPloidy: 'int', offspring: 'Individual', ploidy: 'int', chrom: 'size_t') -> "void":
-        """
-
-
-        Usage:
-
-            x.copyChromosome(parent, parPloidy, offspring, ploidy, chrom)
-
-        Details:
-
-            Transmit chromosome chrom on the parPloidy set of homologous
-            chromosomes from parent to the ploidy set of homologous
-            chromosomes of offspring. It is equivalent to
-            offspring.setGenotype(parent.genotype(parPloidy, chrom), polidy,
-            chrom), except that it also copies allelic lineage when it is
-            executed in a module with lineage allele type.
-
-
-        """
-        return _simuPOP_ba.GenoTransmitter_copyChromosome(self, parent, parPloidy, offspring, ploidy, chrom)
+    """
 
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
 
-    def copyChromosomes(self, parent: 'Individual', parPloidy: 'int', offspring: 'Individual', ploidy: 'int') -> "void":
-        """
+    def __init__(self, *args, **kwargs):
+        r"""
 
 
         Usage:
 
-            x.copyChromosomes(parent, parPloidy, offspring, ploidy)
+            GenoTransmitter(output="", begin=0, end=-1, step=1, at=[],
+              reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[])
 
         Details:
 
-            Transmit the parPloidy set of homologous chromosomes from parent
-            to the ploidy set of homologous chromosomes of offspring.
-            Customized chromosomes are not copied. It is equivalent to
-            offspring.setGenotype(parent.genotype(parPloidy), ploidy), except
-            that it also copies allelic lineage when it is executed in a
-            module with lineage allele type.
+            Create a base genotype transmitter.
 
 
         """
-        return _simuPOP_ba.GenoTransmitter_copyChromosomes(self, parent, parPloidy, offspring, ploidy)
-
+        _simuPOP_ba.GenoTransmitter_swiginit(self, _simuPOP_ba.new_GenoTransmitter(*args, **kwargs))
+    clearChromosome = _swig_new_instance_method(_simuPOP_ba.GenoTransmitter_clearChromosome)
+    copyChromosome = _swig_new_instance_method(_simuPOP_ba.GenoTransmitter_copyChromosome)
+    copyChromosomes = _swig_new_instance_method(_simuPOP_ba.GenoTransmitter_copyChromosomes)
     __swig_destroy__ = _simuPOP_ba.delete_GenoTransmitter
-GenoTransmitter.clearChromosome = new_instancemethod(_simuPOP_ba.GenoTransmitter_clearChromosome, None, GenoTransmitter)
-GenoTransmitter.copyChromosome = new_instancemethod(_simuPOP_ba.GenoTransmitter_copyChromosome, None, GenoTransmitter)
-GenoTransmitter.copyChromosomes = new_instancemethod(_simuPOP_ba.GenoTransmitter_copyChromosomes, None, GenoTransmitter)
-GenoTransmitter_swigregister = _simuPOP_ba.GenoTransmitter_swigregister
-GenoTransmitter_swigregister(GenoTransmitter)
+
+# Register GenoTransmitter in _simuPOP_ba:
+_simuPOP_ba.GenoTransmitter_swigregister(GenoTransmitter)
 
 class CloneGenoTransmitter(GenoTransmitter):
-    """
+    r"""
 
 
     Details:
@@ -8921,11 +5740,11 @@ class CloneGenoTransmitter(GenoTransmitter):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8954,11 +5773,12 @@ class CloneGenoTransmitter(GenoTransmitter):
         """
         _simuPOP_ba.CloneGenoTransmitter_swiginit(self, _simuPOP_ba.new_CloneGenoTransmitter(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_CloneGenoTransmitter
-CloneGenoTransmitter_swigregister = _simuPOP_ba.CloneGenoTransmitter_swigregister
-CloneGenoTransmitter_swigregister(CloneGenoTransmitter)
+
+# Register CloneGenoTransmitter in _simuPOP_ba:
+_simuPOP_ba.CloneGenoTransmitter_swigregister(CloneGenoTransmitter)
 
 class MendelianGenoTransmitter(GenoTransmitter):
-    """
+    r"""
 
 
     Details:
@@ -8972,11 +5792,11 @@ class MendelianGenoTransmitter(GenoTransmitter):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -8996,33 +5816,14 @@ class MendelianGenoTransmitter(GenoTransmitter):
 
         """
         _simuPOP_ba.MendelianGenoTransmitter_swiginit(self, _simuPOP_ba.new_MendelianGenoTransmitter(*args, **kwargs))
-
-    def transmitGenotype(self, parent: 'Individual', offspring: 'Individual', ploidy: 'int') -> "void":
-        """
-
-
-        Usage:
-
-            x.transmitGenotype(parent, offspring, ploidy)
-
-        Details:
-
-            Transmit genotype from parent to offspring, and fill the ploidy
-            homologous set of chromosomes. This function does not set
-            genotypes of customized chromosomes and handles sex chromosomes
-            properly, according to offspring sex and ploidy.
-
-
-        """
-        return _simuPOP_ba.MendelianGenoTransmitter_transmitGenotype(self, parent, offspring, ploidy)
-
+    transmitGenotype = _swig_new_instance_method(_simuPOP_ba.MendelianGenoTransmitter_transmitGenotype)
     __swig_destroy__ = _simuPOP_ba.delete_MendelianGenoTransmitter
-MendelianGenoTransmitter.transmitGenotype = new_instancemethod(_simuPOP_ba.MendelianGenoTransmitter_transmitGenotype, None, MendelianGenoTransmitter)
-MendelianGenoTransmitter_swigregister = _simuPOP_ba.MendelianGenoTransmitter_swigregister
-MendelianGenoTransmitter_swigregister(MendelianGenoTransmitter)
+
+# Register MendelianGenoTransmitter in _simuPOP_ba:
+_simuPOP_ba.MendelianGenoTransmitter_swigregister(MendelianGenoTransmitter)
 
 class SelfingGenoTransmitter(MendelianGenoTransmitter):
-    """
+    r"""
 
 
     Details:
@@ -9036,11 +5837,11 @@ class SelfingGenoTransmitter(MendelianGenoTransmitter):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9060,11 +5861,12 @@ class SelfingGenoTransmitter(MendelianGenoTransmitter):
         """
         _simuPOP_ba.SelfingGenoTransmitter_swiginit(self, _simuPOP_ba.new_SelfingGenoTransmitter(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_SelfingGenoTransmitter
-SelfingGenoTransmitter_swigregister = _simuPOP_ba.SelfingGenoTransmitter_swigregister
-SelfingGenoTransmitter_swigregister(SelfingGenoTransmitter)
+
+# Register SelfingGenoTransmitter in _simuPOP_ba:
+_simuPOP_ba.SelfingGenoTransmitter_swigregister(SelfingGenoTransmitter)
 
 class HaplodiploidGenoTransmitter(MendelianGenoTransmitter):
-    """
+    r"""
 
 
     Details:
@@ -9080,11 +5882,11 @@ class HaplodiploidGenoTransmitter(MendelianGenoTransmitter):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9104,11 +5906,12 @@ class HaplodiploidGenoTransmitter(MendelianGenoTransmitter):
         """
         _simuPOP_ba.HaplodiploidGenoTransmitter_swiginit(self, _simuPOP_ba.new_HaplodiploidGenoTransmitter(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_HaplodiploidGenoTransmitter
-HaplodiploidGenoTransmitter_swigregister = _simuPOP_ba.HaplodiploidGenoTransmitter_swigregister
-HaplodiploidGenoTransmitter_swigregister(HaplodiploidGenoTransmitter)
+
+# Register HaplodiploidGenoTransmitter in _simuPOP_ba:
+_simuPOP_ba.HaplodiploidGenoTransmitter_swigregister(HaplodiploidGenoTransmitter)
 
 class MitochondrialGenoTransmitter(GenoTransmitter):
-    """
+    r"""
 
 
     Details:
@@ -9129,11 +5932,11 @@ class MitochondrialGenoTransmitter(GenoTransmitter):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9157,11 +5960,12 @@ class MitochondrialGenoTransmitter(GenoTransmitter):
         """
         _simuPOP_ba.MitochondrialGenoTransmitter_swiginit(self, _simuPOP_ba.new_MitochondrialGenoTransmitter(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MitochondrialGenoTransmitter
-MitochondrialGenoTransmitter_swigregister = _simuPOP_ba.MitochondrialGenoTransmitter_swigregister
-MitochondrialGenoTransmitter_swigregister(MitochondrialGenoTransmitter)
+
+# Register MitochondrialGenoTransmitter in _simuPOP_ba:
+_simuPOP_ba.MitochondrialGenoTransmitter_swigregister(MitochondrialGenoTransmitter)
 
 class Recombinator(GenoTransmitter):
-    """
+    r"""
 
 
     Details:
@@ -9197,11 +6001,11 @@ class Recombinator(GenoTransmitter):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9282,7 +6086,10 @@ class Recombinator(GenoTransmitter):
             chromosomes. Such a record will be generated for each set of
             homologous chromosomes so an diploid offspring will have two lines
             of output. Note that individual IDs need to be set (using a
-            IdTagger operator) before this Recombinator is applied.  In
+            IdTagger operator) before this Recombinator is applied. The
+            output can be sent to a TreeSeqRecorder (module simuPOP.utils) to
+            record the genealogy of chromosome segments. Offspring are not
+            generated in parallel if recombination events are recorded.  In
             addition to genotypes, this operator also copies alleleic lineage
             if it is executed in a module with lineage allele type.
 
@@ -9298,32 +6105,13 @@ class Recombinator(GenoTransmitter):
         """
         _simuPOP_ba.Recombinator_swiginit(self, _simuPOP_ba.new_Recombinator(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_Recombinator
+    transmitGenotype = _swig_new_instance_method(_simuPOP_ba.Recombinator_transmitGenotype)
 
-    def transmitGenotype(self, parent: 'Individual', offspring: 'Individual', ploidy: 'int') -> "void":
-        """
-
-
-        Usage:
-
-            x.transmitGenotype(parent, offspring, ploidy)
-
-        Details:
-
-            This function transmits genotypes from a parent to the ploidy-th
-            homologous set of chromosomes of an offspring. It can be used, for
-            example, by a customized genotype transmitter to use sex-specific
-            recombination rates to transmit parental genotypes to offspring.
-
-
-        """
-        return _simuPOP_ba.Recombinator_transmitGenotype(self, parent, offspring, ploidy)
-
-Recombinator.transmitGenotype = new_instancemethod(_simuPOP_ba.Recombinator_transmitGenotype, None, Recombinator)
-Recombinator_swigregister = _simuPOP_ba.Recombinator_swigregister
-Recombinator_swigregister(Recombinator)
+# Register Recombinator in _simuPOP_ba:
+_simuPOP_ba.Recombinator_swigregister(Recombinator)
 
 class BaseSelector(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -9397,11 +6185,11 @@ class BaseSelector(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9418,11 +6206,12 @@ class BaseSelector(BaseOperator):
         """
         _simuPOP_ba.BaseSelector_swiginit(self, _simuPOP_ba.new_BaseSelector(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_BaseSelector
-BaseSelector_swigregister = _simuPOP_ba.BaseSelector_swigregister
-BaseSelector_swigregister(BaseSelector)
+
+# Register BaseSelector in _simuPOP_ba:
+_simuPOP_ba.BaseSelector_swigregister(BaseSelector)
 
 class MapSelector(BaseSelector):
-    """
+    r"""
 
 
     Details:
@@ -9434,11 +6223,11 @@ class MapSelector(BaseSelector):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9470,11 +6259,12 @@ class MapSelector(BaseSelector):
         """
         _simuPOP_ba.MapSelector_swiginit(self, _simuPOP_ba.new_MapSelector(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MapSelector
-MapSelector_swigregister = _simuPOP_ba.MapSelector_swigregister
-MapSelector_swigregister(MapSelector)
+
+# Register MapSelector in _simuPOP_ba:
+_simuPOP_ba.MapSelector_swigregister(MapSelector)
 
 class MaSelector(BaseSelector):
-    """
+    r"""
 
 
     Details:
@@ -9490,11 +6280,11 @@ class MaSelector(BaseSelector):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9527,11 +6317,12 @@ class MaSelector(BaseSelector):
         """
         _simuPOP_ba.MaSelector_swiginit(self, _simuPOP_ba.new_MaSelector(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MaSelector
-MaSelector_swigregister = _simuPOP_ba.MaSelector_swigregister
-MaSelector_swigregister(MaSelector)
+
+# Register MaSelector in _simuPOP_ba:
+_simuPOP_ba.MaSelector_swigregister(MaSelector)
 
 class MlSelector(BaseSelector):
-    """
+    r"""
 
 
     Details:
@@ -9545,11 +6336,11 @@ class MlSelector(BaseSelector):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9579,11 +6370,12 @@ class MlSelector(BaseSelector):
         """
         _simuPOP_ba.MlSelector_swiginit(self, _simuPOP_ba.new_MlSelector(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MlSelector
-MlSelector_swigregister = _simuPOP_ba.MlSelector_swigregister
-MlSelector_swigregister(MlSelector)
+
+# Register MlSelector in _simuPOP_ba:
+_simuPOP_ba.MlSelector_swigregister(MlSelector)
 
 class PySelector(BaseSelector):
-    """
+    r"""
 
 
     Details:
@@ -9610,35 +6402,51 @@ class PySelector(BaseSelector):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
 
             PySelector(func, loci=[], begin=0, end=-1, step=1, at=[],
               reps=ALL_AVAIL, output="", subPops=ALL_AVAIL,
-              infoFields=ALL_AVAIL)
+              infoFields=ALL_AVAIL, cacheSize=0, batchSize=0)
 
         Details:
 
             Create a Python hybrid selector that passes genotype at specified
             loci, values at specified information fields (if requested) and a
             generation number to a user-defined function func. The return
-            value will be treated as individual fitness.
+            value will be treated as individual fitness.  If func accepts only
+            parameters geno and gen, a positive cacheSize allows this operator
+            to cache fitness values of up to cacheSize genotypes (and
+            generations) so that func is called only once for each distinct
+            genotype. Least recently used values are removed when the cache is
+            full. This should only be used if func returns the same value for
+            the same genotype (and generation).  If a positive batchSize is
+            specified, func is called in batch mode for blocks of up to
+            batchSize individuals. It then receives genotypes as a 2-d NumPy
+            array with one row per individual (geno), values at information
+            fields as NumPy arrays, and should return an array of fitness
+            values, one for each individual. Individuals with different numbers
+            of alleles at loci, such as males and females at loci on sex
+            chromosomes, are passed in separate calls. Parameters ind and mut
+            are not allowed in this mode.
 
 
         """
         _simuPOP_ba.PySelector_swiginit(self, _simuPOP_ba.new_PySelector(*args, **kwargs))
+    cacheStats = _swig_new_instance_method(_simuPOP_ba.PySelector_cacheStats)
     __swig_destroy__ = _simuPOP_ba.delete_PySelector
-PySelector_swigregister = _simuPOP_ba.PySelector_swigregister
-PySelector_swigregister(PySelector)
+
+# Register PySelector in _simuPOP_ba:
+_simuPOP_ba.PySelector_swigregister(PySelector)
 
 class PyMlSelector(BaseSelector):
-    """
+    r"""
 
 
     Details:
@@ -9653,11 +6461,11 @@ class PyMlSelector(BaseSelector):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9697,11 +6505,12 @@ class PyMlSelector(BaseSelector):
         """
         _simuPOP_ba.PyMlSelector_swiginit(self, _simuPOP_ba.new_PyMlSelector(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyMlSelector
-PyMlSelector_swigregister = _simuPOP_ba.PyMlSelector_swigregister
-PyMlSelector_swigregister(PyMlSelector)
+
+# Register PyMlSelector in _simuPOP_ba:
+_simuPOP_ba.PyMlSelector_swigregister(PyMlSelector)
 
 class BaseQuanTrait(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -9724,11 +6533,11 @@ class BaseQuanTrait(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9750,11 +6559,12 @@ class BaseQuanTrait(BaseOperator):
         """
         _simuPOP_ba.BaseQuanTrait_swiginit(self, _simuPOP_ba.new_BaseQuanTrait(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_BaseQuanTrait
-BaseQuanTrait_swigregister = _simuPOP_ba.BaseQuanTrait_swigregister
-BaseQuanTrait_swigregister(BaseQuanTrait)
+
+# Register BaseQuanTrait in _simuPOP_ba:
+_simuPOP_ba.BaseQuanTrait_swigregister(BaseQuanTrait)
 
 class PyQuanTrait(BaseQuanTrait):
-    """
+    r"""
 
 
     Details:
@@ -9777,17 +6587,18 @@ class PyQuanTrait(BaseQuanTrait):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
 
             PyQuanTrait(func, loci=[], ancGens=UNSPECIFIED, begin=0, end=-1,
-              step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[])
+              step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[],
+              cacheSize=0, batchSize=0)
 
         Details:
 
@@ -9799,17 +6610,33 @@ class PyQuanTrait(BaseQuanTrait):
             be assigned to specified trait fields (infoField). If only one
             trait field is specified, a number or a sequence of one element is
             acceptable. Otherwise, a sequence of values will be accepted and
-            be assigned to each trait field.
+            be assigned to each trait field.  If func accepts only parameters
+            geno and gen, a positive cacheSize allows this operator to cache
+            trait values of up to cacheSize genotypes (and generations) so
+            that func is called only once for each distinct genotype. Least
+            recently used values are removed when the cache is full. This
+            should not be used if func returns random trait values.  If a
+            positive batchSize is specified, func is called in batch mode for
+            blocks of up to batchSize individuals. It then receives genotypes
+            as a 2-d NumPy array with one row per individual (geno), values at
+            information fields as NumPy arrays, and should return an array
+            with one row of trait values for each individual (or a 1-d array
+            if there is only one trait field). Individuals with different
+            numbers of alleles at loci, such as males and females at loci on
+            sex chromosomes, are passed in separate calls. Parameters ind and
+            mut are not allowed in this mode.
 
 
         """
         _simuPOP_ba.PyQuanTrait_swiginit(self, _simuPOP_ba.new_PyQuanTrait(*args, **kwargs))
+    cacheStats = _swig_new_instance_method(_simuPOP_ba.PyQuanTrait_cacheStats)
     __swig_destroy__ = _simuPOP_ba.delete_PyQuanTrait
-PyQuanTrait_swigregister = _simuPOP_ba.PyQuanTrait_swigregister
-PyQuanTrait_swigregister(PyQuanTrait)
+
+# Register PyQuanTrait in _simuPOP_ba:
+_simuPOP_ba.PyQuanTrait_swigregister(PyQuanTrait)
 
 class BasePenetrance(BaseOperator):
-    """
+    r"""
 
 
     Details:
@@ -9842,11 +6669,11 @@ class BasePenetrance(BaseOperator):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9869,32 +6696,13 @@ class BasePenetrance(BaseOperator):
         """
         _simuPOP_ba.BasePenetrance_swiginit(self, _simuPOP_ba.new_BasePenetrance(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_BasePenetrance
+    applyToIndividual = _swig_new_instance_method(_simuPOP_ba.BasePenetrance_applyToIndividual)
 
-    def applyToIndividual(self, ind: 'Individual', pop: 'Population'=None) -> "bool":
-        """
-
-
-        Usage:
-
-            x.applyToIndividual(ind, pop=None)
-
-        Details:
-
-            Apply the penetrance operator to a single individual ind and set
-            his or her affection status. A population reference can be passed
-            if the penetrance model depends on population properties such as
-            generation number. This function returns the affection status.
-
-
-        """
-        return _simuPOP_ba.BasePenetrance_applyToIndividual(self, ind, pop)
-
-BasePenetrance.applyToIndividual = new_instancemethod(_simuPOP_ba.BasePenetrance_applyToIndividual, None, BasePenetrance)
-BasePenetrance_swigregister = _simuPOP_ba.BasePenetrance_swigregister
-BasePenetrance_swigregister(BasePenetrance)
+# Register BasePenetrance in _simuPOP_ba:
+_simuPOP_ba.BasePenetrance_swigregister(BasePenetrance)
 
 class MapPenetrance(BasePenetrance):
-    """
+    r"""
 
 
     Details:
@@ -9905,11 +6713,11 @@ class MapPenetrance(BasePenetrance):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9939,11 +6747,12 @@ class MapPenetrance(BasePenetrance):
         """
         _simuPOP_ba.MapPenetrance_swiginit(self, _simuPOP_ba.new_MapPenetrance(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MapPenetrance
-MapPenetrance_swigregister = _simuPOP_ba.MapPenetrance_swigregister
-MapPenetrance_swigregister(MapPenetrance)
+
+# Register MapPenetrance in _simuPOP_ba:
+_simuPOP_ba.MapPenetrance_swigregister(MapPenetrance)
 
 class MaPenetrance(BasePenetrance):
-    """
+    r"""
 
 
     Details:
@@ -9959,11 +6768,11 @@ class MaPenetrance(BasePenetrance):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -9997,11 +6806,12 @@ class MaPenetrance(BasePenetrance):
         """
         _simuPOP_ba.MaPenetrance_swiginit(self, _simuPOP_ba.new_MaPenetrance(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MaPenetrance
-MaPenetrance_swigregister = _simuPOP_ba.MaPenetrance_swigregister
-MaPenetrance_swigregister(MaPenetrance)
+
+# Register MaPenetrance in _simuPOP_ba:
+_simuPOP_ba.MaPenetrance_swigregister(MaPenetrance)
 
 class MlPenetrance(BasePenetrance):
-    """
+    r"""
 
 
     Details:
@@ -10018,11 +6828,11 @@ class MlPenetrance(BasePenetrance):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -10053,11 +6863,12 @@ class MlPenetrance(BasePenetrance):
         """
         _simuPOP_ba.MlPenetrance_swiginit(self, _simuPOP_ba.new_MlPenetrance(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_MlPenetrance
-MlPenetrance_swigregister = _simuPOP_ba.MlPenetrance_swigregister
-MlPenetrance_swigregister(MlPenetrance)
+
+# Register MlPenetrance in _simuPOP_ba:
+_simuPOP_ba.MlPenetrance_swigregister(MlPenetrance)
 
 class PyPenetrance(BasePenetrance):
-    """
+    r"""
 
 
     Details:
@@ -10082,18 +6893,18 @@ class PyPenetrance(BasePenetrance):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
 
             PyPenetrance(func, loci=[], ancGens=UNSPECIFIED, begin=0,
               end=-1, step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL,
-              infoFields=[])
+              infoFields=[], cacheSize=0, batchSize=0)
 
         Details:
 
@@ -10104,17 +6915,31 @@ class PyPenetrance(BasePenetrance):
             chromosome position pairs, ALL_AVAIL, or a function with optional
             parameter pop that will be called at each ganeeration to determine
             indexes of loci. The return value will be treated as Individual
-            penetrance.
+            penetrance.  If func accepts only parameters geno and gen, a
+            positive cacheSize allows this operator to cache penetrance values
+            of up to cacheSize genotypes (and generations) so that func is
+            called only once for each distinct genotype. Least recently used
+            values are removed when the cache is full.  If a positive
+            batchSize is specified, func is called in batch mode for blocks
+            of up to batchSize individuals. It then receives genotypes as a
+            2-d NumPy array with one row per individual (geno), values at
+            information fields as NumPy arrays, and should return an array of
+            penetrance values, one for each individual. Individuals with
+            different numbers of alleles at loci, such as males and females at
+            loci on sex chromosomes, are passed in separate calls. Parameters
+            ind and mut are not allowed in this mode.
 
 
         """
         _simuPOP_ba.PyPenetrance_swiginit(self, _simuPOP_ba.new_PyPenetrance(*args, **kwargs))
+    cacheStats = _swig_new_instance_method(_simuPOP_ba.PyPenetrance_cacheStats)
     __swig_destroy__ = _simuPOP_ba.delete_PyPenetrance
-PyPenetrance_swigregister = _simuPOP_ba.PyPenetrance_swigregister
-PyPenetrance_swigregister(PyPenetrance)
+
+# Register PyPenetrance in _simuPOP_ba:
+_simuPOP_ba.PyPenetrance_swigregister(PyPenetrance)
 
 class PyMlPenetrance(BasePenetrance):
-    """
+    r"""
 
 
     Details:
@@ -10129,11 +6954,11 @@ class PyMlPenetrance(BasePenetrance):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -10170,11 +6995,12 @@ class PyMlPenetrance(BasePenetrance):
         """
         _simuPOP_ba.PyMlPenetrance_swiginit(self, _simuPOP_ba.new_PyMlPenetrance(*args, **kwargs))
     __swig_destroy__ = _simuPOP_ba.delete_PyMlPenetrance
-PyMlPenetrance_swigregister = _simuPOP_ba.PyMlPenetrance_swigregister
-PyMlPenetrance_swigregister(PyMlPenetrance)
+
+# Register PyMlPenetrance in _simuPOP_ba:
+_simuPOP_ba.PyMlPenetrance_swigregister(PyMlPenetrance)
 
 class Pedigree(Population):
-    """
+    r"""
 
 
     Details:
@@ -10195,11 +7021,11 @@ class Pedigree(Population):
 
     """
 
-    thisown = _swig_property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc='The membership flag')
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def __init__(self, *args, **kwargs):
-        """
+        r"""
 
 
         Usage:
@@ -10235,397 +7061,32 @@ class Pedigree(Population):
 
         """
         _simuPOP_ba.Pedigree_swiginit(self, _simuPOP_ba.new_Pedigree(*args, **kwargs))
-
-    def clone(self) -> "simuPOP::Pedigree *":
-        """
-
-
-        Usage:
-
-            x.clone()
-
-        Details:
-
-            Create a cloned copy of a Pedigree.
-
-
-        """
-        return _simuPOP_ba.Pedigree_clone(self)
-
-
-    def save(self, *args, **kwargs) -> "void":
-        """
-
-
-        Usage:
-
-            x.save(filename, infoFields=[], loci=[])
-
-        Details:
-
-            Save a pedigree to file filename. This function goes through all
-            individuals of a pedigree and outputs in each line the ID of
-            individual, IDs of his or her parents, sex ('M' or 'F'), affection
-            status ('A' or 'U'), values of specified information fields
-            infoFields and genotypes at specified loci (parameter loci, which
-            can be a list of loci indexes, names, or ALL_AVAIL). Allele
-            numbers, instead of their names are outputed. Two columns are used
-            for each locus if the population is diploid. This file can be
-            loaded using function loadPedigree although additional information
-            such as names of information fields need to be specified. This
-            format differs from a .ped file used in some genetic analysis
-            software in that there is no family ID and IDs of all individuals
-            have to be unique. Note that parental IDs will be set to zero if
-            the parent is not in the pedigree object. Therefore, the parents
-            of individuals in the top-most ancestral generation will always be
-            zero.
-
-
-        """
-        return _simuPOP_ba.Pedigree_save(self, *args, **kwargs)
-
-
-    def indByID(self, id: 'double') -> "simuPOP::Individual &":
-        """
-
-
-        Usage:
-
-            x.indByID(id)
-
-        Details:
-
-            Return a reference to individual with id. An IndexError will be
-            raised if no individual with id is found. An float id is
-            acceptable as long as it rounds closely to an integer.
-
-
-        """
-        return _simuPOP_ba.Pedigree_indByID(self, id)
-
-
-    def numParents(self) -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_numParents(self)
-
-
-    def locateRelatives(self, *args, **kwargs) -> "void":
-        """
-
-
-        Usage:
-
-            x.locateRelatives(relType, resultFields=[], sex=ANY_SEX,
-              affectionStatus=ANY_AFFECTION_STATUS, ancGens=ALL_AVAIL)
-
-        Details:
-
-            This function locates relatives (of type relType) of each
-            individual and store their IDs in information fields relFields.
-            The length of relFields determines how many relatives an
-            individual can have.  Parameter relType specifies what type of
-            relative to locate, which can be
-            *   SPOUSE locate spouses with whom an individual has at least one
-            common offspring.
-            *   OUTBRED_SPOUSE locate non-slibling spouses, namely spouses
-            with no shared parent.
-            *   OFFSPRING all offspring of each individual.
-            *   COMMON_OFFSPRING common offspring between each individual and
-            its spouse (located by SPOUSE or OUTBRED_SPOUSE). relFields should
-            consist of an information field for spouse and m-1 fields for
-            offspring where m is the number of fields.
-            *   FULLSIBLING siblings with common father and mother,
-            *   SIBLING siblings with at least one common parent. Optionally,
-            you can specify the sex and affection status of relatives you
-            would like to locate, using parameters sex and affectionStatus.
-            sex can be ANY_SEX (default), MALE_ONLY, FEMALE_ONLY, SAME_SEX or
-            OPPOSITE_SEX, and affectionStatus can be AFFECTED, UNAFFECTED or
-            ANY_AFFECTION_STATUS (default). Only relatives with specified
-            properties will be located.  This function will by default go
-            through all ancestral generations and locate relatives for all
-            individuals. This can be changed by setting parameter ancGens to
-            certain ancestral generations you would like to process.
-
-
-        """
-        return _simuPOP_ba.Pedigree_locateRelatives(self, *args, **kwargs)
-
-
-    def traceRelatives(self, *args, **kwargs) -> "bool":
-        """
-
-
-        Usage:
-
-            x.traceRelatives(fieldPath, sex=[], affectionStatus=[],
-              resultFields=[], ancGens=ALL_AVAIL)
-
-        Details:
-
-            Trace a relative path in a population and record the result in the
-            given information fields resultFields. This function is used to
-            locate more distant relatives based on the relatives located by
-            function locateRelatives. For example, after siblings and
-            offspring of all individuals are located, you can locate mother's
-            sibling's offspring using a relative path, and save their indexes
-            in each individuals information fields resultFields.  A relative
-            path consits of a fieldPath that specifies which information
-            fields to look for at each step, a sex specifies sex choices at
-            each generation, and a affectionStatus that specifies affection
-            status at each generation. fieldPath should be a list of
-            information fields, sex and affectionStatus are optional. If
-            specified, they should be a list of ANY_SEX, MALE_ONLY,
-            FEMALE_ONLY, SAME_SEX and OppsiteSex for parameter sex, and a list
-            of UNAFFECTED, AFFECTED and ANY_AFFECTION_STATUS for parameter
-            affectionStatus.  For example, if fieldPath = [['father_id',
-            'mother_id'], ['sib1', 'sib2'], ['off1', 'off2']], and sex =
-            [ANY_SEX, MALE_ONLY, FEMALE_ONLY], this function will locate
-            father_id and mother_id for each individual, find all individuals
-            referred by father_id and mother_id, find informaton fields sib1
-            and sib2 from these parents and locate male individuals referred
-            by these two information fields. Finally, the information fields
-            off1 and off2 from these siblings are located and are used to
-            locate their female offspring. The results are father or mother's
-            brother's daughters. Their indexes will be saved in each
-            individuals information fields resultFields. If a list of
-            ancestral generations is given in parameter ancGens is given, only
-            individuals in these ancestral generations will be processed.
-
-
-        """
-        return _simuPOP_ba.Pedigree_traceRelatives(self, *args, **kwargs)
-
-
-    def individualsWithRelatives(self, *args, **kwargs) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.individualsWithRelatives(infoFields, sex=[],
-              affectionStatus=[], subPops=ALL_AVAIL, ancGens=ALL_AVAIL)
-
-        Details:
-
-            Return a list of IDs of individuals who have non-negative values
-            at information fields infoFields. Additional requirements could be
-            specified by parameters sex and affectionStatus. sex can be
-            ANY_SEX (default), MALE_ONLY, FEMALE_ONLY, SAME_SEX or
-            OPPOSITE_SEX, and affectionStatus can be AFFECTED, UNAFFECTED or
-            ANY_AFFECTION_STATUS (default). This function by default check all
-            individuals in all ancestral generations, but you could limit the
-            search using parameter subPops (a list of (virtual)
-            subpopulations) and ancestral generations ancGens. Relatives fall
-            out of specified subpopulations and ancestral generaions will be
-            considered invalid.
-
-
-        """
-        return _simuPOP_ba.Pedigree_individualsWithRelatives(self, *args, **kwargs)
-
-
-    def identifyFamilies(self, *args, **kwargs) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.identifyFamilies(pedField="", subPops=ALL_AVAIL,
-              ancGens=ALL_AVAIL)
-
-        Details:
-
-            This function goes through all individuals in a pedigree and group
-            related individuals into families. If an information field
-            pedField is given, indexes of families will be assigned to this
-            field of each family member. The return value is a list of family
-            sizes corresponding to families 0, 1, 2, ... etc. If a list of
-            (virtual) subpopulations (parameter subPops) or ancestral
-            generations are specified (parameter ancGens), the search will be
-            limited to individuals in these subpopulations and generations.
-
-
-        """
-        return _simuPOP_ba.Pedigree_identifyFamilies(self, *args, **kwargs)
-
-
-    def identifyAncestors(self, *args, **kwargs) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.identifyAncestors(IDs=ALL_AVAIL, subPops=ALL_AVAIL,
-              ancGens=ALL_AVAIL)
-
-        Details:
-
-            If a list of individuals (IDs) is given, this function traces
-            backward in time and find all ancestors of these individuals. If
-            IDs is ALL_AVAIL, ancestors of all individuals in the present
-            generation will be located. If a list of (virtual) subpopulations
-            (subPops) or ancestral geneartions (ancGens) is given, the search
-            will be limited to individuals in these subpopulations and
-            generations. This could be used to, for example, find all fathers
-            of IDs. This function returns a list of IDs, which includes valid
-            specified IDs. Invalid IDs will be silently ignored. Note that
-            parameters subPops and ancGens will limit starting IDs if IDs is
-            set to ALL_AVAIL, but specified IDs will not be trimmed according
-            to these parameters.
-
-
-        """
-        return _simuPOP_ba.Pedigree_identifyAncestors(self, *args, **kwargs)
-
-
-    def identifyOffspring(self, *args, **kwargs) -> "vectoru":
-        """
-
-
-        Usage:
-
-            x.identifyOffspring(IDs=[], subPops=ALL_AVAIL,
-              ancGens=ALL_AVAIL)
-
-        Details:
-
-            This function traces forward in time and find all offspring of
-            individuals specified in parameter IDs. If a list of (virtual)
-            subpopulations (subPops) or ancestral geneartions (ancGens) is
-            given, the search will be limited to individuals in these
-            subpopulations and generations. This could be used to, for
-            example, find all male offspring of IDs. This function returns a
-            list of IDs, which includes valid starting IDs. Invalid IDs are
-            silently ignored. Note that parameters subPops and ancGens will
-            limit search result but will not be used to trim specified IDs.
-
-
-        """
-        return _simuPOP_ba.Pedigree_identifyOffspring(self, *args, **kwargs)
-
-
-    def removeIndividuals(self, *args, **kwargs) -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_removeIndividuals(self, *args, **kwargs)
-
-
-    def removeSubPops(self, subPops: 'subPopList') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_removeSubPops(self, subPops)
-
-
-    def push(self, pop: 'Population') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_push(self, pop)
-
-
-    def addChrom(self, *args, **kwargs) -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_addChrom(self, *args, **kwargs)
-
-
-    def addChromFrom(self, pop: 'Population') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_addChromFrom(self, pop)
-
-
-    def addIndFrom(self, pop: 'Population') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_addIndFrom(self, pop)
-
-
-    def mergeSubPops(self, *args, **kwargs) -> "size_t":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_mergeSubPops(self, *args, **kwargs)
-
-
-    def resize(self, sizes: 'uintList', propagate: 'bool'=False) -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_resize(self, sizes, propagate)
-
-
-    def setSubPopByIndInfo(self, field: 'string const &') -> "void":
-        """Obsolete or undocumented function."""
-        return _simuPOP_ba.Pedigree_setSubPopByIndInfo(self, field)
-
+    clone = _swig_new_instance_method(_simuPOP_ba.Pedigree_clone)
+    save = _swig_new_instance_method(_simuPOP_ba.Pedigree_save)
+    indByID = _swig_new_instance_method(_simuPOP_ba.Pedigree_indByID)
+    numParents = _swig_new_instance_method(_simuPOP_ba.Pedigree_numParents)
+    locateRelatives = _swig_new_instance_method(_simuPOP_ba.Pedigree_locateRelatives)
+    traceRelatives = _swig_new_instance_method(_simuPOP_ba.Pedigree_traceRelatives)
+    individualsWithRelatives = _swig_new_instance_method(_simuPOP_ba.Pedigree_individualsWithRelatives)
+    identifyFamilies = _swig_new_instance_method(_simuPOP_ba.Pedigree_identifyFamilies)
+    identifyAncestors = _swig_new_instance_method(_simuPOP_ba.Pedigree_identifyAncestors)
+    identifyOffspring = _swig_new_instance_method(_simuPOP_ba.Pedigree_identifyOffspring)
+    drawFamilies = _swig_new_instance_method(_simuPOP_ba.Pedigree_drawFamilies)
+    removeIndividuals = _swig_new_instance_method(_simuPOP_ba.Pedigree_removeIndividuals)
+    removeSubPops = _swig_new_instance_method(_simuPOP_ba.Pedigree_removeSubPops)
+    push = _swig_new_instance_method(_simuPOP_ba.Pedigree_push)
+    addChrom = _swig_new_instance_method(_simuPOP_ba.Pedigree_addChrom)
+    addChromFrom = _swig_new_instance_method(_simuPOP_ba.Pedigree_addChromFrom)
+    addIndFrom = _swig_new_instance_method(_simuPOP_ba.Pedigree_addIndFrom)
+    mergeSubPops = _swig_new_instance_method(_simuPOP_ba.Pedigree_mergeSubPops)
+    resize = _swig_new_instance_method(_simuPOP_ba.Pedigree_resize)
+    setSubPopByIndInfo = _swig_new_instance_method(_simuPOP_ba.Pedigree_setSubPopByIndInfo)
     __swig_destroy__ = _simuPOP_ba.delete_Pedigree
-Pedigree.clone = new_instancemethod(_simuPOP_ba.Pedigree_clone, None, Pedigree)
-Pedigree.save = new_instancemethod(_simuPOP_ba.Pedigree_save, None, Pedigree)
-Pedigree.indByID = new_instancemethod(_simuPOP_ba.Pedigree_indByID, None, Pedigree)
-Pedigree.numParents = new_instancemethod(_simuPOP_ba.Pedigree_numParents, None, Pedigree)
-Pedigree.locateRelatives = new_instancemethod(_simuPOP_ba.Pedigree_locateRelatives, None, Pedigree)
-Pedigree.traceRelatives = new_instancemethod(_simuPOP_ba.Pedigree_traceRelatives, None, Pedigree)
-Pedigree.individualsWithRelatives = new_instancemethod(_simuPOP_ba.Pedigree_individualsWithRelatives, None, Pedigree)
-Pedigree.identifyFamilies = new_instancemethod(_simuPOP_ba.Pedigree_identifyFamilies, None, Pedigree)
-Pedigree.identifyAncestors = new_instancemethod(_simuPOP_ba.Pedigree_identifyAncestors, None, Pedigree)
-Pedigree.identifyOffspring = new_instancemethod(_simuPOP_ba.Pedigree_identifyOffspring, None, Pedigree)
-Pedigree.removeIndividuals = new_instancemethod(_simuPOP_ba.Pedigree_removeIndividuals, None, Pedigree)
-Pedigree.removeSubPops = new_instancemethod(_simuPOP_ba.Pedigree_removeSubPops, None, Pedigree)
-Pedigree.push = new_instancemethod(_simuPOP_ba.Pedigree_push, None, Pedigree)
-Pedigree.addChrom = new_instancemethod(_simuPOP_ba.Pedigree_addChrom, None, Pedigree)
-Pedigree.addChromFrom = new_instancemethod(_simuPOP_ba.Pedigree_addChromFrom, None, Pedigree)
-Pedigree.addIndFrom = new_instancemethod(_simuPOP_ba.Pedigree_addIndFrom, None, Pedigree)
-Pedigree.mergeSubPops = new_instancemethod(_simuPOP_ba.Pedigree_mergeSubPops, None, Pedigree)
-Pedigree.resize = new_instancemethod(_simuPOP_ba.Pedigree_resize, None, Pedigree)
-Pedigree.setSubPopByIndInfo = new_instancemethod(_simuPOP_ba.Pedigree_setSubPopByIndInfo, None, Pedigree)
-Pedigree_swigregister = _simuPOP_ba.Pedigree_swigregister
-Pedigree_swigregister(Pedigree)
-
-
-def loadPedigree(*args, **kwargs) -> "simuPOP::Pedigree":
-    """
-
-
-    Usage:
-
-        loadPedigree(file, idField="ind_id", fatherField="father_id",
-          motherField="mother_id", ploidy=2, loci=[], chromTypes=[],
-          lociPos=[], chromNames=[], alleleNames=[], lociNames=[],
-          subPopNames=[], infoFields=[])
 
-    Details:
-
-        Load a pedigree from a file saved by operator PedigreeTagger or
-        function Pedigree.save. This file contains the ID of each
-        offspring and their parent(s) and optionally sex ('M' or 'F'),
-        affection status ('A' or 'U'), values of information fields and
-        genotype at some loci. IDs of each individual and their parents
-        are loaded to information fields idField, fatherField and
-        motherField. Only numeric IDs are allowed, and individual IDs must
-        be unique across all generations.  Because this file does not
-        contain generation information, generations to which offspring
-        belong are determined by the parent-offspring relationships.
-        Individuals without parents are assumed to be in the top-most
-        ancestral generation. This is the case for individuals in the top-
-        most ancestral generation if the file is saved by function
-        Pedigree.save(), and for individuals who only appear as another
-        individual's parent, if the file is saved by operator
-        PedigreeTagger. The order at which offsprng is specified is not
-        important because this function essentially creates a top-most
-        ancestral generation using IDs without parents, and creates the
-        next generation using offspring of these parents, and so on until
-        all generations are recreated. That is to say, if you have a
-        mixture of pedigrees with different generations, they will be
-        lined up from the top most ancestral generation.  If individual
-        sex is not specified, sex of of parents are determined by their
-        parental roles (father or mother) but the sex of individuals in
-        the last generation can not be determined so they will all be
-        males. If additional information fields are given, their names
-        have to be specified using parameter infoFields. The rest of the
-        columns are assued to be alleles, arranged ploidy consecutive
-        columns for each locus. If paraemter loci is not specified, the
-        number of loci is calculated by number of columns divided by
-        ploidy (default to 2). All loci are assumed to be on one
-        chromosome unless parameter loci is used to specified number of
-        loci on each chromosome. Additional parameters such as ploidy,
-        chromTypes, lociPos, chromNames, alleleNames, lociNames could be
-        used to specified the genotype structured of the loaded pedigree.
-        Please refer to class Population for details about these
-        parameters.
+# Register Pedigree in _simuPOP_ba:
+_simuPOP_ba.Pedigree_swigregister(Pedigree)
 
-
-    """
-    return _simuPOP_ba.loadPedigree(*args, **kwargs)
+loadPedigree = _simuPOP_ba.loadPedigree
 
 defdict = _simuPOP_ba.defdict
 
@@ -363,8 +363,6 @@ extern const unsigned char MaxTraitIndex;
 // if this is changed Info_Var_As_Numarray in utility.cpp also needs to be changed.
 typedef std::vector<double>::iterator InfoIterator;
 typedef std::vector<double>::const_iterator ConstInfoIterator;
-typedef std::vector<long>::iterator LineageIterator;
-typedef std::vector<long>::const_iterator ConstLineageIterator;
 extern const size_t InvalidValue;
 
 // FIXME: I need a type that is 32 or 64 bit long depending on platform
@@ -372,9 +370,15 @@ typedef unsigned long ULONG;
 extern const size_t MaxIndexSize;
 typedef long LONG;
 
+// allocator for genotype and lineage storage, which can be file-mapped
+#include "mapped_allocator.h"
+
 typedef std::vector<long>                                vectori;
 typedef std::vector<double>                              vectorf;
-typedef std::vector<Allele>                              vectora;
+typedef std::vector<Allele, simuPOP::MappedAllocator<Allele> > vectora;
+typedef std::vector<long, simuPOP::MappedAllocator<long> > vectorlin;
+typedef vectorlin::iterator LineageIterator;
+typedef vectorlin::const_iterator ConstLineageIterator;
 #ifdef MUTANTALLELE
 //typedef simuPOP::vectorm         vectorm;
 #endif
@@ -610,8 +614,8 @@ namespace simuPOP {
 typedef simuPOP::vectorm::iterator GenoIterator;
 typedef simuPOP::vectorm::const_iterator ConstGenoIterator;
 #else
-typedef std::vector<Allele>::iterator GenoIterator;
-typedef std::vector<Allele>::const_iterator ConstGenoIterator;
+typedef vectora::iterator GenoIterator;
+typedef vectora::const_iterator ConstGenoIterator;
 #endif
 
 #endif
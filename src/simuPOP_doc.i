@@ -55,6 +55,18 @@ Usage:
 
 %ignore simuPOP::AffectionSplitter::size(const Population &pop, size_t subPop, size_t virtualSubPop) const;
 
+%ignore simuPOP::AlleleTracker;
+
+%ignore simuPOP::AlleleTracker::AlleleTracker(const Population &pop, const vectoru &loci);
+
+%ignore simuPOP::AlleleTracker::loci() const;
+
+%ignore simuPOP::AlleleTracker::count(RawIndIterator begin, RawIndIterator end);
+
+%ignore simuPOP::AlleleTracker::merge(const AlleleTracker &rhs);
+
+%ignore simuPOP::AlleleTracker::setVars(Population &pop) const;
+
 %ignore simuPOP::AlleleVecAsNumArray(GenoIterator begin, GenoIterator end);
 
 %feature("docstring") simuPOP::BackwardMigrator "
@@ -531,6 +543,10 @@ Details:
 
 "; 
 
+%ignore simuPOP::BasePenetrance::batchSize() const;
+
+%ignore simuPOP::BasePenetrance::blockPenet(Population &pop, const vector< Individual * > &inds, vectorf &penetrance) const;
+
 %feature("docstring") simuPOP::BasePenetrance::clone "Obsolete or undocumented function."
 
 %feature("docstring") simuPOP::BasePenetrance::describe "Obsolete or undocumented function."
@@ -603,6 +619,10 @@ Usage:
 
 %ignore simuPOP::BaseQuanTrait::applyDuringMating(Population &pop, Population &offPop, RawIndIterator offspring, Individual *dad=NULL, Individual *mom=NULL) const;
 
+%ignore simuPOP::BaseQuanTrait::batchSize() const;
+
+%ignore simuPOP::BaseQuanTrait::blockQtrait(Population &pop, const vector< Individual * > &inds, vectorf &traits) const;
+
 %feature("docstring") simuPOP::BaseQuanTrait::clone "Obsolete or undocumented function."
 
 %feature("docstring") simuPOP::BaseQuanTrait::describe "Obsolete or undocumented function."
@@ -711,6 +731,10 @@ Details:
 
 %ignore simuPOP::BaseSelector::applyDuringMating(Population &pop, Population &offPop, RawIndIterator offspring, Individual *dad=NULL, Individual *mom=NULL) const;
 
+%ignore simuPOP::BaseSelector::batchSize() const;
+
+%ignore simuPOP::BaseSelector::blockFitness(Population &pop, const vector< Individual * > &inds, vectorf &fitness) const;
+
 %feature("docstring") simuPOP::BaseSelector::clone "Obsolete or undocumented function."
 
 %feature("docstring") simuPOP::BaseSelector::describe "Obsolete or undocumented function."
@@ -1753,10 +1777,12 @@ Usage:
 
 %ignore simuPOP::Expression::empty();
 
-%ignore simuPOP::Expression::evaluate() const;
+%ignore simuPOP::Expression::evaluate(bool quiet=false) const;
 
 %ignore simuPOP::Expression::expr() const;
 
+%ignore simuPOP::Expression::nameUsage(vectorstr &loaded, vectorstr &stored) const;
+
 %ignore simuPOP::Expression::setExpr(const string &expr=string());
 
 %ignore simuPOP::Expression::setLocalDict(PyObject *dict) const;
@@ -1765,6 +1791,8 @@ Usage:
 
 %ignore simuPOP::Expression::stmts() const;
 
+%ignore simuPOP::Expression::symbols() const;
+
 %ignore simuPOP::Expression::valueAsArray() const;
 
 %ignore simuPOP::Expression::valueAsBool() const;
@@ -2718,7 +2746,7 @@ Details:
 Usage:
 
     HeteroMating(matingSchemes, subPopSize=[],
-      shuffleOffspring=True, weightBy=ANY_SEX)
+      shuffleOffspring=True, weightBy=ANY_SEX, trackAlleleFreq=[])
 
 Details:
 
@@ -2766,7 +2794,11 @@ Details:
     applied to the same subpopulation, offspring produced by these
     mating schemes are shuffled randomly. If this is not desired, you
     can turn off offspring shuffling by setting parameter
-    shuffleOffspring to False.
+    shuffleOffspring to False.  If a list of loci is given to
+    parameter trackAlleleFreq, alleles at these loci are counted as
+    offspring are produced by all homogeneous mating schemes, and are
+    used to set variables alleleNum and alleleFreq of the offspring
+    population. Please refer to class MatingScheme for details.
 
 "; 
 
@@ -2807,7 +2839,7 @@ Details:
 Usage:
 
     HomoMating(chooser, generator, subPopSize=[], subPops=ALL_AVAIL,
-      weight=0)
+      weight=0, trackAlleleFreq=[])
 
 Details:
 
@@ -2824,7 +2856,11 @@ Details:
     weight are used to determine which (virtual) subpopulations this
     mating scheme will be applied to, and how many offspring this
     mating scheme will produce. Please refer to mating scheme
-    HeteroMating for the use of these two parameters.
+    HeteroMating for the use of these two parameters.  Parameter
+    trackAlleleFreq can be used to count alleles at specified loci
+    during mating. Please refer to class MatingScheme for details.
+    This parameter is ignored if this mating scheme is used within a
+    heterogeneous mating scheme.
 
 "; 
 
@@ -3097,6 +3133,8 @@ Details:
 
 "; 
 
+%ignore simuPOP::Individual::allelesAtLoci(const lociList &loci, vector< ULONG > &alleles);
+
 %feature("docstring") simuPOP::Individual::cmp "
 
 Description:
@@ -3143,7 +3181,10 @@ Details:
     chromosomes will be returned. If multiple chromosomes are
     specified, there should not be gaps between chromosomes. This
     function ignores type of chromosomes so it will return unused
-    alleles for sex and mitochondrial chromosomes.
+    alleles for sex and mitochondrial chromosomes. Alleles of more
+    than one homologous copy of chromosomes are exported with shape
+    (ploidy, locus) through the buffer interface (not available for
+    binary and mutant modules).
 
 "; 
 
@@ -3433,8 +3474,14 @@ Details:
     output. Optionally, a statement (or several statements separated
     by newline) can be executed before expr is evaluated. The
     evaluation of this statement may change the value of information
-    fields.  Parameter usePopVars is obsolete because population
-    variables are always usable in such expressions.
+    fields.  If NumPy is available and the expression and statements
+    only use information fields, numeric population variables and
+    function abs, they are evaluated only once for each (non-virtual)
+    subpopulation, with information fields exposed as arrays of
+    values. Expressions that cannot be evaluated this way (e.g. raise
+    an error for arrays) are evaluated for each individual.  Parameter
+    usePopVars is obsolete because population variables are always
+    usable in such expressions.
 
 "; 
 
@@ -3488,8 +3535,11 @@ Details:
     individuals to information field b or a population variable b if b
     is not an information field but a population variable, and
     a=ind.sex() will set information field a of all individuals to its
-    sex (needs exposeInd='ind'.  Parameter usePopVars is obsolete
-    because population variables will always be usable.
+    sex (needs exposeInd='ind'.  Similar to operator InfoEval,
+    statements that only assign information fields are executed once
+    for each subpopulation, with information fields exposed as NumPy
+    arrays, if possible.  Parameter usePopVars is obsolete because
+    population variables will always be usable.
 
 "; 
 
@@ -4177,7 +4227,7 @@ Details:
 
 Usage:
 
-    MatingScheme(subPopSize=[])
+    MatingScheme(subPopSize=[], trackAlleleFreq=[])
 
 Details:
 
@@ -4198,7 +4248,14 @@ Details:
     but you can also modify this population to prepare for mating. A
     common practice is to split and merge parental populations in this
     function so that you demographic related information and actions
-    could be implemented in the same function.
+    could be implemented in the same function.  If a list of loci is
+    given to parameter trackAlleleFreq, alleles at these loci are
+    counted as offspring are produced, and variables alleleNum and
+    alleleFreq of the offspring population are set as if operator
+    Stat(alleleFreq=trackAlleleFreq) were applied to it after mating.
+    Because offspring are counted while their genotypes are being
+    written, this avoids a separate pass through the offspring
+    population.
 
 "; 
 
@@ -4214,6 +4271,10 @@ Details:
 
 %ignore simuPOP::MatingScheme::subPopSizeSpecified();
 
+%ignore simuPOP::MatingScheme::trackAlleleFreqSpecified();
+
+%ignore simuPOP::MatingScheme::setAlleleTracker(AlleleTracker *tracker);
+
 %ignore simuPOP::MatingScheme::submitScratch(Population &pop, Population &scratch);
 
 %feature("docstring") simuPOP::MatingScheme::~MatingScheme "
@@ -5324,6 +5385,37 @@ Details:
 
 %ignore simuPOP::Pedigree::idIdx() const;
 
+%feature("docstring") simuPOP::Pedigree::drawFamilies "
+
+Usage:
+
+    x.drawFamilies(IDs, fieldPath, numFamilies, numOfSamples=1)
+
+Details:
+
+    Randomly select non-overlapping families from a pedigree and
+    return IDs of their members. A family is identified by an anchor
+    individual (e.g. a father or grandfather) and consists of this
+    individual and relatives located by following each relative path
+    in fieldPath, which is a list of information fields to look for at
+    each step. For example, fieldPath=[['spouse'], ['off0'], ['off0',
+    'spouse']] specifies a family with an anchor individual, its
+    spouse, its first offspring and the spouse of this offspring.
+    Paths that lead to an invalid (negative) ID are ignored.
+    Parameter IDs should be a list of IDs of anchor individuals, or a
+    list of such lists if families are drawn separately from several
+    groups (e.g. subpopulations). numFamilies families are drawn from
+    each group, by visiting anchor individuals in random order and
+    selecting a family if none of its members belongs to a family that
+    has been selected for the same sample. Families are enumerated
+    only once so that multiple samples (numOfSamples) can be drawn
+    efficiently. This function returns a list of samples, each of
+    which has a list of selected families (a list of IDs) for each
+    group. Fewer families than requested are returned if there are not
+    enough non-overlapping families in a group.
+
+"; 
+
 %feature("docstring") simuPOP::Pedigree::identifyAncestors "
 
 Usage:
@@ -6176,6 +6268,8 @@ Details:
 
 %ignore simuPOP::Population::extract(const lociList &extractedLoci, const stringList &infoFieldList, const subPopList &subPops=subPopList(), const uintList &ancGens=uintList()) const;
 
+%ignore simuPOP::Population::extractIndexedIndividuals(const vectoru &indexes) const;
+
 %feature("docstring") simuPOP::Population::extractIndividuals "
 
 Usage:
@@ -6205,6 +6299,27 @@ Details:
 
 "; 
 
+%feature("docstring") simuPOP::Population::extractIndividualSets "
+
+Usage:
+
+    x.extractIndividualSets(indexes=[], IDs=[], idField=\"ind_id\")
+
+Details:
+
+    Extract several sets of individuals and return a list of
+    populations, one for each set. Sets of individuals can be
+    specified as lists of absolute indexes in the present generation
+    (parameter indexes), or lists of IDs (parameter IDs, stored in
+    information field idField, default to ind_id). The returned
+    populations are the same as those returned by calling
+    extractIndividuals for each set, but this function locates
+    individuals with a single index that is shared by all sets so it
+    is much faster if many samples are extracted from a large
+    population.
+
+"; 
+
 %ignore simuPOP::Population::extractMarkedIndividuals() const;
 
 %feature("docstring") simuPOP::Population::extractSubPops "
@@ -6257,7 +6372,11 @@ Details:
 
     Return an editable array of the genotype of all individuals in a
     population (if subPop=[], default), or individuals in a
-    subpopulation subPop. Virtual subpopulation is unsupported.
+    subpopulation subPop. Virtual subpopulation is unsupported. The
+    array supports the buffer interface with shape (individual,
+    ploidy, locus) so numpy.asarray(pop.genotype()) refers to the
+    underlying genotype directly without copying (not available for
+    binary and mutant modules).
 
 "; 
 
@@ -6285,13 +6404,34 @@ Details:
     generations) or UNSPECIFIED to search only the current generation.
     If no individual with id is found, an IndexError will be raised. A
     float id is acceptable as long as it rounds closely to an integer.
-    Note that this function uses a dynamic searching algorithm which
-    tends to be slow. If you need to look for multiple individuals
-    from a static population, you might want to convert a population
-    object to a pedigree object and use function Pedigree.indByID.
+    Individuals are located through an index of IDs that is built when
+    this function is first called, and is rebuilt only after
+    individuals have been added, removed, reordered, or assigned new
+    IDs by functions such as setIndInfo and operators such as IdTagger.
+    Individuals whose IDs are changed directly through
+    Individual.setInfo might not be found.
+
+"; 
+
+%feature("docstring") simuPOP::Population::indsByIDs "
+
+Usage:
+
+    x.indsByIDs(IDs, ancGens=ALL_AVAIL, idField=\"ind_id\")
+
+Details:
+
+    Return a list of individuals with IDs stored in information field
+    idField (default to ind_id), searched in the present and all
+    ancestral generations (default), or specified generations ancGens.
+    This function is equivalent to, but much faster than, calling
+    indByID for each ID. An IndexError will be raised if any of the
+    individuals could not be found.
 
 "; 
 
+%ignore simuPOP::Population::invalidateIDIndex();
+
 %ignore simuPOP::Population::indGenoBegin(size_t ind) const;
 
 %ignore simuPOP::Population::indGenoEnd(size_t ind) const;
@@ -6311,6 +6451,26 @@ Details:
 
 "; 
 
+%feature("docstring") simuPOP::Population::indInfoArray "
+
+Usage:
+
+    x.indInfoArray(field, subPop=[])
+
+Details:
+
+    Return an editable one-dimensional array of the values of
+    information field field (by index or name) of all individuals (if
+    subPop=[], default), or individuals in a subpopulation subPop.
+    Unlike indInfo(), which returns a copy of the values, the returned
+    memoryview refers directly to the underlying storage so
+    numpy.asarray(pop.indInfoArray('fitness')) can be used to read or
+    write a field without copying. Virtual subpopulation is
+    unsupported and the array becomes invalid once the population
+    changes.
+
+"; 
+
 %ignore simuPOP::Population::indIterator();
 
 %ignore simuPOP::Population::indIterator(size_t subPop);
@@ -6359,6 +6519,27 @@ Details:
 
 %ignore simuPOP::Population::infoEnd(size_t idx);
 
+%feature("docstring") simuPOP::Population::infoArray "
+
+Usage:
+
+    x.infoArray(subPop=[])
+
+Details:
+
+    Return an editable array of the values of all information fields
+    of all individuals (if subPop=[], default), or individuals in a
+    subpopulation subPop. Virtual subpopulation is unsupported. The
+    returned object is a two-dimensional memoryview of shape
+    (individual, field) that refers directly to the underlying
+    storage so that numpy.asarray(pop.infoArray()) does not copy data
+    and changes to the array are reflected in the population. Values
+    of a field can be accessed as arr[:, pop.infoIdx(field)]. Similar
+    to genotype(), the returned array becomes invalid once the
+    population changes.
+
+"; 
+
 %ignore simuPOP::Population::keepAncestralGens(const uintList &ancGens);
 
 %feature("docstring") simuPOP::Population::lineage "
@@ -6372,8 +6553,10 @@ Details:
     Return an editable array of the lineage of alleles for all
     individuals in a population (if subPop=[], default), or
     individuals in a subpopulation subPop. Virtual subpopulation is
-    unsupported. This function returns None for modules without
-    lineage information.
+    unsupported. Similar to genotype(), the array can be accessed
+    through the buffer interface with shape (individual, ploidy,
+    locus). This function returns None for modules without lineage
+    information.
 
 "; 
 
@@ -6626,12 +6809,20 @@ Details:
 
 Usage:
 
-    x.save(filename)
+    x.save(filename, format=\"text\")
 
 Details:
 
     Save population to a file filename, which can be loaded by a
-    global function loadPopulation(filename).
+    global function loadPopulation(filename). By default
+    (format='text'), the population is saved as a compressed text
+    archive that can be loaded by all simuPOP modules on all
+    platforms. If format is set to 'binary', genotype, lineage,
+    information fields and individual flags of all generations are
+    written as raw memory blocks, which is much faster to save and
+    load for large populations but can only be loaded by the same
+    type of simuPOP module on a platform with the same word size.
+    loadPopulation detects the format automatically.
 
 "; 
 
@@ -6731,7 +6922,8 @@ Details:
     Rearrange individuals to their new subpopulations according to
     their integer values at information field field (value returned by
     Individual::info(field)). individuals with negative values at this
-    field will be removed. Existing subpopulation names are kept. New
+    field will be removed. The relative order of individuals in each
+    subpopulation is kept. Existing subpopulation names are kept. New
     subpopulations will have empty names.
 
 "; 
@@ -7692,7 +7884,7 @@ Usage:
 
     PyPenetrance(func, loci=[], ancGens=UNSPECIFIED, begin=0,
       end=-1, step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL,
-      infoFields=[])
+      infoFields=[], cacheSize=0, batchSize=0)
 
 Details:
 
@@ -7703,7 +7895,36 @@ Details:
     chromosome position pairs, ALL_AVAIL, or a function with optional
     parameter pop that will be called at each ganeeration to determine
     indexes of loci. The return value will be treated as Individual
-    penetrance.
+    penetrance.  If func accepts only parameters geno and gen, a
+    positive cacheSize allows this operator to cache penetrance values
+    of up to cacheSize genotypes (and generations) so that func is
+    called only once for each distinct genotype. Least recently used
+    values are removed when the cache is full.  If a positive
+    batchSize is specified, func is called in batch mode for blocks
+    of up to batchSize individuals. It then receives genotypes as a
+    2-d NumPy array with one row per individual (geno), values at
+    information fields as NumPy arrays, and should return an array of
+    penetrance values, one for each individual. Individuals with
+    different numbers of alleles at loci, such as males and females at
+    loci on sex chromosomes, are passed in separate calls. Parameters
+    ind and mut are not allowed in this mode.
+
+"; 
+
+%ignore simuPOP::PyPenetrance::batchSize() const;
+
+%ignore simuPOP::PyPenetrance::blockPenet(Population &pop, const vector< Individual * > &inds, vectorf &penetrance) const;
+
+%feature("docstring") simuPOP::PyPenetrance::cacheStats "
+
+Usage:
+
+    x.cacheStats()
+
+Details:
+
+    Return a dictionary with numbers of hits and misses of the
+    penetrance cache, number of cached values (size) and cacheSize.
 
 "; 
 
@@ -7741,7 +7962,8 @@ Details:
 Usage:
 
     PyQuanTrait(func, loci=[], ancGens=UNSPECIFIED, begin=0, end=-1,
-      step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[])
+      step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[],
+      cacheSize=0, batchSize=0)
 
 Details:
 
@@ -7753,7 +7975,38 @@ Details:
     be assigned to specified trait fields (infoField). If only one
     trait field is specified, a number or a sequence of one element is
     acceptable. Otherwise, a sequence of values will be accepted and
-    be assigned to each trait field.
+    be assigned to each trait field.  If func accepts only parameters
+    geno and gen, a positive cacheSize allows this operator to cache
+    trait values of up to cacheSize genotypes (and generations) so
+    that func is called only once for each distinct genotype. Least
+    recently used values are removed when the cache is full. This
+    should not be used if func returns random trait values.  If a
+    positive batchSize is specified, func is called in batch mode for
+    blocks of up to batchSize individuals. It then receives genotypes
+    as a 2-d NumPy array with one row per individual (geno), values at
+    information fields as NumPy arrays, and should return an array
+    with one row of trait values for each individual (or a 1-d array
+    if there is only one trait field). Individuals with different
+    numbers of alleles at loci, such as males and females at loci on
+    sex chromosomes, are passed in separate calls. Parameters ind and
+    mut are not allowed in this mode.
+
+"; 
+
+%ignore simuPOP::PyQuanTrait::batchSize() const;
+
+%ignore simuPOP::PyQuanTrait::blockQtrait(Population &pop, const vector< Individual * > &inds, vectorf &traits) const;
+
+%feature("docstring") simuPOP::PyQuanTrait::cacheStats "
+
+Usage:
+
+    x.cacheStats()
+
+Details:
+
+    Return a dictionary with numbers of hits and misses of the trait
+    cache, number of cached values (size) and cacheSize.
 
 "; 
 
@@ -7794,14 +8047,47 @@ Usage:
 
     PySelector(func, loci=[], begin=0, end=-1, step=1, at=[],
       reps=ALL_AVAIL, output=\"\", subPops=ALL_AVAIL,
-      infoFields=ALL_AVAIL)
+      infoFields=ALL_AVAIL, cacheSize=0, batchSize=0)
 
 Details:
 
     Create a Python hybrid selector that passes genotype at specified
     loci, values at specified information fields (if requested) and a
     generation number to a user-defined function func. The return
-    value will be treated as individual fitness.
+    value will be treated as individual fitness.  If func accepts only
+    parameters geno and gen, a positive cacheSize allows this operator
+    to cache fitness values of up to cacheSize genotypes (and
+    generations) so that func is called only once for each distinct
+    genotype. Least recently used values are removed when the cache is
+    full. This should only be used if func returns the same value for
+    the same genotype (and generation).  If a positive batchSize is
+    specified, func is called in batch mode for blocks of up to
+    batchSize individuals. It then receives genotypes as a 2-d NumPy
+    array with one row per individual (geno), values at information
+    fields as NumPy arrays, and should return an array of fitness
+    values, one for each individual. Individuals with different numbers
+    of alleles at loci, such as males and females at loci on sex
+    chromosomes, are passed in separate calls. Parameters ind and mut
+    are not allowed in this mode.
+
+"; 
+
+%ignore simuPOP::PySelector::batchSize() const;
+
+%ignore simuPOP::PySelector::blockFitness(Population &pop, const vector< Individual * > &inds, vectorf &fitness) const;
+
+%feature("docstring") simuPOP::PySelector::cacheStats "
+
+Usage:
+
+    x.cacheStats()
+
+Details:
+
+    Return a dictionary with numbers of hits and misses of the fitness
+    cache, number of cached values (size) and cacheSize. The cache is
+    shared by copies of this operator, including those used by
+    function evolve.
 
 "; 
 
@@ -7889,6 +8175,21 @@ Details:
 
 %ignore simuPOP::RNG::RNG(const RNG &);
 
+%feature("docstring") simuPOP::RNG::copyState "
+
+Usage:
+
+    x.copyState(rhs)
+
+Details:
+
+    Copy the state of another generator rhs of the same type so that
+    the two generators produce the same sequence of random numbers
+    afterward. This can be used to save and restore the state of a
+    random number generator.
+
+"; 
+
 %feature("docstring") simuPOP::RNG::name "
 
 Usage:
@@ -8095,16 +8396,6 @@ Usage:
 
 "; 
 
-%ignore simuPOP::RNGfunc;
-
-%feature("docstring") simuPOP::RNGfunc::RNGfunc "
-
-Usage:
-
-    RNG_func(rng)
-
-"; 
-
 %feature("docstring") simuPOP::RandomParentChooser "
 
 Details:
@@ -8452,7 +8743,10 @@ Details:
     chromosomes. Such a record will be generated for each set of
     homologous chromosomes so an diploid offspring will have two lines
     of output. Note that individual IDs need to be set (using a
-    IdTagger operator) before this Recombinator is applied.  In
+    IdTagger operator) before this Recombinator is applied. The
+    output can be sent to a TreeSeqRecorder (module simuPOP.utils) to
+    record the genealogy of chromosome segments. Offspring are not
+    generated in parallel if recombination events are recorded.  In
     addition to genotypes, this operator also copies alleleic lineage
     if it is executed in a module with lineage allele type.
 
@@ -9134,7 +9428,7 @@ Details:
 Usage:
 
     x.evolve(initOps=[], preOps=[], matingScheme=MatingScheme,
-      postOps=[], finalOps=[], gen=-1, dryrun=False)
+      postOps=[], finalOps=[], gen=-1, dryrun=False, reps=ALL_AVAIL)
 
 Details:
 
@@ -9180,7 +9474,10 @@ Details:
     population, including those that have stopped before others.  If
     parameter dryrun is set to True, this function will print a
     description of the evolutionary process generated by function
-    describeEvolProcess() and exits.
+    describeEvolProcess() and exits.  Parameter reps can be used to evolve only specified replicates
+    (default to all replicates). Other replicates are left untouched
+    but are still considered active so that negative replicate indexes
+    of operators refer to the same populations.
 
 "; 
 
@@ -9355,9 +9652,9 @@ Usage:
       numOfSegSites=[], numOfMutants=[], alleleFreq=[], heteroFreq=[],
       homoFreq=[], genoFreq=[], haploFreq=[], haploHeteroFreq=[],
       haploHomoFreq=[], sumOfInfo=[], meanOfInfo=[], varOfInfo=[],
-      maxOfInfo=[], minOfInfo=[], LD=[], association=[],
-      neutrality=[], structure=[], HWE=[], inbreeding=[],
-      effectiveSize=[], vars=ALL_AVAIL, suffix=\"\", output=\"\", begin=0,
+      maxOfInfo=[], minOfInfo=[], LD=[], LDMatrix=[], LDWindow=0,
+      association=[], neutrality=[], structure=[], HWE=[],
+      inbreeding=[], effectiveSize=[], vars=ALL_AVAIL, suffix=\"\", output=\"\", begin=0,
       end=-1, step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL,
       infoFields=[])
 
@@ -9643,6 +9940,35 @@ Details:
     *   LD_ChiSq_p_sp p value for the ChiSq statistics for each
     (virtual) subpopulation.
     *   CramerV_sp Cramer V statistics for each (virtual)
+    subpopulation.LDMatrix: Parameter LDMatrix accepts a list of loci,
+    which can be a list of indexes, names, or ALL_AVAIL, and calculates
+    linkage disequilibrium between all pairs of these loci, which
+    should be on chromosomes of the same type. All non-zero alleles at
+    a locus are combined so the results are the same as diallelic
+    measures calculated by parameter LD for diallelic loci with
+    alleles 0 and 1. Haplotypes at all loci are packed into bits so
+    that this statistic is much faster than parameter LD for a large
+    number of pairs of loci, such as loci within a window of a
+    chromosome. If a positive LDWindow is given, only pairs of loci
+    that are at most LDWindow loci apart in the list are calculated,
+    which requires time and memory proportional to the number of loci
+    instead of its square. This statistic sets the following
+    variables, each as a list of lists (which can be converted to a
+    numpy array) with element [i][j] for the i-th and j-th loci, or,
+    if LDWindow is positive, with LDWindow elements [i][k] for the
+    i-th and (i+k+1)-th loci (0 for loci beyond the end of the list):
+    *   LD_matrix (default) Absolute value of basic LD measure for
+    haplotypes in all or specified (virtual) subpopulations.
+    *   LD_prime_matrix (default) Absolute value of Lewontin's D'
+    measure for haplotypes in all or specified (virtual)
+    subpopulations.
+    *   R2_matrix (default) Correlation LD measure for haplotypes in
+    all or specified (virtual) subpopulations.
+    *   LD_matrix_sp Basic LD measure for haplotypes in each (virtual)
+    subpopulation.
+    *   LD_prime_matrix_sp Lewontin's D' measure for haplotypes in
+    each (virtual) subpopulation.
+    *   R2_matrix_sp R2 measure for haplotypes in each (virtual)
     subpopulation.association: Parameter association accepts a list of
     loci, which can be a list of indexes, names, or ALL_AVAIL. At each
     locus, one or more statistical tests will be performed to test
@@ -10181,6 +10507,97 @@ Usage:
 
 "; 
 
+%feature("docstring") simuPOP::TrajectoryEngine "
+
+Details:
+
+    A trajectory engine simulates trajectories of allele frequencies
+    of one or more unlinked diallelic loci in a diploid population,
+    forward or backward in time. It is the native engine used by class
+    TrajectorySimulator of module simuPOP.utils, which prepares
+    population sizes and fitness values from demographic and fitness
+    functions and wraps simulated frequencies into Trajectory objects.
+    Attempts to simulate a trajectory are run in parallel if multiple
+    threads are used. The accepted attempt depends on the number of
+    threads unless random number streams are enabled by
+    setOptions(rngStreams=True), in which case each attempt uses its own
+    stream of random numbers.
+
+"; 
+
+%feature("docstring") simuPOP::TrajectoryEngine::TrajectoryEngine "
+
+Usage:
+
+    TrajectoryEngine(nLoci, firstGen, N, fitness)
+
+Details:
+
+    Create a trajectory engine for nLoci unlinked loci. N is a list of
+    subpopulation sizes at the beginning of generation firstGen and at
+    the end of generations firstGen, firstGen + 1, and so on. The
+    first and last items are used for generations before and after
+    these generations. fitness can be a list of fitness values (3,
+    3*nLoci or 3**nLoci values, see TrajectorySimulator for details)
+    that is used for all generations and subpopulations, or a list of
+    fitness values for each subpopulation at each generation, starting
+    from generation firstGen, with the same number of items (the
+    maximal number of subpopulations in N) for each generation.
+
+"; 
+
+%feature("docstring") simuPOP::TrajectoryEngine::simuForward "
+
+Usage:
+
+    x.simuForward(beginGen, endGen, beginFreq, endFreq, maxAttempts)
+
+Details:
+
+    Simulate a trajectory forward in time from allele frequencies
+    beginFreq (a list of frequencies for each subpopulation) at the
+    beginning of generation beginGen, until the end of generation
+    endGen. A trajectory is accepted if frequencies at endGen fall
+    into ranges endFreq, given for each locus in each subpopulation or
+    for each locus in the whole population. Up to maxAttempts attempts
+    are made, and a dictionary of frequencies of all subpopulations at
+    each generation is returned for the first accepted attempt. None
+    is returned if no trajectory is accepted.
+
+"; 
+
+%feature("docstring") simuPOP::TrajectoryEngine::simuBackward "
+
+Usage:
+
+    x.simuBackward(endGen, endFreq, minMutAge, maxMutAge,
+      maxAttempts)
+
+Details:
+
+    Simulate a trajectory backward in time from allele frequencies
+    endFreq (a list of frequencies for each subpopulation) at the end
+    of generation endGen, until alleles at all loci are lost. A
+    trajectory is accepted if no allele gets fixed and if its length
+    is between minMutAge and maxMutAge. Up to maxAttempts attempts are
+    made, and a dictionary of frequencies of all subpopulations at
+    each generation is returned for the first accepted attempt. None
+    is returned if no trajectory is accepted.
+
+"; 
+
+%feature("docstring") simuPOP::TrajectoryEngine::attempts "
+
+Usage:
+
+    x.attempts()
+
+Details:
+
+    Return the number of attempts made by the last simulation.
+
+"; 
+
 %ignore simuPOP::UniformNumOffModel;
 
 %feature("docstring") simuPOP::UniformNumOffModel::UniformNumOffModel "
@@ -10297,6 +10714,10 @@ Usage:
 
 %ignore simuPOP::armitageTrendTest(const vector< vectoru > &table, const vectorf &weight);
 
+%ignore simuPOP::batchCall(const pyFunc &func, Population *pop, size_t gen, const lociList &loci, const vector< Individual * > &inds, size_t numValues, vectorf &values);
+
+%ignore simuPOP::checkBatchFunc(const pyFunc &func);
+
 %ignore simuPOP::chisqTest(const vector< vectoru > &table, double &chisq, double &chisq_p);
 
 %ignore simuPOP::cleanupCircularRefs();
@@ -10407,6 +10828,8 @@ Usage:
 
 %ignore simuPOP::formatDescription(const string &text);
 
+%ignore simuPOP::genoValueCache;
+
 %feature("docstring") simuPOP::getRNG "
 
 Description:
@@ -10719,6 +11142,8 @@ Usage:
 
 "; 
 
+%ignore simuPOP::pyFuncArgs;
+
 %ignore simuPOP::pyGenerator;
 
 %feature("docstring") simuPOP::pyGenerator::isValid "
@@ -10956,7 +11381,7 @@ Usage:
 
 "; 
 
-%ignore simuPOP::pyPopObj(void *p);
+%ignore simuPOP::pyPopObj(void *p, bool own=false);
 
 %ignore simuPOP::pyPopPointer(PyObject *p);
 
@@ -10966,7 +11391,8 @@ Usage:
 
 Usage:
 
-    setOptions(numThreads=-1, name=None, seed=0)
+    setOptions(numThreads=-1, name=None, seed=0, storageDir=None,
+      rngStreams=-1)
 
 Details:
 
@@ -10976,7 +11402,22 @@ Details:
     environmental variable OMP_NUM_THREADS. Second and third argument
     is to set the type or seed of existing random number generator
     using RNGname with seed. If using openMP, it sets the type or seed
-    of random number generator of each thread.
+    of random number generator of each thread. If a directory is given
+    to storageDir, large genotype and lineage arrays allocated
+    afterwards are stored in temporary files under this directory and
+    mapped into memory, so that generations that are not in use (e.g.
+    ancestral generations) can be paged out to disk instead of
+    occupying RAM. Setting storageDir to an empty string restores in-
+    memory storage for newly allocated arrays. This feature is not
+    available under windows and for the mutant module. If rngStreams
+    is set to True, offspring generated by a homogeneous mating scheme
+    are divided into blocks of fixed size and each block draws random
+    numbers from a stream determined by the random seed, generation
+    number, replicate, subpopulation and index of its first offspring,
+    so that results do not depend on the number of threads used.
+    Because individual IDs are assigned in the order at which
+    offspring are generated, mating schemes with an IdTagger are not
+    parallelized in this mode. Default to -1 (unchanged).
 
 "; 
 
@@ -11368,6 +11809,32 @@ Usage:
 
 "; 
 
+%ignore simuPOP::statLDMatrix;
+
+%feature("docstring") simuPOP::statLDMatrix::apply "
+
+Usage:
+
+    x.apply(pop)
+
+"; 
+
+%feature("docstring") simuPOP::statLDMatrix::describe "
+
+Usage:
+
+    x.describe(format=True)
+
+"; 
+
+%feature("docstring") simuPOP::statLDMatrix::statLDMatrix "
+
+Usage:
+
+    statLDMatrix(loci, window, subPops, vars, suffix)
+
+"; 
+
 %ignore simuPOP::statNeutrality;
 
 %feature("docstring") simuPOP::statNeutrality::apply "
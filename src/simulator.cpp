@@ -194,7 +194,8 @@ vectoru Simulator::evolve(
                           const MatingScheme & matingScheme,
                           const opList & postOps,
                           const opList & finalOps,
-                          int gens, bool dryrun)
+                          int gens, bool dryrun,
+                          const uintList & reps)
 {
 	if (dryrun) {
 		cerr << describeEvolProcess(initOps, preOps, matingScheme, postOps, finalOps, gens, numRep()) << endl;
@@ -208,6 +209,20 @@ vectoru Simulator::evolve(
 	fill(activeReps.begin(), activeReps.end(), true);
 	size_t numStopped = 0;
 
+	// replicates that will be evolved. Replicates that are not selected are
+	// left untouched but are still considered active by the operators so
+	// that negative replicate indexes refer to the same populations.
+	vector<bool> selectedReps(m_pops.size(), reps.allAvail());
+	if (!reps.allAvail()) {
+		const vectoru & repList = reps.elems();
+		for (size_t i = 0; i < repList.size(); ++i) {
+			PARAM_FAILIF(repList[i] >= m_pops.size(), IndexError,
+				(boost::format("Replicate index %1% out of range of 0 ~ %2%") % repList[i] % (m_pops.size() - 1)).str());
+			selectedReps[repList[i]] = true;
+		}
+	}
+	size_t numSelected = std::count(selectedReps.begin(), selectedReps.end(), true);
+
 	// evolved generations, which will be returned.
 	vectoru evolvedGens(m_pops.size(), 0U);
 
@@ -227,7 +242,7 @@ vectoru Simulator::evolve(
 	// appy pre-op, most likely initializer. Do not check if they are active
 	// or if they are successful
 	if (!initOps.empty())
-		apply(initOps);
+		apply(initOps, selectedReps);
 
 	elapsedTime("Start evolution.");
 
@@ -254,7 +269,7 @@ vectoru Simulator::evolve(
 			DBG_ASSERT(curRep == curPop.rep(), SystemError,
 				"Replicate number does not match");
 
-			if (!activeReps[curRep])
+			if (!activeReps[curRep] || !selectedReps[curRep])
 				continue;
 
 			size_t it = 0;                                            // asign a value to reduce compiler warning
@@ -262,7 +277,7 @@ vectoru Simulator::evolve(
 			if (PyErr_CheckSignals()) {
 				cerr << "Evolution stopped due to keyboard interruption." << endl;
 				fill(activeReps.begin(), activeReps.end(), false);
-				numStopped = activeReps.size();
+				numStopped = numSelected;
 			}
 			// apply pre-mating ops to current gen()
 			if (!preOps.empty()) {
@@ -290,7 +305,7 @@ vectoru Simulator::evolve(
 						if (e.message()[0] != '\0')
 							cerr << e.message() << endl;
 						fill(activeReps.begin(), activeReps.end(), false);
-						numStopped = activeReps.size();
+						numStopped = numSelected;
 						break;
 					} catch (RevertEvolution e) {
 						long newCurGen = curPop.getVars().getVarAsInt("gen");
@@ -326,7 +341,7 @@ vectoru Simulator::evolve(
 					                        << "During-mating Operator at replicate " << curRep << endl);
 
 				fill(activeReps.begin(), activeReps.end(), false);
-				numStopped = activeReps.size();
+				numStopped = numSelected;
 				// does not execute post mating operator
 				break;
 			} catch (RevertEvolution e) {
@@ -365,7 +380,7 @@ vectoru Simulator::evolve(
 						if (e.message()[0] != '\0')
 							cerr << e.message() << endl;
 						fill(activeReps.begin(), activeReps.end(), false);
-						numStopped = activeReps.size();
+						numStopped = numSelected;
 						// does not run the rest of the post-mating operators.
 						break;
 					} catch (RevertEvolution e) {
@@ -398,12 +413,12 @@ vectoru Simulator::evolve(
 		//    cur, end = cur +1
 		//    will go two generations.
 		//  therefore, step should:
-		if (numStopped == m_pops.size() || gens == 0)
+		if (numStopped >= numSelected || gens == 0)
 			break;
 	}                                                                                         // the big loop
 
 	if (!finalOps.empty())
-		apply(finalOps);
+		apply(finalOps, selectedReps);
 
 	// close every opened file (including append-cross-evolution ones)
 	ostreamManager().closeAll();
@@ -412,10 +427,12 @@ vectoru Simulator::evolve(
 }
 
 
-bool Simulator::apply(const opList & ops)
+bool Simulator::apply(const opList & ops, const vector<bool> & selectedReps)
 {
 	// really apply
 	for (UINT curRep = 0; curRep < m_pops.size(); curRep++) {
+		if (!selectedReps.empty() && !selectedReps[curRep])
+			continue;
 		Population & curPop = *m_pops[curRep];
 		size_t it;
 		// apply pre-mating ops to current gen
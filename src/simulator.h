@@ -215,6 +215,11 @@ public:
 	 *  If parameter \e dryrun is set to \c True, this function will print a
 	 *  description of the evolutionary process generated by function
 	 *  \c describeEvolProcess() and exits.
+	 *
+	 *  Parameter \e reps can be used to evolve only specified replicates
+	 *  (default to all replicates). Other replicates are left untouched but
+	 *  are still considered active so that negative replicate indexes of
+	 *  operators refer to the same populations.
 	 *  <group>2-evolve</group>
 	 */
 	vectoru evolve(
@@ -223,11 +228,12 @@ public:
 		const MatingScheme & matingScheme = MatingScheme(),
 		const opList & postOps = opList(),
 		const opList & finalOps = opList(),
-		int gen = -1, bool dryrun = false);
+		int gen = -1, bool dryrun = false,
+		const uintList & reps = uintList());
 
 
-	/// CPPONLY apply a list of operators to all populations
-	bool apply(const opList & ops);
+	/// CPPONLY apply a list of operators to all (or selected) populations
+	bool apply(const opList & ops, const vector<bool> & selectedReps = vector<bool>());
 
 
 	/** Return the local namespace of the \e rep-th population, equivalent to
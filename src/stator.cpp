@@ -34,6 +34,9 @@ using std::set;
 #include <vector>
 #include <algorithm>
 
+#include "boost/dynamic_bitset/detail/lowest_bit.hpp"
+using boost::detail::lowest_bit;
+
 #if TR1_SUPPORT == 0
 #  include <map>
 typedef std::map<ULONG, pair<ULONG, ULONG> > IndexMap;
@@ -117,21 +120,41 @@ bool PyEval::apply(Population & pop) const
 }
 
 
-string InfoEval::evalInfo(Individual * ind, PyObject * dict) const
+void InfoEval::usedInfoFields(const Population & pop, vectorstr & names, vectoru & fields) const
 {
-	vectorstr infos = ind->infoFields();
+	const vectorstr infos = pop.infoFields();
+
+	names.clear();
+	fields.clear();
+	// all fields are exposed if variables might be accessed dynamically
+	bool allFields = false;
+	const char * dynamicNames[] = { "locals", "vars", "globals", "eval", "exec", NULL };
+	for (size_t i = 0; dynamicNames[i] != NULL; ++i)
+		if (find(m_symbols.begin(), m_symbols.end(), dynamicNames[i]) != m_symbols.end())
+			allFields = true;
 
 	for (size_t idx = 0; idx < infos.size(); ++idx) {
-		string name = infos[idx];
-		double val = ind->info(idx);
+		if (allFields || find(m_symbols.begin(), m_symbols.end(), infos[idx]) != m_symbols.end()) {
+			names.push_back(infos[idx]);
+			fields.push_back(idx);
+		}
+	}
+}
+
+
+string InfoEval::evalInfo(Individual * ind, PyObject * dict, const vectorstr & names,
+                          const vectoru & fields) const
+{
+	for (size_t i = 0; i < fields.size(); ++i) {
+		double val = ind->info(fields[i]);
 		// if the value is unchanged, do not set new value
-		if (m_lastValues.size() <= idx || m_lastValues[idx] != val) {
-			if (m_lastValues.size() <= idx)
+		if (m_lastValues.size() <= i || m_lastValues[i] != val) {
+			if (m_lastValues.size() <= i)
 				m_lastValues.push_back(val);
 			else
-				m_lastValues[idx] = val;
+				m_lastValues[i] = val;
 			PyObject * obj = PyFloat_FromDouble(val);
-			int err = PyDict_SetItemString(dict, name.c_str(), obj);
+			int err = PyDict_SetItemString(dict, names[i].c_str(), obj);
 			Py_DECREF(obj);
 			if (err != 0) {
 #ifndef OPTIMIZED
@@ -159,18 +182,20 @@ string InfoEval::evalInfo(Individual * ind, PyObject * dict) const
 	// evaluate
 	string res = m_expr.valueAsString();
 	// If some statements have been evaluated, the value of field might have been changed
-	// update the value of individual.
+	// update the value of individual. Unchanged variables are not copied back because
+	// the field might have been changed through the exposed individual.
 	if (!m_expr.stmts().empty()) {
-		for (size_t idx = 0; idx < infos.size(); ++idx) {
+		for (size_t i = 0; i < fields.size(); ++i) {
 			double info = 0;
-			string name = infos[idx];
 			try {
-				PyObject * var = PyDict_GetItemString(dict, name.c_str());
+				PyObject * var = PyDict_GetItemString(dict, names[i].c_str());
 				PyObj_As_Double(var, info);
-				ind->setInfo(info, idx);
-				m_lastValues[idx] = info;
+				if (info == m_lastValues[i])
+					continue;
+				ind->setInfo(info, fields[i]);
+				m_lastValues[i] = info;
 			} catch (...) {
-				DBG_WARNIF(true, "Failed to update information field " + name +
+				DBG_WARNIF(true, "Failed to update information field " + names[i] +
 					" from a dictionary of information fields.");
 			}
 		}
@@ -179,14 +204,13 @@ string InfoEval::evalInfo(Individual * ind, PyObject * dict) const
 }
 
 
-void InfoEval::clearVars(Population & pop) const
+void InfoEval::clearVars(Population & pop, const vectorstr & names) const
 {
-	vectorstr infos = pop.infoFields();
-
-	//
-	for (size_t idx = 0; idx < infos.size(); ++idx) {
-		string name = infos[idx];
-		int err = PyDict_DelItemString(pop.dict(), name.c_str());
+	for (size_t idx = 0; idx < names.size(); ++idx) {
+		// variables are not set if no individual has been evaluated
+		if (PyDict_GetItemString(pop.dict(), names[idx].c_str()) == NULL)
+			continue;
+		int err = PyDict_DelItemString(pop.dict(), names[idx].c_str());
 		if (err != 0) {
 #ifndef OPTIMIZED
 			if (debug(DBG_GENERAL)) {
@@ -203,18 +227,202 @@ void InfoEval::clearVars(Population & pop) const
 }
 
 
+// convert value to a 1-d array of numbers of given size. A number is
+// repeated for all elements. Return NULL if value is not a number or an
+// array of numbers of the right size.
+static PyObject * numericColumn(PyObject * numpy, PyObject * value, size_t size)
+{
+	PyObject * arr = PyObject_CallMethod(numpy, "asarray", "O", value);
+
+	if (arr == NULL) {
+		PyErr_Clear();
+		return NULL;
+	}
+	PyObject * dtype = PyObject_GetAttrString(arr, "dtype");
+	PyObject * kind = dtype == NULL ? NULL : PyObject_GetAttrString(dtype, "kind");
+	PyObject * ndim = PyObject_GetAttrString(arr, "ndim");
+	bool numeric = kind != NULL && ndim != NULL && PyLong_AsLong(ndim) <= 1 &&
+	               string("biuf").find(PyObj_AsString(kind)) != string::npos;
+	Py_XDECREF(dtype);
+	Py_XDECREF(kind);
+	Py_XDECREF(ndim);
+	PyObject * col = NULL;
+	if (numeric)
+		col = PyObject_CallMethod(numpy, "broadcast_to", "O(n)", arr, static_cast<Py_ssize_t>(size));
+	Py_DECREF(arr);
+	if (col == NULL)
+		PyErr_Clear();
+	return col;
+}
+
+
+bool InfoEval::evalInfoArray(Population & pop, size_t subPop, const vectorstr & names,
+                             const vectoru & fields, vectorstr * results) const
+{
+	if (!m_vectorizable || !m_exposeInd.empty())
+		return false;
+
+	PyObject * dict = pop.dict();
+	// all assigned variables should be information fields
+	for (size_t i = 0; i < m_storedSymbols.size(); ++i)
+		if (find(names.begin(), names.end(), m_storedSymbols[i]) == names.end())
+			return false;
+	// other variables should be numbers, or the builtin function abs
+	for (size_t i = 0; i < m_loadedSymbols.size(); ++i) {
+		const string & name = m_loadedSymbols[i];
+		if (find(names.begin(), names.end(), name) != names.end())
+			continue;
+		PyObject * var = PyDict_GetItemString(dict, name.c_str());
+		if (var == NULL && name == "abs")
+			continue;
+#if PY_VERSION_HEX < 0x03000000
+		if (var == NULL || !(PyFloat_Check(var) || PyLong_Check(var) || PyInt_Check(var)))
+#else
+		if (var == NULL || !(PyFloat_Check(var) || PyLong_Check(var)))
+#endif
+			return false;
+	}
+	PyObject * numpy = PyImport_ImportModule("numpy");
+	if (numpy == NULL) {
+		PyErr_Clear();
+		return false;
+	}
+
+	size_t popSize = pop.subPopSize(subPop);
+	if (popSize == 0) {
+		Py_DECREF(numpy);
+		if (results != NULL)
+			results->clear();
+		return true;
+	}
+	// expose information fields as arrays
+	vectorf column(popSize);
+	bool vectorized = true;
+	for (size_t i = 0; vectorized && i < fields.size(); ++i) {
+		IndIterator ind = pop.indIterator(subPop);
+		for (size_t j = 0; ind.valid(); ++ind, ++j)
+			column[j] = ind->info(fields[i]);
+		PyObject * view = Info_Vec_As_NumArray(&column[0], vectoru(1, popSize), vectoru(1, 1));
+		PyObject * arr = PyObject_CallMethod(numpy, "array", "O", view);
+		Py_DECREF(view);
+		vectorized = arr != NULL && PyDict_SetItemString(dict, names[i].c_str(), arr) == 0;
+		Py_XDECREF(arr);
+	}
+
+	// let numpy raise errors such as division by zero as Python does for numbers
+	PyObject * noArgs = PyTuple_New(0);
+	PyObject * errKwargs = Py_BuildValue("{s:s}", "all", "raise");
+	PyObject * seterr = PyObject_GetAttrString(numpy, "seterr");
+	PyObject * oldErr = seterr == NULL ? NULL : PyObject_Call(seterr, noArgs, errKwargs);
+	PyObject * res = NULL;
+	if (vectorized && oldErr != NULL) {
+		m_expr.setLocalDict(dict);
+		try {
+			res = m_expr.evaluate(true);
+		} catch (RuntimeError &) {
+			vectorized = false;
+		}
+	} else
+		vectorized = false;
+	if (oldErr != NULL) {
+		PyObject * restored = PyObject_Call(seterr, noArgs, oldErr);
+		Py_XDECREF(restored);
+	}
+	Py_XDECREF(oldErr);
+	Py_XDECREF(seterr);
+	Py_DECREF(errKwargs);
+	Py_DECREF(noArgs);
+	PyErr_Clear();
+
+	// results have to be numbers or arrays of numbers
+	if (vectorized && results != NULL) {
+		results->clear();
+		if (res == NULL)
+			results->resize(popSize);
+		else {
+			PyObject * col = numericColumn(numpy, res, popSize);
+			PyObject * values = col == NULL ? NULL : PyObject_CallMethod(col, "tolist", NULL);
+			vectorized = values != NULL;
+			for (size_t j = 0; vectorized && j < popSize; ++j) {
+				string value;
+				PyObj_As_String(PyList_GetItem(values, j), value);
+				results->push_back(value);
+			}
+			Py_XDECREF(values);
+			Py_XDECREF(col);
+		}
+	}
+	Py_XDECREF(res);
+
+	// assigned information fields have to be numbers or arrays of numbers
+	vector<PyObject *> columns;
+	for (size_t i = 0; vectorized && i < m_storedSymbols.size(); ++i) {
+		PyObject * var = PyDict_GetItemString(dict, m_storedSymbols[i].c_str());
+		PyObject * col = var == NULL ? NULL : numericColumn(numpy, var, popSize);
+		PyObject * arr = col == NULL ? NULL :
+		                 PyObject_CallMethod(numpy, "ascontiguousarray", "Os", col, "d");
+		Py_XDECREF(col);
+		if (arr == NULL)
+			vectorized = false;
+		else
+			columns.push_back(arr);
+	}
+	// update information fields only if all of them can be updated
+	for (size_t i = 0; i < columns.size(); ++i) {
+		if (vectorized) {
+			Py_buffer buf;
+			if (PyObject_GetBuffer(columns[i], &buf, PyBUF_C_CONTIGUOUS) == 0) {
+				size_t idx = fields[find(names.begin(), names.end(), m_storedSymbols[i]) - names.begin()];
+				const double * values = static_cast<const double *>(buf.buf);
+				IndIterator ind = pop.indIterator(subPop);
+				for (size_t j = 0; ind.valid(); ++ind, ++j)
+					ind->setInfo(values[j], idx);
+				PyBuffer_Release(&buf);
+			} else
+				vectorized = false;
+		}
+		Py_DECREF(columns[i]);
+	}
+	PyErr_Clear();
+	Py_DECREF(numpy);
+	clearVars(pop, names);
+	return vectorized;
+}
+
+
 bool InfoEval::apply(Population & pop) const
 {
 	subPopList subPops = applicableSubPops(pop);
 
+	// only information fields used by the expression are exposed
+	vectorstr names;
+	vectoru fields;
+	usedInfoFields(pop, names, fields);
+
 	subPopList::const_iterator sp = subPops.begin();
 	subPopList::const_iterator spEnd = subPops.end();
 
+	// evaluate the expression for all individuals in a subpopulation at once
+	// until it fails, in which case it is evaluated for each individual.
+	bool vectorized = true;
 	for ( ; sp != spEnd; ++sp) {
+		if (vectorized && !sp->isVirtual()) {
+			vectorstr results;
+			vectorized = evalInfoArray(pop, sp->subPop(), names, fields,
+				this->noOutput() ? NULL : &results);
+			if (vectorized) {
+				for (size_t i = 0; i < results.size(); ++i) {
+					ostream & out = this->getOstream(pop.dict());
+					out << results[i];
+					this->closeOstream();
+				}
+				continue;
+			}
+		}
 		pop.activateVirtualSubPop(*sp);
 		IndIterator ind = const_cast<Population &>(pop).indIterator(sp->subPop());
 		for (; ind.valid(); ++ind) {
-			string res = evalInfo(&*ind, pop.dict()) ;
+			string res = evalInfo(&*ind, pop.dict(), names, fields) ;
 			if (!this->noOutput()) {
 				ostream & out = this->getOstream(pop.dict());
 				out << res;
@@ -223,7 +431,7 @@ bool InfoEval::apply(Population & pop) const
 		}
 		pop.deactivateVirtualSubPop(sp->subPop());
 	}
-	clearVars(pop);
+	clearVars(pop, names);
 	return true;
 }
 
@@ -234,14 +442,17 @@ bool InfoEval::applyDuringMating(Population & pop, Population & offPop, RawIndIt
 	// if offspring does not belong to subPops, do nothing, but does not fail.
 	if (!applicableToAllOffspring() && !applicableToOffspring(offPop, offspring))
 		return true;
-	string res = evalInfo(&*offspring, pop.dict());
+	vectorstr names;
+	vectoru fields;
+	usedInfoFields(offPop, names, fields);
+	string res = evalInfo(&*offspring, pop.dict(), names, fields);
 
 	if (!this->noOutput()) {
 		ostream & out = this->getOstream(pop.dict());
 		out << res;
 		this->closeOstream();
 	}
-	clearVars(pop);
+	clearVars(pop, names);
 	return true;
 }
 
@@ -255,6 +466,8 @@ string InfoExec::describe(bool /* format */) const
 bool InfoExec::apply(Population & pop) const
 {
 	subPopList subPops = applicableSubPops(pop);
+	// statements can assign new IDs to individuals
+	pop.invalidateIDIndex();
 
 	simpleStmt::OperationType oType = m_simpleStmt.operation();
 	string oVar = m_simpleStmt.var();
@@ -264,15 +477,26 @@ bool InfoExec::apply(Population & pop) const
 	if (oType != simpleStmt::NoOperation)
 		oVarIdx = pop.infoIdx(oVar);
 
+	vectorstr names;
+	vectoru fields;
+	if (oType == simpleStmt::NoOperation)
+		usedInfoFields(pop, names, fields);
+
 	subPopList::const_iterator sp = subPops.begin();
 	subPopList::const_iterator spEnd = subPops.end();
+	bool vectorized = oType == simpleStmt::NoOperation;
 	for ( ; sp != spEnd; ++sp) {
+		if (vectorized && !sp->isVirtual()) {
+			vectorized = evalInfoArray(pop, sp->subPop(), names, fields, NULL);
+			if (vectorized)
+				continue;
+		}
 		pop.activateVirtualSubPop(*sp);
 		IndIterator ind = const_cast<Population &>(pop).indIterator(sp->subPop());
 		for (; ind.valid(); ++ind) {
 			switch (oType) {
 			case simpleStmt::NoOperation:
-				evalInfo(&*ind, pop.dict());
+				evalInfo(&*ind, pop.dict(), names, fields);
 				break;
 			case simpleStmt::Assignment:
 				ind->setInfo(oValue, oVarIdx);
@@ -302,7 +526,7 @@ bool InfoExec::apply(Population & pop) const
 		pop.deactivateVirtualSubPop(sp->subPop());
 	}
 	if (oType == simpleStmt::NoOperation)
-		clearVars(pop);
+		clearVars(pop, names);
 	return true;
 }
 
@@ -313,8 +537,11 @@ bool InfoExec::applyDuringMating(Population & pop, Population & offPop, RawIndIt
 	// if offspring does not belong to subPops, do nothing, but does not fail.
 	if (!applicableToAllOffspring() && !applicableToOffspring(offPop, offspring))
 		return true;
-	evalInfo(&*offspring, pop.dict());
-	clearVars(pop);
+	vectorstr names;
+	vectoru fields;
+	usedInfoFields(offPop, names, fields);
+	evalInfo(&*offspring, pop.dict(), names, fields);
+	clearVars(pop, names);
 	return true;
 }
 
@@ -371,6 +598,8 @@ Stat::Stat(
 	const stringList & minOfInfo,
 	//
 	const intMatrix & LD,
+	const lociList & LDMatrix,
+	size_t LDWindow,
 	//
 	const lociList & association,
 	//
@@ -404,6 +633,7 @@ Stat::Stat(
 	m_haploHomoFreq(haploHeteroFreq, haploHomoFreq, subPops, vars, suffix),
 	m_info(sumOfInfo.elems(), meanOfInfo.elems(), varOfInfo.elems(), maxOfInfo.elems(), minOfInfo.elems(), subPops, vars, suffix),
 	m_LD(LD, subPops, vars, suffix),
+	m_LDMatrix(LDMatrix, LDWindow, subPops, vars, suffix),
 	m_association(association, subPops, vars, suffix),
 	m_neutrality(neutrality, subPops, vars, suffix),
 	m_structure(structure, subPops, vars, suffix),
@@ -431,6 +661,7 @@ string Stat::describe(bool /* format */) const
 	descs.push_back(m_haploFreq.describe(false));
 	descs.push_back(m_info.describe(false));
 	descs.push_back(m_LD.describe(false));
+	descs.push_back(m_LDMatrix.describe(false));
 	descs.push_back(m_association.describe(false));
 	descs.push_back(m_neutrality.describe(false));
 	descs.push_back(m_structure.describe(false));
@@ -460,6 +691,7 @@ bool Stat::apply(Population & pop) const
 	       m_haploHomoFreq.apply(pop) &&
 	       m_info.apply(pop) &&
 	       m_LD.apply(pop) &&
+	       m_LDMatrix.apply(pop) &&
 	       m_association.apply(pop) &&
 	       m_neutrality.apply(pop) &&
 	       m_structure.apply(pop) &&
@@ -951,6 +1183,302 @@ bool statNumOfMutants::apply(Population & pop) const
 }
 
 
+#ifndef MUTANTALLELE
+
+// number of loci (or words of loci for the binary module) that are counted
+// by a thread in a single pass through all individuals
+const size_t StatLociBlockSize = 256;
+
+#  ifdef LONGALLELE
+typedef intDict AlleleCounter;
+#  else
+typedef vectoru AlleleCounter;
+#  endif
+
+/* Return true if the p-th homologous copy of a locus on a chromosome of type
+ * chromType is counted for an individual of given sex. Following
+ * Population::alleleIterator(), all homologous copies of mitochondrial DNA are
+ * counted if allCopies is true.
+ */
+inline bool countedCopy(size_t chromType, Sex sex, size_t p, bool allCopies)
+{
+	switch (chromType) {
+	case CHROMOSOME_X:
+		return p == 0 || sex == FEMALE;
+	case CHROMOSOME_Y:
+		return p == 1 && sex == MALE;
+	case MITOCHONDRIAL:
+		return p == 0 || allCopies;
+	default:
+		return true;
+	}
+}
+
+
+#  ifdef BINARYALLELE
+
+/* Return \c WORDBIT alleles starting at geno, of which only the first \e
+ * size alleles are valid.
+ */
+inline WORDTYPE readAlleleWord(GenoIterator geno, size_t size)
+{
+	const WORDTYPE * ptr = BITPTR(geno);
+	size_t offset = BITOFF(geno);
+
+	if (offset == 0)
+		return *ptr;
+	else if (offset + size <= WORDBIT)
+		return *ptr >> offset;
+	else
+		return (*ptr >> offset) | (*(ptr + 1) << (WORDBIT - offset));
+}
+
+
+/* A set of WORDBIT counters stored as bit planes so that a word of WORDBIT
+ * bits can be added to all counters with a few bitwise operations.
+ */
+class BitSlicedCounter
+{
+public:
+	BitSlicedCounter() : m_added(0)
+	{
+		std::fill(m_planes, m_planes + NumPlanes, 0);
+	}
+
+
+	// add bits of word to counters, flushing counts to cnt if needed
+	void add(WORDTYPE word, vectoru & cnt)
+	{
+		WORDTYPE carry = word;
+
+		for (size_t k = 0; carry != 0 && k < NumPlanes; ++k) {
+			WORDTYPE t = m_planes[k] & carry;
+			m_planes[k] ^= carry;
+			carry = t;
+		}
+		if (++m_added == (1UL << NumPlanes) - 1)
+			flush(cnt);
+	}
+
+
+	// add counts to cnt, which should have WORDBIT elements
+	void flush(vectoru & cnt)
+	{
+		for (size_t k = 0; k < NumPlanes; ++k) {
+			WORDTYPE plane = m_planes[k];
+			while (plane != 0) {
+				size_t j = lowest_bit(plane);
+				cnt[j] += 1UL << k;
+				plane &= plane - 1;
+			}
+			m_planes[k] = 0;
+		}
+		m_added = 0;
+	}
+
+
+private:
+	static const size_t NumPlanes = 16;
+
+	WORDTYPE m_planes[NumPlanes];
+
+	size_t m_added;
+};
+
+#  endif
+
+/* Count alleles at loci for all (visible) individuals of subpopulation
+ * subPop. Requested loci are divided into blocks that are counted in
+ * parallel, and each block is counted in a single pass through the genotype
+ * of all individuals. alleleCnt[i] will have the number of each allele and
+ * allAlleles[i] the total number of alleles at locus loci[i].
+ */
+void countAlleles(Population & pop, size_t subPop, const vectoru & loci,
+                  vector<AlleleCounter> & alleleCnt, vectoru & allAlleles)
+{
+	size_t ply = pop.ploidy();
+	bool allCopies = !pop.hasActivatedVirtualSubPop() && pop.indOrdered() && !pop.isHaplodiploid();
+
+	vectoru chromTypes(loci.size());
+	for (size_t idx = 0; idx < loci.size(); ++idx)
+		chromTypes[idx] = pop.chromType(pop.chromLocusPair(loci[idx]).first);
+
+	// number of individuals of each sex, which determines the number of alleles
+	size_t numInds[2] = { 0, 0 };
+	for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind)
+		++numInds[ind->sex() == MALE ? 0 : 1];
+
+	alleleCnt.clear();
+	alleleCnt.resize(loci.size());
+	allAlleles.resize(loci.size());
+	for (size_t idx = 0; idx < loci.size(); ++idx) {
+		allAlleles[idx] = 0;
+		for (size_t p = 0; p < ply; ++p) {
+			if (countedCopy(chromTypes[idx], MALE, p, allCopies))
+				allAlleles[idx] += numInds[0];
+			if (countedCopy(chromTypes[idx], FEMALE, p, allCopies))
+				allAlleles[idx] += numInds[1];
+		}
+	}
+
+#  ifdef BINARYALLELE
+	// for the binary module, alleles at WORDBIT consecutive loci are read as
+	// a word and counted with bit-sliced counters.
+	size_t totNumLoci = pop.totNumLoci();
+	std::map<size_t, size_t> wordIndex;
+	for (size_t idx = 0; idx < loci.size(); ++idx)
+		wordIndex.insert(std::map<size_t, size_t>::value_type(loci[idx] / WORDBIT, wordIndex.size()));
+	vectoru words(wordIndex.size());
+	for (std::map<size_t, size_t>::iterator wi = wordIndex.begin(); wi != wordIndex.end(); ++wi)
+		words[wi->second] = wi->first;
+	// masks of counted loci for each word, sex and homologous copy
+	vector<WORDTYPE> masks(words.size() * 2 * ply, 0);
+	for (size_t idx = 0; idx < loci.size(); ++idx) {
+		size_t w = wordIndex[loci[idx] / WORDBIT];
+		for (size_t p = 0; p < ply; ++p) {
+			if (countedCopy(chromTypes[idx], MALE, p, allCopies))
+				masks[(w * 2) * ply + p] |= WORDTYPE(1) << (loci[idx] % WORDBIT);
+			if (countedCopy(chromTypes[idx], FEMALE, p, allCopies))
+				masks[(w * 2 + 1) * ply + p] |= WORDTYPE(1) << (loci[idx] % WORDBIT);
+		}
+	}
+	vector<vectoru> wordCnt(words.size(), vectoru(WORDBIT, 0));
+	ssize_t numBlocks = (words.size() + StatLociBlockSize - 1) / StatLociBlockSize;
+
+#    pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t blk = 0; blk < numBlocks; ++blk) {
+		size_t wBegin = blk * StatLociBlockSize;
+		size_t wEnd = std::min(wBegin + StatLociBlockSize, words.size());
+		vector<BitSlicedCounter> counters(wEnd - wBegin);
+		for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind) {
+			size_t s = ind->sex() == MALE ? 0 : 1;
+			for (size_t p = 0; p < ply; ++p) {
+				GenoIterator geno = ind->genoBegin(p);
+				for (size_t w = wBegin; w < wEnd; ++w) {
+					WORDTYPE mask = masks[(w * 2 + s) * ply + p];
+					if (mask == 0)
+						continue;
+					size_t start = words[w] * WORDBIT;
+					WORDTYPE word = readAlleleWord(geno + start, std::min(static_cast<size_t>(WORDBIT), totNumLoci - start)) & mask;
+					if (word != 0)
+						counters[w - wBegin].add(word, wordCnt[w]);
+				}
+			}
+		}
+		for (size_t w = wBegin; w < wEnd; ++w)
+			counters[w - wBegin].flush(wordCnt[w]);
+	}
+	for (size_t idx = 0; idx < loci.size(); ++idx) {
+		size_t ones = wordCnt[wordIndex[loci[idx] / WORDBIT]][loci[idx] % WORDBIT];
+		alleleCnt[idx].resize(2, 0);
+		alleleCnt[idx][0] = allAlleles[idx] - ones;
+		alleleCnt[idx][1] = ones;
+	}
+#  else
+	ssize_t numBlocks = (loci.size() + StatLociBlockSize - 1) / StatLociBlockSize;
+
+#    pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t blk = 0; blk < numBlocks; ++blk) {
+		size_t idxBegin = blk * StatLociBlockSize;
+		size_t idxEnd = std::min(idxBegin + StatLociBlockSize, loci.size());
+		bool autosomeOnly = true;
+		for (size_t idx = idxBegin; idx < idxEnd; ++idx)
+			if (chromTypes[idx] != AUTOSOME && chromTypes[idx] != CUSTOMIZED)
+				autosomeOnly = false;
+		for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind) {
+			Sex sex = ind->sex();
+			for (size_t p = 0; p < ply; ++p) {
+				GenoIterator geno = ind->genoBegin(p);
+				for (size_t idx = idxBegin; idx < idxEnd; ++idx) {
+					if (!autosomeOnly && !countedCopy(chromTypes[idx], sex, p, allCopies))
+						continue;
+					Allele v = *(geno + loci[idx]);
+#    ifndef LONGALLELE
+					if (v >= alleleCnt[idx].size())
+						alleleCnt[idx].resize(v + 1, 0);
+#    endif
+					alleleCnt[idx][v]++;
+				}
+			}
+		}
+	}
+#  endif
+}
+
+
+/* Count heterozygotes at loci for all (visible) individuals of diploid
+ * subpopulation subPop in a single pass for each block of loci.
+ */
+void countHeterozygotes(Population & pop, size_t subPop, const vectoru & loci,
+                        vectoru & heteroCnt, vectoru & homoCnt)
+{
+	size_t numInds = 0;
+
+	for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind)
+		++numInds;
+
+	heteroCnt.assign(loci.size(), 0);
+	homoCnt.resize(loci.size());
+
+#  ifdef BINARYALLELE
+	size_t totNumLoci = pop.totNumLoci();
+	std::map<size_t, size_t> wordIndex;
+	for (size_t idx = 0; idx < loci.size(); ++idx)
+		wordIndex.insert(std::map<size_t, size_t>::value_type(loci[idx] / WORDBIT, wordIndex.size()));
+	vectoru words(wordIndex.size());
+	vector<WORDTYPE> masks(wordIndex.size(), 0);
+	for (std::map<size_t, size_t>::iterator wi = wordIndex.begin(); wi != wordIndex.end(); ++wi)
+		words[wi->second] = wi->first;
+	for (size_t idx = 0; idx < loci.size(); ++idx)
+		masks[wordIndex[loci[idx] / WORDBIT]] |= WORDTYPE(1) << (loci[idx] % WORDBIT);
+	vector<vectoru> wordCnt(words.size(), vectoru(WORDBIT, 0));
+	ssize_t numBlocks = (words.size() + StatLociBlockSize - 1) / StatLociBlockSize;
+
+#    pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t blk = 0; blk < numBlocks; ++blk) {
+		size_t wBegin = blk * StatLociBlockSize;
+		size_t wEnd = std::min(wBegin + StatLociBlockSize, words.size());
+		vector<BitSlicedCounter> counters(wEnd - wBegin);
+		for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind) {
+			GenoIterator geno0 = ind->genoBegin(0);
+			GenoIterator geno1 = ind->genoBegin(1);
+			for (size_t w = wBegin; w < wEnd; ++w) {
+				size_t start = words[w] * WORDBIT;
+				size_t size = std::min(static_cast<size_t>(WORDBIT), totNumLoci - start);
+				// different alleles at the two homologous copies
+				WORDTYPE word = (readAlleleWord(geno0 + start, size) ^ readAlleleWord(geno1 + start, size)) & masks[w];
+				if (word != 0)
+					counters[w - wBegin].add(word, wordCnt[w]);
+			}
+		}
+		for (size_t w = wBegin; w < wEnd; ++w)
+			counters[w - wBegin].flush(wordCnt[w]);
+	}
+	for (size_t idx = 0; idx < loci.size(); ++idx)
+		heteroCnt[idx] = wordCnt[wordIndex[loci[idx] / WORDBIT]][loci[idx] % WORDBIT];
+#  else
+	ssize_t numBlocks = (loci.size() + StatLociBlockSize - 1) / StatLociBlockSize;
+
+#    pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t blk = 0; blk < numBlocks; ++blk) {
+		size_t idxBegin = blk * StatLociBlockSize;
+		size_t idxEnd = std::min(idxBegin + StatLociBlockSize, loci.size());
+		for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind) {
+			GenoIterator geno0 = ind->genoBegin(0);
+			GenoIterator geno1 = ind->genoBegin(1);
+			for (size_t idx = idxBegin; idx < idxEnd; ++idx)
+				if (*(geno0 + loci[idx]) != *(geno1 + loci[idx]))
+					heteroCnt[idx]++;
+		}
+	}
+#  endif
+	for (size_t idx = 0; idx < loci.size(); ++idx)
+		homoCnt[idx] = numInds - heteroCnt[idx];
+}
+
+
+#endif
+
 statAlleleFreq::statAlleleFreq(const lociList & loci, const subPopList & subPops,
 	const stringList & vars, const string & suffix)
 	: m_loci(loci), m_subPops(subPops), m_vars(), m_suffix(suffix)
@@ -1123,34 +1651,14 @@ bool statAlleleFreq::apply(Population & pop) const
 			}
 		}
 #else       // for mutant allele
+		vector<AlleleCounter> subPopAlleleCnt;
+		vectoru subPopAllAlleles;
+		countAlleles(pop, it->subPop(), loci, subPopAlleleCnt, subPopAllAlleles);
 
-
-#  pragma omp parallel for if(numThreads() > 1)
-		for (ssize_t idx = 0; idx < static_cast<ssize_t>(loci.size()); ++idx) {
+		for (size_t idx = 0; idx < loci.size(); ++idx) {
 			size_t loc = loci[idx];
-
-#  ifdef LONGALLELE
-			intDict alleles;
-#  else
-			vectoru alleles(2, 0);
-#  endif
-			size_t allAlleles = 0;
-
-			// go through all alleles
-			IndAlleleIterator a = pop.alleleIterator(loc, it->subPop());
-			// use allAllelel here because some marker does not have full number
-			// of alleles (e.g. markers on chromosome X and Y).
-			for (; a.valid(); ++a) {
-				Allele v = a.value();
-#  ifndef BINARYALLELE
-#    ifndef LONGALLELE
-				if (v >= alleles.size())
-					alleles.resize(v + 1, 0);
-#    endif
-#  endif
-				alleles[v]++;
-				allAlleles++;
-			}
+			AlleleCounter & alleles = subPopAlleleCnt[idx];
+			size_t allAlleles = subPopAllAlleles[idx];
 			// total allele count
 #  ifdef LONGALLELE
 			intDict::iterator cnt = alleles.begin();
@@ -1165,16 +1673,13 @@ bool statAlleleFreq::apply(Population & pop) const
 			allAllelesCnt[idx] += allAlleles;
 			// output variable.
 #  ifdef LONGALLELE
-			if (m_vars.contains(AlleleNum_sp_String)) {
-#    pragma omp critical
+			if (m_vars.contains(AlleleNum_sp_String))
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleNum_String, m_suffix) % loc).str(), alleles);
-			}
 			if (m_vars.contains(AlleleFreq_sp_String)) {
 				intDict::iterator cnt = alleles.begin();
 				intDict::iterator cntEnd = alleles.end();
 				for ( ; cnt != cntEnd; ++cnt)
 					cnt->second /= static_cast<double>(allAlleles);
-#    pragma omp critical
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleFreq_String, m_suffix) % loc).str(), alleles);
 			}
 #  else
@@ -1183,7 +1688,6 @@ bool statAlleleFreq::apply(Population & pop) const
 				for (size_t i = 0; i < alleles.size(); ++i)
 					if (alleles[i] != 0)
 						d[i] = static_cast<double>(alleles[i]);
-#    pragma omp critical
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleNum_String, m_suffix) % loc).str(), d);
 			}
 			if (m_vars.contains(AlleleFreq_sp_String)) {
@@ -1191,7 +1695,6 @@ bool statAlleleFreq::apply(Population & pop) const
 				for (size_t i = 0; i < alleles.size(); ++i)
 					if (alleles[i] != 0)
 						d[i] = alleles[i] / static_cast<double>(allAlleles);
-#    pragma omp critical
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleFreq_String, m_suffix) % loc).str(), d);
 			}
 #  endif
@@ -1295,15 +1798,18 @@ bool statHeteroFreq::apply(Population & pop) const
 		uintDict heteroCnt;
 		uintDict homoCnt;
 
-#pragma omp parallel for if(numThreads() > 1)
-		for (ssize_t idx = 0; idx < static_cast<ssize_t>(loci.size()); ++idx) {
-			size_t loc = loci[idx];
-
 #ifndef OPTIMIZED
-			size_t chromType = pop.chromType(pop.chromLocusPair(loc).first);
+		for (size_t idx = 0; idx < loci.size(); ++idx) {
+			size_t chromType = pop.chromType(pop.chromLocusPair(loci[idx]).first);
 			DBG_FAILIF(chromType == CHROMOSOME_X || chromType == CHROMOSOME_Y || chromType == MITOCHONDRIAL,
 				ValueError, "Heterozygosity count for sex and mitochondrial chromosomes is not supported.");
+		}
 #endif
+
+#ifdef MUTANTALLELE
+#pragma omp parallel for if(numThreads() > 1)
+		for (ssize_t idx = 0; idx < static_cast<ssize_t>(loci.size()); ++idx) {
+			size_t loc = loci[idx];
 			size_t hetero = 0;
 			size_t homo = 0;
 
@@ -1324,6 +1830,19 @@ bool statHeteroFreq::apply(Population & pop) const
 				allHomoCnt[loc] += homoCnt[loc];
 			}
 		}
+#else
+		vectoru hetero;
+		vectoru homo;
+		countHeterozygotes(pop, it->subPop(), loci, hetero, homo);
+		for (size_t idx = 0; idx < loci.size(); ++idx) {
+			size_t loc = loci[idx];
+			heteroCnt[loc] = static_cast<double>(hetero[idx]);
+			homoCnt[loc] = static_cast<double>(homo[idx]);
+			//
+			allHeteroCnt[loc] += heteroCnt[loc];
+			allHomoCnt[loc] += homoCnt[loc];
+		}
+#endif
 		pop.deactivateVirtualSubPop(it->subPop());
 		// output subpopulation variable?
 		if (m_vars.contains(HeteroNum_sp_String)) {
@@ -2583,6 +3102,230 @@ bool statLD::apply(Population & pop) const
 }
 
 
+// number of loci whose haplotypes are compared, as a block, with haplotypes
+// at all other loci by a thread
+const size_t LDMatrixTileSize = 64;
+
+/* Return the number of bits that are set in word.
+ */
+inline size_t countBits(WORDTYPE word)
+{
+#if defined(__GNUC__)
+	return __builtin_popcountl(word);
+#else
+	size_t cnt = 0;
+	for (; word != 0; word &= word - 1)
+		++cnt;
+	return cnt;
+#endif
+}
+
+
+statLDMatrix::statLDMatrix(const lociList & loci, size_t window, const subPopList & subPops,
+	const stringList & vars, const string & suffix)
+	: m_loci(loci), m_window(window), m_subPops(subPops), m_vars(), m_suffix(suffix)
+{
+	const char * allowedVars[] = {
+		LD_matrix_String,	 LD_prime_matrix_String,	R2_matrix_String,
+		LD_matrix_sp_String, LD_prime_matrix_sp_String, R2_matrix_sp_String,
+		""
+	};
+	const char * defaultVars[] = { LD_matrix_String, LD_prime_matrix_String, R2_matrix_String, "" };
+
+	m_vars.obtainFrom(vars, allowedVars, defaultVars);
+}
+
+
+string statLDMatrix::describe(bool /* format */) const
+{
+	ostringstream desc;
+
+	if (m_loci.empty())
+		return desc.str();
+	if (m_window > 0)
+		desc << "calculate linkage disequilibrium between each locus and the next " << m_window << " loci";
+	else
+		desc << "calculate linkage disequilibrium between all pairs of loci";
+	if (!m_loci.allAvail())
+		desc << " " << m_loci.elems();
+	return desc.str();
+}
+
+
+void statLDMatrix::countHaplotypes(Population & pop, const vspID & subPop, const vectoru & loci,
+                                   size_t chromType, vectoru & alleleCnt, vectoru & haploCnt, size_t & numHaplo) const
+{
+	size_t nLoci = loci.size();
+	size_t width = m_window > 0 ? m_window : nLoci;
+	size_t ply = pop.ploidy();
+
+	// haplotypes that are counted, following the rules used by statLD
+	vector<GenoIterator> haplos;
+
+	pop.activateVirtualSubPop(subPop);
+	IndIterator ind = pop.indIterator(subPop.subPop());
+	for (; ind.valid(); ++ind) {
+		for (size_t p = 0; p < ply; ++p) {
+			if (ply == 2 && p == 1 && ind->sex() == MALE && pop.isHaplodiploid())
+				continue;
+			if (chromType == CHROMOSOME_Y && ind->sex() == FEMALE)
+				continue;
+			if (((chromType == CHROMOSOME_X && p == 1) ||
+			     (chromType == CHROMOSOME_Y && p == 0)) && ind->sex() == MALE)
+				continue;
+			if (chromType == MITOCHONDRIAL && p > 0)
+				continue;
+			haplos.push_back(ind->genoBegin(p));
+		}
+	}
+	pop.deactivateVirtualSubPop(subPop.subPop());
+
+	numHaplo = haplos.size();
+	alleleCnt.assign(nLoci, 0);
+	haploCnt.assign(nLoci * width, 0);
+	if (numHaplo == 0)
+		return;
+
+	// non-zero alleles at each locus are packed into words, with one bit for
+	// each haplotype, so that haplotypes at a pair of loci can be counted
+	// with bitwise and and popcount.
+	size_t nWords = (numHaplo + WORDBIT - 1) / WORDBIT;
+	vector<WORDTYPE> bits(nLoci * nWords, 0);
+
+#pragma omp parallel for if(numThreads() > 1)
+	for (ssize_t w = 0; w < static_cast<ssize_t>(nWords); ++w) {
+		size_t hBegin = w * WORDBIT;
+		size_t hEnd = std::min(hBegin + WORDBIT, numHaplo);
+		for (size_t h = hBegin; h < hEnd; ++h) {
+			WORDTYPE mask = WORDTYPE(1) << (h % WORDBIT);
+			for (size_t k = 0; k < nLoci; ++k)
+				if (DEREF_ALLELE(haplos[h] + loci[k]) != 0)
+					bits[k * nWords + w] |= mask;
+		}
+	}
+
+	// each thread handles all pairs between a tile of loci and the loci
+	// after them, up to the end of the list or the window.
+	ssize_t nTiles = (nLoci + LDMatrixTileSize - 1) / LDMatrixTileSize;
+#pragma omp parallel for schedule(dynamic) if(numThreads() > 1)
+	for (ssize_t t = 0; t < nTiles; ++t) {
+		size_t iBegin = t * LDMatrixTileSize;
+		size_t iEnd = std::min(iBegin + LDMatrixTileSize, nLoci);
+		size_t jEnd = m_window > 0 ? std::min(iEnd + m_window, nLoci) : nLoci;
+		for (size_t j = iBegin; j < jEnd; ++j) {
+			const WORDTYPE * bj = &bits[j * nWords];
+			size_t iFirst = m_window > 0 && j > m_window ? std::max(iBegin, j - m_window) : iBegin;
+			for (size_t i = iFirst; i < iEnd && i <= j; ++i) {
+				const WORDTYPE * bi = &bits[i * nWords];
+				size_t cnt = 0;
+				for (size_t w = 0; w < nWords; ++w)
+					cnt += countBits(bi[w] & bj[w]);
+				if (i == j)
+					alleleCnt[i] = cnt;
+				else if (m_window > 0)
+					haploCnt[i * width + j - i - 1] = cnt;
+				else {
+					haploCnt[i * width + j] = cnt;
+					haploCnt[j * width + i] = cnt;
+				}
+			}
+		}
+	}
+	if (m_window == 0)
+		for (size_t i = 0; i < nLoci; ++i)
+			haploCnt[i * width + i] = alleleCnt[i];
+}
+
+
+void statLDMatrix::outputVars(Population & pop, const vectoru & alleleCnt, const vectoru & haploCnt,
+                              size_t numHaplo, const string & LDName, const string & LDPrimeName,
+                              const string & R2Name) const
+{
+	if (LDName.empty() && LDPrimeName.empty() && R2Name.empty())
+		return;
+
+	size_t nLoci = alleleCnt.size();
+	size_t width = m_window > 0 ? m_window : nLoci;
+	matrixf LD(nLoci, vectorf(width, 0.));
+	matrixf D_prime(nLoci, vectorf(width, 0.));
+	matrixf R2(nLoci, vectorf(width, 0.));
+	for (size_t i = 0; numHaplo > 0 && i < nLoci; ++i) {
+		for (size_t k = 0; k < width; ++k) {
+			// the k-th element of row i is for locus i + k + 1 in a window
+			size_t j = m_window > 0 ? i + k + 1 : k;
+			if (j >= nLoci)
+				break;
+			double P_A = alleleCnt[i] / static_cast<double>(numHaplo);
+			double P_B = alleleCnt[j] / static_cast<double>(numHaplo);
+			double P_AB = haploCnt[i * width + k] / static_cast<double>(numHaplo);
+			// the same as diallelic measures calculated by statLD
+			double D = P_AB - P_A * P_B;
+			double D_max = D > 0 ? std::min(P_A * (1 - P_B), (1 - P_A) * P_B) : std::min(P_A * P_B, (1 - P_A) * (1 - P_B));
+			double Dp = fcmp_eq(D_max, 0.) ? 0. : D / D_max;
+			double r2 = (fcmp_eq(P_A, 0) || fcmp_eq(P_B, 0) || fcmp_eq(P_A, 1) || fcmp_eq(P_B, 1)) ? 0. : D * D / P_A / (1 - P_A) / P_B / (1 - P_B);
+			LD[i][k] = fabs(D);
+			D_prime[i][k] = fabs(Dp);
+			R2[i][k] = r2;
+		}
+	}
+	if (!LDName.empty())
+		pop.getVars().setVar(LDName, LD);
+	if (!LDPrimeName.empty())
+		pop.getVars().setVar(LDPrimeName, D_prime);
+	if (!R2Name.empty())
+		pop.getVars().setVar(R2Name, R2);
+}
+
+
+bool statLDMatrix::apply(Population & pop) const
+{
+	if (m_loci.empty())
+		return true;
+
+	const vectoru & loci = m_loci.elems(&pop);
+	size_t nLoci = loci.size();
+	size_t chromType = AUTOSOME;
+	for (size_t idx = 0; idx < nLoci; ++idx) {
+		PARAM_FAILIF(loci[idx] >= pop.totNumLoci(), IndexError,
+			(boost::format("Locus index %1% out of range.") % loci[idx]).str());
+		size_t ct = pop.chromType(pop.chromLocusPair(loci[idx]).first);
+		if (idx == 0)
+			chromType = ct;
+		PARAM_FAILIF(ct != chromType, ValueError,
+			"All loci in parameter LDMatrix must be on chromosome(s) of the same type");
+	}
+
+	vectoru allAlleleCnt(nLoci, 0);
+	vectoru allHaploCnt(nLoci * (m_window > 0 ? m_window : nLoci), 0);
+	size_t allNumHaplo = 0;
+	// selected (virtual) subpopulatons.
+	subPopList subPops = m_subPops.expandFrom(pop);
+	subPopList::const_iterator it = subPops.begin();
+	subPopList::const_iterator itEnd = subPops.end();
+	for (; it != itEnd; ++it) {
+		vectoru alleleCnt;
+		vectoru haploCnt;
+		size_t numHaplo = 0;
+		countHaplotypes(pop, *it, loci, chromType, alleleCnt, haploCnt, numHaplo);
+		for (size_t i = 0; i < alleleCnt.size(); ++i)
+			allAlleleCnt[i] += alleleCnt[i];
+		for (size_t i = 0; i < haploCnt.size(); ++i)
+			allHaploCnt[i] += haploCnt[i];
+		allNumHaplo += numHaplo;
+
+		outputVars(pop, alleleCnt, haploCnt, numHaplo,
+			m_vars.contains(LD_matrix_sp_String) ? subPopVar_String(*it, LD_matrix_String, m_suffix) : string(),
+			m_vars.contains(LD_prime_matrix_sp_String) ? subPopVar_String(*it, LD_prime_matrix_String, m_suffix) : string(),
+			m_vars.contains(R2_matrix_sp_String) ? subPopVar_String(*it, R2_matrix_String, m_suffix) : string());
+	}
+	outputVars(pop, allAlleleCnt, allHaploCnt, allNumHaplo,
+		m_vars.contains(LD_matrix_String) ? LD_matrix_String + m_suffix : string(),
+		m_vars.contains(LD_prime_matrix_String) ? LD_prime_matrix_String + m_suffix : string(),
+		m_vars.contains(R2_matrix_String) ? R2_matrix_String + m_suffix : string());
+	return true;
+}
+
+
 statAssociation::statAssociation(const lociList & loci,
 	const subPopList & subPops, const stringList & vars, const string & suffix)
 	: m_loci(loci), m_subPops(subPops), m_vars(), m_suffix(suffix)
@@ -192,6 +192,13 @@ public:
 	 *  evaluation of this statement may change the value of information
 	 *  fields.
 	 *
+	 *  If NumPy is available and the expression and statements only use
+	 *  information fields, numeric population variables and function \c abs,
+	 *  they are evaluated only once for each (non-virtual) subpopulation, with
+	 *  information fields exposed as arrays of values. Expressions that cannot
+	 *  be evaluated this way (e.g. raise an error for arrays) are evaluated for
+	 *  each individual.
+	 *
 	 *  Parameter \e usePopVars is obsolete because population variables are
 	 *  always usable in such expressions.
 	 */
@@ -200,8 +207,10 @@ public:
 		const stringFunc & output = ">", int begin = 0, int end = -1, int step = 1, const intList & at = vectori(),
 		const intList & reps = intList(), const subPopList & subPops = subPopList(), const stringList & infoFields = vectorstr())
 		: BaseOperator(output, begin, end, step, at, reps, subPops, infoFields),
-		m_expr(expr, stmts), m_exposeInd(exposeInd), m_lastValues()
+		m_expr(expr, stmts), m_symbols(m_expr.symbols()), m_loadedSymbols(), m_storedSymbols(),
+		m_vectorizable(false), m_exposeInd(exposeInd), m_lastValues()
 	{
+		m_vectorizable = m_expr.nameUsage(m_loadedSymbols, m_storedSymbols);
 		(void)usePopVars;  // this parameter is obsolete, use (void) to avoid a warning message
 		DBG_WARNIF(debug(DBG_COMPATIBILITY) && usePopVars, "WARNING: parameter usePopVars is obsolete.");
 	}
@@ -230,13 +239,33 @@ public:
 	string describe(bool format = true) const;
 
 protected:
-	string evalInfo(Individual * ind, PyObject * dict) const;
+	/// names and indexes of information fields used by the expression and statements
+	void usedInfoFields(const Population & pop, vectorstr & names, vectoru & fields) const;
+
+	string evalInfo(Individual * ind, PyObject * dict, const vectorstr & names,
+		const vectoru & fields) const;
+
+	void clearVars(Population & pop, const vectorstr & names) const;
 
-	void clearVars(Population & pop) const;
+	/// evaluate the expression once for all individuals in a subpopulation
+	/// with information fields exposed as NumPy arrays. Return \c false if
+	/// the expression cannot be evaluated in this way.
+	bool evalInfoArray(Population & pop, size_t subPop, const vectorstr & names,
+		const vectoru & fields, vectorstr * results) const;
 
 	/// expression to evaluate
 	const Expression m_expr;
 
+	/// variables referred to by m_expr
+	const vectorstr m_symbols;
+
+	/// variables read and assigned by m_expr
+	vectorstr m_loadedSymbols;
+	vectorstr m_storedSymbols;
+
+	/// if m_expr can be evaluated with arrays of values
+	bool m_vectorizable;
+
 	const string m_exposeInd;
 	/// cache last values to speed up evaluation, more specifically,
 	/// if the next individual holds the same value at an information field
@@ -269,6 +298,10 @@ public:
 	 *  information field \e a of all individuals to its sex (needs
 	 *  <tt>exposeInd='ind'</tt>.
 	 *
+	 *  Similar to operator \c InfoEval, statements that only assign
+	 *  information fields are executed once for each subpopulation, with
+	 *  information fields exposed as NumPy arrays, if possible.
+	 *
 	 *  Parameter \e usePopVars is obsolete because population variables will
 	 *  always be usable.
 	 */
@@ -717,6 +750,47 @@ private:
 	string m_suffix;
 };
 
+/// CPPONLY
+class statLDMatrix
+{
+private:
+#define   LD_matrix_String          "LD_matrix"
+#define   LD_prime_matrix_String    "LD_prime_matrix"
+#define   R2_matrix_String          "R2_matrix"
+
+#define   LD_matrix_sp_String       "LD_matrix_sp"
+#define   LD_prime_matrix_sp_String "LD_prime_matrix_sp"
+#define   R2_matrix_sp_String       "R2_matrix_sp"
+
+public:
+	statLDMatrix(const lociList & loci, size_t window, const subPopList & subPops,
+		const stringList & vars, const string & suffix);
+
+	string describe(bool format = true) const;
+
+	bool apply(Population & pop) const;
+
+private:
+	// count non-zero alleles at each locus and haplotypes with non-zero
+	// alleles at each pair of loci, stored as rows of m_window elements
+	// (or all loci if m_window is zero)
+	void countHaplotypes(Population & pop, const vspID & subPop, const vectoru & loci,
+		size_t chromType, vectoru & alleleCnt, vectoru & haploCnt, size_t & numHaplo) const;
+
+	// calculate and output LD measures from allele and haplotype counts
+	void outputVars(Population & pop, const vectoru & alleleCnt, const vectoru & haploCnt,
+		size_t numHaplo, const string & LDName, const string & LDPrimeName,
+		const string & R2Name) const;
+
+private:
+	lociList m_loci;
+	size_t m_window;
+
+	subPopList m_subPops;
+	stringList m_vars;
+	string m_suffix;
+};
+
 /// CPPONLY
 class statAssociation
 {
@@ -1302,6 +1376,37 @@ public:
 	 *       (virtual) subpopulation.
 	 *  \li \c CramerV_sp Cramer V statistics for each (virtual) subpopulation.
 	 *
+	 *  <b>LDMatrix</b>: Parameter \c LDMatrix accepts a list of loci, which can
+	 *  be a list of indexes, names, or \c ALL_AVAIL, and calculates linkage
+	 *  disequilibrium between all pairs of these loci, which should be on
+	 *  chromosomes of the same type. All non-zero alleles at a locus are
+	 *  combined so the results are the same as diallelic measures calculated
+	 *  by parameter \c LD for diallelic loci with alleles \c 0 and \c 1.
+	 *  Haplotypes at all loci are packed into bits so that this statistic is
+	 *  much faster than parameter \c LD for a large number of pairs of loci,
+	 *  such as loci within a window of a chromosome. If a positive
+	 *  \c LDWindow is given, only pairs of loci that are at most \c LDWindow
+	 *  loci apart in the list are calculated, which requires time and memory
+	 *  proportional to the number of loci instead of its square. This
+	 *  statistic sets the following variables, each as a list of lists (which
+	 *  can be converted to a numpy array) with element <tt>[i][j]</tt> for the
+	 *  i-th and j-th loci, or, if \c LDWindow is positive, with \c LDWindow
+	 *  elements <tt>[i][k]</tt> for the i-th and <tt>(i+k+1)</tt>-th loci (0
+	 *  for loci beyond the end of the list):
+	 *  \li \c LD_matrix (default) Absolute value of basic LD measure for
+	 *       haplotypes in all or specified (virtual) subpopulations.
+	 *  \li \c LD_prime_matrix (default) Absolute value of Lewontin's D'
+	 *       measure for haplotypes in all or specified (virtual)
+	 *       subpopulations.
+	 *  \li \c R2_matrix (default) Correlation LD measure for haplotypes in
+	 *       all or specified (virtual) subpopulations.
+	 *  \li \c LD_matrix_sp Basic LD measure for haplotypes in each (virtual)
+	 *       subpopulation.
+	 *  \li \c LD_prime_matrix_sp Lewontin's D' measure for haplotypes in each
+	 *       (virtual) subpopulation.
+	 *  \li \c R2_matrix_sp R2 measure for haplotypes in each (virtual)
+	 *       subpopulation.
+	 *
 	 *  <b>association</b>: Parameter \c association accepts a list of loci,
 	 *  which can be a list of indexes, names, or \c ALL_AVAIL. At each locus,
 	 *  one or more statistical tests will be performed to test association
@@ -1544,6 +1649,8 @@ public:
 		const stringList & minOfInfo = vectorstr(),
 		//
 		const intMatrix & LD = intMatrix(),
+		const lociList & LDMatrix = vectoru(),
+		size_t LDWindow = 0,
 		//
 		const lociList & association = vectoru(),
 		//
@@ -1600,6 +1707,7 @@ private:
 	const statHaploHomoFreq m_haploHomoFreq;
 	const statInfo m_info;
 	const statLD m_LD;
+	const statLDMatrix m_LDMatrix;
 	const statAssociation m_association;
 	const statNeutrality m_neutrality;
 	const statStructure m_structure;
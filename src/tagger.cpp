@@ -62,6 +62,7 @@ bool IdTagger::apply(Population & pop) const
 			pop.individual(i).setInfo(static_cast<double>(g_indID++), idx);
 	}
 	pop.useAncestralGen(curGen);
+	pop.invalidateIDIndex();
 	return true;
 }
 
@@ -432,23 +433,26 @@ bool PyTagger::applyDuringMating(Population & /* pop */, Population & offPop, Ra
 	// if offspring does not belong to subPops, do nothing, but does not fail.
 	if (!applicableToAllOffspring() && !applicableToOffspring(offPop, offspring))
 		return true;
-	PyObject * args = PyTuple_New(m_func.numArgs());
-
-	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
-
-	for (size_t i = 0; i < m_func.numArgs(); ++i) {
-		const string & arg = m_func.arg(i);
-
+	// parents usually share the genotypic structure of offspring so
+	// information fields can be accessed by indexes
+	m_args.initializeIfNeeded(*offspring);
+	bool dadIdx = dad != NULL && dad->genoStruIdx() == offspring->genoStruIdx();
+	bool momIdx = mom != NULL && mom->genoStruIdx() == offspring->genoStruIdx();
+	PyObject * args = m_args.tuple();
+
+	for (size_t i = 0; i < m_args.size(); ++i) {
 		PyObject * item = PyTuple_New((dad != NULL) + (mom != NULL));
 		int idx = 0;
 		if (dad != NULL) {
-			PyTuple_SET_ITEM(item, idx, PyFloat_FromDouble(dad->info(arg)));
+			PyTuple_SET_ITEM(item, idx, PyFloat_FromDouble(dadIdx ?
+					dad->info(m_args.infoIdx(i)) : dad->info(m_func.arg(i))));
 			++idx;
 		}
 		if (mom != NULL)
-			PyTuple_SET_ITEM(item, idx, PyFloat_FromDouble(mom->info(arg)));
+			PyTuple_SET_ITEM(item, idx, PyFloat_FromDouble(momIdx ?
+					mom->info(m_args.infoIdx(i)) : mom->info(m_func.arg(i))));
 
-		PyTuple_SET_ITEM(args, i, item);
+		m_args.setArg(i, item);
 	}
 
 	//
@@ -459,9 +463,8 @@ bool PyTagger::applyDuringMating(Population & /* pop */, Population & offPop, Ra
 
 	// assign return values to offspring
 	for (size_t i = 0; i < res.size(); ++i)
-		offspring->setInfo(res[i], m_func.arg(i));
+		offspring->setInfo(res[i], m_args.infoIdx(i));
 
-	Py_DECREF(args);
 	return true;
 }
 
@@ -104,7 +104,9 @@ public:
 	/// CPPONLY
 	bool parallelizable() const
 	{
-		return true;
+		// IDs depend on the order at which offspring are generated, which is
+		// not reproducible when random number streams are used
+		return !useRNGStreams();
 	}
 
 
@@ -484,7 +486,7 @@ public:
 		int step = 1, const intList & at = vectori(), const intList & reps = intList(), const subPopList & subPops = subPopList(),
 		const stringFunc & output = "", const stringList & infoFields = vectorstr()) :
 		BaseOperator(output, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func)
+		m_func(func), m_args(m_func, pyFuncArgs::INFO_ARG)
 	{
 		DBG_ASSERT(infoSize() == 0, ValueError,
 			"Parameter infoFields of this operator is not used.");
@@ -527,6 +529,9 @@ public:
 
 private:
 	const pyFunc m_func;
+
+	/// information fields passed to m_func
+	const pyFuncArgs m_args;
 };
 
 
@@ -751,7 +751,7 @@ void Recombinator::initialize(const Individual & ind) const
 	} else
 		m_algorithm = 1;
 
-	if (m_algorithm != 2) {
+	if (m_algorithm == 0) {
 #ifdef _OPENMP
 		for (size_t i = 0; i < numThreads(); i++)
 			m_bt[i].setParameter(vecP);
@@ -759,12 +759,36 @@ void Recombinator::initialize(const Individual & ind) const
 
 		m_bt.setParameter(vecP);
 #endif
+	} else if (m_algorithm == 1) {
+		// cumulative hazard -log(1-p) of recombination points, excluding the
+		// last one that determines the starting copy of chromosomes
+		m_cumHazard.resize(vecP.size() - 1);
+		double hazard = 0;
+		for (size_t i = 0; i + 1 < vecP.size(); ++i) {
+			hazard -= log1p(-max(vecP[i], 0.));
+			m_cumHazard[i] = hazard;
+		}
 	}
 
 	DBG_DO(DBG_TRANSMITTER, cerr << "Algorithm " << m_algorithm << " is being used " << endl);
 }
 
 
+size_t Recombinator::nextRecPoint(double & hazard) const
+{
+	// Recombination events follow a Poisson process along the cumulative
+	// hazard so the waiting time to the next event is exponentially
+	// distributed. A recombination point is crossed if at least one event
+	// happens in its interval, which happens with probability p.
+	hazard -= log(getRNG().randUniform());
+	vectorf::const_iterator it = std::upper_bound(m_cumHazard.begin(), m_cumHazard.end(), hazard);
+	if (it == m_cumHazard.end())
+		return Bernullitrials_T::npos;
+	hazard = *it;
+	return it - m_cumHazard.begin();
+}
+
+
 void Recombinator::transmitGenotype(const Individual & parent,
                                     Individual & offspring, int ploidy) const
 {
@@ -833,9 +857,9 @@ void Recombinator::transmitGenotype(const Individual & parent,
 	}
 	// get a new set of values.
 	// const BoolResults& bs = bt.trial();
-	if (m_algorithm != 2)
+	if (m_algorithm == 0)
 		bt.trial();
-	int curCp = m_algorithm == 2 ? getRNG().randBit() : (bt.trialSucc(m_recBeforeLoci.size() - 1) ? 0 : 1);
+	int curCp = m_algorithm != 0 ? getRNG().randBit() : (bt.trialSucc(m_recBeforeLoci.size() - 1) ? 0 : 1);
 	curCp = forceFirstBegin == 0 ? 0 : (forceSecondBegin == 0 ? 1 : curCp);
 
 	if (m_debugOutput)
@@ -843,7 +867,7 @@ void Recombinator::transmitGenotype(const Individual & parent,
 
 	// the last one does not count, because it determines
 	// the initial copy of paternal chromosome
-	if (m_algorithm != 2)
+	if (m_algorithm == 0)
 		bt.setTrialSucc(m_recBeforeLoci.size() - 1, false);
 
 	// algorithm one:
@@ -938,7 +962,8 @@ void Recombinator::transmitGenotype(const Individual & parent,
 	} else if (m_algorithm == 1) {
 #ifndef BINARYALLELE
 		size_t gt = 0, gtEnd = 0;
-		size_t pos = bt.probFirstSucc();
+		double hazard = 0;
+		size_t pos = nextRecPoint(hazard);
 		// if there is some recombination
 		ssize_t convCount = -1;
 		size_t convEnd;
@@ -946,13 +971,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 			// first piece
 #  ifdef MUTANTALLELE
 			copyGenotype(cp[curCp] + gt, cp[curCp] + m_recBeforeLoci[pos], off + gt);
-			gt = m_recBeforeLoci[pos];
 #  else
-			for (; gt < m_recBeforeLoci[pos]; ++gt) {
-				off[gt] = cp[curCp][gt];
-				LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-			}
+			copy(cp[curCp] + gt, cp[curCp] + m_recBeforeLoci[pos], off + gt);
+			LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + m_recBeforeLoci[pos], lineageOff + gt));
 #  endif
+			gt = m_recBeforeLoci[pos];
 			curCp = (curCp + 1) % 2;
 			if (m_debugOutput)
 				*m_debugOutput << ' ' << gt - 1;
@@ -963,7 +986,7 @@ void Recombinator::transmitGenotype(const Individual & parent,
 				convCount = markersConverted(gt, parent);
 			}
 			// next recombination point...
-			while ((pos = bt.probNextSucc(pos)) != Bernullitrials_T::npos) {
+			while ((pos = nextRecPoint(hazard)) != Bernullitrials_T::npos) {
 				// copy from last to this recombination point, but
 				// there might be a conversion event in between
 				gtEnd = m_recBeforeLoci[pos];
@@ -972,13 +995,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 					if (convEnd < gtEnd) {
 #  ifdef MUTANTALLELE
 						copyGenotype(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
-						gt = convEnd;
 #  else
-						for (; gt < convEnd; ++gt) {
-							off[gt] = cp[curCp][gt];
-							LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-						}
+						copy(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
+						LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + convEnd, lineageOff + gt));
 #  endif
+						gt = convEnd;
 						curCp = (curCp + 1) % 2;
 						if (m_debugOutput)
 							*m_debugOutput << ' ' << gt - 1;
@@ -989,13 +1010,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 				// copy from the end of conversion to this recombination point
 #  ifdef MUTANTALLELE
 				copyGenotype(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
-				gt = gtEnd;
 #  else
-				for (; gt < gtEnd; ++gt) {
-					off[gt] = cp[curCp][gt];
-					LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-				}
+				copy(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
+				LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 #  endif
+				gt = gtEnd;
 				curCp = (curCp + 1) % 2;
 				if (m_debugOutput)
 					*m_debugOutput << ' ' << gt - 1;
@@ -1017,13 +1036,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 			if (convEnd < gtEnd) {
 #  ifdef MUTANTALLELE
 				copyGenotype(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
-				gt = convEnd;
 #  else
-				for (; gt < convEnd; ++gt) {
-					off[gt] = cp[curCp][gt];
-					LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-				}
+				copy(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
+				LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + convEnd, lineageOff + gt));
 #  endif
+				gt = convEnd;
 				curCp = (curCp + 1) % 2;
 				if (m_debugOutput)
 					*m_debugOutput << ' ' << gt - 1;
@@ -1031,16 +1048,15 @@ void Recombinator::transmitGenotype(const Individual & parent,
 		}
 #  ifdef MUTANTALLELE
 		copyGenotype(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
-		gt = gtEnd;
 #  else
-		for (; gt < gtEnd; ++gt) {
-			off[gt] = cp[curCp][gt];
-			LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-		}
+		copy(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
+		LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 #  endif
+		gt = gtEnd;
 #else
 		size_t gt = 0, gtEnd = 0;
-		size_t pos = bt.probFirstSucc();
+		double hazard = 0;
+		size_t pos = nextRecPoint(hazard);
 		// if there is some recombination
 		ssize_t convCount = -1;
 		size_t convEnd;
@@ -1061,7 +1077,7 @@ void Recombinator::transmitGenotype(const Individual & parent,
 				convCount = markersConverted(gt, parent);
 			}
 			// next recombination point...
-			while ((pos = bt.probNextSucc(pos)) != Bernullitrials_T::npos) {
+			while ((pos = nextRecPoint(hazard)) != Bernullitrials_T::npos) {
 				gtEnd = m_recBeforeLoci[pos];
 				if (convCount > 0) {
 					convEnd = gt + convCount;
@@ -1130,13 +1146,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 			// first piece
 #  ifdef MUTANTALLELE
 			copyGenotype(cp[curCp] + gt, cp[curCp] + m_recBeforeLoci[pos], off + gt);
-			gt = m_recBeforeLoci[pos];
 #  else
-			for (; gt < m_recBeforeLoci[pos]; ++gt) {
-				off[gt] = cp[curCp][gt];
-				LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-			}
+			copy(cp[curCp] + gt, cp[curCp] + m_recBeforeLoci[pos], off + gt);
+			LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + m_recBeforeLoci[pos], lineageOff + gt));
 #  endif
+			gt = m_recBeforeLoci[pos];
 			curCp = (curCp + 1) % 2;
 			if (m_debugOutput)
 				*m_debugOutput << ' ' << gt - 1;
@@ -1162,13 +1176,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 					if (convEnd < gtEnd) {
 #  ifdef MUTANTALLELE
 						copyGenotype(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
-						gt = convEnd;
 #  else
-						for (; gt < convEnd; ++gt) {
-							off[gt] = cp[curCp][gt];
-							LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-						}
+						copy(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
+						LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + convEnd, lineageOff + gt));
 #  endif
+						gt = convEnd;
 						curCp = (curCp + 1) % 2;
 						if (m_debugOutput)
 							*m_debugOutput << ' ' << gt - 1;
@@ -1179,13 +1191,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 				// copy from the end of conversion to this recombination point
 #  ifdef MUTANTALLELE
 				copyGenotype(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
-				gt = gtEnd;
 #  else
-				for (; gt < gtEnd; ++gt) {
-					off[gt] = cp[curCp][gt];
-					LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-				}
+				copy(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
+				LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 #  endif
+				gt = gtEnd;
 				curCp = (curCp + 1) % 2;
 				if (m_debugOutput)
 					*m_debugOutput << ' ' << gt - 1;
@@ -1208,13 +1218,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 			if (convEnd < gtEnd) {
 #  ifdef MUTANTALLELE
 				copyGenotype(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
-				gt = convEnd;
 #  else
-				for (; gt < convEnd; ++gt) {
-					off[gt] = cp[curCp][gt];
-					LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-				}
+				copy(cp[curCp] + gt, cp[curCp] + convEnd, off + gt);
+				LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + convEnd, lineageOff + gt));
 #  endif
+				gt = convEnd;
 				curCp = (curCp + 1) % 2;
 				if (m_debugOutput)
 					*m_debugOutput << ' ' << gt - 1;
@@ -1222,13 +1230,11 @@ void Recombinator::transmitGenotype(const Individual & parent,
 		}
 #  ifdef MUTANTALLELE
 		copyGenotype(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
-		gt = gtEnd;
 #  else
-		for (; gt < gtEnd; ++gt) {
-			off[gt] = cp[curCp][gt];
-			LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
-		}
+		copy(cp[curCp] + gt, cp[curCp] + gtEnd, off + gt);
+		LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 #  endif
+		gt = gtEnd;
 #else       // binary alleles
 		size_t gt = 0, gtEnd = 0;
 		size_t step = getRNG().randGeometric(m_rates[0]);
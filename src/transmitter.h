@@ -567,6 +567,10 @@ public:
 	 *  for each set of homologous chromosomes so an diploid offspring will
 	 *  have two lines of output. Note that individual IDs need to be set
 	 *  (using a \c IdTagger operator) before this Recombinator is applied.
+	 *  The output can be sent to a \c TreeSeqRecorder (module
+	 *  \c simuPOP.utils) to record the genealogy of chromosome segments.
+	 *  Offspring are not generated in parallel if recombination events are
+	 *  recorded.
 	 *
 	 *  In addition to genotypes, this operator also copies alleleic lineage if
 	 *  it is executed in a module with lineage allele type.
@@ -630,7 +634,8 @@ public:
 	/// CPPONLY
 	bool parallelizable() const
 	{
-		return true;
+		// recombination events are written to output one offspring at a time
+		return infoSize() != 1 || noOutput();
 	}
 
 
@@ -638,6 +643,9 @@ private:
 	/// determine number of markers to convert
 	size_t markersConverted(size_t index, const Individual & ind) const;
 
+	/// index of the next recombination point after cumulative \e hazard
+	size_t nextRecPoint(double & hazard) const;
+
 private:
 	/// intensity
 	const double m_intensity;
@@ -663,6 +671,9 @@ private:
 	/// algorithm to use (frequent or seldom recombinations)
 	mutable int m_algorithm;
 
+	/// cumulative hazard of recombination points, used by algorithm 1
+	mutable vectorf m_cumHazard;
+
 	mutable ostream * m_debugOutput;
 
 	/// bernulli trials
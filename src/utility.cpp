@@ -100,6 +100,10 @@ using std::ofstream;
 // for CryptGenRandom
 #if defined (_WIN32) || defined (__WIN32__)
 #  include <windows.h>
+#else
+// for file-mapped genotype storage
+#  include <sys/mman.h>
+#  include <unistd.h>
 #endif
 
 #include "boost/dynamic_bitset/detail/lowest_bit.hpp"
@@ -117,9 +121,9 @@ using boost::cmatch;
 // these functions are defined in customizedTypes.c which is included
 // in simuPOP_wrap.cpp
 
-extern "C" PyObject * newcarrayobject(GenoIterator begin, GenoIterator end);
+extern "C" PyObject * newcarrayobject(GenoIterator begin, GenoIterator end, const vectoru & shape);
 
-extern "C" PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end);
+extern "C" PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end, const vectoru & shape);
 
 extern "C" PyObject * PyDefDict_New();
 
@@ -426,8 +430,90 @@ RNG * g_RNG;
 RNG g_RNG;
 #endif
 
-void setOptions(const int numThreads, const char * name, unsigned long seed)
+// directory for file-mapped genotype storage, empty for in-memory storage
+string g_storageDir;
+
+// whether or not use random number streams during mating
+bool g_rngStreams = false;
+
+// blocks smaller than this are always allocated from the heap
+const size_t MappedStorageThreshold = 1024 * 1024;
+
+// each block starts with a header that records how it was allocated
+// (0 for heap and 1 for file-mapped) and the length of the whole block,
+// padded to 16 bytes to keep the alignment of the returned memory.
+const size_t StorageHeaderSize = 16;
+
+void * allocateStorage(size_t bytes)
+{
+	size_t total = bytes + StorageHeaderSize;
+	char * block = NULL;
+	size_t mapped = 0;
+
+#if !defined (_WIN32) && !defined (__WIN32__)
+	if (!g_storageDir.empty() && bytes >= MappedStorageThreshold) {
+		string tmpl = g_storageDir + "/simuPOP_XXXXXX";
+		vector<char> filename(tmpl.begin(), tmpl.end());
+		filename.push_back('\0');
+		int fd = mkstemp(&filename[0]);
+		if (fd == -1)
+			throw RuntimeError("Failed to create file-mapped storage under directory " + g_storageDir);
+		// the file will be removed when the region is unmapped
+		unlink(&filename[0]);
+		if (ftruncate(fd, total) != 0) {
+			close(fd);
+			throw RuntimeError((boost::format("Failed to allocate %1% bytes of file-mapped storage under directory %2%")
+				                % total % g_storageDir).str());
+		}
+		void * addr = mmap(NULL, total, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+		close(fd);
+		if (addr == MAP_FAILED)
+			throw RuntimeError((boost::format("Failed to map %1% bytes of storage under directory %2%")
+				                % total % g_storageDir).str());
+		block = static_cast<char *>(addr);
+		mapped = 1;
+	}
+#endif
+	if (block == NULL) {
+		block = static_cast<char *>(malloc(total));
+		if (block == NULL)
+			throw std::bad_alloc();
+	}
+	size_t * header = reinterpret_cast<size_t *>(block);
+	header[0] = mapped;
+	header[1] = total;
+	return block + StorageHeaderSize;
+}
+
+
+void deallocateStorage(void * ptr)
 {
+	if (ptr == NULL)
+		return;
+	char * block = static_cast<char *>(ptr) - StorageHeaderSize;
+	size_t * header = reinterpret_cast<size_t *>(block);
+#if !defined (_WIN32) && !defined (__WIN32__)
+	if (header[0] == 1) {
+		munmap(block, header[1]);
+		return;
+	}
+#endif
+	free(block);
+}
+
+
+void setOptions(const int numThreads, const char * name, unsigned long seed, const char * storageDir,
+                const int rngStreams)
+{
+	if (rngStreams >= 0)
+		g_rngStreams = rngStreams != 0;
+	if (storageDir != NULL) {
+#if defined (_WIN32) || defined (__WIN32__)
+		if (storageDir[0] != '\0')
+			throw ValueError("File-mapped genotype storage is not supported under windows.");
+#endif
+		g_storageDir = storageDir;
+	}
 #ifdef _OPENMP
 	// if numThreads is zero, all threads will be used.
 	if (numThreads == 0) {
@@ -476,6 +562,12 @@ UINT numThreads()
 }
 
 
+bool useRNGStreams()
+{
+	return g_rngStreams;
+}
+
+
 ATOMICLONG fetchAndIncrement(ATOMICLONG * val)
 {
 	if (g_numThreads == 1)
@@ -1066,6 +1158,103 @@ pyFunc::pyFunc(PyObject * func) : m_func(func), m_numArgs(0), m_circular_self(NU
 	Py_DECREF(code);
 }
 
+
+genoValueCache::genoValueCache(const pyFunc & func, size_t cacheSize) : m_data(new cacheData())
+{
+	m_data->refCount = 1;
+	m_data->cacheSize = cacheSize;
+	m_data->useGen = func.hasArg("gen");
+	m_data->hits = 0;
+	m_data->misses = 0;
+	if (cacheSize == 0)
+		return;
+	for (size_t i = 0; i < func.numArgs(); ++i) {
+		if (func.arg(i) != "geno" && func.arg(i) != "gen") {
+			release();
+			throw ValueError("Values returned by function " + func.name() +
+				" can only be cached if it accepts only parameters geno and gen.");
+		}
+	}
+}
+
+
+genoValueCache::genoValueCache(const genoValueCache & rhs) : m_data(rhs.m_data)
+{
+	++m_data->refCount;
+}
+
+
+genoValueCache & genoValueCache::operator=(const genoValueCache & rhs)
+{
+	if (m_data != rhs.m_data) {
+		release();
+		m_data = rhs.m_data;
+		++m_data->refCount;
+	}
+	return *this;
+}
+
+
+genoValueCache::~genoValueCache()
+{
+	release();
+}
+
+
+void genoValueCache::release()
+{
+	if (--m_data->refCount == 0)
+		delete m_data;
+	m_data = NULL;
+}
+
+
+void genoValueCache::setKey(Key & key, size_t gen, const vector<ULONG> & geno) const
+{
+	key.clear();
+	key.reserve(geno.size() + 1);
+	if (m_data->useGen)
+		key.push_back(gen);
+	key.insert(key.end(), geno.begin(), geno.end());
+}
+
+
+const vectorf * genoValueCache::find(const Key & key) const
+{
+	ValueIndex::iterator it = m_data->index.find(key);
+
+	if (it == m_data->index.end()) {
+		++m_data->misses;
+		return NULL;
+	}
+	++m_data->hits;
+	// move to the front of the list
+	m_data->values.splice(m_data->values.begin(), m_data->values, it->second);
+	return &it->second->second;
+}
+
+
+void genoValueCache::insert(const Key & key, const vectorf & values) const
+{
+	if (m_data->cacheSize == 0 || m_data->index.find(key) != m_data->index.end())
+		return;
+	if (m_data->values.size() >= m_data->cacheSize) {
+		m_data->index.erase(m_data->values.back().first);
+		m_data->values.pop_back();
+	}
+	m_data->values.push_front(pair<Key, vectorf>(key, values));
+	m_data->index[key] = m_data->values.begin();
+}
+
+
+PyObject * genoValueCache::stats() const
+{
+	return Py_BuildValue("{s:k,s:k,s:n,s:n}", "hits", m_data->hits, "misses", m_data->misses,
+		"size", static_cast<Py_ssize_t>(m_data->values.size()),
+		"cacheSize", static_cast<Py_ssize_t>(m_data->cacheSize));
+}
+
+
 void pyGenerator::set(PyObject * gen)
 {
 	Py_XDECREF(m_iterator);
@@ -1465,24 +1654,113 @@ void PyObj_As_SizeTArray(PyObject * obj, vectoru & val)
 }
 
 
-PyObject * Allele_Vec_As_NumArray(GenoIterator begin, GenoIterator end)
+PyObject * Allele_Vec_As_NumArray(GenoIterator begin, GenoIterator end, const vectoru & shape)
 {
-	PyObject * res = newcarrayobject(begin, end);
+	PyObject * res = newcarrayobject(begin, end, shape);
 
 	DBG_FAILIF(res == NULL, ValueError, "Can not convert buf to Allele num array");
 	return res;
 }
 
 
-PyObject * Lineage_Vec_As_NumArray(LineageIterator begin, LineageIterator end)
+PyObject * Lineage_Vec_As_NumArray(LineageIterator begin, LineageIterator end, const vectoru & shape)
 {
-	PyObject * res = newcarrayobject_lineage(begin, end);
+	PyObject * res = newcarrayobject_lineage(begin, end, shape);
 
 	DBG_FAILIF(res == NULL, ValueError, "Can not convert buf to Lineage num array");
 	return res;
 }
 
 
+// create a memoryview of items of given format and size, with strides
+// in number of items
+PyObject * bufferAsMemoryView(void * begin, const char * format, size_t itemsize,
+                              const vectoru & shape, const vectoru & strides)
+{
+	// a valid pointer is needed even if the array is empty
+	static double empty = 0;
+	// memoryview copies shape and strides so local arrays can be used
+	std::vector<Py_ssize_t> viewShape(shape.size());
+	std::vector<Py_ssize_t> viewStrides(shape.size());
+	size_t size = 1;
+
+	for (size_t i = 0; i < shape.size(); ++i) {
+		viewShape[i] = static_cast<Py_ssize_t>(shape[i]);
+		viewStrides[i] = static_cast<Py_ssize_t>(strides[i] * itemsize);
+		size *= shape[i];
+	}
+	Py_buffer view;
+	view.buf = size == 0 ? &empty : begin;
+	view.obj = NULL;
+	view.len = size * itemsize;
+	view.readonly = 0;
+	view.itemsize = itemsize;
+	view.format = const_cast<char *>(format);
+	view.ndim = static_cast<int>(shape.size());
+	view.shape = &viewShape[0];
+	view.strides = &viewStrides[0];
+	view.suboffsets = NULL;
+	view.internal = NULL;
+	return PyMemoryView_FromBuffer(&view);
+}
+
+
+PyObject * Info_Vec_As_NumArray(double * begin, const vectoru & shape, const vectoru & strides)
+{
+	PyObject * res = bufferAsMemoryView(begin, "d", sizeof(double), shape, strides);
+
+	DBG_FAILIF(res == NULL, ValueError, "Can not convert buf to info num array");
+	return res;
+}
+
+
+// copy a C-contiguous memoryview to a NumPy array
+PyObject * memoryViewAsNumPyArray(PyObject * view)
+{
+	if (view == NULL)
+		throw RuntimeError("Failed to create a memoryview");
+	PyObject * numpy = PyImport_ImportModule("numpy");
+	if (numpy == NULL) {
+		Py_DECREF(view);
+		PyErr_Clear();
+		throw RuntimeError("Failed to import module numpy");
+	}
+	PyObject * res = PyObject_CallMethod(numpy, "array", "O", view);
+	Py_DECREF(view);
+	Py_DECREF(numpy);
+	if (res == NULL) {
+		PyErr_Clear();
+		throw RuntimeError("Failed to create a numpy array");
+	}
+	return res;
+}
+
+
+// strides of a C-contiguous array, in number of items
+vectoru contiguousStrides(const vectoru & shape)
+{
+	vectoru strides(shape.size(), 1);
+
+	for (size_t i = shape.size(); i > 1; --i)
+		strides[i - 2] = strides[i - 1] * shape[i - 1];
+	return strides;
+}
+
+
+PyObject * Vec_As_NumPyArray(const vectorf & values, const vectoru & shape)
+{
+	return memoryViewAsNumPyArray(bufferAsMemoryView(const_cast<double *>(values.empty() ? NULL : &values[0]),
+			"d", sizeof(double), shape, contiguousStrides(shape)));
+}
+
+
+PyObject * Vec_As_NumPyArray(const vector<long> & values, const vectoru & shape)
+{
+	return memoryViewAsNumPyArray(bufferAsMemoryView(const_cast<long *>(values.empty() ? NULL : &values[0]),
+			"l", sizeof(long), shape, contiguousStrides(shape)));
+}
+
+
 string PyObj_AsString(PyObject * str)
 {
 #if PY_VERSION_HEX >= 0x03000000
@@ -1991,6 +2269,24 @@ PyObject * SharedVariables::setVar(const string & name, const vectorf & val)
 }
 
 
+PyObject * SharedVariables::setVar(const string & name, const matrixf & val)
+{
+	PyObject * obj = PyList_New(0);
+
+	for (matrixf::const_iterator row = val.begin(); row != val.end(); ++row) {
+		PyObject * rowObj = PyList_New(0);
+		for (vectorf::const_iterator it = row->begin(); it != row->end(); ++it) {
+			PyObject * item = PyFloat_FromDouble(*it);
+			PyList_Append(rowObj, item);
+			Py_XDECREF(item);
+		}
+		PyList_Append(obj, rowObj);
+		Py_XDECREF(rowObj);
+	}
+	return setVar(name, obj);
+}
+
+
 PyObject * SharedVariables::setVar(const string & name, const strDict & val)
 {
 	PyObject * obj = PyDict_New();
@@ -2547,9 +2843,9 @@ SharedVariables & moduleVars()
 }
 
 
-PyObject * pyPopObj(void * p)
+PyObject * pyPopObj(void * p, bool own)
 {
-	return SWIG_NewPointerObj(p, g_swigPopType, 0);
+	return SWIG_NewPointerObj(p, g_swigPopType, own ? SWIG_POINTER_OWN : 0);
 }
 
 
@@ -2654,8 +2950,136 @@ void Expression::compileStmts(const string & stmts)
 }
 
 
+// collect co_names of a code object and the code objects nested in it
+void getCodeSymbols(PyObject * code, vectorstr & names)
+{
+	PyObject * coNames = PyObject_GetAttrString(code, "co_names");
+
+	if (coNames != NULL && PyTuple_Check(coNames)) {
+		for (Py_ssize_t i = 0; i < PyTuple_Size(coNames); ++i) {
+			string name = PyObj_AsString(PyTuple_GetItem(coNames, i));
+			if (find(names.begin(), names.end(), name) == names.end())
+				names.push_back(name);
+		}
+	}
+	Py_XDECREF(coNames);
+	PyObject * coConsts = PyObject_GetAttrString(code, "co_consts");
+	if (coConsts != NULL && PyTuple_Check(coConsts)) {
+		for (Py_ssize_t i = 0; i < PyTuple_Size(coConsts); ++i) {
+			PyObject * item = PyTuple_GetItem(coConsts, i);
+			if (PyCode_Check(item))
+				getCodeSymbols(item, names);
+		}
+	}
+	Py_XDECREF(coConsts);
+	PyErr_Clear();
+}
+
+
+vectorstr Expression::symbols() const
+{
+	vectorstr names;
+
+	if (m_expr != NULL)
+		getCodeSymbols(m_expr, names);
+	if (m_stmts != NULL)
+		getCodeSymbols(m_stmts, names);
+	return names;
+}
+
+
+// collect names loaded and stored by the instructions of a code object and
+// the code objects nested in it. Return false if the code contains operations
+// that behave differently for numbers and arrays of numbers.
+bool getCodeNameUsage(PyObject * code, PyObject * getInstructions,
+                      vectorstr & loaded, vectorstr & stored)
+{
+	PyObject * insts = PyObject_CallFunctionObjArgs(getInstructions, code, NULL);
+
+	if (insts == NULL) {
+		PyErr_Clear();
+		return false;
+	}
+	PyObject * iter = PyObject_GetIter(insts);
+	Py_DECREF(insts);
+	if (iter == NULL) {
+		PyErr_Clear();
+		return false;
+	}
+
+	bool vectorizable = true;
+	PyObject * inst = NULL;
+	while (vectorizable && (inst = PyIter_Next(iter)) != NULL) {
+		PyObject * opnameObj = PyObject_GetAttrString(inst, "opname");
+		PyObject * argval = PyObject_GetAttrString(inst, "argval");
+		PyObject * argreprObj = PyObject_GetAttrString(inst, "argrepr");
+		if (opnameObj == NULL || argval == NULL || argreprObj == NULL)
+			vectorizable = false;
+		else {
+			string opname = PyObj_AsString(opnameObj);
+			string argrepr = PyObj_AsString(argreprObj);
+			if (opname == "LOAD_NAME" || opname == "LOAD_GLOBAL") {
+				string name = PyObj_AsString(argval);
+				if (find(loaded.begin(), loaded.end(), name) == loaded.end())
+					loaded.push_back(name);
+			} else if (opname == "STORE_NAME" || opname == "STORE_GLOBAL") {
+				string name = PyObj_AsString(argval);
+				if (find(stored.begin(), stored.end(), name) == stored.end())
+					stored.push_back(name);
+			} else if (opname == "LOAD_CONST" && PyCode_Check(argval))
+				vectorizable = getCodeNameUsage(argval, getInstructions, loaded, stored);
+			// in-place operators modify shared arrays, attributes, items, matrix
+			// multiplication and identity tests behave differently for arrays
+			else if (opname.compare(0, 8, "INPLACE_") == 0 || opname.compare(0, 7, "IMPORT_") == 0 ||
+			         opname.compare(0, 7, "DELETE_") == 0 || opname.find("ATTR") != string::npos ||
+			         opname.find("METHOD") != string::npos || opname.find("SUBSCR") != string::npos ||
+			         opname.find("SLICE") != string::npos || opname.find("MATRIX") != string::npos ||
+			         opname == "IS_OP" || opname == "CONTAINS_OP" ||
+			         (opname == "COMPARE_OP" && (argrepr == "in" || argrepr == "not in" ||
+			                                     argrepr == "is" || argrepr == "is not")) ||
+			         (opname == "BINARY_OP" && !argrepr.empty() &&
+			          (argrepr[argrepr.size() - 1] == '=' || argrepr[0] == '@' || argrepr[0] == '[')))
+				vectorizable = false;
+		}
+		Py_XDECREF(opnameObj);
+		Py_XDECREF(argval);
+		Py_XDECREF(argreprObj);
+		Py_DECREF(inst);
+	}
+	Py_DECREF(iter);
+	PyErr_Clear();
+	return vectorizable;
+}
+
+
+bool Expression::nameUsage(vectorstr & loaded, vectorstr & stored) const
+{
+	loaded.clear();
+	stored.clear();
+	// module dis provides get_instructions only for Python 3.4 and later
+	PyObject * dis = PyImport_ImportModule("dis");
+	if (dis == NULL) {
+		PyErr_Clear();
+		return false;
+	}
+	PyObject * getInstructions = PyObject_GetAttrString(dis, "get_instructions");
+	Py_DECREF(dis);
+	if (getInstructions == NULL) {
+		PyErr_Clear();
+		return false;
+	}
+	bool vectorizable = true;
+	if (m_expr != NULL)
+		vectorizable = getCodeNameUsage(m_expr, getInstructions, loaded, stored);
+	if (vectorizable && m_stmts != NULL)
+		vectorizable = getCodeNameUsage(m_stmts, getInstructions, loaded, stored);
+	Py_DECREF(getInstructions);
+	return vectorizable;
+}
+
+
 // python expression
-PyObject * Expression::evaluate() const
+PyObject * Expression::evaluate(bool quiet) const
 {
 	if (m_expr == NULL && m_stmts == NULL)
 		return NULL;
@@ -2672,7 +3096,7 @@ PyObject * Expression::evaluate() const
 #endif
 		if (res == NULL) {
 #ifndef OPTIMIZED
-			if (debug(DBG_GENERAL)) {
+			if (!quiet && debug(DBG_GENERAL)) {
 				PyErr_Print();
 				PyErr_Clear();
 			}
@@ -2692,7 +3116,7 @@ PyObject * Expression::evaluate() const
 #endif
 		if (res == NULL) {
 #ifndef OPTIMIZED
-			if (debug(DBG_GENERAL)) {
+			if (!quiet && debug(DBG_GENERAL)) {
 				PyErr_Print();
 				PyErr_Clear();
 			}
@@ -3273,13 +3697,13 @@ void closeOutput(const string & output)
 
 
 // Random number generator
-RNG::RNG(const char * rng, unsigned long seed) : m_RNG(NULL)
+RNG::RNG(const char * rng, unsigned long seed) : m_RNG(NULL), m_streamEpoch(0)
 {
 	set(rng, seed);
 }
 
 
-RNG::RNG(const RNG & rhs) : m_RNG(NULL)
+RNG::RNG(const RNG & rhs) : m_RNG(NULL), m_streamEpoch(0)
 {
 	// this will create a new instance of m_RNG.
 	set(rhs.name(), rhs.seed());
@@ -3439,6 +3863,37 @@ void RNG::set(const char * rng, unsigned long seed)
 }
 
 
+void RNG::setStream(unsigned long seed, ULONG gen, size_t rep, size_t subPop, size_t index)
+{
+	// combine the keys using the finalizer of splitmix64 so that streams with
+	// adjacent keys are seeded with unrelated values
+	uint64_t key = seed;
+	uint64_t keys[4] = { gen, rep, subPop, index };
+
+	for (size_t i = 0; i < 4; ++i) {
+		key ^= keys[i] + 0x9E3779B97F4A7C15ULL + (key << 6) + (key >> 2);
+		key = (key ^ (key >> 30)) * 0xBF58476D1CE4E5B9ULL;
+		key = (key ^ (key >> 27)) * 0x94D049BB133111EBULL;
+		key ^= key >> 31;
+	}
+	gsl_rng_set(m_RNG, static_cast<unsigned long>(key ^ (key >> 32)));
+	m_bitByte = 0;
+	m_bitIndex = 0;
+	++m_streamEpoch;
+}
+
+
+void RNG::copyState(const RNG & rhs)
+{
+	PARAM_FAILIF(m_RNG->type != rhs.m_RNG->type, ValueError,
+		"Cannot copy the state of a random number generator of a different type");
+	gsl_rng_memcpy(m_RNG, rhs.m_RNG);
+	m_bitByte = rhs.m_bitByte;
+	m_bitIndex = rhs.m_bitIndex;
+	++m_streamEpoch;
+}
+
+
 bool RNG::randBit()
 {
 	if (m_bitIndex == 16)
@@ -4217,13 +4672,13 @@ double Bernullitrials::probSuccRate() const
 // ###############################################
 
 Bernullitrials_T::Bernullitrials_T(RNG & /* rng */)
-	: m_N(1024), m_prob(0), m_table(0), m_pointer(0), m_cur(npos)
+	: m_N(1024), m_prob(0), m_table(0), m_pointer(0), m_cur(npos), m_epoch(0)
 {
 }
 
 
 Bernullitrials_T::Bernullitrials_T(RNG & /* rng */, const vectorf & prob, size_t N)
-	: m_N(N), m_prob(prob), m_table(N), m_pointer(N), m_cur(npos)
+	: m_N(N), m_prob(prob), m_table(N), m_pointer(N), m_cur(npos), m_epoch(0)
 {
 	//DBG_FAILIF(trials_T <= 0, ValueError, "trial number can not be zero.");
 	DBG_FAILIF(prob.empty(), ValueError, "probability table can not be empty.");
@@ -4310,13 +4765,15 @@ void Bernullitrials_T::doTrial()
 		}
 	}
 	m_cur = 0;
+	m_epoch = getRNG().streamEpoch();
 }
 
 
 // get a trial corresponding to m_prob.
 void Bernullitrials_T::trial()
 {
-	if (m_cur == npos || m_cur == m_N - 1)  // reach the last trial
+	// reach the last trial, or the RNG has been switched to another stream
+	if (m_cur == npos || m_cur == m_N - 1 || m_epoch != getRNG().streamEpoch())
 		doTrial();
 	else
 		m_cur++;
@@ -4435,6 +4892,523 @@ double Bernullitrials_T::probSuccRate() const
 #undef getBit
 
 
+TrajectoryEngine::TrajectoryEngine(size_t nLoci, long firstGen, const intMatrix & N,
+                                   const floatMatrix & fitness)
+	: m_nLoci(nLoci), m_firstGen(firstGen), m_N(), m_fitness(fitness.elems()),
+	m_maxSubPop(0), m_attempts(0)
+{
+	PARAM_FAILIF(m_nLoci == 0, ValueError, "At least one locus is needed.");
+	PARAM_FAILIF(N.empty(), ValueError, "Population sizes are needed.");
+	const matrixi & sizes = N.elems();
+	for (size_t i = 0; i < sizes.size(); ++i) {
+		PARAM_FAILIF(sizes[i].empty(), ValueError, "Empty list of subpopulation sizes.");
+		for (size_t sp = 0; sp < sizes[i].size(); ++sp) {
+			PARAM_FAILIF(sizes[i][sp] <= 0, ValueError, "Subpopulation sizes should be positive.");
+		}
+		m_N.push_back(vectoru(sizes[i].begin(), sizes[i].end()));
+		if (sizes[i].size() > m_maxSubPop)
+			m_maxSubPop = sizes[i].size();
+	}
+	PARAM_FAILIF(m_fitness.empty() || (m_fitness.size() > 1 && m_fitness.size() % m_maxSubPop != 0),
+		ValueError, "Fitness values should be given for all subpopulations at each generation.");
+	size_t numGeno = 1;
+	for (size_t i = 0; i < m_nLoci; ++i)
+		numGeno *= 3;
+	for (size_t i = 0; i < m_fitness.size(); ++i) {
+		const vectorf & fit = m_fitness[i];
+		if (fit.size() == 3 * m_nLoci || fit.size() == 3) {
+			for (size_t j = 0; j < fit.size(); j += 3) {
+				PARAM_FAILIF(fit[j] == 0, ValueError,
+					(boost::format("fitness[%1%] should be a non zero value.") % j).str());
+			}
+		} else {
+			PARAM_FAILIF(fit.size() != numGeno, ValueError,
+				(boost::format("Wrong length of list of fitness: %1%") % fit.size()).str());
+		}
+	}
+}
+
+
+const vectoru & TrajectoryEngine::sizes(long gen) const
+{
+	long idx = gen - m_firstGen + 1;
+
+	if (idx <= 0)
+		return m_N.front();
+	else if (idx >= static_cast<long>(m_N.size()))
+		return m_N.back();
+	return m_N[idx];
+}
+
+
+void TrajectoryEngine::getS(long gen, size_t sp, const double * freq, vectorf & s) const
+{
+	size_t row = 0;
+
+	if (m_fitness.size() > 1) {
+		long numGen = static_cast<long>(m_fitness.size() / m_maxSubPop);
+		long idx = gen - m_firstGen;
+		if (idx < 0)
+			idx = 0;
+		else if (idx >= numGen)
+			idx = numGen - 1;
+		row = idx * m_maxSubPop + sp;
+	}
+	const vectorf & fit = m_fitness[row];
+	s.resize(3 * m_nLoci);
+	// the same fitness for all loci, or fitness for each locus
+	if (fit.size() == 3 * m_nLoci || fit.size() == 3) {
+		for (size_t loc = 0; loc < m_nLoci; ++loc) {
+			const double * f = fit.size() == 3 ? &fit[0] : &fit[3 * loc];
+			s[3 * loc] = 0.;
+			s[3 * loc + 1] = f[1] / f[0] - 1.;
+			s[3 * loc + 2] = f[2] / f[0] - 1.;
+		}
+		return;
+	}
+	// fitness for each combination of genotypes. Marginal fitness of each
+	// genotype at a locus is calculated from allele frequencies at other loci
+	//     f(X=Aa) = Sum_g P(Y=g) * f(X=Aa, Y=g)
+	vectoru allgeno(m_nLoci);
+	for (size_t loc = 0; loc < m_nLoci; ++loc) {
+		double f[3] = { 0., 0., 0. };
+		for (size_t geno = 0; geno < 3; ++geno) {
+			allgeno[loc] = geno;
+			// iterate through genotypes at other loci
+			for (size_t it = 0; it < fit.size() / 3; ++it) {
+				size_t num = it;
+				for (size_t l = 0; l < m_nLoci; ++l) {
+					if (l != loc) {
+						allgeno[l] = num % 3;
+						num /= 3;
+					}
+				}
+				size_t index = 0;
+				double fq = 1.;
+				for (size_t l = 0; l < m_nLoci; ++l) {
+					if (l != loc) {
+						if (allgeno[l] == 0)
+							fq *= (1 - freq[l]) * (1 - freq[l]);
+						else if (allgeno[l] == 1)
+							fq *= 2 * (1 - freq[l]) * freq[l];
+						else
+							fq *= freq[l] * freq[l];
+					}
+					index = index * 3 + allgeno[l];
+				}
+				f[geno] += fit[index] * fq;
+			}
+		}
+		s[3 * loc] = 0.;
+		s[3 * loc + 1] = f[1] / f[0] - 1.;
+		s[3 * loc + 2] = f[2] / f[0] - 1.;
+	}
+}
+
+
+void TrajectoryEngine::getNextXt(const double * curXt, double * nextXt, size_t Nt, const vectorf & s) const
+{
+	RNG & rng = getRNG();
+
+	for (size_t loc = 0; loc < m_nLoci; ++loc) {
+		double x = curXt[loc];
+		// lost or fixed alleles stay lost or fixed
+		if (x == 0. || x == 1.) {
+			nextXt[loc] = x;
+			continue;
+		}
+		double s1 = s[3 * loc + 1];
+		double s2 = s[3 * loc + 2];
+		// expected allele frequency at the next generation
+		double y = x * (1 + s2 * x + s1 * (1 - x)) / (1 + s2 * x * x + 2 * s1 * x * (1 - x));
+		nextXt[loc] = static_cast<double>(rng.randBinomial(static_cast<UINT>(2 * Nt), y)) / (2 * Nt);
+	}
+}
+
+
+void TrajectoryEngine::getPrevXt(const double * curXt, double * prevXt, size_t Nt, const vectorf & s) const
+{
+	RNG & rng = getRNG();
+
+	for (size_t loc = 0; loc < m_nLoci; ++loc) {
+		double x = curXt[loc];
+		if (x == 0.) {
+			prevXt[loc] = 0.;
+			continue;
+		}
+		// if the allele is fixed, we assume that it just reaches here by
+		// losing one allele
+		if (x == 1.) {
+			prevXt[loc] = static_cast<double>(2 * Nt - 1) / (2 * Nt);
+			continue;
+		}
+		double s1 = s[3 * loc + 1];
+		double s2 = s[3 * loc + 2];
+		// solve y from x = y(1+s2 y+s1 (1-y))/(1+s2 y^2+2 s1 y(1-y))
+		double y = x;
+		if (s1 != 0. || s2 != 0.) {
+			double a = s2 * x - 2 * s1 * x - s2 + s1;
+			double b = 2 * s1 * x - 1 - s1;
+			double c = x;
+			if (fabs(a) < 1e-8)
+				y = -c / b;
+			else {
+				double d = sqrt(b * b - 4 * a * c);
+				y = (-b - d) / (2 * a);
+				if (y < 0. || y > 1.)
+					y = (-b + d) / (2 * a);
+			}
+		}
+		prevXt[loc] = static_cast<double>(rng.randBinomial(static_cast<UINT>(2 * Nt), y)) / (2 * Nt);
+	}
+}
+
+
+bool TrajectoryEngine::simuForwardOnce(long beginGen, long endGen, const matrixf & endFreq,
+                                       vector<vectorf> & traj) const
+{
+	// traj[0] is the frequency at the beginning of beginGen, traj[i] is the
+	// frequency at the end of generation beginGen + i - 1.
+	vectorf s;
+	vectorf tmpXt(m_nLoci);
+
+	for (long gen = beginGen; gen <= endGen; ++gen) {
+		const vectorf & beginXt = traj[gen - beginGen];
+		vectorf & endingXt = traj[gen - beginGen + 1];
+		size_t numBegin = beginXt.size() / m_nLoci;
+		// population size at the end of this generation
+		const vectoru & Nt = sizes(gen);
+		size_t N = accumulate(Nt.begin(), Nt.end(), size_t(0));
+		endingXt.assign(Nt.size() * m_nLoci, 0.);
+		if (Nt.size() > numBegin) {
+			// split (forward sense) from one population to several subpopulations,
+			// assuming a multinomial distribution of alleles
+			getS(gen, 0, &beginXt[0], s);
+			getNextXt(&beginXt[0], &tmpXt[0], N, s);
+			vectorf p(Nt.size());
+			for (size_t sp = 0; sp < Nt.size(); ++sp)
+				p[sp] = static_cast<double>(Nt[sp]) / N;
+			for (size_t loc = 0; loc < m_nLoci; ++loc) {
+				vectoru cnt = getRNG().randMultinomial(static_cast<unsigned int>(tmpXt[loc] * N), p);
+				for (size_t sp = 0; sp < Nt.size(); ++sp)
+					endingXt[sp * m_nLoci + loc] = static_cast<double>(cnt[sp]) / Nt[sp];
+			}
+		} else if (Nt.size() < numBegin) {
+			// merge (forward sense) from several subpopulations into one population
+			const vectoru & prevNt = sizes(gen - 1);
+			size_t prevN = accumulate(prevNt.begin(), prevNt.end(), size_t(0));
+			for (size_t sp = 0; sp < prevNt.size(); ++sp) {
+				size_t spN = static_cast<size_t>(static_cast<double>(prevNt[sp]) / prevN * Nt[0]);
+				getS(gen, sp, &beginXt[sp * m_nLoci], s);
+				getNextXt(&beginXt[sp * m_nLoci], &tmpXt[0], spN, s);
+				for (size_t loc = 0; loc < m_nLoci; ++loc)
+					endingXt[loc] += tmpXt[loc] * spN / Nt[0];
+			}
+		} else {
+			for (size_t sp = 0; sp < Nt.size(); ++sp) {
+				getS(gen, sp, &beginXt[sp * m_nLoci], s);
+				getNextXt(&beginXt[sp * m_nLoci], &endingXt[sp * m_nLoci], Nt[sp], s);
+			}
+		}
+	}
+	// check if frequencies at the ending generation fall into specified ranges
+	const vectorf & freq = traj.back();
+	const vectoru & Nt = sizes(endGen);
+	size_t N = accumulate(Nt.begin(), Nt.end(), size_t(0));
+	for (size_t loc = 0; loc < m_nLoci; ++loc) {
+		if (endFreq.size() == m_nLoci * Nt.size()) {
+			// allele frequency at each subpopulation
+			for (size_t sp = 0; sp < Nt.size(); ++sp) {
+				const vectorf & range = endFreq[sp * m_nLoci + loc];
+				if (freq[sp * m_nLoci + loc] < range[0] || freq[sp * m_nLoci + loc] > range[1])
+					return false;
+			}
+		} else {
+			// combined allele frequency
+			double allFreq = 0.;
+			for (size_t sp = 0; sp < Nt.size(); ++sp)
+				allFreq += freq[sp * m_nLoci + loc] * Nt[sp];
+			allFreq /= N;
+			if (allFreq < endFreq[loc][0] || allFreq > endFreq[loc][1])
+				return false;
+		}
+	}
+	return true;
+}
+
+
+bool TrajectoryEngine::simuBackwardOnce(long endGen, long minMutAge, long maxMutAge,
+                                        vector<vectorf> & traj) const
+{
+	// traj[i] is the frequency at the end of generation endGen - i.
+	vectorf s;
+	vectorf tmpXt(m_nLoci);
+	// done[loc] is set if alleles at locus loc are lost in all subpopulations
+	vector<bool> done(m_nLoci, false);
+
+	for (long gen = endGen; gen >= 0; --gen) {
+		traj.push_back(vectorf());
+		const vectorf & endingXt = traj[traj.size() - 2];
+		vectorf & beginXt = traj.back();
+		size_t numEnd = endingXt.size() / m_nLoci;
+		// population sizes at the beginning and at the end of this generation
+		const vectoru & Nt = sizes(gen - 1);
+		const vectoru & endNt = sizes(gen);
+		size_t N = accumulate(Nt.begin(), Nt.end(), size_t(0));
+		beginXt.assign(Nt.size() * m_nLoci, 0.);
+		if (Nt.size() > numEnd) {
+			// merge (forward sense), assuming a multinomial distribution of
+			// alleles in the previous subpopulations
+			getS(gen, 0, &endingXt[0], s);
+			getPrevXt(&endingXt[0], &tmpXt[0], N, s);
+			vectorf p(Nt.size());
+			for (size_t sp = 0; sp < Nt.size(); ++sp)
+				p[sp] = static_cast<double>(Nt[sp]) / N;
+			for (size_t loc = 0; loc < m_nLoci; ++loc) {
+				vectoru cnt = getRNG().randMultinomial(static_cast<unsigned int>(tmpXt[loc] * N), p);
+				for (size_t sp = 0; sp < Nt.size(); ++sp)
+					beginXt[sp * m_nLoci + loc] = static_cast<double>(cnt[sp]) / Nt[sp];
+			}
+		} else if (Nt.size() < numEnd) {
+			// split (forward sense) from one population
+			size_t endN = accumulate(endNt.begin(), endNt.end(), size_t(0));
+			for (size_t sp = 0; sp < endNt.size(); ++sp) {
+				size_t spN = static_cast<size_t>(static_cast<double>(endNt[sp]) / endN * Nt[0]);
+				getS(gen, sp, &endingXt[sp * m_nLoci], s);
+				getPrevXt(&endingXt[sp * m_nLoci], &tmpXt[0], spN, s);
+				for (size_t loc = 0; loc < m_nLoci; ++loc)
+					beginXt[loc] += tmpXt[loc] * spN / Nt[0];
+			}
+		} else {
+			for (size_t sp = 0; sp < Nt.size(); ++sp) {
+				getS(gen, sp, &endingXt[sp * m_nLoci], s);
+				getPrevXt(&endingXt[sp * m_nLoci], &beginXt[sp * m_nLoci], Nt[sp], s);
+			}
+		}
+		// Check if alleles at all loci are lost. As in previous versions of
+		// TrajectorySimulator, subpopulations after the first subpopulation
+		// that loses the allele in this generation are not checked, so the
+		// locus can only be marked as done in the next generation if they
+		// have also lost the allele.
+		for (size_t loc = 0; loc < m_nLoci; ++loc) {
+			if (done[loc])
+				continue;
+			bool lost = true;
+			for (size_t sp = 0; sp < Nt.size(); ++sp) {
+				// already lost at a previous generation
+				if (endingXt[(numEnd == 1 ? 0 : sp) * m_nLoci + loc] == 0.)
+					continue;
+				double x = beginXt[sp * m_nLoci + loc];
+				if (x == 0.) {
+					// the trajectory is too short
+					if (endGen - gen < minMutAge)
+						return false;
+					lost = lost && sp + 1 == Nt.size();
+					break;
+				} else if (x == 1.)
+					// the allele gets fixed
+					return false;
+				else
+					lost = false;
+			}
+			done[loc] = lost;
+		}
+		if (find(done.begin(), done.end(), false) == done.end())
+			return true;
+		// the trajectory is too long
+		if (gen == 0 || gen + maxMutAge < endGen)
+			return false;
+	}
+	return false;
+}
+
+
+PyObject * TrajectoryEngine::simulate(bool forward, long beginGen, long endGen, const vectorf & freq,
+                                      const matrixf & endFreq, long minMutAge, long maxMutAge, size_t maxAttempts)
+{
+	// attempts are run in parallel, and the first accepted attempt is returned
+	size_t accepted = maxAttempts;
+	vector<vectorf> result;
+	ATOMICLONG next = 0;
+	int except = 0;
+	string msg;
+	// If random number streams are used, each attempt draws random numbers
+	// from its own stream so that the result does not depend on the number
+	// of threads. The streams are keyed by a number drawn from the main RNG
+	// so that repeated simulations produce different trajectories.
+	bool streams = useRNGStreams();
+	unsigned long seed = 0;
+	RNG * mainRNG = NULL;
+	if (streams) {
+		seed = static_cast<unsigned long>(getRNG().randUniform() * 4294967296.);
+		// the RNG of the main thread will be restored after simulation
+		mainRNG = new RNG(getRNG());
+		mainRNG->copyState(getRNG());
+	}
+
+#pragma omp parallel if (numThreads() > 1)
+	{
+		vector<vectorf> traj;
+		while (true) {
+			size_t attempt = static_cast<size_t>(fetchAndIncrement(&next));
+			bool stop = false;
+#pragma omp critical (trajectory)
+			stop = except != 0 || attempt >= accepted;
+			if (stop)
+				break;
+			if (streams)
+				getRNG().setStream(seed, 0, 0, 0, attempt);
+			bool success = false;
+			int error = 0;
+			string errorMsg;
+			try {
+				if (forward) {
+					traj.resize(endGen - beginGen + 2);
+					traj[0] = freq;
+					success = simuForwardOnce(beginGen, endGen, endFreq, traj);
+				} else {
+					traj.assign(1, freq);
+					success = simuBackwardOnce(endGen, minMutAge, maxMutAge, traj);
+				}
+			} catch (ValueError & e) {
+				error = 1;
+				errorMsg = e.message();
+			} catch (IndexError & e) {
+				error = 2;
+				errorMsg = e.message();
+			} catch (RuntimeError & e) {
+				error = 3;
+				errorMsg = e.message();
+			} catch (Exception & e) {
+				error = 4;
+				errorMsg = e.message();
+			}
+			if (error != 0) {
+#pragma omp critical (trajectory)
+				{
+					if (except == 0) {
+						except = error;
+						msg = errorMsg;
+					}
+				}
+				break;
+			}
+			if (success) {
+#pragma omp critical (trajectory)
+				{
+					if (attempt < accepted) {
+						accepted = attempt;
+						result.swap(traj);
+					}
+				}
+			}
+		}
+	}
+	if (mainRNG != NULL) {
+		getRNG().copyState(*mainRNG);
+		delete mainRNG;
+	}
+
+	if (except == 1)
+		throw ValueError(msg);
+	else if (except == 2)
+		throw IndexError(msg);
+	else if (except == 3)
+		throw RuntimeError(msg);
+	else if (except == 4)
+		throw Exception(msg);
+
+	if (accepted == maxAttempts) {
+		m_attempts = maxAttempts;
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+	m_attempts = accepted + 1;
+	// frequencies at the beginning of beginGen are not part of a forward trajectory
+	PyObject * traj = PyDict_New();
+	for (size_t i = forward ? 1 : 0; i < result.size(); ++i) {
+		long gen = forward ? beginGen + static_cast<long>(i) - 1 : endGen - static_cast<long>(i);
+		size_t numSP = result[i].size() / m_nLoci;
+		PyObject * freqList = PyList_New(numSP);
+		for (size_t sp = 0; sp < numSP; ++sp) {
+			PyObject * spFreq = PyList_New(m_nLoci);
+			for (size_t loc = 0; loc < m_nLoci; ++loc)
+				PyList_SET_ITEM(spFreq, loc, PyFloat_FromDouble(result[i][sp * m_nLoci + loc]));
+			PyList_SET_ITEM(freqList, sp, spFreq);
+		}
+		PyObject * key = PyInt_FromLong(gen);
+		PyDict_SetItem(traj, key, freqList);
+		Py_DECREF(key);
+		Py_DECREF(freqList);
+	}
+	return traj;
+}
+
+
+PyObject * TrajectoryEngine::simuForward(long beginGen, long endGen, const floatMatrix & beginFreq,
+                                         const floatMatrix & endFreq, size_t maxAttempts)
+{
+	PARAM_FAILIF(beginGen > endGen || endGen <= 0, ValueError,
+		"Beginning generation should be less than ending generation");
+	const matrixf & begin = beginFreq.elems();
+	vectorf freq;
+	for (size_t sp = 0; sp < begin.size(); ++sp) {
+		PARAM_FAILIF(begin[sp].size() != m_nLoci, ValueError,
+			"Initial frequency should be provided for each locus in each subpopulation.");
+		freq.insert(freq.end(), begin[sp].begin(), begin[sp].end());
+	}
+	PARAM_FAILIF(freq.empty(), ValueError, "Initial frequency should be provided for each locus in each subpopulation.");
+	const matrixf & ranges = endFreq.elems();
+	for (size_t i = 0; i < ranges.size(); ++i) {
+		PARAM_FAILIF(ranges[i].size() != 2, ValueError, "Please specify frequency range of each marker");
+	}
+	// check split and merge of subpopulations
+	size_t numSP = begin.size();
+	for (long gen = beginGen; gen <= endGen; ++gen) {
+		size_t nextSP = sizes(gen).size();
+		if (nextSP > numSP) {
+			PARAM_FAILIF(numSP != 1, RuntimeError, "Can only split from one subpopulation.");
+		} else if (nextSP < numSP) {
+			PARAM_FAILIF(nextSP != 1, RuntimeError, "Can only merge into one subpopulation");
+			PARAM_FAILIF(numSP != sizes(gen - 1).size(), RuntimeError,
+				"Subpopulation size and allele frequency mismatch.");
+		}
+		numSP = nextSP;
+	}
+	PARAM_FAILIF(ranges.size() != m_nLoci && ranges.size() != m_nLoci * numSP, ValueError,
+		"Please specify a frequency range for each locus");
+	return simulate(true, beginGen, endGen, freq, ranges, 0, 0, maxAttempts);
+}
+
+
+PyObject * TrajectoryEngine::simuBackward(long endGen, const floatMatrix & endFreq,
+                                          long minMutAge, long maxMutAge, size_t maxAttempts)
+{
+	PARAM_FAILIF(endGen <= 0, ValueError, "A positive ending generation is needed.");
+	const matrixf & end = endFreq.elems();
+	vectorf freq;
+	for (size_t sp = 0; sp < end.size(); ++sp) {
+		PARAM_FAILIF(end[sp].size() != m_nLoci, ValueError,
+			"Ending frequency should be provided for each locus in each subpopulation.");
+		freq.insert(freq.end(), end[sp].begin(), end[sp].end());
+	}
+	PARAM_FAILIF(freq.empty(), ValueError, "Ending frequency should be provided for each locus in each subpopulation.");
+	// check split and merge of subpopulations
+	size_t numSP = end.size();
+	long lastGen = endGen - maxMutAge - 1 > 0 ? endGen - maxMutAge - 1 : 0;
+	for (long gen = endGen; gen >= lastGen; --gen) {
+		size_t prevSP = sizes(gen - 1).size();
+		if (prevSP > numSP) {
+			PARAM_FAILIF(numSP != 1, RuntimeError, "Can only merge to one subpopulation");
+		} else if (prevSP < numSP) {
+			PARAM_FAILIF(prevSP != 1, ValueError, "Can only split from one subpopulation.");
+		}
+		numSP = prevSP;
+	}
+	return simulate(false, 0, endGen, freq, matrixf(), minMutAge, maxMutAge, maxAttempts);
+}
+
+
 // Global debug and initialization related functions
 
 void gsl_error_handler(const char * reason, const char *,
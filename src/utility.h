@@ -69,6 +69,8 @@ using std::find;
 using std::setw;
 
 #include <set>
+#include <list>
+#include <map>
 
 /// for ranr generator
 #include "gsl/gsl_sys.h"                                           // for floating point comparison
@@ -153,13 +155,30 @@ void checkRefCount();
  *  a number set by environmental variable \c OMP_NUM_THREADS.
  *  Second and third argument is to set the type or seed of existing random number generator using RNG \e name
  *  with \e seed. If using openMP, it sets the type or seed of random number
- *  generator of each thread.
+ *  generator of each thread. If a directory is given to \e storageDir, large
+ *  genotype and lineage arrays allocated afterwards are stored in temporary
+ *  files under this directory and mapped into memory, so that generations
+ *  that are not in use (e.g. ancestral generations) can be paged out to disk
+ *  instead of occupying RAM. Setting \e storageDir to an empty string
+ *  restores in-memory storage for newly allocated arrays. This feature is not
+ *  available under windows and for the mutant module. If \e rngStreams is set
+ *  to \c True, offspring generated by a homogeneous mating scheme are divided
+ *  into blocks of fixed size and each block draws random numbers from a
+ *  stream determined by the random seed, generation number, replicate,
+ *  subpopulation and index of its first offspring, so that results do not
+ *  depend on the number of threads used. Because individual IDs are assigned
+ *  in the order at which offspring are generated, mating schemes with an
+ *  \c IdTagger are not parallelized in this mode. Default to \c -1 (unchanged).
  */
-void setOptions(const int numThreads = -1, const char * name = NULL, unsigned long seed = 0);
+void setOptions(const int numThreads = -1, const char * name = NULL, unsigned long seed = 0,
+	const char * storageDir = NULL, const int rngStreams = -1);
 
 /// CPPONLY get number of thread in openMP
 UINT numThreads();
 
+/// CPPONLY return true if random number streams are used during mating
+bool useRNGStreams();
+
 /// CPPONLY return val and increase val by 1, ensuring thread safety
 ATOMICLONG fetchAndIncrement(ATOMICLONG * val);
 
@@ -215,11 +234,11 @@ ostream & operator<<(ostream & out, const pair<T1, T2> & pair)
 
 
 /// CPPONLY how to output any vector.
-template<class T>
-ostream & operator<<(ostream & out, const vector<T> & vec)
+template<class T, class A>
+ostream & operator<<(ostream & out, const vector<T, A> & vec)
 {
 	if (!vec.empty()) {
-		typename vector<T>::const_iterator it = vec.begin();
+		typename vector<T, A>::const_iterator it = vec.begin();
 		out << *it;
 		for (++it; it != vec.end(); ++it)
 			out << ", " << *it ;
@@ -345,7 +364,7 @@ public:
 	}
 
 
-	string arg(size_t arg) const
+	const string & arg(size_t arg) const
 	{
 		return m_args[arg];
 	}
@@ -449,6 +468,72 @@ private:
 };
 
 
+/** A bounded cache of values returned by a Python function for genotypes at
+ *  specified loci, and generation numbers if the function accepts parameter
+ *  \c gen. Least recently used values are removed when the cache is full.
+ *  Copies of a cache share values and statistics so that clones of an
+ *  operator use the same cache.
+ *  CPPONLY
+ */
+class genoValueCache
+{
+public:
+	typedef vector<ULONG> Key;
+
+	/// Create a cache of at most \e cacheSize values returned by \e func,
+	/// which can only accept parameters \c geno and \c gen if caching is
+	/// enabled (\e cacheSize > 0).
+	genoValueCache(const pyFunc & func, size_t cacheSize);
+
+	genoValueCache(const genoValueCache & rhs);
+
+	genoValueCache & operator=(const genoValueCache & rhs);
+
+	~genoValueCache();
+
+	/// if values are cached at all
+	bool enabled() const
+	{
+		return m_data->cacheSize > 0;
+	}
+
+
+	/// fill \e key with generation \e gen (if needed) and genotype \e geno
+	void setKey(Key & key, size_t gen, const vector<ULONG> & geno) const;
+
+	/// return cached values of \e key, or \c NULL if \e key is not cached
+	const vectorf * find(const Key & key) const;
+
+	/// cache \e values of \e key, remove the least recently used values if
+	/// the cache is full
+	void insert(const Key & key, const vectorf & values) const;
+
+	/// return a dictionary with numbers of hits and misses, number of cached
+	/// values and size of the cache
+	PyObject * stats() const;
+
+private:
+	typedef std::list<pair<Key, vectorf> > ValueList;
+	typedef std::map<Key, ValueList::iterator> ValueIndex;
+
+	struct cacheData
+	{
+		size_t refCount;
+		size_t cacheSize;
+		bool useGen;
+		// most recently used values are at the front
+		ValueList values;
+		ValueIndex index;
+		ULONG hits;
+		ULONG misses;
+	};
+
+	void release();
+
+	cacheData * m_data;
+};
+
+
 /// CPPONLY
 /// Remove circular references to release memory of objects that 
 /// are derived from PyObject
@@ -1103,10 +1188,26 @@ void PyObj_As_IntArray(PyObject * obj, vectori & val);
 void PyObj_As_SizeTArray(PyObject * obj, vectoru & val);
 
 /// CPPONLY
-PyObject * Allele_Vec_As_NumArray(GenoIterator begin, GenoIterator end);
+PyObject * Allele_Vec_As_NumArray(GenoIterator begin, GenoIterator end,
+                                  const vectoru & shape = vectoru());
 
 /// CPPONLY
-PyObject * Lineage_Vec_As_NumArray(LineageIterator begin, LineageIterator end);
+PyObject * Lineage_Vec_As_NumArray(LineageIterator begin, LineageIterator end,
+                                   const vectoru & shape = vectoru());
+
+/** CPPONLY Return a writable memoryview of doubles starting at \e begin,
+ *  with given \e shape and \e strides (in number of items) for each
+ *  dimension.
+ */
+PyObject * Info_Vec_As_NumArray(double * begin, const vectoru & shape, const vectoru & strides);
+
+/** CPPONLY Return a NumPy array with a copy of \e values in given \e shape.
+ *  A \c RuntimeError will be raised if NumPy is not available.
+ */
+PyObject * Vec_As_NumPyArray(const vectorf & values, const vectoru & shape);
+
+/// CPPONLY
+PyObject * Vec_As_NumPyArray(const vector<long> & values, const vectoru & shape);
 
 // ///////////////////////////////////////////////////////
 /** CPPONLY shared variables.
@@ -1210,6 +1311,9 @@ public:
 	///CPPONLY
 	PyObject * setVar(const string & name, const vectorf & val);
 
+	///CPPONLY
+	PyObject * setVar(const string & name, const matrixf & val);
+
 	///CPPONLY
 	PyObject * setVar(const string & name, const strDict & val);
 
@@ -1309,7 +1413,7 @@ SharedVariables & mainVars();
 SharedVariables & moduleVars();
 
 /// CPPONLY
-PyObject * pyPopObj(void * p);
+PyObject * pyPopObj(void * p, bool own = false);
 
 /// CPPONLY
 PyObject * pyIndObj(void * p);
@@ -1422,8 +1526,9 @@ public:
 	}
 
 
-	/// CPPONLY evaluate with PyObject* output
-	PyObject * evaluate() const;
+	/// CPPONLY evaluate with PyObject* output. Python errors are not printed
+	/// in debug mode if \e quiet is set to \c true.
+	PyObject * evaluate(bool quiet = false) const;
 
 	/// CPPONLY  return bool value
 	bool valueAsBool() const;
@@ -1440,6 +1545,20 @@ public:
 	/// CPPONLY  return array value
 	vectorf valueAsArray() const;
 
+	/** CPPONLY return names of variables referred to by the expression and
+	 *  statements, including names used in nested code blocks such as list
+	 *  comprehensions.
+	 */
+	vectorstr symbols() const;
+
+	/** CPPONLY collect names of variables that are read (\e loaded) and
+	 *  assigned (\e stored) by the expression and statements. Return
+	 *  \c false if the code modifies objects in place, accesses attributes
+	 *  or items, or imports modules, so that it might behave differently
+	 *  when variables are arrays instead of numbers.
+	 */
+	bool nameUsage(vectorstr & loaded, vectorstr & stored) const;
+
 private:
 	/// compile expression into byte code
 	void compileExpr(const string & expr);
@@ -1767,27 +1886,6 @@ void closeOutput(const string & output = string());
 // ////////////////////////////////////////////////////////////
 
 
-/// CPPONLY
-class RNG_func
-{
-public:
-	RNG_func(gsl_rng * rng) : m_RNG(rng)
-	{
-
-	}
-
-
-	unsigned long int operator()(unsigned long int N) const
-	{
-		return gsl_rng_uniform_int(m_RNG, N);
-	}
-
-
-private:
-	gsl_rng * m_RNG;
-};
-
-
 /** This random number generator class wraps around a number of random number
  *  generators from GNU Scientific Library. You can obtain and change the
  *  RNG used by the current simuPOP module through the \c getRNG() function,
@@ -1844,6 +1942,32 @@ public:
 	/// CPPONLY
 	static unsigned long generateRandomSeed();
 
+	/** CPPONLY
+	 *  Reseed the generator so that it generates a stream of random numbers
+	 *  determined by \e seed, generation \e gen, replicate \e rep,
+	 *  subpopulation \e subPop and index \e index. The reported seed of the
+	 *  generator is not changed.
+	 */
+	void setStream(unsigned long seed, ULONG gen, size_t rep, size_t subPop, size_t index);
+
+	/** Copy the state of another generator \e rhs of the same type so that
+	 *  the two generators produce the same sequence of random numbers
+	 *  afterward. This can be used to save and restore the state of a
+	 *  random number generator.
+	 *  <group>1-setup</group>
+	 */
+	void copyState(const RNG & rhs);
+
+	/** CPPONLY
+	 *  Return the number of times the state of the generator has been reset
+	 *  by \c setStream or \c copyState. Objects that cache random numbers
+	 *  use it to discard numbers generated from a previous stream.
+	 */
+	ULONG streamEpoch() const
+	{
+		return m_streamEpoch;
+	}
+
 
 	/** Generate a random number following a rng_uniform [0, 1) distribution.
 	 *  <group>3-rng</group>
@@ -1973,11 +2097,14 @@ public:
 	template<typename T>
 	void randomShuffle(T begin, T end) const
 	{
-		// use the STL random shuffle function but a GSL random number
-		// generator.
-		RNG_func rng(m_RNG);
-
-		std::random_shuffle(begin, end, rng);
+		// a sequential Fisher-Yates shuffle with a GSL random number
+		// generator. std::random_shuffle is not used because its parallel
+		// mode (_GLIBCXX_PARALLEL) produces results that depend on the
+		// number of threads.
+		if (begin == end)
+			return;
+		for (T it = begin + 1; it != end; ++it)
+			std::iter_swap(it, begin + gsl_rng_uniform_int(m_RNG, (it - begin) + 1));
 	}
 
 
@@ -1997,6 +2124,9 @@ private:
 	/// to reset a RNG when a new seed is set.
 	uint16_t m_bitByte;
 	UINT m_bitIndex;
+
+	/// number of times the generator has been reset to a stream
+	ULONG m_streamEpoch;
 };
 
 /// return the currently used random number generator
@@ -2483,6 +2613,105 @@ private:
 
 	/// current trial. Used when user want to access the table row by row
 	size_t m_cur;
+
+	/// stream epoch of the RNG used to generate the table
+	ULONG m_epoch;
+};
+
+
+/** A trajectory engine simulates trajectories of allele frequencies of one
+ *  or more unlinked diallelic loci in a diploid population, forward or
+ *  backward in time. It is the native engine used by class
+ *  \c TrajectorySimulator of module \c simuPOP.utils, which prepares
+ *  population sizes and fitness values from demographic and fitness functions
+ *  and wraps simulated frequencies into \c Trajectory objects. Attempts to
+ *  simulate a trajectory are run in parallel if multiple threads are used.
+ *  The accepted attempt depends on the number of threads unless random
+ *  number streams are enabled by <tt>setOptions(rngStreams=True)</tt>, in
+ *  which case each attempt uses its own stream of random numbers.
+ */
+class TrajectoryEngine
+{
+public:
+	/** Create a trajectory engine for \e nLoci unlinked loci. \e N is a list
+	 *  of subpopulation sizes at the beginning of generation \e firstGen and
+	 *  at the end of generations \e firstGen, \e firstGen + 1, and so on. The
+	 *  first and last items are used for generations before and after these
+	 *  generations. \e fitness can be a list of fitness values (\c 3,
+	 *  <tt>3*nLoci</tt> or <tt>3**nLoci</tt> values, see \c TrajectorySimulator
+	 *  for details) that is used for all generations and subpopulations, or a
+	 *  list of fitness values for each subpopulation at each generation,
+	 *  starting from generation \e firstGen, with the same number of items
+	 *  (the maximal number of subpopulations in \e N) for each generation.
+	 */
+	TrajectoryEngine(size_t nLoci, long firstGen, const intMatrix & N,
+		const floatMatrix & fitness);
+
+	/** Simulate a trajectory forward in time from allele frequencies
+	 *  \e beginFreq (a list of frequencies for each subpopulation) at the
+	 *  beginning of generation \e beginGen, until the end of generation
+	 *  \e endGen. A trajectory is accepted if frequencies at \e endGen fall
+	 *  into ranges \e endFreq, given for each locus in each subpopulation or
+	 *  for each locus in the whole population. Up to \e maxAttempts attempts
+	 *  are made, and a dictionary of frequencies of all subpopulations at
+	 *  each generation is returned for the first accepted attempt. \c None
+	 *  is returned if no trajectory is accepted.
+	 */
+	PyObject * simuForward(long beginGen, long endGen, const floatMatrix & beginFreq,
+		const floatMatrix & endFreq, size_t maxAttempts);
+
+	/** Simulate a trajectory backward in time from allele frequencies
+	 *  \e endFreq (a list of frequencies for each subpopulation) at the end
+	 *  of generation \e endGen, until alleles at all loci are lost. A
+	 *  trajectory is accepted if no allele gets fixed and if its length is
+	 *  between \e minMutAge and \e maxMutAge. Up to \e maxAttempts attempts
+	 *  are made, and a dictionary of frequencies of all subpopulations at
+	 *  each generation is returned for the first accepted attempt. \c None
+	 *  is returned if no trajectory is accepted.
+	 */
+	PyObject * simuBackward(long endGen, const floatMatrix & endFreq,
+		long minMutAge, long maxMutAge, size_t maxAttempts);
+
+	/** Return the number of attempts made by the last simulation.
+	 */
+	size_t attempts() const
+	{
+		return m_attempts;
+	}
+
+
+private:
+	const vectoru & sizes(long gen) const;
+
+	void getS(long gen, size_t sp, const double * freq, vectorf & s) const;
+
+	void getNextXt(const double * curXt, double * nextXt, size_t Nt, const vectorf & s) const;
+
+	void getPrevXt(const double * curXt, double * prevXt, size_t Nt, const vectorf & s) const;
+
+	bool simuForwardOnce(long beginGen, long endGen, const matrixf & endFreq,
+		vector<vectorf> & traj) const;
+
+	bool simuBackwardOnce(long endGen, long minMutAge, long maxMutAge,
+		vector<vectorf> & traj) const;
+
+	PyObject * simulate(bool forward, long beginGen, long endGen, const vectorf & freq,
+		const matrixf & endFreq, long minMutAge, long maxMutAge, size_t maxAttempts);
+
+private:
+	size_t m_nLoci;
+
+	long m_firstGen;
+
+	/// subpopulation sizes at the end of generation m_firstGen - 1 and later
+	vector<vectoru> m_N;
+
+	/// fitness values, either one row or m_maxSubPop rows per generation
+	matrixf m_fitness;
+
+	size_t m_maxSubPop;
+
+	size_t m_attempts;
 };
 
 
@@ -48,16 +48,19 @@ __all__ = [
     'TrajectorySimulator',
     'simulateBackwardTrajectory',
     'simulateForwardTrajectory',
+    'TreeSeqRecorder',
 ]
 
 import sys
 import time
+import heapq
 
 from simuOpt import simuOptions
 
 from simuPOP import moduleInfo, MALE, FEMALE, Population, PointMutator, getRNG,\
-    ALL_AVAIL, PyOperator, stat
+    ALL_AVAIL, PyOperator, stat, TrajectoryEngine
 import collections
+import collections.abc
 
 def viewVars(var, gui=None):
     '''
@@ -358,7 +361,7 @@ def saveCSV(pop, filename='', infoFields=[], loci=ALL_AVAIL, header=True,
                 raise ValueError("genoFormatter cannot be empty")
             value = list(genoFormatter.values())[0]
         else:
-            if not isinstance(genoFormatter, collections.Callable):
+            if not isinstance(genoFormatter, collections.abc.Callable):
                 raise ValueError("genoFormatter should be a None, a dictionary or a callable function")
             value = genoFormatter(tuple([pop.individual(0).allele(0, p) for p in range(ploidy)]))
         try:
@@ -861,6 +864,11 @@ class TrajectorySimulator:
     information about Trajectory simulation techniques and related controlled
     random mating scheme, please refer to the simuPOP user's guide, and Peng et
     al (PLoS Genetics 3(3), 2007).
+
+    Trajectories are simulated by a native ``TrajectoryEngine``, which runs
+    attempts in parallel if simuPOP is started with multiple threads. Use
+    ``setOptions(rngStreams=True)`` if simulated trajectories should not
+    depend on the number of threads.
     '''
 
     def __init__(self, N, nLoci=1, fitness=None, logger=None):
@@ -921,7 +929,7 @@ class TrajectorySimulator:
     def _Nt(self, gen):
         'Get Nt(gen) depending on the type of N'
         # _Nt() expects parameter gen
-        if isinstance(self.N, collections.Callable):
+        if callable(self.N):
             nt = self.N(gen)
             # the return value of a demographic function sometimes is not integer.
             if type(nt) in [int, int, float]:
@@ -932,391 +940,24 @@ class TrajectorySimulator:
             # a constant list
             return self.N
 
-    def _marginalFitness(self, fitness, freq):
-        '''Convert interaction fitness (3**n elements) to marginal fitness
-        (3*n elements) using given allele frequency. The marginal fitnesses
-        are calculated using formula:
-                f(X=Aa) = Sum_g P(Y=g) * f(X=Aa, Y=g)
-        where g is genotype at all other loci.
-        '''
-        assert len(freq) == 2
-        assert len(fitness) == 3 ** self.nLoci
-        s = [0] * (3 * self.nLoci)
-        # each locus
-        for loc in range(self.nLoci):
-            # each genotype AA, Aa and aa (geno is the number of disease allele)
-            for geno in range(3):
-                # iterate through OTHER DSL
-                allgeno = [0] * self.nLoci
-                # set myself
-                allgeno[loc] = geno
-                # iterate through genotype at other loci
-                f = 0.
-                for it in range(3**(self.nLoci - 1)):
-                    # assign allgeno, using it as a 3-based integer.
-                    num = it
-                    for l in range(self.nLoci):
-                        if l != loc:
-                            allgeno[l] = num % 3
-                            num /= 3
-                    # calculate P(Y=g) and f(X=Aa, Y=g)
-                    index = 0
-                    fq = 1.
-                    for i in range(len(allgeno)):
-                        if i != loc:
-                            if allgeno[i] == 0:
-                                fq *= (1 - freq[i]) * (1 - freq[i])
-                            elif allgeno[i] == 1:
-                                fq *= 2 * (1 - freq[i]) * freq[i]
-                            else:
-                                fq *= freq[i] * freq[i]
-                        # index is determined by genotype.
-                        index = index * 3 + allgeno[i]
-                    f += fitness[index] * fq
-                # sum over other genotype
-                s[loc * 3 + geno] = f
-            # convert to form 0, s1, s2
-            s[3 * loc + 1] = float(s[3 * loc + 1]) / s[3 * loc] - 1.
-            s[3 * loc + 2] = float(s[3 * loc + 2]) / s[3 * loc] - 1.
-            s[3 * loc] = 0.
-        return s
-
-    def _getS(self, gen, subPop, freq):
-        '''Get s1, s2 for subpopulation *subPop* at generation *gen*. If
-        self.fitness is a function, it is called with *gen* and *subPop* to get
-        a generation and subpopulation specific fitness value. The fitness
-        value is then translated to 0, s1, s2. If interactions are involved,
-        marginal fitness is calculated using allele frequency (``freq``) in
-        subpopulation *subPop*. 
-        '''
-        assert len(freq) == self.nLoci
-        # _fitness() expects parameters gen and a subpopulation index
-        if isinstance(self.fitness, collections.Callable):
-            fit = self.fitness(gen, subPop)
-        else:
-            fit = self.fitness
-        s = []
-        # simplest case when fitness only depends on gen if defined in fitness func:      
-        # case 1: 3x self.nLoci no interaction 
-        if len(fit) == 3 * self.nLoci:
-            for i in range(self.nLoci):
-                if fit[3 * i] == 0:
-                    raise ValueError('fitness['+ str(3 * i) + '] should be a non zero value.')
-                s.append(0.)
-                s.append(float(fit[3 * i + 1]) / float(fit[3 * i]) - 1.)
-                s.append(float(fit[3 * i + 2]) / float(fit[3 * i]) - 1.)
-        # case 2: same fitness for multiple loci
-        elif len(fit) == 3 and self.nLoci > 1:
-            if fit[0] == 0:
-                raise ValueError('fitness[0] should be a non zero value.')
-            s.append(0.)
-            s.append(float(fit[1]) / float(fit[0]) - 1.)
-            s.append(float(fit[2]) / float(fit[0]) - 1.)
-            s = s * self.nLoci
-        # case 3: 3**self.nLoci, interaction
-        elif len(fit) == 3**self.nLoci:
-            # from fitness list, get s using allele frequency
-            # Allele frequency for each subpopulation is passed and there will be
-            # different s for each subpopulation because different allele frequencies.
-            s.extend(self._marginalFitness(fit, freq))
-        else:
-            raise ValueError('Wrong length of list of fitness: ' + str(len(fit)))
-        return s
-
-    def _getNextXt(self, curXt, Nt, s):
-        '''Solve y from the formula and simulate allele frequencies in the next
-        generation. All parameters are assumed to be for one subpopulation. Nt
-        is the population size of at the end of the current generation (or the
-        next generation)'''
-        assert len(curXt) == self.nLoci
-        assert type(Nt) not in [type(()), type([])]
-        it = []
-        xt = []
-        for loc in range(self.nLoci):
-            # if current allele freq in subpop sp at locus loc has already been 0 or 1,
-            # set it to be 0 or 1 for next gens
-            x = curXt[loc]
-            if x in [0, 1]:
-                xt.append(x)
-                continue
-            s1 = s[3 * loc + 1]
-            s2 = s[3 * loc + 2]
-            # with s1 and s2 on hand, calculate freq at the next generation
-            y = x * (1 + s2 * x + s1 * (1 - x)) / (1 + s2 * x * x + 2 * s1 * x * (1 - x))
-            # y is obtained, is the expected allele frequency for the next generation t+1
-            it = getRNG().randBinomial(2 * Nt, y)
-            xt.append(float(it) / (2 * Nt))
-        return xt
-
-    def _getPrevXt(self, curXt, Nt, s):
-        '''Solve y from the backward formula and simulate allele frequencies in
-        the previous generation. All parameters are assumed to be for one
-        subpopulation. Nt is the population size at the begining of the current
-        generation, e.g. the population size at the previous generation.
+    def _engine(self, firstGen, lastGen):
+        '''Return a native ``TrajectoryEngine`` with population sizes at the
+        beginning of generation *firstGen* and at the end of generations
+        *firstGen* to *lastGen*, and fitness values at these generations.
         '''
-        assert type(Nt) not in [type(()), type([])]
-        assert len(curXt) == self.nLoci
-        #
-        # given x(t)
-        # calculate y=x(t-1)' by solving an equation
-        #
-        # x_t = y(1+s2 y+s1 (1-y))/(1+s2 y+2 s1 Y(1-y))
-        it = []
-        xt = []
-        for loc in range(self.nLoci):
-            x = curXt[loc]
-            # if current allele freq in subpop sp at locus loc has already been 0,
-            # it to be 0 for previous gens
-            if x == 0:
-                xt.append(x)
-                continue
-            # if current allele freq in subop sp is 1, we assume that it just reaches
-            # here by losing one allele
-            if x == 1:
-                xt.append(float(2 * Nt - 1) / (2 * Nt))
-                continue
-            # In the interaction case, s1, s2 will be different
-            # from subpopulation to subpopulation.
-            s1 = s[3 * loc + 1]
-            s2 = s[3 * loc + 2]
-            # with s1 and s2 on hand, calculate freq at the previous generation
-            if s1 == 0 and s2 == 0:
-                # special case when a = 0
-                y = x
-            else:
-                a = s2 * x - 2 * s1 * x - s2 + s1
-                b = 2 * s1 * x - 1 - s1
-                c = float(x)
-                b2_4ac = b * b - 4 * a * c
-            
-                if abs(a) < 1e-8:
-                    y1 = float(-c) / float(b)
-                    # y1 should be valid
-                    y2 = 1000.
-                else:
-                    y1 = (-b + b2_4ac**0.5) / (2 * a)
-                    y2 = (-b - b2_4ac**0.5) / (2 * a)
-                #
-                # choose one of the solutions
-                if y1 >= 0 or y1 <= 1:
-                     y = y2
-                else:
-                     y = y1
-            # y is obtained, is the expected allele frequency for the previous generation t-1
-            it = getRNG().randBinomial(int(2 * Nt), y)
-            xt.append(float(it) / (2 * Nt))
-        return xt
+        N = [[int(x) for x in self._Nt(gen)] for gen in range(firstGen - 1, lastGen + 1)]
+        if not callable(self.fitness):
+            return TrajectoryEngine(self.nLoci, firstGen, N, [self.fitness])
+        # fitness values of all subpopulations that exist at the beginning or
+        # at the end of each generation
+        maxSP = max([len(x) for x in N])
+        fitness = []
+        for gen in range(firstGen, lastGen + 1):
+            numSP = max(len(N[gen - firstGen]), len(N[gen - firstGen + 1]))
+            fit = [self.fitness(gen, sp) for sp in range(numSP)]
+            fitness.extend(fit + [fit[0]] * (maxSP - numSP))
+        return TrajectoryEngine(self.nLoci, firstGen, N, fitness)
 
-    def _simuForward(self, freq, endFreq, beginGen, endGen):
-        '''Simulates a trajectory froward in time, starting from frequency
-        ``freq`` at generation ``beginGen`` to frequency ranges specified in
-        ``endFreq`` at generation ``endGen``. During the evolution, multiple
-        subpopulations can be merged into one, and one population can be split
-        into several subpopulations. The number of subpopulation is determined
-        by the demographic function. The function returns the ending allele
-        frequency if the simulated Trajectory does not fall into ``destFeq``,
-        and a ``Trajectory`` object otherwise.
-        '''
-        # initialize a trajectory
-        # freq is assumed to be at the beginning of the beginGen.
-        # so we do not it does not count into the Trajectory.
-        xt = Trajectory(endGen = endGen, nLoci = self.nLoci)
-        # go through each generation
-        for gen in range(beginGen, endGen + 1):
-            # first get beginXt, N(t+1), then calculate nextXt.
-            if gen == beginGen:
-                beginXt = freq
-            else:
-                # current Xt is the frequency at the previous generation.
-                beginXt = xt._freq(gen - 1)
-            # _Ne(gen) is the population size at the end of this generation.
-            Nt = self._Nt(gen)
-            #
-            if len(Nt) > len(beginXt):
-                # split (forward sense) from one population to nSP subpopulations
-                if len(beginXt) != 1:
-                    raise RuntimeError('Can only split from one subpopulation.')
-                #
-                # get NextXt using one subpopulation, then split...
-                tmpXt = self._getNextXt(beginXt[0], sum(Nt), self._getS(gen, 0, beginXt[0]))
-                # split tmpXt to multiple subpopulations and assign endingXt.
-                # here we assume a multi-nomial distribution of disease alleels.
-                endingXt = [[0]*self.nLoci for x in Nt]
-                p = [float(x) / sum(Nt) for x in Nt]
-                for loc in range(self.nLoci):
-                    it = getRNG().randMultinomial(int(tmpXt[loc]*sum(Nt)), p)
-                    for sp in range(len(Nt)):
-                        endingXt[sp][loc] = float(it[sp]) / Nt[sp]
-            elif len(Nt) < len(beginXt):
-                # check length of next Nt.
-                if len(Nt) != 1:
-                    raise RuntimeError('Can only merge into one subpopulation')
-                # merge (forward sense) from multiple subpopulations to one pop.
-                Nt_prev = self._Nt(gen - 1)
-                if len(beginXt) != len(Nt_prev):
-                    raise RuntimeError('Subpopulation size and allele frequency mismatch.')
-                Nt_tmp = [int(x * 1.0 / sum(Nt_prev) * Nt[0]) for x in Nt_prev]
-                #
-                endingXt = [[0] * self.nLoci]
-                for sp in range(len(Nt_prev)):
-                    # simulate frequency in each subpopulation
-                    tmpXt = self._getNextXt(beginXt[sp], Nt_tmp[sp], self._getS(gen, sp, beginXt[sp]))
-                    # and accumulate alleles in the final merged frequency
-                    for loc in range(self.nLoci):
-                        endingXt[0][loc] += tmpXt[loc] * Nt_tmp[sp] / Nt[0]
-            else:
-                endingXt = [self._getNextXt(beginXt[sp], Nt[sp], self._getS(gen, sp, beginXt[sp]))
-                    for sp in range(len(Nt))]
-            #
-            assert len(endingXt) == len(Nt)
-            # set frequency at the end of this generation
-            #if self.logger:
-            #    self.logger.debug('Gen=%d, xt=%s'  % (gen, endingXt))           
-            xt._setFreq(endingXt, gen)
-            # and now we go to the next generation...
-        # not we have a trajectory... is it valid?
-        freq = xt._freq(endGen)
-        Nt = self._Nt(endGen)
-        for loc in range(self.nLoci):
-            # case 1: allele frequency at each subpopulation
-            if len(endFreq) == self.nLoci * len(Nt):
-                for sp in range(len(Nt)):
-                    if freq[sp][loc] < endFreq[sp * self.nLoci + loc][0] or \
-                        freq[sp][loc] > endFreq[sp * self.nLoci + loc][1]:
-                        if self.logger:
-                            self.logger.debug('Forward Trajectory restarted, hitting allele requency ' + str(freq))
-                        return freq
-            # case 2: combined allele frequency
-            else:
-                allFreq = 0
-                for sp in range(len(Nt)):
-                    allFreq += freq[sp][loc] * Nt[sp]
-                allFreq /= sum(Nt)
-                if allFreq < endFreq[loc][0] or allFreq > endFreq[loc][1]:
-                    if self.logger:
-                        self.logger.debug('Forward Trajectory restarted, hitting allele frequency %s (combined %.3f)' \
-                            % (freq, allFreq))
-                    return allFreq
-        if self.logger:
-            self.logger.info('Forward Trajectory succeed, hitting allele frequency ' + str(freq))
-        return xt
-
-    def _avgOfNestedList(self, value):
-        '''Take average of each element of a nested list of the same shape. For
-        example, _avgOfNestedList([[1,[2,3]], [2,[3,4]]]) would return
-        [1.5, [2.5, 3.5]]. This is used to return summary statistics of failed
-        attempts.
-        '''
-        if len(value) == 0:
-            return []
-        if type(value[0]) in [type(()), type([])]:
-            avg = []
-            for i in range(len(value[0])):
-                avg.append(self._avgOfNestedList([val[i] for val in value]))
-        else:
-            return float(sum(value)) / len(value)
-        return avg
-
-    def _simuBackward(self, endGen, freq, minMutAge, maxMutAge):
-        '''Simulates a trajectory backward from allele frequency ``freq`` at
-        generation ``endGen``. During the evolution, multiple subpopulations can
-        be merged into one, and one population can be split into several
-        subpopulations. The number of subpopulation is determined by the
-        demographic function. If a simulated Trajectory is shorter than
-        ``minMutAge`` or is longer than ``maxMutAge``, the function will raise
-        an exception.
-        '''
-        if endGen <= 0:
-            raise ValueError("A positive ending generation is needed.")
-        # done[i] is used to track at which generation a trajectory
-        # is successfully generated at locus i.
-        done = [False] * self.nLoci
-        # initialize a trajectory
-        xt = Trajectory(endGen=endGen, nLoci = self.nLoci)
-        # because freq is the allele frequency at the end of the last generation,
-        # it is part of the Trajectory.
-        xt._setFreq(freq, gen=endGen)
-        # start from endGen, go backward.
-        for gen in range(endGen, -1, -1):
-            # first get curXt, N(t-1), then calculate prevXt
-            endingXt = xt._freq(gen)
-            # Nt is the size at the beginning of the current generation.
-            Nt = self._Nt(gen - 1)
-            Nt_end = self._Nt(gen)
-            if len(Nt) > len(endingXt):
-                if len(endingXt) != 1:
-                    raise RuntimeError('Can only merge to one subpopulation')
-                # merge (forward sense)
-                tmpXt = self._getPrevXt(endingXt[0], sum(Nt), self._getS(gen, 0, endingXt[0]))
-                assert len(tmpXt) == self.nLoci
-                # SPLIT tmpXt to multiple subpopulations and assign an expanded beginXt.
-                beginXt = [[0]*self.nLoci for x in Nt]
-                p = [float(x)/sum(Nt) for x in Nt]
-                for loc in range(self.nLoci):
-                    it = getRNG().randMultinomial(int(tmpXt[loc]*sum(Nt)), p)
-                    beginXt[sp][loc] = float(it[sp]) / Nt[sp]
-            elif len(Nt) < len(endingXt):
-                # check length of previous Nt.
-                if len(Nt) != 1:
-                    raise ValueError('Can only split from one subpoplation.')
-                # split (forward sense)
-                Nt_tmp = [int(float(x) / sum(Nt_end) * Nt[0]) for x in Nt_end]
-                beginXt = [[0] * self.nLoci]
-                for sp in range(len(Nt)):
-                    tmpXt = self._getPrevXt(endingXt[sp], Nt_tmp[sp], self._getS(gen, sp, endingXt[sp]))
-                    for loc in range(self.nLoci):
-                        beginXt[0][loc] += tmpXt[loc] * Nt_tmp[sp] / Nt[0]
-            else:
-                beginXt = [self._getPrevXt(endingXt[sp], Nt[sp], self._getS(gen, sp, endingXt[sp]))
-                    for sp in range(len(Nt))]
-            #
-            assert len(beginXt) == len(Nt)
-            # set frequency at the end of this generation
-            if self.logger:
-                self.logger.debug('Gen=%d, xt=%s'  % (gen - 1, beginXt)) 
-            #
-            xt._setFreq(beginXt, gen - 1)
-            # check all loci and see if beginXt is 0
-            for loc in range(self.nLoci):
-                doneSP = [False] * len(Nt)
-                if done[loc]:
-                    continue
-                # loop over subpopulation
-                for sp in range(len(Nt)):
-                    if (len(Nt_end) == 1 and endingXt[0][loc] == 0.) or \
-                        (len(Nt_end) > 1 and endingXt[sp][loc] == 0.):
-                        # already done in a previous generation
-                        doneSP[sp] = True
-                        continue
-                    if beginXt[sp][loc] == 0.:
-                        # success
-                        doneSP[sp] = True
-                        if endGen - gen < minMutAge:
-                            if self.logger:
-                                self.logger.debug('Backward failed - Trajectory too short. gen = %d subPop=%d locus = %d' \
-                                    % (gen, sp, loc))
-                            return (gen, beginXt)
-                        if self.logger:
-                            self.logger.debug('Backward success: gen = %d subPop=%d locus = %d' % (gen, sp, loc))
-                        break
-                    elif beginXt[sp][loc] == 1: # fixed
-                        if self.logger:
-                            self.logger.debug('Backward failed - allele gets fixed. gen = %d subPop=%d locus = %d' \
-                                    % (gen, sp, loc))
-                        return (gen, beginXt)
-                if False not in doneSP:
-                    done[loc] = True
-            if False not in done:
-                # success
-                if self.logger:
-                    self.logger.info('Backward Trajectory succeded at gen = %d' % gen)
-                return xt
-            # go back gen == 0 and not successful, or if the Trajectory is too long
-            if gen == 0 or gen + self.maxMutAge < endGen:
-                if self.logger:
-                    self.logger.debug('Backward failed - Trajectory too long. gen = %d' % gen)
-                return (gen, beginXt)
-            
     def simuForward(self, beginGen, endGen, beginFreq, endFreq, maxAttempts=10000):
         '''Simulate trajectories of multiple disease susceptibility loci using a
         forward time approach. This function accepts allele frequencies of
@@ -1355,8 +996,8 @@ class TrajectorySimulator:
         Trajectory is found after ``maxAttempts`` attemps.
         '''
         #
-        # This functin wraps around _simuForward. It handles parameter
-        # validation and maxAttempts.
+        # This function validates parameters and simulates trajectories with
+        # a native TrajectoryEngine.
         #
         # endGen
         if not beginGen <= endGen or endGen <= 0:
@@ -1391,23 +1032,18 @@ class TrajectorySimulator:
                 raise ValueError('Please specify frequency range of each marker')
             if rng[0] > rng[1]:
                 raise ValueError('Invalid frequency range %f - %f' % (rng[0], rng[1]))
-        failedFreq = []
-        for failedCount in range(maxAttempts):
-            xt = self._simuForward(freq, endFreq, beginGen, endGen)
-            if isinstance(xt, Trajectory):
-                if self.logger:
-                    self.logger.info('Simulation succeed after %d attempts with average ending frequencies %s.' \
-                        % (failedCount, self._avgOfNestedList(failedFreq)))
-                return xt
-            else:
-                failedFreq.append(xt)
+        engine = self._engine(beginGen, endGen)
+        traj = engine.simuForward(beginGen, endGen, freq, endFreq, maxAttempts)
+        if traj is None:
+            if self.logger:
+                self.logger.info('Simulation failed after %d attempts' % maxAttempts)
+            return None
+        xt = Trajectory(endGen=endGen, nLoci=self.nLoci)
+        xt.traj = traj
         if self.logger:
-            self.logger.debug('Ending frequencies:')
-            for freq in failedFreq:
-                self.logger.debug('    ' + str(freq))
-            self.logger.info(('Simulation failed after %d attempts with average frequencies ' % failedCount) \
-                + str(self._avgOfNestedList(failedFreq)))
-        return None
+            self.logger.info('Forward Trajectory succeeded after %d attempts, hitting allele frequency %s' \
+                % (engine.attempts(), traj[endGen]))
+        return xt
     
     def simuBackward(self, endGen, endFreq, minMutAge=None, maxMutAge=None,
         maxAttempts = 1000):
@@ -1428,8 +1064,8 @@ class TrajectorySimulator:
         ``None`` if no valid Trajectory is found after ``maxAttempts`` attemps.
         '''
         #
-        # This functin wraps around _simuBackward. It handles parameter
-        # validation and maxAttempts.
+        # This function validates parameters and simulates trajectories with
+        # a native TrajectoryEngine.
         #
         if endGen <= 0:
             raise ValueError('A positive ending generation number is expected.')
@@ -1449,7 +1085,7 @@ class TrajectorySimulator:
         
         if not self.maxMutAge >= self.minMutAge:
             raise ValueError('maxMutAge should >= minMutAge')
-        if endGen == 0 and (isinstance(self.N, collections.Callable) or isinstance(self.fitness, collections.Callable)):
+        if endGen == 0 and (callable(self.N) or callable(self.fitness)):
             raise ValueError('endGen should be > 0 if N or fitness is defined in the form of function')
         if endGen > 0 and endGen < self.maxMutAge:
             raise ValueError('endGen should be >= maxMutAge')
@@ -1469,23 +1105,19 @@ class TrajectorySimulator:
         else:
             raise ValueError("Invalid ending frequency list")
         #
-        failedFreq = []
-        for failedCount in range(maxAttempts):
-            xt = self._simuBackward(endGen, freq, self.minMutAge, self.maxMutAge)
-            if isinstance(xt, Trajectory):
-                if self.logger:
-                    self.logger.info(('Simulation succeeded after %d attempts with average generation and frequencies' \
-                        % failedCount) + str(self._avgOfNestedList(failedFreq)))
-                return xt
-            else:
-                failedFreq.append(xt)
+        engine = self._engine(max(0, endGen - self.maxMutAge - 1), endGen)
+        traj = engine.simuBackward(endGen, freq, self.minMutAge, self.maxMutAge,
+            maxAttempts)
+        if traj is None:
+            if self.logger:
+                self.logger.info('Simulation failed after %d attempts' % maxAttempts)
+            return None
+        xt = Trajectory(endGen=endGen, nLoci=self.nLoci)
+        xt.traj = traj
         if self.logger:
-            self.logger.debug('Beginning generation and frequencies:')
-            for freq in failedFreq:
-                self.logger.debug('    ' + str(freq))
-            self.logger.info(('Simulation failed after %d attempts with average starting generation and frequencies ' % failedCount) \
-                + str(self._avgOfNestedList(failedFreq)))
-        return None
+            self.logger.info('Backward Trajectory succeeded at gen = %d after %d attempts' \
+                % (min(traj.keys()) + 1, engine.attempts()))
+        return xt
 
 
 def simulateForwardTrajectory(N, beginGen, endGen, beginFreq, endFreq, nLoci=1,
@@ -1526,6 +1158,248 @@ def simulateBackwardTrajectory(N, endGen, endFreq, nLoci=1, fitness=None,
     return TrajectorySimulator(N, nLoci, fitness, logger).simuBackward(
         endGen, endFreq, minMutAge, maxMutAge, maxAttempts)
 
+class TreeSeqRecorder:
+    '''A ``TreeSeqRecorder`` records the inheritance of chromosome segments
+    from parents to offspring during evolution, and keeps the genealogy of a
+    population as a table of nodes (haploid genomes) and a table of edges
+    (segments inherited by a child node from a parent node). Because neutral
+    mutations can be added to the genealogy after the simulation (member
+    function ``mutate``), a long neutral region can be simulated with a few
+    markers, and the memory and time used by the recorder grow with the size
+    of the genealogy instead of the number of loci times the number of
+    generations.
+
+    The recorder is used as the output of a ``Recombinator`` with parameter
+    ``infoFields`` set to the field with unique IDs of individuals, which
+    writes recombination events of each offspring to the recorder. Member
+    function ``simplify`` should be called periodically (e.g. from a
+    ``PyOperator``) to remove nodes and edges that are not ancestral to the
+    present population. For example::
+
+        pop = Population(1000, loci=100, infoFields='ind_id')
+        rec = TreeSeqRecorder(pop)
+        pop.evolve(
+            initOps=[InitSex(), IdTagger()],
+            matingScheme=RandomMating(ops=[IdTagger(),
+                Recombinator(rates=0.001, infoFields='ind_id', output=rec)]),
+            postOps=PyOperator(rec.simplify, step=50),
+            gen=500
+        )
+        rec.simplify(pop)
+        rec.mutate(rate=1e-3)
+        rec.dump('tables')
+
+    Positions on the genome are measured by loci indexes so that locus ``i``
+    covers interval ``[i, i+1)`` of a sequence of length ``pop.totNumLoci()``.
+    All chromosomes are treated as autosomes and the recorder works only for
+    diploid populations. Because recombination events have to be written one
+    offspring at a time, offspring are not generated in parallel when the
+    recorder is used.
+    '''
+    def __init__(self, pop, idField='ind_id'):
+        '''Create a recorder for population *pop*, whose individuals become
+        the founders of the genealogy. Individuals should have unique IDs
+        stored in information field *idField* (default to ``ind_id``), which
+        should also be the information field of the ``Recombinator`` that
+        writes to this recorder.
+        '''
+        if pop.ploidy() != 2:
+            raise ValueError('TreeSeqRecorder only works for diploid populations')
+        self.idField = idField
+        self.seqLength = pop.totNumLoci()
+        # birth generation of nodes, counted forward from the founders
+        self.nodeGen = []
+        # edges as (left, right, parent, child)
+        self.edges = []
+        # the first of the two nodes of each individual
+        self.indNodes = {}
+        self.samples = []
+        self.mutations = []
+        self._lastID = None
+        for ind in pop.individuals():
+            self._addIndividual(int(ind.info(idField)), 0)
+
+    def _addIndividual(self, ID, gen):
+        if ID in self.indNodes:
+            raise ValueError('Individual with ID %d is recorded more than once. '
+                'Please use an IdTagger to assign unique IDs to offspring.' % ID)
+        self.indNodes[ID] = len(self.nodeGen)
+        self.nodeGen.extend([gen, gen])
+
+    def __call__(self, msg):
+        '''Record recombination events written by a ``Recombinator``. Each
+        line is in the format of ``offspring_id parent_id starting_ploidy
+        loc1 loc2 ...``, and the first and second lines of an offspring
+        describe its first and second homologous copies of chromosomes.'''
+        for line in msg.split('\n'):
+            if not line:
+                continue
+            fields = [int(x) for x in line.split()]
+            offID, parID, curCp = fields[:3]
+            try:
+                parNode = self.indNodes[parID]
+            except KeyError:
+                raise ValueError('Parent with ID %d is not recorded' % parID)
+            if offID == self._lastID:
+                offNode = self.indNodes[offID] + 1
+                # offspring are one generation younger than both parents
+                gen = max(self.nodeGen[offNode], self.nodeGen[parNode] + 1)
+                self.nodeGen[offNode - 1] = self.nodeGen[offNode] = gen
+                self._lastID = None
+            else:
+                self._addIndividual(offID, self.nodeGen[parNode] + 1)
+                offNode = self.indNodes[offID]
+                self._lastID = offID
+            left = 0
+            for loc in fields[3:]:
+                # recombination after locus loc
+                if loc + 1 >= self.seqLength:
+                    break
+                if loc + 1 > left:
+                    self.edges.append((left, loc + 1, parNode + curCp, offNode))
+                    left = loc + 1
+                curCp = 1 - curCp
+            self.edges.append((left, self.seqLength, parNode + curCp, offNode))
+
+    def simplify(self, pop):
+        '''Simplify the genealogy so that it contains only individuals in the
+        present generation of population *pop*, which become samples of the
+        genealogy, and nodes and edges that are ancestral to them. Nodes that
+        are ancestral to only one node are removed, and edges are merged
+        whenever possible. Mutations added by ``mutate`` are discarded. This
+        function returns ``True`` so it can be called by a ``PyOperator``.
+        '''
+        # nodes of samples come first in the simplified tables
+        nodeMap = {}
+        newGen = []
+        ancestry = {}
+        indNodes = {}
+        for ind in pop.individuals():
+            ID = int(ind.info(self.idField))
+            if ID in indNodes:
+                continue
+            try:
+                node = self.indNodes[ID]
+            except KeyError:
+                raise ValueError('Individual with ID %d is not recorded' % ID)
+            indNodes[ID] = len(newGen)
+            for n in (node, node + 1):
+                nodeMap[n] = len(newGen)
+                newGen.append(self.nodeGen[n])
+                ancestry[n] = [(0, self.seqLength, nodeMap[n])]
+        #
+        edgesOfParent = collections.defaultdict(list)
+        for edge in self.edges:
+            edgesOfParent[edge[2]].append(edge)
+        newEdges = []
+        # children are processed before their parents
+        for parent in sorted(edgesOfParent, key=lambda x: -self.nodeGen[x]):
+            segs = []
+            for left, right, p, child in edgesOfParent[parent]:
+                for l, r, node in ancestry.get(child, []):
+                    if r > left and l < right:
+                        segs.append((max(l, left), min(r, right), node))
+            if not segs:
+                continue
+            heapq.heapify(segs)
+            isSample = parent in nodeMap
+            outNode = nodeMap[parent] if isSample else None
+            # intervals of segments inherited by each child node
+            inherited = collections.defaultdict(list)
+            segments = []
+            while segs:
+                left = segs[0][0]
+                overlap = []
+                while segs and segs[0][0] == left:
+                    overlap.append(heapq.heappop(segs))
+                right = min(x[1] for x in overlap)
+                if segs:
+                    right = min(right, segs[0][0])
+                if len(overlap) == 1 and not isSample:
+                    # the segment is passed through an unary node
+                    segments.append((left, right, overlap[0][2]))
+                else:
+                    # a coalescence (or a sample) creates a node
+                    if outNode is None:
+                        outNode = len(newGen)
+                        nodeMap[parent] = outNode
+                        newGen.append(self.nodeGen[parent])
+                    segments.append((left, right, outNode))
+                    for x in overlap:
+                        intervals = inherited[x[2]]
+                        if intervals and intervals[-1][1] == left:
+                            intervals[-1][1] = right
+                        else:
+                            intervals.append([left, right])
+                for x in overlap:
+                    if x[1] > right:
+                        heapq.heappush(segs, (right, x[1], x[2]))
+            for child, intervals in inherited.items():
+                for left, right in intervals:
+                    newEdges.append((left, right, outNode, child))
+            if isSample:
+                ancestry[parent] = [(0, self.seqLength, outNode)]
+            else:
+                # merge adjacent segments of the same node
+                merged = []
+                for seg in segments:
+                    if merged and merged[-1][2] == seg[2] and merged[-1][1] == seg[0]:
+                        merged[-1] = (merged[-1][0], seg[1], seg[2])
+                    else:
+                        merged.append(seg)
+                ancestry[parent] = merged
+        self.nodeGen = newGen
+        self.edges = newEdges
+        self.indNodes = indNodes
+        self.samples = list(range(2 * len(indNodes)))
+        self.mutations = []
+        self._lastID = None
+        return True
+
+    def mutate(self, rate):
+        '''Add neutral mutations under an infinite-sites model to the edges
+        of the genealogy, with a mutation *rate* per unit length (locus) per
+        generation. Mutations are placed at random positions of the segment of
+        each edge, with a number that follows a Poisson distribution with
+        mean ``rate * (right - left) * (number of generations)``. This
+        function should be called after the final ``simplify``.
+        '''
+        rng = getRNG()
+        mutations = []
+        for left, right, parent, child in self.edges:
+            length = self.nodeGen[child] - self.nodeGen[parent]
+            for i in range(rng.randPoisson(rate * (right - left) * length)):
+                mutations.append((left + rng.randUniform() * (right - left), child))
+        mutations.sort()
+        self.mutations = mutations
+
+    def dump(self, filename):
+        '''Write nodes, edges, sites and mutations of the genealogy to files
+        ``filename_nodes.txt``, ``filename_edges.txt``, ``filename_sites.txt``
+        and ``filename_mutations.txt`` in the text format of the ``tskit``
+        package, which can be loaded with ``tskit.load_text``. Time of nodes
+        is measured in generations before the youngest node.
+        '''
+        maxGen = max(self.nodeGen) if self.nodeGen else 0
+        samples = set(self.samples)
+        with open(filename + '_nodes.txt', 'w') as nodes:
+            nodes.write('is_sample\ttime\n')
+            for node, gen in enumerate(self.nodeGen):
+                nodes.write('%d\t%d\n' % (node in samples, maxGen - gen))
+        with open(filename + '_edges.txt', 'w') as edges:
+            edges.write('left\tright\tparent\tchild\n')
+            for edge in sorted(self.edges, key=lambda x: (-self.nodeGen[x[2]], x[2], x[3], x[0])):
+                edges.write('%d\t%d\t%d\t%d\n' % edge)
+        with open(filename + '_sites.txt', 'w') as sites:
+            sites.write('position\tancestral_state\n')
+            for pos, node in self.mutations:
+                sites.write('%.8f\t0\n' % pos)
+        with open(filename + '_mutations.txt', 'w') as mutations:
+            mutations.write('site\tnode\tderived_state\n')
+            for site, (pos, node) in enumerate(self.mutations):
+                mutations.write('%d\t%d\t1\n' % (site, node))
+
+
 #
 # STRUCTURE format (no import yet)
 #
@@ -2408,7 +2282,7 @@ class CSVExporter:
                 colPerGenotype = 1 if type(value) in [type(''), type(1), type(1)] else len(value)
                 _genoFunc = self._genoFromDict
             else:
-                if not isinstance(self.genoFormatter, collections.Callable):
+                if not isinstance(self.genoFormatter, collections.abc.Callable):
                     raise ValueError("genoFormatter should be a None, a dictionary or a callable function")
                 value = self.genoFormatter(tuple([pop.individual(0).allele(0, p) for p in range(ploidy)]))
                 colPerGenotype = 1 if type(value) in [type(''), type(1), type(1)] else len(value)
@@ -3003,7 +2877,7 @@ class Exporter(PyOperator):
             with open(output.lstrip('>'), mode) as out:
                 self.exporter.export(pop, out.write,
                     self._determineSubPops(pop), self.infoFields, gui=self.gui)
-        elif isinstance(self.output, collections.Callable):
+        elif isinstance(self.output, collections.abc.Callable):
             # it is a regular python function, call it with output
             if bin_mode:
                 self.exporter.export(pop, _binaryWriter(self.output),
@@ -10,7 +10,7 @@
 # $LastChangedDate$
 #
   
-import unittest, os, sys, random, copy
+import unittest, os, sys, random, copy, time
 from simuOpt import setOptions
 setOptions(quiet=True)
 new_argv = []
@@ -197,6 +197,75 @@ class TestPopulation(unittest.TestCase):
         self.assertEqual(len(arr), pop.genoSize()*pop.subPopSize(1))
         self.assertRaises(IndexError, pop.genotype, 2)
 
+    def testGenotypeBuffer(self):
+        'Testing access to genotype and lineage through the buffer interface'
+        import numpy as np
+        pop = Population(loci=[3, 4], size=[5, 8])
+        initGenotype(pop, freq=[.2, .3, .5])
+        if moduleInfo()['alleleType'] in ['binary', 'mutant']:
+            self.assertRaises(BufferError, memoryview, pop.genotype())
+            return
+        geno = np.asarray(pop.genotype())
+        self.assertEqual(geno.shape, (13, 2, 7))
+        self.assertFalse(geno.flags['OWNDATA'])
+        self.assertEqual(list(geno.ravel()), list(pop.genotype()))
+        self.assertEqual(np.asarray(pop.genotype(1)).shape, (8, 2, 7))
+        self.assertEqual(list(geno[6, 1]), list(pop.individual(6).genotype(1)))
+        # writes are reflected in the population
+        geno[6, 1, 4] = 3
+        self.assertEqual(pop.individual(6).allele(4, 1), 3)
+        np.asarray(pop.genotype(1))[:] = 1
+        self.assertEqual(list(pop.genotype(1)), [1] * (8 * 14))
+        # individual genotype
+        self.assertEqual(np.asarray(pop.individual(0).genotype()).shape, (2, 7))
+        self.assertEqual(np.asarray(pop.individual(0).genotype(1, 1)).shape, (4,))
+        # slices are one-dimensional
+        self.assertEqual(memoryview(pop.genotype()[2:5]).shape, (3,))
+        if moduleInfo()['alleleType'] == 'lineage':
+            pop.setLineage(range(10))
+            lin = np.asarray(pop.lineage())
+            self.assertEqual(lin.shape, (13, 2, 7))
+            self.assertEqual(list(lin.ravel()), list(pop.lineage()))
+
+    def testInfoArray(self):
+        'Testing Population::infoArray(), infoArray(subPop)'
+        import numpy as np
+        pop = Population(loci=[1, 2], size=[4, 6], infoFields=['a', 'b', 'c'])
+        pop.setIndInfo(range(10), 'b')
+        info = np.asarray(pop.infoArray())
+        self.assertEqual(info.shape, (10, 3))
+        self.assertEqual(list(info[:, 1]), list(pop.indInfo('b')))
+        info[:, 2] = np.arange(10) * 2
+        self.assertEqual(pop.indInfo('c'), tuple([x * 2. for x in range(10)]))
+        sub = np.asarray(pop.infoArray(1))
+        self.assertEqual(sub.shape, (6, 3))
+        self.assertEqual(list(sub[:, 1]), list(pop.indInfo('b', 1)))
+        sub[:, 0] = 5
+        self.assertEqual(pop.indInfo('a'), tuple([0.] * 4 + [5.] * 6))
+        self.assertRaises(IndexError, pop.infoArray, 2)
+        self.assertRaises(ValueError, pop.infoArray, (0, 0))
+        self.assertEqual(np.asarray(Population(10).infoArray()).shape, (10, 0))
+
+    def testIndInfoArray(self):
+        'Testing Population::indInfoArray(field), indInfoArray(field, subPop)'
+        import numpy as np
+        pop = Population(loci=[1, 2], size=[4, 6], infoFields=['a', 'b', 'c'])
+        pop.setIndInfo(range(10), 'b')
+        b = np.asarray(pop.indInfoArray('b'))
+        self.assertEqual(b.shape, (10,))
+        self.assertEqual(list(b), list(range(10)))
+        b *= 2
+        self.assertEqual(pop.indInfo('b'), tuple([x * 2. for x in range(10)]))
+        c = np.asarray(pop.indInfoArray(2, 1))
+        c[:] = 3
+        self.assertEqual(pop.indInfo('c'), tuple([0.] * 4 + [3.] * 6))
+        self.assertRaises(IndexError, pop.indInfoArray, 3)
+        self.assertRaises(IndexError, pop.indInfoArray, 'a', 2)
+        # individuals are re-ordered before information fields are exposed
+        pop.sortIndividuals('b', reverse=True)
+        self.assertEqual(list(pop.indInfoArray('b')), list(pop.indInfo('b')))
+        self.assertEqual(pop.indInfo('b'), tuple([ind.b for ind in pop.individuals()]))
+
 
 
     def testSetGenotype(self):
@@ -1015,6 +1084,43 @@ class TestPopulation(unittest.TestCase):
                 self.assertEqual(ind, pop.indByID(ind.ind_id), gen)
         self.assertEqual(sum(sz1), len(include))
 
+    def testExtractIndividualSets(self):
+        'Testing Population::extractIndividualSets(indexes, IDs)'
+        pop = self.getPop(size=[20, 100, 30], subPopNames=['sp1', 'sp2', 'sp3'])
+        initSex(pop)
+        initGenotype(pop, freq=[0.4, 0.6])
+        sets = [[15, 110, 120, 121], [121, 15, 15], []]
+        pops = pop.extractIndividualSets(indexes=sets)
+        self.assertEqual(len(pops), 3)
+        for pop1, indexes in zip(pops, sets):
+            pop2 = pop.extractIndividuals(indexes)
+            self.assertEqual(pop1, pop2)
+            self.assertEqual(pop1.subPopNames(), ('sp1', 'sp2', 'sp3'))
+        self.assertEqual(pops[1].subPopSizes(), (1, 0, 1))
+        self.assertEqual(pop.extractIndividualSets(), [])
+        self.assertRaises(IndexError, pop.extractIndividualSets, [[2], [500]])
+        # by ID
+        pop = self.getPop(size=[100, 200], loci=[2, 3, 1], ancGen=5,
+            infoFields=['ind_id'])
+        for gen in range(6):
+            pop.useAncestralGen(gen)
+            initGenotype(pop, freq=[0.5, 0.5])
+        pop.useAncestralGen(0)
+        tagID(pop, reset=True)
+        # individuals with shared IDs are all extracted
+        pop.useAncestralGen(2)
+        pop.individual(5).ind_id = 3
+        pop.useAncestralGen(1)
+        sets = [[random.randint(1, 1800) for x in range(200)] for y in range(5)]
+        sets.append([3, 1000000])
+        pops = pop.extractIndividualSets(IDs=sets)
+        self.assertEqual(pop.curAncestralGen(), 1)
+        self.assertEqual(len(pops), 6)
+        for pop1, IDs in zip(pops, sets):
+            self.assertEqual(pop1, pop.extractIndividuals(IDs=IDs))
+        self.assertEqual(pops[-1].ancestralGens(), 5)
+        self.assertEqual(sum([pops[-1].popSize(ancGen=x) for x in range(6)]), 2)
+
     def testRemoveLoci(self):
         'Testing Population::removeLoci(loci=[], keep=[])'
         # Fixme: test loci, and keep, and test unordered parameters
@@ -1198,6 +1304,33 @@ class TestPopulation(unittest.TestCase):
         # apply this function to an empty information would crash simuPOP (issue #19)
         pop = Population(size=0, infoFields='a')
         pop.setSubPopByIndInfo('a')
+        # individuals keep their relative order and their genotypes
+        pop = Population(size=[200, 300], loci=5, infoFields=['x', 'ind_id'])
+        initGenotype(pop, freq=[0.2, 0.3, 0.5])
+        tagID(pop, reset=True)
+        geno = {}
+        for ind in pop.individuals():
+            geno[ind.ind_id] = list(ind.genotype())
+            ind.x = random.randint(-1, 3)
+        x = pop.indInfo('x')
+        pop.setSubPopByIndInfo('x')
+        for sp in range(4):
+            IDs = pop.indInfo('ind_id', subPop=sp)
+            self.assertEqual(len(IDs), x.count(sp))
+            self.assertEqual(list(IDs), sorted(IDs))
+            for ind in pop.individuals(sp):
+                self.assertEqual(ind.x, sp)
+                self.assertEqual(list(ind.genotype()), geno[ind.ind_id])
+        self.assertEqual(pop.popSize(), len(x) - x.count(-1))
+        # nothing is changed if individuals stay in their subpopulations
+        IDs = pop.indInfo('ind_id')
+        pop.setSubPopByIndInfo('x')
+        self.assertEqual(pop.subPopSizes(), tuple([x.count(sp) for sp in range(4)]))
+        self.assertEqual(pop.indInfo('ind_id'), IDs)
+        # all individuals are removed
+        initInfo(pop, [-1], infoFields='x')
+        pop.setSubPopByIndInfo('x')
+        self.assertEqual(pop.subPopSizes(), (0,))
 
     def testSortIndividuals(self):
         'Testing Population::sortIndividuals(infoFields)'
@@ -1335,6 +1468,70 @@ class TestPopulation(unittest.TestCase):
         self.assertFalse('module_os' in pop1.vars())
         os.remove('popout')
 
+    def testSaveBinary(self):
+        'Testing Population::save(filename, format="binary")'
+        pop = self.getPop(ancGen=5, infoFields=['a', 'b'])
+        for gen in range(pop.ancestralGens(), -1, -1):
+            pop.useAncestralGen(gen)
+            initGenotype(pop, freq=[0.3, 0.7])
+            initSex(pop)
+            initInfo(pop, lambda:random.randint(0, 40), infoFields=['a', 'b'])
+        pop.individual(3).setAffected(True)
+        stat(pop, alleleFreq=list(range(pop.totNumLoci())))
+        pop.save('popout', format='binary')
+        # loadPopulation detects binary format automatically
+        pop1 = loadPopulation('popout')
+        self.assertEqual(pop, pop1)
+        self.assertEqual(pop.ancestralGens(), pop1.ancestralGens())
+        for gen in range(pop.ancestralGens(), -1, -1):
+            pop.useAncestralGen(gen)
+            pop1.useAncestralGen(gen)
+            self.assertEqual(pop.genotype(), pop1.genotype())
+            self.assertEqual(pop.indInfo('a'), pop1.indInfo('a'))
+            self.assertEqual(pop.indInfo('b'), pop1.indInfo('b'))
+            self.assertEqual([x.sex() for x in pop.individuals()],
+                [x.sex() for x in pop1.individuals()])
+        pop1.useAncestralGen(0)
+        self.assertTrue(pop1.individual(3).affected())
+        self.assertEqual(pop.dvars().alleleFreq[0][1], pop1.dvars().alleleFreq[0][1])
+        # a text archive can still be loaded
+        pop.save('popout', format='text')
+        self.assertEqual(pop, loadPopulation('popout'))
+        self.assertRaises(ValueError, pop.save, 'popout', format='unknown')
+        os.remove('popout')
+
+    def testFileMappedStorage(self):
+        'Testing file-mapped genotype storage set by setOptions(storageDir)'
+        if os.name == 'nt' or moduleInfo()['alleleType'] == 'mutant':
+            return
+        if not os.path.isdir('storage'):
+            os.mkdir('storage')
+        setOptions(storageDir='storage')
+        try:
+            pop = Population(size=[2000, 3000], loci=[200, 300], ancGen=2,
+                infoFields='x')
+            initSex(pop)
+            initGenotype(pop, freq=[0.2, 0.8])
+            pop.evolve(
+                matingScheme=RandomMating(),
+                gen=3
+            )
+            self.assertEqual(pop.ancestralGens(), 2)
+            pop1 = pop.clone()
+            self.assertEqual(pop, pop1)
+            pop.useAncestralGen(2)
+            pop1.useAncestralGen(2)
+            self.assertEqual(pop.genotype(), pop1.genotype())
+            # temporary files are removed after they are mapped
+            self.assertEqual(os.listdir('storage'), [])
+        finally:
+            setOptions(storageDir='')
+        # populations with in-memory storage are compatible
+        pop2 = pop.clone()
+        self.assertEqual(pop, pop2)
+        del pop, pop1, pop2
+        os.rmdir('storage')
+
     def testCrossPlatformLoad(self):
         'Testing loading populations created from other platform and allele types'
         localFile = 'sample_%d_%s_v3.pop' % ( \
@@ -1694,7 +1891,65 @@ class TestPopulation(unittest.TestCase):
             ind = pop.indByID(id)
             self.assertEqual(ind.ind_id, id)
         self.assertRaises(IndexError, pop.indByID, 8000)
- 
+        # search in specified generations
+        self.assertEqual(pop.indByID(10, ancGens=3).ind_id, 10)
+        self.assertRaises(IndexError, pop.indByID, 10, ancGens=0)
+        self.assertEqual(pop.indByID(3000, ancGens=[0, 1]).ind_id, 3000)
+        # individuals are reordered
+        pop.sortIndividuals('ind_id', reverse=True)
+        for id in [1, 800, 2500, 3200]:
+            self.assertEqual(pop.indByID(id).ind_id, id)
+        # individuals are assigned new IDs
+        IdTagger().reset(5001)
+        tagID(pop)
+        self.assertRaises(IndexError, pop.indByID, 10)
+        for id in [5001, 6000, 8200]:
+            self.assertEqual(pop.indByID(id).ind_id, id)
+        # individuals are removed
+        pop.removeIndividuals(IDs=range(7401, 7501))
+        self.assertRaises(IndexError, pop.indByID, 7450)
+        self.assertEqual(pop.indByID(7501).ind_id, 7501)
+
+    def testIndByIDMisses(self):
+        'Testing repeated misses of Population::indByID()'
+        pop = Population(size=[100000]*2, ancGen=1, infoFields=['ind_id'])
+        pop.evolve(initOps=[InitSex(), IdTagger()],
+            matingScheme=RandomMating(ops=[MendelianGenoTransmitter(), IdTagger()]),
+            gen=1)
+        # misses do not rebuild the index of IDs
+        start = time.time()
+        for id in range(1000000, 1001000):
+            self.assertRaises(IndexError, pop.indByID, id)
+        self.assertLess(time.time() - start, 10)
+        self.assertEqual(pop.indByID(250000).ind_id, 250000)
+        # the index is rebuilt after individuals are added or assigned new IDs
+        pop1 = pop.clone()
+        pop1.setIndInfo(range(1000000, 1200000), 'ind_id')
+        pop.addIndFrom(pop1)
+        self.assertEqual(pop.indByID(1000500).ind_id, 1000500)
+        self.assertRaises(IndexError, pop.indByID, 1200500)
+        pop.setIndInfo(range(2000000, 2400000), 'ind_id')
+        self.assertEqual(pop.indByID(2000500).ind_id, 2000500)
+        self.assertRaises(IndexError, pop.indByID, 1000500, ancGens=0)
+
+    def testIndsByIDs(self):
+        'Testing Population::indsByIDs()'
+        pop = self.getPop(size=[200]*4, ancGen=3, infoFields=['ind_id'])
+        IdTagger().reset(1)
+        tagID(pop)
+        IDs = [random.randint(1, 800*4) for x in range(400)]
+        inds = pop.indsByIDs(IDs)
+        self.assertEqual([ind.ind_id for ind in inds], IDs)
+        self.assertEqual(pop.indsByIDs([]), [])
+        self.assertEqual([ind.ind_id for ind in pop.indsByIDs([2401, 3200], ancGens=0)],
+            [2401, 3200])
+        self.assertRaises(IndexError, pop.indsByIDs, [1, 8000])
+        self.assertRaises(IndexError, pop.indsByIDs, [1], ancGens=0)
+        # individuals are reordered
+        pop.sortIndividuals('ind_id', reverse=True)
+        inds = pop.indsByIDs(IDs)
+        self.assertEqual([ind.ind_id for ind in inds], IDs)
+
     def testIdentifyFamilies(self):
         'Testing Pedigree::identifyFamily'
         pop = Population(100, infoFields=['ind_id', 'ped_id'], ancGen=1)
@@ -1729,6 +1984,113 @@ class TestPopulation(unittest.TestCase):
                 self.assertEqual(len(list(p.allIndividuals())), sz)
         #
 
+    def testLocateRelatives(self):
+        'Testing Pedigree::locateRelatives and traceRelatives'
+        pop = Population([200, 200], ancGen=-1, loci=1,
+            infoFields=['ind_id', 'father_id', 'mother_id'])
+        pop.evolve(
+            initOps=[InitSex(), IdTagger()],
+            matingScheme=RandomMating(numOffspring=(UNIFORM_DISTRIBUTION, 1, 3),
+                ops=[MendelianGenoTransmitter(), IdTagger(), PedigreeTagger()]),
+            gen=3)
+        ped = Pedigree(pop, infoFields=ALL_AVAIL)
+        ped.addInfoFields(['spouse', 'off1', 'off2', 'sib1', 'sib2', 'sib3', 'g1', 'g2'])
+        inds = {}
+        for gen in range(ped.ancestralGens() + 1):
+            ped.useAncestralGen(gen)
+            for ind in ped.individuals():
+                inds[int(ind.ind_id)] = ind
+        ped.useAncestralGen(0)
+        # offspring and siblings in the order they appear in the pedigree
+        offspring = {}
+        order = []
+        for gen in range(ped.ancestralGens() + 1):
+            ped.useAncestralGen(gen)
+            order.extend([int(ind.ind_id) for ind in ped.individuals()])
+        ped.useAncestralGen(0)
+        for id in order:
+            for p in [inds[id].father_id, inds[id].mother_id]:
+                if p >= 1:
+                    offspring.setdefault(int(p), []).append(id)
+        ped.locateRelatives(OFFSPRING, ['off1', 'off2'])
+        for id, ind in inds.items():
+            off = offspring.get(id, [])[:2]
+            self.assertEqual([ind.off1, ind.off2], off + [-1] * (2 - len(off)))
+        ped.locateRelatives(FULLSIBLING, ['sib1', 'sib2'])
+        for id, ind in inds.items():
+            if ind.father_id < 1:
+                continue
+            sibs = [x for x in offspring[int(ind.father_id)] if x != id and
+                inds[x].mother_id == ind.mother_id][:2]
+            self.assertEqual([ind.sib1, ind.sib2], sibs + [-1] * (2 - len(sibs)))
+        ped.locateRelatives(SIBLING, ['sib1', 'sib2', 'sib3'], sex=SAME_SEX)
+        for id, ind in inds.items():
+            if ind.father_id < 1:
+                continue
+            sibs = []
+            for p in sorted([int(ind.father_id), int(ind.mother_id)]):
+                sibs.extend([x for x in offspring[p] if x != id and x not in sibs
+                    and inds[x].sex() == ind.sex()])
+            sibs = sibs[:3]
+            self.assertEqual([ind.sib1, ind.sib2, ind.sib3], sibs + [-1] * (3 - len(sibs)))
+        # grand children
+        ped.traceRelatives([['off1', 'off2'], ['off1', 'off2']], resultFields=['g1', 'g2'])
+        for id, ind in inds.items():
+            gc = [y for x in offspring.get(id, [])[:2] for y in offspring.get(x, [])[:2]][:2]
+            self.assertEqual([ind.g1, ind.g2], gc + [-1] * (2 - len(gc)))
+        # relatives not in the pedigree
+        ped.useAncestralGen(ped.ancestralGens())
+        ped.individual(0).off1 = 1000000
+        ped.useAncestralGen(0)
+        self.assertRaises(IndexError, ped.traceRelatives, [['off1']], resultFields=['g1'])
+
+    def testDrawFamilies(self):
+        'Testing Pedigree::drawFamilies'
+        pop = Population([200, 200], ancGen=-1, loci=1,
+            infoFields=['ind_id', 'father_id', 'mother_id'])
+        pop.evolve(
+            initOps=[InitSex(), IdTagger()],
+            matingScheme=RandomMating(numOffspring=(UNIFORM_DISTRIBUTION, 1, 3),
+                ops=[MendelianGenoTransmitter(), IdTagger(), PedigreeTagger()]),
+            gen=3)
+        ped = Pedigree(pop, infoFields=ALL_AVAIL)
+        ped.addInfoFields(['spouse', 'off1', 'off2'])
+        ped.locateRelatives(OUTBRED_SPOUSE, ['spouse'], FEMALE_ONLY)
+        ped.locateRelatives(COMMON_OFFSPRING, ['spouse', 'off1', 'off2'])
+        paths = [['spouse'], ['off1'], ['off2'], ['off1', 'spouse']]
+        def family(id):
+            ind = ped.indByID(id)
+            fam = set([id, ind.spouse, ind.off1, ind.off2])
+            if ind.off1 >= 0:
+                fam.add(ped.indByID(ind.off1).spouse)
+            return sorted([int(x) for x in fam if x >= 0])
+        anchors = ped.individualsWithRelatives(['spouse', 'off1'])
+        samples = ped.drawFamilies(anchors, paths, 20, numOfSamples=5)
+        self.assertEqual(len(samples), 5)
+        for sample in samples:
+            self.assertEqual(len(sample), 1)
+            self.assertEqual(len(sample[0]), 20)
+            IDs = []
+            for fam in sample[0]:
+                self.assertTrue(fam in [family(x) for x in fam if x in anchors])
+                IDs.extend(fam)
+            # families do not overlap
+            self.assertEqual(len(IDs), len(set(IDs)))
+        # samples are different
+        self.assertNotEqual(samples[0], samples[1])
+        # one group for each subpopulation, overlapping families excluded
+        # across groups
+        anchors = [ped.individualsWithRelatives(['spouse', 'off1'], subPops=sp) for sp in range(2)]
+        sample = ped.drawFamilies(anchors, paths, [5, 100000])[0]
+        self.assertEqual(len(sample[0]), 5)
+        self.assertTrue(0 < len(sample[1]) <= len(anchors[1]))
+        IDs = [x for group in sample for fam in group for x in fam]
+        self.assertEqual(len(IDs), len(set(IDs)))
+        # without relative path
+        self.assertEqual(ped.drawFamilies([anchors[0][0]], [], 1)[0], [[[anchors[0][0]]]])
+        self.assertEqual(ped.drawFamilies([[], []], paths, [1, 1]), [[[], []]])
+        self.assertRaises(ValueError, ped.drawFamilies, anchors, paths, 5)
+
     def testIdentifyAncestors(self):
         'Testing pedigree::identifyAncestors'
         pop = Population(100, infoFields=['ind_id', 'father_id'], ancGen=1)
@@ -1957,6 +2319,34 @@ class TestPopulation(unittest.TestCase):
         ped.useAncestralGen(0)
         self.assertNotEqual(ped.individual(0).father_id, 0)
         self.assertNotEqual(ped.individual(0).mother_id, 0)
+        # pedigree streamed from a population without ancestral generations,
+        # with genotypes of offspring but not of the initial population
+        os.remove('test.ped')
+        pop = Population(500, loci=[2], infoFields=['ind_id', 'father_id', 'mother_id', 'x'])
+        tagID(pop, reset=True)
+        pop.evolve(
+            initOps = [
+                InitSex(),
+                InitGenotype(freq=[0.5, 0.5]),
+                PedigreeTagger(output='>>test.ped', outputFields='x'),
+            ],
+            matingScheme=RandomMating(ops=[
+                MendelianGenoTransmitter(),
+                IdTagger(),
+                InfoExec('x = ind_id * 2'),
+                PedigreeTagger(output='>>test.ped', outputFields='x', outputLoci=[0, 1])]),
+            gen = 5
+        )
+        ped = loadPedigree('test.ped', infoFields='x')
+        self.assertEqual(ped.ancestralGens(), 5)
+        self.assertEqual(ped.totNumLoci(), 2)
+        self.assertEqual(ped.indInfo('x'), tuple([x * 2. for x in ped.indInfo('ind_id')]))
+        self.assertEqual(ped.genotype(), pop.genotype())
+        self.assertEqual(ped.indInfo('father_id'), pop.indInfo('father_id'))
+        self.assertEqual([x.sex() for x in ped.individuals()], [x.sex() for x in pop.individuals()])
+        ped.useAncestralGen(5)
+        self.assertEqual(ped.popSize(), 500)
+        self.assertEqual(ped.genotype(), [0] * 2000)
         # cleanup
         for file in ['test.ped', 'test1.ped', 'test2.ped']:
             os.remove(file)
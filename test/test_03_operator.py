@@ -300,6 +300,43 @@ class TestOperator(unittest.TestCase):
         pop.vars()['c'] = 5
         # usePopVars is needed
         infoEval(pop, 'c+4', output='')
+        # only fields used by the expression are exposed, and they are
+        # removed afterwards
+        pop.setIndInfo(range(10), 'a')
+        infoEval(pop, expr='b', stmts='b=sum([a for x in range(2)])', output='')
+        self.assertEqual(pop.indInfo('b'), tuple([x * 2. for x in range(10)]))
+        self.assertFalse('a' in pop.vars() or 'b' in pop.vars())
+        infoEval(pop, expr='b', stmts='b=eval("a")', output='')
+        self.assertEqual(pop.indInfo('b'), tuple([x * 1. for x in range(10)]))
+        # fields changed through the exposed individual are kept
+        infoExec(pop, 'ind.b = 5', exposeInd='ind')
+        self.assertEqual(pop.indInfo('b'), tuple([5.] * 10))
+        infoExec(pop, 'ind.b = a + b', exposeInd='ind')
+        self.assertEqual(pop.indInfo('b'), tuple([x + 5. for x in range(10)]))
+        # expressions are evaluated with arrays of information fields if
+        # possible, with the same results as evaluating them for each
+        # individual (exposeInd disables arrays)
+        pop = Population([20, 30], infoFields=['a', 'b', 'c'])
+        pop.setIndInfo([(x % 7 - 3) / 4. for x in range(50)], 'a')
+        pop.vars()['d'] = 3
+        for stmts in ['b=a*d+1', 'b=abs(a)//0.1\nc=b%3', 'c=a>0', 'b=1',
+                'b=a if a > 0 else -a', 'b=d']:
+            pop1 = pop.clone()
+            infoExec(pop, stmts)
+            infoExec(pop1, stmts, exposeInd='ind')
+            self.assertEqual(pop.indInfo('b'), pop1.indInfo('b'))
+            self.assertEqual(pop.indInfo('c'), pop1.indInfo('c'))
+        for expr in ['a*2', 'a>0', 'd', "'%.2f' % a"]:
+            infoEval(pop, expr, stmts='c=a+b', output='a.txt', subPops=[1, 0])
+            with open('a.txt') as res:
+                vectorized = res.read()
+            infoEval(pop, expr, stmts='c=a+b', output='a.txt', subPops=[1, 0],
+                exposeInd='ind')
+            with open('a.txt') as res:
+                self.assertEqual(vectorized, res.read())
+        os.remove('a.txt')
+        # errors are raised as before
+        self.assertRaises(RuntimeError, infoExec, pop, 'b=a/0')
 
     def testIdTagger(self):
         '''Testing operator IdTagger'''
@@ -372,6 +409,9 @@ class TestOperator(unittest.TestCase):
         pop.vars()['c'] = 5
         infoExec(pop, 'b=c+4')
         self.assertEqual(pop.indInfo('b'), tuple([9]*10))
+        # fields changed through an exposed individual are not overwritten
+        infoExec(pop, 'ind.setInfo(ind.info("a") + 2, "b")', exposeInd='ind')
+        self.assertEqual(pop.indInfo('b'), tuple([3]*10))
         #
         # as an operator
         pop.evolve(
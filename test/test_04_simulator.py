@@ -66,6 +66,41 @@ class TestSimulator(unittest.TestCase):
             gen=10
         )
 
+    def testEvolveReps(self):
+        'Testing Simulator::evolve(reps, numProcs)'
+        pop = Population(size=[200, 80], loci=[3])
+        simu = Simulator(pop, rep=3, stealPops=False)
+        gens = simu.evolve(
+            initOps = [InitSex(), InitGenotype(freq=[0.2, 0.8])],
+            matingScheme=RandomMating(),
+            gen=5, reps=[0, 2])
+        self.assertEqual(gens, (5, 0, 5))
+        self.assertEqual(simu.dvars(0).gen, 5)
+        self.assertEqual(simu.population(1).genotype(), pop.genotype())
+        self.assertRaises(IndexError, simu.evolve, gen=1, reps=3)
+        # results do not depend on the number of processes or threads
+        nThreads = moduleInfo()['threads']
+        setOptions(numThreads=2)
+        res = []
+        for numProcs in [1, 2]:
+            getRNG().set(seed=1234)
+            simu = Simulator(pop, rep=3, stealPops=False)
+            gens = simu.evolve(
+                initOps = [InitSex(), InitGenotype(freq=[0.2, 0.8])],
+                matingScheme=RandomMating(ops=Recombinator(rates=0.01)),
+                postOps=Stat(alleleFreq=0),
+                gen=5, numProcs=numProcs)
+            self.assertEqual(gens, (5, 5, 5))
+            res.append([list(simu.population(x).genotype()) for x in range(3)] +
+                [simu.dvars(x).alleleFreq[0][0] for x in range(3)])
+            # the random number generator of the caller is not reset
+            self.assertEqual(getRNG().seed(), 1234)
+            self.assertEqual(moduleInfo()['threads'], 2)
+            res.append(getRNG().randInt(100000))
+        setOptions(numThreads=nThreads)
+        self.assertEqual(res[0], res[2])
+        self.assertEqual(res[1], res[3])
+
     def testCreateSimulator(self):
         'Testing the construction of Simulator'
         pop = Population(size=[20, 80], loci=1)
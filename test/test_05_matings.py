@@ -274,7 +274,25 @@ class TestMatingSchemes(unittest.TestCase):
                 lastParent = parent
                 famSize.append(1)
         self.assertEqual(famSize, [1]*20000+[2]*10000)
-         
+
+    def testShuffleOffspring(self):
+        'Testing if genotypes stay with shuffled offspring'
+        pop = Population(size=500, loci=[20, 10], infoFields='a')
+        initGenotype(pop, freq=[0.3, 0.7])
+        geno = {}
+        def record(off):
+            off.a = len(geno)
+            geno[len(geno)] = list(off.genotype())
+            return True
+        ops = [MendelianGenoTransmitter(), PyOperator(func=record)]
+        pop.evolve(
+            initOps=InitSex(),
+            matingScheme=HeteroMating([RandomMating(ops=ops), RandomMating(ops=ops)]),
+            gen=1)
+        self.assertNotEqual([int(ind.a) for ind in pop.individuals()], list(range(500)))
+        for ind in pop.individuals():
+            self.assertEqual(list(ind.genotype()), geno[int(ind.a)])
+
     def testWeightingScheme(self):
         'Testing weighting schemes of heterogeneous mating schemes'
         pop = Population(size=[1000], loci=2, infoFields='mark')
@@ -445,6 +463,95 @@ class TestMatingSchemes(unittest.TestCase):
         self.assertEqual(mi[0], mi[1])
         self.assertNotEqual(mi[0], mi[2])              
        
+    def testRNGStreams(self):
+        'Testing reproducibility of mating with random number streams'
+        nThreads = moduleInfo()['threads']
+        pop = Population(size=[3000, 1000], loci=[20, 30],
+            infoFields=['father_idx', 'mother_idx'])
+        initSex(pop)
+        initGenotype(pop, freq=[0.3, 0.7])
+        res = []
+        for n in [1, 2, 3]:
+            setOptions(numThreads=n, seed=1357, rngStreams=True)
+            pop1 = pop.clone()
+            pop1.evolve(
+                matingScheme=HeteroMating([
+                    RandomMating(ops=[Recombinator(rates=0.01), ParentsTagger()]),
+                    PolygamousMating(polyNum=3, numOffspring=2,
+                        ops=[MendelianGenoTransmitter(), ParentsTagger()])]),
+                gen=3)
+            # compare digests because differences between long lists are
+            # very slow to report
+            res.append((hash(tuple(pop1.genotype())), hash(pop1.indInfo('father_idx')),
+                hash(pop1.indInfo('mother_idx')), getRNG().randInt(1000000)))
+        setOptions(numThreads=nThreads, rngStreams=False)
+        self.assertEqual(res[0], res[1])
+        self.assertEqual(res[0], res[2])
+
+    def testParallelMating(self):
+        'Testing offspring genotypes generated by multiple threads'
+        nThreads = moduleInfo()['threads']
+        # long chromosomes with rare alleles, which are stored sparsely
+        # by the mutant module
+        pop = Population(size=[1500, 700], loci=[300, 200],
+            infoFields=['father_idx', 'mother_idx'])
+        initSex(pop)
+        initGenotype(pop, freq=[0.97, 0.02, 0.01])
+        pop.setAncestralDepth(1)
+        setOptions(numThreads=3)
+        for ms in [
+            RandomMating(ops=[MendelianGenoTransmitter(), ParentsTagger()]),
+            # offspring in the second subpopulation are clones
+            HeteroMating([
+                RandomMating(subPops=0,
+                    ops=[MendelianGenoTransmitter(), ParentsTagger()]),
+                CloneMating(subPops=1, ops=[CloneGenoTransmitter(),
+                    ParentsTagger(infoFields='father_idx')])])]:
+            for gen in range(2):
+                pop.evolve(matingScheme=ms, gen=1)
+                parents = pop.clone()
+                parents.useAncestralGen(1)
+                for idx, off in enumerate(pop.individuals()):
+                    dad = parents.individual(int(off.father_idx))
+                    if idx >= pop.subPopSize(0) and isinstance(ms, HeteroMating):
+                        self.assertEqual(off.genotype(), dad.genotype())
+                        continue
+                    mom = parents.individual(int(off.mother_idx))
+                    for ch in range(2):
+                        # the first homologous copy is inherited from mother
+                        self.assertTrue(list(off.genotype(0, ch)) in
+                            [list(mom.genotype(0, ch)), list(mom.genotype(1, ch))])
+                        self.assertTrue(list(off.genotype(1, ch)) in
+                            [list(dad.genotype(0, ch)), list(dad.genotype(1, ch))])
+        setOptions(numThreads=nThreads)
+
+    def testTrackAlleleFreq(self):
+        'Testing allele frequency tracking during mating'
+        nThreads = moduleInfo()['threads']
+        pop = Population(size=[1500, 700], loci=[5, 2, 1],
+            chromTypes=[AUTOSOME, CHROMOSOME_X, CHROMOSOME_Y])
+        initSex(pop)
+        initGenotype(pop, freq=[0.2, 0.3, 0.5])
+        for n, streams in [(1, False), (2, True)]:
+            setOptions(numThreads=n, rngStreams=streams)
+            for ms in [
+                RandomMating(ops=[MendelianGenoTransmitter(),
+                    PyOperator(lambda off: off.allele(0) + off.allele(1) > 0)],
+                    trackAlleleFreq=ALL_AVAIL),
+                HeteroMating([RandomMating(), CloneMating()],
+                    trackAlleleFreq=[0, 4, 6, 7])]:
+                pop1 = pop.clone()
+                pop1.evolve(matingScheme=ms, gen=2)
+                num = dict([(x, dict(y)) for x, y in pop1.vars()['alleleNum'].items()])
+                freq = dict([(x, dict(y)) for x, y in pop1.vars()['alleleFreq'].items()])
+                stat(pop1, alleleFreq=list(num.keys()))
+                self.assertEqual(num, pop1.vars()['alleleNum'])
+                self.assertEqual(freq, pop1.vars()['alleleFreq'])
+        setOptions(numThreads=nThreads, rngStreams=False)
+        # no variable is set if trackAlleleFreq is not specified
+        pop.evolve(matingScheme=RandomMating(), gen=1)
+        self.assertFalse('alleleFreq' in pop.vars())
+
     def testPedigreeMating(self):
         'Testing pedigree mating using a population object'
         pop = Population(size=[100, 100], loci=[2, 5], ancGen=-1,
@@ -339,6 +339,40 @@ class TestStat(unittest.TestCase):
         stat(pop, alleleFreq=ALL_AVAIL)
 
 
+    def testAlleleFreqManyLoci(self):
+        'Testing allele and heterozygote frequency at many loci'
+        pop = Population(size=[300, 200], loci=[700, 150, 90, 40],
+            chromTypes=[AUTOSOME, CHROMOSOME_X, CHROMOSOME_Y, AUTOSOME])
+        pop.setVirtualSplitter(SexSplitter())
+        initSex(pop)
+        initGenotype(pop, freq=[0.3, 0.7])
+        loci = list(range(0, 700, 3)) + list(range(700, 980)) + [5, 1, 976]
+        for subPop in [0, (1, 0), (1, 1)]:
+            pop.vars().clear()
+            stat(pop, alleleFreq=loci, heteroFreq=list(range(700)) + [979],
+                subPops=[subPop], vars=['alleleNum_sp', 'heteroNum_sp', 'homoNum_sp'])
+            alleleNum = pop.dvars(subPop).alleleNum
+            for loc in loci:
+                cnt = {}
+                ct = pop.chromType(pop.chromLocusPair(loc)[0])
+                for ind in pop.individuals(subPop):
+                    if ct == CHROMOSOME_X:
+                        ploidy = [0, 1] if ind.sex() == FEMALE else [0]
+                    elif ct == CHROMOSOME_Y:
+                        ploidy = [1] if ind.sex() == MALE else []
+                    else:
+                        ploidy = [0, 1]
+                    for p in ploidy:
+                        a = ind.allele(loc, p)
+                        cnt[a] = cnt.get(a, 0) + 1
+                self.assertEqual(alleleNum[loc], cnt)
+            for loc in list(range(700)) + [979]:
+                hetero = len([ind for ind in pop.individuals(subPop)
+                    if ind.allele(loc, 0) != ind.allele(loc, 1)])
+                self.assertEqual(pop.dvars(subPop).heteroNum[loc], hetero)
+                self.assertEqual(pop.dvars(subPop).homoNum[loc],
+                    pop.subPopSize(subPop) - hetero)
+
     def testHeteroFreq(self):
         'Testing counting of heterozygote frequency'
         pop = Population(size=[500,100,1000],
@@ -694,6 +728,47 @@ class TestStat(unittest.TestCase):
             self.assertAlmostEqual(ChiSq(pop.dvars(sp), 2, 4), pop.dvars(sp).LD_ChiSq[2][4])
             self.assertAlmostEqual(CramerV(pop.dvars(sp), 2, 4), pop.dvars(sp).CramerV[2][4])
 
+    def testLDMatrix(self):
+        'Testing calculation of LD matrix between all pairs of loci'
+        pop = Population(size=[500, 300], loci=[6, 4])
+        initGenotype(pop, freq=[.3, .7])
+        pop.evolve(initOps=InitSex(),
+            matingScheme=RandomMating(ops=Recombinator(rates=0.1)), gen=2)
+        stat(pop, LDMatrix=ALL_AVAIL, LD=[[i, j] for i in range(10) for j in range(i+1, 10)],
+            vars=['LD_matrix', 'LD_prime_matrix', 'R2_matrix', 'LD', 'LD_prime', 'R2',
+                'LD_matrix_sp', 'R2_matrix_sp', 'LD_sp', 'R2_sp'])
+        self.assertEqual(len(pop.dvars().LD_matrix), 10)
+        for i in range(10):
+            self.assertEqual(len(pop.dvars().R2_matrix[i]), 10)
+            for j in range(i + 1, 10):
+                self.assertAlmostEqual(pop.dvars().LD_matrix[i][j], pop.dvars().LD[i][j])
+                self.assertAlmostEqual(pop.dvars().LD_prime_matrix[i][j], pop.dvars().LD_prime[i][j])
+                self.assertAlmostEqual(pop.dvars().R2_matrix[i][j], pop.dvars().R2[i][j])
+                self.assertAlmostEqual(pop.dvars().R2_matrix[j][i], pop.dvars().R2[i][j])
+                for sp in range(2):
+                    self.assertAlmostEqual(pop.dvars(sp).LD_matrix[i][j], pop.dvars(sp).LD[i][j])
+                    self.assertAlmostEqual(pop.dvars(sp).R2_matrix[j][i], pop.dvars(sp).R2[i][j])
+        # a subset of loci
+        stat(pop, LDMatrix=[2, 5, 7])
+        self.assertEqual(len(pop.dvars().LD_matrix), 3)
+        self.assertAlmostEqual(pop.dvars().LD_matrix[1][2], pop.dvars().LD[5][7])
+        self.assertRaises(IndexError, stat, pop, LDMatrix=[2, 10])
+        # pairs of loci within a window
+        stat(pop, LDMatrix=ALL_AVAIL, LDWindow=3, vars=['LD_matrix', 'R2_matrix', 'R2_matrix_sp'])
+        self.assertEqual(len(pop.dvars().LD_matrix), 10)
+        for i in range(10):
+            self.assertEqual(len(pop.dvars().R2_matrix[i]), 3)
+            for k in range(3):
+                if i + k + 1 < 10:
+                    self.assertAlmostEqual(pop.dvars().LD_matrix[i][k], pop.dvars().LD[i][i + k + 1])
+                    self.assertAlmostEqual(pop.dvars().R2_matrix[i][k], pop.dvars().R2[i][i + k + 1])
+                    self.assertAlmostEqual(pop.dvars(1).R2_matrix[i][k], pop.dvars(1).R2[i][i + k + 1])
+                else:
+                    self.assertEqual(pop.dvars().R2_matrix[i][k], 0)
+        # loci on chromosomes of different types
+        pop = Population(size=100, loci=[3, 2], chromTypes=[AUTOSOME, CHROMOSOME_X])
+        self.assertRaises(ValueError, stat, pop, LDMatrix=ALL_AVAIL)
+
 
     def testCombinedStats(self):
         '''Testing dependency of combined statistics'''
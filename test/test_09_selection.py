@@ -694,6 +694,111 @@ class TestSelector(unittest.TestCase):
         # simulation did not terminate unexpectedly
         self.assertEqual(simu.dvars(0).gen, 100)
 
+    def testPySelectorCache(self):
+        'Testing caching of fitness values of PySelector'
+        calls = []
+        def sel(geno, gen):
+            calls.append((geno, gen))
+            return 1 - 0.1 * sum(geno)
+        pop = Population(size=1000, loci=[2], infoFields='fitness')
+        initGenotype(pop, freq=[.5, .5])
+        op = PySelector(loci=[0, 1], func=sel, cacheSize=100)
+        op.apply(pop)
+        # called once for each distinct genotype
+        self.assertEqual(len(calls), len(set(calls)))
+        self.assertEqual(len(calls), 16)
+        self.assertEqual(pop.indInfo('fitness'),
+            tuple([1 - 0.1 * sum(ind.genotype()) for ind in pop.individuals()]))
+        stats = op.cacheStats()
+        self.assertEqual(stats['misses'], 16)
+        self.assertEqual(stats['hits'], 1000 - 16)
+        self.assertEqual(stats['size'], 16)
+        self.assertEqual(stats['cacheSize'], 100)
+        # least recently used values are removed
+        op = PySelector(loci=[0, 1], func=sel, cacheSize=4)
+        op.apply(pop)
+        self.assertEqual(op.cacheStats()['size'], 4)
+        self.assertEqual(op.cacheStats()['hits'] + op.cacheStats()['misses'], 1000)
+        self.assertEqual(pop.indInfo('fitness'),
+            tuple([1 - 0.1 * sum(ind.genotype()) for ind in pop.individuals()]))
+        # the cache is shared by copies used during evolution
+        op = PySelector(loci=0, func=sel, cacheSize=100)
+        pop.evolve(initOps=InitSex(), preOps=op, matingScheme=RandomMating(),
+            gen=5)
+        self.assertEqual(op.cacheStats()['size'], 4 * 5)
+        self.assertEqual(op.cacheStats()['misses'], 4 * 5)
+        # only functions of genotype and generation can be cached
+        self.assertRaises(ValueError, PySelector, loci=0, func=lambda geno, fitness: 1,
+            cacheSize=10)
+
+    def testPySelectorArgs(self):
+        'Testing arguments passed by PySelector'
+        op = PySelector(func=lambda a, b, gen: a + 2 * b + gen)
+        # information fields are located for each genotypic structure
+        for fields in [['fitness', 'a', 'b'], ['b', 'a', 'fitness']]:
+            pop = Population(size=10, loci=1, infoFields=fields)
+            pop.setIndInfo(range(10), 'a')
+            pop.setIndInfo(1, 'b')
+            op.apply(pop)
+            self.assertEqual(pop.indInfo('fitness'), tuple([x + 2. for x in range(10)]))
+        # arguments kept by the function are not changed by later calls
+        kept = []
+        def sel(geno):
+            kept.append(geno)
+            return 1
+        pop = Population(size=20, loci=1, infoFields='fitness')
+        initGenotype(pop, freq=[.5, .5])
+        PySelector(loci=0, func=sel).apply(pop)
+        self.assertEqual(kept, [tuple(ind.genotype()) for ind in pop.individuals()])
+        self.assertRaises(ValueError, PySelector(func=lambda c: 1).apply, pop)
+
+    def testPySelectorBatch(self):
+        'Testing batch mode of PySelector'
+        import numpy as np
+        blocks = []
+        def sel(geno, a):
+            blocks.append(geno.shape)
+            return 1 - 0.1 * geno.sum(axis=1) + a
+        pop = Population(size=[300, 700], loci=[2], infoFields=['fitness', 'a'])
+        initGenotype(pop, freq=[.5, .5])
+        pop.setIndInfo([x / 1000. for x in range(1000)], 'a')
+        PySelector(loci=[0, 1], func=sel, batchSize=256).apply(pop)
+        # individuals are passed in blocks within each subpopulation
+        self.assertEqual(blocks, [(256, 4), (44, 4), (256, 4), (256, 4), (188, 4)])
+        for ind in pop.individuals():
+            self.assertAlmostEqual(ind.fitness, 1 - 0.1 * sum(ind.genotype()) + ind.a)
+        # the same fitness values as calling the function for each individual
+        fitness = pop.indInfo('fitness')
+        PySelector(loci=[0, 1], func=lambda geno, a: 1 - 0.1 * sum(geno) + a).apply(pop)
+        for x, y in zip(fitness, pop.indInfo('fitness')):
+            self.assertAlmostEqual(x, y)
+        # males and females have different numbers of alleles on sex
+        # chromosomes and are passed in separate calls
+        blocks = []
+        sexPop = Population(size=100, loci=[1, 1], chromTypes=[AUTOSOME, CHROMOSOME_X],
+            infoFields='fitness')
+        initSex(sexPop, sex=[MALE, FEMALE, FEMALE])
+        initGenotype(sexPop, freq=[.5, .5])
+        PySelector(loci=[0, 1], func=lambda geno: blocks.append(geno.shape) or
+            1 - 0.1 * geno.sum(axis=1), batchSize=60).apply(sexPop)
+        self.assertEqual(blocks, [(20, 3), (40, 4), (14, 3), (26, 4)])
+        fitness = sexPop.indInfo('fitness')
+        PySelector(loci=[0, 1], func=lambda geno: 1 - 0.1 * sum(geno)).apply(sexPop)
+        for x, y in zip(fitness, sexPop.indInfo('fitness')):
+            self.assertAlmostEqual(x, y)
+        # batch mode is also used during evolution
+        pop.evolve(initOps=InitSex(), preOps=PySelector(loci=0,
+            func=lambda geno: np.ones(geno.shape[0]), batchSize=100),
+            matingScheme=RandomMating(), gen=2)
+        # wrong number of returned values
+        self.assertRaises(ValueError, PySelector(loci=0,
+            func=lambda geno: np.ones(2), batchSize=100).apply, pop)
+        # individual and mutants are not passed in batch mode
+        self.assertRaises(ValueError, PySelector, loci=0, func=lambda ind: 1,
+            batchSize=10)
+        self.assertRaises(ValueError, PySelector, loci=0, func=lambda geno: 1,
+            batchSize=10, cacheSize=10)
+
     def pyGenoTest1(self, geno, mut):
         self.geno.extend(geno[::2])
         self.geno.extend(geno[1::2])
@@ -67,6 +67,26 @@ class TestQuanTrait(unittest.TestCase):
             self.assertEqual(len(geno), 4)
             return random.normalvariate(0, 0.5*sum(geno) ), 1
         pyQuanTrait(pop, loci=[2,6], func=qt1, infoFields=['qtrait1', 'qtrait2'])
+        # trait values can be cached for each genotype
+        op = PyQuanTrait(loci=[2,6], func=lambda geno: (sum(geno), 1),
+            infoFields=['qtrait1', 'qtrait2'], cacheSize=100)
+        op.apply(pop)
+        self.assertEqual(op.cacheStats()['misses'], len(set([(ind.allele(2, 0),
+            ind.allele(6, 0), ind.allele(2, 1), ind.allele(6, 1)) for ind in pop.individuals()])))
+        for ind in pop.individuals():
+            self.assertEqual(ind.qtrait1, ind.allele(2, 0) + ind.allele(2, 1) +
+                ind.allele(6, 0) + ind.allele(6, 1))
+            self.assertEqual(ind.qtrait2, 1)
+        # trait values can be calculated for blocks of individuals
+        import numpy as np
+        op = PyQuanTrait(loci=[2,6], func=lambda geno, qtrait1: np.column_stack(
+            (geno.sum(axis=1), qtrait1 + 1)), infoFields=['qtrait1', 'qtrait2'],
+            batchSize=300)
+        op.apply(pop)
+        for ind in pop.individuals():
+            self.assertEqual(ind.qtrait1, ind.allele(2, 0) + ind.allele(2, 1) +
+                ind.allele(6, 0) + ind.allele(6, 1))
+            self.assertEqual(ind.qtrait2, ind.qtrait1 + 1)
 
     def testAncestralGen(self):
         'Testing parameter ancestralGen of qtrait... (FIXME)'
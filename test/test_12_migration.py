@@ -218,6 +218,28 @@ class TestMigrator(unittest.TestCase):
         self.assertTrue(abs(tested[1] - 4500) < 20)
         self.assertTrue(abs(tested[2] - 3500) < 20)
 
+    def testmigrateByProbabilityManyDemes(self):
+        'Testing migrate by probability among many small subpopulations'
+        rate = [[0.002 * (i != j) for j in range(50)] for i in range(50)]
+        numMigrants = 0
+        for i in range(100):
+            pop = Population(size=[100] * 50, infoFields=['ind_id', 'migrate_to'])
+            tagID(pop, reset=True)
+            migrate(pop, mode=BY_PROBABILITY, rate=rate)
+            self.assertEqual(sorted(pop.indInfo('ind_id')), [float(x + 1) for x in range(5000)])
+            for sp in range(pop.numSubPop()):
+                # individuals are moved to the subpopulations in migrate_to
+                self.assertEqual(pop.indInfo('migrate_to', subPop=sp), tuple([sp] * pop.subPopSize(sp)))
+                numMigrants += len([x for x in pop.indInfo('ind_id', subPop=sp) if (x - 1) // 100 != sp])
+        # each individual migrates with probability 0.098
+        self.assertTrue(abs(numMigrants / 100. - 490) < 20)
+        # nobody is moved if all rates are zero
+        sizes = pop.subPopSizes()
+        IDs = pop.indInfo('ind_id')
+        migrate(pop, mode=BY_PROBABILITY, rate=[[0] * 50] * 50)
+        self.assertEqual(pop.subPopSizes(), sizes)
+        self.assertEqual(pop.indInfo('ind_id'), IDs)
+
     def testmigrateFromTo(self):
         'Testing parameter from and to of Migrators'
         def migrateSize():
@@ -1051,6 +1051,37 @@ class TestTransmitters(unittest.TestCase):
         #     "Expression abs(simu.dvars(0).haploFreq[(3,6)].setdefault((a1,a2), 0) - 0.25) (test value %f) be less than 0.01. This test may occasionally fail due to the randomness of outcome." % (abs(simu.dvars(0).haploFreq[(3,6)].setdefault((a1,a2), 0) - 0.25)))
 
 
+    def testSparseRecRates(self):
+        'Testing recombination with rare and locus-specific recombination rates'
+        pop = Population(size=2, loci=[50, 50])
+        parent = pop.individual(0)
+        parent.setGenotype([0], 0)
+        parent.setGenotype([1], 1)
+        off = pop.individual(1)
+        rates = [0.002 * (i % 5) for i in range(100)]
+        rec = Recombinator(rates=rates, loci=ALL_AVAIL)
+        N = 20000
+        counts = [0] * 99
+        first = 0
+        for i in range(N):
+            rec.transmitGenotype(parent, off, 0)
+            geno = off.genotype(0)
+            first += geno[0]
+            for loc in range(99):
+                if geno[loc] != geno[loc + 1]:
+                    counts[loc] += 1
+        self.assertTrue(abs(first - N / 2.) < 0.03 * N)
+        # no recombination at loci with zero recombination rate
+        self.assertEqual(sum([counts[x] for x in range(99) if rates[x] == 0]), 0)
+        # free recombination between chromosomes
+        self.assertTrue(abs(counts[49] - N / 2.) < 0.03 * N)
+        expected = sum([rates[x] for x in range(99) if x != 49]) * N
+        self.assertTrue(abs(sum(counts) - counts[49] - expected) < 0.05 * expected)
+        for r in [0.002, 0.004, 0.006, 0.008]:
+            expected = len([x for x in range(99) if x != 49 and rates[x] == r]) * r * N
+            observed = sum([counts[x] for x in range(99) if x != 49 and rates[x] == r])
+            self.assertTrue(abs(observed - expected) < 0.15 * expected)
+
     def testRecProportion(self):
         'Testing table 4 of H&C 3nd edition P49 '
         N = 100000
@@ -188,6 +188,28 @@ class TestPenetrance(unittest.TestCase):
                 return 1
         pyPenetrance(self.pop, loci = 0, func=pen)
         stat(self.pop, numOfAffected=1, vars=['numOfAffected', 'numOfAffected_sp'])
+        # penetrance values can be cached for each genotype
+        op = PyPenetrance(loci=0, func=pen, cacheSize=10)
+        op.apply(self.pop)
+        self.assertEqual(op.cacheStats()['misses'], len(set([tuple(ind.genotype())
+            for ind in self.pop.individuals()])))
+        self.assertEqual(op.cacheStats()['hits'] + op.cacheStats()['misses'],
+            self.pop.popSize())
+        for ind in self.pop.individuals():
+            if ind.genotype() == (0, 0):
+                self.assertFalse(ind.affected())
+        # penetrance values can be calculated for blocks of individuals
+        op = PyPenetrance(loci=0, infoFields='penetrance',
+            func=lambda geno: geno.sum(axis=1) / 2., batchSize=100)
+        pop = Population(size=[200, 150], loci=[1], infoFields='penetrance')
+        initGenotype(pop, freq=[.5, .5])
+        op.apply(pop)
+        for ind in pop.individuals():
+            self.assertEqual(ind.penetrance, sum(ind.genotype()) / 2.)
+            if ind.penetrance == 0:
+                self.assertFalse(ind.affected())
+            elif ind.penetrance == 1:
+                self.assertTrue(ind.affected())
         # self.assertTrue(abs(self.pop.dvars().numOfAffected -  880*0.5 - 545) < 100, 
         #     "Expression abs(self.pop.dvars().numOfAffected -  880*0.5 - 545) (test value %f) be less than 100. This test may occasionally fail due to the randomness of outcome." % (abs(self.pop.dvars().numOfAffected -  880*0.5 - 545)))
         # self.assertTrue(abs(self.pop.dvars(0).numOfAffected - 250*0.5 - 125) < 30, 
@@ -142,6 +142,52 @@ class TestSampling(unittest.TestCase):
         # draw from vsp?
 
 
+    def testReuseSampler(self):
+        'Testing reuse of prepared samplers'
+        pop = Population(size=[500, 500], loci=1, infoFields='oldindex')
+        pop.evolve(
+            initOps=[InitSex(), InitGenotype(freq=[.5, .5])],
+            matingScheme=RandomMating(),
+            postOps=MaPenetrance(loci=0, penetrance=[0.1, 0.5, 0.9]),
+            gen=1
+        )
+        pop.setIndInfo(list(range(pop.popSize())), 'oldindex')
+        sampler = CaseControlSampler(cases=[10, 20], controls=[30, 40])
+        samples = sampler.drawSamples(pop, numOfSamples=20)
+        self.assertEqual(len(samples), 20)
+        for s in samples:
+            self.assertEqual(s.subPopSizes(), (40, 60))
+            for ind in s.individuals():
+                self.assertEqual(ind, pop.individual(int(ind.oldindex)))
+            self.assertEqual([len([x for x in s.individuals(sp) if x.affected()]) for sp in range(2)],
+                [10, 20])
+        # samples are different
+        self.assertNotEqual(samples[0], samples[1])
+        self.assertEqual(sampler.drawSamples(pop, numOfSamples=0), [])
+        # preparation is reused for the same population
+        affected = sampler.affected
+        sampler.drawSample(pop)
+        self.assertTrue(sampler.affected is affected)
+        # and is redone after the population evolves
+        pop.evolve(
+            matingScheme=RandomMating(),
+            postOps=[MaPenetrance(loci=0, penetrance=[0.1, 0.5, 0.9]),
+                InitInfo(lambda: -1, infoFields='oldindex')],
+            gen=1
+        )
+        s = sampler.drawSample(pop)
+        self.assertTrue(sampler.affected is not affected)
+        for ind in s.individuals():
+            self.assertEqual(ind.oldindex, -1)
+        # or for another population
+        sampler = RandomSampler(sizes=10)
+        sampler.drawSample(pop)
+        prepared = sampler.indexes
+        sampler.drawSample(pop)
+        self.assertTrue(sampler.indexes is prepared)
+        sampler.drawSample(pop.clone())
+        self.assertTrue(sampler.indexes is not prepared)
+
     def testAffectedSibpairSample(self):
         'Testing affected sibpair sampling (incomplete)'
 		# FIXME: testing sharing of parents
@@ -202,6 +248,83 @@ class TestSampling(unittest.TestCase):
             inpop = self.largepop.individual(int(ind.oldindex))
             self.assertEqual(ind, inpop)
 
+    def testPedigreeSamples(self):
+        'Testing drawing multiple pedigree samples'
+        samples = drawAffectedSibpairSamples(self.pop, families=[2, 3], numOfSamples=5)
+        self.assertEqual(len(samples), 5)
+        for s in samples:
+            self.assertEqual(s.subPopSizes(), (4, 6))
+            for ind in s.individuals():
+                self.assertEqual(ind.affected(), True)
+        samples = drawNuclearFamilySamples(self.largepop, families=20, numOffspring=(2, 3),
+            affectedParents=(0, 2), affectedOffspring=(1, 3), numOfSamples=3)
+        self.assertEqual(len(samples), 3)
+        for s in samples:
+            IDs = []
+            for gen in range(s.ancestralGens() + 1):
+                s.useAncestralGen(gen)
+                IDs.extend(s.indInfo('ind_id'))
+            # parents and two or three offspring for each family
+            self.assertTrue(80 <= len(set(IDs)) <= 100)
+        samples = drawThreeGenFamilySamples(self.largepop, families=5, pedSize=(3, 20),
+            numOffspring=(1, 5), numOfAffected=(0, 5), numOfSamples=2)
+        self.assertEqual(len(samples), 2)
+        for s in samples:
+            for gen in range(s.ancestralGens() + 1):
+                s.useAncestralGen(gen)
+                for ind in s.individuals():
+                    self.assertEqual(ind, self.largepop.indByID(ind.ind_id))
+
+    def testRedefinedFamily(self):
+        'Testing pedigree samplers that redefine function family'
+        class ParentsSampler(AffectedSibpairSampler):
+            # sample parents of affected sibpairs only
+            def family(self, id):
+                return [id, self.pedigree.indByID(id).spouse]
+        samples = ParentsSampler(families=[2, 3]).drawSamples(self.pop, numOfSamples=3)
+        for s in samples:
+            s.useAncestralGen(0)
+            self.assertEqual(s.popSize(), 0)
+            s.useAncestralGen(1)
+            self.assertEqual(s.subPopSizes(), (4, 6))
+
+    def testStreamedPedigreeSample(self):
+        'Testing sampling from a pedigree saved during evolution'
+        pop = Population(size=[1000, 1000], loci=2,
+            infoFields=['ind_id', 'father_id', 'mother_id'])
+        pop.evolve(
+            initOps=[
+                InitSex(),
+                InitGenotype(freq=[.2, .8]),
+                IdTagger(),
+                PedigreeTagger(output='>>stream.ped', outputLoci=[0, 1]),
+            ],
+            matingScheme=RandomMating(
+                numOffspring=(UNIFORM_DISTRIBUTION, 2, 4),
+                ops=[MendelianGenoTransmitter(),
+                IdTagger(),
+                MapPenetrance(loci=0,
+                    penetrance={(0,0):0.1, (0,1):.7, (1,1):1}),
+                PedigreeTagger(output='>>stream.ped', outputLoci=[0, 1]),
+            ]),
+            gen = 3
+        )
+        # no ancestral generation is kept in pop
+        self.assertEqual(pop.ancestralGens(), 0)
+        ped = loadPedigree('stream.ped')
+        os.remove('stream.ped')
+        self.assertEqual(ped.ancestralGens(), 3)
+        s = drawAffectedSibpairSample(ped, families=5)
+        self.assertEqual(len(list(s.allIndividuals(ancGens=ALL_AVAIL))), 20)
+        for ind in s.individuals():
+            self.assertEqual(ind.affected(), True)
+            self.assertEqual(ind, pop.indByID(ind.ind_id, ancGens=0))
+        s = drawNuclearFamilySample(ped, families=5, numOffspring=(2, 4),
+            affectedParents=(0, 2), affectedOffspring=(1, 4))
+        for gen in range(s.ancestralGens() + 1):
+            s.useAncestralGen(gen)
+            for ind in s.individuals():
+                self.assertEqual(ind, ped.indByID(ind.ind_id))
 
 
 if __name__ == '__main__':
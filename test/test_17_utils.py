@@ -568,6 +568,18 @@ class TestUtils(unittest.TestCase):
         # one mutation
         self.assertEqual(len(traj.mutators(loci=[0,1])), 4)
 
+    def testTrajectoryRNGStreams(self):
+        'Testing reproducibility of Trajectory simulation with random number streams'
+        nThreads = moduleInfo()['threads']
+        res = []
+        for n in [1, 4]:
+            setOptions(numThreads=n, seed=2468, rngStreams=True)
+            trajSimulator = TrajectorySimulator(N=[1000, 3000], nLoci=2)
+            traj = trajSimulator.simuBackward(endGen=3000, endFreq=0.1, minMutAge=400)
+            res.append((traj._beginGen(), traj.freq(2800, 0), getRNG().randInt(1000000)))
+        setOptions(numThreads=nThreads, rngStreams=False)
+        self.assertEqual(res[0], res[1])
+
     def testForwardSimpleMultiLociSubPop(self):
         'Testing forward Trajectory simulation of multiple loci with multiple populations and no selection'
         # test Trajectory
@@ -660,6 +672,27 @@ class TestUtils(unittest.TestCase):
         # Fix: multi subpopulation.
         #
 
+    def testTrajectorySimulatorInteraction(self):
+        'Testing Trajectory simulation with interaction fitness and population split'
+        # fitness of each combination of genotypes at two loci
+        traj = simulateBackwardTrajectory(N=1000, nLoci=2, endGen=2000, endFreq=0.05,
+            fitness=[1, 1, 1, 1, 1.01, 1.02, 1, 1.02, 1.04])
+        self.assertNotEqual(traj, None)
+        self.assertEqual(traj.freq(traj._beginGen(), 0), [0., 0.])
+        # a population splits into two subpopulations at generation 1500
+        traj = simulateBackwardTrajectory(N=lambda gen: [2000] if gen < 1500 else [1000, 1000],
+            endGen=2000, endFreq=[0.05, 0.1], fitness=lambda gen, sp: [1, 1.01, 1.02])
+        self.assertNotEqual(traj, None)
+        for gen in range(traj._beginGen(), 2001):
+            self.assertEqual(len(traj._freq(gen)), 1 if gen < 1500 else 2)
+        self.assertEqual(traj.freq(traj._beginGen(), 0), [0.])
+        traj = simulateForwardTrajectory(N=lambda gen: [2000] if gen < 150 else [1000, 1000],
+            beginGen=100, endGen=200, beginFreq=0.1, endFreq=[[0.05, 0.15]],
+            fitness=lambda gen, sp: [1, 1.01, 1.02])
+        self.assertNotEqual(traj, None)
+        self.assertEqual(len(traj._freq(149)), 1)
+        self.assertEqual(len(traj._freq(200)), 2)
+
 
 
     def testSimuCase2(self):
@@ -769,6 +802,84 @@ class TestUtils(unittest.TestCase):
             endFreq = [[0,1]]*5)
         #traj1.plot()
     
+    def testTreeSeqRecorder(self):
+        'Testing the recording of genealogy by a TreeSeqRecorder'
+        import copy
+        if moduleInfo()['alleleType'] == 'binary':
+            return
+        pop = Population(60, loci=[20, 10], infoFields='ind_id')
+        initSex(pop)
+        tagID(pop, reset=True)
+        # each founder chromosome carries its own allele
+        for i, ind in enumerate(pop.individuals()):
+            ind.setGenotype([2 * i + 1], ploidy=0)
+            ind.setGenotype([2 * i + 2], ploidy=1)
+        rec = TreeSeqRecorder(pop)
+        pop.evolve(
+            matingScheme=RandomMating(ops=[IdTagger(),
+                Recombinator(rates=0.05, infoFields='ind_id', output=rec)]),
+            gen=20)
+        #
+        def parentsOf(rec):
+            # parents of each child node as (left, right, parent)
+            parents = {}
+            for l, r, p, c in rec.edges:
+                parents.setdefault(c, []).append((l, r, p))
+            return parents
+        #
+        def path(parents, node, pos):
+            # ancestors of a node at position pos
+            nodes = [node]
+            while True:
+                par = [p for l, r, p in parents.get(nodes[-1], []) if l <= pos < r]
+                if not par:
+                    return nodes
+                self.assertEqual(len(par), 1)
+                nodes.append(par[0])
+        #
+        def mrcaGen(rec, parents, a, b, pos):
+            ancestors = set(path(parents, b, pos))
+            for node in path(parents, a, pos):
+                if node in ancestors:
+                    return rec.nodeGen[node]
+        #
+        # genotypes are inherited from the recorded founder chromosomes
+        parents = parentsOf(rec)
+        for ind in pop.individuals():
+            node = rec.indNodes[int(ind.ind_id)]
+            for p in range(2):
+                for loc in range(0, 30, 3):
+                    root = path(parents, node + p, loc)[-1]
+                    self.assertEqual(rec.nodeGen[root], 0)
+                    self.assertEqual(ind.allele(loc, p), root + 1)
+        # simplification keeps the time to the most recent common ancestors
+        full = copy.deepcopy(rec)
+        rec.simplify(pop)
+        self.assertEqual(rec.samples, list(range(2 * pop.popSize())))
+        self.assertTrue(len(rec.edges) < len(full.edges))
+        simplified = parentsOf(rec)
+        IDs = [int(x) for x in pop.indInfo('ind_id')]
+        for i in range(200):
+            a, b = random.sample(IDs, 2)
+            pa, pb = random.randint(0, 1), random.randint(0, 1)
+            pos = random.randint(0, 29)
+            self.assertEqual(
+                mrcaGen(full, parents, full.indNodes[a] + pa, full.indNodes[b] + pb, pos),
+                mrcaGen(rec, simplified, rec.indNodes[a] + pa, rec.indNodes[b] + pb, pos))
+        #
+        rec.mutate(rate=0.01)
+        self.assertTrue(len(rec.mutations) > 0)
+        rec.dump('treeseq')
+        for table, header in [('nodes', 'is_sample\ttime'),
+                ('edges', 'left\tright\tparent\tchild'),
+                ('sites', 'position\tancestral_state'),
+                ('mutations', 'site\tnode\tderived_state')]:
+            with open('treeseq_%s.txt' % table) as tbl:
+                lines = tbl.read().split('\n')
+                self.assertEqual(lines[0], header)
+            os.remove('treeseq_%s.txt' % table)
+        self.assertEqual(len(lines), len(rec.mutations) + 2)
+
     def testGSL(self):
         'Testing GSL functions'
         gsl_cdf_gaussian_P(0.5, 1)